@@ -1,106 +1,116 @@
-def __wma_delay__():
-    from .wma.agegrader import AgeGrader, AthlonsAgeGrader
-    return AgeGrader, AthlonsAgeGrader
-from .uka.agegroups import calc_uka_age_group
-from .athlon_score import score as athlon_score
-from .hungarian_score import score as hungarian_score
-from .bulgarian_score import score as bulgarian_score
-from .athlon_score import performance as athlon_performance_needed
+"""athlib: utilities for track and field athletics
+
+Everything in __all__ is available from here, but the submodules (and any
+data they load) are only imported when a name is first used, so that
+importing athlib itself is cheap.
+"""
+import sys
+from importlib import import_module
+from types import ModuleType
 
 __version__ = u'0.9.8'
 
-from .exceptions import RuleViolation
-
-from .utils import (
-    normalize_gender,
-    str2num,
-    parse_hms,
-    get_distance,
-    round_up_str_num,
-    format_seconds_as_time,
-    check_performance_for_discipline,
-    discipline_sort_key,
-    text_discipline_sort_key,
-    sort_by_discipline,
-    check_event_code,
-    normalize_event_code,
-    isStr,
-    nativeStr,
-    is_hand_timing
+# public name -> (submodule, name in the submodule)
+_lazy = dict(
+    calc_uka_age_group=('.uka.agegroups', 'calc_uka_age_group'),
+    athlon_score=('.athlon_score', 'score'),
+    athlon_performance_needed=('.athlon_score', 'performance'),
+    hungarian_score=('.hungarian_score', 'score'),
+    bulgarian_score=('.bulgarian_score', 'score'),
+    RuleViolation=('.exceptions', 'RuleViolation'),
+    get_implement_weight=('.implements', 'get_implement_weight'),
+    get_specific_event_code=('.implements', 'get_specific_event_code'),
+    HighJumpCompetition=('.highjump', 'HighJumpCompetition'),
+    Jumper=('.highjump', 'Jumper'),
+    AgeGrader=('.wma.agegrader', 'AgeGrader'),
+    AthlonsAgeGrader=('.wma.agegrader', 'AthlonsAgeGrader'),
+    tyrving_score=('.tyrving_score', 'tyrving_score'),
+    qkids_score=('.qkids_score', 'qkids_score'),
+    sportshall_score=('.sportshall_score', 'sportshall_score'),
+    )
+_lazy.update((k, ('.utils', k)) for k in '''
+    normalize_gender str2num parse_hms parse_hms_many get_distance round_up_str_num
+    format_seconds_as_time format_seconds_as_times check_performance_for_discipline
+    check_performances
+    discipline_sort_key text_discipline_sort_key sort_by_discipline
+    check_event_code normalize_event_code isStr nativeStr is_hand_timing
+    classify_event_code EventInfo
+    '''.split())
+_lazy.update((k, ('.codes', k)) for k in '''
+    JUMPS THROWS MULTI_EVENTS FIELD_EVENTS STANDARD_MALE_TRACK_EVENTS
+    STANDARD_FEMALE_TRACK_EVENTS FIELD_SORT_ORDER PAT_THROWS PAT_JUMPS
+    PAT_TRACK PAT_ROAD PAT_RUN PAT_FIELD PAT_RELAYS PAT_HURDLES PAT_MULTI
+    PAT_EVENT_CODE PAT_LEADING_DIGITS PAT_LEADING_FLOAT PAT_VERTICAL_JUMPS
+    PAT_HORIZONTAL_JUMPS PAT_LENGTH_EVENT PAT_TIMED_EVENT PAT_PERF
+    PAT_LONG_SECONDS PAT_NOT_FINISHED PAT_FINISH_RECORD
+    '''.split())
+
+# the shared graders, made on first use
+_graders = dict(
+    ag2015=lambda: _get('AgeGrader')(year=2015),
+    ag2023=lambda: _get('AgeGrader')(year=2023),
+    ag=lambda: _get('ag2023'),
+    aag=lambda: _get('AthlonsAgeGrader')(),
     )
 
-from .implements import get_implement_weight, get_specific_event_code
-
-from .codes import (
-                    JUMPS,
-                    THROWS,
-                    MULTI_EVENTS,
-                    FIELD_EVENTS,
-                    STANDARD_MALE_TRACK_EVENTS,
-                    STANDARD_FEMALE_TRACK_EVENTS,
-                    FIELD_SORT_ORDER,
-                    PAT_THROWS,
-                    PAT_JUMPS,
-                    PAT_TRACK,
-                    PAT_ROAD,
-                    PAT_RUN,
-                    PAT_FIELD,
-                    PAT_RELAYS,
-                    PAT_HURDLES,
-                    PAT_MULTI,
-                    PAT_EVENT_CODE,
-                    PAT_LEADING_DIGITS,
-                    PAT_LEADING_FLOAT,
-                    PAT_VERTICAL_JUMPS,
-                    PAT_HORIZONTAL_JUMPS,
-                    PAT_LENGTH_EVENT,
-                    PAT_TIMED_EVENT,
-                    PAT_PERF,
-                    PAT_LONG_SECONDS,
-                    PAT_NOT_FINISHED,
-                    PAT_FINISH_RECORD,
-                    )
-
-from .highjump import HighJumpCompetition, Jumper
-
-AgeGrader, AthlonsAgeGrader = __wma_delay__()
-del __wma_delay__
-ag2015 = AgeGrader(year=2015)
-ag = ag2023 = AgeGrader(year=2023)
+
+def __getattr__(name):
+    if name in _lazy:
+        module, attr = _lazy[name]
+        value = getattr(import_module(module, __name__), attr)
+    elif name in _graders:
+        value = _graders[name]()
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def _get(name):
+    "for use inside this module, where __getattr__ is not consulted"
+    g = globals()
+    return g[name] if name in g else __getattr__(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _AthlibModule(ModuleType):
+    def __setattr__(self, name, value):
+        # importing a submodule such as athlib.hungarian_score binds it here;
+        # keep the function of the same name that athlib exports instead
+        if name in _lazy and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _AthlibModule
 
 
 def wma_age_grade(gender, age, event, performance, verbose=False, year="2023"):
     """Return the age grade score (0 to 100ish) for this result."""
-    ag = (year == 2015) and ag2015 or ag2023
+    ag = (year == 2015) and _get('ag2015') or _get('ag2023')
     return ag.calculate_age_grade(gender, age,event, performance, verbose=verbose)
 
 def wma_age_factor(gender, age, event, year="2015"):
     """Work out 'slowdown factor' for a geezer of this
     age taking part in this event e.g."""
-    ag = (year == 2015) and ag2015 or ag2023
+    ag = (year == 2015) and _get('ag2015') or _get('ag2023')
     return ag.calculate_factor(gender, age, event)
 
 def wma_world_best(gender, event, year="2023"):
     "The relevant world-record performance on the date stats were compiled"
-    ag = (year == 2015) and ag2015 or ag2023
+    ag = (year == 2015) and _get('ag2015') or _get('ag2023')
     return ag.world_best(gender, event)
 
-aag = AthlonsAgeGrader()
 def wma_athlon_age_factor(gender, age, event):
     """Work out 'slowdown factor' for a geezer of this
     age taking part in this event e.g."""
-    return aag.calculate_factor(gender, age, event)
+    return _get('aag').calculate_factor(gender, age, event)
 
 def wma_athlon_age_grade(gender, age, event, performance, verbose=False):
     """Return the age grade score (0 to 100ish) for this result."""
-    return aag.calculate_age_grade(gender, age, event, performance, verbose=verbose)
-
-from .tyrving_score import tyrving_score
-from .qkids_score import qkids_score
-from .sportshall_score import sportshall_score
-
-def __make_all__():
-    return [k for k, v in sorted(globals().items()) if not (k.startswith('__') or v.__class__.__name__== 'module')]
+    return _get('aag').calculate_age_grade(gender, age, event, performance, verbose=verbose)
 
-__all__ = __make_all__()
-del __make_all__
+__all__ = sorted(list(_lazy) + list(_graders) + [k for k in globals() if k.startswith('wma_')])
@@ -4,13 +4,14 @@ scores.   Taken from IAUM site,
 """
 import math
 
+from array import array
 from decimal import Decimal, getcontext
 
-from .codes import PAT_JUMPS, PAT_THROWS
+from .utils import classify_event_code
 from .wma.agegrader import AthlonsAgeGrader
 from .implements import get_specific_event_code
 
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Sequence
 
 getcontext().prec = 28
 
@@ -103,6 +104,11 @@ def _convert_to_decimal_table(table_data: Tuple[Dict]) -> List[Dict]:
 
 _scoring_table = _convert_to_decimal_table(_scoring_table)
 
+def _event_kind(event_code: str) -> Optional[str]:
+    info = classify_event_code(event_code)
+    return info.kind if info else None
+
+
 def scoring_key(gender: str, event_code: str) -> str:
     """Utility function to get the <gender>-<event> scoring key."""
     return (f"{gender}-{event_code}").upper()
@@ -125,7 +131,8 @@ def _scoring_objects_create() -> None:
             _scoring_objects[scoring_key(o["gender"], o["event_code"])] = o
 
 
-def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: bool = False) -> Optional[int]:
+def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: bool = False,
+          fast: bool = False) -> Optional[int]:
     """Function to determine IAAF score, based on gender, event and performance.
     
     You should only pass the age if you wish to age-adjust in years for WMA events
@@ -137,18 +144,70 @@ def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: b
     and <metres> for throws and jumps. In the the Wikipedia-sourced factors,
     jumps are <centimetres>.  Therefore there is a factor of 100 applied at the
     end.
+
+    With fast=True the points are worked out in floating point, falling back
+    to Decimal when that is too close to a whole number to be sure of; the
+    result is the same either way.
     """
     # Create _scoring_objects (lazily evaluated)
-    global _scoring_objects
     _scoring_objects_create()
 
-    ag = AthlonsAgeGrader()
+    age_factor = _age_factor(gender, age, event_code)
+    scorer = _event_scorer(gender, event_code, esaa)
+    if scorer is None:
+        return None
+    return _points(value, age_factor, *scorer, fast=fast)
+
+
+def score_many(genders: Sequence[str], event_codes: Sequence[str], values: Sequence[Decimal],
+               ages: Sequence[str] = None, esaa: bool = False, fast: bool = False) -> List[Optional[int]]:
+    """Score many performances at once, e.g. every mark in a season of combined events.
+
+    The arguments are parallel sequences as for score; ages may be None and
+    fast is as for score.
+    Coefficients are looked up once per gender and event and age factors once
+    per gender, age and event.  Returns the list of points score would give.
+    """
+    _scoring_objects_create()
+
+    if ages is None:
+        ages = [None] * len(values)
+    if not (len(genders) == len(event_codes) == len(values) == len(ages)):
+        raise ValueError('score_many needs sequences of equal length')
+
+    scorers = {}
+    age_factors = {}
+    points = []
+    for gender, event_code, value, age in zip(genders, event_codes, values, ages):
+        k = (gender, age, event_code)
+        age_factor = age_factors.get(k)
+        if age_factor is None:
+            age_factor = age_factors[k] = _age_factor(gender, age, event_code)
+        k = (gender, event_code)
+        if k not in scorers:
+            scorers[k] = _event_scorer(gender, event_code, esaa)
+        scorer = scorers[k]
+        points.append(None if scorer is None else _points(value, age_factor, *scorer, fast=fast))
+    return points
+
+
+# one grader, loaded on first use, for the WMA age factors
+_age_grader = None
+
+
+def _age_factor(gender: str, age: str, event_code: str) -> Decimal:
+    global _age_grader
     if not age:
-        age_factor = Decimal('1.00')
-    else:
-        age_factor = Decimal(str(ag.calculate_factor(gender, age, event_code)))
+        return Decimal('1.00')
+    if _age_grader is None:
+        _age_grader = AthlonsAgeGrader()
+    return Decimal(str(_age_grader.calculate_factor(gender, age, event_code)))
 
 
+def _event_scorer(gender: str, event_code: str, esaa: bool = False) -> Optional[Tuple[Dict, bool, bool]]:
+    """Return the coefficients for this gender and event, and whether it is a
+    field event and a jump; None if there are no coefficients.
+    """
     # special case: old people run shorter hurdles races, score as if 100/110H
     if gender == "F" and event_code == "80H":
         event_code = "100H"
@@ -167,8 +226,14 @@ def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: b
     if (key == "M-800") and esaa:
         coeffs = {"gender": "M", "event_code": "800", "A": Decimal('0.232'), "Z": Decimal('200.0'), "X": Decimal('1.85')}
 
-    is_field_event = PAT_JUMPS.match(event_code) or PAT_THROWS.match(event_code)
+    kind = _event_kind(event_code)
+    is_jump = kind == 'jump'
+    is_field_event = is_jump or kind == 'throw'
+    return coeffs, is_field_event, is_jump
+
 
+def _points(value: Decimal, age_factor: Decimal, coeffs: Dict, is_field_event: bool, is_jump: bool,
+            fast: bool = False) -> int:
     # Multiply by 100 and age_factor
     scaled_value = Decimal("100") * value * age_factor
     # Round up or down depending on event type
@@ -177,7 +242,7 @@ def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: b
 
     # Handle based on whether jumps, throws or track event
     if is_field_event:
-        if PAT_JUMPS.match(event_code):
+        if is_jump:
             # The table is expressed in centimetres in the original source
             value = value * Decimal('100')
         if value > coeffs["Z"]:
@@ -190,22 +255,41 @@ def score(gender: str, event_code: str, value: Decimal, age: str = None, esaa: b
         else:
             return 0
 
+    if fast:
+        points = _fast_floor(float(coeffs["A"]) * float(base) ** float(coeffs["X"]))
+        if points is not None:
+            return max(0, points)
+
     points_decimal = coeffs["A"] * ((base) ** coeffs["X"])
     final_score = int(points_decimal.to_integral_value(rounding="ROUND_FLOOR"))
     return max(0, final_score)
 
+
+# The float arithmetic is good to a few parts in 1e16, so a float further
+# than this (relatively) from a whole number rounds the same way as the
+# Decimal it approximates.  Anything nearer is left to Decimal.
+_FAST_EPSILON = 1e-9
+
+
+def _fast_floor(x: float) -> Optional[int]:
+    """Return floor(x), or None if x is too near a whole number to be sure."""
+    if abs(x - round(x)) <= _FAST_EPSILON * max(1.0, abs(x)):
+        return None
+    return math.floor(x)
+
 def unit_name(event_code: str) -> str:
     """Utility function to get the unit name based on event type."""
-    if PAT_JUMPS.match(event_code):
+    kind = _event_kind(event_code)
+    if kind == 'jump':
         # Used to be cm, but we standardised
         return "metres"
-    elif PAT_THROWS.match(event_code):
+    elif kind == 'throw':
         return "metres"
     else:
         return "seconds"
 
 
-def performance(gender: str, event_code: str, score: int) -> Optional[Decimal]:
+def performance(gender: str, event_code: str, score: int, fast: bool = False) -> Optional[Decimal]:
     """Function to determine performance required to achieve IAAF score, given
     gender and event.
 
@@ -213,6 +297,10 @@ def performance(gender: str, event_code: str, score: int) -> Optional[Decimal]:
     and <metres> for throws and jumps. In the the Wikipedia-sourced factors,
     jumps are <centimetres>.  Therefore there is a factor of 100 applied at the
     end.
+
+    fast=True works in floating point as for score, with the same result.
+    Whole number scores up to PERFORMANCE_TABLE_MAX are looked up in a table
+    of every score for the event, made the first time it is needed.
     """
     # Create _scoring_objects (lazily evaluated)
     global _scoring_objects
@@ -221,24 +309,68 @@ def performance(gender: str, event_code: str, score: int) -> Optional[Decimal]:
     if score < 0:
         score = 0
 
-    decimal_score = Decimal(score)
-
     key = scoring_key(gender, event_code)
 
     # Drop out if no coefficients defined (e.g. bad event/gender)
     if key not in _scoring_objects:
         return None
 
+    if isinstance(score, int) and score <= PERFORMANCE_TABLE_MAX:
+        return _from_hundredths(_performance_table(key, event_code)[score])
+    return _performance(event_code, score, _scoring_objects[key], fast)
+
+
+def performance_range(gender: str, event_code: str, lo: int, hi: int) -> Optional[List[Decimal]]:
+    """Return the performances needed for each score from lo to hi inclusive,
+    e.g. to draw a target chart; the same as calling performance for each.
+    """
+    _scoring_objects_create()
+    key = scoring_key(gender, event_code)
+    if key not in _scoring_objects:
+        return None
+
+    table = _performance_table(key, event_code)
     coeffs = _scoring_objects[key]
+    return [_from_hundredths(table[max(0, s)]) if s <= PERFORMANCE_TABLE_MAX
+            else _performance(event_code, s, coeffs, True) for s in range(lo, hi + 1)]
+
+
+# Scores from 0 to this are tabulated, per gender and event, in hundredths
+# of a second or metre.
+PERFORMANCE_TABLE_MAX = 1500
+_performance_tables = {}
 
+
+def _performance_table(key: str, event_code: str) -> array:
+    table = _performance_tables.get((key, event_code))
+    if table is None:
+        coeffs = _scoring_objects[key]
+        table = array('q', (int(_performance(event_code, s, coeffs, True).scaleb(2))
+                            for s in range(PERFORMANCE_TABLE_MAX + 1)))
+        _performance_tables[key, event_code] = table
+    return table
+
+
+def _from_hundredths(n: int) -> Decimal:
+    return Decimal(n).scaleb(-2)
+
+
+def _performance(event_code: str, score: int, coeffs: Dict, fast: bool = False) -> Decimal:
+    if fast:
+        perf = _fast_performance(event_code, score, coeffs)
+        if perf is not None:
+            return perf
+
+    kind = _event_kind(event_code)
+    decimal_score = Decimal(score)
     exponent = Decimal('1.0') / coeffs["X"]
     power_term = (decimal_score / coeffs["A"]) ** (exponent)
 
-    if PAT_JUMPS.match(event_code):
+    if kind == 'jump':
         perf_cm_decimal = power_term + coeffs["Z"]
         perf_cm_rounded = perf_cm_decimal.to_integral_value(rounding="ROUND_CEILING")
         perf = Decimal("0.01") * perf_cm_rounded
-    elif PAT_THROWS.match(event_code):
+    elif kind == 'throw':
         perf_metres_decimal = power_term + coeffs["Z"]
         perf = perf_metres_decimal.quantize(Decimal('0.01'), rounding="ROUND_CEILING")
     else:
@@ -246,3 +378,18 @@ def performance(gender: str, event_code: str, score: int) -> Optional[Decimal]:
         perf = perf_seconds_decimal.quantize(Decimal('0.01'), rounding="ROUND_FLOOR")
 
     return perf
+
+
+def _fast_performance(event_code: str, score: int, coeffs: Dict) -> Optional[Decimal]:
+    """performance in floating point, or None if Decimal is needed to round it."""
+    kind = _event_kind(event_code)
+    power_term = (score / float(coeffs["A"])) ** (1.0 / float(coeffs["X"]))
+    if kind == 'jump':
+        perf_cm = _fast_floor(power_term + float(coeffs["Z"]))
+        return None if perf_cm is None else Decimal("0.01") * Decimal(perf_cm + 1)
+    elif kind == 'throw':
+        perf_cm = _fast_floor(100 * (power_term + float(coeffs["Z"])))
+        return None if perf_cm is None else _from_hundredths(perf_cm + 1)
+    else:
+        perf_cs = _fast_floor(100 * (float(coeffs["Z"]) - power_term))
+        return None if perf_cs is None else _from_hundredths(perf_cs)
@@ -1,30068 +1,84 @@
 """ Scoring systems for Bulgarian U16 athletes
+
+The points tables live in bulgarian-scores.json and are read the first
+time they are needed.  Each table is held as a bytes block of points indexed
+from its lowest performance, with the min (no points) and max (150 points)
+performances alongside.
 """
+import json
+import os
+from collections import namedtuple
 from athlib.utils import check_event_code, parse_hms
 
-def score(ag, gender, event_code, performance):
+__all__ = ('score', 'score_many', 'get_tables')
+
+TIMED_EVENTS = ['60', '100', '200', '600', '800', '60H', '100H']
+DISTANCE_EVENTS = ['SP', 'LJ', 'HJ']
+
+# first is the lowest tabulated performance; points[i] is for first + i
+bulgarian_table = namedtuple('bulgarian_table', 'min max first points')
+
+_tables = None
+def get_tables():
+  """Return the points tables keyed by age group, gender and event e.g. U16M60"""
+  global _tables
+  if _tables is None:
+    fn = os.path.join(os.path.dirname(__file__), 'bulgarian-scores.json')
+    with open(fn, 'r') as f:
+      raw = json.load(f)['tables']
+    _tables = dict((key, bulgarian_table(t['min'], t['max'], t['first'], bytes(t['points'])))
+                   for key, t in raw.items())
+  return _tables
+
+def _scorer(ag, gender, event_code):
+  """Check the arguments and return a function scoring one performance"""
   assert gender in 'MFX'
   ec = check_event_code(event_code)
   assert ec is not None, (f"Unrecognised event code {event_code}")
-  """ Distance events are dealt with in centimetres, time events in centiseconds """
-  
-  if event_code in ['60', '100', '200', '600', '800', '60H', '100H']:
-    int_perf = int(100 * parse_hms(performance))
-  else:
-    int_perf = int(100 * performance)
   key = str(ag) + str(gender) + str(event_code)
-  min_val = scores[key]['min']
-  max_val = scores[key]['max']
-  if event_code in ['SP', 'LJ', 'HJ']:
-    if int_perf < min_val:
-      return 0
-    elif int_perf > max_val:
-      return 150
-    else:
-      score = scores[key][int_perf]
-      return score
-  elif event_code in ['60', '100', '200', '600', '800', '60H', '100H']:
-    if int_perf > min_val:
-      return 0
-    elif int_perf < max_val:
-      return 150
-    else:
-      score = scores[key][int_perf]
-      return score
+  min_val, max_val, first, points = get_tables()[key]
+
+  # Distance events are dealt with in centimetres, time events in centiseconds
+  if event_code in DISTANCE_EVENTS:
+    def scorer(performance):
+      int_perf = int(100 * performance)
+      if int_perf < min_val:
+        return 0
+      elif int_perf > max_val:
+        return 150
+      else:
+        return points[int_perf - first]
+  elif event_code in TIMED_EVENTS:
+    def scorer(performance):
+      int_perf = int(100 * parse_hms(performance))
+      if int_perf > min_val:
+        return 0
+      elif int_perf < max_val:
+        return 150
+      else:
+        return points[int_perf - first]
   else:
-    return 0
-  
-scores = {
-  'U16M60': {
-    'min': 1200,
-    'max': 680,
-    1200: 1,
-    1199: 1,
-    1198: 1,
-    1197: 1,
-    1196: 1,
-    1195: 1,
-    1194: 1,
-    1193: 1,
-    1192: 1,
-    1191: 1,
-    1190: 2,
-    1189: 2,
-    1188: 2,
-    1187: 2,
-    1186: 2,
-    1185: 2,
-    1184: 2,
-    1183: 2,
-    1182: 2,
-    1181: 2,
-    1180: 3,
-    1179: 3,
-    1178: 3,
-    1177: 3,
-    1176: 3,
-    1175: 3,
-    1174: 3,
-    1173: 3,
-    1172: 3,
-    1171: 3,
-    1170: 4,
-    1169: 4,
-    1168: 4,
-    1167: 4,
-    1166: 4,
-    1165: 4,
-    1164: 4,
-    1163: 4,
-    1162: 4,
-    1161: 4,
-    1160: 5,
-    1159: 5,
-    1158: 5,
-    1157: 5,
-    1156: 5,
-    1155: 5,
-    1154: 5,
-    1153: 5,
-    1152: 5,
-    1151: 5,
-    1150: 6,
-    1149: 6,
-    1148: 6,
-    1147: 6,
-    1146: 6,
-    1145: 6,
-    1144: 6,
-    1143: 6,
-    1142: 6,
-    1141: 6,
-    1140: 7,
-    1139: 7,
-    1138: 7,
-    1137: 7,
-    1136: 7,
-    1135: 7,
-    1134: 7,
-    1133: 7,
-    1132: 7,
-    1131: 7,
-    1130: 8,
-    1129: 8,
-    1128: 8,
-    1127: 8,
-    1126: 8,
-    1125: 8,
-    1124: 8,
-    1123: 8,
-    1122: 8,
-    1121: 8,
-    1120: 9,
-    1119: 9,
-    1118: 9,
-    1117: 9,
-    1116: 9,
-    1115: 9,
-    1114: 9,
-    1113: 9,
-    1112: 9,
-    1111: 9,
-    1110: 11,
-    1109: 11,
-    1108: 11,
-    1107: 11,
-    1106: 11,
-    1105: 11,
-    1104: 11,
-    1103: 11,
-    1102: 11,
-    1101: 11,
-    1100: 12,
-    1099: 12,
-    1098: 12,
-    1097: 12,
-    1096: 12,
-    1095: 12,
-    1094: 12,
-    1093: 12,
-    1092: 12,
-    1091: 12,
-    1090: 14,
-    1089: 14,
-    1088: 14,
-    1087: 14,
-    1086: 14,
-    1085: 14,
-    1084: 14,
-    1083: 14,
-    1082: 14,
-    1081: 14,
-    1080: 15,
-    1079: 15,
-    1078: 15,
-    1077: 15,
-    1076: 15,
-    1075: 15,
-    1074: 15,
-    1073: 15,
-    1072: 15,
-    1071: 15,
-    1070: 17,
-    1069: 17,
-    1068: 17,
-    1067: 17,
-    1066: 17,
-    1065: 17,
-    1064: 17,
-    1063: 17,
-    1062: 17,
-    1061: 17,
-    1060: 18,
-    1059: 18,
-    1058: 18,
-    1057: 18,
-    1056: 18,
-    1055: 18,
-    1054: 18,
-    1053: 18,
-    1052: 18,
-    1051: 18,
-    1050: 20,
-    1049: 20,
-    1048: 20,
-    1047: 20,
-    1046: 20,
-    1045: 20,
-    1044: 20,
-    1043: 20,
-    1042: 20,
-    1041: 20,
-    1040: 21,
-    1039: 21,
-    1038: 21,
-    1037: 21,
-    1036: 21,
-    1035: 21,
-    1034: 21,
-    1033: 21,
-    1032: 21,
-    1031: 21,
-    1030: 23,
-    1029: 23,
-    1028: 23,
-    1027: 23,
-    1026: 23,
-    1025: 23,
-    1024: 23,
-    1023: 23,
-    1022: 23,
-    1021: 23,
-    1020: 24,
-    1019: 24,
-    1018: 24,
-    1017: 24,
-    1016: 24,
-    1015: 24,
-    1014: 24,
-    1013: 24,
-    1012: 24,
-    1011: 24,
-    1010: 26,
-    1009: 26,
-    1008: 26,
-    1007: 26,
-    1006: 26,
-    1005: 26,
-    1004: 26,
-    1003: 26,
-    1002: 26,
-    1001: 26,
-    1000: 27,
-    999: 27,
-    998: 27,
-    997: 27,
-    996: 27,
-    995: 27,
-    994: 27,
-    993: 27,
-    992: 27,
-    991: 27,
-    990: 29,
-    989: 29,
-    988: 29,
-    987: 29,
-    986: 29,
-    985: 29,
-    984: 29,
-    983: 29,
-    982: 29,
-    981: 29,
-    980: 30,
-    979: 30,
-    978: 30,
-    977: 30,
-    976: 30,
-    975: 30,
-    974: 30,
-    973: 30,
-    972: 30,
-    971: 30,
-    970: 32,
-    969: 32,
-    968: 32,
-    967: 32,
-    966: 32,
-    965: 32,
-    964: 32,
-    963: 32,
-    962: 32,
-    961: 32,
-    960: 33,
-    959: 33,
-    958: 33,
-    957: 33,
-    956: 33,
-    955: 33,
-    954: 33,
-    953: 33,
-    952: 33,
-    951: 33,
-    950: 35,
-    949: 35,
-    948: 35,
-    947: 35,
-    946: 35,
-    945: 35,
-    944: 35,
-    943: 35,
-    942: 35,
-    941: 35,
-    940: 37,
-    939: 37,
-    938: 37,
-    937: 37,
-    936: 37,
-    935: 37,
-    934: 37,
-    933: 37,
-    932: 37,
-    931: 37,
-    930: 39,
-    929: 39,
-    928: 39,
-    927: 39,
-    926: 39,
-    925: 39,
-    924: 39,
-    923: 39,
-    922: 39,
-    921: 39,
-    920: 41,
-    919: 41,
-    918: 41,
-    917: 41,
-    916: 41,
-    915: 41,
-    914: 41,
-    913: 41,
-    912: 41,
-    911: 41,
-    910: 43,
-    909: 43,
-    908: 43,
-    907: 43,
-    906: 43,
-    905: 43,
-    904: 43,
-    903: 43,
-    902: 43,
-    901: 43,
-    900: 45,
-    899: 45,
-    898: 45,
-    897: 45,
-    896: 45,
-    895: 45,
-    894: 45,
-    893: 45,
-    892: 45,
-    891: 45,
-    890: 47,
-    889: 47,
-    888: 47,
-    887: 47,
-    886: 47,
-    885: 47,
-    884: 47,
-    883: 47,
-    882: 47,
-    881: 47,
-    880: 49,
-    879: 49,
-    878: 49,
-    877: 49,
-    876: 49,
-    875: 49,
-    874: 49,
-    873: 49,
-    872: 49,
-    871: 49,
-    870: 51,
-    869: 51,
-    868: 51,
-    867: 51,
-    866: 51,
-    865: 51,
-    864: 51,
-    863: 51,
-    862: 51,
-    861: 51,
-    860: 53,
-    859: 53,
-    858: 53,
-    857: 53,
-    856: 53,
-    855: 53,
-    854: 53,
-    853: 53,
-    852: 53,
-    851: 53,
-    850: 55,
-    849: 55,
-    848: 55,
-    847: 55,
-    846: 55,
-    845: 55,
-    844: 55,
-    843: 55,
-    842: 55,
-    841: 55,
-    840: 58,
-    839: 58,
-    838: 58,
-    837: 58,
-    836: 58,
-    835: 58,
-    834: 58,
-    833: 58,
-    832: 58,
-    831: 58,
-    830: 61,
-    829: 61,
-    828: 61,
-    827: 61,
-    826: 61,
-    825: 61,
-    824: 61,
-    823: 61,
-    822: 61,
-    821: 61,
-    820: 64,
-    819: 64,
-    818: 64,
-    817: 64,
-    816: 64,
-    815: 64,
-    814: 64,
-    813: 64,
-    812: 64,
-    811: 64,
-    810: 67,
-    809: 67,
-    808: 67,
-    807: 67,
-    806: 67,
-    805: 67,
-    804: 67,
-    803: 67,
-    802: 67,
-    801: 67,
-    800: 70,
-    799: 70,
-    798: 70,
-    797: 70,
-    796: 70,
-    795: 70,
-    794: 70,
-    793: 70,
-    792: 70,
-    791: 70,
-    790: 74,
-    789: 74,
-    788: 74,
-    787: 74,
-    786: 74,
-    785: 74,
-    784: 74,
-    783: 74,
-    782: 74,
-    781: 74,
-    780: 78,
-    779: 78,
-    778: 78,
-    777: 78,
-    776: 78,
-    775: 78,
-    774: 78,
-    773: 78,
-    772: 78,
-    771: 78,
-    770: 82,
-    769: 82,
-    768: 82,
-    767: 82,
-    766: 82,
-    765: 82,
-    764: 82,
-    763: 82,
-    762: 82,
-    761: 82,
-    760: 87,
-    759: 87,
-    758: 87,
-    757: 87,
-    756: 87,
-    755: 87,
-    754: 87,
-    753: 87,
-    752: 87,
-    751: 87,
-    750: 93,
-    749: 93,
-    748: 93,
-    747: 93,
-    746: 93,
-    745: 93,
-    744: 93,
-    743: 93,
-    742: 93,
-    741: 93,
-    740: 99,
-    739: 99,
-    738: 99,
-    737: 99,
-    736: 99,
-    735: 99,
-    734: 99,
-    733: 99,
-    732: 99,
-    731: 99,
-    730: 105,
-    729: 105,
-    728: 105,
-    727: 105,
-    726: 105,
-    725: 105,
-    724: 105,
-    723: 105,
-    722: 105,
-    721: 105,
-    720: 112,
-    719: 112,
-    718: 112,
-    717: 112,
-    716: 112,
-    715: 112,
-    714: 112,
-    713: 112,
-    712: 112,
-    711: 112,
-    710: 119,
-    709: 119,
-    708: 119,
-    707: 119,
-    706: 119,
-    705: 119,
-    704: 119,
-    703: 119,
-    702: 119,
-    701: 119,
-    700: 128,
-    699: 128,
-    698: 128,
-    697: 128,
-    696: 128,
-    695: 128,
-    694: 128,
-    693: 128,
-    692: 128,
-    691: 128,
-    690: 138,
-    689: 138,
-    688: 138,
-    687: 138,
-    686: 138,
-    685: 138,
-    684: 138,
-    683: 138,
-    682: 138,
-    681: 138,
-    680: 150
-  },
-  'U16M100': {
-    'min': 1600,
-    'max': 1080,
-    1600: 1,
-    1599: 1,
-    1598: 1,
-    1597: 1,
-    1596: 1,
-    1595: 1,
-    1594: 1,
-    1593: 1,
-    1592: 1,
-    1591: 1,
-    1590: 2,
-    1589: 2,
-    1588: 2,
-    1587: 2,
-    1586: 2,
-    1585: 2,
-    1584: 2,
-    1583: 2,
-    1582: 2,
-    1581: 2,
-    1580: 3,
-    1579: 3,
-    1578: 3,
-    1577: 3,
-    1576: 3,
-    1575: 3,
-    1574: 3,
-    1573: 3,
-    1572: 3,
-    1571: 3,
-    1570: 4,
-    1569: 4,
-    1568: 4,
-    1567: 4,
-    1566: 4,
-    1565: 4,
-    1564: 4,
-    1563: 4,
-    1562: 4,
-    1561: 4,
-    1560: 5,
-    1559: 5,
-    1558: 5,
-    1557: 5,
-    1556: 5,
-    1555: 5,
-    1554: 5,
-    1553: 5,
-    1552: 5,
-    1551: 5,
-    1550: 6,
-    1549: 6,
-    1548: 6,
-    1547: 6,
-    1546: 6,
-    1545: 6,
-    1544: 6,
-    1543: 6,
-    1542: 6,
-    1541: 6,
-    1540: 7,
-    1539: 7,
-    1538: 7,
-    1537: 7,
-    1536: 7,
-    1535: 7,
-    1534: 7,
-    1533: 7,
-    1532: 7,
-    1531: 7,
-    1530: 8,
-    1529: 8,
-    1528: 8,
-    1527: 8,
-    1526: 8,
-    1525: 8,
-    1524: 8,
-    1523: 8,
-    1522: 8,
-    1521: 8,
-    1520: 9,
-    1519: 9,
-    1518: 9,
-    1517: 9,
-    1516: 9,
-    1515: 9,
-    1514: 9,
-    1513: 9,
-    1512: 9,
-    1511: 9,
-    1510: 11,
-    1509: 11,
-    1508: 11,
-    1507: 11,
-    1506: 11,
-    1505: 11,
-    1504: 11,
-    1503: 11,
-    1502: 11,
-    1501: 11,
-    1500: 12,
-    1499: 12,
-    1498: 12,
-    1497: 12,
-    1496: 12,
-    1495: 12,
-    1494: 12,
-    1493: 12,
-    1492: 12,
-    1491: 12,
-    1490: 14,
-    1489: 14,
-    1488: 14,
-    1487: 14,
-    1486: 14,
-    1485: 14,
-    1484: 14,
-    1483: 14,
-    1482: 14,
-    1481: 14,
-    1480: 15,
-    1479: 15,
-    1478: 15,
-    1477: 15,
-    1476: 15,
-    1475: 15,
-    1474: 15,
-    1473: 15,
-    1472: 15,
-    1471: 15,
-    1470: 17,
-    1469: 17,
-    1468: 17,
-    1467: 17,
-    1466: 17,
-    1465: 17,
-    1464: 17,
-    1463: 17,
-    1462: 17,
-    1461: 17,
-    1460: 18,
-    1459: 18,
-    1458: 18,
-    1457: 18,
-    1456: 18,
-    1455: 18,
-    1454: 18,
-    1453: 18,
-    1452: 18,
-    1451: 18,
-    1450: 20,
-    1449: 20,
-    1448: 20,
-    1447: 20,
-    1446: 20,
-    1445: 20,
-    1444: 20,
-    1443: 20,
-    1442: 20,
-    1441: 20,
-    1440: 21,
-    1439: 21,
-    1438: 21,
-    1437: 21,
-    1436: 21,
-    1435: 21,
-    1434: 21,
-    1433: 21,
-    1432: 21,
-    1431: 21,
-    1430: 23,
-    1429: 23,
-    1428: 23,
-    1427: 23,
-    1426: 23,
-    1425: 23,
-    1424: 23,
-    1423: 23,
-    1422: 23,
-    1421: 23,
-    1420: 24,
-    1419: 24,
-    1418: 24,
-    1417: 24,
-    1416: 24,
-    1415: 24,
-    1414: 24,
-    1413: 24,
-    1412: 24,
-    1411: 24,
-    1410: 26,
-    1409: 26,
-    1408: 26,
-    1407: 26,
-    1406: 26,
-    1405: 26,
-    1404: 26,
-    1403: 26,
-    1402: 26,
-    1401: 26,
-    1400: 27,
-    1399: 27,
-    1398: 27,
-    1397: 27,
-    1396: 27,
-    1395: 27,
-    1394: 27,
-    1393: 27,
-    1392: 27,
-    1391: 27,
-    1390: 29,
-    1389: 29,
-    1388: 29,
-    1387: 29,
-    1386: 29,
-    1385: 29,
-    1384: 29,
-    1383: 29,
-    1382: 29,
-    1381: 29,
-    1380: 30,
-    1379: 30,
-    1378: 30,
-    1377: 30,
-    1376: 30,
-    1375: 30,
-    1374: 30,
-    1373: 30,
-    1372: 30,
-    1371: 30,
-    1370: 32,
-    1369: 32,
-    1368: 32,
-    1367: 32,
-    1366: 32,
-    1365: 32,
-    1364: 32,
-    1363: 32,
-    1362: 32,
-    1361: 32,
-    1360: 33,
-    1359: 33,
-    1358: 33,
-    1357: 33,
-    1356: 33,
-    1355: 33,
-    1354: 33,
-    1353: 33,
-    1352: 33,
-    1351: 33,
-    1350: 35,
-    1349: 35,
-    1348: 35,
-    1347: 35,
-    1346: 35,
-    1345: 35,
-    1344: 35,
-    1343: 35,
-    1342: 35,
-    1341: 35,
-    1340: 37,
-    1339: 37,
-    1338: 37,
-    1337: 37,
-    1336: 37,
-    1335: 37,
-    1334: 37,
-    1333: 37,
-    1332: 37,
-    1331: 37,
-    1330: 39,
-    1329: 39,
-    1328: 39,
-    1327: 39,
-    1326: 39,
-    1325: 39,
-    1324: 39,
-    1323: 39,
-    1322: 39,
-    1321: 39,
-    1320: 41,
-    1319: 41,
-    1318: 41,
-    1317: 41,
-    1316: 41,
-    1315: 41,
-    1314: 41,
-    1313: 41,
-    1312: 41,
-    1311: 41,
-    1310: 43,
-    1309: 43,
-    1308: 43,
-    1307: 43,
-    1306: 43,
-    1305: 43,
-    1304: 43,
-    1303: 43,
-    1302: 43,
-    1301: 43,
-    1300: 45,
-    1299: 45,
-    1298: 45,
-    1297: 45,
-    1296: 45,
-    1295: 45,
-    1294: 45,
-    1293: 45,
-    1292: 45,
-    1291: 45,
-    1290: 47,
-    1289: 47,
-    1288: 47,
-    1287: 47,
-    1286: 47,
-    1285: 47,
-    1284: 47,
-    1283: 47,
-    1282: 47,
-    1281: 47,
-    1280: 49,
-    1279: 49,
-    1278: 49,
-    1277: 49,
-    1276: 49,
-    1275: 49,
-    1274: 49,
-    1273: 49,
-    1272: 49,
-    1271: 49,
-    1270: 51,
-    1269: 51,
-    1268: 51,
-    1267: 51,
-    1266: 51,
-    1265: 51,
-    1264: 51,
-    1263: 51,
-    1262: 51,
-    1261: 51,
-    1260: 53,
-    1259: 53,
-    1258: 53,
-    1257: 53,
-    1256: 53,
-    1255: 53,
-    1254: 53,
-    1253: 53,
-    1252: 53,
-    1251: 53,
-    1250: 55,
-    1249: 55,
-    1248: 55,
-    1247: 55,
-    1246: 55,
-    1245: 55,
-    1244: 55,
-    1243: 55,
-    1242: 55,
-    1241: 55,
-    1240: 58,
-    1239: 58,
-    1238: 58,
-    1237: 58,
-    1236: 58,
-    1235: 58,
-    1234: 58,
-    1233: 58,
-    1232: 58,
-    1231: 58,
-    1230: 61,
-    1229: 61,
-    1228: 61,
-    1227: 61,
-    1226: 61,
-    1225: 61,
-    1224: 61,
-    1223: 61,
-    1222: 61,
-    1221: 61,
-    1220: 64,
-    1219: 64,
-    1218: 64,
-    1217: 64,
-    1216: 64,
-    1215: 64,
-    1214: 64,
-    1213: 64,
-    1212: 64,
-    1211: 64,
-    1210: 67,
-    1209: 67,
-    1208: 67,
-    1207: 67,
-    1206: 67,
-    1205: 67,
-    1204: 67,
-    1203: 67,
-    1202: 67,
-    1201: 67,
-    1200: 70,
-    1199: 70,
-    1198: 70,
-    1197: 70,
-    1196: 70,
-    1195: 70,
-    1194: 70,
-    1193: 70,
-    1192: 70,
-    1191: 70,
-    1190: 74,
-    1189: 74,
-    1188: 74,
-    1187: 74,
-    1186: 74,
-    1185: 74,
-    1184: 74,
-    1183: 74,
-    1182: 74,
-    1181: 74,
-    1180: 78,
-    1179: 78,
-    1178: 78,
-    1177: 78,
-    1176: 78,
-    1175: 78,
-    1174: 78,
-    1173: 78,
-    1172: 78,
-    1171: 78,
-    1170: 82,
-    1169: 82,
-    1168: 82,
-    1167: 82,
-    1166: 82,
-    1165: 82,
-    1164: 82,
-    1163: 82,
-    1162: 82,
-    1161: 82,
-    1160: 87,
-    1159: 87,
-    1158: 87,
-    1157: 87,
-    1156: 87,
-    1155: 87,
-    1154: 87,
-    1153: 87,
-    1152: 87,
-    1151: 87,
-    1150: 93,
-    1149: 93,
-    1148: 93,
-    1147: 93,
-    1146: 93,
-    1145: 93,
-    1144: 93,
-    1143: 93,
-    1142: 93,
-    1141: 93,
-    1140: 99,
-    1139: 99,
-    1138: 99,
-    1137: 99,
-    1136: 99,
-    1135: 99,
-    1134: 99,
-    1133: 99,
-    1132: 99,
-    1131: 99,
-    1130: 105,
-    1129: 105,
-    1128: 105,
-    1127: 105,
-    1126: 105,
-    1125: 105,
-    1124: 105,
-    1123: 105,
-    1122: 105,
-    1121: 105,
-    1120: 112,
-    1119: 112,
-    1118: 112,
-    1117: 112,
-    1116: 112,
-    1115: 112,
-    1114: 112,
-    1113: 112,
-    1112: 112,
-    1111: 112,
-    1110: 119,
-    1109: 119,
-    1108: 119,
-    1107: 119,
-    1106: 119,
-    1105: 119,
-    1104: 119,
-    1103: 119,
-    1102: 119,
-    1101: 119,
-    1100: 128,
-    1099: 128,
-    1098: 128,
-    1097: 128,
-    1096: 128,
-    1095: 128,
-    1094: 128,
-    1093: 128,
-    1092: 128,
-    1091: 128,
-    1090: 138,
-    1089: 138,
-    1088: 138,
-    1087: 138,
-    1086: 138,
-    1085: 138,
-    1084: 138,
-    1083: 138,
-    1082: 138,
-    1081: 138,
-    1080: 150
-  },
-  'U16M800': {
-    'min': 24760,
-    'max': 11530,
-    24760: 1,
-    24759: 1,
-    24758: 1,
-    24757: 1,
-    24756: 1,
-    24755: 1,
-    24754: 1,
-    24753: 1,
-    24752: 1,
-    24751: 1,
-    24750: 1,
-    24749: 1,
-    24748: 1,
-    24747: 1,
-    24746: 1,
-    24745: 1,
-    24744: 1,
-    24743: 1,
-    24742: 1,
-    24741: 1,
-    24740: 1,
-    24739: 1,
-    24738: 1,
-    24737: 1,
-    24736: 1,
-    24735: 1,
-    24734: 1,
-    24733: 1,
-    24732: 1,
-    24731: 1,
-    24730: 1,
-    24729: 1,
-    24728: 1,
-    24727: 1,
-    24726: 1,
-    24725: 1,
-    24724: 1,
-    24723: 1,
-    24722: 1,
-    24721: 1,
-    24720: 1,
-    24719: 1,
-    24718: 1,
-    24717: 1,
-    24716: 1,
-    24715: 1,
-    24714: 1,
-    24713: 1,
-    24712: 1,
-    24711: 1,
-    24710: 1,
-    24709: 1,
-    24708: 1,
-    24707: 1,
-    24706: 1,
-    24705: 1,
-    24704: 1,
-    24703: 1,
-    24702: 1,
-    24701: 1,
-    24700: 1,
-    24699: 1,
-    24698: 1,
-    24697: 1,
-    24696: 1,
-    24695: 1,
-    24694: 1,
-    24693: 1,
-    24692: 1,
-    24691: 1,
-    24690: 1,
-    24689: 1,
-    24688: 1,
-    24687: 1,
-    24686: 1,
-    24685: 1,
-    24684: 1,
-    24683: 1,
-    24682: 1,
-    24681: 1,
-    24680: 1,
-    24679: 1,
-    24678: 1,
-    24677: 1,
-    24676: 1,
-    24675: 1,
-    24674: 1,
-    24673: 1,
-    24672: 1,
-    24671: 1,
-    24670: 1,
-    24669: 1,
-    24668: 1,
-    24667: 1,
-    24666: 1,
-    24665: 1,
-    24664: 1,
-    24663: 1,
-    24662: 1,
-    24661: 1,
-    24660: 1,
-    24659: 1,
-    24658: 1,
-    24657: 1,
-    24656: 1,
-    24655: 1,
-    24654: 1,
-    24653: 1,
-    24652: 1,
-    24651: 1,
-    24650: 1,
-    24649: 1,
-    24648: 1,
-    24647: 1,
-    24646: 1,
-    24645: 1,
-    24644: 1,
-    24643: 1,
-    24642: 1,
-    24641: 1,
-    24640: 1,
-    24639: 1,
-    24638: 1,
-    24637: 1,
-    24636: 1,
-    24635: 1,
-    24634: 1,
-    24633: 1,
-    24632: 1,
-    24631: 1,
-    24630: 1,
-    24629: 1,
-    24628: 1,
-    24627: 1,
-    24626: 1,
-    24625: 1,
-    24624: 1,
-    24623: 1,
-    24622: 1,
-    24621: 1,
-    24620: 1,
-    24619: 1,
-    24618: 1,
-    24617: 1,
-    24616: 1,
-    24615: 1,
-    24614: 1,
-    24613: 1,
-    24612: 1,
-    24611: 1,
-    24610: 1,
-    24609: 1,
-    24608: 1,
-    24607: 1,
-    24606: 1,
-    24605: 1,
-    24604: 1,
-    24603: 1,
-    24602: 1,
-    24601: 1,
-    24600: 1,
-    24599: 1,
-    24598: 1,
-    24597: 1,
-    24596: 1,
-    24595: 1,
-    24594: 1,
-    24593: 1,
-    24592: 1,
-    24591: 1,
-    24590: 1,
-    24589: 1,
-    24588: 1,
-    24587: 1,
-    24586: 1,
-    24585: 1,
-    24584: 1,
-    24583: 1,
-    24582: 1,
-    24581: 1,
-    24580: 1,
-    24579: 1,
-    24578: 1,
-    24577: 1,
-    24576: 1,
-    24575: 1,
-    24574: 1,
-    24573: 1,
-    24572: 1,
-    24571: 1,
-    24570: 1,
-    24569: 1,
-    24568: 1,
-    24567: 1,
-    24566: 1,
-    24565: 1,
-    24564: 1,
-    24563: 1,
-    24562: 1,
-    24561: 1,
-    24560: 1,
-    24559: 1,
-    24558: 1,
-    24557: 1,
-    24556: 1,
-    24555: 1,
-    24554: 1,
-    24553: 1,
-    24552: 1,
-    24551: 1,
-    24550: 1,
-    24549: 1,
-    24548: 1,
-    24547: 1,
-    24546: 1,
-    24545: 1,
-    24544: 1,
-    24543: 1,
-    24542: 1,
-    24541: 1,
-    24540: 1,
-    24539: 1,
-    24538: 1,
-    24537: 1,
-    24536: 1,
-    24535: 1,
-    24534: 1,
-    24533: 1,
-    24532: 1,
-    24531: 1,
-    24530: 1,
-    24529: 1,
-    24528: 1,
-    24527: 1,
-    24526: 1,
-    24525: 1,
-    24524: 1,
-    24523: 1,
-    24522: 1,
-    24521: 1,
-    24520: 1,
-    24519: 1,
-    24518: 1,
-    24517: 1,
-    24516: 1,
-    24515: 1,
-    24514: 1,
-    24513: 1,
-    24512: 1,
-    24511: 1,
-    24510: 1,
-    24509: 1,
-    24508: 1,
-    24507: 1,
-    24506: 1,
-    24505: 1,
-    24504: 1,
-    24503: 1,
-    24502: 1,
-    24501: 1,
-    24500: 1,
-    24499: 1,
-    24498: 1,
-    24497: 1,
-    24496: 1,
-    24495: 1,
-    24494: 1,
-    24493: 1,
-    24492: 1,
-    24491: 1,
-    24490: 1,
-    24489: 1,
-    24488: 1,
-    24487: 1,
-    24486: 1,
-    24485: 1,
-    24484: 1,
-    24483: 1,
-    24482: 1,
-    24481: 1,
-    24480: 2,
-    24479: 2,
-    24478: 2,
-    24477: 2,
-    24476: 2,
-    24475: 2,
-    24474: 2,
-    24473: 2,
-    24472: 2,
-    24471: 2,
-    24470: 2,
-    24469: 2,
-    24468: 2,
-    24467: 2,
-    24466: 2,
-    24465: 2,
-    24464: 2,
-    24463: 2,
-    24462: 2,
-    24461: 2,
-    24460: 2,
-    24459: 2,
-    24458: 2,
-    24457: 2,
-    24456: 2,
-    24455: 2,
-    24454: 2,
-    24453: 2,
-    24452: 2,
-    24451: 2,
-    24450: 2,
-    24449: 2,
-    24448: 2,
-    24447: 2,
-    24446: 2,
-    24445: 2,
-    24444: 2,
-    24443: 2,
-    24442: 2,
-    24441: 2,
-    24440: 2,
-    24439: 2,
-    24438: 2,
-    24437: 2,
-    24436: 2,
-    24435: 2,
-    24434: 2,
-    24433: 2,
-    24432: 2,
-    24431: 2,
-    24430: 2,
-    24429: 2,
-    24428: 2,
-    24427: 2,
-    24426: 2,
-    24425: 2,
-    24424: 2,
-    24423: 2,
-    24422: 2,
-    24421: 2,
-    24420: 2,
-    24419: 2,
-    24418: 2,
-    24417: 2,
-    24416: 2,
-    24415: 2,
-    24414: 2,
-    24413: 2,
-    24412: 2,
-    24411: 2,
-    24410: 2,
-    24409: 2,
-    24408: 2,
-    24407: 2,
-    24406: 2,
-    24405: 2,
-    24404: 2,
-    24403: 2,
-    24402: 2,
-    24401: 2,
-    24400: 2,
-    24399: 2,
-    24398: 2,
-    24397: 2,
-    24396: 2,
-    24395: 2,
-    24394: 2,
-    24393: 2,
-    24392: 2,
-    24391: 2,
-    24390: 2,
-    24389: 2,
-    24388: 2,
-    24387: 2,
-    24386: 2,
-    24385: 2,
-    24384: 2,
-    24383: 2,
-    24382: 2,
-    24381: 2,
-    24380: 2,
-    24379: 2,
-    24378: 2,
-    24377: 2,
-    24376: 2,
-    24375: 2,
-    24374: 2,
-    24373: 2,
-    24372: 2,
-    24371: 2,
-    24370: 2,
-    24369: 2,
-    24368: 2,
-    24367: 2,
-    24366: 2,
-    24365: 2,
-    24364: 2,
-    24363: 2,
-    24362: 2,
-    24361: 2,
-    24360: 2,
-    24359: 2,
-    24358: 2,
-    24357: 2,
-    24356: 2,
-    24355: 2,
-    24354: 2,
-    24353: 2,
-    24352: 2,
-    24351: 2,
-    24350: 2,
-    24349: 2,
-    24348: 2,
-    24347: 2,
-    24346: 2,
-    24345: 2,
-    24344: 2,
-    24343: 2,
-    24342: 2,
-    24341: 2,
-    24340: 2,
-    24339: 2,
-    24338: 2,
-    24337: 2,
-    24336: 2,
-    24335: 2,
-    24334: 2,
-    24333: 2,
-    24332: 2,
-    24331: 2,
-    24330: 2,
-    24329: 2,
-    24328: 2,
-    24327: 2,
-    24326: 2,
-    24325: 2,
-    24324: 2,
-    24323: 2,
-    24322: 2,
-    24321: 2,
-    24320: 2,
-    24319: 2,
-    24318: 2,
-    24317: 2,
-    24316: 2,
-    24315: 2,
-    24314: 2,
-    24313: 2,
-    24312: 2,
-    24311: 2,
-    24310: 2,
-    24309: 2,
-    24308: 2,
-    24307: 2,
-    24306: 2,
-    24305: 2,
-    24304: 2,
-    24303: 2,
-    24302: 2,
-    24301: 2,
-    24300: 2,
-    24299: 2,
-    24298: 2,
-    24297: 2,
-    24296: 2,
-    24295: 2,
-    24294: 2,
-    24293: 2,
-    24292: 2,
-    24291: 2,
-    24290: 2,
-    24289: 2,
-    24288: 2,
-    24287: 2,
-    24286: 2,
-    24285: 2,
-    24284: 2,
-    24283: 2,
-    24282: 2,
-    24281: 2,
-    24280: 2,
-    24279: 2,
-    24278: 2,
-    24277: 2,
-    24276: 2,
-    24275: 2,
-    24274: 2,
-    24273: 2,
-    24272: 2,
-    24271: 2,
-    24270: 2,
-    24269: 2,
-    24268: 2,
-    24267: 2,
-    24266: 2,
-    24265: 2,
-    24264: 2,
-    24263: 2,
-    24262: 2,
-    24261: 2,
-    24260: 2,
-    24259: 2,
-    24258: 2,
-    24257: 2,
-    24256: 2,
-    24255: 2,
-    24254: 2,
-    24253: 2,
-    24252: 2,
-    24251: 2,
-    24250: 2,
-    24249: 2,
-    24248: 2,
-    24247: 2,
-    24246: 2,
-    24245: 2,
-    24244: 2,
-    24243: 2,
-    24242: 2,
-    24241: 2,
-    24240: 2,
-    24239: 2,
-    24238: 2,
-    24237: 2,
-    24236: 2,
-    24235: 2,
-    24234: 2,
-    24233: 2,
-    24232: 2,
-    24231: 2,
-    24230: 2,
-    24229: 2,
-    24228: 2,
-    24227: 2,
-    24226: 2,
-    24225: 2,
-    24224: 2,
-    24223: 2,
-    24222: 2,
-    24221: 2,
-    24220: 2,
-    24219: 2,
-    24218: 2,
-    24217: 2,
-    24216: 2,
-    24215: 2,
-    24214: 2,
-    24213: 2,
-    24212: 2,
-    24211: 2,
-    24210: 3,
-    24209: 3,
-    24208: 3,
-    24207: 3,
-    24206: 3,
-    24205: 3,
-    24204: 3,
-    24203: 3,
-    24202: 3,
-    24201: 3,
-    24200: 3,
-    24199: 3,
-    24198: 3,
-    24197: 3,
-    24196: 3,
-    24195: 3,
-    24194: 3,
-    24193: 3,
-    24192: 3,
-    24191: 3,
-    24190: 3,
-    24189: 3,
-    24188: 3,
-    24187: 3,
-    24186: 3,
-    24185: 3,
-    24184: 3,
-    24183: 3,
-    24182: 3,
-    24181: 3,
-    24180: 3,
-    24179: 3,
-    24178: 3,
-    24177: 3,
-    24176: 3,
-    24175: 3,
-    24174: 3,
-    24173: 3,
-    24172: 3,
-    24171: 3,
-    24170: 3,
-    24169: 3,
-    24168: 3,
-    24167: 3,
-    24166: 3,
-    24165: 3,
-    24164: 3,
-    24163: 3,
-    24162: 3,
-    24161: 3,
-    24160: 3,
-    24159: 3,
-    24158: 3,
-    24157: 3,
-    24156: 3,
-    24155: 3,
-    24154: 3,
-    24153: 3,
-    24152: 3,
-    24151: 3,
-    24150: 3,
-    24149: 3,
-    24148: 3,
-    24147: 3,
-    24146: 3,
-    24145: 3,
-    24144: 3,
-    24143: 3,
-    24142: 3,
-    24141: 3,
-    24140: 3,
-    24139: 3,
-    24138: 3,
-    24137: 3,
-    24136: 3,
-    24135: 3,
-    24134: 3,
-    24133: 3,
-    24132: 3,
-    24131: 3,
-    24130: 3,
-    24129: 3,
-    24128: 3,
-    24127: 3,
-    24126: 3,
-    24125: 3,
-    24124: 3,
-    24123: 3,
-    24122: 3,
-    24121: 3,
-    24120: 3,
-    24119: 3,
-    24118: 3,
-    24117: 3,
-    24116: 3,
-    24115: 3,
-    24114: 3,
-    24113: 3,
-    24112: 3,
-    24111: 3,
-    24110: 3,
-    24109: 3,
-    24108: 3,
-    24107: 3,
-    24106: 3,
-    24105: 3,
-    24104: 3,
-    24103: 3,
-    24102: 3,
-    24101: 3,
-    24100: 3,
-    24099: 3,
-    24098: 3,
-    24097: 3,
-    24096: 3,
-    24095: 3,
-    24094: 3,
-    24093: 3,
-    24092: 3,
-    24091: 3,
-    24090: 3,
-    24089: 3,
-    24088: 3,
-    24087: 3,
-    24086: 3,
-    24085: 3,
-    24084: 3,
-    24083: 3,
-    24082: 3,
-    24081: 3,
-    24080: 3,
-    24079: 3,
-    24078: 3,
-    24077: 3,
-    24076: 3,
-    24075: 3,
-    24074: 3,
-    24073: 3,
-    24072: 3,
-    24071: 3,
-    24070: 3,
-    24069: 3,
-    24068: 3,
-    24067: 3,
-    24066: 3,
-    24065: 3,
-    24064: 3,
-    24063: 3,
-    24062: 3,
-    24061: 3,
-    24060: 3,
-    24059: 3,
-    24058: 3,
-    24057: 3,
-    24056: 3,
-    24055: 3,
-    24054: 3,
-    24053: 3,
-    24052: 3,
-    24051: 3,
-    24050: 3,
-    24049: 3,
-    24048: 3,
-    24047: 3,
-    24046: 3,
-    24045: 3,
-    24044: 3,
-    24043: 3,
-    24042: 3,
-    24041: 3,
-    24040: 3,
-    24039: 3,
-    24038: 3,
-    24037: 3,
-    24036: 3,
-    24035: 3,
-    24034: 3,
-    24033: 3,
-    24032: 3,
-    24031: 3,
-    24030: 3,
-    24029: 3,
-    24028: 3,
-    24027: 3,
-    24026: 3,
-    24025: 3,
-    24024: 3,
-    24023: 3,
-    24022: 3,
-    24021: 3,
-    24020: 3,
-    24019: 3,
-    24018: 3,
-    24017: 3,
-    24016: 3,
-    24015: 3,
-    24014: 3,
-    24013: 3,
-    24012: 3,
-    24011: 3,
-    24010: 3,
-    24009: 3,
-    24008: 3,
-    24007: 3,
-    24006: 3,
-    24005: 3,
-    24004: 3,
-    24003: 3,
-    24002: 3,
-    24001: 3,
-    24000: 3,
-    23999: 3,
-    23998: 3,
-    23997: 3,
-    23996: 3,
-    23995: 3,
-    23994: 3,
-    23993: 3,
-    23992: 3,
-    23991: 3,
-    23990: 3,
-    23989: 3,
-    23988: 3,
-    23987: 3,
-    23986: 3,
-    23985: 3,
-    23984: 3,
-    23983: 3,
-    23982: 3,
-    23981: 3,
-    23980: 3,
-    23979: 3,
-    23978: 3,
-    23977: 3,
-    23976: 3,
-    23975: 3,
-    23974: 3,
-    23973: 3,
-    23972: 3,
-    23971: 3,
-    23970: 3,
-    23969: 3,
-    23968: 3,
-    23967: 3,
-    23966: 3,
-    23965: 3,
-    23964: 3,
-    23963: 3,
-    23962: 3,
-    23961: 3,
-    23960: 3,
-    23959: 3,
-    23958: 3,
-    23957: 3,
-    23956: 3,
-    23955: 3,
-    23954: 3,
-    23953: 3,
-    23952: 3,
-    23951: 3,
-    23950: 3,
-    23949: 3,
-    23948: 3,
-    23947: 3,
-    23946: 3,
-    23945: 3,
-    23944: 3,
-    23943: 3,
-    23942: 3,
-    23941: 3,
-    23940: 4,
-    23939: 4,
-    23938: 4,
-    23937: 4,
-    23936: 4,
-    23935: 4,
-    23934: 4,
-    23933: 4,
-    23932: 4,
-    23931: 4,
-    23930: 4,
-    23929: 4,
-    23928: 4,
-    23927: 4,
-    23926: 4,
-    23925: 4,
-    23924: 4,
-    23923: 4,
-    23922: 4,
-    23921: 4,
-    23920: 4,
-    23919: 4,
-    23918: 4,
-    23917: 4,
-    23916: 4,
-    23915: 4,
-    23914: 4,
-    23913: 4,
-    23912: 4,
-    23911: 4,
-    23910: 4,
-    23909: 4,
-    23908: 4,
-    23907: 4,
-    23906: 4,
-    23905: 4,
-    23904: 4,
-    23903: 4,
-    23902: 4,
-    23901: 4,
-    23900: 4,
-    23899: 4,
-    23898: 4,
-    23897: 4,
-    23896: 4,
-    23895: 4,
-    23894: 4,
-    23893: 4,
-    23892: 4,
-    23891: 4,
-    23890: 4,
-    23889: 4,
-    23888: 4,
-    23887: 4,
-    23886: 4,
-    23885: 4,
-    23884: 4,
-    23883: 4,
-    23882: 4,
-    23881: 4,
-    23880: 4,
-    23879: 4,
-    23878: 4,
-    23877: 4,
-    23876: 4,
-    23875: 4,
-    23874: 4,
-    23873: 4,
-    23872: 4,
-    23871: 4,
-    23870: 4,
-    23869: 4,
-    23868: 4,
-    23867: 4,
-    23866: 4,
-    23865: 4,
-    23864: 4,
-    23863: 4,
-    23862: 4,
-    23861: 4,
-    23860: 4,
-    23859: 4,
-    23858: 4,
-    23857: 4,
-    23856: 4,
-    23855: 4,
-    23854: 4,
-    23853: 4,
-    23852: 4,
-    23851: 4,
-    23850: 4,
-    23849: 4,
-    23848: 4,
-    23847: 4,
-    23846: 4,
-    23845: 4,
-    23844: 4,
-    23843: 4,
-    23842: 4,
-    23841: 4,
-    23840: 4,
-    23839: 4,
-    23838: 4,
-    23837: 4,
-    23836: 4,
-    23835: 4,
-    23834: 4,
-    23833: 4,
-    23832: 4,
-    23831: 4,
-    23830: 4,
-    23829: 4,
-    23828: 4,
-    23827: 4,
-    23826: 4,
-    23825: 4,
-    23824: 4,
-    23823: 4,
-    23822: 4,
-    23821: 4,
-    23820: 4,
-    23819: 4,
-    23818: 4,
-    23817: 4,
-    23816: 4,
-    23815: 4,
-    23814: 4,
-    23813: 4,
-    23812: 4,
-    23811: 4,
-    23810: 4,
-    23809: 4,
-    23808: 4,
-    23807: 4,
-    23806: 4,
-    23805: 4,
-    23804: 4,
-    23803: 4,
-    23802: 4,
-    23801: 4,
-    23800: 4,
-    23799: 4,
-    23798: 4,
-    23797: 4,
-    23796: 4,
-    23795: 4,
-    23794: 4,
-    23793: 4,
-    23792: 4,
-    23791: 4,
-    23790: 4,
-    23789: 4,
-    23788: 4,
-    23787: 4,
-    23786: 4,
-    23785: 4,
-    23784: 4,
-    23783: 4,
-    23782: 4,
-    23781: 4,
-    23780: 4,
-    23779: 4,
-    23778: 4,
-    23777: 4,
-    23776: 4,
-    23775: 4,
-    23774: 4,
-    23773: 4,
-    23772: 4,
-    23771: 4,
-    23770: 4,
-    23769: 4,
-    23768: 4,
-    23767: 4,
-    23766: 4,
-    23765: 4,
-    23764: 4,
-    23763: 4,
-    23762: 4,
-    23761: 4,
-    23760: 4,
-    23759: 4,
-    23758: 4,
-    23757: 4,
-    23756: 4,
-    23755: 4,
-    23754: 4,
-    23753: 4,
-    23752: 4,
-    23751: 4,
-    23750: 4,
-    23749: 4,
-    23748: 4,
-    23747: 4,
-    23746: 4,
-    23745: 4,
-    23744: 4,
-    23743: 4,
-    23742: 4,
-    23741: 4,
-    23740: 4,
-    23739: 4,
-    23738: 4,
-    23737: 4,
-    23736: 4,
-    23735: 4,
-    23734: 4,
-    23733: 4,
-    23732: 4,
-    23731: 4,
-    23730: 4,
-    23729: 4,
-    23728: 4,
-    23727: 4,
-    23726: 4,
-    23725: 4,
-    23724: 4,
-    23723: 4,
-    23722: 4,
-    23721: 4,
-    23720: 4,
-    23719: 4,
-    23718: 4,
-    23717: 4,
-    23716: 4,
-    23715: 4,
-    23714: 4,
-    23713: 4,
-    23712: 4,
-    23711: 4,
-    23710: 4,
-    23709: 4,
-    23708: 4,
-    23707: 4,
-    23706: 4,
-    23705: 4,
-    23704: 4,
-    23703: 4,
-    23702: 4,
-    23701: 4,
-    23700: 4,
-    23699: 4,
-    23698: 4,
-    23697: 4,
-    23696: 4,
-    23695: 4,
-    23694: 4,
-    23693: 4,
-    23692: 4,
-    23691: 4,
-    23690: 4,
-    23689: 4,
-    23688: 4,
-    23687: 4,
-    23686: 4,
-    23685: 4,
-    23684: 4,
-    23683: 4,
-    23682: 4,
-    23681: 4,
-    23680: 5,
-    23679: 5,
-    23678: 5,
-    23677: 5,
-    23676: 5,
-    23675: 5,
-    23674: 5,
-    23673: 5,
-    23672: 5,
-    23671: 5,
-    23670: 5,
-    23669: 5,
-    23668: 5,
-    23667: 5,
-    23666: 5,
-    23665: 5,
-    23664: 5,
-    23663: 5,
-    23662: 5,
-    23661: 5,
-    23660: 5,
-    23659: 5,
-    23658: 5,
-    23657: 5,
-    23656: 5,
-    23655: 5,
-    23654: 5,
-    23653: 5,
-    23652: 5,
-    23651: 5,
-    23650: 5,
-    23649: 5,
-    23648: 5,
-    23647: 5,
-    23646: 5,
-    23645: 5,
-    23644: 5,
-    23643: 5,
-    23642: 5,
-    23641: 5,
-    23640: 5,
-    23639: 5,
-    23638: 5,
-    23637: 5,
-    23636: 5,
-    23635: 5,
-    23634: 5,
-    23633: 5,
-    23632: 5,
-    23631: 5,
-    23630: 5,
-    23629: 5,
-    23628: 5,
-    23627: 5,
-    23626: 5,
-    23625: 5,
-    23624: 5,
-    23623: 5,
-    23622: 5,
-    23621: 5,
-    23620: 5,
-    23619: 5,
-    23618: 5,
-    23617: 5,
-    23616: 5,
-    23615: 5,
-    23614: 5,
-    23613: 5,
-    23612: 5,
-    23611: 5,
-    23610: 5,
-    23609: 5,
-    23608: 5,
-    23607: 5,
-    23606: 5,
-    23605: 5,
-    23604: 5,
-    23603: 5,
-    23602: 5,
-    23601: 5,
-    23600: 5,
-    23599: 5,
-    23598: 5,
-    23597: 5,
-    23596: 5,
-    23595: 5,
-    23594: 5,
-    23593: 5,
-    23592: 5,
-    23591: 5,
-    23590: 5,
-    23589: 5,
-    23588: 5,
-    23587: 5,
-    23586: 5,
-    23585: 5,
-    23584: 5,
-    23583: 5,
-    23582: 5,
-    23581: 5,
-    23580: 5,
-    23579: 5,
-    23578: 5,
-    23577: 5,
-    23576: 5,
-    23575: 5,
-    23574: 5,
-    23573: 5,
-    23572: 5,
-    23571: 5,
-    23570: 5,
-    23569: 5,
-    23568: 5,
-    23567: 5,
-    23566: 5,
-    23565: 5,
-    23564: 5,
-    23563: 5,
-    23562: 5,
-    23561: 5,
-    23560: 5,
-    23559: 5,
-    23558: 5,
-    23557: 5,
-    23556: 5,
-    23555: 5,
-    23554: 5,
-    23553: 5,
-    23552: 5,
-    23551: 5,
-    23550: 5,
-    23549: 5,
-    23548: 5,
-    23547: 5,
-    23546: 5,
-    23545: 5,
-    23544: 5,
-    23543: 5,
-    23542: 5,
-    23541: 5,
-    23540: 5,
-    23539: 5,
-    23538: 5,
-    23537: 5,
-    23536: 5,
-    23535: 5,
-    23534: 5,
-    23533: 5,
-    23532: 5,
-    23531: 5,
-    23530: 5,
-    23529: 5,
-    23528: 5,
-    23527: 5,
-    23526: 5,
-    23525: 5,
-    23524: 5,
-    23523: 5,
-    23522: 5,
-    23521: 5,
-    23520: 5,
-    23519: 5,
-    23518: 5,
-    23517: 5,
-    23516: 5,
-    23515: 5,
-    23514: 5,
-    23513: 5,
-    23512: 5,
-    23511: 5,
-    23510: 5,
-    23509: 5,
-    23508: 5,
-    23507: 5,
-    23506: 5,
-    23505: 5,
-    23504: 5,
-    23503: 5,
-    23502: 5,
-    23501: 5,
-    23500: 5,
-    23499: 5,
-    23498: 5,
-    23497: 5,
-    23496: 5,
-    23495: 5,
-    23494: 5,
-    23493: 5,
-    23492: 5,
-    23491: 5,
-    23490: 5,
-    23489: 5,
-    23488: 5,
-    23487: 5,
-    23486: 5,
-    23485: 5,
-    23484: 5,
-    23483: 5,
-    23482: 5,
-    23481: 5,
-    23480: 5,
-    23479: 5,
-    23478: 5,
-    23477: 5,
-    23476: 5,
-    23475: 5,
-    23474: 5,
-    23473: 5,
-    23472: 5,
-    23471: 5,
-    23470: 5,
-    23469: 5,
-    23468: 5,
-    23467: 5,
-    23466: 5,
-    23465: 5,
-    23464: 5,
-    23463: 5,
-    23462: 5,
-    23461: 5,
-    23460: 5,
-    23459: 5,
-    23458: 5,
-    23457: 5,
-    23456: 5,
-    23455: 5,
-    23454: 5,
-    23453: 5,
-    23452: 5,
-    23451: 5,
-    23450: 5,
-    23449: 5,
-    23448: 5,
-    23447: 5,
-    23446: 5,
-    23445: 5,
-    23444: 5,
-    23443: 5,
-    23442: 5,
-    23441: 5,
-    23440: 5,
-    23439: 5,
-    23438: 5,
-    23437: 5,
-    23436: 5,
-    23435: 5,
-    23434: 5,
-    23433: 5,
-    23432: 5,
-    23431: 5,
-    23430: 6,
-    23429: 6,
-    23428: 6,
-    23427: 6,
-    23426: 6,
-    23425: 6,
-    23424: 6,
-    23423: 6,
-    23422: 6,
-    23421: 6,
-    23420: 6,
-    23419: 6,
-    23418: 6,
-    23417: 6,
-    23416: 6,
-    23415: 6,
-    23414: 6,
-    23413: 6,
-    23412: 6,
-    23411: 6,
-    23410: 6,
-    23409: 6,
-    23408: 6,
-    23407: 6,
-    23406: 6,
-    23405: 6,
-    23404: 6,
-    23403: 6,
-    23402: 6,
-    23401: 6,
-    23400: 6,
-    23399: 6,
-    23398: 6,
-    23397: 6,
-    23396: 6,
-    23395: 6,
-    23394: 6,
-    23393: 6,
-    23392: 6,
-    23391: 6,
-    23390: 6,
-    23389: 6,
-    23388: 6,
-    23387: 6,
-    23386: 6,
-    23385: 6,
-    23384: 6,
-    23383: 6,
-    23382: 6,
-    23381: 6,
-    23380: 6,
-    23379: 6,
-    23378: 6,
-    23377: 6,
-    23376: 6,
-    23375: 6,
-    23374: 6,
-    23373: 6,
-    23372: 6,
-    23371: 6,
-    23370: 6,
-    23369: 6,
-    23368: 6,
-    23367: 6,
-    23366: 6,
-    23365: 6,
-    23364: 6,
-    23363: 6,
-    23362: 6,
-    23361: 6,
-    23360: 6,
-    23359: 6,
-    23358: 6,
-    23357: 6,
-    23356: 6,
-    23355: 6,
-    23354: 6,
-    23353: 6,
-    23352: 6,
-    23351: 6,
-    23350: 6,
-    23349: 6,
-    23348: 6,
-    23347: 6,
-    23346: 6,
-    23345: 6,
-    23344: 6,
-    23343: 6,
-    23342: 6,
-    23341: 6,
-    23340: 6,
-    23339: 6,
-    23338: 6,
-    23337: 6,
-    23336: 6,
-    23335: 6,
-    23334: 6,
-    23333: 6,
-    23332: 6,
-    23331: 6,
-    23330: 6,
-    23329: 6,
-    23328: 6,
-    23327: 6,
-    23326: 6,
-    23325: 6,
-    23324: 6,
-    23323: 6,
-    23322: 6,
-    23321: 6,
-    23320: 6,
-    23319: 6,
-    23318: 6,
-    23317: 6,
-    23316: 6,
-    23315: 6,
-    23314: 6,
-    23313: 6,
-    23312: 6,
-    23311: 6,
-    23310: 6,
-    23309: 6,
-    23308: 6,
-    23307: 6,
-    23306: 6,
-    23305: 6,
-    23304: 6,
-    23303: 6,
-    23302: 6,
-    23301: 6,
-    23300: 6,
-    23299: 6,
-    23298: 6,
-    23297: 6,
-    23296: 6,
-    23295: 6,
-    23294: 6,
-    23293: 6,
-    23292: 6,
-    23291: 6,
-    23290: 6,
-    23289: 6,
-    23288: 6,
-    23287: 6,
-    23286: 6,
-    23285: 6,
-    23284: 6,
-    23283: 6,
-    23282: 6,
-    23281: 6,
-    23280: 6,
-    23279: 6,
-    23278: 6,
-    23277: 6,
-    23276: 6,
-    23275: 6,
-    23274: 6,
-    23273: 6,
-    23272: 6,
-    23271: 6,
-    23270: 6,
-    23269: 6,
-    23268: 6,
-    23267: 6,
-    23266: 6,
-    23265: 6,
-    23264: 6,
-    23263: 6,
-    23262: 6,
-    23261: 6,
-    23260: 6,
-    23259: 6,
-    23258: 6,
-    23257: 6,
-    23256: 6,
-    23255: 6,
-    23254: 6,
-    23253: 6,
-    23252: 6,
-    23251: 6,
-    23250: 6,
-    23249: 6,
-    23248: 6,
-    23247: 6,
-    23246: 6,
-    23245: 6,
-    23244: 6,
-    23243: 6,
-    23242: 6,
-    23241: 6,
-    23240: 6,
-    23239: 6,
-    23238: 6,
-    23237: 6,
-    23236: 6,
-    23235: 6,
-    23234: 6,
-    23233: 6,
-    23232: 6,
-    23231: 6,
-    23230: 6,
-    23229: 6,
-    23228: 6,
-    23227: 6,
-    23226: 6,
-    23225: 6,
-    23224: 6,
-    23223: 6,
-    23222: 6,
-    23221: 6,
-    23220: 6,
-    23219: 6,
-    23218: 6,
-    23217: 6,
-    23216: 6,
-    23215: 6,
-    23214: 6,
-    23213: 6,
-    23212: 6,
-    23211: 6,
-    23210: 6,
-    23209: 6,
-    23208: 6,
-    23207: 6,
-    23206: 6,
-    23205: 6,
-    23204: 6,
-    23203: 6,
-    23202: 6,
-    23201: 6,
-    23200: 6,
-    23199: 6,
-    23198: 6,
-    23197: 6,
-    23196: 6,
-    23195: 6,
-    23194: 6,
-    23193: 6,
-    23192: 6,
-    23191: 6,
-    23190: 7,
-    23189: 7,
-    23188: 7,
-    23187: 7,
-    23186: 7,
-    23185: 7,
-    23184: 7,
-    23183: 7,
-    23182: 7,
-    23181: 7,
-    23180: 7,
-    23179: 7,
-    23178: 7,
-    23177: 7,
-    23176: 7,
-    23175: 7,
-    23174: 7,
-    23173: 7,
-    23172: 7,
-    23171: 7,
-    23170: 7,
-    23169: 7,
-    23168: 7,
-    23167: 7,
-    23166: 7,
-    23165: 7,
-    23164: 7,
-    23163: 7,
-    23162: 7,
-    23161: 7,
-    23160: 7,
-    23159: 7,
-    23158: 7,
-    23157: 7,
-    23156: 7,
-    23155: 7,
-    23154: 7,
-    23153: 7,
-    23152: 7,
-    23151: 7,
-    23150: 7,
-    23149: 7,
-    23148: 7,
-    23147: 7,
-    23146: 7,
-    23145: 7,
-    23144: 7,
-    23143: 7,
-    23142: 7,
-    23141: 7,
-    23140: 7,
-    23139: 7,
-    23138: 7,
-    23137: 7,
-    23136: 7,
-    23135: 7,
-    23134: 7,
-    23133: 7,
-    23132: 7,
-    23131: 7,
-    23130: 7,
-    23129: 7,
-    23128: 7,
-    23127: 7,
-    23126: 7,
-    23125: 7,
-    23124: 7,
-    23123: 7,
-    23122: 7,
-    23121: 7,
-    23120: 7,
-    23119: 7,
-    23118: 7,
-    23117: 7,
-    23116: 7,
-    23115: 7,
-    23114: 7,
-    23113: 7,
-    23112: 7,
-    23111: 7,
-    23110: 7,
-    23109: 7,
-    23108: 7,
-    23107: 7,
-    23106: 7,
-    23105: 7,
-    23104: 7,
-    23103: 7,
-    23102: 7,
-    23101: 7,
-    23100: 7,
-    23099: 7,
-    23098: 7,
-    23097: 7,
-    23096: 7,
-    23095: 7,
-    23094: 7,
-    23093: 7,
-    23092: 7,
-    23091: 7,
-    23090: 7,
-    23089: 7,
-    23088: 7,
-    23087: 7,
-    23086: 7,
-    23085: 7,
-    23084: 7,
-    23083: 7,
-    23082: 7,
-    23081: 7,
-    23080: 7,
-    23079: 7,
-    23078: 7,
-    23077: 7,
-    23076: 7,
-    23075: 7,
-    23074: 7,
-    23073: 7,
-    23072: 7,
-    23071: 7,
-    23070: 7,
-    23069: 7,
-    23068: 7,
-    23067: 7,
-    23066: 7,
-    23065: 7,
-    23064: 7,
-    23063: 7,
-    23062: 7,
-    23061: 7,
-    23060: 7,
-    23059: 7,
-    23058: 7,
-    23057: 7,
-    23056: 7,
-    23055: 7,
-    23054: 7,
-    23053: 7,
-    23052: 7,
-    23051: 7,
-    23050: 7,
-    23049: 7,
-    23048: 7,
-    23047: 7,
-    23046: 7,
-    23045: 7,
-    23044: 7,
-    23043: 7,
-    23042: 7,
-    23041: 7,
-    23040: 7,
-    23039: 7,
-    23038: 7,
-    23037: 7,
-    23036: 7,
-    23035: 7,
-    23034: 7,
-    23033: 7,
-    23032: 7,
-    23031: 7,
-    23030: 7,
-    23029: 7,
-    23028: 7,
-    23027: 7,
-    23026: 7,
-    23025: 7,
-    23024: 7,
-    23023: 7,
-    23022: 7,
-    23021: 7,
-    23020: 7,
-    23019: 7,
-    23018: 7,
-    23017: 7,
-    23016: 7,
-    23015: 7,
-    23014: 7,
-    23013: 7,
-    23012: 7,
-    23011: 7,
-    23010: 7,
-    23009: 7,
-    23008: 7,
-    23007: 7,
-    23006: 7,
-    23005: 7,
-    23004: 7,
-    23003: 7,
-    23002: 7,
-    23001: 7,
-    23000: 7,
-    22999: 7,
-    22998: 7,
-    22997: 7,
-    22996: 7,
-    22995: 7,
-    22994: 7,
-    22993: 7,
-    22992: 7,
-    22991: 7,
-    22990: 7,
-    22989: 7,
-    22988: 7,
-    22987: 7,
-    22986: 7,
-    22985: 7,
-    22984: 7,
-    22983: 7,
-    22982: 7,
-    22981: 7,
-    22980: 7,
-    22979: 7,
-    22978: 7,
-    22977: 7,
-    22976: 7,
-    22975: 7,
-    22974: 7,
-    22973: 7,
-    22972: 7,
-    22971: 7,
-    22970: 7,
-    22969: 7,
-    22968: 7,
-    22967: 7,
-    22966: 7,
-    22965: 7,
-    22964: 7,
-    22963: 7,
-    22962: 7,
-    22961: 7,
-    22960: 8,
-    22959: 8,
-    22958: 8,
-    22957: 8,
-    22956: 8,
-    22955: 8,
-    22954: 8,
-    22953: 8,
-    22952: 8,
-    22951: 8,
-    22950: 8,
-    22949: 8,
-    22948: 8,
-    22947: 8,
-    22946: 8,
-    22945: 8,
-    22944: 8,
-    22943: 8,
-    22942: 8,
-    22941: 8,
-    22940: 8,
-    22939: 8,
-    22938: 8,
-    22937: 8,
-    22936: 8,
-    22935: 8,
-    22934: 8,
-    22933: 8,
-    22932: 8,
-    22931: 8,
-    22930: 8,
-    22929: 8,
-    22928: 8,
-    22927: 8,
-    22926: 8,
-    22925: 8,
-    22924: 8,
-    22923: 8,
-    22922: 8,
-    22921: 8,
-    22920: 8,
-    22919: 8,
-    22918: 8,
-    22917: 8,
-    22916: 8,
-    22915: 8,
-    22914: 8,
-    22913: 8,
-    22912: 8,
-    22911: 8,
-    22910: 8,
-    22909: 8,
-    22908: 8,
-    22907: 8,
-    22906: 8,
-    22905: 8,
-    22904: 8,
-    22903: 8,
-    22902: 8,
-    22901: 8,
-    22900: 8,
-    22899: 8,
-    22898: 8,
-    22897: 8,
-    22896: 8,
-    22895: 8,
-    22894: 8,
-    22893: 8,
-    22892: 8,
-    22891: 8,
-    22890: 8,
-    22889: 8,
-    22888: 8,
-    22887: 8,
-    22886: 8,
-    22885: 8,
-    22884: 8,
-    22883: 8,
-    22882: 8,
-    22881: 8,
-    22880: 8,
-    22879: 8,
-    22878: 8,
-    22877: 8,
-    22876: 8,
-    22875: 8,
-    22874: 8,
-    22873: 8,
-    22872: 8,
-    22871: 8,
-    22870: 8,
-    22869: 8,
-    22868: 8,
-    22867: 8,
-    22866: 8,
-    22865: 8,
-    22864: 8,
-    22863: 8,
-    22862: 8,
-    22861: 8,
-    22860: 8,
-    22859: 8,
-    22858: 8,
-    22857: 8,
-    22856: 8,
-    22855: 8,
-    22854: 8,
-    22853: 8,
-    22852: 8,
-    22851: 8,
-    22850: 8,
-    22849: 8,
-    22848: 8,
-    22847: 8,
-    22846: 8,
-    22845: 8,
-    22844: 8,
-    22843: 8,
-    22842: 8,
-    22841: 8,
-    22840: 8,
-    22839: 8,
-    22838: 8,
-    22837: 8,
-    22836: 8,
-    22835: 8,
-    22834: 8,
-    22833: 8,
-    22832: 8,
-    22831: 8,
-    22830: 8,
-    22829: 8,
-    22828: 8,
-    22827: 8,
-    22826: 8,
-    22825: 8,
-    22824: 8,
-    22823: 8,
-    22822: 8,
-    22821: 8,
-    22820: 8,
-    22819: 8,
-    22818: 8,
-    22817: 8,
-    22816: 8,
-    22815: 8,
-    22814: 8,
-    22813: 8,
-    22812: 8,
-    22811: 8,
-    22810: 8,
-    22809: 8,
-    22808: 8,
-    22807: 8,
-    22806: 8,
-    22805: 8,
-    22804: 8,
-    22803: 8,
-    22802: 8,
-    22801: 8,
-    22800: 8,
-    22799: 8,
-    22798: 8,
-    22797: 8,
-    22796: 8,
-    22795: 8,
-    22794: 8,
-    22793: 8,
-    22792: 8,
-    22791: 8,
-    22790: 8,
-    22789: 8,
-    22788: 8,
-    22787: 8,
-    22786: 8,
-    22785: 8,
-    22784: 8,
-    22783: 8,
-    22782: 8,
-    22781: 8,
-    22780: 8,
-    22779: 8,
-    22778: 8,
-    22777: 8,
-    22776: 8,
-    22775: 8,
-    22774: 8,
-    22773: 8,
-    22772: 8,
-    22771: 8,
-    22770: 8,
-    22769: 8,
-    22768: 8,
-    22767: 8,
-    22766: 8,
-    22765: 8,
-    22764: 8,
-    22763: 8,
-    22762: 8,
-    22761: 8,
-    22760: 8,
-    22759: 8,
-    22758: 8,
-    22757: 8,
-    22756: 8,
-    22755: 8,
-    22754: 8,
-    22753: 8,
-    22752: 8,
-    22751: 8,
-    22750: 8,
-    22749: 8,
-    22748: 8,
-    22747: 8,
-    22746: 8,
-    22745: 8,
-    22744: 8,
-    22743: 8,
-    22742: 8,
-    22741: 8,
-    22740: 9,
-    22739: 9,
-    22738: 9,
-    22737: 9,
-    22736: 9,
-    22735: 9,
-    22734: 9,
-    22733: 9,
-    22732: 9,
-    22731: 9,
-    22730: 9,
-    22729: 9,
-    22728: 9,
-    22727: 9,
-    22726: 9,
-    22725: 9,
-    22724: 9,
-    22723: 9,
-    22722: 9,
-    22721: 9,
-    22720: 9,
-    22719: 9,
-    22718: 9,
-    22717: 9,
-    22716: 9,
-    22715: 9,
-    22714: 9,
-    22713: 9,
-    22712: 9,
-    22711: 9,
-    22710: 9,
-    22709: 9,
-    22708: 9,
-    22707: 9,
-    22706: 9,
-    22705: 9,
-    22704: 9,
-    22703: 9,
-    22702: 9,
-    22701: 9,
-    22700: 9,
-    22699: 9,
-    22698: 9,
-    22697: 9,
-    22696: 9,
-    22695: 9,
-    22694: 9,
-    22693: 9,
-    22692: 9,
-    22691: 9,
-    22690: 9,
-    22689: 9,
-    22688: 9,
-    22687: 9,
-    22686: 9,
-    22685: 9,
-    22684: 9,
-    22683: 9,
-    22682: 9,
-    22681: 9,
-    22680: 9,
-    22679: 9,
-    22678: 9,
-    22677: 9,
-    22676: 9,
-    22675: 9,
-    22674: 9,
-    22673: 9,
-    22672: 9,
-    22671: 9,
-    22670: 9,
-    22669: 9,
-    22668: 9,
-    22667: 9,
-    22666: 9,
-    22665: 9,
-    22664: 9,
-    22663: 9,
-    22662: 9,
-    22661: 9,
-    22660: 9,
-    22659: 9,
-    22658: 9,
-    22657: 9,
-    22656: 9,
-    22655: 9,
-    22654: 9,
-    22653: 9,
-    22652: 9,
-    22651: 9,
-    22650: 9,
-    22649: 9,
-    22648: 9,
-    22647: 9,
-    22646: 9,
-    22645: 9,
-    22644: 9,
-    22643: 9,
-    22642: 9,
-    22641: 9,
-    22640: 9,
-    22639: 9,
-    22638: 9,
-    22637: 9,
-    22636: 9,
-    22635: 9,
-    22634: 9,
-    22633: 9,
-    22632: 9,
-    22631: 9,
-    22630: 9,
-    22629: 9,
-    22628: 9,
-    22627: 9,
-    22626: 9,
-    22625: 9,
-    22624: 9,
-    22623: 9,
-    22622: 9,
-    22621: 9,
-    22620: 9,
-    22619: 9,
-    22618: 9,
-    22617: 9,
-    22616: 9,
-    22615: 9,
-    22614: 9,
-    22613: 9,
-    22612: 9,
-    22611: 9,
-    22610: 9,
-    22609: 9,
-    22608: 9,
-    22607: 9,
-    22606: 9,
-    22605: 9,
-    22604: 9,
-    22603: 9,
-    22602: 9,
-    22601: 9,
-    22600: 9,
-    22599: 9,
-    22598: 9,
-    22597: 9,
-    22596: 9,
-    22595: 9,
-    22594: 9,
-    22593: 9,
-    22592: 9,
-    22591: 9,
-    22590: 9,
-    22589: 9,
-    22588: 9,
-    22587: 9,
-    22586: 9,
-    22585: 9,
-    22584: 9,
-    22583: 9,
-    22582: 9,
-    22581: 9,
-    22580: 9,
-    22579: 9,
-    22578: 9,
-    22577: 9,
-    22576: 9,
-    22575: 9,
-    22574: 9,
-    22573: 9,
-    22572: 9,
-    22571: 9,
-    22570: 9,
-    22569: 9,
-    22568: 9,
-    22567: 9,
-    22566: 9,
-    22565: 9,
-    22564: 9,
-    22563: 9,
-    22562: 9,
-    22561: 9,
-    22560: 9,
-    22559: 9,
-    22558: 9,
-    22557: 9,
-    22556: 9,
-    22555: 9,
-    22554: 9,
-    22553: 9,
-    22552: 9,
-    22551: 9,
-    22550: 9,
-    22549: 9,
-    22548: 9,
-    22547: 9,
-    22546: 9,
-    22545: 9,
-    22544: 9,
-    22543: 9,
-    22542: 9,
-    22541: 9,
-    22540: 9,
-    22539: 9,
-    22538: 9,
-    22537: 9,
-    22536: 9,
-    22535: 9,
-    22534: 9,
-    22533: 9,
-    22532: 9,
-    22531: 9,
-    22530: 10,
-    22529: 10,
-    22528: 10,
-    22527: 10,
-    22526: 10,
-    22525: 10,
-    22524: 10,
-    22523: 10,
-    22522: 10,
-    22521: 10,
-    22520: 10,
-    22519: 10,
-    22518: 10,
-    22517: 10,
-    22516: 10,
-    22515: 10,
-    22514: 10,
-    22513: 10,
-    22512: 10,
-    22511: 10,
-    22510: 10,
-    22509: 10,
-    22508: 10,
-    22507: 10,
-    22506: 10,
-    22505: 10,
-    22504: 10,
-    22503: 10,
-    22502: 10,
-    22501: 10,
-    22500: 10,
-    22499: 10,
-    22498: 10,
-    22497: 10,
-    22496: 10,
-    22495: 10,
-    22494: 10,
-    22493: 10,
-    22492: 10,
-    22491: 10,
-    22490: 10,
-    22489: 10,
-    22488: 10,
-    22487: 10,
-    22486: 10,
-    22485: 10,
-    22484: 10,
-    22483: 10,
-    22482: 10,
-    22481: 10,
-    22480: 10,
-    22479: 10,
-    22478: 10,
-    22477: 10,
-    22476: 10,
-    22475: 10,
-    22474: 10,
-    22473: 10,
-    22472: 10,
-    22471: 10,
-    22470: 10,
-    22469: 10,
-    22468: 10,
-    22467: 10,
-    22466: 10,
-    22465: 10,
-    22464: 10,
-    22463: 10,
-    22462: 10,
-    22461: 10,
-    22460: 10,
-    22459: 10,
-    22458: 10,
-    22457: 10,
-    22456: 10,
-    22455: 10,
-    22454: 10,
-    22453: 10,
-    22452: 10,
-    22451: 10,
-    22450: 10,
-    22449: 10,
-    22448: 10,
-    22447: 10,
-    22446: 10,
-    22445: 10,
-    22444: 10,
-    22443: 10,
-    22442: 10,
-    22441: 10,
-    22440: 10,
-    22439: 10,
-    22438: 10,
-    22437: 10,
-    22436: 10,
-    22435: 10,
-    22434: 10,
-    22433: 10,
-    22432: 10,
-    22431: 10,
-    22430: 10,
-    22429: 10,
-    22428: 10,
-    22427: 10,
-    22426: 10,
-    22425: 10,
-    22424: 10,
-    22423: 10,
-    22422: 10,
-    22421: 10,
-    22420: 10,
-    22419: 10,
-    22418: 10,
-    22417: 10,
-    22416: 10,
-    22415: 10,
-    22414: 10,
-    22413: 10,
-    22412: 10,
-    22411: 10,
-    22410: 10,
-    22409: 10,
-    22408: 10,
-    22407: 10,
-    22406: 10,
-    22405: 10,
-    22404: 10,
-    22403: 10,
-    22402: 10,
-    22401: 10,
-    22400: 10,
-    22399: 10,
-    22398: 10,
-    22397: 10,
-    22396: 10,
-    22395: 10,
-    22394: 10,
-    22393: 10,
-    22392: 10,
-    22391: 10,
-    22390: 10,
-    22389: 10,
-    22388: 10,
-    22387: 10,
-    22386: 10,
-    22385: 10,
-    22384: 10,
-    22383: 10,
-    22382: 10,
-    22381: 10,
-    22380: 10,
-    22379: 10,
-    22378: 10,
-    22377: 10,
-    22376: 10,
-    22375: 10,
-    22374: 10,
-    22373: 10,
-    22372: 10,
-    22371: 10,
-    22370: 10,
-    22369: 10,
-    22368: 10,
-    22367: 10,
-    22366: 10,
-    22365: 10,
-    22364: 10,
-    22363: 10,
-    22362: 10,
-    22361: 10,
-    22360: 10,
-    22359: 10,
-    22358: 10,
-    22357: 10,
-    22356: 10,
-    22355: 10,
-    22354: 10,
-    22353: 10,
-    22352: 10,
-    22351: 10,
-    22350: 10,
-    22349: 10,
-    22348: 10,
-    22347: 10,
-    22346: 10,
-    22345: 10,
-    22344: 10,
-    22343: 10,
-    22342: 10,
-    22341: 10,
-    22340: 10,
-    22339: 10,
-    22338: 10,
-    22337: 10,
-    22336: 10,
-    22335: 10,
-    22334: 10,
-    22333: 10,
-    22332: 10,
-    22331: 10,
-    22330: 10,
-    22329: 10,
-    22328: 10,
-    22327: 10,
-    22326: 10,
-    22325: 10,
-    22324: 10,
-    22323: 10,
-    22322: 10,
-    22321: 10,
-    22320: 11,
-    22319: 11,
-    22318: 11,
-    22317: 11,
-    22316: 11,
-    22315: 11,
-    22314: 11,
-    22313: 11,
-    22312: 11,
-    22311: 11,
-    22310: 11,
-    22309: 11,
-    22308: 11,
-    22307: 11,
-    22306: 11,
-    22305: 11,
-    22304: 11,
-    22303: 11,
-    22302: 11,
-    22301: 11,
-    22300: 11,
-    22299: 11,
-    22298: 11,
-    22297: 11,
-    22296: 11,
-    22295: 11,
-    22294: 11,
-    22293: 11,
-    22292: 11,
-    22291: 11,
-    22290: 11,
-    22289: 11,
-    22288: 11,
-    22287: 11,
-    22286: 11,
-    22285: 11,
-    22284: 11,
-    22283: 11,
-    22282: 11,
-    22281: 11,
-    22280: 11,
-    22279: 11,
-    22278: 11,
-    22277: 11,
-    22276: 11,
-    22275: 11,
-    22274: 11,
-    22273: 11,
-    22272: 11,
-    22271: 11,
-    22270: 11,
-    22269: 11,
-    22268: 11,
-    22267: 11,
-    22266: 11,
-    22265: 11,
-    22264: 11,
-    22263: 11,
-    22262: 11,
-    22261: 11,
-    22260: 11,
-    22259: 11,
-    22258: 11,
-    22257: 11,
-    22256: 11,
-    22255: 11,
-    22254: 11,
-    22253: 11,
-    22252: 11,
-    22251: 11,
-    22250: 11,
-    22249: 11,
-    22248: 11,
-    22247: 11,
-    22246: 11,
-    22245: 11,
-    22244: 11,
-    22243: 11,
-    22242: 11,
-    22241: 11,
-    22240: 11,
-    22239: 11,
-    22238: 11,
-    22237: 11,
-    22236: 11,
-    22235: 11,
-    22234: 11,
-    22233: 11,
-    22232: 11,
-    22231: 11,
-    22230: 11,
-    22229: 11,
-    22228: 11,
-    22227: 11,
-    22226: 11,
-    22225: 11,
-    22224: 11,
-    22223: 11,
-    22222: 11,
-    22221: 11,
-    22220: 11,
-    22219: 11,
-    22218: 11,
-    22217: 11,
-    22216: 11,
-    22215: 11,
-    22214: 11,
-    22213: 11,
-    22212: 11,
-    22211: 11,
-    22210: 11,
-    22209: 11,
-    22208: 11,
-    22207: 11,
-    22206: 11,
-    22205: 11,
-    22204: 11,
-    22203: 11,
-    22202: 11,
-    22201: 11,
-    22200: 11,
-    22199: 11,
-    22198: 11,
-    22197: 11,
-    22196: 11,
-    22195: 11,
-    22194: 11,
-    22193: 11,
-    22192: 11,
-    22191: 11,
-    22190: 11,
-    22189: 11,
-    22188: 11,
-    22187: 11,
-    22186: 11,
-    22185: 11,
-    22184: 11,
-    22183: 11,
-    22182: 11,
-    22181: 11,
-    22180: 11,
-    22179: 11,
-    22178: 11,
-    22177: 11,
-    22176: 11,
-    22175: 11,
-    22174: 11,
-    22173: 11,
-    22172: 11,
-    22171: 11,
-    22170: 11,
-    22169: 11,
-    22168: 11,
-    22167: 11,
-    22166: 11,
-    22165: 11,
-    22164: 11,
-    22163: 11,
-    22162: 11,
-    22161: 11,
-    22160: 11,
-    22159: 11,
-    22158: 11,
-    22157: 11,
-    22156: 11,
-    22155: 11,
-    22154: 11,
-    22153: 11,
-    22152: 11,
-    22151: 11,
-    22150: 11,
-    22149: 11,
-    22148: 11,
-    22147: 11,
-    22146: 11,
-    22145: 11,
-    22144: 11,
-    22143: 11,
-    22142: 11,
-    22141: 11,
-    22140: 11,
-    22139: 11,
-    22138: 11,
-    22137: 11,
-    22136: 11,
-    22135: 11,
-    22134: 11,
-    22133: 11,
-    22132: 11,
-    22131: 11,
-    22130: 11,
-    22129: 11,
-    22128: 11,
-    22127: 11,
-    22126: 11,
-    22125: 11,
-    22124: 11,
-    22123: 11,
-    22122: 11,
-    22121: 11,
-    22120: 11,
-    22119: 11,
-    22118: 11,
-    22117: 11,
-    22116: 11,
-    22115: 11,
-    22114: 11,
-    22113: 11,
-    22112: 11,
-    22111: 11,
-    22110: 12,
-    22109: 12,
-    22108: 12,
-    22107: 12,
-    22106: 12,
-    22105: 12,
-    22104: 12,
-    22103: 12,
-    22102: 12,
-    22101: 12,
-    22100: 12,
-    22099: 12,
-    22098: 12,
-    22097: 12,
-    22096: 12,
-    22095: 12,
-    22094: 12,
-    22093: 12,
-    22092: 12,
-    22091: 12,
-    22090: 12,
-    22089: 12,
-    22088: 12,
-    22087: 12,
-    22086: 12,
-    22085: 12,
-    22084: 12,
-    22083: 12,
-    22082: 12,
-    22081: 12,
-    22080: 12,
-    22079: 12,
-    22078: 12,
-    22077: 12,
-    22076: 12,
-    22075: 12,
-    22074: 12,
-    22073: 12,
-    22072: 12,
-    22071: 12,
-    22070: 12,
-    22069: 12,
-    22068: 12,
-    22067: 12,
-    22066: 12,
-    22065: 12,
-    22064: 12,
-    22063: 12,
-    22062: 12,
-    22061: 12,
-    22060: 12,
-    22059: 12,
-    22058: 12,
-    22057: 12,
-    22056: 12,
-    22055: 12,
-    22054: 12,
-    22053: 12,
-    22052: 12,
-    22051: 12,
-    22050: 12,
-    22049: 12,
-    22048: 12,
-    22047: 12,
-    22046: 12,
-    22045: 12,
-    22044: 12,
-    22043: 12,
-    22042: 12,
-    22041: 12,
-    22040: 12,
-    22039: 12,
-    22038: 12,
-    22037: 12,
-    22036: 12,
-    22035: 12,
-    22034: 12,
-    22033: 12,
-    22032: 12,
-    22031: 12,
-    22030: 12,
-    22029: 12,
-    22028: 12,
-    22027: 12,
-    22026: 12,
-    22025: 12,
-    22024: 12,
-    22023: 12,
-    22022: 12,
-    22021: 12,
-    22020: 12,
-    22019: 12,
-    22018: 12,
-    22017: 12,
-    22016: 12,
-    22015: 12,
-    22014: 12,
-    22013: 12,
-    22012: 12,
-    22011: 12,
-    22010: 12,
-    22009: 12,
-    22008: 12,
-    22007: 12,
-    22006: 12,
-    22005: 12,
-    22004: 12,
-    22003: 12,
-    22002: 12,
-    22001: 12,
-    22000: 12,
-    21999: 12,
-    21998: 12,
-    21997: 12,
-    21996: 12,
-    21995: 12,
-    21994: 12,
-    21993: 12,
-    21992: 12,
-    21991: 12,
-    21990: 12,
-    21989: 12,
-    21988: 12,
-    21987: 12,
-    21986: 12,
-    21985: 12,
-    21984: 12,
-    21983: 12,
-    21982: 12,
-    21981: 12,
-    21980: 12,
-    21979: 12,
-    21978: 12,
-    21977: 12,
-    21976: 12,
-    21975: 12,
-    21974: 12,
-    21973: 12,
-    21972: 12,
-    21971: 12,
-    21970: 12,
-    21969: 12,
-    21968: 12,
-    21967: 12,
-    21966: 12,
-    21965: 12,
-    21964: 12,
-    21963: 12,
-    21962: 12,
-    21961: 12,
-    21960: 12,
-    21959: 12,
-    21958: 12,
-    21957: 12,
-    21956: 12,
-    21955: 12,
-    21954: 12,
-    21953: 12,
-    21952: 12,
-    21951: 12,
-    21950: 12,
-    21949: 12,
-    21948: 12,
-    21947: 12,
-    21946: 12,
-    21945: 12,
-    21944: 12,
-    21943: 12,
-    21942: 12,
-    21941: 12,
-    21940: 12,
-    21939: 12,
-    21938: 12,
-    21937: 12,
-    21936: 12,
-    21935: 12,
-    21934: 12,
-    21933: 12,
-    21932: 12,
-    21931: 12,
-    21930: 12,
-    21929: 12,
-    21928: 12,
-    21927: 12,
-    21926: 12,
-    21925: 12,
-    21924: 12,
-    21923: 12,
-    21922: 12,
-    21921: 12,
-    21920: 12,
-    21919: 12,
-    21918: 12,
-    21917: 12,
-    21916: 12,
-    21915: 12,
-    21914: 12,
-    21913: 12,
-    21912: 12,
-    21911: 12,
-    21910: 12,
-    21909: 12,
-    21908: 12,
-    21907: 12,
-    21906: 12,
-    21905: 12,
-    21904: 12,
-    21903: 12,
-    21902: 12,
-    21901: 12,
-    21900: 13,
-    21899: 13,
-    21898: 13,
-    21897: 13,
-    21896: 13,
-    21895: 13,
-    21894: 13,
-    21893: 13,
-    21892: 13,
-    21891: 13,
-    21890: 13,
-    21889: 13,
-    21888: 13,
-    21887: 13,
-    21886: 13,
-    21885: 13,
-    21884: 13,
-    21883: 13,
-    21882: 13,
-    21881: 13,
-    21880: 13,
-    21879: 13,
-    21878: 13,
-    21877: 13,
-    21876: 13,
-    21875: 13,
-    21874: 13,
-    21873: 13,
-    21872: 13,
-    21871: 13,
-    21870: 13,
-    21869: 13,
-    21868: 13,
-    21867: 13,
-    21866: 13,
-    21865: 13,
-    21864: 13,
-    21863: 13,
-    21862: 13,
-    21861: 13,
-    21860: 13,
-    21859: 13,
-    21858: 13,
-    21857: 13,
-    21856: 13,
-    21855: 13,
-    21854: 13,
-    21853: 13,
-    21852: 13,
-    21851: 13,
-    21850: 13,
-    21849: 13,
-    21848: 13,
-    21847: 13,
-    21846: 13,
-    21845: 13,
-    21844: 13,
-    21843: 13,
-    21842: 13,
-    21841: 13,
-    21840: 13,
-    21839: 13,
-    21838: 13,
-    21837: 13,
-    21836: 13,
-    21835: 13,
-    21834: 13,
-    21833: 13,
-    21832: 13,
-    21831: 13,
-    21830: 13,
-    21829: 13,
-    21828: 13,
-    21827: 13,
-    21826: 13,
-    21825: 13,
-    21824: 13,
-    21823: 13,
-    21822: 13,
-    21821: 13,
-    21820: 13,
-    21819: 13,
-    21818: 13,
-    21817: 13,
-    21816: 13,
-    21815: 13,
-    21814: 13,
-    21813: 13,
-    21812: 13,
-    21811: 13,
-    21810: 13,
-    21809: 13,
-    21808: 13,
-    21807: 13,
-    21806: 13,
-    21805: 13,
-    21804: 13,
-    21803: 13,
-    21802: 13,
-    21801: 13,
-    21800: 13,
-    21799: 13,
-    21798: 13,
-    21797: 13,
-    21796: 13,
-    21795: 13,
-    21794: 13,
-    21793: 13,
-    21792: 13,
-    21791: 13,
-    21790: 13,
-    21789: 13,
-    21788: 13,
-    21787: 13,
-    21786: 13,
-    21785: 13,
-    21784: 13,
-    21783: 13,
-    21782: 13,
-    21781: 13,
-    21780: 13,
-    21779: 13,
-    21778: 13,
-    21777: 13,
-    21776: 13,
-    21775: 13,
-    21774: 13,
-    21773: 13,
-    21772: 13,
-    21771: 13,
-    21770: 13,
-    21769: 13,
-    21768: 13,
-    21767: 13,
-    21766: 13,
-    21765: 13,
-    21764: 13,
-    21763: 13,
-    21762: 13,
-    21761: 13,
-    21760: 13,
-    21759: 13,
-    21758: 13,
-    21757: 13,
-    21756: 13,
-    21755: 13,
-    21754: 13,
-    21753: 13,
-    21752: 13,
-    21751: 13,
-    21750: 13,
-    21749: 13,
-    21748: 13,
-    21747: 13,
-    21746: 13,
-    21745: 13,
-    21744: 13,
-    21743: 13,
-    21742: 13,
-    21741: 13,
-    21740: 13,
-    21739: 13,
-    21738: 13,
-    21737: 13,
-    21736: 13,
-    21735: 13,
-    21734: 13,
-    21733: 13,
-    21732: 13,
-    21731: 13,
-    21730: 13,
-    21729: 13,
-    21728: 13,
-    21727: 13,
-    21726: 13,
-    21725: 13,
-    21724: 13,
-    21723: 13,
-    21722: 13,
-    21721: 13,
-    21720: 13,
-    21719: 13,
-    21718: 13,
-    21717: 13,
-    21716: 13,
-    21715: 13,
-    21714: 13,
-    21713: 13,
-    21712: 13,
-    21711: 13,
-    21710: 13,
-    21709: 13,
-    21708: 13,
-    21707: 13,
-    21706: 13,
-    21705: 13,
-    21704: 13,
-    21703: 13,
-    21702: 13,
-    21701: 13,
-    21700: 13,
-    21699: 13,
-    21698: 13,
-    21697: 13,
-    21696: 13,
-    21695: 13,
-    21694: 13,
-    21693: 13,
-    21692: 13,
-    21691: 13,
-    21690: 14,
-    21689: 14,
-    21688: 14,
-    21687: 14,
-    21686: 14,
-    21685: 14,
-    21684: 14,
-    21683: 14,
-    21682: 14,
-    21681: 14,
-    21680: 14,
-    21679: 14,
-    21678: 14,
-    21677: 14,
-    21676: 14,
-    21675: 14,
-    21674: 14,
-    21673: 14,
-    21672: 14,
-    21671: 14,
-    21670: 14,
-    21669: 14,
-    21668: 14,
-    21667: 14,
-    21666: 14,
-    21665: 14,
-    21664: 14,
-    21663: 14,
-    21662: 14,
-    21661: 14,
-    21660: 14,
-    21659: 14,
-    21658: 14,
-    21657: 14,
-    21656: 14,
-    21655: 14,
-    21654: 14,
-    21653: 14,
-    21652: 14,
-    21651: 14,
-    21650: 14,
-    21649: 14,
-    21648: 14,
-    21647: 14,
-    21646: 14,
-    21645: 14,
-    21644: 14,
-    21643: 14,
-    21642: 14,
-    21641: 14,
-    21640: 14,
-    21639: 14,
-    21638: 14,
-    21637: 14,
-    21636: 14,
-    21635: 14,
-    21634: 14,
-    21633: 14,
-    21632: 14,
-    21631: 14,
-    21630: 14,
-    21629: 14,
-    21628: 14,
-    21627: 14,
-    21626: 14,
-    21625: 14,
-    21624: 14,
-    21623: 14,
-    21622: 14,
-    21621: 14,
-    21620: 14,
-    21619: 14,
-    21618: 14,
-    21617: 14,
-    21616: 14,
-    21615: 14,
-    21614: 14,
-    21613: 14,
-    21612: 14,
-    21611: 14,
-    21610: 14,
-    21609: 14,
-    21608: 14,
-    21607: 14,
-    21606: 14,
-    21605: 14,
-    21604: 14,
-    21603: 14,
-    21602: 14,
-    21601: 14,
-    21600: 14,
-    21599: 14,
-    21598: 14,
-    21597: 14,
-    21596: 14,
-    21595: 14,
-    21594: 14,
-    21593: 14,
-    21592: 14,
-    21591: 14,
-    21590: 14,
-    21589: 14,
-    21588: 14,
-    21587: 14,
-    21586: 14,
-    21585: 14,
-    21584: 14,
-    21583: 14,
-    21582: 14,
-    21581: 14,
-    21580: 14,
-    21579: 14,
-    21578: 14,
-    21577: 14,
-    21576: 14,
-    21575: 14,
-    21574: 14,
-    21573: 14,
-    21572: 14,
-    21571: 14,
-    21570: 14,
-    21569: 14,
-    21568: 14,
-    21567: 14,
-    21566: 14,
-    21565: 14,
-    21564: 14,
-    21563: 14,
-    21562: 14,
-    21561: 14,
-    21560: 14,
-    21559: 14,
-    21558: 14,
-    21557: 14,
-    21556: 14,
-    21555: 14,
-    21554: 14,
-    21553: 14,
-    21552: 14,
-    21551: 14,
-    21550: 14,
-    21549: 14,
-    21548: 14,
-    21547: 14,
-    21546: 14,
-    21545: 14,
-    21544: 14,
-    21543: 14,
-    21542: 14,
-    21541: 14,
-    21540: 14,
-    21539: 14,
-    21538: 14,
-    21537: 14,
-    21536: 14,
-    21535: 14,
-    21534: 14,
-    21533: 14,
-    21532: 14,
-    21531: 14,
-    21530: 14,
-    21529: 14,
-    21528: 14,
-    21527: 14,
-    21526: 14,
-    21525: 14,
-    21524: 14,
-    21523: 14,
-    21522: 14,
-    21521: 14,
-    21520: 14,
-    21519: 14,
-    21518: 14,
-    21517: 14,
-    21516: 14,
-    21515: 14,
-    21514: 14,
-    21513: 14,
-    21512: 14,
-    21511: 14,
-    21510: 14,
-    21509: 14,
-    21508: 14,
-    21507: 14,
-    21506: 14,
-    21505: 14,
-    21504: 14,
-    21503: 14,
-    21502: 14,
-    21501: 14,
-    21500: 14,
-    21499: 14,
-    21498: 14,
-    21497: 14,
-    21496: 14,
-    21495: 14,
-    21494: 14,
-    21493: 14,
-    21492: 14,
-    21491: 14,
-    21490: 14,
-    21489: 14,
-    21488: 14,
-    21487: 14,
-    21486: 14,
-    21485: 14,
-    21484: 14,
-    21483: 14,
-    21482: 14,
-    21481: 14,
-    21480: 15,
-    21479: 15,
-    21478: 15,
-    21477: 15,
-    21476: 15,
-    21475: 15,
-    21474: 15,
-    21473: 15,
-    21472: 15,
-    21471: 15,
-    21470: 15,
-    21469: 15,
-    21468: 15,
-    21467: 15,
-    21466: 15,
-    21465: 15,
-    21464: 15,
-    21463: 15,
-    21462: 15,
-    21461: 15,
-    21460: 15,
-    21459: 15,
-    21458: 15,
-    21457: 15,
-    21456: 15,
-    21455: 15,
-    21454: 15,
-    21453: 15,
-    21452: 15,
-    21451: 15,
-    21450: 15,
-    21449: 15,
-    21448: 15,
-    21447: 15,
-    21446: 15,
-    21445: 15,
-    21444: 15,
-    21443: 15,
-    21442: 15,
-    21441: 15,
-    21440: 15,
-    21439: 15,
-    21438: 15,
-    21437: 15,
-    21436: 15,
-    21435: 15,
-    21434: 15,
-    21433: 15,
-    21432: 15,
-    21431: 15,
-    21430: 15,
-    21429: 15,
-    21428: 15,
-    21427: 15,
-    21426: 15,
-    21425: 15,
-    21424: 15,
-    21423: 15,
-    21422: 15,
-    21421: 15,
-    21420: 15,
-    21419: 15,
-    21418: 15,
-    21417: 15,
-    21416: 15,
-    21415: 15,
-    21414: 15,
-    21413: 15,
-    21412: 15,
-    21411: 15,
-    21410: 15,
-    21409: 15,
-    21408: 15,
-    21407: 15,
-    21406: 15,
-    21405: 15,
-    21404: 15,
-    21403: 15,
-    21402: 15,
-    21401: 15,
-    21400: 15,
-    21399: 15,
-    21398: 15,
-    21397: 15,
-    21396: 15,
-    21395: 15,
-    21394: 15,
-    21393: 15,
-    21392: 15,
-    21391: 15,
-    21390: 15,
-    21389: 15,
-    21388: 15,
-    21387: 15,
-    21386: 15,
-    21385: 15,
-    21384: 15,
-    21383: 15,
-    21382: 15,
-    21381: 15,
-    21380: 15,
-    21379: 15,
-    21378: 15,
-    21377: 15,
-    21376: 15,
-    21375: 15,
-    21374: 15,
-    21373: 15,
-    21372: 15,
-    21371: 15,
-    21370: 15,
-    21369: 15,
-    21368: 15,
-    21367: 15,
-    21366: 15,
-    21365: 15,
-    21364: 15,
-    21363: 15,
-    21362: 15,
-    21361: 15,
-    21360: 15,
-    21359: 15,
-    21358: 15,
-    21357: 15,
-    21356: 15,
-    21355: 15,
-    21354: 15,
-    21353: 15,
-    21352: 15,
-    21351: 15,
-    21350: 15,
-    21349: 15,
-    21348: 15,
-    21347: 15,
-    21346: 15,
-    21345: 15,
-    21344: 15,
-    21343: 15,
-    21342: 15,
-    21341: 15,
-    21340: 15,
-    21339: 15,
-    21338: 15,
-    21337: 15,
-    21336: 15,
-    21335: 15,
-    21334: 15,
-    21333: 15,
-    21332: 15,
-    21331: 15,
-    21330: 15,
-    21329: 15,
-    21328: 15,
-    21327: 15,
-    21326: 15,
-    21325: 15,
-    21324: 15,
-    21323: 15,
-    21322: 15,
-    21321: 15,
-    21320: 15,
-    21319: 15,
-    21318: 15,
-    21317: 15,
-    21316: 15,
-    21315: 15,
-    21314: 15,
-    21313: 15,
-    21312: 15,
-    21311: 15,
-    21310: 15,
-    21309: 15,
-    21308: 15,
-    21307: 15,
-    21306: 15,
-    21305: 15,
-    21304: 15,
-    21303: 15,
-    21302: 15,
-    21301: 15,
-    21300: 15,
-    21299: 15,
-    21298: 15,
-    21297: 15,
-    21296: 15,
-    21295: 15,
-    21294: 15,
-    21293: 15,
-    21292: 15,
-    21291: 15,
-    21290: 15,
-    21289: 15,
-    21288: 15,
-    21287: 15,
-    21286: 15,
-    21285: 15,
-    21284: 15,
-    21283: 15,
-    21282: 15,
-    21281: 15,
-    21280: 15,
-    21279: 15,
-    21278: 15,
-    21277: 15,
-    21276: 15,
-    21275: 15,
-    21274: 15,
-    21273: 15,
-    21272: 15,
-    21271: 15,
-    21270: 16,
-    21269: 16,
-    21268: 16,
-    21267: 16,
-    21266: 16,
-    21265: 16,
-    21264: 16,
-    21263: 16,
-    21262: 16,
-    21261: 16,
-    21260: 16,
-    21259: 16,
-    21258: 16,
-    21257: 16,
-    21256: 16,
-    21255: 16,
-    21254: 16,
-    21253: 16,
-    21252: 16,
-    21251: 16,
-    21250: 16,
-    21249: 16,
-    21248: 16,
-    21247: 16,
-    21246: 16,
-    21245: 16,
-    21244: 16,
-    21243: 16,
-    21242: 16,
-    21241: 16,
-    21240: 16,
-    21239: 16,
-    21238: 16,
-    21237: 16,
-    21236: 16,
-    21235: 16,
-    21234: 16,
-    21233: 16,
-    21232: 16,
-    21231: 16,
-    21230: 16,
-    21229: 16,
-    21228: 16,
-    21227: 16,
-    21226: 16,
-    21225: 16,
-    21224: 16,
-    21223: 16,
-    21222: 16,
-    21221: 16,
-    21220: 16,
-    21219: 16,
-    21218: 16,
-    21217: 16,
-    21216: 16,
-    21215: 16,
-    21214: 16,
-    21213: 16,
-    21212: 16,
-    21211: 16,
-    21210: 16,
-    21209: 16,
-    21208: 16,
-    21207: 16,
-    21206: 16,
-    21205: 16,
-    21204: 16,
-    21203: 16,
-    21202: 16,
-    21201: 16,
-    21200: 16,
-    21199: 16,
-    21198: 16,
-    21197: 16,
-    21196: 16,
-    21195: 16,
-    21194: 16,
-    21193: 16,
-    21192: 16,
-    21191: 16,
-    21190: 16,
-    21189: 16,
-    21188: 16,
-    21187: 16,
-    21186: 16,
-    21185: 16,
-    21184: 16,
-    21183: 16,
-    21182: 16,
-    21181: 16,
-    21180: 16,
-    21179: 16,
-    21178: 16,
-    21177: 16,
-    21176: 16,
-    21175: 16,
-    21174: 16,
-    21173: 16,
-    21172: 16,
-    21171: 16,
-    21170: 16,
-    21169: 16,
-    21168: 16,
-    21167: 16,
-    21166: 16,
-    21165: 16,
-    21164: 16,
-    21163: 16,
-    21162: 16,
-    21161: 16,
-    21160: 16,
-    21159: 16,
-    21158: 16,
-    21157: 16,
-    21156: 16,
-    21155: 16,
-    21154: 16,
-    21153: 16,
-    21152: 16,
-    21151: 16,
-    21150: 16,
-    21149: 16,
-    21148: 16,
-    21147: 16,
-    21146: 16,
-    21145: 16,
-    21144: 16,
-    21143: 16,
-    21142: 16,
-    21141: 16,
-    21140: 16,
-    21139: 16,
-    21138: 16,
-    21137: 16,
-    21136: 16,
-    21135: 16,
-    21134: 16,
-    21133: 16,
-    21132: 16,
-    21131: 16,
-    21130: 16,
-    21129: 16,
-    21128: 16,
-    21127: 16,
-    21126: 16,
-    21125: 16,
-    21124: 16,
-    21123: 16,
-    21122: 16,
-    21121: 16,
-    21120: 16,
-    21119: 16,
-    21118: 16,
-    21117: 16,
-    21116: 16,
-    21115: 16,
-    21114: 16,
-    21113: 16,
-    21112: 16,
-    21111: 16,
-    21110: 16,
-    21109: 16,
-    21108: 16,
-    21107: 16,
-    21106: 16,
-    21105: 16,
-    21104: 16,
-    21103: 16,
-    21102: 16,
-    21101: 16,
-    21100: 16,
-    21099: 16,
-    21098: 16,
-    21097: 16,
-    21096: 16,
-    21095: 16,
-    21094: 16,
-    21093: 16,
-    21092: 16,
-    21091: 16,
-    21090: 16,
-    21089: 16,
-    21088: 16,
-    21087: 16,
-    21086: 16,
-    21085: 16,
-    21084: 16,
-    21083: 16,
-    21082: 16,
-    21081: 16,
-    21080: 16,
-    21079: 16,
-    21078: 16,
-    21077: 16,
-    21076: 16,
-    21075: 16,
-    21074: 16,
-    21073: 16,
-    21072: 16,
-    21071: 16,
-    21070: 17,
-    21069: 17,
-    21068: 17,
-    21067: 17,
-    21066: 17,
-    21065: 17,
-    21064: 17,
-    21063: 17,
-    21062: 17,
-    21061: 17,
-    21060: 17,
-    21059: 17,
-    21058: 17,
-    21057: 17,
-    21056: 17,
-    21055: 17,
-    21054: 17,
-    21053: 17,
-    21052: 17,
-    21051: 17,
-    21050: 17,
-    21049: 17,
-    21048: 17,
-    21047: 17,
-    21046: 17,
-    21045: 17,
-    21044: 17,
-    21043: 17,
-    21042: 17,
-    21041: 17,
-    21040: 17,
-    21039: 17,
-    21038: 17,
-    21037: 17,
-    21036: 17,
-    21035: 17,
-    21034: 17,
-    21033: 17,
-    21032: 17,
-    21031: 17,
-    21030: 17,
-    21029: 17,
-    21028: 17,
-    21027: 17,
-    21026: 17,
-    21025: 17,
-    21024: 17,
-    21023: 17,
-    21022: 17,
-    21021: 17,
-    21020: 17,
-    21019: 17,
-    21018: 17,
-    21017: 17,
-    21016: 17,
-    21015: 17,
-    21014: 17,
-    21013: 17,
-    21012: 17,
-    21011: 17,
-    21010: 17,
-    21009: 17,
-    21008: 17,
-    21007: 17,
-    21006: 17,
-    21005: 17,
-    21004: 17,
-    21003: 17,
-    21002: 17,
-    21001: 17,
-    21000: 17,
-    20999: 17,
-    20998: 17,
-    20997: 17,
-    20996: 17,
-    20995: 17,
-    20994: 17,
-    20993: 17,
-    20992: 17,
-    20991: 17,
-    20990: 17,
-    20989: 17,
-    20988: 17,
-    20987: 17,
-    20986: 17,
-    20985: 17,
-    20984: 17,
-    20983: 17,
-    20982: 17,
-    20981: 17,
-    20980: 17,
-    20979: 17,
-    20978: 17,
-    20977: 17,
-    20976: 17,
-    20975: 17,
-    20974: 17,
-    20973: 17,
-    20972: 17,
-    20971: 17,
-    20970: 17,
-    20969: 17,
-    20968: 17,
-    20967: 17,
-    20966: 17,
-    20965: 17,
-    20964: 17,
-    20963: 17,
-    20962: 17,
-    20961: 17,
-    20960: 17,
-    20959: 17,
-    20958: 17,
-    20957: 17,
-    20956: 17,
-    20955: 17,
-    20954: 17,
-    20953: 17,
-    20952: 17,
-    20951: 17,
-    20950: 17,
-    20949: 17,
-    20948: 17,
-    20947: 17,
-    20946: 17,
-    20945: 17,
-    20944: 17,
-    20943: 17,
-    20942: 17,
-    20941: 17,
-    20940: 17,
-    20939: 17,
-    20938: 17,
-    20937: 17,
-    20936: 17,
-    20935: 17,
-    20934: 17,
-    20933: 17,
-    20932: 17,
-    20931: 17,
-    20930: 17,
-    20929: 17,
-    20928: 17,
-    20927: 17,
-    20926: 17,
-    20925: 17,
-    20924: 17,
-    20923: 17,
-    20922: 17,
-    20921: 17,
-    20920: 17,
-    20919: 17,
-    20918: 17,
-    20917: 17,
-    20916: 17,
-    20915: 17,
-    20914: 17,
-    20913: 17,
-    20912: 17,
-    20911: 17,
-    20910: 17,
-    20909: 17,
-    20908: 17,
-    20907: 17,
-    20906: 17,
-    20905: 17,
-    20904: 17,
-    20903: 17,
-    20902: 17,
-    20901: 17,
-    20900: 17,
-    20899: 17,
-    20898: 17,
-    20897: 17,
-    20896: 17,
-    20895: 17,
-    20894: 17,
-    20893: 17,
-    20892: 17,
-    20891: 17,
-    20890: 17,
-    20889: 17,
-    20888: 17,
-    20887: 17,
-    20886: 17,
-    20885: 17,
-    20884: 17,
-    20883: 17,
-    20882: 17,
-    20881: 17,
-    20880: 17,
-    20879: 17,
-    20878: 17,
-    20877: 17,
-    20876: 17,
-    20875: 17,
-    20874: 17,
-    20873: 17,
-    20872: 17,
-    20871: 17,
-    20870: 18,
-    20869: 18,
-    20868: 18,
-    20867: 18,
-    20866: 18,
-    20865: 18,
-    20864: 18,
-    20863: 18,
-    20862: 18,
-    20861: 18,
-    20860: 18,
-    20859: 18,
-    20858: 18,
-    20857: 18,
-    20856: 18,
-    20855: 18,
-    20854: 18,
-    20853: 18,
-    20852: 18,
-    20851: 18,
-    20850: 18,
-    20849: 18,
-    20848: 18,
-    20847: 18,
-    20846: 18,
-    20845: 18,
-    20844: 18,
-    20843: 18,
-    20842: 18,
-    20841: 18,
-    20840: 18,
-    20839: 18,
-    20838: 18,
-    20837: 18,
-    20836: 18,
-    20835: 18,
-    20834: 18,
-    20833: 18,
-    20832: 18,
-    20831: 18,
-    20830: 18,
-    20829: 18,
-    20828: 18,
-    20827: 18,
-    20826: 18,
-    20825: 18,
-    20824: 18,
-    20823: 18,
-    20822: 18,
-    20821: 18,
-    20820: 18,
-    20819: 18,
-    20818: 18,
-    20817: 18,
-    20816: 18,
-    20815: 18,
-    20814: 18,
-    20813: 18,
-    20812: 18,
-    20811: 18,
-    20810: 18,
-    20809: 18,
-    20808: 18,
-    20807: 18,
-    20806: 18,
-    20805: 18,
-    20804: 18,
-    20803: 18,
-    20802: 18,
-    20801: 18,
-    20800: 18,
-    20799: 18,
-    20798: 18,
-    20797: 18,
-    20796: 18,
-    20795: 18,
-    20794: 18,
-    20793: 18,
-    20792: 18,
-    20791: 18,
-    20790: 18,
-    20789: 18,
-    20788: 18,
-    20787: 18,
-    20786: 18,
-    20785: 18,
-    20784: 18,
-    20783: 18,
-    20782: 18,
-    20781: 18,
-    20780: 18,
-    20779: 18,
-    20778: 18,
-    20777: 18,
-    20776: 18,
-    20775: 18,
-    20774: 18,
-    20773: 18,
-    20772: 18,
-    20771: 18,
-    20770: 18,
-    20769: 18,
-    20768: 18,
-    20767: 18,
-    20766: 18,
-    20765: 18,
-    20764: 18,
-    20763: 18,
-    20762: 18,
-    20761: 18,
-    20760: 18,
-    20759: 18,
-    20758: 18,
-    20757: 18,
-    20756: 18,
-    20755: 18,
-    20754: 18,
-    20753: 18,
-    20752: 18,
-    20751: 18,
-    20750: 18,
-    20749: 18,
-    20748: 18,
-    20747: 18,
-    20746: 18,
-    20745: 18,
-    20744: 18,
-    20743: 18,
-    20742: 18,
-    20741: 18,
-    20740: 18,
-    20739: 18,
-    20738: 18,
-    20737: 18,
-    20736: 18,
-    20735: 18,
-    20734: 18,
-    20733: 18,
-    20732: 18,
-    20731: 18,
-    20730: 18,
-    20729: 18,
-    20728: 18,
-    20727: 18,
-    20726: 18,
-    20725: 18,
-    20724: 18,
-    20723: 18,
-    20722: 18,
-    20721: 18,
-    20720: 18,
-    20719: 18,
-    20718: 18,
-    20717: 18,
-    20716: 18,
-    20715: 18,
-    20714: 18,
-    20713: 18,
-    20712: 18,
-    20711: 18,
-    20710: 18,
-    20709: 18,
-    20708: 18,
-    20707: 18,
-    20706: 18,
-    20705: 18,
-    20704: 18,
-    20703: 18,
-    20702: 18,
-    20701: 18,
-    20700: 18,
-    20699: 18,
-    20698: 18,
-    20697: 18,
-    20696: 18,
-    20695: 18,
-    20694: 18,
-    20693: 18,
-    20692: 18,
-    20691: 18,
-    20690: 18,
-    20689: 18,
-    20688: 18,
-    20687: 18,
-    20686: 18,
-    20685: 18,
-    20684: 18,
-    20683: 18,
-    20682: 18,
-    20681: 18,
-    20680: 19,
-    20679: 19,
-    20678: 19,
-    20677: 19,
-    20676: 19,
-    20675: 19,
-    20674: 19,
-    20673: 19,
-    20672: 19,
-    20671: 19,
-    20670: 19,
-    20669: 19,
-    20668: 19,
-    20667: 19,
-    20666: 19,
-    20665: 19,
-    20664: 19,
-    20663: 19,
-    20662: 19,
-    20661: 19,
-    20660: 19,
-    20659: 19,
-    20658: 19,
-    20657: 19,
-    20656: 19,
-    20655: 19,
-    20654: 19,
-    20653: 19,
-    20652: 19,
-    20651: 19,
-    20650: 19,
-    20649: 19,
-    20648: 19,
-    20647: 19,
-    20646: 19,
-    20645: 19,
-    20644: 19,
-    20643: 19,
-    20642: 19,
-    20641: 19,
-    20640: 19,
-    20639: 19,
-    20638: 19,
-    20637: 19,
-    20636: 19,
-    20635: 19,
-    20634: 19,
-    20633: 19,
-    20632: 19,
-    20631: 19,
-    20630: 19,
-    20629: 19,
-    20628: 19,
-    20627: 19,
-    20626: 19,
-    20625: 19,
-    20624: 19,
-    20623: 19,
-    20622: 19,
-    20621: 19,
-    20620: 19,
-    20619: 19,
-    20618: 19,
-    20617: 19,
-    20616: 19,
-    20615: 19,
-    20614: 19,
-    20613: 19,
-    20612: 19,
-    20611: 19,
-    20610: 19,
-    20609: 19,
-    20608: 19,
-    20607: 19,
-    20606: 19,
-    20605: 19,
-    20604: 19,
-    20603: 19,
-    20602: 19,
-    20601: 19,
-    20600: 19,
-    20599: 19,
-    20598: 19,
-    20597: 19,
-    20596: 19,
-    20595: 19,
-    20594: 19,
-    20593: 19,
-    20592: 19,
-    20591: 19,
-    20590: 19,
-    20589: 19,
-    20588: 19,
-    20587: 19,
-    20586: 19,
-    20585: 19,
-    20584: 19,
-    20583: 19,
-    20582: 19,
-    20581: 19,
-    20580: 19,
-    20579: 19,
-    20578: 19,
-    20577: 19,
-    20576: 19,
-    20575: 19,
-    20574: 19,
-    20573: 19,
-    20572: 19,
-    20571: 19,
-    20570: 19,
-    20569: 19,
-    20568: 19,
-    20567: 19,
-    20566: 19,
-    20565: 19,
-    20564: 19,
-    20563: 19,
-    20562: 19,
-    20561: 19,
-    20560: 19,
-    20559: 19,
-    20558: 19,
-    20557: 19,
-    20556: 19,
-    20555: 19,
-    20554: 19,
-    20553: 19,
-    20552: 19,
-    20551: 19,
-    20550: 19,
-    20549: 19,
-    20548: 19,
-    20547: 19,
-    20546: 19,
-    20545: 19,
-    20544: 19,
-    20543: 19,
-    20542: 19,
-    20541: 19,
-    20540: 19,
-    20539: 19,
-    20538: 19,
-    20537: 19,
-    20536: 19,
-    20535: 19,
-    20534: 19,
-    20533: 19,
-    20532: 19,
-    20531: 19,
-    20530: 19,
-    20529: 19,
-    20528: 19,
-    20527: 19,
-    20526: 19,
-    20525: 19,
-    20524: 19,
-    20523: 19,
-    20522: 19,
-    20521: 19,
-    20520: 19,
-    20519: 19,
-    20518: 19,
-    20517: 19,
-    20516: 19,
-    20515: 19,
-    20514: 19,
-    20513: 19,
-    20512: 19,
-    20511: 19,
-    20510: 19,
-    20509: 19,
-    20508: 19,
-    20507: 19,
-    20506: 19,
-    20505: 19,
-    20504: 19,
-    20503: 19,
-    20502: 19,
-    20501: 19,
-    20500: 20,
-    20499: 20,
-    20498: 20,
-    20497: 20,
-    20496: 20,
-    20495: 20,
-    20494: 20,
-    20493: 20,
-    20492: 20,
-    20491: 20,
-    20490: 20,
-    20489: 20,
-    20488: 20,
-    20487: 20,
-    20486: 20,
-    20485: 20,
-    20484: 20,
-    20483: 20,
-    20482: 20,
-    20481: 20,
-    20480: 20,
-    20479: 20,
-    20478: 20,
-    20477: 20,
-    20476: 20,
-    20475: 20,
-    20474: 20,
-    20473: 20,
-    20472: 20,
-    20471: 20,
-    20470: 20,
-    20469: 20,
-    20468: 20,
-    20467: 20,
-    20466: 20,
-    20465: 20,
-    20464: 20,
-    20463: 20,
-    20462: 20,
-    20461: 20,
-    20460: 20,
-    20459: 20,
-    20458: 20,
-    20457: 20,
-    20456: 20,
-    20455: 20,
-    20454: 20,
-    20453: 20,
-    20452: 20,
-    20451: 20,
-    20450: 20,
-    20449: 20,
-    20448: 20,
-    20447: 20,
-    20446: 20,
-    20445: 20,
-    20444: 20,
-    20443: 20,
-    20442: 20,
-    20441: 20,
-    20440: 20,
-    20439: 20,
-    20438: 20,
-    20437: 20,
-    20436: 20,
-    20435: 20,
-    20434: 20,
-    20433: 20,
-    20432: 20,
-    20431: 20,
-    20430: 20,
-    20429: 20,
-    20428: 20,
-    20427: 20,
-    20426: 20,
-    20425: 20,
-    20424: 20,
-    20423: 20,
-    20422: 20,
-    20421: 20,
-    20420: 20,
-    20419: 20,
-    20418: 20,
-    20417: 20,
-    20416: 20,
-    20415: 20,
-    20414: 20,
-    20413: 20,
-    20412: 20,
-    20411: 20,
-    20410: 20,
-    20409: 20,
-    20408: 20,
-    20407: 20,
-    20406: 20,
-    20405: 20,
-    20404: 20,
-    20403: 20,
-    20402: 20,
-    20401: 20,
-    20400: 20,
-    20399: 20,
-    20398: 20,
-    20397: 20,
-    20396: 20,
-    20395: 20,
-    20394: 20,
-    20393: 20,
-    20392: 20,
-    20391: 20,
-    20390: 20,
-    20389: 20,
-    20388: 20,
-    20387: 20,
-    20386: 20,
-    20385: 20,
-    20384: 20,
-    20383: 20,
-    20382: 20,
-    20381: 20,
-    20380: 20,
-    20379: 20,
-    20378: 20,
-    20377: 20,
-    20376: 20,
-    20375: 20,
-    20374: 20,
-    20373: 20,
-    20372: 20,
-    20371: 20,
-    20370: 20,
-    20369: 20,
-    20368: 20,
-    20367: 20,
-    20366: 20,
-    20365: 20,
-    20364: 20,
-    20363: 20,
-    20362: 20,
-    20361: 20,
-    20360: 20,
-    20359: 20,
-    20358: 20,
-    20357: 20,
-    20356: 20,
-    20355: 20,
-    20354: 20,
-    20353: 20,
-    20352: 20,
-    20351: 20,
-    20350: 20,
-    20349: 20,
-    20348: 20,
-    20347: 20,
-    20346: 20,
-    20345: 20,
-    20344: 20,
-    20343: 20,
-    20342: 20,
-    20341: 20,
-    20340: 20,
-    20339: 20,
-    20338: 20,
-    20337: 20,
-    20336: 20,
-    20335: 20,
-    20334: 20,
-    20333: 20,
-    20332: 20,
-    20331: 20,
-    20330: 21,
-    20329: 21,
-    20328: 21,
-    20327: 21,
-    20326: 21,
-    20325: 21,
-    20324: 21,
-    20323: 21,
-    20322: 21,
-    20321: 21,
-    20320: 21,
-    20319: 21,
-    20318: 21,
-    20317: 21,
-    20316: 21,
-    20315: 21,
-    20314: 21,
-    20313: 21,
-    20312: 21,
-    20311: 21,
-    20310: 21,
-    20309: 21,
-    20308: 21,
-    20307: 21,
-    20306: 21,
-    20305: 21,
-    20304: 21,
-    20303: 21,
-    20302: 21,
-    20301: 21,
-    20300: 21,
-    20299: 21,
-    20298: 21,
-    20297: 21,
-    20296: 21,
-    20295: 21,
-    20294: 21,
-    20293: 21,
-    20292: 21,
-    20291: 21,
-    20290: 21,
-    20289: 21,
-    20288: 21,
-    20287: 21,
-    20286: 21,
-    20285: 21,
-    20284: 21,
-    20283: 21,
-    20282: 21,
-    20281: 21,
-    20280: 21,
-    20279: 21,
-    20278: 21,
-    20277: 21,
-    20276: 21,
-    20275: 21,
-    20274: 21,
-    20273: 21,
-    20272: 21,
-    20271: 21,
-    20270: 21,
-    20269: 21,
-    20268: 21,
-    20267: 21,
-    20266: 21,
-    20265: 21,
-    20264: 21,
-    20263: 21,
-    20262: 21,
-    20261: 21,
-    20260: 21,
-    20259: 21,
-    20258: 21,
-    20257: 21,
-    20256: 21,
-    20255: 21,
-    20254: 21,
-    20253: 21,
-    20252: 21,
-    20251: 21,
-    20250: 21,
-    20249: 21,
-    20248: 21,
-    20247: 21,
-    20246: 21,
-    20245: 21,
-    20244: 21,
-    20243: 21,
-    20242: 21,
-    20241: 21,
-    20240: 21,
-    20239: 21,
-    20238: 21,
-    20237: 21,
-    20236: 21,
-    20235: 21,
-    20234: 21,
-    20233: 21,
-    20232: 21,
-    20231: 21,
-    20230: 21,
-    20229: 21,
-    20228: 21,
-    20227: 21,
-    20226: 21,
-    20225: 21,
-    20224: 21,
-    20223: 21,
-    20222: 21,
-    20221: 21,
-    20220: 21,
-    20219: 21,
-    20218: 21,
-    20217: 21,
-    20216: 21,
-    20215: 21,
-    20214: 21,
-    20213: 21,
-    20212: 21,
-    20211: 21,
-    20210: 21,
-    20209: 21,
-    20208: 21,
-    20207: 21,
-    20206: 21,
-    20205: 21,
-    20204: 21,
-    20203: 21,
-    20202: 21,
-    20201: 21,
-    20200: 21,
-    20199: 21,
-    20198: 21,
-    20197: 21,
-    20196: 21,
-    20195: 21,
-    20194: 21,
-    20193: 21,
-    20192: 21,
-    20191: 21,
-    20190: 21,
-    20189: 21,
-    20188: 21,
-    20187: 21,
-    20186: 21,
-    20185: 21,
-    20184: 21,
-    20183: 21,
-    20182: 21,
-    20181: 21,
-    20180: 21,
-    20179: 21,
-    20178: 21,
-    20177: 21,
-    20176: 21,
-    20175: 21,
-    20174: 21,
-    20173: 21,
-    20172: 21,
-    20171: 21,
-    20170: 22,
-    20169: 22,
-    20168: 22,
-    20167: 22,
-    20166: 22,
-    20165: 22,
-    20164: 22,
-    20163: 22,
-    20162: 22,
-    20161: 22,
-    20160: 22,
-    20159: 22,
-    20158: 22,
-    20157: 22,
-    20156: 22,
-    20155: 22,
-    20154: 22,
-    20153: 22,
-    20152: 22,
-    20151: 22,
-    20150: 22,
-    20149: 22,
-    20148: 22,
-    20147: 22,
-    20146: 22,
-    20145: 22,
-    20144: 22,
-    20143: 22,
-    20142: 22,
-    20141: 22,
-    20140: 22,
-    20139: 22,
-    20138: 22,
-    20137: 22,
-    20136: 22,
-    20135: 22,
-    20134: 22,
-    20133: 22,
-    20132: 22,
-    20131: 22,
-    20130: 22,
-    20129: 22,
-    20128: 22,
-    20127: 22,
-    20126: 22,
-    20125: 22,
-    20124: 22,
-    20123: 22,
-    20122: 22,
-    20121: 22,
-    20120: 22,
-    20119: 22,
-    20118: 22,
-    20117: 22,
-    20116: 22,
-    20115: 22,
-    20114: 22,
-    20113: 22,
-    20112: 22,
-    20111: 22,
-    20110: 22,
-    20109: 22,
-    20108: 22,
-    20107: 22,
-    20106: 22,
-    20105: 22,
-    20104: 22,
-    20103: 22,
-    20102: 22,
-    20101: 22,
-    20100: 22,
-    20099: 22,
-    20098: 22,
-    20097: 22,
-    20096: 22,
-    20095: 22,
-    20094: 22,
-    20093: 22,
-    20092: 22,
-    20091: 22,
-    20090: 22,
-    20089: 22,
-    20088: 22,
-    20087: 22,
-    20086: 22,
-    20085: 22,
-    20084: 22,
-    20083: 22,
-    20082: 22,
-    20081: 22,
-    20080: 22,
-    20079: 22,
-    20078: 22,
-    20077: 22,
-    20076: 22,
-    20075: 22,
-    20074: 22,
-    20073: 22,
-    20072: 22,
-    20071: 22,
-    20070: 22,
-    20069: 22,
-    20068: 22,
-    20067: 22,
-    20066: 22,
-    20065: 22,
-    20064: 22,
-    20063: 22,
-    20062: 22,
-    20061: 22,
-    20060: 22,
-    20059: 22,
-    20058: 22,
-    20057: 22,
-    20056: 22,
-    20055: 22,
-    20054: 22,
-    20053: 22,
-    20052: 22,
-    20051: 22,
-    20050: 22,
-    20049: 22,
-    20048: 22,
-    20047: 22,
-    20046: 22,
-    20045: 22,
-    20044: 22,
-    20043: 22,
-    20042: 22,
-    20041: 22,
-    20040: 22,
-    20039: 22,
-    20038: 22,
-    20037: 22,
-    20036: 22,
-    20035: 22,
-    20034: 22,
-    20033: 22,
-    20032: 22,
-    20031: 22,
-    20030: 22,
-    20029: 22,
-    20028: 22,
-    20027: 22,
-    20026: 22,
-    20025: 22,
-    20024: 22,
-    20023: 22,
-    20022: 22,
-    20021: 22,
-    20020: 22,
-    20019: 22,
-    20018: 22,
-    20017: 22,
-    20016: 22,
-    20015: 22,
-    20014: 22,
-    20013: 22,
-    20012: 22,
-    20011: 22,
-    20010: 23,
-    20009: 23,
-    20008: 23,
-    20007: 23,
-    20006: 23,
-    20005: 23,
-    20004: 23,
-    20003: 23,
-    20002: 23,
-    20001: 23,
-    20000: 23,
-    19999: 23,
-    19998: 23,
-    19997: 23,
-    19996: 23,
-    19995: 23,
-    19994: 23,
-    19993: 23,
-    19992: 23,
-    19991: 23,
-    19990: 23,
-    19989: 23,
-    19988: 23,
-    19987: 23,
-    19986: 23,
-    19985: 23,
-    19984: 23,
-    19983: 23,
-    19982: 23,
-    19981: 23,
-    19980: 23,
-    19979: 23,
-    19978: 23,
-    19977: 23,
-    19976: 23,
-    19975: 23,
-    19974: 23,
-    19973: 23,
-    19972: 23,
-    19971: 23,
-    19970: 23,
-    19969: 23,
-    19968: 23,
-    19967: 23,
-    19966: 23,
-    19965: 23,
-    19964: 23,
-    19963: 23,
-    19962: 23,
-    19961: 23,
-    19960: 23,
-    19959: 23,
-    19958: 23,
-    19957: 23,
-    19956: 23,
-    19955: 23,
-    19954: 23,
-    19953: 23,
-    19952: 23,
-    19951: 23,
-    19950: 23,
-    19949: 23,
-    19948: 23,
-    19947: 23,
-    19946: 23,
-    19945: 23,
-    19944: 23,
-    19943: 23,
-    19942: 23,
-    19941: 23,
-    19940: 23,
-    19939: 23,
-    19938: 23,
-    19937: 23,
-    19936: 23,
-    19935: 23,
-    19934: 23,
-    19933: 23,
-    19932: 23,
-    19931: 23,
-    19930: 23,
-    19929: 23,
-    19928: 23,
-    19927: 23,
-    19926: 23,
-    19925: 23,
-    19924: 23,
-    19923: 23,
-    19922: 23,
-    19921: 23,
-    19920: 23,
-    19919: 23,
-    19918: 23,
-    19917: 23,
-    19916: 23,
-    19915: 23,
-    19914: 23,
-    19913: 23,
-    19912: 23,
-    19911: 23,
-    19910: 23,
-    19909: 23,
-    19908: 23,
-    19907: 23,
-    19906: 23,
-    19905: 23,
-    19904: 23,
-    19903: 23,
-    19902: 23,
-    19901: 23,
-    19900: 23,
-    19899: 23,
-    19898: 23,
-    19897: 23,
-    19896: 23,
-    19895: 23,
-    19894: 23,
-    19893: 23,
-    19892: 23,
-    19891: 23,
-    19890: 23,
-    19889: 23,
-    19888: 23,
-    19887: 23,
-    19886: 23,
-    19885: 23,
-    19884: 23,
-    19883: 23,
-    19882: 23,
-    19881: 23,
-    19880: 23,
-    19879: 23,
-    19878: 23,
-    19877: 23,
-    19876: 23,
-    19875: 23,
-    19874: 23,
-    19873: 23,
-    19872: 23,
-    19871: 23,
-    19870: 23,
-    19869: 23,
-    19868: 23,
-    19867: 23,
-    19866: 23,
-    19865: 23,
-    19864: 23,
-    19863: 23,
-    19862: 23,
-    19861: 23,
-    19860: 23,
-    19859: 23,
-    19858: 23,
-    19857: 23,
-    19856: 23,
-    19855: 23,
-    19854: 23,
-    19853: 23,
-    19852: 23,
-    19851: 23,
-    19850: 24,
-    19849: 24,
-    19848: 24,
-    19847: 24,
-    19846: 24,
-    19845: 24,
-    19844: 24,
-    19843: 24,
-    19842: 24,
-    19841: 24,
-    19840: 24,
-    19839: 24,
-    19838: 24,
-    19837: 24,
-    19836: 24,
-    19835: 24,
-    19834: 24,
-    19833: 24,
-    19832: 24,
-    19831: 24,
-    19830: 24,
-    19829: 24,
-    19828: 24,
-    19827: 24,
-    19826: 24,
-    19825: 24,
-    19824: 24,
-    19823: 24,
-    19822: 24,
-    19821: 24,
-    19820: 24,
-    19819: 24,
-    19818: 24,
-    19817: 24,
-    19816: 24,
-    19815: 24,
-    19814: 24,
-    19813: 24,
-    19812: 24,
-    19811: 24,
-    19810: 24,
-    19809: 24,
-    19808: 24,
-    19807: 24,
-    19806: 24,
-    19805: 24,
-    19804: 24,
-    19803: 24,
-    19802: 24,
-    19801: 24,
-    19800: 24,
-    19799: 24,
-    19798: 24,
-    19797: 24,
-    19796: 24,
-    19795: 24,
-    19794: 24,
-    19793: 24,
-    19792: 24,
-    19791: 24,
-    19790: 24,
-    19789: 24,
-    19788: 24,
-    19787: 24,
-    19786: 24,
-    19785: 24,
-    19784: 24,
-    19783: 24,
-    19782: 24,
-    19781: 24,
-    19780: 24,
-    19779: 24,
-    19778: 24,
-    19777: 24,
-    19776: 24,
-    19775: 24,
-    19774: 24,
-    19773: 24,
-    19772: 24,
-    19771: 24,
-    19770: 24,
-    19769: 24,
-    19768: 24,
-    19767: 24,
-    19766: 24,
-    19765: 24,
-    19764: 24,
-    19763: 24,
-    19762: 24,
-    19761: 24,
-    19760: 24,
-    19759: 24,
-    19758: 24,
-    19757: 24,
-    19756: 24,
-    19755: 24,
-    19754: 24,
-    19753: 24,
-    19752: 24,
-    19751: 24,
-    19750: 24,
-    19749: 24,
-    19748: 24,
-    19747: 24,
-    19746: 24,
-    19745: 24,
-    19744: 24,
-    19743: 24,
-    19742: 24,
-    19741: 24,
-    19740: 24,
-    19739: 24,
-    19738: 24,
-    19737: 24,
-    19736: 24,
-    19735: 24,
-    19734: 24,
-    19733: 24,
-    19732: 24,
-    19731: 24,
-    19730: 24,
-    19729: 24,
-    19728: 24,
-    19727: 24,
-    19726: 24,
-    19725: 24,
-    19724: 24,
-    19723: 24,
-    19722: 24,
-    19721: 24,
-    19720: 24,
-    19719: 24,
-    19718: 24,
-    19717: 24,
-    19716: 24,
-    19715: 24,
-    19714: 24,
-    19713: 24,
-    19712: 24,
-    19711: 24,
-    19710: 24,
-    19709: 24,
-    19708: 24,
-    19707: 24,
-    19706: 24,
-    19705: 24,
-    19704: 24,
-    19703: 24,
-    19702: 24,
-    19701: 24,
-    19700: 25,
-    19699: 25,
-    19698: 25,
-    19697: 25,
-    19696: 25,
-    19695: 25,
-    19694: 25,
-    19693: 25,
-    19692: 25,
-    19691: 25,
-    19690: 25,
-    19689: 25,
-    19688: 25,
-    19687: 25,
-    19686: 25,
-    19685: 25,
-    19684: 25,
-    19683: 25,
-    19682: 25,
-    19681: 25,
-    19680: 25,
-    19679: 25,
-    19678: 25,
-    19677: 25,
-    19676: 25,
-    19675: 25,
-    19674: 25,
-    19673: 25,
-    19672: 25,
-    19671: 25,
-    19670: 25,
-    19669: 25,
-    19668: 25,
-    19667: 25,
-    19666: 25,
-    19665: 25,
-    19664: 25,
-    19663: 25,
-    19662: 25,
-    19661: 25,
-    19660: 25,
-    19659: 25,
-    19658: 25,
-    19657: 25,
-    19656: 25,
-    19655: 25,
-    19654: 25,
-    19653: 25,
-    19652: 25,
-    19651: 25,
-    19650: 25,
-    19649: 25,
-    19648: 25,
-    19647: 25,
-    19646: 25,
-    19645: 25,
-    19644: 25,
-    19643: 25,
-    19642: 25,
-    19641: 25,
-    19640: 25,
-    19639: 25,
-    19638: 25,
-    19637: 25,
-    19636: 25,
-    19635: 25,
-    19634: 25,
-    19633: 25,
-    19632: 25,
-    19631: 25,
-    19630: 25,
-    19629: 25,
-    19628: 25,
-    19627: 25,
-    19626: 25,
-    19625: 25,
-    19624: 25,
-    19623: 25,
-    19622: 25,
-    19621: 25,
-    19620: 25,
-    19619: 25,
-    19618: 25,
-    19617: 25,
-    19616: 25,
-    19615: 25,
-    19614: 25,
-    19613: 25,
-    19612: 25,
-    19611: 25,
-    19610: 25,
-    19609: 25,
-    19608: 25,
-    19607: 25,
-    19606: 25,
-    19605: 25,
-    19604: 25,
-    19603: 25,
-    19602: 25,
-    19601: 25,
-    19600: 25,
-    19599: 25,
-    19598: 25,
-    19597: 25,
-    19596: 25,
-    19595: 25,
-    19594: 25,
-    19593: 25,
-    19592: 25,
-    19591: 25,
-    19590: 25,
-    19589: 25,
-    19588: 25,
-    19587: 25,
-    19586: 25,
-    19585: 25,
-    19584: 25,
-    19583: 25,
-    19582: 25,
-    19581: 25,
-    19580: 25,
-    19579: 25,
-    19578: 25,
-    19577: 25,
-    19576: 25,
-    19575: 25,
-    19574: 25,
-    19573: 25,
-    19572: 25,
-    19571: 25,
-    19570: 25,
-    19569: 25,
-    19568: 25,
-    19567: 25,
-    19566: 25,
-    19565: 25,
-    19564: 25,
-    19563: 25,
-    19562: 25,
-    19561: 25,
-    19560: 25,
-    19559: 25,
-    19558: 25,
-    19557: 25,
-    19556: 25,
-    19555: 25,
-    19554: 25,
-    19553: 25,
-    19552: 25,
-    19551: 25,
-    19550: 26,
-    19549: 26,
-    19548: 26,
-    19547: 26,
-    19546: 26,
-    19545: 26,
-    19544: 26,
-    19543: 26,
-    19542: 26,
-    19541: 26,
-    19540: 26,
-    19539: 26,
-    19538: 26,
-    19537: 26,
-    19536: 26,
-    19535: 26,
-    19534: 26,
-    19533: 26,
-    19532: 26,
-    19531: 26,
-    19530: 26,
-    19529: 26,
-    19528: 26,
-    19527: 26,
-    19526: 26,
-    19525: 26,
-    19524: 26,
-    19523: 26,
-    19522: 26,
-    19521: 26,
-    19520: 26,
-    19519: 26,
-    19518: 26,
-    19517: 26,
-    19516: 26,
-    19515: 26,
-    19514: 26,
-    19513: 26,
-    19512: 26,
-    19511: 26,
-    19510: 26,
-    19509: 26,
-    19508: 26,
-    19507: 26,
-    19506: 26,
-    19505: 26,
-    19504: 26,
-    19503: 26,
-    19502: 26,
-    19501: 26,
-    19500: 26,
-    19499: 26,
-    19498: 26,
-    19497: 26,
-    19496: 26,
-    19495: 26,
-    19494: 26,
-    19493: 26,
-    19492: 26,
-    19491: 26,
-    19490: 26,
-    19489: 26,
-    19488: 26,
-    19487: 26,
-    19486: 26,
-    19485: 26,
-    19484: 26,
-    19483: 26,
-    19482: 26,
-    19481: 26,
-    19480: 26,
-    19479: 26,
-    19478: 26,
-    19477: 26,
-    19476: 26,
-    19475: 26,
-    19474: 26,
-    19473: 26,
-    19472: 26,
-    19471: 26,
-    19470: 26,
-    19469: 26,
-    19468: 26,
-    19467: 26,
-    19466: 26,
-    19465: 26,
-    19464: 26,
-    19463: 26,
-    19462: 26,
-    19461: 26,
-    19460: 26,
-    19459: 26,
-    19458: 26,
-    19457: 26,
-    19456: 26,
-    19455: 26,
-    19454: 26,
-    19453: 26,
-    19452: 26,
-    19451: 26,
-    19450: 26,
-    19449: 26,
-    19448: 26,
-    19447: 26,
-    19446: 26,
-    19445: 26,
-    19444: 26,
-    19443: 26,
-    19442: 26,
-    19441: 26,
-    19440: 26,
-    19439: 26,
-    19438: 26,
-    19437: 26,
-    19436: 26,
-    19435: 26,
-    19434: 26,
-    19433: 26,
-    19432: 26,
-    19431: 26,
-    19430: 26,
-    19429: 26,
-    19428: 26,
-    19427: 26,
-    19426: 26,
-    19425: 26,
-    19424: 26,
-    19423: 26,
-    19422: 26,
-    19421: 26,
-    19420: 26,
-    19419: 26,
-    19418: 26,
-    19417: 26,
-    19416: 26,
-    19415: 26,
-    19414: 26,
-    19413: 26,
-    19412: 26,
-    19411: 26,
-    19410: 26,
-    19409: 26,
-    19408: 26,
-    19407: 26,
-    19406: 26,
-    19405: 26,
-    19404: 26,
-    19403: 26,
-    19402: 26,
-    19401: 26,
-    19400: 27,
-    19399: 27,
-    19398: 27,
-    19397: 27,
-    19396: 27,
-    19395: 27,
-    19394: 27,
-    19393: 27,
-    19392: 27,
-    19391: 27,
-    19390: 27,
-    19389: 27,
-    19388: 27,
-    19387: 27,
-    19386: 27,
-    19385: 27,
-    19384: 27,
-    19383: 27,
-    19382: 27,
-    19381: 27,
-    19380: 27,
-    19379: 27,
-    19378: 27,
-    19377: 27,
-    19376: 27,
-    19375: 27,
-    19374: 27,
-    19373: 27,
-    19372: 27,
-    19371: 27,
-    19370: 27,
-    19369: 27,
-    19368: 27,
-    19367: 27,
-    19366: 27,
-    19365: 27,
-    19364: 27,
-    19363: 27,
-    19362: 27,
-    19361: 27,
-    19360: 27,
-    19359: 27,
-    19358: 27,
-    19357: 27,
-    19356: 27,
-    19355: 27,
-    19354: 27,
-    19353: 27,
-    19352: 27,
-    19351: 27,
-    19350: 27,
-    19349: 27,
-    19348: 27,
-    19347: 27,
-    19346: 27,
-    19345: 27,
-    19344: 27,
-    19343: 27,
-    19342: 27,
-    19341: 27,
-    19340: 27,
-    19339: 27,
-    19338: 27,
-    19337: 27,
-    19336: 27,
-    19335: 27,
-    19334: 27,
-    19333: 27,
-    19332: 27,
-    19331: 27,
-    19330: 27,
-    19329: 27,
-    19328: 27,
-    19327: 27,
-    19326: 27,
-    19325: 27,
-    19324: 27,
-    19323: 27,
-    19322: 27,
-    19321: 27,
-    19320: 27,
-    19319: 27,
-    19318: 27,
-    19317: 27,
-    19316: 27,
-    19315: 27,
-    19314: 27,
-    19313: 27,
-    19312: 27,
-    19311: 27,
-    19310: 27,
-    19309: 27,
-    19308: 27,
-    19307: 27,
-    19306: 27,
-    19305: 27,
-    19304: 27,
-    19303: 27,
-    19302: 27,
-    19301: 27,
-    19300: 27,
-    19299: 27,
-    19298: 27,
-    19297: 27,
-    19296: 27,
-    19295: 27,
-    19294: 27,
-    19293: 27,
-    19292: 27,
-    19291: 27,
-    19290: 27,
-    19289: 27,
-    19288: 27,
-    19287: 27,
-    19286: 27,
-    19285: 27,
-    19284: 27,
-    19283: 27,
-    19282: 27,
-    19281: 27,
-    19280: 27,
-    19279: 27,
-    19278: 27,
-    19277: 27,
-    19276: 27,
-    19275: 27,
-    19274: 27,
-    19273: 27,
-    19272: 27,
-    19271: 27,
-    19270: 27,
-    19269: 27,
-    19268: 27,
-    19267: 27,
-    19266: 27,
-    19265: 27,
-    19264: 27,
-    19263: 27,
-    19262: 27,
-    19261: 27,
-    19260: 28,
-    19259: 28,
-    19258: 28,
-    19257: 28,
-    19256: 28,
-    19255: 28,
-    19254: 28,
-    19253: 28,
-    19252: 28,
-    19251: 28,
-    19250: 28,
-    19249: 28,
-    19248: 28,
-    19247: 28,
-    19246: 28,
-    19245: 28,
-    19244: 28,
-    19243: 28,
-    19242: 28,
-    19241: 28,
-    19240: 28,
-    19239: 28,
-    19238: 28,
-    19237: 28,
-    19236: 28,
-    19235: 28,
-    19234: 28,
-    19233: 28,
-    19232: 28,
-    19231: 28,
-    19230: 28,
-    19229: 28,
-    19228: 28,
-    19227: 28,
-    19226: 28,
-    19225: 28,
-    19224: 28,
-    19223: 28,
-    19222: 28,
-    19221: 28,
-    19220: 28,
-    19219: 28,
-    19218: 28,
-    19217: 28,
-    19216: 28,
-    19215: 28,
-    19214: 28,
-    19213: 28,
-    19212: 28,
-    19211: 28,
-    19210: 28,
-    19209: 28,
-    19208: 28,
-    19207: 28,
-    19206: 28,
-    19205: 28,
-    19204: 28,
-    19203: 28,
-    19202: 28,
-    19201: 28,
-    19200: 28,
-    19199: 28,
-    19198: 28,
-    19197: 28,
-    19196: 28,
-    19195: 28,
-    19194: 28,
-    19193: 28,
-    19192: 28,
-    19191: 28,
-    19190: 28,
-    19189: 28,
-    19188: 28,
-    19187: 28,
-    19186: 28,
-    19185: 28,
-    19184: 28,
-    19183: 28,
-    19182: 28,
-    19181: 28,
-    19180: 28,
-    19179: 28,
-    19178: 28,
-    19177: 28,
-    19176: 28,
-    19175: 28,
-    19174: 28,
-    19173: 28,
-    19172: 28,
-    19171: 28,
-    19170: 28,
-    19169: 28,
-    19168: 28,
-    19167: 28,
-    19166: 28,
-    19165: 28,
-    19164: 28,
-    19163: 28,
-    19162: 28,
-    19161: 28,
-    19160: 28,
-    19159: 28,
-    19158: 28,
-    19157: 28,
-    19156: 28,
-    19155: 28,
-    19154: 28,
-    19153: 28,
-    19152: 28,
-    19151: 28,
-    19150: 28,
-    19149: 28,
-    19148: 28,
-    19147: 28,
-    19146: 28,
-    19145: 28,
-    19144: 28,
-    19143: 28,
-    19142: 28,
-    19141: 28,
-    19140: 28,
-    19139: 28,
-    19138: 28,
-    19137: 28,
-    19136: 28,
-    19135: 28,
-    19134: 28,
-    19133: 28,
-    19132: 28,
-    19131: 28,
-    19130: 28,
-    19129: 28,
-    19128: 28,
-    19127: 28,
-    19126: 28,
-    19125: 28,
-    19124: 28,
-    19123: 28,
-    19122: 28,
-    19121: 28,
-    19120: 29,
-    19119: 29,
-    19118: 29,
-    19117: 29,
-    19116: 29,
-    19115: 29,
-    19114: 29,
-    19113: 29,
-    19112: 29,
-    19111: 29,
-    19110: 29,
-    19109: 29,
-    19108: 29,
-    19107: 29,
-    19106: 29,
-    19105: 29,
-    19104: 29,
-    19103: 29,
-    19102: 29,
-    19101: 29,
-    19100: 29,
-    19099: 29,
-    19098: 29,
-    19097: 29,
-    19096: 29,
-    19095: 29,
-    19094: 29,
-    19093: 29,
-    19092: 29,
-    19091: 29,
-    19090: 29,
-    19089: 29,
-    19088: 29,
-    19087: 29,
-    19086: 29,
-    19085: 29,
-    19084: 29,
-    19083: 29,
-    19082: 29,
-    19081: 29,
-    19080: 29,
-    19079: 29,
-    19078: 29,
-    19077: 29,
-    19076: 29,
-    19075: 29,
-    19074: 29,
-    19073: 29,
-    19072: 29,
-    19071: 29,
-    19070: 29,
-    19069: 29,
-    19068: 29,
-    19067: 29,
-    19066: 29,
-    19065: 29,
-    19064: 29,
-    19063: 29,
-    19062: 29,
-    19061: 29,
-    19060: 29,
-    19059: 29,
-    19058: 29,
-    19057: 29,
-    19056: 29,
-    19055: 29,
-    19054: 29,
-    19053: 29,
-    19052: 29,
-    19051: 29,
-    19050: 29,
-    19049: 29,
-    19048: 29,
-    19047: 29,
-    19046: 29,
-    19045: 29,
-    19044: 29,
-    19043: 29,
-    19042: 29,
-    19041: 29,
-    19040: 29,
-    19039: 29,
-    19038: 29,
-    19037: 29,
-    19036: 29,
-    19035: 29,
-    19034: 29,
-    19033: 29,
-    19032: 29,
-    19031: 29,
-    19030: 29,
-    19029: 29,
-    19028: 29,
-    19027: 29,
-    19026: 29,
-    19025: 29,
-    19024: 29,
-    19023: 29,
-    19022: 29,
-    19021: 29,
-    19020: 29,
-    19019: 29,
-    19018: 29,
-    19017: 29,
-    19016: 29,
-    19015: 29,
-    19014: 29,
-    19013: 29,
-    19012: 29,
-    19011: 29,
-    19010: 29,
-    19009: 29,
-    19008: 29,
-    19007: 29,
-    19006: 29,
-    19005: 29,
-    19004: 29,
-    19003: 29,
-    19002: 29,
-    19001: 29,
-    19000: 29,
-    18999: 29,
-    18998: 29,
-    18997: 29,
-    18996: 29,
-    18995: 29,
-    18994: 29,
-    18993: 29,
-    18992: 29,
-    18991: 29,
-    18990: 29,
-    18989: 29,
-    18988: 29,
-    18987: 29,
-    18986: 29,
-    18985: 29,
-    18984: 29,
-    18983: 29,
-    18982: 29,
-    18981: 29,
-    18980: 30,
-    18979: 30,
-    18978: 30,
-    18977: 30,
-    18976: 30,
-    18975: 30,
-    18974: 30,
-    18973: 30,
-    18972: 30,
-    18971: 30,
-    18970: 30,
-    18969: 30,
-    18968: 30,
-    18967: 30,
-    18966: 30,
-    18965: 30,
-    18964: 30,
-    18963: 30,
-    18962: 30,
-    18961: 30,
-    18960: 30,
-    18959: 30,
-    18958: 30,
-    18957: 30,
-    18956: 30,
-    18955: 30,
-    18954: 30,
-    18953: 30,
-    18952: 30,
-    18951: 30,
-    18950: 30,
-    18949: 30,
-    18948: 30,
-    18947: 30,
-    18946: 30,
-    18945: 30,
-    18944: 30,
-    18943: 30,
-    18942: 30,
-    18941: 30,
-    18940: 30,
-    18939: 30,
-    18938: 30,
-    18937: 30,
-    18936: 30,
-    18935: 30,
-    18934: 30,
-    18933: 30,
-    18932: 30,
-    18931: 30,
-    18930: 30,
-    18929: 30,
-    18928: 30,
-    18927: 30,
-    18926: 30,
-    18925: 30,
-    18924: 30,
-    18923: 30,
-    18922: 30,
-    18921: 30,
-    18920: 30,
-    18919: 30,
-    18918: 30,
-    18917: 30,
-    18916: 30,
-    18915: 30,
-    18914: 30,
-    18913: 30,
-    18912: 30,
-    18911: 30,
-    18910: 30,
-    18909: 30,
-    18908: 30,
-    18907: 30,
-    18906: 30,
-    18905: 30,
-    18904: 30,
-    18903: 30,
-    18902: 30,
-    18901: 30,
-    18900: 30,
-    18899: 30,
-    18898: 30,
-    18897: 30,
-    18896: 30,
-    18895: 30,
-    18894: 30,
-    18893: 30,
-    18892: 30,
-    18891: 30,
-    18890: 30,
-    18889: 30,
-    18888: 30,
-    18887: 30,
-    18886: 30,
-    18885: 30,
-    18884: 30,
-    18883: 30,
-    18882: 30,
-    18881: 30,
-    18880: 30,
-    18879: 30,
-    18878: 30,
-    18877: 30,
-    18876: 30,
-    18875: 30,
-    18874: 30,
-    18873: 30,
-    18872: 30,
-    18871: 30,
-    18870: 30,
-    18869: 30,
-    18868: 30,
-    18867: 30,
-    18866: 30,
-    18865: 30,
-    18864: 30,
-    18863: 30,
-    18862: 30,
-    18861: 30,
-    18860: 30,
-    18859: 30,
-    18858: 30,
-    18857: 30,
-    18856: 30,
-    18855: 30,
-    18854: 30,
-    18853: 30,
-    18852: 30,
-    18851: 30,
-    18850: 31,
-    18849: 31,
-    18848: 31,
-    18847: 31,
-    18846: 31,
-    18845: 31,
-    18844: 31,
-    18843: 31,
-    18842: 31,
-    18841: 31,
-    18840: 31,
-    18839: 31,
-    18838: 31,
-    18837: 31,
-    18836: 31,
-    18835: 31,
-    18834: 31,
-    18833: 31,
-    18832: 31,
-    18831: 31,
-    18830: 31,
-    18829: 31,
-    18828: 31,
-    18827: 31,
-    18826: 31,
-    18825: 31,
-    18824: 31,
-    18823: 31,
-    18822: 31,
-    18821: 31,
-    18820: 31,
-    18819: 31,
-    18818: 31,
-    18817: 31,
-    18816: 31,
-    18815: 31,
-    18814: 31,
-    18813: 31,
-    18812: 31,
-    18811: 31,
-    18810: 31,
-    18809: 31,
-    18808: 31,
-    18807: 31,
-    18806: 31,
-    18805: 31,
-    18804: 31,
-    18803: 31,
-    18802: 31,
-    18801: 31,
-    18800: 31,
-    18799: 31,
-    18798: 31,
-    18797: 31,
-    18796: 31,
-    18795: 31,
-    18794: 31,
-    18793: 31,
-    18792: 31,
-    18791: 31,
-    18790: 31,
-    18789: 31,
-    18788: 31,
-    18787: 31,
-    18786: 31,
-    18785: 31,
-    18784: 31,
-    18783: 31,
-    18782: 31,
-    18781: 31,
-    18780: 31,
-    18779: 31,
-    18778: 31,
-    18777: 31,
-    18776: 31,
-    18775: 31,
-    18774: 31,
-    18773: 31,
-    18772: 31,
-    18771: 31,
-    18770: 31,
-    18769: 31,
-    18768: 31,
-    18767: 31,
-    18766: 31,
-    18765: 31,
-    18764: 31,
-    18763: 31,
-    18762: 31,
-    18761: 31,
-    18760: 31,
-    18759: 31,
-    18758: 31,
-    18757: 31,
-    18756: 31,
-    18755: 31,
-    18754: 31,
-    18753: 31,
-    18752: 31,
-    18751: 31,
-    18750: 31,
-    18749: 31,
-    18748: 31,
-    18747: 31,
-    18746: 31,
-    18745: 31,
-    18744: 31,
-    18743: 31,
-    18742: 31,
-    18741: 31,
-    18740: 31,
-    18739: 31,
-    18738: 31,
-    18737: 31,
-    18736: 31,
-    18735: 31,
-    18734: 31,
-    18733: 31,
-    18732: 31,
-    18731: 31,
-    18730: 31,
-    18729: 31,
-    18728: 31,
-    18727: 31,
-    18726: 31,
-    18725: 31,
-    18724: 31,
-    18723: 31,
-    18722: 31,
-    18721: 31,
-    18720: 32,
-    18719: 32,
-    18718: 32,
-    18717: 32,
-    18716: 32,
-    18715: 32,
-    18714: 32,
-    18713: 32,
-    18712: 32,
-    18711: 32,
-    18710: 32,
-    18709: 32,
-    18708: 32,
-    18707: 32,
-    18706: 32,
-    18705: 32,
-    18704: 32,
-    18703: 32,
-    18702: 32,
-    18701: 32,
-    18700: 32,
-    18699: 32,
-    18698: 32,
-    18697: 32,
-    18696: 32,
-    18695: 32,
-    18694: 32,
-    18693: 32,
-    18692: 32,
-    18691: 32,
-    18690: 32,
-    18689: 32,
-    18688: 32,
-    18687: 32,
-    18686: 32,
-    18685: 32,
-    18684: 32,
-    18683: 32,
-    18682: 32,
-    18681: 32,
-    18680: 32,
-    18679: 32,
-    18678: 32,
-    18677: 32,
-    18676: 32,
-    18675: 32,
-    18674: 32,
-    18673: 32,
-    18672: 32,
-    18671: 32,
-    18670: 32,
-    18669: 32,
-    18668: 32,
-    18667: 32,
-    18666: 32,
-    18665: 32,
-    18664: 32,
-    18663: 32,
-    18662: 32,
-    18661: 32,
-    18660: 32,
-    18659: 32,
-    18658: 32,
-    18657: 32,
-    18656: 32,
-    18655: 32,
-    18654: 32,
-    18653: 32,
-    18652: 32,
-    18651: 32,
-    18650: 32,
-    18649: 32,
-    18648: 32,
-    18647: 32,
-    18646: 32,
-    18645: 32,
-    18644: 32,
-    18643: 32,
-    18642: 32,
-    18641: 32,
-    18640: 32,
-    18639: 32,
-    18638: 32,
-    18637: 32,
-    18636: 32,
-    18635: 32,
-    18634: 32,
-    18633: 32,
-    18632: 32,
-    18631: 32,
-    18630: 32,
-    18629: 32,
-    18628: 32,
-    18627: 32,
-    18626: 32,
-    18625: 32,
-    18624: 32,
-    18623: 32,
-    18622: 32,
-    18621: 32,
-    18620: 32,
-    18619: 32,
-    18618: 32,
-    18617: 32,
-    18616: 32,
-    18615: 32,
-    18614: 32,
-    18613: 32,
-    18612: 32,
-    18611: 32,
-    18610: 32,
-    18609: 32,
-    18608: 32,
-    18607: 32,
-    18606: 32,
-    18605: 32,
-    18604: 32,
-    18603: 32,
-    18602: 32,
-    18601: 32,
-    18600: 32,
-    18599: 32,
-    18598: 32,
-    18597: 32,
-    18596: 32,
-    18595: 32,
-    18594: 32,
-    18593: 32,
-    18592: 32,
-    18591: 32,
-    18590: 33,
-    18589: 33,
-    18588: 33,
-    18587: 33,
-    18586: 33,
-    18585: 33,
-    18584: 33,
-    18583: 33,
-    18582: 33,
-    18581: 33,
-    18580: 33,
-    18579: 33,
-    18578: 33,
-    18577: 33,
-    18576: 33,
-    18575: 33,
-    18574: 33,
-    18573: 33,
-    18572: 33,
-    18571: 33,
-    18570: 33,
-    18569: 33,
-    18568: 33,
-    18567: 33,
-    18566: 33,
-    18565: 33,
-    18564: 33,
-    18563: 33,
-    18562: 33,
-    18561: 33,
-    18560: 33,
-    18559: 33,
-    18558: 33,
-    18557: 33,
-    18556: 33,
-    18555: 33,
-    18554: 33,
-    18553: 33,
-    18552: 33,
-    18551: 33,
-    18550: 33,
-    18549: 33,
-    18548: 33,
-    18547: 33,
-    18546: 33,
-    18545: 33,
-    18544: 33,
-    18543: 33,
-    18542: 33,
-    18541: 33,
-    18540: 33,
-    18539: 33,
-    18538: 33,
-    18537: 33,
-    18536: 33,
-    18535: 33,
-    18534: 33,
-    18533: 33,
-    18532: 33,
-    18531: 33,
-    18530: 33,
-    18529: 33,
-    18528: 33,
-    18527: 33,
-    18526: 33,
-    18525: 33,
-    18524: 33,
-    18523: 33,
-    18522: 33,
-    18521: 33,
-    18520: 33,
-    18519: 33,
-    18518: 33,
-    18517: 33,
-    18516: 33,
-    18515: 33,
-    18514: 33,
-    18513: 33,
-    18512: 33,
-    18511: 33,
-    18510: 33,
-    18509: 33,
-    18508: 33,
-    18507: 33,
-    18506: 33,
-    18505: 33,
-    18504: 33,
-    18503: 33,
-    18502: 33,
-    18501: 33,
-    18500: 33,
-    18499: 33,
-    18498: 33,
-    18497: 33,
-    18496: 33,
-    18495: 33,
-    18494: 33,
-    18493: 33,
-    18492: 33,
-    18491: 33,
-    18490: 33,
-    18489: 33,
-    18488: 33,
-    18487: 33,
-    18486: 33,
-    18485: 33,
-    18484: 33,
-    18483: 33,
-    18482: 33,
-    18481: 33,
-    18480: 33,
-    18479: 33,
-    18478: 33,
-    18477: 33,
-    18476: 33,
-    18475: 33,
-    18474: 33,
-    18473: 33,
-    18472: 33,
-    18471: 33,
-    18470: 33,
-    18469: 33,
-    18468: 33,
-    18467: 33,
-    18466: 33,
-    18465: 33,
-    18464: 33,
-    18463: 33,
-    18462: 33,
-    18461: 33,
-    18460: 34,
-    18459: 34,
-    18458: 34,
-    18457: 34,
-    18456: 34,
-    18455: 34,
-    18454: 34,
-    18453: 34,
-    18452: 34,
-    18451: 34,
-    18450: 34,
-    18449: 34,
-    18448: 34,
-    18447: 34,
-    18446: 34,
-    18445: 34,
-    18444: 34,
-    18443: 34,
-    18442: 34,
-    18441: 34,
-    18440: 34,
-    18439: 34,
-    18438: 34,
-    18437: 34,
-    18436: 34,
-    18435: 34,
-    18434: 34,
-    18433: 34,
-    18432: 34,
-    18431: 34,
-    18430: 34,
-    18429: 34,
-    18428: 34,
-    18427: 34,
-    18426: 34,
-    18425: 34,
-    18424: 34,
-    18423: 34,
-    18422: 34,
-    18421: 34,
-    18420: 34,
-    18419: 34,
-    18418: 34,
-    18417: 34,
-    18416: 34,
-    18415: 34,
-    18414: 34,
-    18413: 34,
-    18412: 34,
-    18411: 34,
-    18410: 34,
-    18409: 34,
-    18408: 34,
-    18407: 34,
-    18406: 34,
-    18405: 34,
-    18404: 34,
-    18403: 34,
-    18402: 34,
-    18401: 34,
-    18400: 34,
-    18399: 34,
-    18398: 34,
-    18397: 34,
-    18396: 34,
-    18395: 34,
-    18394: 34,
-    18393: 34,
-    18392: 34,
-    18391: 34,
-    18390: 34,
-    18389: 34,
-    18388: 34,
-    18387: 34,
-    18386: 34,
-    18385: 34,
-    18384: 34,
-    18383: 34,
-    18382: 34,
-    18381: 34,
-    18380: 34,
-    18379: 34,
-    18378: 34,
-    18377: 34,
-    18376: 34,
-    18375: 34,
-    18374: 34,
-    18373: 34,
-    18372: 34,
-    18371: 34,
-    18370: 34,
-    18369: 34,
-    18368: 34,
-    18367: 34,
-    18366: 34,
-    18365: 34,
-    18364: 34,
-    18363: 34,
-    18362: 34,
-    18361: 34,
-    18360: 34,
-    18359: 34,
-    18358: 34,
-    18357: 34,
-    18356: 34,
-    18355: 34,
-    18354: 34,
-    18353: 34,
-    18352: 34,
-    18351: 34,
-    18350: 34,
-    18349: 34,
-    18348: 34,
-    18347: 34,
-    18346: 34,
-    18345: 34,
-    18344: 34,
-    18343: 34,
-    18342: 34,
-    18341: 34,
-    18340: 34,
-    18339: 34,
-    18338: 34,
-    18337: 34,
-    18336: 34,
-    18335: 34,
-    18334: 34,
-    18333: 34,
-    18332: 34,
-    18331: 34,
-    18330: 35,
-    18329: 35,
-    18328: 35,
-    18327: 35,
-    18326: 35,
-    18325: 35,
-    18324: 35,
-    18323: 35,
-    18322: 35,
-    18321: 35,
-    18320: 35,
-    18319: 35,
-    18318: 35,
-    18317: 35,
-    18316: 35,
-    18315: 35,
-    18314: 35,
-    18313: 35,
-    18312: 35,
-    18311: 35,
-    18310: 35,
-    18309: 35,
-    18308: 35,
-    18307: 35,
-    18306: 35,
-    18305: 35,
-    18304: 35,
-    18303: 35,
-    18302: 35,
-    18301: 35,
-    18300: 35,
-    18299: 35,
-    18298: 35,
-    18297: 35,
-    18296: 35,
-    18295: 35,
-    18294: 35,
-    18293: 35,
-    18292: 35,
-    18291: 35,
-    18290: 35,
-    18289: 35,
-    18288: 35,
-    18287: 35,
-    18286: 35,
-    18285: 35,
-    18284: 35,
-    18283: 35,
-    18282: 35,
-    18281: 35,
-    18280: 35,
-    18279: 35,
-    18278: 35,
-    18277: 35,
-    18276: 35,
-    18275: 35,
-    18274: 35,
-    18273: 35,
-    18272: 35,
-    18271: 35,
-    18270: 35,
-    18269: 35,
-    18268: 35,
-    18267: 35,
-    18266: 35,
-    18265: 35,
-    18264: 35,
-    18263: 35,
-    18262: 35,
-    18261: 35,
-    18260: 35,
-    18259: 35,
-    18258: 35,
-    18257: 35,
-    18256: 35,
-    18255: 35,
-    18254: 35,
-    18253: 35,
-    18252: 35,
-    18251: 35,
-    18250: 35,
-    18249: 35,
-    18248: 35,
-    18247: 35,
-    18246: 35,
-    18245: 35,
-    18244: 35,
-    18243: 35,
-    18242: 35,
-    18241: 35,
-    18240: 35,
-    18239: 35,
-    18238: 35,
-    18237: 35,
-    18236: 35,
-    18235: 35,
-    18234: 35,
-    18233: 35,
-    18232: 35,
-    18231: 35,
-    18230: 35,
-    18229: 35,
-    18228: 35,
-    18227: 35,
-    18226: 35,
-    18225: 35,
-    18224: 35,
-    18223: 35,
-    18222: 35,
-    18221: 35,
-    18220: 35,
-    18219: 35,
-    18218: 35,
-    18217: 35,
-    18216: 35,
-    18215: 35,
-    18214: 35,
-    18213: 35,
-    18212: 35,
-    18211: 35,
-    18210: 35,
-    18209: 35,
-    18208: 35,
-    18207: 35,
-    18206: 35,
-    18205: 35,
-    18204: 35,
-    18203: 35,
-    18202: 35,
-    18201: 35,
-    18200: 36,
-    18199: 36,
-    18198: 36,
-    18197: 36,
-    18196: 36,
-    18195: 36,
-    18194: 36,
-    18193: 36,
-    18192: 36,
-    18191: 36,
-    18190: 36,
-    18189: 36,
-    18188: 36,
-    18187: 36,
-    18186: 36,
-    18185: 36,
-    18184: 36,
-    18183: 36,
-    18182: 36,
-    18181: 36,
-    18180: 36,
-    18179: 36,
-    18178: 36,
-    18177: 36,
-    18176: 36,
-    18175: 36,
-    18174: 36,
-    18173: 36,
-    18172: 36,
-    18171: 36,
-    18170: 36,
-    18169: 36,
-    18168: 36,
-    18167: 36,
-    18166: 36,
-    18165: 36,
-    18164: 36,
-    18163: 36,
-    18162: 36,
-    18161: 36,
-    18160: 36,
-    18159: 36,
-    18158: 36,
-    18157: 36,
-    18156: 36,
-    18155: 36,
-    18154: 36,
-    18153: 36,
-    18152: 36,
-    18151: 36,
-    18150: 36,
-    18149: 36,
-    18148: 36,
-    18147: 36,
-    18146: 36,
-    18145: 36,
-    18144: 36,
-    18143: 36,
-    18142: 36,
-    18141: 36,
-    18140: 36,
-    18139: 36,
-    18138: 36,
-    18137: 36,
-    18136: 36,
-    18135: 36,
-    18134: 36,
-    18133: 36,
-    18132: 36,
-    18131: 36,
-    18130: 36,
-    18129: 36,
-    18128: 36,
-    18127: 36,
-    18126: 36,
-    18125: 36,
-    18124: 36,
-    18123: 36,
-    18122: 36,
-    18121: 36,
-    18120: 36,
-    18119: 36,
-    18118: 36,
-    18117: 36,
-    18116: 36,
-    18115: 36,
-    18114: 36,
-    18113: 36,
-    18112: 36,
-    18111: 36,
-    18110: 36,
-    18109: 36,
-    18108: 36,
-    18107: 36,
-    18106: 36,
-    18105: 36,
-    18104: 36,
-    18103: 36,
-    18102: 36,
-    18101: 36,
-    18100: 36,
-    18099: 36,
-    18098: 36,
-    18097: 36,
-    18096: 36,
-    18095: 36,
-    18094: 36,
-    18093: 36,
-    18092: 36,
-    18091: 36,
-    18090: 36,
-    18089: 36,
-    18088: 36,
-    18087: 36,
-    18086: 36,
-    18085: 36,
-    18084: 36,
-    18083: 36,
-    18082: 36,
-    18081: 36,
-    18080: 36,
-    18079: 36,
-    18078: 36,
-    18077: 36,
-    18076: 36,
-    18075: 36,
-    18074: 36,
-    18073: 36,
-    18072: 36,
-    18071: 36,
-    18070: 37,
-    18069: 37,
-    18068: 37,
-    18067: 37,
-    18066: 37,
-    18065: 37,
-    18064: 37,
-    18063: 37,
-    18062: 37,
-    18061: 37,
-    18060: 37,
-    18059: 37,
-    18058: 37,
-    18057: 37,
-    18056: 37,
-    18055: 37,
-    18054: 37,
-    18053: 37,
-    18052: 37,
-    18051: 37,
-    18050: 37,
-    18049: 37,
-    18048: 37,
-    18047: 37,
-    18046: 37,
-    18045: 37,
-    18044: 37,
-    18043: 37,
-    18042: 37,
-    18041: 37,
-    18040: 37,
-    18039: 37,
-    18038: 37,
-    18037: 37,
-    18036: 37,
-    18035: 37,
-    18034: 37,
-    18033: 37,
-    18032: 37,
-    18031: 37,
-    18030: 37,
-    18029: 37,
-    18028: 37,
-    18027: 37,
-    18026: 37,
-    18025: 37,
-    18024: 37,
-    18023: 37,
-    18022: 37,
-    18021: 37,
-    18020: 37,
-    18019: 37,
-    18018: 37,
-    18017: 37,
-    18016: 37,
-    18015: 37,
-    18014: 37,
-    18013: 37,
-    18012: 37,
-    18011: 37,
-    18010: 37,
-    18009: 37,
-    18008: 37,
-    18007: 37,
-    18006: 37,
-    18005: 37,
-    18004: 37,
-    18003: 37,
-    18002: 37,
-    18001: 37,
-    18000: 37,
-    17999: 37,
-    17998: 37,
-    17997: 37,
-    17996: 37,
-    17995: 37,
-    17994: 37,
-    17993: 37,
-    17992: 37,
-    17991: 37,
-    17990: 37,
-    17989: 37,
-    17988: 37,
-    17987: 37,
-    17986: 37,
-    17985: 37,
-    17984: 37,
-    17983: 37,
-    17982: 37,
-    17981: 37,
-    17980: 37,
-    17979: 37,
-    17978: 37,
-    17977: 37,
-    17976: 37,
-    17975: 37,
-    17974: 37,
-    17973: 37,
-    17972: 37,
-    17971: 37,
-    17970: 37,
-    17969: 37,
-    17968: 37,
-    17967: 37,
-    17966: 37,
-    17965: 37,
-    17964: 37,
-    17963: 37,
-    17962: 37,
-    17961: 37,
-    17960: 37,
-    17959: 37,
-    17958: 37,
-    17957: 37,
-    17956: 37,
-    17955: 37,
-    17954: 37,
-    17953: 37,
-    17952: 37,
-    17951: 37,
-    17950: 37,
-    17949: 37,
-    17948: 37,
-    17947: 37,
-    17946: 37,
-    17945: 37,
-    17944: 37,
-    17943: 37,
-    17942: 37,
-    17941: 37,
-    17940: 38,
-    17939: 38,
-    17938: 38,
-    17937: 38,
-    17936: 38,
-    17935: 38,
-    17934: 38,
-    17933: 38,
-    17932: 38,
-    17931: 38,
-    17930: 38,
-    17929: 38,
-    17928: 38,
-    17927: 38,
-    17926: 38,
-    17925: 38,
-    17924: 38,
-    17923: 38,
-    17922: 38,
-    17921: 38,
-    17920: 38,
-    17919: 38,
-    17918: 38,
-    17917: 38,
-    17916: 38,
-    17915: 38,
-    17914: 38,
-    17913: 38,
-    17912: 38,
-    17911: 38,
-    17910: 38,
-    17909: 38,
-    17908: 38,
-    17907: 38,
-    17906: 38,
-    17905: 38,
-    17904: 38,
-    17903: 38,
-    17902: 38,
-    17901: 38,
-    17900: 38,
-    17899: 38,
-    17898: 38,
-    17897: 38,
-    17896: 38,
-    17895: 38,
-    17894: 38,
-    17893: 38,
-    17892: 38,
-    17891: 38,
-    17890: 38,
-    17889: 38,
-    17888: 38,
-    17887: 38,
-    17886: 38,
-    17885: 38,
-    17884: 38,
-    17883: 38,
-    17882: 38,
-    17881: 38,
-    17880: 38,
-    17879: 38,
-    17878: 38,
-    17877: 38,
-    17876: 38,
-    17875: 38,
-    17874: 38,
-    17873: 38,
-    17872: 38,
-    17871: 38,
-    17870: 38,
-    17869: 38,
-    17868: 38,
-    17867: 38,
-    17866: 38,
-    17865: 38,
-    17864: 38,
-    17863: 38,
-    17862: 38,
-    17861: 38,
-    17860: 38,
-    17859: 38,
-    17858: 38,
-    17857: 38,
-    17856: 38,
-    17855: 38,
-    17854: 38,
-    17853: 38,
-    17852: 38,
-    17851: 38,
-    17850: 38,
-    17849: 38,
-    17848: 38,
-    17847: 38,
-    17846: 38,
-    17845: 38,
-    17844: 38,
-    17843: 38,
-    17842: 38,
-    17841: 38,
-    17840: 38,
-    17839: 38,
-    17838: 38,
-    17837: 38,
-    17836: 38,
-    17835: 38,
-    17834: 38,
-    17833: 38,
-    17832: 38,
-    17831: 38,
-    17830: 38,
-    17829: 38,
-    17828: 38,
-    17827: 38,
-    17826: 38,
-    17825: 38,
-    17824: 38,
-    17823: 38,
-    17822: 38,
-    17821: 38,
-    17820: 39,
-    17819: 39,
-    17818: 39,
-    17817: 39,
-    17816: 39,
-    17815: 39,
-    17814: 39,
-    17813: 39,
-    17812: 39,
-    17811: 39,
-    17810: 39,
-    17809: 39,
-    17808: 39,
-    17807: 39,
-    17806: 39,
-    17805: 39,
-    17804: 39,
-    17803: 39,
-    17802: 39,
-    17801: 39,
-    17800: 39,
-    17799: 39,
-    17798: 39,
-    17797: 39,
-    17796: 39,
-    17795: 39,
-    17794: 39,
-    17793: 39,
-    17792: 39,
-    17791: 39,
-    17790: 39,
-    17789: 39,
-    17788: 39,
-    17787: 39,
-    17786: 39,
-    17785: 39,
-    17784: 39,
-    17783: 39,
-    17782: 39,
-    17781: 39,
-    17780: 39,
-    17779: 39,
-    17778: 39,
-    17777: 39,
-    17776: 39,
-    17775: 39,
-    17774: 39,
-    17773: 39,
-    17772: 39,
-    17771: 39,
-    17770: 39,
-    17769: 39,
-    17768: 39,
-    17767: 39,
-    17766: 39,
-    17765: 39,
-    17764: 39,
-    17763: 39,
-    17762: 39,
-    17761: 39,
-    17760: 39,
-    17759: 39,
-    17758: 39,
-    17757: 39,
-    17756: 39,
-    17755: 39,
-    17754: 39,
-    17753: 39,
-    17752: 39,
-    17751: 39,
-    17750: 39,
-    17749: 39,
-    17748: 39,
-    17747: 39,
-    17746: 39,
-    17745: 39,
-    17744: 39,
-    17743: 39,
-    17742: 39,
-    17741: 39,
-    17740: 39,
-    17739: 39,
-    17738: 39,
-    17737: 39,
-    17736: 39,
-    17735: 39,
-    17734: 39,
-    17733: 39,
-    17732: 39,
-    17731: 39,
-    17730: 39,
-    17729: 39,
-    17728: 39,
-    17727: 39,
-    17726: 39,
-    17725: 39,
-    17724: 39,
-    17723: 39,
-    17722: 39,
-    17721: 39,
-    17720: 39,
-    17719: 39,
-    17718: 39,
-    17717: 39,
-    17716: 39,
-    17715: 39,
-    17714: 39,
-    17713: 39,
-    17712: 39,
-    17711: 39,
-    17710: 39,
-    17709: 39,
-    17708: 39,
-    17707: 39,
-    17706: 39,
-    17705: 39,
-    17704: 39,
-    17703: 39,
-    17702: 39,
-    17701: 39,
-    17700: 40,
-    17699: 40,
-    17698: 40,
-    17697: 40,
-    17696: 40,
-    17695: 40,
-    17694: 40,
-    17693: 40,
-    17692: 40,
-    17691: 40,
-    17690: 40,
-    17689: 40,
-    17688: 40,
-    17687: 40,
-    17686: 40,
-    17685: 40,
-    17684: 40,
-    17683: 40,
-    17682: 40,
-    17681: 40,
-    17680: 40,
-    17679: 40,
-    17678: 40,
-    17677: 40,
-    17676: 40,
-    17675: 40,
-    17674: 40,
-    17673: 40,
-    17672: 40,
-    17671: 40,
-    17670: 40,
-    17669: 40,
-    17668: 40,
-    17667: 40,
-    17666: 40,
-    17665: 40,
-    17664: 40,
-    17663: 40,
-    17662: 40,
-    17661: 40,
-    17660: 40,
-    17659: 40,
-    17658: 40,
-    17657: 40,
-    17656: 40,
-    17655: 40,
-    17654: 40,
-    17653: 40,
-    17652: 40,
-    17651: 40,
-    17650: 40,
-    17649: 40,
-    17648: 40,
-    17647: 40,
-    17646: 40,
-    17645: 40,
-    17644: 40,
-    17643: 40,
-    17642: 40,
-    17641: 40,
-    17640: 40,
-    17639: 40,
-    17638: 40,
-    17637: 40,
-    17636: 40,
-    17635: 40,
-    17634: 40,
-    17633: 40,
-    17632: 40,
-    17631: 40,
-    17630: 40,
-    17629: 40,
-    17628: 40,
-    17627: 40,
-    17626: 40,
-    17625: 40,
-    17624: 40,
-    17623: 40,
-    17622: 40,
-    17621: 40,
-    17620: 40,
-    17619: 40,
-    17618: 40,
-    17617: 40,
-    17616: 40,
-    17615: 40,
-    17614: 40,
-    17613: 40,
-    17612: 40,
-    17611: 40,
-    17610: 40,
-    17609: 40,
-    17608: 40,
-    17607: 40,
-    17606: 40,
-    17605: 40,
-    17604: 40,
-    17603: 40,
-    17602: 40,
-    17601: 40,
-    17600: 40,
-    17599: 40,
-    17598: 40,
-    17597: 40,
-    17596: 40,
-    17595: 40,
-    17594: 40,
-    17593: 40,
-    17592: 40,
-    17591: 40,
-    17590: 40,
-    17589: 40,
-    17588: 40,
-    17587: 40,
-    17586: 40,
-    17585: 40,
-    17584: 40,
-    17583: 40,
-    17582: 40,
-    17581: 40,
-    17580: 41,
-    17579: 41,
-    17578: 41,
-    17577: 41,
-    17576: 41,
-    17575: 41,
-    17574: 41,
-    17573: 41,
-    17572: 41,
-    17571: 41,
-    17570: 41,
-    17569: 41,
-    17568: 41,
-    17567: 41,
-    17566: 41,
-    17565: 41,
-    17564: 41,
-    17563: 41,
-    17562: 41,
-    17561: 41,
-    17560: 41,
-    17559: 41,
-    17558: 41,
-    17557: 41,
-    17556: 41,
-    17555: 41,
-    17554: 41,
-    17553: 41,
-    17552: 41,
-    17551: 41,
-    17550: 41,
-    17549: 41,
-    17548: 41,
-    17547: 41,
-    17546: 41,
-    17545: 41,
-    17544: 41,
-    17543: 41,
-    17542: 41,
-    17541: 41,
-    17540: 41,
-    17539: 41,
-    17538: 41,
-    17537: 41,
-    17536: 41,
-    17535: 41,
-    17534: 41,
-    17533: 41,
-    17532: 41,
-    17531: 41,
-    17530: 41,
-    17529: 41,
-    17528: 41,
-    17527: 41,
-    17526: 41,
-    17525: 41,
-    17524: 41,
-    17523: 41,
-    17522: 41,
-    17521: 41,
-    17520: 41,
-    17519: 41,
-    17518: 41,
-    17517: 41,
-    17516: 41,
-    17515: 41,
-    17514: 41,
-    17513: 41,
-    17512: 41,
-    17511: 41,
-    17510: 41,
-    17509: 41,
-    17508: 41,
-    17507: 41,
-    17506: 41,
-    17505: 41,
-    17504: 41,
-    17503: 41,
-    17502: 41,
-    17501: 41,
-    17500: 41,
-    17499: 41,
-    17498: 41,
-    17497: 41,
-    17496: 41,
-    17495: 41,
-    17494: 41,
-    17493: 41,
-    17492: 41,
-    17491: 41,
-    17490: 41,
-    17489: 41,
-    17488: 41,
-    17487: 41,
-    17486: 41,
-    17485: 41,
-    17484: 41,
-    17483: 41,
-    17482: 41,
-    17481: 41,
-    17480: 41,
-    17479: 41,
-    17478: 41,
-    17477: 41,
-    17476: 41,
-    17475: 41,
-    17474: 41,
-    17473: 41,
-    17472: 41,
-    17471: 41,
-    17470: 41,
-    17469: 41,
-    17468: 41,
-    17467: 41,
-    17466: 41,
-    17465: 41,
-    17464: 41,
-    17463: 41,
-    17462: 41,
-    17461: 41,
-    17460: 42,
-    17459: 42,
-    17458: 42,
-    17457: 42,
-    17456: 42,
-    17455: 42,
-    17454: 42,
-    17453: 42,
-    17452: 42,
-    17451: 42,
-    17450: 42,
-    17449: 42,
-    17448: 42,
-    17447: 42,
-    17446: 42,
-    17445: 42,
-    17444: 42,
-    17443: 42,
-    17442: 42,
-    17441: 42,
-    17440: 42,
-    17439: 42,
-    17438: 42,
-    17437: 42,
-    17436: 42,
-    17435: 42,
-    17434: 42,
-    17433: 42,
-    17432: 42,
-    17431: 42,
-    17430: 42,
-    17429: 42,
-    17428: 42,
-    17427: 42,
-    17426: 42,
-    17425: 42,
-    17424: 42,
-    17423: 42,
-    17422: 42,
-    17421: 42,
-    17420: 42,
-    17419: 42,
-    17418: 42,
-    17417: 42,
-    17416: 42,
-    17415: 42,
-    17414: 42,
-    17413: 42,
-    17412: 42,
-    17411: 42,
-    17410: 42,
-    17409: 42,
-    17408: 42,
-    17407: 42,
-    17406: 42,
-    17405: 42,
-    17404: 42,
-    17403: 42,
-    17402: 42,
-    17401: 42,
-    17400: 42,
-    17399: 42,
-    17398: 42,
-    17397: 42,
-    17396: 42,
-    17395: 42,
-    17394: 42,
-    17393: 42,
-    17392: 42,
-    17391: 42,
-    17390: 42,
-    17389: 42,
-    17388: 42,
-    17387: 42,
-    17386: 42,
-    17385: 42,
-    17384: 42,
-    17383: 42,
-    17382: 42,
-    17381: 42,
-    17380: 42,
-    17379: 42,
-    17378: 42,
-    17377: 42,
-    17376: 42,
-    17375: 42,
-    17374: 42,
-    17373: 42,
-    17372: 42,
-    17371: 42,
-    17370: 42,
-    17369: 42,
-    17368: 42,
-    17367: 42,
-    17366: 42,
-    17365: 42,
-    17364: 42,
-    17363: 42,
-    17362: 42,
-    17361: 42,
-    17360: 42,
-    17359: 42,
-    17358: 42,
-    17357: 42,
-    17356: 42,
-    17355: 42,
-    17354: 42,
-    17353: 42,
-    17352: 42,
-    17351: 42,
-    17350: 42,
-    17349: 42,
-    17348: 42,
-    17347: 42,
-    17346: 42,
-    17345: 42,
-    17344: 42,
-    17343: 42,
-    17342: 42,
-    17341: 42,
-    17340: 43,
-    17339: 43,
-    17338: 43,
-    17337: 43,
-    17336: 43,
-    17335: 43,
-    17334: 43,
-    17333: 43,
-    17332: 43,
-    17331: 43,
-    17330: 43,
-    17329: 43,
-    17328: 43,
-    17327: 43,
-    17326: 43,
-    17325: 43,
-    17324: 43,
-    17323: 43,
-    17322: 43,
-    17321: 43,
-    17320: 43,
-    17319: 43,
-    17318: 43,
-    17317: 43,
-    17316: 43,
-    17315: 43,
-    17314: 43,
-    17313: 43,
-    17312: 43,
-    17311: 43,
-    17310: 43,
-    17309: 43,
-    17308: 43,
-    17307: 43,
-    17306: 43,
-    17305: 43,
-    17304: 43,
-    17303: 43,
-    17302: 43,
-    17301: 43,
-    17300: 43,
-    17299: 43,
-    17298: 43,
-    17297: 43,
-    17296: 43,
-    17295: 43,
-    17294: 43,
-    17293: 43,
-    17292: 43,
-    17291: 43,
-    17290: 43,
-    17289: 43,
-    17288: 43,
-    17287: 43,
-    17286: 43,
-    17285: 43,
-    17284: 43,
-    17283: 43,
-    17282: 43,
-    17281: 43,
-    17280: 43,
-    17279: 43,
-    17278: 43,
-    17277: 43,
-    17276: 43,
-    17275: 43,
-    17274: 43,
-    17273: 43,
-    17272: 43,
-    17271: 43,
-    17270: 43,
-    17269: 43,
-    17268: 43,
-    17267: 43,
-    17266: 43,
-    17265: 43,
-    17264: 43,
-    17263: 43,
-    17262: 43,
-    17261: 43,
-    17260: 43,
-    17259: 43,
-    17258: 43,
-    17257: 43,
-    17256: 43,
-    17255: 43,
-    17254: 43,
-    17253: 43,
-    17252: 43,
-    17251: 43,
-    17250: 43,
-    17249: 43,
-    17248: 43,
-    17247: 43,
-    17246: 43,
-    17245: 43,
-    17244: 43,
-    17243: 43,
-    17242: 43,
-    17241: 43,
-    17240: 43,
-    17239: 43,
-    17238: 43,
-    17237: 43,
-    17236: 43,
-    17235: 43,
-    17234: 43,
-    17233: 43,
-    17232: 43,
-    17231: 43,
-    17230: 43,
-    17229: 43,
-    17228: 43,
-    17227: 43,
-    17226: 43,
-    17225: 43,
-    17224: 43,
-    17223: 43,
-    17222: 43,
-    17221: 43,
-    17220: 44,
-    17219: 44,
-    17218: 44,
-    17217: 44,
-    17216: 44,
-    17215: 44,
-    17214: 44,
-    17213: 44,
-    17212: 44,
-    17211: 44,
-    17210: 44,
-    17209: 44,
-    17208: 44,
-    17207: 44,
-    17206: 44,
-    17205: 44,
-    17204: 44,
-    17203: 44,
-    17202: 44,
-    17201: 44,
-    17200: 44,
-    17199: 44,
-    17198: 44,
-    17197: 44,
-    17196: 44,
-    17195: 44,
-    17194: 44,
-    17193: 44,
-    17192: 44,
-    17191: 44,
-    17190: 44,
-    17189: 44,
-    17188: 44,
-    17187: 44,
-    17186: 44,
-    17185: 44,
-    17184: 44,
-    17183: 44,
-    17182: 44,
-    17181: 44,
-    17180: 44,
-    17179: 44,
-    17178: 44,
-    17177: 44,
-    17176: 44,
-    17175: 44,
-    17174: 44,
-    17173: 44,
-    17172: 44,
-    17171: 44,
-    17170: 44,
-    17169: 44,
-    17168: 44,
-    17167: 44,
-    17166: 44,
-    17165: 44,
-    17164: 44,
-    17163: 44,
-    17162: 44,
-    17161: 44,
-    17160: 44,
-    17159: 44,
-    17158: 44,
-    17157: 44,
-    17156: 44,
-    17155: 44,
-    17154: 44,
-    17153: 44,
-    17152: 44,
-    17151: 44,
-    17150: 44,
-    17149: 44,
-    17148: 44,
-    17147: 44,
-    17146: 44,
-    17145: 44,
-    17144: 44,
-    17143: 44,
-    17142: 44,
-    17141: 44,
-    17140: 44,
-    17139: 44,
-    17138: 44,
-    17137: 44,
-    17136: 44,
-    17135: 44,
-    17134: 44,
-    17133: 44,
-    17132: 44,
-    17131: 44,
-    17130: 44,
-    17129: 44,
-    17128: 44,
-    17127: 44,
-    17126: 44,
-    17125: 44,
-    17124: 44,
-    17123: 44,
-    17122: 44,
-    17121: 44,
-    17120: 44,
-    17119: 44,
-    17118: 44,
-    17117: 44,
-    17116: 44,
-    17115: 44,
-    17114: 44,
-    17113: 44,
-    17112: 44,
-    17111: 44,
-    17110: 44,
-    17109: 44,
-    17108: 44,
-    17107: 44,
-    17106: 44,
-    17105: 44,
-    17104: 44,
-    17103: 44,
-    17102: 44,
-    17101: 44,
-    17100: 45,
-    17099: 45,
-    17098: 45,
-    17097: 45,
-    17096: 45,
-    17095: 45,
-    17094: 45,
-    17093: 45,
-    17092: 45,
-    17091: 45,
-    17090: 45,
-    17089: 45,
-    17088: 45,
-    17087: 45,
-    17086: 45,
-    17085: 45,
-    17084: 45,
-    17083: 45,
-    17082: 45,
-    17081: 45,
-    17080: 45,
-    17079: 45,
-    17078: 45,
-    17077: 45,
-    17076: 45,
-    17075: 45,
-    17074: 45,
-    17073: 45,
-    17072: 45,
-    17071: 45,
-    17070: 45,
-    17069: 45,
-    17068: 45,
-    17067: 45,
-    17066: 45,
-    17065: 45,
-    17064: 45,
-    17063: 45,
-    17062: 45,
-    17061: 45,
-    17060: 45,
-    17059: 45,
-    17058: 45,
-    17057: 45,
-    17056: 45,
-    17055: 45,
-    17054: 45,
-    17053: 45,
-    17052: 45,
-    17051: 45,
-    17050: 45,
-    17049: 45,
-    17048: 45,
-    17047: 45,
-    17046: 45,
-    17045: 45,
-    17044: 45,
-    17043: 45,
-    17042: 45,
-    17041: 45,
-    17040: 45,
-    17039: 45,
-    17038: 45,
-    17037: 45,
-    17036: 45,
-    17035: 45,
-    17034: 45,
-    17033: 45,
-    17032: 45,
-    17031: 45,
-    17030: 45,
-    17029: 45,
-    17028: 45,
-    17027: 45,
-    17026: 45,
-    17025: 45,
-    17024: 45,
-    17023: 45,
-    17022: 45,
-    17021: 45,
-    17020: 45,
-    17019: 45,
-    17018: 45,
-    17017: 45,
-    17016: 45,
-    17015: 45,
-    17014: 45,
-    17013: 45,
-    17012: 45,
-    17011: 45,
-    17010: 45,
-    17009: 45,
-    17008: 45,
-    17007: 45,
-    17006: 45,
-    17005: 45,
-    17004: 45,
-    17003: 45,
-    17002: 45,
-    17001: 45,
-    17000: 45,
-    16999: 45,
-    16998: 45,
-    16997: 45,
-    16996: 45,
-    16995: 45,
-    16994: 45,
-    16993: 45,
-    16992: 45,
-    16991: 45,
-    16990: 45,
-    16989: 45,
-    16988: 45,
-    16987: 45,
-    16986: 45,
-    16985: 45,
-    16984: 45,
-    16983: 45,
-    16982: 45,
-    16981: 45,
-    16980: 45,
-    16979: 45,
-    16978: 45,
-    16977: 45,
-    16976: 45,
-    16975: 45,
-    16974: 45,
-    16973: 45,
-    16972: 45,
-    16971: 45,
-    16970: 45,
-    16969: 45,
-    16968: 45,
-    16967: 45,
-    16966: 45,
-    16965: 45,
-    16964: 45,
-    16963: 45,
-    16962: 45,
-    16961: 45,
-    16960: 45,
-    16959: 45,
-    16958: 45,
-    16957: 45,
-    16956: 45,
-    16955: 45,
-    16954: 45,
-    16953: 45,
-    16952: 45,
-    16951: 45,
-    16950: 45,
-    16949: 45,
-    16948: 45,
-    16947: 45,
-    16946: 45,
-    16945: 45,
-    16944: 45,
-    16943: 45,
-    16942: 45,
-    16941: 45,
-    16940: 45,
-    16939: 45,
-    16938: 45,
-    16937: 45,
-    16936: 45,
-    16935: 45,
-    16934: 45,
-    16933: 45,
-    16932: 45,
-    16931: 45,
-    16930: 45,
-    16929: 45,
-    16928: 45,
-    16927: 45,
-    16926: 45,
-    16925: 45,
-    16924: 45,
-    16923: 45,
-    16922: 45,
-    16921: 45,
-    16920: 45,
-    16919: 45,
-    16918: 45,
-    16917: 45,
-    16916: 45,
-    16915: 45,
-    16914: 45,
-    16913: 45,
-    16912: 45,
-    16911: 45,
-    16910: 45,
-    16909: 45,
-    16908: 45,
-    16907: 45,
-    16906: 45,
-    16905: 45,
-    16904: 45,
-    16903: 45,
-    16902: 45,
-    16901: 45,
-    16900: 45,
-    16899: 45,
-    16898: 45,
-    16897: 45,
-    16896: 45,
-    16895: 45,
-    16894: 45,
-    16893: 45,
-    16892: 45,
-    16891: 45,
-    16890: 45,
-    16889: 45,
-    16888: 45,
-    16887: 45,
-    16886: 45,
-    16885: 45,
-    16884: 45,
-    16883: 45,
-    16882: 45,
-    16881: 45,
-    16880: 46,
-    16879: 46,
-    16878: 46,
-    16877: 46,
-    16876: 46,
-    16875: 46,
-    16874: 46,
-    16873: 46,
-    16872: 46,
-    16871: 46,
-    16870: 46,
-    16869: 46,
-    16868: 46,
-    16867: 46,
-    16866: 46,
-    16865: 46,
-    16864: 46,
-    16863: 46,
-    16862: 46,
-    16861: 46,
-    16860: 46,
-    16859: 46,
-    16858: 46,
-    16857: 46,
-    16856: 46,
-    16855: 46,
-    16854: 46,
-    16853: 46,
-    16852: 46,
-    16851: 46,
-    16850: 46,
-    16849: 46,
-    16848: 46,
-    16847: 46,
-    16846: 46,
-    16845: 46,
-    16844: 46,
-    16843: 46,
-    16842: 46,
-    16841: 46,
-    16840: 46,
-    16839: 46,
-    16838: 46,
-    16837: 46,
-    16836: 46,
-    16835: 46,
-    16834: 46,
-    16833: 46,
-    16832: 46,
-    16831: 46,
-    16830: 46,
-    16829: 46,
-    16828: 46,
-    16827: 46,
-    16826: 46,
-    16825: 46,
-    16824: 46,
-    16823: 46,
-    16822: 46,
-    16821: 46,
-    16820: 46,
-    16819: 46,
-    16818: 46,
-    16817: 46,
-    16816: 46,
-    16815: 46,
-    16814: 46,
-    16813: 46,
-    16812: 46,
-    16811: 46,
-    16810: 46,
-    16809: 46,
-    16808: 46,
-    16807: 46,
-    16806: 46,
-    16805: 46,
-    16804: 46,
-    16803: 46,
-    16802: 46,
-    16801: 46,
-    16800: 46,
-    16799: 46,
-    16798: 46,
-    16797: 46,
-    16796: 46,
-    16795: 46,
-    16794: 46,
-    16793: 46,
-    16792: 46,
-    16791: 46,
-    16790: 46,
-    16789: 46,
-    16788: 46,
-    16787: 46,
-    16786: 46,
-    16785: 46,
-    16784: 46,
-    16783: 46,
-    16782: 46,
-    16781: 46,
-    16780: 46,
-    16779: 46,
-    16778: 46,
-    16777: 46,
-    16776: 46,
-    16775: 46,
-    16774: 46,
-    16773: 46,
-    16772: 46,
-    16771: 46,
-    16770: 46,
-    16769: 46,
-    16768: 46,
-    16767: 46,
-    16766: 46,
-    16765: 46,
-    16764: 46,
-    16763: 46,
-    16762: 46,
-    16761: 46,
-    16760: 47,
-    16759: 47,
-    16758: 47,
-    16757: 47,
-    16756: 47,
-    16755: 47,
-    16754: 47,
-    16753: 47,
-    16752: 47,
-    16751: 47,
-    16750: 47,
-    16749: 47,
-    16748: 47,
-    16747: 47,
-    16746: 47,
-    16745: 47,
-    16744: 47,
-    16743: 47,
-    16742: 47,
-    16741: 47,
-    16740: 47,
-    16739: 47,
-    16738: 47,
-    16737: 47,
-    16736: 47,
-    16735: 47,
-    16734: 47,
-    16733: 47,
-    16732: 47,
-    16731: 47,
-    16730: 47,
-    16729: 47,
-    16728: 47,
-    16727: 47,
-    16726: 47,
-    16725: 47,
-    16724: 47,
-    16723: 47,
-    16722: 47,
-    16721: 47,
-    16720: 47,
-    16719: 47,
-    16718: 47,
-    16717: 47,
-    16716: 47,
-    16715: 47,
-    16714: 47,
-    16713: 47,
-    16712: 47,
-    16711: 47,
-    16710: 47,
-    16709: 47,
-    16708: 47,
-    16707: 47,
-    16706: 47,
-    16705: 47,
-    16704: 47,
-    16703: 47,
-    16702: 47,
-    16701: 47,
-    16700: 47,
-    16699: 47,
-    16698: 47,
-    16697: 47,
-    16696: 47,
-    16695: 47,
-    16694: 47,
-    16693: 47,
-    16692: 47,
-    16691: 47,
-    16690: 47,
-    16689: 47,
-    16688: 47,
-    16687: 47,
-    16686: 47,
-    16685: 47,
-    16684: 47,
-    16683: 47,
-    16682: 47,
-    16681: 47,
-    16680: 47,
-    16679: 47,
-    16678: 47,
-    16677: 47,
-    16676: 47,
-    16675: 47,
-    16674: 47,
-    16673: 47,
-    16672: 47,
-    16671: 47,
-    16670: 47,
-    16669: 47,
-    16668: 47,
-    16667: 47,
-    16666: 47,
-    16665: 47,
-    16664: 47,
-    16663: 47,
-    16662: 47,
-    16661: 47,
-    16660: 47,
-    16659: 47,
-    16658: 47,
-    16657: 47,
-    16656: 47,
-    16655: 47,
-    16654: 47,
-    16653: 47,
-    16652: 47,
-    16651: 47,
-    16650: 47,
-    16649: 47,
-    16648: 47,
-    16647: 47,
-    16646: 47,
-    16645: 47,
-    16644: 47,
-    16643: 47,
-    16642: 47,
-    16641: 47,
-    16640: 48,
-    16639: 48,
-    16638: 48,
-    16637: 48,
-    16636: 48,
-    16635: 48,
-    16634: 48,
-    16633: 48,
-    16632: 48,
-    16631: 48,
-    16630: 48,
-    16629: 48,
-    16628: 48,
-    16627: 48,
-    16626: 48,
-    16625: 48,
-    16624: 48,
-    16623: 48,
-    16622: 48,
-    16621: 48,
-    16620: 48,
-    16619: 48,
-    16618: 48,
-    16617: 48,
-    16616: 48,
-    16615: 48,
-    16614: 48,
-    16613: 48,
-    16612: 48,
-    16611: 48,
-    16610: 48,
-    16609: 48,
-    16608: 48,
-    16607: 48,
-    16606: 48,
-    16605: 48,
-    16604: 48,
-    16603: 48,
-    16602: 48,
-    16601: 48,
-    16600: 48,
-    16599: 48,
-    16598: 48,
-    16597: 48,
-    16596: 48,
-    16595: 48,
-    16594: 48,
-    16593: 48,
-    16592: 48,
-    16591: 48,
-    16590: 48,
-    16589: 48,
-    16588: 48,
-    16587: 48,
-    16586: 48,
-    16585: 48,
-    16584: 48,
-    16583: 48,
-    16582: 48,
-    16581: 48,
-    16580: 48,
-    16579: 48,
-    16578: 48,
-    16577: 48,
-    16576: 48,
-    16575: 48,
-    16574: 48,
-    16573: 48,
-    16572: 48,
-    16571: 48,
-    16570: 48,
-    16569: 48,
-    16568: 48,
-    16567: 48,
-    16566: 48,
-    16565: 48,
-    16564: 48,
-    16563: 48,
-    16562: 48,
-    16561: 48,
-    16560: 48,
-    16559: 48,
-    16558: 48,
-    16557: 48,
-    16556: 48,
-    16555: 48,
-    16554: 48,
-    16553: 48,
-    16552: 48,
-    16551: 48,
-    16550: 48,
-    16549: 48,
-    16548: 48,
-    16547: 48,
-    16546: 48,
-    16545: 48,
-    16544: 48,
-    16543: 48,
-    16542: 48,
-    16541: 48,
-    16540: 48,
-    16539: 48,
-    16538: 48,
-    16537: 48,
-    16536: 48,
-    16535: 48,
-    16534: 48,
-    16533: 48,
-    16532: 48,
-    16531: 48,
-    16530: 48,
-    16529: 48,
-    16528: 48,
-    16527: 48,
-    16526: 48,
-    16525: 48,
-    16524: 48,
-    16523: 48,
-    16522: 48,
-    16521: 48,
-    16520: 49,
-    16519: 49,
-    16518: 49,
-    16517: 49,
-    16516: 49,
-    16515: 49,
-    16514: 49,
-    16513: 49,
-    16512: 49,
-    16511: 49,
-    16510: 49,
-    16509: 49,
-    16508: 49,
-    16507: 49,
-    16506: 49,
-    16505: 49,
-    16504: 49,
-    16503: 49,
-    16502: 49,
-    16501: 49,
-    16500: 49,
-    16499: 49,
-    16498: 49,
-    16497: 49,
-    16496: 49,
-    16495: 49,
-    16494: 49,
-    16493: 49,
-    16492: 49,
-    16491: 49,
-    16490: 49,
-    16489: 49,
-    16488: 49,
-    16487: 49,
-    16486: 49,
-    16485: 49,
-    16484: 49,
-    16483: 49,
-    16482: 49,
-    16481: 49,
-    16480: 49,
-    16479: 49,
-    16478: 49,
-    16477: 49,
-    16476: 49,
-    16475: 49,
-    16474: 49,
-    16473: 49,
-    16472: 49,
-    16471: 49,
-    16470: 49,
-    16469: 49,
-    16468: 49,
-    16467: 49,
-    16466: 49,
-    16465: 49,
-    16464: 49,
-    16463: 49,
-    16462: 49,
-    16461: 49,
-    16460: 49,
-    16459: 49,
-    16458: 49,
-    16457: 49,
-    16456: 49,
-    16455: 49,
-    16454: 49,
-    16453: 49,
-    16452: 49,
-    16451: 49,
-    16450: 49,
-    16449: 49,
-    16448: 49,
-    16447: 49,
-    16446: 49,
-    16445: 49,
-    16444: 49,
-    16443: 49,
-    16442: 49,
-    16441: 49,
-    16440: 49,
-    16439: 49,
-    16438: 49,
-    16437: 49,
-    16436: 49,
-    16435: 49,
-    16434: 49,
-    16433: 49,
-    16432: 49,
-    16431: 49,
-    16430: 49,
-    16429: 49,
-    16428: 49,
-    16427: 49,
-    16426: 49,
-    16425: 49,
-    16424: 49,
-    16423: 49,
-    16422: 49,
-    16421: 49,
-    16420: 49,
-    16419: 49,
-    16418: 49,
-    16417: 49,
-    16416: 49,
-    16415: 49,
-    16414: 49,
-    16413: 49,
-    16412: 49,
-    16411: 49,
-    16410: 50,
-    16409: 50,
-    16408: 50,
-    16407: 50,
-    16406: 50,
-    16405: 50,
-    16404: 50,
-    16403: 50,
-    16402: 50,
-    16401: 50,
-    16400: 50,
-    16399: 50,
-    16398: 50,
-    16397: 50,
-    16396: 50,
-    16395: 50,
-    16394: 50,
-    16393: 50,
-    16392: 50,
-    16391: 50,
-    16390: 50,
-    16389: 50,
-    16388: 50,
-    16387: 50,
-    16386: 50,
-    16385: 50,
-    16384: 50,
-    16383: 50,
-    16382: 50,
-    16381: 50,
-    16380: 50,
-    16379: 50,
-    16378: 50,
-    16377: 50,
-    16376: 50,
-    16375: 50,
-    16374: 50,
-    16373: 50,
-    16372: 50,
-    16371: 50,
-    16370: 50,
-    16369: 50,
-    16368: 50,
-    16367: 50,
-    16366: 50,
-    16365: 50,
-    16364: 50,
-    16363: 50,
-    16362: 50,
-    16361: 50,
-    16360: 50,
-    16359: 50,
-    16358: 50,
-    16357: 50,
-    16356: 50,
-    16355: 50,
-    16354: 50,
-    16353: 50,
-    16352: 50,
-    16351: 50,
-    16350: 50,
-    16349: 50,
-    16348: 50,
-    16347: 50,
-    16346: 50,
-    16345: 50,
-    16344: 50,
-    16343: 50,
-    16342: 50,
-    16341: 50,
-    16340: 50,
-    16339: 50,
-    16338: 50,
-    16337: 50,
-    16336: 50,
-    16335: 50,
-    16334: 50,
-    16333: 50,
-    16332: 50,
-    16331: 50,
-    16330: 50,
-    16329: 50,
-    16328: 50,
-    16327: 50,
-    16326: 50,
-    16325: 50,
-    16324: 50,
-    16323: 50,
-    16322: 50,
-    16321: 50,
-    16320: 50,
-    16319: 50,
-    16318: 50,
-    16317: 50,
-    16316: 50,
-    16315: 50,
-    16314: 50,
-    16313: 50,
-    16312: 50,
-    16311: 50,
-    16310: 50,
-    16309: 50,
-    16308: 50,
-    16307: 50,
-    16306: 50,
-    16305: 50,
-    16304: 50,
-    16303: 50,
-    16302: 50,
-    16301: 50,
-    16300: 51,
-    16299: 51,
-    16298: 51,
-    16297: 51,
-    16296: 51,
-    16295: 51,
-    16294: 51,
-    16293: 51,
-    16292: 51,
-    16291: 51,
-    16290: 51,
-    16289: 51,
-    16288: 51,
-    16287: 51,
-    16286: 51,
-    16285: 51,
-    16284: 51,
-    16283: 51,
-    16282: 51,
-    16281: 51,
-    16280: 51,
-    16279: 51,
-    16278: 51,
-    16277: 51,
-    16276: 51,
-    16275: 51,
-    16274: 51,
-    16273: 51,
-    16272: 51,
-    16271: 51,
-    16270: 51,
-    16269: 51,
-    16268: 51,
-    16267: 51,
-    16266: 51,
-    16265: 51,
-    16264: 51,
-    16263: 51,
-    16262: 51,
-    16261: 51,
-    16260: 51,
-    16259: 51,
-    16258: 51,
-    16257: 51,
-    16256: 51,
-    16255: 51,
-    16254: 51,
-    16253: 51,
-    16252: 51,
-    16251: 51,
-    16250: 51,
-    16249: 51,
-    16248: 51,
-    16247: 51,
-    16246: 51,
-    16245: 51,
-    16244: 51,
-    16243: 51,
-    16242: 51,
-    16241: 51,
-    16240: 51,
-    16239: 51,
-    16238: 51,
-    16237: 51,
-    16236: 51,
-    16235: 51,
-    16234: 51,
-    16233: 51,
-    16232: 51,
-    16231: 51,
-    16230: 51,
-    16229: 51,
-    16228: 51,
-    16227: 51,
-    16226: 51,
-    16225: 51,
-    16224: 51,
-    16223: 51,
-    16222: 51,
-    16221: 51,
-    16220: 51,
-    16219: 51,
-    16218: 51,
-    16217: 51,
-    16216: 51,
-    16215: 51,
-    16214: 51,
-    16213: 51,
-    16212: 51,
-    16211: 51,
-    16210: 51,
-    16209: 51,
-    16208: 51,
-    16207: 51,
-    16206: 51,
-    16205: 51,
-    16204: 51,
-    16203: 51,
-    16202: 51,
-    16201: 51,
-    16200: 51,
-    16199: 51,
-    16198: 51,
-    16197: 51,
-    16196: 51,
-    16195: 51,
-    16194: 51,
-    16193: 51,
-    16192: 51,
-    16191: 51,
-    16190: 52,
-    16189: 52,
-    16188: 52,
-    16187: 52,
-    16186: 52,
-    16185: 52,
-    16184: 52,
-    16183: 52,
-    16182: 52,
-    16181: 52,
-    16180: 52,
-    16179: 52,
-    16178: 52,
-    16177: 52,
-    16176: 52,
-    16175: 52,
-    16174: 52,
-    16173: 52,
-    16172: 52,
-    16171: 52,
-    16170: 52,
-    16169: 52,
-    16168: 52,
-    16167: 52,
-    16166: 52,
-    16165: 52,
-    16164: 52,
-    16163: 52,
-    16162: 52,
-    16161: 52,
-    16160: 52,
-    16159: 52,
-    16158: 52,
-    16157: 52,
-    16156: 52,
-    16155: 52,
-    16154: 52,
-    16153: 52,
-    16152: 52,
-    16151: 52,
-    16150: 52,
-    16149: 52,
-    16148: 52,
-    16147: 52,
-    16146: 52,
-    16145: 52,
-    16144: 52,
-    16143: 52,
-    16142: 52,
-    16141: 52,
-    16140: 52,
-    16139: 52,
-    16138: 52,
-    16137: 52,
-    16136: 52,
-    16135: 52,
-    16134: 52,
-    16133: 52,
-    16132: 52,
-    16131: 52,
-    16130: 52,
-    16129: 52,
-    16128: 52,
-    16127: 52,
-    16126: 52,
-    16125: 52,
-    16124: 52,
-    16123: 52,
-    16122: 52,
-    16121: 52,
-    16120: 52,
-    16119: 52,
-    16118: 52,
-    16117: 52,
-    16116: 52,
-    16115: 52,
-    16114: 52,
-    16113: 52,
-    16112: 52,
-    16111: 52,
-    16110: 52,
-    16109: 52,
-    16108: 52,
-    16107: 52,
-    16106: 52,
-    16105: 52,
-    16104: 52,
-    16103: 52,
-    16102: 52,
-    16101: 52,
-    16100: 52,
-    16099: 52,
-    16098: 52,
-    16097: 52,
-    16096: 52,
-    16095: 52,
-    16094: 52,
-    16093: 52,
-    16092: 52,
-    16091: 52,
-    16090: 52,
-    16089: 52,
-    16088: 52,
-    16087: 52,
-    16086: 52,
-    16085: 52,
-    16084: 52,
-    16083: 52,
-    16082: 52,
-    16081: 52,
-    16080: 53,
-    16079: 53,
-    16078: 53,
-    16077: 53,
-    16076: 53,
-    16075: 53,
-    16074: 53,
-    16073: 53,
-    16072: 53,
-    16071: 53,
-    16070: 53,
-    16069: 53,
-    16068: 53,
-    16067: 53,
-    16066: 53,
-    16065: 53,
-    16064: 53,
-    16063: 53,
-    16062: 53,
-    16061: 53,
-    16060: 53,
-    16059: 53,
-    16058: 53,
-    16057: 53,
-    16056: 53,
-    16055: 53,
-    16054: 53,
-    16053: 53,
-    16052: 53,
-    16051: 53,
-    16050: 53,
-    16049: 53,
-    16048: 53,
-    16047: 53,
-    16046: 53,
-    16045: 53,
-    16044: 53,
-    16043: 53,
-    16042: 53,
-    16041: 53,
-    16040: 53,
-    16039: 53,
-    16038: 53,
-    16037: 53,
-    16036: 53,
-    16035: 53,
-    16034: 53,
-    16033: 53,
-    16032: 53,
-    16031: 53,
-    16030: 53,
-    16029: 53,
-    16028: 53,
-    16027: 53,
-    16026: 53,
-    16025: 53,
-    16024: 53,
-    16023: 53,
-    16022: 53,
-    16021: 53,
-    16020: 53,
-    16019: 53,
-    16018: 53,
-    16017: 53,
-    16016: 53,
-    16015: 53,
-    16014: 53,
-    16013: 53,
-    16012: 53,
-    16011: 53,
-    16010: 53,
-    16009: 53,
-    16008: 53,
-    16007: 53,
-    16006: 53,
-    16005: 53,
-    16004: 53,
-    16003: 53,
-    16002: 53,
-    16001: 53,
-    16000: 53,
-    15999: 53,
-    15998: 53,
-    15997: 53,
-    15996: 53,
-    15995: 53,
-    15994: 53,
-    15993: 53,
-    15992: 53,
-    15991: 53,
-    15990: 53,
-    15989: 53,
-    15988: 53,
-    15987: 53,
-    15986: 53,
-    15985: 53,
-    15984: 53,
-    15983: 53,
-    15982: 53,
-    15981: 53,
-    15980: 53,
-    15979: 53,
-    15978: 53,
-    15977: 53,
-    15976: 53,
-    15975: 53,
-    15974: 53,
-    15973: 53,
-    15972: 53,
-    15971: 53,
-    15970: 54,
-    15969: 54,
-    15968: 54,
-    15967: 54,
-    15966: 54,
-    15965: 54,
-    15964: 54,
-    15963: 54,
-    15962: 54,
-    15961: 54,
-    15960: 54,
-    15959: 54,
-    15958: 54,
-    15957: 54,
-    15956: 54,
-    15955: 54,
-    15954: 54,
-    15953: 54,
-    15952: 54,
-    15951: 54,
-    15950: 54,
-    15949: 54,
-    15948: 54,
-    15947: 54,
-    15946: 54,
-    15945: 54,
-    15944: 54,
-    15943: 54,
-    15942: 54,
-    15941: 54,
-    15940: 54,
-    15939: 54,
-    15938: 54,
-    15937: 54,
-    15936: 54,
-    15935: 54,
-    15934: 54,
-    15933: 54,
-    15932: 54,
-    15931: 54,
-    15930: 54,
-    15929: 54,
-    15928: 54,
-    15927: 54,
-    15926: 54,
-    15925: 54,
-    15924: 54,
-    15923: 54,
-    15922: 54,
-    15921: 54,
-    15920: 54,
-    15919: 54,
-    15918: 54,
-    15917: 54,
-    15916: 54,
-    15915: 54,
-    15914: 54,
-    15913: 54,
-    15912: 54,
-    15911: 54,
-    15910: 54,
-    15909: 54,
-    15908: 54,
-    15907: 54,
-    15906: 54,
-    15905: 54,
-    15904: 54,
-    15903: 54,
-    15902: 54,
-    15901: 54,
-    15900: 54,
-    15899: 54,
-    15898: 54,
-    15897: 54,
-    15896: 54,
-    15895: 54,
-    15894: 54,
-    15893: 54,
-    15892: 54,
-    15891: 54,
-    15890: 54,
-    15889: 54,
-    15888: 54,
-    15887: 54,
-    15886: 54,
-    15885: 54,
-    15884: 54,
-    15883: 54,
-    15882: 54,
-    15881: 54,
-    15880: 54,
-    15879: 54,
-    15878: 54,
-    15877: 54,
-    15876: 54,
-    15875: 54,
-    15874: 54,
-    15873: 54,
-    15872: 54,
-    15871: 54,
-    15870: 55,
-    15869: 55,
-    15868: 55,
-    15867: 55,
-    15866: 55,
-    15865: 55,
-    15864: 55,
-    15863: 55,
-    15862: 55,
-    15861: 55,
-    15860: 55,
-    15859: 55,
-    15858: 55,
-    15857: 55,
-    15856: 55,
-    15855: 55,
-    15854: 55,
-    15853: 55,
-    15852: 55,
-    15851: 55,
-    15850: 55,
-    15849: 55,
-    15848: 55,
-    15847: 55,
-    15846: 55,
-    15845: 55,
-    15844: 55,
-    15843: 55,
-    15842: 55,
-    15841: 55,
-    15840: 55,
-    15839: 55,
-    15838: 55,
-    15837: 55,
-    15836: 55,
-    15835: 55,
-    15834: 55,
-    15833: 55,
-    15832: 55,
-    15831: 55,
-    15830: 55,
-    15829: 55,
-    15828: 55,
-    15827: 55,
-    15826: 55,
-    15825: 55,
-    15824: 55,
-    15823: 55,
-    15822: 55,
-    15821: 55,
-    15820: 55,
-    15819: 55,
-    15818: 55,
-    15817: 55,
-    15816: 55,
-    15815: 55,
-    15814: 55,
-    15813: 55,
-    15812: 55,
-    15811: 55,
-    15810: 55,
-    15809: 55,
-    15808: 55,
-    15807: 55,
-    15806: 55,
-    15805: 55,
-    15804: 55,
-    15803: 55,
-    15802: 55,
-    15801: 55,
-    15800: 55,
-    15799: 55,
-    15798: 55,
-    15797: 55,
-    15796: 55,
-    15795: 55,
-    15794: 55,
-    15793: 55,
-    15792: 55,
-    15791: 55,
-    15790: 55,
-    15789: 55,
-    15788: 55,
-    15787: 55,
-    15786: 55,
-    15785: 55,
-    15784: 55,
-    15783: 55,
-    15782: 55,
-    15781: 55,
-    15780: 56,
-    15779: 56,
-    15778: 56,
-    15777: 56,
-    15776: 56,
-    15775: 56,
-    15774: 56,
-    15773: 56,
-    15772: 56,
-    15771: 56,
-    15770: 56,
-    15769: 56,
-    15768: 56,
-    15767: 56,
-    15766: 56,
-    15765: 56,
-    15764: 56,
-    15763: 56,
-    15762: 56,
-    15761: 56,
-    15760: 56,
-    15759: 56,
-    15758: 56,
-    15757: 56,
-    15756: 56,
-    15755: 56,
-    15754: 56,
-    15753: 56,
-    15752: 56,
-    15751: 56,
-    15750: 56,
-    15749: 56,
-    15748: 56,
-    15747: 56,
-    15746: 56,
-    15745: 56,
-    15744: 56,
-    15743: 56,
-    15742: 56,
-    15741: 56,
-    15740: 56,
-    15739: 56,
-    15738: 56,
-    15737: 56,
-    15736: 56,
-    15735: 56,
-    15734: 56,
-    15733: 56,
-    15732: 56,
-    15731: 56,
-    15730: 56,
-    15729: 56,
-    15728: 56,
-    15727: 56,
-    15726: 56,
-    15725: 56,
-    15724: 56,
-    15723: 56,
-    15722: 56,
-    15721: 56,
-    15720: 56,
-    15719: 56,
-    15718: 56,
-    15717: 56,
-    15716: 56,
-    15715: 56,
-    15714: 56,
-    15713: 56,
-    15712: 56,
-    15711: 56,
-    15710: 56,
-    15709: 56,
-    15708: 56,
-    15707: 56,
-    15706: 56,
-    15705: 56,
-    15704: 56,
-    15703: 56,
-    15702: 56,
-    15701: 56,
-    15700: 56,
-    15699: 56,
-    15698: 56,
-    15697: 56,
-    15696: 56,
-    15695: 56,
-    15694: 56,
-    15693: 56,
-    15692: 56,
-    15691: 56,
-    15690: 57,
-    15689: 57,
-    15688: 57,
-    15687: 57,
-    15686: 57,
-    15685: 57,
-    15684: 57,
-    15683: 57,
-    15682: 57,
-    15681: 57,
-    15680: 57,
-    15679: 57,
-    15678: 57,
-    15677: 57,
-    15676: 57,
-    15675: 57,
-    15674: 57,
-    15673: 57,
-    15672: 57,
-    15671: 57,
-    15670: 57,
-    15669: 57,
-    15668: 57,
-    15667: 57,
-    15666: 57,
-    15665: 57,
-    15664: 57,
-    15663: 57,
-    15662: 57,
-    15661: 57,
-    15660: 57,
-    15659: 57,
-    15658: 57,
-    15657: 57,
-    15656: 57,
-    15655: 57,
-    15654: 57,
-    15653: 57,
-    15652: 57,
-    15651: 57,
-    15650: 57,
-    15649: 57,
-    15648: 57,
-    15647: 57,
-    15646: 57,
-    15645: 57,
-    15644: 57,
-    15643: 57,
-    15642: 57,
-    15641: 57,
-    15640: 57,
-    15639: 57,
-    15638: 57,
-    15637: 57,
-    15636: 57,
-    15635: 57,
-    15634: 57,
-    15633: 57,
-    15632: 57,
-    15631: 57,
-    15630: 57,
-    15629: 57,
-    15628: 57,
-    15627: 57,
-    15626: 57,
-    15625: 57,
-    15624: 57,
-    15623: 57,
-    15622: 57,
-    15621: 57,
-    15620: 57,
-    15619: 57,
-    15618: 57,
-    15617: 57,
-    15616: 57,
-    15615: 57,
-    15614: 57,
-    15613: 57,
-    15612: 57,
-    15611: 57,
-    15610: 57,
-    15609: 57,
-    15608: 57,
-    15607: 57,
-    15606: 57,
-    15605: 57,
-    15604: 57,
-    15603: 57,
-    15602: 57,
-    15601: 57,
-    15600: 58,
-    15599: 58,
-    15598: 58,
-    15597: 58,
-    15596: 58,
-    15595: 58,
-    15594: 58,
-    15593: 58,
-    15592: 58,
-    15591: 58,
-    15590: 58,
-    15589: 58,
-    15588: 58,
-    15587: 58,
-    15586: 58,
-    15585: 58,
-    15584: 58,
-    15583: 58,
-    15582: 58,
-    15581: 58,
-    15580: 58,
-    15579: 58,
-    15578: 58,
-    15577: 58,
-    15576: 58,
-    15575: 58,
-    15574: 58,
-    15573: 58,
-    15572: 58,
-    15571: 58,
-    15570: 58,
-    15569: 58,
-    15568: 58,
-    15567: 58,
-    15566: 58,
-    15565: 58,
-    15564: 58,
-    15563: 58,
-    15562: 58,
-    15561: 58,
-    15560: 58,
-    15559: 58,
-    15558: 58,
-    15557: 58,
-    15556: 58,
-    15555: 58,
-    15554: 58,
-    15553: 58,
-    15552: 58,
-    15551: 58,
-    15550: 58,
-    15549: 58,
-    15548: 58,
-    15547: 58,
-    15546: 58,
-    15545: 58,
-    15544: 58,
-    15543: 58,
-    15542: 58,
-    15541: 58,
-    15540: 58,
-    15539: 58,
-    15538: 58,
-    15537: 58,
-    15536: 58,
-    15535: 58,
-    15534: 58,
-    15533: 58,
-    15532: 58,
-    15531: 58,
-    15530: 58,
-    15529: 58,
-    15528: 58,
-    15527: 58,
-    15526: 58,
-    15525: 58,
-    15524: 58,
-    15523: 58,
-    15522: 58,
-    15521: 58,
-    15520: 58,
-    15519: 58,
-    15518: 58,
-    15517: 58,
-    15516: 58,
-    15515: 58,
-    15514: 58,
-    15513: 58,
-    15512: 58,
-    15511: 58,
-    15510: 59,
-    15509: 59,
-    15508: 59,
-    15507: 59,
-    15506: 59,
-    15505: 59,
-    15504: 59,
-    15503: 59,
-    15502: 59,
-    15501: 59,
-    15500: 59,
-    15499: 59,
-    15498: 59,
-    15497: 59,
-    15496: 59,
-    15495: 59,
-    15494: 59,
-    15493: 59,
-    15492: 59,
-    15491: 59,
-    15490: 59,
-    15489: 59,
-    15488: 59,
-    15487: 59,
-    15486: 59,
-    15485: 59,
-    15484: 59,
-    15483: 59,
-    15482: 59,
-    15481: 59,
-    15480: 59,
-    15479: 59,
-    15478: 59,
-    15477: 59,
-    15476: 59,
-    15475: 59,
-    15474: 59,
-    15473: 59,
-    15472: 59,
-    15471: 59,
-    15470: 59,
-    15469: 59,
-    15468: 59,
-    15467: 59,
-    15466: 59,
-    15465: 59,
-    15464: 59,
-    15463: 59,
-    15462: 59,
-    15461: 59,
-    15460: 59,
-    15459: 59,
-    15458: 59,
-    15457: 59,
-    15456: 59,
-    15455: 59,
-    15454: 59,
-    15453: 59,
-    15452: 59,
-    15451: 59,
-    15450: 59,
-    15449: 59,
-    15448: 59,
-    15447: 59,
-    15446: 59,
-    15445: 59,
-    15444: 59,
-    15443: 59,
-    15442: 59,
-    15441: 59,
-    15440: 59,
-    15439: 59,
-    15438: 59,
-    15437: 59,
-    15436: 59,
-    15435: 59,
-    15434: 59,
-    15433: 59,
-    15432: 59,
-    15431: 59,
-    15430: 59,
-    15429: 59,
-    15428: 59,
-    15427: 59,
-    15426: 59,
-    15425: 59,
-    15424: 59,
-    15423: 59,
-    15422: 59,
-    15421: 59,
-    15420: 60,
-    15419: 60,
-    15418: 60,
-    15417: 60,
-    15416: 60,
-    15415: 60,
-    15414: 60,
-    15413: 60,
-    15412: 60,
-    15411: 60,
-    15410: 60,
-    15409: 60,
-    15408: 60,
-    15407: 60,
-    15406: 60,
-    15405: 60,
-    15404: 60,
-    15403: 60,
-    15402: 60,
-    15401: 60,
-    15400: 60,
-    15399: 60,
-    15398: 60,
-    15397: 60,
-    15396: 60,
-    15395: 60,
-    15394: 60,
-    15393: 60,
-    15392: 60,
-    15391: 60,
-    15390: 60,
-    15389: 60,
-    15388: 60,
-    15387: 60,
-    15386: 60,
-    15385: 60,
-    15384: 60,
-    15383: 60,
-    15382: 60,
-    15381: 60,
-    15380: 60,
-    15379: 60,
-    15378: 60,
-    15377: 60,
-    15376: 60,
-    15375: 60,
-    15374: 60,
-    15373: 60,
-    15372: 60,
-    15371: 60,
-    15370: 60,
-    15369: 60,
-    15368: 60,
-    15367: 60,
-    15366: 60,
-    15365: 60,
-    15364: 60,
-    15363: 60,
-    15362: 60,
-    15361: 60,
-    15360: 60,
-    15359: 60,
-    15358: 60,
-    15357: 60,
-    15356: 60,
-    15355: 60,
-    15354: 60,
-    15353: 60,
-    15352: 60,
-    15351: 60,
-    15350: 60,
-    15349: 60,
-    15348: 60,
-    15347: 60,
-    15346: 60,
-    15345: 60,
-    15344: 60,
-    15343: 60,
-    15342: 60,
-    15341: 60,
-    15340: 60,
-    15339: 60,
-    15338: 60,
-    15337: 60,
-    15336: 60,
-    15335: 60,
-    15334: 60,
-    15333: 60,
-    15332: 60,
-    15331: 60,
-    15330: 61,
-    15329: 61,
-    15328: 61,
-    15327: 61,
-    15326: 61,
-    15325: 61,
-    15324: 61,
-    15323: 61,
-    15322: 61,
-    15321: 61,
-    15320: 61,
-    15319: 61,
-    15318: 61,
-    15317: 61,
-    15316: 61,
-    15315: 61,
-    15314: 61,
-    15313: 61,
-    15312: 61,
-    15311: 61,
-    15310: 61,
-    15309: 61,
-    15308: 61,
-    15307: 61,
-    15306: 61,
-    15305: 61,
-    15304: 61,
-    15303: 61,
-    15302: 61,
-    15301: 61,
-    15300: 61,
-    15299: 61,
-    15298: 61,
-    15297: 61,
-    15296: 61,
-    15295: 61,
-    15294: 61,
-    15293: 61,
-    15292: 61,
-    15291: 61,
-    15290: 61,
-    15289: 61,
-    15288: 61,
-    15287: 61,
-    15286: 61,
-    15285: 61,
-    15284: 61,
-    15283: 61,
-    15282: 61,
-    15281: 61,
-    15280: 61,
-    15279: 61,
-    15278: 61,
-    15277: 61,
-    15276: 61,
-    15275: 61,
-    15274: 61,
-    15273: 61,
-    15272: 61,
-    15271: 61,
-    15270: 61,
-    15269: 61,
-    15268: 61,
-    15267: 61,
-    15266: 61,
-    15265: 61,
-    15264: 61,
-    15263: 61,
-    15262: 61,
-    15261: 61,
-    15260: 61,
-    15259: 61,
-    15258: 61,
-    15257: 61,
-    15256: 61,
-    15255: 61,
-    15254: 61,
-    15253: 61,
-    15252: 61,
-    15251: 61,
-    15250: 61,
-    15249: 61,
-    15248: 61,
-    15247: 61,
-    15246: 61,
-    15245: 61,
-    15244: 61,
-    15243: 61,
-    15242: 61,
-    15241: 61,
-    15240: 62,
-    15239: 62,
-    15238: 62,
-    15237: 62,
-    15236: 62,
-    15235: 62,
-    15234: 62,
-    15233: 62,
-    15232: 62,
-    15231: 62,
-    15230: 62,
-    15229: 62,
-    15228: 62,
-    15227: 62,
-    15226: 62,
-    15225: 62,
-    15224: 62,
-    15223: 62,
-    15222: 62,
-    15221: 62,
-    15220: 62,
-    15219: 62,
-    15218: 62,
-    15217: 62,
-    15216: 62,
-    15215: 62,
-    15214: 62,
-    15213: 62,
-    15212: 62,
-    15211: 62,
-    15210: 62,
-    15209: 62,
-    15208: 62,
-    15207: 62,
-    15206: 62,
-    15205: 62,
-    15204: 62,
-    15203: 62,
-    15202: 62,
-    15201: 62,
-    15200: 62,
-    15199: 62,
-    15198: 62,
-    15197: 62,
-    15196: 62,
-    15195: 62,
-    15194: 62,
-    15193: 62,
-    15192: 62,
-    15191: 62,
-    15190: 62,
-    15189: 62,
-    15188: 62,
-    15187: 62,
-    15186: 62,
-    15185: 62,
-    15184: 62,
-    15183: 62,
-    15182: 62,
-    15181: 62,
-    15180: 62,
-    15179: 62,
-    15178: 62,
-    15177: 62,
-    15176: 62,
-    15175: 62,
-    15174: 62,
-    15173: 62,
-    15172: 62,
-    15171: 62,
-    15170: 62,
-    15169: 62,
-    15168: 62,
-    15167: 62,
-    15166: 62,
-    15165: 62,
-    15164: 62,
-    15163: 62,
-    15162: 62,
-    15161: 62,
-    15160: 62,
-    15159: 62,
-    15158: 62,
-    15157: 62,
-    15156: 62,
-    15155: 62,
-    15154: 62,
-    15153: 62,
-    15152: 62,
-    15151: 62,
-    15150: 63,
-    15149: 63,
-    15148: 63,
-    15147: 63,
-    15146: 63,
-    15145: 63,
-    15144: 63,
-    15143: 63,
-    15142: 63,
-    15141: 63,
-    15140: 63,
-    15139: 63,
-    15138: 63,
-    15137: 63,
-    15136: 63,
-    15135: 63,
-    15134: 63,
-    15133: 63,
-    15132: 63,
-    15131: 63,
-    15130: 63,
-    15129: 63,
-    15128: 63,
-    15127: 63,
-    15126: 63,
-    15125: 63,
-    15124: 63,
-    15123: 63,
-    15122: 63,
-    15121: 63,
-    15120: 63,
-    15119: 63,
-    15118: 63,
-    15117: 63,
-    15116: 63,
-    15115: 63,
-    15114: 63,
-    15113: 63,
-    15112: 63,
-    15111: 63,
-    15110: 63,
-    15109: 63,
-    15108: 63,
-    15107: 63,
-    15106: 63,
-    15105: 63,
-    15104: 63,
-    15103: 63,
-    15102: 63,
-    15101: 63,
-    15100: 63,
-    15099: 63,
-    15098: 63,
-    15097: 63,
-    15096: 63,
-    15095: 63,
-    15094: 63,
-    15093: 63,
-    15092: 63,
-    15091: 63,
-    15090: 63,
-    15089: 63,
-    15088: 63,
-    15087: 63,
-    15086: 63,
-    15085: 63,
-    15084: 63,
-    15083: 63,
-    15082: 63,
-    15081: 63,
-    15080: 63,
-    15079: 63,
-    15078: 63,
-    15077: 63,
-    15076: 63,
-    15075: 63,
-    15074: 63,
-    15073: 63,
-    15072: 63,
-    15071: 63,
-    15070: 63,
-    15069: 63,
-    15068: 63,
-    15067: 63,
-    15066: 63,
-    15065: 63,
-    15064: 63,
-    15063: 63,
-    15062: 63,
-    15061: 63,
-    15060: 64,
-    15059: 64,
-    15058: 64,
-    15057: 64,
-    15056: 64,
-    15055: 64,
-    15054: 64,
-    15053: 64,
-    15052: 64,
-    15051: 64,
-    15050: 64,
-    15049: 64,
-    15048: 64,
-    15047: 64,
-    15046: 64,
-    15045: 64,
-    15044: 64,
-    15043: 64,
-    15042: 64,
-    15041: 64,
-    15040: 64,
-    15039: 64,
-    15038: 64,
-    15037: 64,
-    15036: 64,
-    15035: 64,
-    15034: 64,
-    15033: 64,
-    15032: 64,
-    15031: 64,
-    15030: 64,
-    15029: 64,
-    15028: 64,
-    15027: 64,
-    15026: 64,
-    15025: 64,
-    15024: 64,
-    15023: 64,
-    15022: 64,
-    15021: 64,
-    15020: 64,
-    15019: 64,
-    15018: 64,
-    15017: 64,
-    15016: 64,
-    15015: 64,
-    15014: 64,
-    15013: 64,
-    15012: 64,
-    15011: 64,
-    15010: 64,
-    15009: 64,
-    15008: 64,
-    15007: 64,
-    15006: 64,
-    15005: 64,
-    15004: 64,
-    15003: 64,
-    15002: 64,
-    15001: 64,
-    15000: 64,
-    14999: 64,
-    14998: 64,
-    14997: 64,
-    14996: 64,
-    14995: 64,
-    14994: 64,
-    14993: 64,
-    14992: 64,
-    14991: 64,
-    14990: 64,
-    14989: 64,
-    14988: 64,
-    14987: 64,
-    14986: 64,
-    14985: 64,
-    14984: 64,
-    14983: 64,
-    14982: 64,
-    14981: 64,
-    14980: 64,
-    14979: 64,
-    14978: 64,
-    14977: 64,
-    14976: 64,
-    14975: 64,
-    14974: 64,
-    14973: 64,
-    14972: 64,
-    14971: 64,
-    14970: 65,
-    14969: 65,
-    14968: 65,
-    14967: 65,
-    14966: 65,
-    14965: 65,
-    14964: 65,
-    14963: 65,
-    14962: 65,
-    14961: 65,
-    14960: 65,
-    14959: 65,
-    14958: 65,
-    14957: 65,
-    14956: 65,
-    14955: 65,
-    14954: 65,
-    14953: 65,
-    14952: 65,
-    14951: 65,
-    14950: 65,
-    14949: 65,
-    14948: 65,
-    14947: 65,
-    14946: 65,
-    14945: 65,
-    14944: 65,
-    14943: 65,
-    14942: 65,
-    14941: 65,
-    14940: 65,
-    14939: 65,
-    14938: 65,
-    14937: 65,
-    14936: 65,
-    14935: 65,
-    14934: 65,
-    14933: 65,
-    14932: 65,
-    14931: 65,
-    14930: 65,
-    14929: 65,
-    14928: 65,
-    14927: 65,
-    14926: 65,
-    14925: 65,
-    14924: 65,
-    14923: 65,
-    14922: 65,
-    14921: 65,
-    14920: 65,
-    14919: 65,
-    14918: 65,
-    14917: 65,
-    14916: 65,
-    14915: 65,
-    14914: 65,
-    14913: 65,
-    14912: 65,
-    14911: 65,
-    14910: 65,
-    14909: 65,
-    14908: 65,
-    14907: 65,
-    14906: 65,
-    14905: 65,
-    14904: 65,
-    14903: 65,
-    14902: 65,
-    14901: 65,
-    14900: 65,
-    14899: 65,
-    14898: 65,
-    14897: 65,
-    14896: 65,
-    14895: 65,
-    14894: 65,
-    14893: 65,
-    14892: 65,
-    14891: 65,
-    14890: 66,
-    14889: 66,
-    14888: 66,
-    14887: 66,
-    14886: 66,
-    14885: 66,
-    14884: 66,
-    14883: 66,
-    14882: 66,
-    14881: 66,
-    14880: 66,
-    14879: 66,
-    14878: 66,
-    14877: 66,
-    14876: 66,
-    14875: 66,
-    14874: 66,
-    14873: 66,
-    14872: 66,
-    14871: 66,
-    14870: 66,
-    14869: 66,
-    14868: 66,
-    14867: 66,
-    14866: 66,
-    14865: 66,
-    14864: 66,
-    14863: 66,
-    14862: 66,
-    14861: 66,
-    14860: 66,
-    14859: 66,
-    14858: 66,
-    14857: 66,
-    14856: 66,
-    14855: 66,
-    14854: 66,
-    14853: 66,
-    14852: 66,
-    14851: 66,
-    14850: 66,
-    14849: 66,
-    14848: 66,
-    14847: 66,
-    14846: 66,
-    14845: 66,
-    14844: 66,
-    14843: 66,
-    14842: 66,
-    14841: 66,
-    14840: 66,
-    14839: 66,
-    14838: 66,
-    14837: 66,
-    14836: 66,
-    14835: 66,
-    14834: 66,
-    14833: 66,
-    14832: 66,
-    14831: 66,
-    14830: 66,
-    14829: 66,
-    14828: 66,
-    14827: 66,
-    14826: 66,
-    14825: 66,
-    14824: 66,
-    14823: 66,
-    14822: 66,
-    14821: 66,
-    14820: 66,
-    14819: 66,
-    14818: 66,
-    14817: 66,
-    14816: 66,
-    14815: 66,
-    14814: 66,
-    14813: 66,
-    14812: 66,
-    14811: 66,
-    14810: 67,
-    14809: 67,
-    14808: 67,
-    14807: 67,
-    14806: 67,
-    14805: 67,
-    14804: 67,
-    14803: 67,
-    14802: 67,
-    14801: 67,
-    14800: 67,
-    14799: 67,
-    14798: 67,
-    14797: 67,
-    14796: 67,
-    14795: 67,
-    14794: 67,
-    14793: 67,
-    14792: 67,
-    14791: 67,
-    14790: 67,
-    14789: 67,
-    14788: 67,
-    14787: 67,
-    14786: 67,
-    14785: 67,
-    14784: 67,
-    14783: 67,
-    14782: 67,
-    14781: 67,
-    14780: 67,
-    14779: 67,
-    14778: 67,
-    14777: 67,
-    14776: 67,
-    14775: 67,
-    14774: 67,
-    14773: 67,
-    14772: 67,
-    14771: 67,
-    14770: 67,
-    14769: 67,
-    14768: 67,
-    14767: 67,
-    14766: 67,
-    14765: 67,
-    14764: 67,
-    14763: 67,
-    14762: 67,
-    14761: 67,
-    14760: 67,
-    14759: 67,
-    14758: 67,
-    14757: 67,
-    14756: 67,
-    14755: 67,
-    14754: 67,
-    14753: 67,
-    14752: 67,
-    14751: 67,
-    14750: 67,
-    14749: 67,
-    14748: 67,
-    14747: 67,
-    14746: 67,
-    14745: 67,
-    14744: 67,
-    14743: 67,
-    14742: 67,
-    14741: 67,
-    14740: 67,
-    14739: 67,
-    14738: 67,
-    14737: 67,
-    14736: 67,
-    14735: 67,
-    14734: 67,
-    14733: 67,
-    14732: 67,
-    14731: 67,
-    14730: 68,
-    14729: 68,
-    14728: 68,
-    14727: 68,
-    14726: 68,
-    14725: 68,
-    14724: 68,
-    14723: 68,
-    14722: 68,
-    14721: 68,
-    14720: 68,
-    14719: 68,
-    14718: 68,
-    14717: 68,
-    14716: 68,
-    14715: 68,
-    14714: 68,
-    14713: 68,
-    14712: 68,
-    14711: 68,
-    14710: 68,
-    14709: 68,
-    14708: 68,
-    14707: 68,
-    14706: 68,
-    14705: 68,
-    14704: 68,
-    14703: 68,
-    14702: 68,
-    14701: 68,
-    14700: 68,
-    14699: 68,
-    14698: 68,
-    14697: 68,
-    14696: 68,
-    14695: 68,
-    14694: 68,
-    14693: 68,
-    14692: 68,
-    14691: 68,
-    14690: 68,
-    14689: 68,
-    14688: 68,
-    14687: 68,
-    14686: 68,
-    14685: 68,
-    14684: 68,
-    14683: 68,
-    14682: 68,
-    14681: 68,
-    14680: 68,
-    14679: 68,
-    14678: 68,
-    14677: 68,
-    14676: 68,
-    14675: 68,
-    14674: 68,
-    14673: 68,
-    14672: 68,
-    14671: 68,
-    14670: 68,
-    14669: 68,
-    14668: 68,
-    14667: 68,
-    14666: 68,
-    14665: 68,
-    14664: 68,
-    14663: 68,
-    14662: 68,
-    14661: 68,
-    14660: 68,
-    14659: 68,
-    14658: 68,
-    14657: 68,
-    14656: 68,
-    14655: 68,
-    14654: 68,
-    14653: 68,
-    14652: 68,
-    14651: 68,
-    14650: 69,
-    14649: 69,
-    14648: 69,
-    14647: 69,
-    14646: 69,
-    14645: 69,
-    14644: 69,
-    14643: 69,
-    14642: 69,
-    14641: 69,
-    14640: 69,
-    14639: 69,
-    14638: 69,
-    14637: 69,
-    14636: 69,
-    14635: 69,
-    14634: 69,
-    14633: 69,
-    14632: 69,
-    14631: 69,
-    14630: 69,
-    14629: 69,
-    14628: 69,
-    14627: 69,
-    14626: 69,
-    14625: 69,
-    14624: 69,
-    14623: 69,
-    14622: 69,
-    14621: 69,
-    14620: 69,
-    14619: 69,
-    14618: 69,
-    14617: 69,
-    14616: 69,
-    14615: 69,
-    14614: 69,
-    14613: 69,
-    14612: 69,
-    14611: 69,
-    14610: 69,
-    14609: 69,
-    14608: 69,
-    14607: 69,
-    14606: 69,
-    14605: 69,
-    14604: 69,
-    14603: 69,
-    14602: 69,
-    14601: 69,
-    14600: 69,
-    14599: 69,
-    14598: 69,
-    14597: 69,
-    14596: 69,
-    14595: 69,
-    14594: 69,
-    14593: 69,
-    14592: 69,
-    14591: 69,
-    14590: 69,
-    14589: 69,
-    14588: 69,
-    14587: 69,
-    14586: 69,
-    14585: 69,
-    14584: 69,
-    14583: 69,
-    14582: 69,
-    14581: 69,
-    14580: 70,
-    14579: 70,
-    14578: 70,
-    14577: 70,
-    14576: 70,
-    14575: 70,
-    14574: 70,
-    14573: 70,
-    14572: 70,
-    14571: 70,
-    14570: 70,
-    14569: 70,
-    14568: 70,
-    14567: 70,
-    14566: 70,
-    14565: 70,
-    14564: 70,
-    14563: 70,
-    14562: 70,
-    14561: 70,
-    14560: 70,
-    14559: 70,
-    14558: 70,
-    14557: 70,
-    14556: 70,
-    14555: 70,
-    14554: 70,
-    14553: 70,
-    14552: 70,
-    14551: 70,
-    14550: 70,
-    14549: 70,
-    14548: 70,
-    14547: 70,
-    14546: 70,
-    14545: 70,
-    14544: 70,
-    14543: 70,
-    14542: 70,
-    14541: 70,
-    14540: 70,
-    14539: 70,
-    14538: 70,
-    14537: 70,
-    14536: 70,
-    14535: 70,
-    14534: 70,
-    14533: 70,
-    14532: 70,
-    14531: 70,
-    14530: 70,
-    14529: 70,
-    14528: 70,
-    14527: 70,
-    14526: 70,
-    14525: 70,
-    14524: 70,
-    14523: 70,
-    14522: 70,
-    14521: 70,
-    14520: 70,
-    14519: 70,
-    14518: 70,
-    14517: 70,
-    14516: 70,
-    14515: 70,
-    14514: 70,
-    14513: 70,
-    14512: 70,
-    14511: 70,
-    14510: 71,
-    14509: 71,
-    14508: 71,
-    14507: 71,
-    14506: 71,
-    14505: 71,
-    14504: 71,
-    14503: 71,
-    14502: 71,
-    14501: 71,
-    14500: 71,
-    14499: 71,
-    14498: 71,
-    14497: 71,
-    14496: 71,
-    14495: 71,
-    14494: 71,
-    14493: 71,
-    14492: 71,
-    14491: 71,
-    14490: 71,
-    14489: 71,
-    14488: 71,
-    14487: 71,
-    14486: 71,
-    14485: 71,
-    14484: 71,
-    14483: 71,
-    14482: 71,
-    14481: 71,
-    14480: 71,
-    14479: 71,
-    14478: 71,
-    14477: 71,
-    14476: 71,
-    14475: 71,
-    14474: 71,
-    14473: 71,
-    14472: 71,
-    14471: 71,
-    14470: 71,
-    14469: 71,
-    14468: 71,
-    14467: 71,
-    14466: 71,
-    14465: 71,
-    14464: 71,
-    14463: 71,
-    14462: 71,
-    14461: 71,
-    14460: 71,
-    14459: 71,
-    14458: 71,
-    14457: 71,
-    14456: 71,
-    14455: 71,
-    14454: 71,
-    14453: 71,
-    14452: 71,
-    14451: 71,
-    14450: 71,
-    14449: 71,
-    14448: 71,
-    14447: 71,
-    14446: 71,
-    14445: 71,
-    14444: 71,
-    14443: 71,
-    14442: 71,
-    14441: 71,
-    14440: 72,
-    14439: 72,
-    14438: 72,
-    14437: 72,
-    14436: 72,
-    14435: 72,
-    14434: 72,
-    14433: 72,
-    14432: 72,
-    14431: 72,
-    14430: 72,
-    14429: 72,
-    14428: 72,
-    14427: 72,
-    14426: 72,
-    14425: 72,
-    14424: 72,
-    14423: 72,
-    14422: 72,
-    14421: 72,
-    14420: 72,
-    14419: 72,
-    14418: 72,
-    14417: 72,
-    14416: 72,
-    14415: 72,
-    14414: 72,
-    14413: 72,
-    14412: 72,
-    14411: 72,
-    14410: 72,
-    14409: 72,
-    14408: 72,
-    14407: 72,
-    14406: 72,
-    14405: 72,
-    14404: 72,
-    14403: 72,
-    14402: 72,
-    14401: 72,
-    14400: 72,
-    14399: 72,
-    14398: 72,
-    14397: 72,
-    14396: 72,
-    14395: 72,
-    14394: 72,
-    14393: 72,
-    14392: 72,
-    14391: 72,
-    14390: 72,
-    14389: 72,
-    14388: 72,
-    14387: 72,
-    14386: 72,
-    14385: 72,
-    14384: 72,
-    14383: 72,
-    14382: 72,
-    14381: 72,
-    14380: 73,
-    14379: 73,
-    14378: 73,
-    14377: 73,
-    14376: 73,
-    14375: 73,
-    14374: 73,
-    14373: 73,
-    14372: 73,
-    14371: 73,
-    14370: 73,
-    14369: 73,
-    14368: 73,
-    14367: 73,
-    14366: 73,
-    14365: 73,
-    14364: 73,
-    14363: 73,
-    14362: 73,
-    14361: 73,
-    14360: 73,
-    14359: 73,
-    14358: 73,
-    14357: 73,
-    14356: 73,
-    14355: 73,
-    14354: 73,
-    14353: 73,
-    14352: 73,
-    14351: 73,
-    14350: 73,
-    14349: 73,
-    14348: 73,
-    14347: 73,
-    14346: 73,
-    14345: 73,
-    14344: 73,
-    14343: 73,
-    14342: 73,
-    14341: 73,
-    14340: 73,
-    14339: 73,
-    14338: 73,
-    14337: 73,
-    14336: 73,
-    14335: 73,
-    14334: 73,
-    14333: 73,
-    14332: 73,
-    14331: 73,
-    14330: 73,
-    14329: 73,
-    14328: 73,
-    14327: 73,
-    14326: 73,
-    14325: 73,
-    14324: 73,
-    14323: 73,
-    14322: 73,
-    14321: 73,
-    14320: 74,
-    14319: 74,
-    14318: 74,
-    14317: 74,
-    14316: 74,
-    14315: 74,
-    14314: 74,
-    14313: 74,
-    14312: 74,
-    14311: 74,
-    14310: 74,
-    14309: 74,
-    14308: 74,
-    14307: 74,
-    14306: 74,
-    14305: 74,
-    14304: 74,
-    14303: 74,
-    14302: 74,
-    14301: 74,
-    14300: 74,
-    14299: 74,
-    14298: 74,
-    14297: 74,
-    14296: 74,
-    14295: 74,
-    14294: 74,
-    14293: 74,
-    14292: 74,
-    14291: 74,
-    14290: 74,
-    14289: 74,
-    14288: 74,
-    14287: 74,
-    14286: 74,
-    14285: 74,
-    14284: 74,
-    14283: 74,
-    14282: 74,
-    14281: 74,
-    14280: 74,
-    14279: 74,
-    14278: 74,
-    14277: 74,
-    14276: 74,
-    14275: 74,
-    14274: 74,
-    14273: 74,
-    14272: 74,
-    14271: 74,
-    14270: 74,
-    14269: 74,
-    14268: 74,
-    14267: 74,
-    14266: 74,
-    14265: 74,
-    14264: 74,
-    14263: 74,
-    14262: 74,
-    14261: 74,
-    14260: 74,
-    14259: 74,
-    14258: 74,
-    14257: 74,
-    14256: 74,
-    14255: 74,
-    14254: 74,
-    14253: 74,
-    14252: 74,
-    14251: 74,
-    14250: 75,
-    14249: 75,
-    14248: 75,
-    14247: 75,
-    14246: 75,
-    14245: 75,
-    14244: 75,
-    14243: 75,
-    14242: 75,
-    14241: 75,
-    14240: 75,
-    14239: 75,
-    14238: 75,
-    14237: 75,
-    14236: 75,
-    14235: 75,
-    14234: 75,
-    14233: 75,
-    14232: 75,
-    14231: 75,
-    14230: 75,
-    14229: 75,
-    14228: 75,
-    14227: 75,
-    14226: 75,
-    14225: 75,
-    14224: 75,
-    14223: 75,
-    14222: 75,
-    14221: 75,
-    14220: 75,
-    14219: 75,
-    14218: 75,
-    14217: 75,
-    14216: 75,
-    14215: 75,
-    14214: 75,
-    14213: 75,
-    14212: 75,
-    14211: 75,
-    14210: 75,
-    14209: 75,
-    14208: 75,
-    14207: 75,
-    14206: 75,
-    14205: 75,
-    14204: 75,
-    14203: 75,
-    14202: 75,
-    14201: 75,
-    14200: 75,
-    14199: 75,
-    14198: 75,
-    14197: 75,
-    14196: 75,
-    14195: 75,
-    14194: 75,
-    14193: 75,
-    14192: 75,
-    14191: 75,
-    14190: 76,
-    14189: 76,
-    14188: 76,
-    14187: 76,
-    14186: 76,
-    14185: 76,
-    14184: 76,
-    14183: 76,
-    14182: 76,
-    14181: 76,
-    14180: 76,
-    14179: 76,
-    14178: 76,
-    14177: 76,
-    14176: 76,
-    14175: 76,
-    14174: 76,
-    14173: 76,
-    14172: 76,
-    14171: 76,
-    14170: 76,
-    14169: 76,
-    14168: 76,
-    14167: 76,
-    14166: 76,
-    14165: 76,
-    14164: 76,
-    14163: 76,
-    14162: 76,
-    14161: 76,
-    14160: 76,
-    14159: 76,
-    14158: 76,
-    14157: 76,
-    14156: 76,
-    14155: 76,
-    14154: 76,
-    14153: 76,
-    14152: 76,
-    14151: 76,
-    14150: 76,
-    14149: 76,
-    14148: 76,
-    14147: 76,
-    14146: 76,
-    14145: 76,
-    14144: 76,
-    14143: 76,
-    14142: 76,
-    14141: 76,
-    14140: 76,
-    14139: 76,
-    14138: 76,
-    14137: 76,
-    14136: 76,
-    14135: 76,
-    14134: 76,
-    14133: 76,
-    14132: 76,
-    14131: 76,
-    14130: 77,
-    14129: 77,
-    14128: 77,
-    14127: 77,
-    14126: 77,
-    14125: 77,
-    14124: 77,
-    14123: 77,
-    14122: 77,
-    14121: 77,
-    14120: 77,
-    14119: 77,
-    14118: 77,
-    14117: 77,
-    14116: 77,
-    14115: 77,
-    14114: 77,
-    14113: 77,
-    14112: 77,
-    14111: 77,
-    14110: 77,
-    14109: 77,
-    14108: 77,
-    14107: 77,
-    14106: 77,
-    14105: 77,
-    14104: 77,
-    14103: 77,
-    14102: 77,
-    14101: 77,
-    14100: 77,
-    14099: 77,
-    14098: 77,
-    14097: 77,
-    14096: 77,
-    14095: 77,
-    14094: 77,
-    14093: 77,
-    14092: 77,
-    14091: 77,
-    14090: 77,
-    14089: 77,
-    14088: 77,
-    14087: 77,
-    14086: 77,
-    14085: 77,
-    14084: 77,
-    14083: 77,
-    14082: 77,
-    14081: 77,
-    14080: 77,
-    14079: 77,
-    14078: 77,
-    14077: 77,
-    14076: 77,
-    14075: 77,
-    14074: 77,
-    14073: 77,
-    14072: 77,
-    14071: 77,
-    14070: 78,
-    14069: 78,
-    14068: 78,
-    14067: 78,
-    14066: 78,
-    14065: 78,
-    14064: 78,
-    14063: 78,
-    14062: 78,
-    14061: 78,
-    14060: 78,
-    14059: 78,
-    14058: 78,
-    14057: 78,
-    14056: 78,
-    14055: 78,
-    14054: 78,
-    14053: 78,
-    14052: 78,
-    14051: 78,
-    14050: 78,
-    14049: 78,
-    14048: 78,
-    14047: 78,
-    14046: 78,
-    14045: 78,
-    14044: 78,
-    14043: 78,
-    14042: 78,
-    14041: 78,
-    14040: 78,
-    14039: 78,
-    14038: 78,
-    14037: 78,
-    14036: 78,
-    14035: 78,
-    14034: 78,
-    14033: 78,
-    14032: 78,
-    14031: 78,
-    14030: 78,
-    14029: 78,
-    14028: 78,
-    14027: 78,
-    14026: 78,
-    14025: 78,
-    14024: 78,
-    14023: 78,
-    14022: 78,
-    14021: 78,
-    14020: 78,
-    14019: 78,
-    14018: 78,
-    14017: 78,
-    14016: 78,
-    14015: 78,
-    14014: 78,
-    14013: 78,
-    14012: 78,
-    14011: 78,
-    14010: 78,
-    14009: 78,
-    14008: 78,
-    14007: 78,
-    14006: 78,
-    14005: 78,
-    14004: 78,
-    14003: 78,
-    14002: 78,
-    14001: 78,
-    14000: 79,
-    13999: 79,
-    13998: 79,
-    13997: 79,
-    13996: 79,
-    13995: 79,
-    13994: 79,
-    13993: 79,
-    13992: 79,
-    13991: 79,
-    13990: 79,
-    13989: 79,
-    13988: 79,
-    13987: 79,
-    13986: 79,
-    13985: 79,
-    13984: 79,
-    13983: 79,
-    13982: 79,
-    13981: 79,
-    13980: 79,
-    13979: 79,
-    13978: 79,
-    13977: 79,
-    13976: 79,
-    13975: 79,
-    13974: 79,
-    13973: 79,
-    13972: 79,
-    13971: 79,
-    13970: 79,
-    13969: 79,
-    13968: 79,
-    13967: 79,
-    13966: 79,
-    13965: 79,
-    13964: 79,
-    13963: 79,
-    13962: 79,
-    13961: 79,
-    13960: 79,
-    13959: 79,
-    13958: 79,
-    13957: 79,
-    13956: 79,
-    13955: 79,
-    13954: 79,
-    13953: 79,
-    13952: 79,
-    13951: 79,
-    13950: 79,
-    13949: 79,
-    13948: 79,
-    13947: 79,
-    13946: 79,
-    13945: 79,
-    13944: 79,
-    13943: 79,
-    13942: 79,
-    13941: 79,
-    13940: 80,
-    13939: 80,
-    13938: 80,
-    13937: 80,
-    13936: 80,
-    13935: 80,
-    13934: 80,
-    13933: 80,
-    13932: 80,
-    13931: 80,
-    13930: 80,
-    13929: 80,
-    13928: 80,
-    13927: 80,
-    13926: 80,
-    13925: 80,
-    13924: 80,
-    13923: 80,
-    13922: 80,
-    13921: 80,
-    13920: 80,
-    13919: 80,
-    13918: 80,
-    13917: 80,
-    13916: 80,
-    13915: 80,
-    13914: 80,
-    13913: 80,
-    13912: 80,
-    13911: 80,
-    13910: 80,
-    13909: 80,
-    13908: 80,
-    13907: 80,
-    13906: 80,
-    13905: 80,
-    13904: 80,
-    13903: 80,
-    13902: 80,
-    13901: 80,
-    13900: 80,
-    13899: 80,
-    13898: 80,
-    13897: 80,
-    13896: 80,
-    13895: 80,
-    13894: 80,
-    13893: 80,
-    13892: 80,
-    13891: 80,
-    13890: 80,
-    13889: 80,
-    13888: 80,
-    13887: 80,
-    13886: 80,
-    13885: 80,
-    13884: 80,
-    13883: 80,
-    13882: 80,
-    13881: 80,
-    13880: 81,
-    13879: 81,
-    13878: 81,
-    13877: 81,
-    13876: 81,
-    13875: 81,
-    13874: 81,
-    13873: 81,
-    13872: 81,
-    13871: 81,
-    13870: 81,
-    13869: 81,
-    13868: 81,
-    13867: 81,
-    13866: 81,
-    13865: 81,
-    13864: 81,
-    13863: 81,
-    13862: 81,
-    13861: 81,
-    13860: 81,
-    13859: 81,
-    13858: 81,
-    13857: 81,
-    13856: 81,
-    13855: 81,
-    13854: 81,
-    13853: 81,
-    13852: 81,
-    13851: 81,
-    13850: 81,
-    13849: 81,
-    13848: 81,
-    13847: 81,
-    13846: 81,
-    13845: 81,
-    13844: 81,
-    13843: 81,
-    13842: 81,
-    13841: 81,
-    13840: 81,
-    13839: 81,
-    13838: 81,
-    13837: 81,
-    13836: 81,
-    13835: 81,
-    13834: 81,
-    13833: 81,
-    13832: 81,
-    13831: 81,
-    13830: 81,
-    13829: 81,
-    13828: 81,
-    13827: 81,
-    13826: 81,
-    13825: 81,
-    13824: 81,
-    13823: 81,
-    13822: 81,
-    13821: 81,
-    13820: 82,
-    13819: 82,
-    13818: 82,
-    13817: 82,
-    13816: 82,
-    13815: 82,
-    13814: 82,
-    13813: 82,
-    13812: 82,
-    13811: 82,
-    13810: 82,
-    13809: 82,
-    13808: 82,
-    13807: 82,
-    13806: 82,
-    13805: 82,
-    13804: 82,
-    13803: 82,
-    13802: 82,
-    13801: 82,
-    13800: 82,
-    13799: 82,
-    13798: 82,
-    13797: 82,
-    13796: 82,
-    13795: 82,
-    13794: 82,
-    13793: 82,
-    13792: 82,
-    13791: 82,
-    13790: 82,
-    13789: 82,
-    13788: 82,
-    13787: 82,
-    13786: 82,
-    13785: 82,
-    13784: 82,
-    13783: 82,
-    13782: 82,
-    13781: 82,
-    13780: 82,
-    13779: 82,
-    13778: 82,
-    13777: 82,
-    13776: 82,
-    13775: 82,
-    13774: 82,
-    13773: 82,
-    13772: 82,
-    13771: 82,
-    13770: 82,
-    13769: 82,
-    13768: 82,
-    13767: 82,
-    13766: 82,
-    13765: 82,
-    13764: 82,
-    13763: 82,
-    13762: 82,
-    13761: 82,
-    13760: 83,
-    13759: 83,
-    13758: 83,
-    13757: 83,
-    13756: 83,
-    13755: 83,
-    13754: 83,
-    13753: 83,
-    13752: 83,
-    13751: 83,
-    13750: 83,
-    13749: 83,
-    13748: 83,
-    13747: 83,
-    13746: 83,
-    13745: 83,
-    13744: 83,
-    13743: 83,
-    13742: 83,
-    13741: 83,
-    13740: 83,
-    13739: 83,
-    13738: 83,
-    13737: 83,
-    13736: 83,
-    13735: 83,
-    13734: 83,
-    13733: 83,
-    13732: 83,
-    13731: 83,
-    13730: 83,
-    13729: 83,
-    13728: 83,
-    13727: 83,
-    13726: 83,
-    13725: 83,
-    13724: 83,
-    13723: 83,
-    13722: 83,
-    13721: 83,
-    13720: 83,
-    13719: 83,
-    13718: 83,
-    13717: 83,
-    13716: 83,
-    13715: 83,
-    13714: 83,
-    13713: 83,
-    13712: 83,
-    13711: 83,
-    13710: 84,
-    13709: 84,
-    13708: 84,
-    13707: 84,
-    13706: 84,
-    13705: 84,
-    13704: 84,
-    13703: 84,
-    13702: 84,
-    13701: 84,
-    13700: 84,
-    13699: 84,
-    13698: 84,
-    13697: 84,
-    13696: 84,
-    13695: 84,
-    13694: 84,
-    13693: 84,
-    13692: 84,
-    13691: 84,
-    13690: 84,
-    13689: 84,
-    13688: 84,
-    13687: 84,
-    13686: 84,
-    13685: 84,
-    13684: 84,
-    13683: 84,
-    13682: 84,
-    13681: 84,
-    13680: 84,
-    13679: 84,
-    13678: 84,
-    13677: 84,
-    13676: 84,
-    13675: 84,
-    13674: 84,
-    13673: 84,
-    13672: 84,
-    13671: 84,
-    13670: 84,
-    13669: 84,
-    13668: 84,
-    13667: 84,
-    13666: 84,
-    13665: 84,
-    13664: 84,
-    13663: 84,
-    13662: 84,
-    13661: 84,
-    13660: 85,
-    13659: 85,
-    13658: 85,
-    13657: 85,
-    13656: 85,
-    13655: 85,
-    13654: 85,
-    13653: 85,
-    13652: 85,
-    13651: 85,
-    13650: 85,
-    13649: 85,
-    13648: 85,
-    13647: 85,
-    13646: 85,
-    13645: 85,
-    13644: 85,
-    13643: 85,
-    13642: 85,
-    13641: 85,
-    13640: 85,
-    13639: 85,
-    13638: 85,
-    13637: 85,
-    13636: 85,
-    13635: 85,
-    13634: 85,
-    13633: 85,
-    13632: 85,
-    13631: 85,
-    13630: 85,
-    13629: 85,
-    13628: 85,
-    13627: 85,
-    13626: 85,
-    13625: 85,
-    13624: 85,
-    13623: 85,
-    13622: 85,
-    13621: 85,
-    13620: 85,
-    13619: 85,
-    13618: 85,
-    13617: 85,
-    13616: 85,
-    13615: 85,
-    13614: 85,
-    13613: 85,
-    13612: 85,
-    13611: 85,
-    13610: 86,
-    13609: 86,
-    13608: 86,
-    13607: 86,
-    13606: 86,
-    13605: 86,
-    13604: 86,
-    13603: 86,
-    13602: 86,
-    13601: 86,
-    13600: 86,
-    13599: 86,
-    13598: 86,
-    13597: 86,
-    13596: 86,
-    13595: 86,
-    13594: 86,
-    13593: 86,
-    13592: 86,
-    13591: 86,
-    13590: 86,
-    13589: 86,
-    13588: 86,
-    13587: 86,
-    13586: 86,
-    13585: 86,
-    13584: 86,
-    13583: 86,
-    13582: 86,
-    13581: 86,
-    13580: 86,
-    13579: 86,
-    13578: 86,
-    13577: 86,
-    13576: 86,
-    13575: 86,
-    13574: 86,
-    13573: 86,
-    13572: 86,
-    13571: 86,
-    13570: 86,
-    13569: 86,
-    13568: 86,
-    13567: 86,
-    13566: 86,
-    13565: 86,
-    13564: 86,
-    13563: 86,
-    13562: 86,
-    13561: 86,
-    13560: 87,
-    13559: 87,
-    13558: 87,
-    13557: 87,
-    13556: 87,
-    13555: 87,
-    13554: 87,
-    13553: 87,
-    13552: 87,
-    13551: 87,
-    13550: 87,
-    13549: 87,
-    13548: 87,
-    13547: 87,
-    13546: 87,
-    13545: 87,
-    13544: 87,
-    13543: 87,
-    13542: 87,
-    13541: 87,
-    13540: 87,
-    13539: 87,
-    13538: 87,
-    13537: 87,
-    13536: 87,
-    13535: 87,
-    13534: 87,
-    13533: 87,
-    13532: 87,
-    13531: 87,
-    13530: 87,
-    13529: 87,
-    13528: 87,
-    13527: 87,
-    13526: 87,
-    13525: 87,
-    13524: 87,
-    13523: 87,
-    13522: 87,
-    13521: 87,
-    13520: 88,
-    13519: 88,
-    13518: 88,
-    13517: 88,
-    13516: 88,
-    13515: 88,
-    13514: 88,
-    13513: 88,
-    13512: 88,
-    13511: 88,
-    13510: 88,
-    13509: 88,
-    13508: 88,
-    13507: 88,
-    13506: 88,
-    13505: 88,
-    13504: 88,
-    13503: 88,
-    13502: 88,
-    13501: 88,
-    13500: 88,
-    13499: 88,
-    13498: 88,
-    13497: 88,
-    13496: 88,
-    13495: 88,
-    13494: 88,
-    13493: 88,
-    13492: 88,
-    13491: 88,
-    13490: 88,
-    13489: 88,
-    13488: 88,
-    13487: 88,
-    13486: 88,
-    13485: 88,
-    13484: 88,
-    13483: 88,
-    13482: 88,
-    13481: 88,
-    13480: 88,
-    13479: 88,
-    13478: 88,
-    13477: 88,
-    13476: 88,
-    13475: 88,
-    13474: 88,
-    13473: 88,
-    13472: 88,
-    13471: 88,
-    13470: 89,
-    13469: 89,
-    13468: 89,
-    13467: 89,
-    13466: 89,
-    13465: 89,
-    13464: 89,
-    13463: 89,
-    13462: 89,
-    13461: 89,
-    13460: 89,
-    13459: 89,
-    13458: 89,
-    13457: 89,
-    13456: 89,
-    13455: 89,
-    13454: 89,
-    13453: 89,
-    13452: 89,
-    13451: 89,
-    13450: 89,
-    13449: 89,
-    13448: 89,
-    13447: 89,
-    13446: 89,
-    13445: 89,
-    13444: 89,
-    13443: 89,
-    13442: 89,
-    13441: 89,
-    13440: 89,
-    13439: 89,
-    13438: 89,
-    13437: 89,
-    13436: 89,
-    13435: 89,
-    13434: 89,
-    13433: 89,
-    13432: 89,
-    13431: 89,
-    13430: 90,
-    13429: 90,
-    13428: 90,
-    13427: 90,
-    13426: 90,
-    13425: 90,
-    13424: 90,
-    13423: 90,
-    13422: 90,
-    13421: 90,
-    13420: 90,
-    13419: 90,
-    13418: 90,
-    13417: 90,
-    13416: 90,
-    13415: 90,
-    13414: 90,
-    13413: 90,
-    13412: 90,
-    13411: 90,
-    13410: 90,
-    13409: 90,
-    13408: 90,
-    13407: 90,
-    13406: 90,
-    13405: 90,
-    13404: 90,
-    13403: 90,
-    13402: 90,
-    13401: 90,
-    13400: 90,
-    13399: 90,
-    13398: 90,
-    13397: 90,
-    13396: 90,
-    13395: 90,
-    13394: 90,
-    13393: 90,
-    13392: 90,
-    13391: 90,
-    13390: 90,
-    13389: 90,
-    13388: 90,
-    13387: 90,
-    13386: 90,
-    13385: 90,
-    13384: 90,
-    13383: 90,
-    13382: 90,
-    13381: 90,
-    13380: 91,
-    13379: 91,
-    13378: 91,
-    13377: 91,
-    13376: 91,
-    13375: 91,
-    13374: 91,
-    13373: 91,
-    13372: 91,
-    13371: 91,
-    13370: 91,
-    13369: 91,
-    13368: 91,
-    13367: 91,
-    13366: 91,
-    13365: 91,
-    13364: 91,
-    13363: 91,
-    13362: 91,
-    13361: 91,
-    13360: 91,
-    13359: 91,
-    13358: 91,
-    13357: 91,
-    13356: 91,
-    13355: 91,
-    13354: 91,
-    13353: 91,
-    13352: 91,
-    13351: 91,
-    13350: 91,
-    13349: 91,
-    13348: 91,
-    13347: 91,
-    13346: 91,
-    13345: 91,
-    13344: 91,
-    13343: 91,
-    13342: 91,
-    13341: 91,
-    13340: 92,
-    13339: 92,
-    13338: 92,
-    13337: 92,
-    13336: 92,
-    13335: 92,
-    13334: 92,
-    13333: 92,
-    13332: 92,
-    13331: 92,
-    13330: 92,
-    13329: 92,
-    13328: 92,
-    13327: 92,
-    13326: 92,
-    13325: 92,
-    13324: 92,
-    13323: 92,
-    13322: 92,
-    13321: 92,
-    13320: 92,
-    13319: 92,
-    13318: 92,
-    13317: 92,
-    13316: 92,
-    13315: 92,
-    13314: 92,
-    13313: 92,
-    13312: 92,
-    13311: 92,
-    13310: 92,
-    13309: 92,
-    13308: 92,
-    13307: 92,
-    13306: 92,
-    13305: 92,
-    13304: 92,
-    13303: 92,
-    13302: 92,
-    13301: 92,
-    13300: 93,
-    13299: 93,
-    13298: 93,
-    13297: 93,
-    13296: 93,
-    13295: 93,
-    13294: 93,
-    13293: 93,
-    13292: 93,
-    13291: 93,
-    13290: 93,
-    13289: 93,
-    13288: 93,
-    13287: 93,
-    13286: 93,
-    13285: 93,
-    13284: 93,
-    13283: 93,
-    13282: 93,
-    13281: 93,
-    13280: 93,
-    13279: 93,
-    13278: 93,
-    13277: 93,
-    13276: 93,
-    13275: 93,
-    13274: 93,
-    13273: 93,
-    13272: 93,
-    13271: 93,
-    13270: 93,
-    13269: 93,
-    13268: 93,
-    13267: 93,
-    13266: 93,
-    13265: 93,
-    13264: 93,
-    13263: 93,
-    13262: 93,
-    13261: 93,
-    13260: 93,
-    13259: 93,
-    13258: 93,
-    13257: 93,
-    13256: 93,
-    13255: 93,
-    13254: 93,
-    13253: 93,
-    13252: 93,
-    13251: 93,
-    13250: 94,
-    13249: 94,
-    13248: 94,
-    13247: 94,
-    13246: 94,
-    13245: 94,
-    13244: 94,
-    13243: 94,
-    13242: 94,
-    13241: 94,
-    13240: 94,
-    13239: 94,
-    13238: 94,
-    13237: 94,
-    13236: 94,
-    13235: 94,
-    13234: 94,
-    13233: 94,
-    13232: 94,
-    13231: 94,
-    13230: 94,
-    13229: 94,
-    13228: 94,
-    13227: 94,
-    13226: 94,
-    13225: 94,
-    13224: 94,
-    13223: 94,
-    13222: 94,
-    13221: 94,
-    13220: 94,
-    13219: 94,
-    13218: 94,
-    13217: 94,
-    13216: 94,
-    13215: 94,
-    13214: 94,
-    13213: 94,
-    13212: 94,
-    13211: 94,
-    13210: 95,
-    13209: 95,
-    13208: 95,
-    13207: 95,
-    13206: 95,
-    13205: 95,
-    13204: 95,
-    13203: 95,
-    13202: 95,
-    13201: 95,
-    13200: 95,
-    13199: 95,
-    13198: 95,
-    13197: 95,
-    13196: 95,
-    13195: 95,
-    13194: 95,
-    13193: 95,
-    13192: 95,
-    13191: 95,
-    13190: 95,
-    13189: 95,
-    13188: 95,
-    13187: 95,
-    13186: 95,
-    13185: 95,
-    13184: 95,
-    13183: 95,
-    13182: 95,
-    13181: 95,
-    13180: 95,
-    13179: 95,
-    13178: 95,
-    13177: 95,
-    13176: 95,
-    13175: 95,
-    13174: 95,
-    13173: 95,
-    13172: 95,
-    13171: 95,
-    13170: 96,
-    13169: 96,
-    13168: 96,
-    13167: 96,
-    13166: 96,
-    13165: 96,
-    13164: 96,
-    13163: 96,
-    13162: 96,
-    13161: 96,
-    13160: 96,
-    13159: 96,
-    13158: 96,
-    13157: 96,
-    13156: 96,
-    13155: 96,
-    13154: 96,
-    13153: 96,
-    13152: 96,
-    13151: 96,
-    13150: 96,
-    13149: 96,
-    13148: 96,
-    13147: 96,
-    13146: 96,
-    13145: 96,
-    13144: 96,
-    13143: 96,
-    13142: 96,
-    13141: 96,
-    13140: 96,
-    13139: 96,
-    13138: 96,
-    13137: 96,
-    13136: 96,
-    13135: 96,
-    13134: 96,
-    13133: 96,
-    13132: 96,
-    13131: 96,
-    13130: 97,
-    13129: 97,
-    13128: 97,
-    13127: 97,
-    13126: 97,
-    13125: 97,
-    13124: 97,
-    13123: 97,
-    13122: 97,
-    13121: 97,
-    13120: 97,
-    13119: 97,
-    13118: 97,
-    13117: 97,
-    13116: 97,
-    13115: 97,
-    13114: 97,
-    13113: 97,
-    13112: 97,
-    13111: 97,
-    13110: 97,
-    13109: 97,
-    13108: 97,
-    13107: 97,
-    13106: 97,
-    13105: 97,
-    13104: 97,
-    13103: 97,
-    13102: 97,
-    13101: 97,
-    13100: 97,
-    13099: 97,
-    13098: 97,
-    13097: 97,
-    13096: 97,
-    13095: 97,
-    13094: 97,
-    13093: 97,
-    13092: 97,
-    13091: 97,
-    13090: 98,
-    13089: 98,
-    13088: 98,
-    13087: 98,
-    13086: 98,
-    13085: 98,
-    13084: 98,
-    13083: 98,
-    13082: 98,
-    13081: 98,
-    13080: 98,
-    13079: 98,
-    13078: 98,
-    13077: 98,
-    13076: 98,
-    13075: 98,
-    13074: 98,
-    13073: 98,
-    13072: 98,
-    13071: 98,
-    13070: 98,
-    13069: 98,
-    13068: 98,
-    13067: 98,
-    13066: 98,
-    13065: 98,
-    13064: 98,
-    13063: 98,
-    13062: 98,
-    13061: 98,
-    13060: 98,
-    13059: 98,
-    13058: 98,
-    13057: 98,
-    13056: 98,
-    13055: 98,
-    13054: 98,
-    13053: 98,
-    13052: 98,
-    13051: 98,
-    13050: 98,
-    13049: 98,
-    13048: 98,
-    13047: 98,
-    13046: 98,
-    13045: 98,
-    13044: 98,
-    13043: 98,
-    13042: 98,
-    13041: 98,
-    13040: 99,
-    13039: 99,
-    13038: 99,
-    13037: 99,
-    13036: 99,
-    13035: 99,
-    13034: 99,
-    13033: 99,
-    13032: 99,
-    13031: 99,
-    13030: 99,
-    13029: 99,
-    13028: 99,
-    13027: 99,
-    13026: 99,
-    13025: 99,
-    13024: 99,
-    13023: 99,
-    13022: 99,
-    13021: 99,
-    13020: 99,
-    13019: 99,
-    13018: 99,
-    13017: 99,
-    13016: 99,
-    13015: 99,
-    13014: 99,
-    13013: 99,
-    13012: 99,
-    13011: 99,
-    13010: 99,
-    13009: 99,
-    13008: 99,
-    13007: 99,
-    13006: 99,
-    13005: 99,
-    13004: 99,
-    13003: 99,
-    13002: 99,
-    13001: 99,
-    13000: 100,
-    12999: 100,
-    12998: 100,
-    12997: 100,
-    12996: 100,
-    12995: 100,
-    12994: 100,
-    12993: 100,
-    12992: 100,
-    12991: 100,
-    12990: 100,
-    12989: 100,
-    12988: 100,
-    12987: 100,
-    12986: 100,
-    12985: 100,
-    12984: 100,
-    12983: 100,
-    12982: 100,
-    12981: 100,
-    12980: 100,
-    12979: 100,
-    12978: 100,
-    12977: 100,
-    12976: 100,
-    12975: 100,
-    12974: 100,
-    12973: 100,
-    12972: 100,
-    12971: 100,
-    12970: 100,
-    12969: 100,
-    12968: 100,
-    12967: 100,
-    12966: 100,
-    12965: 100,
-    12964: 100,
-    12963: 100,
-    12962: 100,
-    12961: 100,
-    12960: 101,
-    12959: 101,
-    12958: 101,
-    12957: 101,
-    12956: 101,
-    12955: 101,
-    12954: 101,
-    12953: 101,
-    12952: 101,
-    12951: 101,
-    12950: 101,
-    12949: 101,
-    12948: 101,
-    12947: 101,
-    12946: 101,
-    12945: 101,
-    12944: 101,
-    12943: 101,
-    12942: 101,
-    12941: 101,
-    12940: 101,
-    12939: 101,
-    12938: 101,
-    12937: 101,
-    12936: 101,
-    12935: 101,
-    12934: 101,
-    12933: 101,
-    12932: 101,
-    12931: 101,
-    12930: 101,
-    12929: 101,
-    12928: 101,
-    12927: 101,
-    12926: 101,
-    12925: 101,
-    12924: 101,
-    12923: 101,
-    12922: 101,
-    12921: 101,
-    12920: 102,
-    12919: 102,
-    12918: 102,
-    12917: 102,
-    12916: 102,
-    12915: 102,
-    12914: 102,
-    12913: 102,
-    12912: 102,
-    12911: 102,
-    12910: 102,
-    12909: 102,
-    12908: 102,
-    12907: 102,
-    12906: 102,
-    12905: 102,
-    12904: 102,
-    12903: 102,
-    12902: 102,
-    12901: 102,
-    12900: 102,
-    12899: 102,
-    12898: 102,
-    12897: 102,
-    12896: 102,
-    12895: 102,
-    12894: 102,
-    12893: 102,
-    12892: 102,
-    12891: 102,
-    12890: 102,
-    12889: 102,
-    12888: 102,
-    12887: 102,
-    12886: 102,
-    12885: 102,
-    12884: 102,
-    12883: 102,
-    12882: 102,
-    12881: 102,
-    12880: 103,
-    12879: 103,
-    12878: 103,
-    12877: 103,
-    12876: 103,
-    12875: 103,
-    12874: 103,
-    12873: 103,
-    12872: 103,
-    12871: 103,
-    12870: 103,
-    12869: 103,
-    12868: 103,
-    12867: 103,
-    12866: 103,
-    12865: 103,
-    12864: 103,
-    12863: 103,
-    12862: 103,
-    12861: 103,
-    12860: 103,
-    12859: 103,
-    12858: 103,
-    12857: 103,
-    12856: 103,
-    12855: 103,
-    12854: 103,
-    12853: 103,
-    12852: 103,
-    12851: 103,
-    12850: 103,
-    12849: 103,
-    12848: 103,
-    12847: 103,
-    12846: 103,
-    12845: 103,
-    12844: 103,
-    12843: 103,
-    12842: 103,
-    12841: 103,
-    12840: 104,
-    12839: 104,
-    12838: 104,
-    12837: 104,
-    12836: 104,
-    12835: 104,
-    12834: 104,
-    12833: 104,
-    12832: 104,
-    12831: 104,
-    12830: 104,
-    12829: 104,
-    12828: 104,
-    12827: 104,
-    12826: 104,
-    12825: 104,
-    12824: 104,
-    12823: 104,
-    12822: 104,
-    12821: 104,
-    12820: 104,
-    12819: 104,
-    12818: 104,
-    12817: 104,
-    12816: 104,
-    12815: 104,
-    12814: 104,
-    12813: 104,
-    12812: 104,
-    12811: 104,
-    12810: 104,
-    12809: 104,
-    12808: 104,
-    12807: 104,
-    12806: 104,
-    12805: 104,
-    12804: 104,
-    12803: 104,
-    12802: 104,
-    12801: 104,
-    12800: 105,
-    12799: 105,
-    12798: 105,
-    12797: 105,
-    12796: 105,
-    12795: 105,
-    12794: 105,
-    12793: 105,
-    12792: 105,
-    12791: 105,
-    12790: 105,
-    12789: 105,
-    12788: 105,
-    12787: 105,
-    12786: 105,
-    12785: 105,
-    12784: 105,
-    12783: 105,
-    12782: 105,
-    12781: 105,
-    12780: 105,
-    12779: 105,
-    12778: 105,
-    12777: 105,
-    12776: 105,
-    12775: 105,
-    12774: 105,
-    12773: 105,
-    12772: 105,
-    12771: 105,
-    12770: 105,
-    12769: 105,
-    12768: 105,
-    12767: 105,
-    12766: 105,
-    12765: 105,
-    12764: 105,
-    12763: 105,
-    12762: 105,
-    12761: 105,
-    12760: 106,
-    12759: 106,
-    12758: 106,
-    12757: 106,
-    12756: 106,
-    12755: 106,
-    12754: 106,
-    12753: 106,
-    12752: 106,
-    12751: 106,
-    12750: 106,
-    12749: 106,
-    12748: 106,
-    12747: 106,
-    12746: 106,
-    12745: 106,
-    12744: 106,
-    12743: 106,
-    12742: 106,
-    12741: 106,
-    12740: 106,
-    12739: 106,
-    12738: 106,
-    12737: 106,
-    12736: 106,
-    12735: 106,
-    12734: 106,
-    12733: 106,
-    12732: 106,
-    12731: 106,
-    12730: 106,
-    12729: 106,
-    12728: 106,
-    12727: 106,
-    12726: 106,
-    12725: 106,
-    12724: 106,
-    12723: 106,
-    12722: 106,
-    12721: 106,
-    12720: 107,
-    12719: 107,
-    12718: 107,
-    12717: 107,
-    12716: 107,
-    12715: 107,
-    12714: 107,
-    12713: 107,
-    12712: 107,
-    12711: 107,
-    12710: 107,
-    12709: 107,
-    12708: 107,
-    12707: 107,
-    12706: 107,
-    12705: 107,
-    12704: 107,
-    12703: 107,
-    12702: 107,
-    12701: 107,
-    12700: 107,
-    12699: 107,
-    12698: 107,
-    12697: 107,
-    12696: 107,
-    12695: 107,
-    12694: 107,
-    12693: 107,
-    12692: 107,
-    12691: 107,
-    12690: 108,
-    12689: 108,
-    12688: 108,
-    12687: 108,
-    12686: 108,
-    12685: 108,
-    12684: 108,
-    12683: 108,
-    12682: 108,
-    12681: 108,
-    12680: 108,
-    12679: 108,
-    12678: 108,
-    12677: 108,
-    12676: 108,
-    12675: 108,
-    12674: 108,
-    12673: 108,
-    12672: 108,
-    12671: 108,
-    12670: 108,
-    12669: 108,
-    12668: 108,
-    12667: 108,
-    12666: 108,
-    12665: 108,
-    12664: 108,
-    12663: 108,
-    12662: 108,
-    12661: 108,
-    12660: 108,
-    12659: 108,
-    12658: 108,
-    12657: 108,
-    12656: 108,
-    12655: 108,
-    12654: 108,
-    12653: 108,
-    12652: 108,
-    12651: 108,
-    12650: 109,
-    12649: 109,
-    12648: 109,
-    12647: 109,
-    12646: 109,
-    12645: 109,
-    12644: 109,
-    12643: 109,
-    12642: 109,
-    12641: 109,
-    12640: 109,
-    12639: 109,
-    12638: 109,
-    12637: 109,
-    12636: 109,
-    12635: 109,
-    12634: 109,
-    12633: 109,
-    12632: 109,
-    12631: 109,
-    12630: 109,
-    12629: 109,
-    12628: 109,
-    12627: 109,
-    12626: 109,
-    12625: 109,
-    12624: 109,
-    12623: 109,
-    12622: 109,
-    12621: 109,
-    12620: 110,
-    12619: 110,
-    12618: 110,
-    12617: 110,
-    12616: 110,
-    12615: 110,
-    12614: 110,
-    12613: 110,
-    12612: 110,
-    12611: 110,
-    12610: 110,
-    12609: 110,
-    12608: 110,
-    12607: 110,
-    12606: 110,
-    12605: 110,
-    12604: 110,
-    12603: 110,
-    12602: 110,
-    12601: 110,
-    12600: 110,
-    12599: 110,
-    12598: 110,
-    12597: 110,
-    12596: 110,
-    12595: 110,
-    12594: 110,
-    12593: 110,
-    12592: 110,
-    12591: 110,
-    12590: 110,
-    12589: 110,
-    12588: 110,
-    12587: 110,
-    12586: 110,
-    12585: 110,
-    12584: 110,
-    12583: 110,
-    12582: 110,
-    12581: 110,
-    12580: 111,
-    12579: 111,
-    12578: 111,
-    12577: 111,
-    12576: 111,
-    12575: 111,
-    12574: 111,
-    12573: 111,
-    12572: 111,
-    12571: 111,
-    12570: 111,
-    12569: 111,
-    12568: 111,
-    12567: 111,
-    12566: 111,
-    12565: 111,
-    12564: 111,
-    12563: 111,
-    12562: 111,
-    12561: 111,
-    12560: 111,
-    12559: 111,
-    12558: 111,
-    12557: 111,
-    12556: 111,
-    12555: 111,
-    12554: 111,
-    12553: 111,
-    12552: 111,
-    12551: 111,
-    12550: 112,
-    12549: 112,
-    12548: 112,
-    12547: 112,
-    12546: 112,
-    12545: 112,
-    12544: 112,
-    12543: 112,
-    12542: 112,
-    12541: 112,
-    12540: 112,
-    12539: 112,
-    12538: 112,
-    12537: 112,
-    12536: 112,
-    12535: 112,
-    12534: 112,
-    12533: 112,
-    12532: 112,
-    12531: 112,
-    12530: 112,
-    12529: 112,
-    12528: 112,
-    12527: 112,
-    12526: 112,
-    12525: 112,
-    12524: 112,
-    12523: 112,
-    12522: 112,
-    12521: 112,
-    12520: 112,
-    12519: 112,
-    12518: 112,
-    12517: 112,
-    12516: 112,
-    12515: 112,
-    12514: 112,
-    12513: 112,
-    12512: 112,
-    12511: 112,
-    12510: 113,
-    12509: 113,
-    12508: 113,
-    12507: 113,
-    12506: 113,
-    12505: 113,
-    12504: 113,
-    12503: 113,
-    12502: 113,
-    12501: 113,
-    12500: 113,
-    12499: 113,
-    12498: 113,
-    12497: 113,
-    12496: 113,
-    12495: 113,
-    12494: 113,
-    12493: 113,
-    12492: 113,
-    12491: 113,
-    12490: 113,
-    12489: 113,
-    12488: 113,
-    12487: 113,
-    12486: 113,
-    12485: 113,
-    12484: 113,
-    12483: 113,
-    12482: 113,
-    12481: 113,
-    12480: 114,
-    12479: 114,
-    12478: 114,
-    12477: 114,
-    12476: 114,
-    12475: 114,
-    12474: 114,
-    12473: 114,
-    12472: 114,
-    12471: 114,
-    12470: 114,
-    12469: 114,
-    12468: 114,
-    12467: 114,
-    12466: 114,
-    12465: 114,
-    12464: 114,
-    12463: 114,
-    12462: 114,
-    12461: 114,
-    12460: 114,
-    12459: 114,
-    12458: 114,
-    12457: 114,
-    12456: 114,
-    12455: 114,
-    12454: 114,
-    12453: 114,
-    12452: 114,
-    12451: 114,
-    12450: 114,
-    12449: 114,
-    12448: 114,
-    12447: 114,
-    12446: 114,
-    12445: 114,
-    12444: 114,
-    12443: 114,
-    12442: 114,
-    12441: 114,
-    12440: 115,
-    12439: 115,
-    12438: 115,
-    12437: 115,
-    12436: 115,
-    12435: 115,
-    12434: 115,
-    12433: 115,
-    12432: 115,
-    12431: 115,
-    12430: 115,
-    12429: 115,
-    12428: 115,
-    12427: 115,
-    12426: 115,
-    12425: 115,
-    12424: 115,
-    12423: 115,
-    12422: 115,
-    12421: 115,
-    12420: 115,
-    12419: 115,
-    12418: 115,
-    12417: 115,
-    12416: 115,
-    12415: 115,
-    12414: 115,
-    12413: 115,
-    12412: 115,
-    12411: 115,
-    12410: 116,
-    12409: 116,
-    12408: 116,
-    12407: 116,
-    12406: 116,
-    12405: 116,
-    12404: 116,
-    12403: 116,
-    12402: 116,
-    12401: 116,
-    12400: 116,
-    12399: 116,
-    12398: 116,
-    12397: 116,
-    12396: 116,
-    12395: 116,
-    12394: 116,
-    12393: 116,
-    12392: 116,
-    12391: 116,
-    12390: 116,
-    12389: 116,
-    12388: 116,
-    12387: 116,
-    12386: 116,
-    12385: 116,
-    12384: 116,
-    12383: 116,
-    12382: 116,
-    12381: 116,
-    12380: 116,
-    12379: 116,
-    12378: 116,
-    12377: 116,
-    12376: 116,
-    12375: 116,
-    12374: 116,
-    12373: 116,
-    12372: 116,
-    12371: 116,
-    12370: 117,
-    12369: 117,
-    12368: 117,
-    12367: 117,
-    12366: 117,
-    12365: 117,
-    12364: 117,
-    12363: 117,
-    12362: 117,
-    12361: 117,
-    12360: 117,
-    12359: 117,
-    12358: 117,
-    12357: 117,
-    12356: 117,
-    12355: 117,
-    12354: 117,
-    12353: 117,
-    12352: 117,
-    12351: 117,
-    12350: 117,
-    12349: 117,
-    12348: 117,
-    12347: 117,
-    12346: 117,
-    12345: 117,
-    12344: 117,
-    12343: 117,
-    12342: 117,
-    12341: 117,
-    12340: 118,
-    12339: 118,
-    12338: 118,
-    12337: 118,
-    12336: 118,
-    12335: 118,
-    12334: 118,
-    12333: 118,
-    12332: 118,
-    12331: 118,
-    12330: 118,
-    12329: 118,
-    12328: 118,
-    12327: 118,
-    12326: 118,
-    12325: 118,
-    12324: 118,
-    12323: 118,
-    12322: 118,
-    12321: 118,
-    12320: 118,
-    12319: 118,
-    12318: 118,
-    12317: 118,
-    12316: 118,
-    12315: 118,
-    12314: 118,
-    12313: 118,
-    12312: 118,
-    12311: 118,
-    12310: 118,
-    12309: 118,
-    12308: 118,
-    12307: 118,
-    12306: 118,
-    12305: 118,
-    12304: 118,
-    12303: 118,
-    12302: 118,
-    12301: 118,
-    12300: 119,
-    12299: 119,
-    12298: 119,
-    12297: 119,
-    12296: 119,
-    12295: 119,
-    12294: 119,
-    12293: 119,
-    12292: 119,
-    12291: 119,
-    12290: 119,
-    12289: 119,
-    12288: 119,
-    12287: 119,
-    12286: 119,
-    12285: 119,
-    12284: 119,
-    12283: 119,
-    12282: 119,
-    12281: 119,
-    12280: 119,
-    12279: 119,
-    12278: 119,
-    12277: 119,
-    12276: 119,
-    12275: 119,
-    12274: 119,
-    12273: 119,
-    12272: 119,
-    12271: 119,
-    12270: 120,
-    12269: 120,
-    12268: 120,
-    12267: 120,
-    12266: 120,
-    12265: 120,
-    12264: 120,
-    12263: 120,
-    12262: 120,
-    12261: 120,
-    12260: 120,
-    12259: 120,
-    12258: 120,
-    12257: 120,
-    12256: 120,
-    12255: 120,
-    12254: 120,
-    12253: 120,
-    12252: 120,
-    12251: 120,
-    12250: 120,
-    12249: 120,
-    12248: 120,
-    12247: 120,
-    12246: 120,
-    12245: 120,
-    12244: 120,
-    12243: 120,
-    12242: 120,
-    12241: 120,
-    12240: 121,
-    12239: 121,
-    12238: 121,
-    12237: 121,
-    12236: 121,
-    12235: 121,
-    12234: 121,
-    12233: 121,
-    12232: 121,
-    12231: 121,
-    12230: 121,
-    12229: 121,
-    12228: 121,
-    12227: 121,
-    12226: 121,
-    12225: 121,
-    12224: 121,
-    12223: 121,
-    12222: 121,
-    12221: 121,
-    12220: 121,
-    12219: 121,
-    12218: 121,
-    12217: 121,
-    12216: 121,
-    12215: 121,
-    12214: 121,
-    12213: 121,
-    12212: 121,
-    12211: 121,
-    12210: 122,
-    12209: 122,
-    12208: 122,
-    12207: 122,
-    12206: 122,
-    12205: 122,
-    12204: 122,
-    12203: 122,
-    12202: 122,
-    12201: 122,
-    12200: 122,
-    12199: 122,
-    12198: 122,
-    12197: 122,
-    12196: 122,
-    12195: 122,
-    12194: 122,
-    12193: 122,
-    12192: 122,
-    12191: 122,
-    12190: 122,
-    12189: 122,
-    12188: 122,
-    12187: 122,
-    12186: 122,
-    12185: 122,
-    12184: 122,
-    12183: 122,
-    12182: 122,
-    12181: 122,
-    12180: 123,
-    12179: 123,
-    12178: 123,
-    12177: 123,
-    12176: 123,
-    12175: 123,
-    12174: 123,
-    12173: 123,
-    12172: 123,
-    12171: 123,
-    12170: 123,
-    12169: 123,
-    12168: 123,
-    12167: 123,
-    12166: 123,
-    12165: 123,
-    12164: 123,
-    12163: 123,
-    12162: 123,
-    12161: 123,
-    12160: 123,
-    12159: 123,
-    12158: 123,
-    12157: 123,
-    12156: 123,
-    12155: 123,
-    12154: 123,
-    12153: 123,
-    12152: 123,
-    12151: 123,
-    12150: 124,
-    12149: 124,
-    12148: 124,
-    12147: 124,
-    12146: 124,
-    12145: 124,
-    12144: 124,
-    12143: 124,
-    12142: 124,
-    12141: 124,
-    12140: 124,
-    12139: 124,
-    12138: 124,
-    12137: 124,
-    12136: 124,
-    12135: 124,
-    12134: 124,
-    12133: 124,
-    12132: 124,
-    12131: 124,
-    12130: 124,
-    12129: 124,
-    12128: 124,
-    12127: 124,
-    12126: 124,
-    12125: 124,
-    12124: 124,
-    12123: 124,
-    12122: 124,
-    12121: 124,
-    12120: 125,
-    12119: 125,
-    12118: 125,
-    12117: 125,
-    12116: 125,
-    12115: 125,
-    12114: 125,
-    12113: 125,
-    12112: 125,
-    12111: 125,
-    12110: 125,
-    12109: 125,
-    12108: 125,
-    12107: 125,
-    12106: 125,
-    12105: 125,
-    12104: 125,
-    12103: 125,
-    12102: 125,
-    12101: 125,
-    12100: 125,
-    12099: 125,
-    12098: 125,
-    12097: 125,
-    12096: 125,
-    12095: 125,
-    12094: 125,
-    12093: 125,
-    12092: 125,
-    12091: 125,
-    12090: 126,
-    12089: 126,
-    12088: 126,
-    12087: 126,
-    12086: 126,
-    12085: 126,
-    12084: 126,
-    12083: 126,
-    12082: 126,
-    12081: 126,
-    12080: 126,
-    12079: 126,
-    12078: 126,
-    12077: 126,
-    12076: 126,
-    12075: 126,
-    12074: 126,
-    12073: 126,
-    12072: 126,
-    12071: 126,
-    12070: 126,
-    12069: 126,
-    12068: 126,
-    12067: 126,
-    12066: 126,
-    12065: 126,
-    12064: 126,
-    12063: 126,
-    12062: 126,
-    12061: 126,
-    12060: 127,
-    12059: 127,
-    12058: 127,
-    12057: 127,
-    12056: 127,
-    12055: 127,
-    12054: 127,
-    12053: 127,
-    12052: 127,
-    12051: 127,
-    12050: 127,
-    12049: 127,
-    12048: 127,
-    12047: 127,
-    12046: 127,
-    12045: 127,
-    12044: 127,
-    12043: 127,
-    12042: 127,
-    12041: 127,
-    12040: 127,
-    12039: 127,
-    12038: 127,
-    12037: 127,
-    12036: 127,
-    12035: 127,
-    12034: 127,
-    12033: 127,
-    12032: 127,
-    12031: 127,
-    12030: 128,
-    12029: 128,
-    12028: 128,
-    12027: 128,
-    12026: 128,
-    12025: 128,
-    12024: 128,
-    12023: 128,
-    12022: 128,
-    12021: 128,
-    12020: 128,
-    12019: 128,
-    12018: 128,
-    12017: 128,
-    12016: 128,
-    12015: 128,
-    12014: 128,
-    12013: 128,
-    12012: 128,
-    12011: 128,
-    12010: 128,
-    12009: 128,
-    12008: 128,
-    12007: 128,
-    12006: 128,
-    12005: 128,
-    12004: 128,
-    12003: 128,
-    12002: 128,
-    12001: 128,
-    12000: 129,
-    11999: 129,
-    11998: 129,
-    11997: 129,
-    11996: 129,
-    11995: 129,
-    11994: 129,
-    11993: 129,
-    11992: 129,
-    11991: 129,
-    11990: 129,
-    11989: 129,
-    11988: 129,
-    11987: 129,
-    11986: 129,
-    11985: 129,
-    11984: 129,
-    11983: 129,
-    11982: 129,
-    11981: 129,
-    11980: 130,
-    11979: 130,
-    11978: 130,
-    11977: 130,
-    11976: 130,
-    11975: 130,
-    11974: 130,
-    11973: 130,
-    11972: 130,
-    11971: 130,
-    11970: 130,
-    11969: 130,
-    11968: 130,
-    11967: 130,
-    11966: 130,
-    11965: 130,
-    11964: 130,
-    11963: 130,
-    11962: 130,
-    11961: 130,
-    11960: 130,
-    11959: 130,
-    11958: 130,
-    11957: 130,
-    11956: 130,
-    11955: 130,
-    11954: 130,
-    11953: 130,
-    11952: 130,
-    11951: 130,
-    11950: 131,
-    11949: 131,
-    11948: 131,
-    11947: 131,
-    11946: 131,
-    11945: 131,
-    11944: 131,
-    11943: 131,
-    11942: 131,
-    11941: 131,
-    11940: 131,
-    11939: 131,
-    11938: 131,
-    11937: 131,
-    11936: 131,
-    11935: 131,
-    11934: 131,
-    11933: 131,
-    11932: 131,
-    11931: 131,
-    11930: 132,
-    11929: 132,
-    11928: 132,
-    11927: 132,
-    11926: 132,
-    11925: 132,
-    11924: 132,
-    11923: 132,
-    11922: 132,
-    11921: 132,
-    11920: 132,
-    11919: 132,
-    11918: 132,
-    11917: 132,
-    11916: 132,
-    11915: 132,
-    11914: 132,
-    11913: 132,
-    11912: 132,
-    11911: 132,
-    11910: 132,
-    11909: 132,
-    11908: 132,
-    11907: 132,
-    11906: 132,
-    11905: 132,
-    11904: 132,
-    11903: 132,
-    11902: 132,
-    11901: 132,
-    11900: 133,
-    11899: 133,
-    11898: 133,
-    11897: 133,
-    11896: 133,
-    11895: 133,
-    11894: 133,
-    11893: 133,
-    11892: 133,
-    11891: 133,
-    11890: 133,
-    11889: 133,
-    11888: 133,
-    11887: 133,
-    11886: 133,
-    11885: 133,
-    11884: 133,
-    11883: 133,
-    11882: 133,
-    11881: 133,
-    11880: 134,
-    11879: 134,
-    11878: 134,
-    11877: 134,
-    11876: 134,
-    11875: 134,
-    11874: 134,
-    11873: 134,
-    11872: 134,
-    11871: 134,
-    11870: 134,
-    11869: 134,
-    11868: 134,
-    11867: 134,
-    11866: 134,
-    11865: 134,
-    11864: 134,
-    11863: 134,
-    11862: 134,
-    11861: 134,
-    11860: 134,
-    11859: 134,
-    11858: 134,
-    11857: 134,
-    11856: 134,
-    11855: 134,
-    11854: 134,
-    11853: 134,
-    11852: 134,
-    11851: 134,
-    11850: 135,
-    11849: 135,
-    11848: 135,
-    11847: 135,
-    11846: 135,
-    11845: 135,
-    11844: 135,
-    11843: 135,
-    11842: 135,
-    11841: 135,
-    11840: 135,
-    11839: 135,
-    11838: 135,
-    11837: 135,
-    11836: 135,
-    11835: 135,
-    11834: 135,
-    11833: 135,
-    11832: 135,
-    11831: 135,
-    11830: 136,
-    11829: 136,
-    11828: 136,
-    11827: 136,
-    11826: 136,
-    11825: 136,
-    11824: 136,
-    11823: 136,
-    11822: 136,
-    11821: 136,
-    11820: 136,
-    11819: 136,
-    11818: 136,
-    11817: 136,
-    11816: 136,
-    11815: 136,
-    11814: 136,
-    11813: 136,
-    11812: 136,
-    11811: 136,
-    11810: 137,
-    11809: 137,
-    11808: 137,
-    11807: 137,
-    11806: 137,
-    11805: 137,
-    11804: 137,
-    11803: 137,
-    11802: 137,
-    11801: 137,
-    11800: 137,
-    11799: 137,
-    11798: 137,
-    11797: 137,
-    11796: 137,
-    11795: 137,
-    11794: 137,
-    11793: 137,
-    11792: 137,
-    11791: 137,
-    11790: 138,
-    11789: 138,
-    11788: 138,
-    11787: 138,
-    11786: 138,
-    11785: 138,
-    11784: 138,
-    11783: 138,
-    11782: 138,
-    11781: 138,
-    11780: 138,
-    11779: 138,
-    11778: 138,
-    11777: 138,
-    11776: 138,
-    11775: 138,
-    11774: 138,
-    11773: 138,
-    11772: 138,
-    11771: 138,
-    11770: 138,
-    11769: 138,
-    11768: 138,
-    11767: 138,
-    11766: 138,
-    11765: 138,
-    11764: 138,
-    11763: 138,
-    11762: 138,
-    11761: 138,
-    11760: 139,
-    11759: 139,
-    11758: 139,
-    11757: 139,
-    11756: 139,
-    11755: 139,
-    11754: 139,
-    11753: 139,
-    11752: 139,
-    11751: 139,
-    11750: 139,
-    11749: 139,
-    11748: 139,
-    11747: 139,
-    11746: 139,
-    11745: 139,
-    11744: 139,
-    11743: 139,
-    11742: 139,
-    11741: 139,
-    11740: 140,
-    11739: 140,
-    11738: 140,
-    11737: 140,
-    11736: 140,
-    11735: 140,
-    11734: 140,
-    11733: 140,
-    11732: 140,
-    11731: 140,
-    11730: 140,
-    11729: 140,
-    11728: 140,
-    11727: 140,
-    11726: 140,
-    11725: 140,
-    11724: 140,
-    11723: 140,
-    11722: 140,
-    11721: 140,
-    11720: 140,
-    11719: 140,
-    11718: 140,
-    11717: 140,
-    11716: 140,
-    11715: 140,
-    11714: 140,
-    11713: 140,
-    11712: 140,
-    11711: 140,
-    11710: 140,
-    11709: 140,
-    11708: 140,
-    11707: 140,
-    11706: 140,
-    11705: 140,
-    11704: 140,
-    11703: 140,
-    11702: 140,
-    11701: 140,
-    11700: 141,
-    11699: 141,
-    11698: 141,
-    11697: 141,
-    11696: 141,
-    11695: 141,
-    11694: 141,
-    11693: 141,
-    11692: 141,
-    11691: 141,
-    11690: 142,
-    11689: 142,
-    11688: 142,
-    11687: 142,
-    11686: 142,
-    11685: 142,
-    11684: 142,
-    11683: 142,
-    11682: 142,
-    11681: 142,
-    11680: 142,
-    11679: 142,
-    11678: 142,
-    11677: 142,
-    11676: 142,
-    11675: 142,
-    11674: 142,
-    11673: 142,
-    11672: 142,
-    11671: 142,
-    11670: 143,
-    11669: 143,
-    11668: 143,
-    11667: 143,
-    11666: 143,
-    11665: 143,
-    11664: 143,
-    11663: 143,
-    11662: 143,
-    11661: 143,
-    11660: 143,
-    11659: 143,
-    11658: 143,
-    11657: 143,
-    11656: 143,
-    11655: 143,
-    11654: 143,
-    11653: 143,
-    11652: 143,
-    11651: 143,
-    11650: 144,
-    11649: 144,
-    11648: 144,
-    11647: 144,
-    11646: 144,
-    11645: 144,
-    11644: 144,
-    11643: 144,
-    11642: 144,
-    11641: 144,
-    11640: 144,
-    11639: 144,
-    11638: 144,
-    11637: 144,
-    11636: 144,
-    11635: 144,
-    11634: 144,
-    11633: 144,
-    11632: 144,
-    11631: 144,
-    11630: 145,
-    11629: 145,
-    11628: 145,
-    11627: 145,
-    11626: 145,
-    11625: 145,
-    11624: 145,
-    11623: 145,
-    11622: 145,
-    11621: 145,
-    11620: 145,
-    11619: 145,
-    11618: 145,
-    11617: 145,
-    11616: 145,
-    11615: 145,
-    11614: 145,
-    11613: 145,
-    11612: 145,
-    11611: 145,
-    11610: 146,
-    11609: 146,
-    11608: 146,
-    11607: 146,
-    11606: 146,
-    11605: 146,
-    11604: 146,
-    11603: 146,
-    11602: 146,
-    11601: 146,
-    11600: 147,
-    11599: 147,
-    11598: 147,
-    11597: 147,
-    11596: 147,
-    11595: 147,
-    11594: 147,
-    11593: 147,
-    11592: 147,
-    11591: 147,
-    11590: 147,
-    11589: 147,
-    11588: 147,
-    11587: 147,
-    11586: 147,
-    11585: 147,
-    11584: 147,
-    11583: 147,
-    11582: 147,
-    11581: 147,
-    11580: 147,
-    11579: 147,
-    11578: 147,
-    11577: 147,
-    11576: 147,
-    11575: 147,
-    11574: 147,
-    11573: 147,
-    11572: 147,
-    11571: 147,
-    11570: 148,
-    11569: 148,
-    11568: 148,
-    11567: 148,
-    11566: 148,
-    11565: 148,
-    11564: 148,
-    11563: 148,
-    11562: 148,
-    11561: 148,
-    11560: 148,
-    11559: 148,
-    11558: 148,
-    11557: 148,
-    11556: 148,
-    11555: 148,
-    11554: 148,
-    11553: 148,
-    11552: 148,
-    11551: 148,
-    11550: 149,
-    11549: 149,
-    11548: 149,
-    11547: 149,
-    11546: 149,
-    11545: 149,
-    11544: 149,
-    11543: 149,
-    11542: 149,
-    11541: 149,
-    11540: 149,
-    11539: 149,
-    11538: 149,
-    11537: 149,
-    11536: 149,
-    11535: 149,
-    11534: 149,
-    11533: 149,
-    11532: 149,
-    11531: 149,
-    11530: 150
-  },
-  'U16M60H': {
-    'min': 1370,
-    'max': 840,
-    1370: 1,
-    1369: 1,
-    1368: 1,
-    1367: 1,
-    1366: 1,
-    1365: 1,
-    1364: 1,
-    1363: 1,
-    1362: 1,
-    1361: 1,
-    1360: 2,
-    1359: 2,
-    1358: 2,
-    1357: 2,
-    1356: 2,
-    1355: 2,
-    1354: 2,
-    1353: 2,
-    1352: 2,
-    1351: 2,
-    1350: 3,
-    1349: 3,
-    1348: 3,
-    1347: 3,
-    1346: 3,
-    1345: 3,
-    1344: 3,
-    1343: 3,
-    1342: 3,
-    1341: 3,
-    1340: 4,
-    1339: 4,
-    1338: 4,
-    1337: 4,
-    1336: 4,
-    1335: 4,
-    1334: 4,
-    1333: 4,
-    1332: 4,
-    1331: 4,
-    1330: 5,
-    1329: 5,
-    1328: 5,
-    1327: 5,
-    1326: 5,
-    1325: 5,
-    1324: 5,
-    1323: 5,
-    1322: 5,
-    1321: 5,
-    1320: 7,
-    1319: 7,
-    1318: 7,
-    1317: 7,
-    1316: 7,
-    1315: 7,
-    1314: 7,
-    1313: 7,
-    1312: 7,
-    1311: 7,
-    1310: 8,
-    1309: 8,
-    1308: 8,
-    1307: 8,
-    1306: 8,
-    1305: 8,
-    1304: 8,
-    1303: 8,
-    1302: 8,
-    1301: 8,
-    1300: 9,
-    1299: 9,
-    1298: 9,
-    1297: 9,
-    1296: 9,
-    1295: 9,
-    1294: 9,
-    1293: 9,
-    1292: 9,
-    1291: 9,
-    1290: 10,
-    1289: 10,
-    1288: 10,
-    1287: 10,
-    1286: 10,
-    1285: 10,
-    1284: 10,
-    1283: 10,
-    1282: 10,
-    1281: 10,
-    1280: 12,
-    1279: 12,
-    1278: 12,
-    1277: 12,
-    1276: 12,
-    1275: 12,
-    1274: 12,
-    1273: 12,
-    1272: 12,
-    1271: 12,
-    1270: 13,
-    1269: 13,
-    1268: 13,
-    1267: 13,
-    1266: 13,
-    1265: 13,
-    1264: 13,
-    1263: 13,
-    1262: 13,
-    1261: 13,
-    1260: 14,
-    1259: 14,
-    1258: 14,
-    1257: 14,
-    1256: 14,
-    1255: 14,
-    1254: 14,
-    1253: 14,
-    1252: 14,
-    1251: 14,
-    1250: 16,
-    1249: 16,
-    1248: 16,
-    1247: 16,
-    1246: 16,
-    1245: 16,
-    1244: 16,
-    1243: 16,
-    1242: 16,
-    1241: 16,
-    1240: 17,
-    1239: 17,
-    1238: 17,
-    1237: 17,
-    1236: 17,
-    1235: 17,
-    1234: 17,
-    1233: 17,
-    1232: 17,
-    1231: 17,
-    1230: 18,
-    1229: 18,
-    1228: 18,
-    1227: 18,
-    1226: 18,
-    1225: 18,
-    1224: 18,
-    1223: 18,
-    1222: 18,
-    1221: 18,
-    1220: 20,
-    1219: 20,
-    1218: 20,
-    1217: 20,
-    1216: 20,
-    1215: 20,
-    1214: 20,
-    1213: 20,
-    1212: 20,
-    1211: 20,
-    1210: 21,
-    1209: 21,
-    1208: 21,
-    1207: 21,
-    1206: 21,
-    1205: 21,
-    1204: 21,
-    1203: 21,
-    1202: 21,
-    1201: 21,
-    1200: 23,
-    1199: 23,
-    1198: 23,
-    1197: 23,
-    1196: 23,
-    1195: 23,
-    1194: 23,
-    1193: 23,
-    1192: 23,
-    1191: 23,
-    1190: 24,
-    1189: 24,
-    1188: 24,
-    1187: 24,
-    1186: 24,
-    1185: 24,
-    1184: 24,
-    1183: 24,
-    1182: 24,
-    1181: 24,
-    1180: 26,
-    1179: 26,
-    1178: 26,
-    1177: 26,
-    1176: 26,
-    1175: 26,
-    1174: 26,
-    1173: 26,
-    1172: 26,
-    1171: 26,
-    1170: 27,
-    1169: 27,
-    1168: 27,
-    1167: 27,
-    1166: 27,
-    1165: 27,
-    1164: 27,
-    1163: 27,
-    1162: 27,
-    1161: 27,
-    1160: 29,
-    1159: 29,
-    1158: 29,
-    1157: 29,
-    1156: 29,
-    1155: 29,
-    1154: 29,
-    1153: 29,
-    1152: 29,
-    1151: 29,
-    1150: 30,
-    1149: 30,
-    1148: 30,
-    1147: 30,
-    1146: 30,
-    1145: 30,
-    1144: 30,
-    1143: 30,
-    1142: 30,
-    1141: 30,
-    1140: 32,
-    1139: 32,
-    1138: 32,
-    1137: 32,
-    1136: 32,
-    1135: 32,
-    1134: 32,
-    1133: 32,
-    1132: 32,
-    1131: 32,
-    1130: 33,
-    1129: 33,
-    1128: 33,
-    1127: 33,
-    1126: 33,
-    1125: 33,
-    1124: 33,
-    1123: 33,
-    1122: 33,
-    1121: 33,
-    1120: 35,
-    1119: 35,
-    1118: 35,
-    1117: 35,
-    1116: 35,
-    1115: 35,
-    1114: 35,
-    1113: 35,
-    1112: 35,
-    1111: 35,
-    1110: 36,
-    1109: 36,
-    1108: 36,
-    1107: 36,
-    1106: 36,
-    1105: 36,
-    1104: 36,
-    1103: 36,
-    1102: 36,
-    1101: 36,
-    1100: 38,
-    1099: 38,
-    1098: 38,
-    1097: 38,
-    1096: 38,
-    1095: 38,
-    1094: 38,
-    1093: 38,
-    1092: 38,
-    1091: 38,
-    1090: 40,
-    1089: 40,
-    1088: 40,
-    1087: 40,
-    1086: 40,
-    1085: 40,
-    1084: 40,
-    1083: 40,
-    1082: 40,
-    1081: 40,
-    1080: 42,
-    1079: 42,
-    1078: 42,
-    1077: 42,
-    1076: 42,
-    1075: 42,
-    1074: 42,
-    1073: 42,
-    1072: 42,
-    1071: 42,
-    1070: 44,
-    1069: 44,
-    1068: 44,
-    1067: 44,
-    1066: 44,
-    1065: 44,
-    1064: 44,
-    1063: 44,
-    1062: 44,
-    1061: 44,
-    1060: 46,
-    1059: 46,
-    1058: 46,
-    1057: 46,
-    1056: 46,
-    1055: 46,
-    1054: 46,
-    1053: 46,
-    1052: 46,
-    1051: 46,
-    1050: 48,
-    1049: 48,
-    1048: 48,
-    1047: 48,
-    1046: 48,
-    1045: 48,
-    1044: 48,
-    1043: 48,
-    1042: 48,
-    1041: 48,
-    1040: 50,
-    1039: 50,
-    1038: 50,
-    1037: 50,
-    1036: 50,
-    1035: 50,
-    1034: 50,
-    1033: 50,
-    1032: 50,
-    1031: 50,
-    1030: 52,
-    1029: 52,
-    1028: 52,
-    1027: 52,
-    1026: 52,
-    1025: 52,
-    1024: 52,
-    1023: 52,
-    1022: 52,
-    1021: 52,
-    1020: 54,
-    1019: 54,
-    1018: 54,
-    1017: 54,
-    1016: 54,
-    1015: 54,
-    1014: 54,
-    1013: 54,
-    1012: 54,
-    1011: 54,
-    1010: 56,
-    1009: 56,
-    1008: 56,
-    1007: 56,
-    1006: 56,
-    1005: 56,
-    1004: 56,
-    1003: 56,
-    1002: 56,
-    1001: 56,
-    1000: 58,
-    999: 58,
-    998: 58,
-    997: 58,
-    996: 58,
-    995: 58,
-    994: 58,
-    993: 58,
-    992: 58,
-    991: 58,
-    990: 61,
-    989: 61,
-    988: 61,
-    987: 61,
-    986: 61,
-    985: 61,
-    984: 61,
-    983: 61,
-    982: 61,
-    981: 61,
-    980: 64,
-    979: 64,
-    978: 64,
-    977: 64,
-    976: 64,
-    975: 64,
-    974: 64,
-    973: 64,
-    972: 64,
-    971: 64,
-    970: 67,
-    969: 67,
-    968: 67,
-    967: 67,
-    966: 67,
-    965: 67,
-    964: 67,
-    963: 67,
-    962: 67,
-    961: 67,
-    960: 70,
-    959: 70,
-    958: 70,
-    957: 70,
-    956: 70,
-    955: 70,
-    954: 70,
-    953: 70,
-    952: 70,
-    951: 70,
-    950: 74,
-    949: 74,
-    948: 74,
-    947: 74,
-    946: 74,
-    945: 74,
-    944: 74,
-    943: 74,
-    942: 74,
-    941: 74,
-    940: 78,
-    939: 78,
-    938: 78,
-    937: 78,
-    936: 78,
-    935: 78,
-    934: 78,
-    933: 78,
-    932: 78,
-    931: 78,
-    930: 82,
-    929: 82,
-    928: 82,
-    927: 82,
-    926: 82,
-    925: 82,
-    924: 82,
-    923: 82,
-    922: 82,
-    921: 82,
-    920: 87,
-    919: 87,
-    918: 87,
-    917: 87,
-    916: 87,
-    915: 87,
-    914: 87,
-    913: 87,
-    912: 87,
-    911: 87,
-    910: 93,
-    909: 93,
-    908: 93,
-    907: 93,
-    906: 93,
-    905: 93,
-    904: 93,
-    903: 93,
-    902: 93,
-    901: 93,
-    900: 99,
-    899: 99,
-    898: 99,
-    897: 99,
-    896: 99,
-    895: 99,
-    894: 99,
-    893: 99,
-    892: 99,
-    891: 99,
-    890: 105,
-    889: 105,
-    888: 105,
-    887: 105,
-    886: 105,
-    885: 105,
-    884: 105,
-    883: 105,
-    882: 105,
-    881: 105,
-    880: 112,
-    879: 112,
-    878: 112,
-    877: 112,
-    876: 112,
-    875: 112,
-    874: 112,
-    873: 112,
-    872: 112,
-    871: 112,
-    870: 119,
-    869: 119,
-    868: 119,
-    867: 119,
-    866: 119,
-    865: 119,
-    864: 119,
-    863: 119,
-    862: 119,
-    861: 119,
-    860: 128,
-    859: 128,
-    858: 128,
-    857: 128,
-    856: 128,
-    855: 128,
-    854: 128,
-    853: 128,
-    852: 128,
-    851: 128,
-    850: 138,
-    849: 138,
-    848: 138,
-    847: 138,
-    846: 138,
-    845: 138,
-    844: 138,
-    843: 138,
-    842: 138,
-    841: 138,
-    840: 150
-  },
-  'U16M100H': {
-    'min': 1830,
-    'max': 1300,
-    1830: 1,
-    1829: 1,
-    1828: 1,
-    1827: 1,
-    1826: 1,
-    1825: 1,
-    1824: 1,
-    1823: 1,
-    1822: 1,
-    1821: 1,
-    1820: 2,
-    1819: 2,
-    1818: 2,
-    1817: 2,
-    1816: 2,
-    1815: 2,
-    1814: 2,
-    1813: 2,
-    1812: 2,
-    1811: 2,
-    1810: 3,
-    1809: 3,
-    1808: 3,
-    1807: 3,
-    1806: 3,
-    1805: 3,
-    1804: 3,
-    1803: 3,
-    1802: 3,
-    1801: 3,
-    1800: 4,
-    1799: 4,
-    1798: 4,
-    1797: 4,
-    1796: 4,
-    1795: 4,
-    1794: 4,
-    1793: 4,
-    1792: 4,
-    1791: 4,
-    1790: 5,
-    1789: 5,
-    1788: 5,
-    1787: 5,
-    1786: 5,
-    1785: 5,
-    1784: 5,
-    1783: 5,
-    1782: 5,
-    1781: 5,
-    1780: 7,
-    1779: 7,
-    1778: 7,
-    1777: 7,
-    1776: 7,
-    1775: 7,
-    1774: 7,
-    1773: 7,
-    1772: 7,
-    1771: 7,
-    1770: 8,
-    1769: 8,
-    1768: 8,
-    1767: 8,
-    1766: 8,
-    1765: 8,
-    1764: 8,
-    1763: 8,
-    1762: 8,
-    1761: 8,
-    1760: 9,
-    1759: 9,
-    1758: 9,
-    1757: 9,
-    1756: 9,
-    1755: 9,
-    1754: 9,
-    1753: 9,
-    1752: 9,
-    1751: 9,
-    1750: 10,
-    1749: 10,
-    1748: 10,
-    1747: 10,
-    1746: 10,
-    1745: 10,
-    1744: 10,
-    1743: 10,
-    1742: 10,
-    1741: 10,
-    1740: 12,
-    1739: 12,
-    1738: 12,
-    1737: 12,
-    1736: 12,
-    1735: 12,
-    1734: 12,
-    1733: 12,
-    1732: 12,
-    1731: 12,
-    1730: 13,
-    1729: 13,
-    1728: 13,
-    1727: 13,
-    1726: 13,
-    1725: 13,
-    1724: 13,
-    1723: 13,
-    1722: 13,
-    1721: 13,
-    1720: 14,
-    1719: 14,
-    1718: 14,
-    1717: 14,
-    1716: 14,
-    1715: 14,
-    1714: 14,
-    1713: 14,
-    1712: 14,
-    1711: 14,
-    1710: 16,
-    1709: 16,
-    1708: 16,
-    1707: 16,
-    1706: 16,
-    1705: 16,
-    1704: 16,
-    1703: 16,
-    1702: 16,
-    1701: 16,
-    1700: 17,
-    1699: 17,
-    1698: 17,
-    1697: 17,
-    1696: 17,
-    1695: 17,
-    1694: 17,
-    1693: 17,
-    1692: 17,
-    1691: 17,
-    1690: 18,
-    1689: 18,
-    1688: 18,
-    1687: 18,
-    1686: 18,
-    1685: 18,
-    1684: 18,
-    1683: 18,
-    1682: 18,
-    1681: 18,
-    1680: 20,
-    1679: 20,
-    1678: 20,
-    1677: 20,
-    1676: 20,
-    1675: 20,
-    1674: 20,
-    1673: 20,
-    1672: 20,
-    1671: 20,
-    1670: 21,
-    1669: 21,
-    1668: 21,
-    1667: 21,
-    1666: 21,
-    1665: 21,
-    1664: 21,
-    1663: 21,
-    1662: 21,
-    1661: 21,
-    1660: 23,
-    1659: 23,
-    1658: 23,
-    1657: 23,
-    1656: 23,
-    1655: 23,
-    1654: 23,
-    1653: 23,
-    1652: 23,
-    1651: 23,
-    1650: 24,
-    1649: 24,
-    1648: 24,
-    1647: 24,
-    1646: 24,
-    1645: 24,
-    1644: 24,
-    1643: 24,
-    1642: 24,
-    1641: 24,
-    1640: 26,
-    1639: 26,
-    1638: 26,
-    1637: 26,
-    1636: 26,
-    1635: 26,
-    1634: 26,
-    1633: 26,
-    1632: 26,
-    1631: 26,
-    1630: 27,
-    1629: 27,
-    1628: 27,
-    1627: 27,
-    1626: 27,
-    1625: 27,
-    1624: 27,
-    1623: 27,
-    1622: 27,
-    1621: 27,
-    1620: 29,
-    1619: 29,
-    1618: 29,
-    1617: 29,
-    1616: 29,
-    1615: 29,
-    1614: 29,
-    1613: 29,
-    1612: 29,
-    1611: 29,
-    1610: 30,
-    1609: 30,
-    1608: 30,
-    1607: 30,
-    1606: 30,
-    1605: 30,
-    1604: 30,
-    1603: 30,
-    1602: 30,
-    1601: 30,
-    1600: 32,
-    1599: 32,
-    1598: 32,
-    1597: 32,
-    1596: 32,
-    1595: 32,
-    1594: 32,
-    1593: 32,
-    1592: 32,
-    1591: 32,
-    1590: 33,
-    1589: 33,
-    1588: 33,
-    1587: 33,
-    1586: 33,
-    1585: 33,
-    1584: 33,
-    1583: 33,
-    1582: 33,
-    1581: 33,
-    1580: 35,
-    1579: 35,
-    1578: 35,
-    1577: 35,
-    1576: 35,
-    1575: 35,
-    1574: 35,
-    1573: 35,
-    1572: 35,
-    1571: 35,
-    1570: 36,
-    1569: 36,
-    1568: 36,
-    1567: 36,
-    1566: 36,
-    1565: 36,
-    1564: 36,
-    1563: 36,
-    1562: 36,
-    1561: 36,
-    1560: 38,
-    1559: 38,
-    1558: 38,
-    1557: 38,
-    1556: 38,
-    1555: 38,
-    1554: 38,
-    1553: 38,
-    1552: 38,
-    1551: 38,
-    1550: 40,
-    1549: 40,
-    1548: 40,
-    1547: 40,
-    1546: 40,
-    1545: 40,
-    1544: 40,
-    1543: 40,
-    1542: 40,
-    1541: 40,
-    1540: 42,
-    1539: 42,
-    1538: 42,
-    1537: 42,
-    1536: 42,
-    1535: 42,
-    1534: 42,
-    1533: 42,
-    1532: 42,
-    1531: 42,
-    1530: 44,
-    1529: 44,
-    1528: 44,
-    1527: 44,
-    1526: 44,
-    1525: 44,
-    1524: 44,
-    1523: 44,
-    1522: 44,
-    1521: 44,
-    1520: 46,
-    1519: 46,
-    1518: 46,
-    1517: 46,
-    1516: 46,
-    1515: 46,
-    1514: 46,
-    1513: 46,
-    1512: 46,
-    1511: 46,
-    1510: 48,
-    1509: 48,
-    1508: 48,
-    1507: 48,
-    1506: 48,
-    1505: 48,
-    1504: 48,
-    1503: 48,
-    1502: 48,
-    1501: 48,
-    1500: 50,
-    1499: 50,
-    1498: 50,
-    1497: 50,
-    1496: 50,
-    1495: 50,
-    1494: 50,
-    1493: 50,
-    1492: 50,
-    1491: 50,
-    1490: 52,
-    1489: 52,
-    1488: 52,
-    1487: 52,
-    1486: 52,
-    1485: 52,
-    1484: 52,
-    1483: 52,
-    1482: 52,
-    1481: 52,
-    1480: 54,
-    1479: 54,
-    1478: 54,
-    1477: 54,
-    1476: 54,
-    1475: 54,
-    1474: 54,
-    1473: 54,
-    1472: 54,
-    1471: 54,
-    1470: 56,
-    1469: 56,
-    1468: 56,
-    1467: 56,
-    1466: 56,
-    1465: 56,
-    1464: 56,
-    1463: 56,
-    1462: 56,
-    1461: 56,
-    1460: 58,
-    1459: 58,
-    1458: 58,
-    1457: 58,
-    1456: 58,
-    1455: 58,
-    1454: 58,
-    1453: 58,
-    1452: 58,
-    1451: 58,
-    1450: 61,
-    1449: 61,
-    1448: 61,
-    1447: 61,
-    1446: 61,
-    1445: 61,
-    1444: 61,
-    1443: 61,
-    1442: 61,
-    1441: 61,
-    1440: 64,
-    1439: 64,
-    1438: 64,
-    1437: 64,
-    1436: 64,
-    1435: 64,
-    1434: 64,
-    1433: 64,
-    1432: 64,
-    1431: 64,
-    1430: 67,
-    1429: 67,
-    1428: 67,
-    1427: 67,
-    1426: 67,
-    1425: 67,
-    1424: 67,
-    1423: 67,
-    1422: 67,
-    1421: 67,
-    1420: 70,
-    1419: 70,
-    1418: 70,
-    1417: 70,
-    1416: 70,
-    1415: 70,
-    1414: 70,
-    1413: 70,
-    1412: 70,
-    1411: 70,
-    1410: 74,
-    1409: 74,
-    1408: 74,
-    1407: 74,
-    1406: 74,
-    1405: 74,
-    1404: 74,
-    1403: 74,
-    1402: 74,
-    1401: 74,
-    1400: 78,
-    1399: 78,
-    1398: 78,
-    1397: 78,
-    1396: 78,
-    1395: 78,
-    1394: 78,
-    1393: 78,
-    1392: 78,
-    1391: 78,
-    1390: 82,
-    1389: 82,
-    1388: 82,
-    1387: 82,
-    1386: 82,
-    1385: 82,
-    1384: 82,
-    1383: 82,
-    1382: 82,
-    1381: 82,
-    1380: 87,
-    1379: 87,
-    1378: 87,
-    1377: 87,
-    1376: 87,
-    1375: 87,
-    1374: 87,
-    1373: 87,
-    1372: 87,
-    1371: 87,
-    1370: 93,
-    1369: 93,
-    1368: 93,
-    1367: 93,
-    1366: 93,
-    1365: 93,
-    1364: 93,
-    1363: 93,
-    1362: 93,
-    1361: 93,
-    1360: 99,
-    1359: 99,
-    1358: 99,
-    1357: 99,
-    1356: 99,
-    1355: 99,
-    1354: 99,
-    1353: 99,
-    1352: 99,
-    1351: 99,
-    1350: 105,
-    1349: 105,
-    1348: 105,
-    1347: 105,
-    1346: 105,
-    1345: 105,
-    1344: 105,
-    1343: 105,
-    1342: 105,
-    1341: 105,
-    1340: 112,
-    1339: 112,
-    1338: 112,
-    1337: 112,
-    1336: 112,
-    1335: 112,
-    1334: 112,
-    1333: 112,
-    1332: 112,
-    1331: 112,
-    1330: 119,
-    1329: 119,
-    1328: 119,
-    1327: 119,
-    1326: 119,
-    1325: 119,
-    1324: 119,
-    1323: 119,
-    1322: 119,
-    1321: 119,
-    1320: 128,
-    1319: 128,
-    1318: 128,
-    1317: 128,
-    1316: 128,
-    1315: 128,
-    1314: 128,
-    1313: 128,
-    1312: 128,
-    1311: 128,
-    1310: 138,
-    1309: 138,
-    1308: 138,
-    1307: 138,
-    1306: 138,
-    1305: 138,
-    1304: 138,
-    1303: 138,
-    1302: 138,
-    1301: 138,
-    1300: 150
-  },
-  'U16MHJ': {
-    'min': 94,
-    'max': 197,
-    94: 1,
-    95: 2,
-    96: 3,
-    97: 4,
-    98: 5,
-    99: 6,
-    100: 7,
-    101: 8,
-    102: 9,
-    103: 10,
-    104: 11,
-    105: 13,
-    106: 14,
-    107: 15,
-    108: 16,
-    109: 17,
-    110: 18,
-    111: 19,
-    112: 20,
-    113: 21,
-    114: 23,
-    115: 24,
-    116: 25,
-    117: 26,
-    118: 27,
-    119: 28,
-    120: 29,
-    121: 30,
-    122: 32,
-    123: 33,
-    124: 34,
-    125: 35,
-    126: 36,
-    127: 37,
-    128: 39,
-    129: 40,
-    130: 41,
-    131: 42,
-    132: 43,
-    133: 45,
-    134: 46,
-    135: 47,
-    136: 48,
-    137: 49,
-    138: 51,
-    139: 52,
-    140: 53,
-    141: 54,
-    142: 56,
-    143: 57,
-    144: 58,
-    145: 59,
-    146: 61,
-    147: 62,
-    148: 63,
-    149: 65,
-    150: 66,
-    151: 67,
-    152: 69,
-    153: 70,
-    154: 71,
-    155: 73,
-    156: 74,
-    157: 75,
-    158: 77,
-    159: 78,
-    160: 80,
-    161: 81,
-    162: 83,
-    163: 84,
-    164: 86,
-    165: 87,
-    166: 89,
-    167: 90,
-    168: 92,
-    169: 93,
-    170: 95,
-    171: 97,
-    172: 99,
-    173: 101,
-    174: 103,
-    175: 105,
-    176: 107,
-    177: 109,
-    178: 111,
-    179: 113,
-    180: 115,
-    181: 117,
-    182: 119,
-    183: 121,
-    184: 123,
-    185: 125,
-    186: 127,
-    187: 129,
-    188: 131,
-    189: 133,
-    190: 135,
-    191: 137,
-    192: 139,
-    193: 141,
-    194: 143,
-    195: 145,
-    196: 147,
-    197: 150
-  },
-  'U16MLJ': {
-    'min': 293,
-    'max': 700,
-    293: 1,
-    294: 1,
-    295: 2,
-    296: 2,
-    297: 3,
-    298: 3,
-    299: 4,
-    300: 4,
-    301: 5,
-    302: 5,
-    303: 6,
-    304: 6,
-    305: 7,
-    306: 7,
-    307: 8,
-    308: 8,
-    309: 9,
-    310: 9,
-    311: 10,
-    312: 10,
-    313: 11,
-    314: 11,
-    315: 12,
-    316: 12,
-    317: 13,
-    318: 13,
-    319: 14,
-    320: 14,
-    321: 15,
-    322: 15,
-    323: 16,
-    324: 16,
-    325: 17,
-    326: 17,
-    327: 18,
-    328: 18,
-    329: 19,
-    330: 19,
-    331: 20,
-    332: 20,
-    333: 21,
-    334: 21,
-    335: 22,
-    336: 22,
-    337: 23,
-    338: 23,
-    339: 24,
-    340: 24,
-    341: 25,
-    342: 25,
-    343: 26,
-    344: 26,
-    345: 27,
-    346: 27,
-    347: 28,
-    348: 28,
-    349: 28,
-    350: 29,
-    351: 29,
-    352: 30,
-    353: 30,
-    354: 30,
-    355: 30,
-    356: 31,
-    357: 31,
-    358: 31,
-    359: 32,
-    360: 32,
-    361: 32,
-    362: 33,
-    363: 33,
-    364: 33,
-    365: 34,
-    366: 34,
-    367: 34,
-    368: 35,
-    369: 35,
-    370: 35,
-    371: 36,
-    372: 36,
-    373: 36,
-    374: 37,
-    375: 37,
-    376: 37,
-    377: 37,
-    378: 38,
-    379: 38,
-    380: 38,
-    381: 38,
-    382: 39,
-    383: 39,
-    384: 39,
-    385: 39,
-    386: 40,
-    387: 40,
-    388: 40,
-    389: 40,
-    390: 41,
-    391: 41,
-    392: 41,
-    393: 41,
-    394: 42,
-    395: 42,
-    396: 42,
-    397: 42,
-    398: 43,
-    399: 43,
-    400: 43,
-    401: 43,
-    402: 44,
-    403: 44,
-    404: 44,
-    405: 44,
-    406: 45,
-    407: 45,
-    408: 45,
-    409: 45,
-    410: 46,
-    411: 46,
-    412: 46,
-    413: 46,
-    414: 47,
-    415: 47,
-    416: 47,
-    417: 47,
-    418: 48,
-    419: 48,
-    420: 48,
-    421: 48,
-    422: 49,
-    423: 49,
-    424: 49,
-    425: 49,
-    426: 50,
-    427: 50,
-    428: 50,
-    429: 50,
-    430: 51,
-    431: 51,
-    432: 51,
-    433: 51,
-    434: 52,
-    435: 52,
-    436: 52,
-    437: 52,
-    438: 53,
-    439: 53,
-    440: 53,
-    441: 53,
-    442: 54,
-    443: 54,
-    444: 54,
-    445: 54,
-    446: 55,
-    447: 55,
-    448: 55,
-    449: 55,
-    450: 56,
-    451: 56,
-    452: 56,
-    453: 56,
-    454: 57,
-    455: 57,
-    456: 57,
-    457: 57,
-    458: 58,
-    459: 58,
-    460: 58,
-    461: 58,
-    462: 59,
-    463: 59,
-    464: 59,
-    465: 59,
-    466: 60,
-    467: 60,
-    468: 60,
-    469: 60,
-    470: 61,
-    471: 61,
-    472: 61,
-    473: 61,
-    474: 62,
-    475: 62,
-    476: 63,
-    477: 63,
-    478: 63,
-    479: 63,
-    480: 63,
-    481: 63,
-    482: 64,
-    483: 64,
-    484: 64,
-    485: 64,
-    486: 65,
-    487: 65,
-    488: 65,
-    489: 65,
-    490: 66,
-    491: 66,
-    492: 66,
-    493: 66,
-    494: 67,
-    495: 67,
-    496: 67,
-    497: 67,
-    498: 68,
-    499: 68,
-    500: 68,
-    501: 68,
-    502: 69,
-    503: 69,
-    504: 69,
-    505: 69,
-    506: 70,
-    507: 70,
-    508: 70,
-    509: 70,
-    510: 71,
-    511: 71,
-    512: 71,
-    513: 71,
-    514: 72,
-    515: 72,
-    516: 72,
-    517: 73,
-    518: 73,
-    519: 73,
-    520: 73,
-    521: 74,
-    522: 74,
-    523: 74,
-    524: 75,
-    525: 75,
-    526: 75,
-    527: 76,
-    528: 76,
-    529: 76,
-    530: 77,
-    531: 77,
-    532: 77,
-    533: 78,
-    534: 78,
-    535: 78,
-    536: 79,
-    537: 79,
-    538: 79,
-    539: 80,
-    540: 80,
-    541: 81,
-    542: 81,
-    543: 81,
-    544: 82,
-    545: 82,
-    546: 82,
-    547: 83,
-    548: 83,
-    549: 83,
-    550: 84,
-    551: 84,
-    552: 85,
-    553: 85,
-    554: 85,
-    555: 86,
-    556: 86,
-    557: 86,
-    558: 87,
-    559: 87,
-    560: 88,
-    561: 88,
-    562: 88,
-    563: 89,
-    564: 89,
-    565: 89,
-    566: 90,
-    567: 90,
-    568: 91,
-    569: 91,
-    570: 91,
-    571: 92,
-    572: 92,
-    573: 92,
-    574: 93,
-    575: 93,
-    576: 94,
-    577: 94,
-    578: 94,
-    579: 95,
-    580: 95,
-    581: 95,
-    582: 96,
-    583: 96,
-    584: 97,
-    585: 97,
-    586: 97,
-    587: 98,
-    588: 98,
-    589: 98,
-    590: 99,
-    591: 99,
-    592: 100,
-    593: 100,
-    594: 100,
-    595: 101,
-    596: 101,
-    597: 101,
-    598: 102,
-    599: 102,
-    600: 103,
-    601: 103,
-    602: 103,
-    603: 104,
-    604: 104,
-    605: 104,
-    606: 105,
-    607: 105,
-    608: 106,
-    609: 106,
-    610: 106,
-    611: 107,
-    612: 107,
-    613: 107,
-    614: 108,
-    615: 108,
-    616: 109,
-    617: 109,
-    618: 109,
-    619: 110,
-    620: 110,
-    621: 110,
-    622: 111,
-    623: 111,
-    624: 112,
-    625: 112,
-    626: 112,
-    627: 113,
-    628: 113,
-    629: 113,
-    630: 114,
-    631: 114,
-    632: 115,
-    633: 115,
-    634: 115,
-    635: 116,
-    636: 116,
-    637: 117,
-    638: 117,
-    639: 117,
-    640: 118,
-    641: 118,
-    642: 119,
-    643: 119,
-    644: 120,
-    645: 120,
-    646: 121,
-    647: 121,
-    648: 122,
-    649: 122,
-    650: 123,
-    651: 123,
-    652: 124,
-    653: 124,
-    654: 125,
-    655: 125,
-    656: 126,
-    657: 126,
-    658: 127,
-    659: 127,
-    660: 128,
-    661: 128,
-    662: 129,
-    663: 129,
-    664: 130,
-    665: 130,
-    666: 131,
-    667: 131,
-    668: 132,
-    669: 132,
-    670: 133,
-    671: 133,
-    672: 134,
-    673: 134,
-    674: 135,
-    675: 135,
-    676: 136,
-    677: 136,
-    678: 137,
-    679: 137,
-    680: 138,
-    681: 138,
-    682: 139,
-    683: 139,
-    684: 140,
-    685: 140,
-    686: 141,
-    687: 141,
-    688: 142,
-    689: 143,
-    690: 143,
-    691: 144,
-    692: 144,
-    693: 145,
-    694: 146,
-    695: 146,
-    696: 147,
-    697: 148,
-    698: 148,
-    699: 149,
-    700: 150
-  },
-  'U16MSP': {
-    'min': 690,
-    'max': 1500,
-    690: 1,
-    691: 1,
-    692: 1,
-    693: 1,
-    694: 1,
-    695: 1,
-    696: 1,
-    697: 1,
-    698: 1,
-    699: 1,
-    700: 2,
-    701: 2,
-    702: 2,
-    703: 2,
-    704: 2,
-    705: 2,
-    706: 2,
-    707: 2,
-    708: 2,
-    709: 2,
-    710: 3,
-    711: 3,
-    712: 3,
-    713: 3,
-    714: 3,
-    715: 3,
-    716: 3,
-    717: 3,
-    718: 3,
-    719: 3,
-    720: 4,
-    721: 4,
-    722: 4,
-    723: 4,
-    724: 4,
-    725: 4,
-    726: 4,
-    727: 4,
-    728: 4,
-    729: 4,
-    730: 5,
-    731: 5,
-    732: 5,
-    733: 5,
-    734: 5,
-    735: 5,
-    736: 5,
-    737: 5,
-    738: 5,
-    739: 5,
-    740: 6,
-    741: 6,
-    742: 6,
-    743: 6,
-    744: 6,
-    745: 6,
-    746: 6,
-    747: 6,
-    748: 6,
-    749: 6,
-    750: 7,
-    751: 7,
-    752: 7,
-    753: 7,
-    754: 7,
-    755: 7,
-    756: 7,
-    757: 7,
-    758: 7,
-    759: 7,
-    760: 8,
-    761: 8,
-    762: 8,
-    763: 8,
-    764: 8,
-    765: 8,
-    766: 8,
-    767: 8,
-    768: 8,
-    769: 8,
-    770: 9,
-    771: 9,
-    772: 9,
-    773: 9,
-    774: 9,
-    775: 9,
-    776: 9,
-    777: 9,
-    778: 9,
-    779: 9,
-    780: 10,
-    781: 10,
-    782: 10,
-    783: 10,
-    784: 10,
-    785: 10,
-    786: 10,
-    787: 10,
-    788: 10,
-    789: 10,
-    790: 11,
-    791: 11,
-    792: 11,
-    793: 11,
-    794: 11,
-    795: 11,
-    796: 11,
-    797: 11,
-    798: 11,
-    799: 11,
-    800: 12,
-    801: 12,
-    802: 12,
-    803: 12,
-    804: 12,
-    805: 12,
-    806: 12,
-    807: 12,
-    808: 12,
-    809: 12,
-    810: 13,
-    811: 13,
-    812: 13,
-    813: 13,
-    814: 13,
-    815: 13,
-    816: 13,
-    817: 13,
-    818: 13,
-    819: 13,
-    820: 14,
-    821: 14,
-    822: 14,
-    823: 14,
-    824: 14,
-    825: 14,
-    826: 14,
-    827: 14,
-    828: 14,
-    829: 14,
-    830: 15,
-    831: 15,
-    832: 15,
-    833: 15,
-    834: 15,
-    835: 15,
-    836: 15,
-    837: 15,
-    838: 15,
-    839: 15,
-    840: 16,
-    841: 16,
-    842: 16,
-    843: 16,
-    844: 16,
-    845: 16,
-    846: 16,
-    847: 16,
-    848: 16,
-    849: 16,
-    850: 17,
-    851: 17,
-    852: 17,
-    853: 17,
-    854: 17,
-    855: 17,
-    856: 17,
-    857: 17,
-    858: 17,
-    859: 17,
-    860: 18,
-    861: 18,
-    862: 18,
-    863: 18,
-    864: 18,
-    865: 18,
-    866: 18,
-    867: 18,
-    868: 18,
-    869: 18,
-    870: 19,
-    871: 19,
-    872: 19,
-    873: 19,
-    874: 19,
-    875: 19,
-    876: 19,
-    877: 19,
-    878: 19,
-    879: 19,
-    880: 20,
-    881: 20,
-    882: 20,
-    883: 20,
-    884: 20,
-    885: 20,
-    886: 20,
-    887: 20,
-    888: 20,
-    889: 20,
-    890: 21,
-    891: 21,
-    892: 21,
-    893: 21,
-    894: 21,
-    895: 21,
-    896: 21,
-    897: 21,
-    898: 21,
-    899: 21,
-    900: 22,
-    901: 22,
-    902: 22,
-    903: 22,
-    904: 22,
-    905: 22,
-    906: 22,
-    907: 22,
-    908: 22,
-    909: 22,
-    910: 23,
-    911: 23,
-    912: 23,
-    913: 23,
-    914: 23,
-    915: 23,
-    916: 23,
-    917: 23,
-    918: 23,
-    919: 23,
-    920: 24,
-    921: 24,
-    922: 24,
-    923: 24,
-    924: 24,
-    925: 24,
-    926: 24,
-    927: 24,
-    928: 24,
-    929: 24,
-    930: 25,
-    931: 25,
-    932: 25,
-    933: 25,
-    934: 25,
-    935: 25,
-    936: 25,
-    937: 25,
-    938: 25,
-    939: 25,
-    940: 26,
-    941: 26,
-    942: 26,
-    943: 26,
-    944: 26,
-    945: 26,
-    946: 26,
-    947: 26,
-    948: 26,
-    949: 26,
-    950: 27,
-    951: 27,
-    952: 27,
-    953: 27,
-    954: 27,
-    955: 27,
-    956: 27,
-    957: 27,
-    958: 27,
-    959: 27,
-    960: 28,
-    961: 28,
-    962: 28,
-    963: 28,
-    964: 28,
-    965: 28,
-    966: 28,
-    967: 28,
-    968: 28,
-    969: 28,
-    970: 29,
-    971: 29,
-    972: 29,
-    973: 29,
-    974: 29,
-    975: 29,
-    976: 29,
-    977: 29,
-    978: 29,
-    979: 29,
-    980: 30,
-    981: 30,
-    982: 30,
-    983: 30,
-    984: 30,
-    985: 30,
-    986: 30,
-    987: 30,
-    988: 30,
-    989: 30,
-    990: 31,
-    991: 31,
-    992: 31,
-    993: 31,
-    994: 31,
-    995: 31,
-    996: 31,
-    997: 31,
-    998: 32,
-    999: 32,
-    1000: 32,
-    1001: 32,
-    1002: 32,
-    1003: 32,
-    1004: 32,
-    1005: 32,
-    1006: 33,
-    1007: 33,
-    1008: 33,
-    1009: 33,
-    1010: 33,
-    1011: 33,
-    1012: 33,
-    1013: 33,
-    1014: 34,
-    1015: 34,
-    1016: 34,
-    1017: 34,
-    1018: 34,
-    1019: 34,
-    1020: 34,
-    1021: 34,
-    1022: 35,
-    1023: 35,
-    1024: 35,
-    1025: 35,
-    1026: 35,
-    1027: 35,
-    1028: 35,
-    1029: 35,
-    1030: 36,
-    1031: 36,
-    1032: 36,
-    1033: 36,
-    1034: 36,
-    1035: 36,
-    1036: 36,
-    1037: 36,
-    1038: 37,
-    1039: 37,
-    1040: 37,
-    1041: 37,
-    1042: 37,
-    1043: 37,
-    1044: 37,
-    1045: 37,
-    1046: 38,
-    1047: 38,
-    1048: 38,
-    1049: 38,
-    1050: 38,
-    1051: 38,
-    1052: 38,
-    1053: 38,
-    1054: 39,
-    1055: 39,
-    1056: 39,
-    1057: 39,
-    1058: 39,
-    1059: 39,
-    1060: 39,
-    1061: 39,
-    1062: 40,
-    1063: 40,
-    1064: 40,
-    1065: 40,
-    1066: 40,
-    1067: 40,
-    1068: 40,
-    1069: 40,
-    1070: 41,
-    1071: 41,
-    1072: 41,
-    1073: 41,
-    1074: 41,
-    1075: 41,
-    1076: 41,
-    1077: 41,
-    1078: 42,
-    1079: 42,
-    1080: 42,
-    1081: 42,
-    1082: 42,
-    1083: 42,
-    1084: 42,
-    1085: 42,
-    1086: 43,
-    1087: 43,
-    1088: 43,
-    1089: 43,
-    1090: 43,
-    1091: 43,
-    1092: 43,
-    1093: 43,
-    1094: 44,
-    1095: 44,
-    1096: 44,
-    1097: 44,
-    1098: 44,
-    1099: 44,
-    1100: 44,
-    1101: 44,
-    1102: 45,
-    1103: 45,
-    1104: 45,
-    1105: 45,
-    1106: 45,
-    1107: 45,
-    1108: 45,
-    1109: 45,
-    1110: 46,
-    1111: 46,
-    1112: 46,
-    1113: 46,
-    1114: 46,
-    1115: 46,
-    1116: 46,
-    1117: 46,
-    1118: 47,
-    1119: 47,
-    1120: 47,
-    1121: 47,
-    1122: 47,
-    1123: 47,
-    1124: 47,
-    1125: 47,
-    1126: 48,
-    1127: 48,
-    1128: 48,
-    1129: 48,
-    1130: 48,
-    1131: 48,
-    1132: 48,
-    1133: 48,
-    1134: 49,
-    1135: 49,
-    1136: 49,
-    1137: 49,
-    1138: 49,
-    1139: 49,
-    1140: 49,
-    1141: 49,
-    1142: 50,
-    1143: 50,
-    1144: 50,
-    1145: 50,
-    1146: 50,
-    1147: 50,
-    1148: 50,
-    1149: 50,
-    1150: 51,
-    1151: 51,
-    1152: 51,
-    1153: 51,
-    1154: 51,
-    1155: 51,
-    1156: 51,
-    1157: 51,
-    1158: 52,
-    1159: 52,
-    1160: 52,
-    1161: 52,
-    1162: 52,
-    1163: 52,
-    1164: 52,
-    1165: 52,
-    1166: 53,
-    1167: 53,
-    1168: 53,
-    1169: 53,
-    1170: 53,
-    1171: 53,
-    1172: 53,
-    1173: 53,
-    1174: 54,
-    1175: 54,
-    1176: 54,
-    1177: 54,
-    1178: 54,
-    1179: 54,
-    1180: 54,
-    1181: 54,
-    1182: 55,
-    1183: 55,
-    1184: 55,
-    1185: 55,
-    1186: 55,
-    1187: 55,
-    1188: 55,
-    1189: 55,
-    1190: 56,
-    1191: 56,
-    1192: 56,
-    1193: 56,
-    1194: 56,
-    1195: 56,
-    1196: 56,
-    1197: 56,
-    1198: 57,
-    1199: 57,
-    1200: 57,
-    1201: 57,
-    1202: 57,
-    1203: 57,
-    1204: 57,
-    1205: 57,
-    1206: 58,
-    1207: 58,
-    1208: 58,
-    1209: 58,
-    1210: 58,
-    1211: 58,
-    1212: 58,
-    1213: 58,
-    1214: 59,
-    1215: 59,
-    1216: 59,
-    1217: 59,
-    1218: 59,
-    1219: 59,
-    1220: 59,
-    1221: 59,
-    1222: 60,
-    1223: 60,
-    1224: 60,
-    1225: 60,
-    1226: 60,
-    1227: 60,
-    1228: 60,
-    1229: 60,
-    1230: 61,
-    1231: 61,
-    1232: 61,
-    1233: 61,
-    1234: 61,
-    1235: 61,
-    1236: 61,
-    1237: 61,
-    1238: 62,
-    1239: 62,
-    1240: 62,
-    1241: 62,
-    1242: 62,
-    1243: 62,
-    1244: 62,
-    1245: 62,
-    1246: 63,
-    1247: 63,
-    1248: 63,
-    1249: 63,
-    1250: 63,
-    1251: 63,
-    1252: 63,
-    1253: 63,
-    1254: 64,
-    1255: 64,
-    1256: 64,
-    1257: 64,
-    1258: 64,
-    1259: 64,
-    1260: 64,
-    1261: 64,
-    1262: 65,
-    1263: 65,
-    1264: 65,
-    1265: 65,
-    1266: 65,
-    1267: 65,
-    1268: 65,
-    1269: 65,
-    1270: 66,
-    1271: 66,
-    1272: 66,
-    1273: 66,
-    1274: 66,
-    1275: 66,
-    1276: 66,
-    1277: 66,
-    1278: 67,
-    1279: 67,
-    1280: 67,
-    1281: 67,
-    1282: 67,
-    1283: 67,
-    1284: 67,
-    1285: 67,
-    1286: 68,
-    1287: 68,
-    1288: 68,
-    1289: 68,
-    1290: 68,
-    1291: 68,
-    1292: 68,
-    1293: 68,
-    1294: 69,
-    1295: 69,
-    1296: 69,
-    1297: 69,
-    1298: 69,
-    1299: 69,
-    1300: 69,
-    1301: 69,
-    1302: 70,
-    1303: 70,
-    1304: 70,
-    1305: 70,
-    1306: 70,
-    1307: 70,
-    1308: 70,
-    1309: 70,
-    1310: 71,
-    1311: 71,
-    1312: 71,
-    1313: 71,
-    1314: 71,
-    1315: 72,
-    1316: 72,
-    1317: 72,
-    1318: 72,
-    1319: 72,
-    1320: 73,
-    1321: 73,
-    1322: 73,
-    1323: 73,
-    1324: 73,
-    1325: 74,
-    1326: 74,
-    1327: 74,
-    1328: 74,
-    1329: 74,
-    1330: 75,
-    1331: 75,
-    1332: 75,
-    1333: 75,
-    1334: 75,
-    1335: 76,
-    1336: 76,
-    1337: 76,
-    1338: 76,
-    1339: 76,
-    1340: 77,
-    1341: 77,
-    1342: 77,
-    1343: 77,
-    1344: 77,
-    1345: 78,
-    1346: 78,
-    1347: 78,
-    1348: 78,
-    1349: 78,
-    1350: 79,
-    1351: 79,
-    1352: 79,
-    1353: 79,
-    1354: 79,
-    1355: 80,
-    1356: 80,
-    1357: 80,
-    1358: 80,
-    1359: 80,
-    1360: 81,
-    1361: 81,
-    1362: 81,
-    1363: 81,
-    1364: 81,
-    1365: 82,
-    1366: 82,
-    1367: 82,
-    1368: 82,
-    1369: 82,
-    1370: 83,
-    1371: 83,
-    1372: 83,
-    1373: 83,
-    1374: 83,
-    1375: 84,
-    1376: 84,
-    1377: 84,
-    1378: 84,
-    1379: 84,
-    1380: 85,
-    1381: 85,
-    1382: 85,
-    1383: 85,
-    1384: 85,
-    1385: 86,
-    1386: 86,
-    1387: 86,
-    1388: 86,
-    1389: 86,
-    1390: 87,
-    1391: 87,
-    1392: 87,
-    1393: 87,
-    1394: 87,
-    1395: 88,
-    1396: 88,
-    1397: 88,
-    1398: 88,
-    1399: 88,
-    1400: 89,
-    1401: 89,
-    1402: 90,
-    1403: 90,
-    1404: 91,
-    1405: 91,
-    1406: 92,
-    1407: 92,
-    1408: 93,
-    1409: 93,
-    1410: 94,
-    1411: 94,
-    1412: 95,
-    1413: 95,
-    1414: 96,
-    1415: 96,
-    1416: 97,
-    1417: 97,
-    1418: 98,
-    1419: 98,
-    1420: 99,
-    1421: 99,
-    1422: 100,
-    1423: 100,
-    1424: 101,
-    1425: 101,
-    1426: 102,
-    1427: 102,
-    1428: 103,
-    1429: 103,
-    1430: 104,
-    1431: 104,
-    1432: 105,
-    1433: 105,
-    1434: 106,
-    1435: 106,
-    1436: 107,
-    1437: 107,
-    1438: 108,
-    1439: 108,
-    1440: 109,
-    1441: 109,
-    1442: 110,
-    1443: 110,
-    1444: 111,
-    1445: 111,
-    1446: 112,
-    1447: 112,
-    1448: 113,
-    1449: 113,
-    1450: 114,
-    1451: 114,
-    1452: 115,
-    1453: 115,
-    1454: 116,
-    1455: 116,
-    1456: 117,
-    1457: 117,
-    1458: 118,
-    1459: 118,
-    1460: 119,
-    1461: 119,
-    1462: 120,
-    1463: 120,
-    1464: 121,
-    1465: 121,
-    1466: 122,
-    1467: 122,
-    1468: 123,
-    1469: 123,
-    1470: 124,
-    1471: 124,
-    1472: 125,
-    1473: 125,
-    1474: 126,
-    1475: 126,
-    1476: 127,
-    1477: 127,
-    1478: 128,
-    1479: 129,
-    1480: 130,
-    1481: 131,
-    1482: 132,
-    1483: 133,
-    1484: 134,
-    1485: 135,
-    1486: 136,
-    1487: 137,
-    1488: 138,
-    1489: 139,
-    1490: 140,
-    1491: 141,
-    1492: 142,
-    1493: 143,
-    1494: 144,
-    1495: 145,
-    1496: 146,
-    1497: 147,
-    1498: 148,
-    1499: 149,
-    1500: 150
-  },
-  'U16F60': {
-    'min': 1250,
-    'max': 720,
-    1250: 1,
-    1249: 1,
-    1248: 1,
-    1247: 1,
-    1246: 1,
-    1245: 1,
-    1244: 1,
-    1243: 1,
-    1242: 1,
-    1241: 1,
-    1240: 2,
-    1239: 2,
-    1238: 2,
-    1237: 2,
-    1236: 2,
-    1235: 2,
-    1234: 2,
-    1233: 2,
-    1232: 2,
-    1231: 2,
-    1230: 3,
-    1229: 3,
-    1228: 3,
-    1227: 3,
-    1226: 3,
-    1225: 3,
-    1224: 3,
-    1223: 3,
-    1222: 3,
-    1221: 3,
-    1220: 4,
-    1219: 4,
-    1218: 4,
-    1217: 4,
-    1216: 4,
-    1215: 4,
-    1214: 4,
-    1213: 4,
-    1212: 4,
-    1211: 4,
-    1210: 5,
-    1209: 5,
-    1208: 5,
-    1207: 5,
-    1206: 5,
-    1205: 5,
-    1204: 5,
-    1203: 5,
-    1202: 5,
-    1201: 5,
-    1200: 7,
-    1199: 7,
-    1198: 7,
-    1197: 7,
-    1196: 7,
-    1195: 7,
-    1194: 7,
-    1193: 7,
-    1192: 7,
-    1191: 7,
-    1190: 8,
-    1189: 8,
-    1188: 8,
-    1187: 8,
-    1186: 8,
-    1185: 8,
-    1184: 8,
-    1183: 8,
-    1182: 8,
-    1181: 8,
-    1180: 9,
-    1179: 9,
-    1178: 9,
-    1177: 9,
-    1176: 9,
-    1175: 9,
-    1174: 9,
-    1173: 9,
-    1172: 9,
-    1171: 9,
-    1170: 10,
-    1169: 10,
-    1168: 10,
-    1167: 10,
-    1166: 10,
-    1165: 10,
-    1164: 10,
-    1163: 10,
-    1162: 10,
-    1161: 10,
-    1160: 12,
-    1159: 12,
-    1158: 12,
-    1157: 12,
-    1156: 12,
-    1155: 12,
-    1154: 12,
-    1153: 12,
-    1152: 12,
-    1151: 12,
-    1150: 13,
-    1149: 13,
-    1148: 13,
-    1147: 13,
-    1146: 13,
-    1145: 13,
-    1144: 13,
-    1143: 13,
-    1142: 13,
-    1141: 13,
-    1140: 14,
-    1139: 14,
-    1138: 14,
-    1137: 14,
-    1136: 14,
-    1135: 14,
-    1134: 14,
-    1133: 14,
-    1132: 14,
-    1131: 14,
-    1130: 16,
-    1129: 16,
-    1128: 16,
-    1127: 16,
-    1126: 16,
-    1125: 16,
-    1124: 16,
-    1123: 16,
-    1122: 16,
-    1121: 16,
-    1120: 17,
-    1119: 17,
-    1118: 17,
-    1117: 17,
-    1116: 17,
-    1115: 17,
-    1114: 17,
-    1113: 17,
-    1112: 17,
-    1111: 17,
-    1110: 18,
-    1109: 18,
-    1108: 18,
-    1107: 18,
-    1106: 18,
-    1105: 18,
-    1104: 18,
-    1103: 18,
-    1102: 18,
-    1101: 18,
-    1100: 20,
-    1099: 20,
-    1098: 20,
-    1097: 20,
-    1096: 20,
-    1095: 20,
-    1094: 20,
-    1093: 20,
-    1092: 20,
-    1091: 20,
-    1090: 21,
-    1089: 21,
-    1088: 21,
-    1087: 21,
-    1086: 21,
-    1085: 21,
-    1084: 21,
-    1083: 21,
-    1082: 21,
-    1081: 21,
-    1080: 23,
-    1079: 23,
-    1078: 23,
-    1077: 23,
-    1076: 23,
-    1075: 23,
-    1074: 23,
-    1073: 23,
-    1072: 23,
-    1071: 23,
-    1070: 24,
-    1069: 24,
-    1068: 24,
-    1067: 24,
-    1066: 24,
-    1065: 24,
-    1064: 24,
-    1063: 24,
-    1062: 24,
-    1061: 24,
-    1060: 26,
-    1059: 26,
-    1058: 26,
-    1057: 26,
-    1056: 26,
-    1055: 26,
-    1054: 26,
-    1053: 26,
-    1052: 26,
-    1051: 26,
-    1050: 27,
-    1049: 27,
-    1048: 27,
-    1047: 27,
-    1046: 27,
-    1045: 27,
-    1044: 27,
-    1043: 27,
-    1042: 27,
-    1041: 27,
-    1040: 29,
-    1039: 29,
-    1038: 29,
-    1037: 29,
-    1036: 29,
-    1035: 29,
-    1034: 29,
-    1033: 29,
-    1032: 29,
-    1031: 29,
-    1030: 30,
-    1029: 30,
-    1028: 30,
-    1027: 30,
-    1026: 30,
-    1025: 30,
-    1024: 30,
-    1023: 30,
-    1022: 30,
-    1021: 30,
-    1020: 32,
-    1019: 32,
-    1018: 32,
-    1017: 32,
-    1016: 32,
-    1015: 32,
-    1014: 32,
-    1013: 32,
-    1012: 32,
-    1011: 32,
-    1010: 33,
-    1009: 33,
-    1008: 33,
-    1007: 33,
-    1006: 33,
-    1005: 33,
-    1004: 33,
-    1003: 33,
-    1002: 33,
-    1001: 33,
-    1000: 35,
-    999: 35,
-    998: 35,
-    997: 35,
-    996: 35,
-    995: 35,
-    994: 35,
-    993: 35,
-    992: 35,
-    991: 35,
-    990: 36,
-    989: 36,
-    988: 36,
-    987: 36,
-    986: 36,
-    985: 36,
-    984: 36,
-    983: 36,
-    982: 36,
-    981: 36,
-    980: 38,
-    979: 38,
-    978: 38,
-    977: 38,
-    976: 38,
-    975: 38,
-    974: 38,
-    973: 38,
-    972: 38,
-    971: 38,
-    970: 40,
-    969: 40,
-    968: 40,
-    967: 40,
-    966: 40,
-    965: 40,
-    964: 40,
-    963: 40,
-    962: 40,
-    961: 40,
-    960: 42,
-    959: 42,
-    958: 42,
-    957: 42,
-    956: 42,
-    955: 42,
-    954: 42,
-    953: 42,
-    952: 42,
-    951: 42,
-    950: 44,
-    949: 44,
-    948: 44,
-    947: 44,
-    946: 44,
-    945: 44,
-    944: 44,
-    943: 44,
-    942: 44,
-    941: 44,
-    940: 46,
-    939: 46,
-    938: 46,
-    937: 46,
-    936: 46,
-    935: 46,
-    934: 46,
-    933: 46,
-    932: 46,
-    931: 46,
-    930: 48,
-    929: 48,
-    928: 48,
-    927: 48,
-    926: 48,
-    925: 48,
-    924: 48,
-    923: 48,
-    922: 48,
-    921: 48,
-    920: 50,
-    919: 50,
-    918: 50,
-    917: 50,
-    916: 50,
-    915: 50,
-    914: 50,
-    913: 50,
-    912: 50,
-    911: 50,
-    910: 52,
-    909: 52,
-    908: 52,
-    907: 52,
-    906: 52,
-    905: 52,
-    904: 52,
-    903: 52,
-    902: 52,
-    901: 52,
-    900: 54,
-    899: 54,
-    898: 54,
-    897: 54,
-    896: 54,
-    895: 54,
-    894: 54,
-    893: 54,
-    892: 54,
-    891: 54,
-    890: 56,
-    889: 56,
-    888: 56,
-    887: 56,
-    886: 56,
-    885: 56,
-    884: 56,
-    883: 56,
-    882: 56,
-    881: 56,
-    880: 58,
-    879: 58,
-    878: 58,
-    877: 58,
-    876: 58,
-    875: 58,
-    874: 58,
-    873: 58,
-    872: 58,
-    871: 58,
-    870: 61,
-    869: 61,
-    868: 61,
-    867: 61,
-    866: 61,
-    865: 61,
-    864: 61,
-    863: 61,
-    862: 61,
-    861: 61,
-    860: 64,
-    859: 64,
-    858: 64,
-    857: 64,
-    856: 64,
-    855: 64,
-    854: 64,
-    853: 64,
-    852: 64,
-    851: 64,
-    850: 67,
-    849: 67,
-    848: 67,
-    847: 67,
-    846: 67,
-    845: 67,
-    844: 67,
-    843: 67,
-    842: 67,
-    841: 67,
-    840: 70,
-    839: 70,
-    838: 70,
-    837: 70,
-    836: 70,
-    835: 70,
-    834: 70,
-    833: 70,
-    832: 70,
-    831: 70,
-    830: 74,
-    829: 74,
-    828: 74,
-    827: 74,
-    826: 74,
-    825: 74,
-    824: 74,
-    823: 74,
-    822: 74,
-    821: 74,
-    820: 78,
-    819: 78,
-    818: 78,
-    817: 78,
-    816: 78,
-    815: 78,
-    814: 78,
-    813: 78,
-    812: 78,
-    811: 78,
-    810: 82,
-    809: 82,
-    808: 82,
-    807: 82,
-    806: 82,
-    805: 82,
-    804: 82,
-    803: 82,
-    802: 82,
-    801: 82,
-    800: 87,
-    799: 87,
-    798: 87,
-    797: 87,
-    796: 87,
-    795: 87,
-    794: 87,
-    793: 87,
-    792: 87,
-    791: 87,
-    790: 93,
-    789: 93,
-    788: 93,
-    787: 93,
-    786: 93,
-    785: 93,
-    784: 93,
-    783: 93,
-    782: 93,
-    781: 93,
-    780: 99,
-    779: 99,
-    778: 99,
-    777: 99,
-    776: 99,
-    775: 99,
-    774: 99,
-    773: 99,
-    772: 99,
-    771: 99,
-    770: 105,
-    769: 105,
-    768: 105,
-    767: 105,
-    766: 105,
-    765: 105,
-    764: 105,
-    763: 105,
-    762: 105,
-    761: 105,
-    760: 112,
-    759: 112,
-    758: 112,
-    757: 112,
-    756: 112,
-    755: 112,
-    754: 112,
-    753: 112,
-    752: 112,
-    751: 112,
-    750: 119,
-    749: 119,
-    748: 119,
-    747: 119,
-    746: 119,
-    745: 119,
-    744: 119,
-    743: 119,
-    742: 119,
-    741: 119,
-    740: 128,
-    739: 128,
-    738: 128,
-    737: 128,
-    736: 128,
-    735: 128,
-    734: 128,
-    733: 128,
-    732: 128,
-    731: 128,
-    730: 138,
-    729: 138,
-    728: 138,
-    727: 138,
-    726: 138,
-    725: 138,
-    724: 138,
-    723: 138,
-    722: 138,
-    721: 138,
-    720: 150
-  },
-  'U16F200': {
-    'min': 3510,
-    'max': 2360,
-    3510: 1,
-    3509: 1,
-    3508: 1,
-    3507: 1,
-    3506: 1,
-    3505: 1,
-    3504: 1,
-    3503: 1,
-    3502: 1,
-    3501: 1,
-    3500: 1,
-    3499: 1,
-    3498: 1,
-    3497: 1,
-    3496: 1,
-    3495: 1,
-    3494: 1,
-    3493: 1,
-    3492: 1,
-    3491: 1,
-    3490: 2,
-    3489: 2,
-    3488: 2,
-    3487: 2,
-    3486: 2,
-    3485: 2,
-    3484: 2,
-    3483: 2,
-    3482: 2,
-    3481: 2,
-    3480: 2,
-    3479: 2,
-    3478: 2,
-    3477: 2,
-    3476: 2,
-    3475: 2,
-    3474: 2,
-    3473: 2,
-    3472: 2,
-    3471: 2,
-    3470: 3,
-    3469: 3,
-    3468: 3,
-    3467: 3,
-    3466: 3,
-    3465: 3,
-    3464: 3,
-    3463: 3,
-    3462: 3,
-    3461: 3,
-    3460: 3,
-    3459: 3,
-    3458: 3,
-    3457: 3,
-    3456: 3,
-    3455: 3,
-    3454: 3,
-    3453: 3,
-    3452: 3,
-    3451: 3,
-    3450: 4,
-    3449: 4,
-    3448: 4,
-    3447: 4,
-    3446: 4,
-    3445: 4,
-    3444: 4,
-    3443: 4,
-    3442: 4,
-    3441: 4,
-    3440: 4,
-    3439: 4,
-    3438: 4,
-    3437: 4,
-    3436: 4,
-    3435: 4,
-    3434: 4,
-    3433: 4,
-    3432: 4,
-    3431: 4,
-    3430: 5,
-    3429: 5,
-    3428: 5,
-    3427: 5,
-    3426: 5,
-    3425: 5,
-    3424: 5,
-    3423: 5,
-    3422: 5,
-    3421: 5,
-    3420: 5,
-    3419: 5,
-    3418: 5,
-    3417: 5,
-    3416: 5,
-    3415: 5,
-    3414: 5,
-    3413: 5,
-    3412: 5,
-    3411: 5,
-    3410: 6,
-    3409: 6,
-    3408: 6,
-    3407: 6,
-    3406: 6,
-    3405: 6,
-    3404: 6,
-    3403: 6,
-    3402: 6,
-    3401: 6,
-    3400: 6,
-    3399: 6,
-    3398: 6,
-    3397: 6,
-    3396: 6,
-    3395: 6,
-    3394: 6,
-    3393: 6,
-    3392: 6,
-    3391: 6,
-    3390: 7,
-    3389: 7,
-    3388: 7,
-    3387: 7,
-    3386: 7,
-    3385: 7,
-    3384: 7,
-    3383: 7,
-    3382: 7,
-    3381: 7,
-    3380: 7,
-    3379: 7,
-    3378: 7,
-    3377: 7,
-    3376: 7,
-    3375: 7,
-    3374: 7,
-    3373: 7,
-    3372: 7,
-    3371: 7,
-    3370: 8,
-    3369: 8,
-    3368: 8,
-    3367: 8,
-    3366: 8,
-    3365: 8,
-    3364: 8,
-    3363: 8,
-    3362: 8,
-    3361: 8,
-    3360: 8,
-    3359: 8,
-    3358: 8,
-    3357: 8,
-    3356: 8,
-    3355: 8,
-    3354: 8,
-    3353: 8,
-    3352: 8,
-    3351: 8,
-    3350: 9,
-    3349: 9,
-    3348: 9,
-    3347: 9,
-    3346: 9,
-    3345: 9,
-    3344: 9,
-    3343: 9,
-    3342: 9,
-    3341: 9,
-    3340: 9,
-    3339: 9,
-    3338: 9,
-    3337: 9,
-    3336: 9,
-    3335: 9,
-    3334: 9,
-    3333: 9,
-    3332: 9,
-    3331: 9,
-    3330: 10,
-    3329: 10,
-    3328: 10,
-    3327: 10,
-    3326: 10,
-    3325: 10,
-    3324: 10,
-    3323: 10,
-    3322: 10,
-    3321: 10,
-    3320: 10,
-    3319: 10,
-    3318: 10,
-    3317: 10,
-    3316: 10,
-    3315: 10,
-    3314: 10,
-    3313: 10,
-    3312: 10,
-    3311: 10,
-    3310: 11,
-    3309: 11,
-    3308: 11,
-    3307: 11,
-    3306: 11,
-    3305: 11,
-    3304: 11,
-    3303: 11,
-    3302: 11,
-    3301: 11,
-    3300: 11,
-    3299: 11,
-    3298: 11,
-    3297: 11,
-    3296: 11,
-    3295: 11,
-    3294: 11,
-    3293: 11,
-    3292: 11,
-    3291: 11,
-    3290: 12,
-    3289: 12,
-    3288: 12,
-    3287: 12,
-    3286: 12,
-    3285: 12,
-    3284: 12,
-    3283: 12,
-    3282: 12,
-    3281: 12,
-    3280: 12,
-    3279: 12,
-    3278: 12,
-    3277: 12,
-    3276: 12,
-    3275: 12,
-    3274: 12,
-    3273: 12,
-    3272: 12,
-    3271: 12,
-    3270: 13,
-    3269: 13,
-    3268: 13,
-    3267: 13,
-    3266: 13,
-    3265: 13,
-    3264: 13,
-    3263: 13,
-    3262: 13,
-    3261: 13,
-    3260: 13,
-    3259: 13,
-    3258: 13,
-    3257: 13,
-    3256: 13,
-    3255: 13,
-    3254: 13,
-    3253: 13,
-    3252: 13,
-    3251: 13,
-    3250: 14,
-    3249: 14,
-    3248: 14,
-    3247: 14,
-    3246: 14,
-    3245: 14,
-    3244: 14,
-    3243: 14,
-    3242: 14,
-    3241: 14,
-    3240: 14,
-    3239: 14,
-    3238: 14,
-    3237: 14,
-    3236: 14,
-    3235: 14,
-    3234: 14,
-    3233: 14,
-    3232: 14,
-    3231: 14,
-    3230: 15,
-    3229: 15,
-    3228: 15,
-    3227: 15,
-    3226: 15,
-    3225: 15,
-    3224: 15,
-    3223: 15,
-    3222: 15,
-    3221: 15,
-    3220: 15,
-    3219: 15,
-    3218: 15,
-    3217: 15,
-    3216: 15,
-    3215: 15,
-    3214: 15,
-    3213: 15,
-    3212: 15,
-    3211: 15,
-    3210: 16,
-    3209: 16,
-    3208: 16,
-    3207: 16,
-    3206: 16,
-    3205: 16,
-    3204: 16,
-    3203: 16,
-    3202: 16,
-    3201: 16,
-    3200: 16,
-    3199: 16,
-    3198: 16,
-    3197: 16,
-    3196: 16,
-    3195: 16,
-    3194: 16,
-    3193: 16,
-    3192: 16,
-    3191: 16,
-    3190: 17,
-    3189: 17,
-    3188: 17,
-    3187: 17,
-    3186: 17,
-    3185: 17,
-    3184: 17,
-    3183: 17,
-    3182: 17,
-    3181: 17,
-    3180: 17,
-    3179: 17,
-    3178: 17,
-    3177: 17,
-    3176: 17,
-    3175: 17,
-    3174: 17,
-    3173: 17,
-    3172: 17,
-    3171: 17,
-    3170: 18,
-    3169: 18,
-    3168: 18,
-    3167: 18,
-    3166: 18,
-    3165: 18,
-    3164: 18,
-    3163: 18,
-    3162: 18,
-    3161: 18,
-    3160: 18,
-    3159: 18,
-    3158: 18,
-    3157: 18,
-    3156: 18,
-    3155: 18,
-    3154: 18,
-    3153: 18,
-    3152: 18,
-    3151: 18,
-    3150: 19,
-    3149: 19,
-    3148: 19,
-    3147: 19,
-    3146: 19,
-    3145: 19,
-    3144: 19,
-    3143: 19,
-    3142: 19,
-    3141: 19,
-    3140: 19,
-    3139: 19,
-    3138: 19,
-    3137: 19,
-    3136: 19,
-    3135: 19,
-    3134: 19,
-    3133: 19,
-    3132: 19,
-    3131: 19,
-    3130: 20,
-    3129: 20,
-    3128: 20,
-    3127: 20,
-    3126: 20,
-    3125: 20,
-    3124: 20,
-    3123: 20,
-    3122: 20,
-    3121: 20,
-    3120: 20,
-    3119: 20,
-    3118: 20,
-    3117: 20,
-    3116: 20,
-    3115: 20,
-    3114: 20,
-    3113: 20,
-    3112: 20,
-    3111: 20,
-    3110: 21,
-    3109: 21,
-    3108: 21,
-    3107: 21,
-    3106: 21,
-    3105: 21,
-    3104: 21,
-    3103: 21,
-    3102: 21,
-    3101: 21,
-    3100: 21,
-    3099: 21,
-    3098: 21,
-    3097: 21,
-    3096: 21,
-    3095: 21,
-    3094: 21,
-    3093: 21,
-    3092: 21,
-    3091: 21,
-    3090: 22,
-    3089: 22,
-    3088: 22,
-    3087: 22,
-    3086: 22,
-    3085: 22,
-    3084: 22,
-    3083: 22,
-    3082: 22,
-    3081: 22,
-    3080: 22,
-    3079: 22,
-    3078: 22,
-    3077: 22,
-    3076: 22,
-    3075: 22,
-    3074: 22,
-    3073: 22,
-    3072: 22,
-    3071: 22,
-    3070: 23,
-    3069: 23,
-    3068: 23,
-    3067: 23,
-    3066: 23,
-    3065: 23,
-    3064: 23,
-    3063: 23,
-    3062: 23,
-    3061: 23,
-    3060: 23,
-    3059: 23,
-    3058: 23,
-    3057: 23,
-    3056: 23,
-    3055: 23,
-    3054: 23,
-    3053: 23,
-    3052: 23,
-    3051: 23,
-    3050: 24,
-    3049: 24,
-    3048: 24,
-    3047: 24,
-    3046: 24,
-    3045: 24,
-    3044: 24,
-    3043: 24,
-    3042: 24,
-    3041: 24,
-    3040: 24,
-    3039: 24,
-    3038: 24,
-    3037: 24,
-    3036: 24,
-    3035: 24,
-    3034: 24,
-    3033: 24,
-    3032: 24,
-    3031: 24,
-    3030: 25,
-    3029: 25,
-    3028: 25,
-    3027: 25,
-    3026: 25,
-    3025: 25,
-    3024: 25,
-    3023: 25,
-    3022: 25,
-    3021: 25,
-    3020: 25,
-    3019: 25,
-    3018: 25,
-    3017: 25,
-    3016: 25,
-    3015: 25,
-    3014: 25,
-    3013: 25,
-    3012: 25,
-    3011: 25,
-    3010: 26,
-    3009: 26,
-    3008: 26,
-    3007: 26,
-    3006: 26,
-    3005: 26,
-    3004: 26,
-    3003: 26,
-    3002: 26,
-    3001: 26,
-    3000: 27,
-    2999: 27,
-    2998: 27,
-    2997: 27,
-    2996: 27,
-    2995: 27,
-    2994: 27,
-    2993: 27,
-    2992: 27,
-    2991: 27,
-    2990: 28,
-    2989: 28,
-    2988: 28,
-    2987: 28,
-    2986: 28,
-    2985: 28,
-    2984: 28,
-    2983: 28,
-    2982: 28,
-    2981: 28,
-    2980: 29,
-    2979: 29,
-    2978: 29,
-    2977: 29,
-    2976: 29,
-    2975: 29,
-    2974: 29,
-    2973: 29,
-    2972: 29,
-    2971: 29,
-    2970: 30,
-    2969: 30,
-    2968: 30,
-    2967: 30,
-    2966: 30,
-    2965: 30,
-    2964: 30,
-    2963: 30,
-    2962: 30,
-    2961: 30,
-    2960: 31,
-    2959: 31,
-    2958: 31,
-    2957: 31,
-    2956: 31,
-    2955: 31,
-    2954: 31,
-    2953: 31,
-    2952: 31,
-    2951: 31,
-    2950: 32,
-    2949: 32,
-    2948: 32,
-    2947: 32,
-    2946: 32,
-    2945: 32,
-    2944: 32,
-    2943: 32,
-    2942: 32,
-    2941: 32,
-    2940: 33,
-    2939: 33,
-    2938: 33,
-    2937: 33,
-    2936: 33,
-    2935: 33,
-    2934: 33,
-    2933: 33,
-    2932: 33,
-    2931: 33,
-    2930: 34,
-    2929: 34,
-    2928: 34,
-    2927: 34,
-    2926: 34,
-    2925: 34,
-    2924: 34,
-    2923: 34,
-    2922: 34,
-    2921: 34,
-    2920: 35,
-    2919: 35,
-    2918: 35,
-    2917: 35,
-    2916: 35,
-    2915: 35,
-    2914: 35,
-    2913: 35,
-    2912: 35,
-    2911: 35,
-    2910: 36,
-    2909: 36,
-    2908: 36,
-    2907: 36,
-    2906: 36,
-    2905: 36,
-    2904: 36,
-    2903: 36,
-    2902: 36,
-    2901: 36,
-    2900: 37,
-    2899: 37,
-    2898: 37,
-    2897: 37,
-    2896: 37,
-    2895: 37,
-    2894: 37,
-    2893: 37,
-    2892: 37,
-    2891: 37,
-    2890: 38,
-    2889: 38,
-    2888: 38,
-    2887: 38,
-    2886: 38,
-    2885: 38,
-    2884: 38,
-    2883: 38,
-    2882: 38,
-    2881: 38,
-    2880: 39,
-    2879: 39,
-    2878: 39,
-    2877: 39,
-    2876: 39,
-    2875: 39,
-    2874: 39,
-    2873: 39,
-    2872: 39,
-    2871: 39,
-    2870: 40,
-    2869: 40,
-    2868: 40,
-    2867: 40,
-    2866: 40,
-    2865: 40,
-    2864: 40,
-    2863: 40,
-    2862: 40,
-    2861: 40,
-    2860: 41,
-    2859: 41,
-    2858: 41,
-    2857: 41,
-    2856: 41,
-    2855: 41,
-    2854: 41,
-    2853: 41,
-    2852: 41,
-    2851: 41,
-    2850: 42,
-    2849: 42,
-    2848: 42,
-    2847: 42,
-    2846: 42,
-    2845: 42,
-    2844: 42,
-    2843: 42,
-    2842: 42,
-    2841: 42,
-    2840: 43,
-    2839: 43,
-    2838: 43,
-    2837: 43,
-    2836: 43,
-    2835: 43,
-    2834: 43,
-    2833: 43,
-    2832: 43,
-    2831: 43,
-    2830: 44,
-    2829: 44,
-    2828: 44,
-    2827: 44,
-    2826: 44,
-    2825: 44,
-    2824: 44,
-    2823: 44,
-    2822: 44,
-    2821: 44,
-    2820: 45,
-    2819: 45,
-    2818: 45,
-    2817: 45,
-    2816: 45,
-    2815: 45,
-    2814: 45,
-    2813: 45,
-    2812: 45,
-    2811: 45,
-    2810: 46,
-    2809: 46,
-    2808: 46,
-    2807: 46,
-    2806: 46,
-    2805: 46,
-    2804: 46,
-    2803: 46,
-    2802: 46,
-    2801: 46,
-    2800: 47,
-    2799: 47,
-    2798: 47,
-    2797: 47,
-    2796: 47,
-    2795: 47,
-    2794: 47,
-    2793: 47,
-    2792: 47,
-    2791: 47,
-    2790: 48,
-    2789: 48,
-    2788: 48,
-    2787: 48,
-    2786: 48,
-    2785: 48,
-    2784: 48,
-    2783: 48,
-    2782: 48,
-    2781: 48,
-    2780: 49,
-    2779: 49,
-    2778: 49,
-    2777: 49,
-    2776: 49,
-    2775: 49,
-    2774: 49,
-    2773: 49,
-    2772: 49,
-    2771: 49,
-    2770: 50,
-    2769: 50,
-    2768: 50,
-    2767: 50,
-    2766: 50,
-    2765: 50,
-    2764: 50,
-    2763: 50,
-    2762: 50,
-    2761: 50,
-    2760: 51,
-    2759: 51,
-    2758: 51,
-    2757: 51,
-    2756: 51,
-    2755: 51,
-    2754: 51,
-    2753: 51,
-    2752: 51,
-    2751: 51,
-    2750: 52,
-    2749: 52,
-    2748: 52,
-    2747: 52,
-    2746: 52,
-    2745: 52,
-    2744: 52,
-    2743: 52,
-    2742: 52,
-    2741: 52,
-    2740: 53,
-    2739: 53,
-    2738: 53,
-    2737: 53,
-    2736: 53,
-    2735: 53,
-    2734: 53,
-    2733: 53,
-    2732: 53,
-    2731: 53,
-    2730: 54,
-    2729: 54,
-    2728: 54,
-    2727: 54,
-    2726: 54,
-    2725: 54,
-    2724: 54,
-    2723: 54,
-    2722: 54,
-    2721: 54,
-    2720: 55,
-    2719: 55,
-    2718: 55,
-    2717: 55,
-    2716: 55,
-    2715: 55,
-    2714: 55,
-    2713: 55,
-    2712: 55,
-    2711: 55,
-    2710: 56,
-    2709: 56,
-    2708: 56,
-    2707: 56,
-    2706: 56,
-    2705: 56,
-    2704: 56,
-    2703: 56,
-    2702: 56,
-    2701: 56,
-    2700: 57,
-    2699: 57,
-    2698: 57,
-    2697: 57,
-    2696: 57,
-    2695: 57,
-    2694: 57,
-    2693: 57,
-    2692: 57,
-    2691: 57,
-    2690: 58,
-    2689: 58,
-    2688: 58,
-    2687: 58,
-    2686: 58,
-    2685: 58,
-    2684: 58,
-    2683: 58,
-    2682: 58,
-    2681: 58,
-    2680: 59,
-    2679: 59,
-    2678: 59,
-    2677: 59,
-    2676: 59,
-    2675: 59,
-    2674: 59,
-    2673: 59,
-    2672: 59,
-    2671: 59,
-    2670: 60,
-    2669: 60,
-    2668: 60,
-    2667: 60,
-    2666: 60,
-    2665: 60,
-    2664: 60,
-    2663: 60,
-    2662: 60,
-    2661: 60,
-    2660: 62,
-    2659: 62,
-    2658: 62,
-    2657: 62,
-    2656: 62,
-    2655: 62,
-    2654: 62,
-    2653: 62,
-    2652: 62,
-    2651: 62,
-    2650: 64,
-    2649: 64,
-    2648: 64,
-    2647: 64,
-    2646: 64,
-    2645: 64,
-    2644: 64,
-    2643: 64,
-    2642: 64,
-    2641: 64,
-    2640: 66,
-    2639: 66,
-    2638: 66,
-    2637: 66,
-    2636: 66,
-    2635: 66,
-    2634: 66,
-    2633: 66,
-    2632: 66,
-    2631: 66,
-    2630: 68,
-    2629: 68,
-    2628: 68,
-    2627: 68,
-    2626: 68,
-    2625: 68,
-    2624: 68,
-    2623: 68,
-    2622: 68,
-    2621: 68,
-    2620: 70,
-    2619: 70,
-    2618: 70,
-    2617: 70,
-    2616: 70,
-    2615: 70,
-    2614: 70,
-    2613: 70,
-    2612: 70,
-    2611: 70,
-    2610: 72,
-    2609: 72,
-    2608: 72,
-    2607: 72,
-    2606: 72,
-    2605: 72,
-    2604: 72,
-    2603: 72,
-    2602: 72,
-    2601: 72,
-    2600: 74,
-    2599: 74,
-    2598: 74,
-    2597: 74,
-    2596: 74,
-    2595: 74,
-    2594: 74,
-    2593: 74,
-    2592: 74,
-    2591: 74,
-    2590: 76,
-    2589: 76,
-    2588: 76,
-    2587: 76,
-    2586: 76,
-    2585: 76,
-    2584: 76,
-    2583: 76,
-    2582: 76,
-    2581: 76,
-    2580: 78,
-    2579: 78,
-    2578: 78,
-    2577: 78,
-    2576: 78,
-    2575: 78,
-    2574: 78,
-    2573: 78,
-    2572: 78,
-    2571: 78,
-    2570: 80,
-    2569: 80,
-    2568: 80,
-    2567: 80,
-    2566: 80,
-    2565: 80,
-    2564: 80,
-    2563: 80,
-    2562: 80,
-    2561: 80,
-    2560: 82,
-    2559: 82,
-    2558: 82,
-    2557: 82,
-    2556: 82,
-    2555: 82,
-    2554: 82,
-    2553: 82,
-    2552: 82,
-    2551: 82,
-    2550: 84,
-    2549: 84,
-    2548: 84,
-    2547: 84,
-    2546: 84,
-    2545: 84,
-    2544: 84,
-    2543: 84,
-    2542: 84,
-    2541: 84,
-    2540: 86,
-    2539: 86,
-    2538: 86,
-    2537: 86,
-    2536: 86,
-    2535: 86,
-    2534: 86,
-    2533: 86,
-    2532: 86,
-    2531: 86,
-    2530: 88,
-    2529: 88,
-    2528: 88,
-    2527: 88,
-    2526: 88,
-    2525: 88,
-    2524: 88,
-    2523: 88,
-    2522: 88,
-    2521: 88,
-    2520: 90,
-    2519: 90,
-    2518: 90,
-    2517: 90,
-    2516: 90,
-    2515: 90,
-    2514: 90,
-    2513: 90,
-    2512: 90,
-    2511: 90,
-    2510: 92,
-    2509: 92,
-    2508: 92,
-    2507: 92,
-    2506: 92,
-    2505: 92,
-    2504: 92,
-    2503: 92,
-    2502: 92,
-    2501: 92,
-    2500: 94,
-    2499: 94,
-    2498: 94,
-    2497: 94,
-    2496: 94,
-    2495: 94,
-    2494: 94,
-    2493: 94,
-    2492: 94,
-    2491: 94,
-    2490: 96,
-    2489: 96,
-    2488: 96,
-    2487: 96,
-    2486: 96,
-    2485: 96,
-    2484: 96,
-    2483: 96,
-    2482: 96,
-    2481: 96,
-    2480: 98,
-    2479: 98,
-    2478: 98,
-    2477: 98,
-    2476: 98,
-    2475: 98,
-    2474: 98,
-    2473: 98,
-    2472: 98,
-    2471: 98,
-    2470: 100,
-    2469: 100,
-    2468: 100,
-    2467: 100,
-    2466: 100,
-    2465: 100,
-    2464: 100,
-    2463: 100,
-    2462: 100,
-    2461: 100,
-    2460: 104,
-    2459: 104,
-    2458: 104,
-    2457: 104,
-    2456: 104,
-    2455: 104,
-    2454: 104,
-    2453: 104,
-    2452: 104,
-    2451: 104,
-    2450: 108,
-    2449: 108,
-    2448: 108,
-    2447: 108,
-    2446: 108,
-    2445: 108,
-    2444: 108,
-    2443: 108,
-    2442: 108,
-    2441: 108,
-    2440: 112,
-    2439: 112,
-    2438: 112,
-    2437: 112,
-    2436: 112,
-    2435: 112,
-    2434: 112,
-    2433: 112,
-    2432: 112,
-    2431: 112,
-    2430: 116,
-    2429: 116,
-    2428: 116,
-    2427: 116,
-    2426: 116,
-    2425: 116,
-    2424: 116,
-    2423: 116,
-    2422: 116,
-    2421: 116,
-    2420: 120,
-    2419: 120,
-    2418: 120,
-    2417: 120,
-    2416: 120,
-    2415: 120,
-    2414: 120,
-    2413: 120,
-    2412: 120,
-    2411: 120,
-    2410: 124,
-    2409: 124,
-    2408: 124,
-    2407: 124,
-    2406: 124,
-    2405: 124,
-    2404: 124,
-    2403: 124,
-    2402: 124,
-    2401: 124,
-    2400: 128,
-    2399: 128,
-    2398: 128,
-    2397: 128,
-    2396: 128,
-    2395: 128,
-    2394: 128,
-    2393: 128,
-    2392: 128,
-    2391: 128,
-    2390: 132,
-    2389: 132,
-    2388: 132,
-    2387: 132,
-    2386: 132,
-    2385: 132,
-    2384: 132,
-    2383: 132,
-    2382: 132,
-    2381: 132,
-    2380: 138,
-    2379: 138,
-    2378: 138,
-    2377: 138,
-    2376: 138,
-    2375: 138,
-    2374: 138,
-    2373: 138,
-    2372: 138,
-    2371: 138,
-    2370: 144,
-    2369: 144,
-    2368: 144,
-    2367: 144,
-    2366: 144,
-    2365: 144,
-    2364: 144,
-    2363: 144,
-    2362: 144,
-    2361: 144,
-    2360: 150
-  },
-  'U16F600': {
-    'min': 18150,
-    'max': 8850,
-    18150: 1,
-    18149: 1,
-    18148: 1,
-    18147: 1,
-    18146: 1,
-    18145: 1,
-    18144: 1,
-    18143: 1,
-    18142: 1,
-    18141: 1,
-    18140: 1,
-    18139: 1,
-    18138: 1,
-    18137: 1,
-    18136: 1,
-    18135: 1,
-    18134: 1,
-    18133: 1,
-    18132: 1,
-    18131: 1,
-    18130: 1,
-    18129: 1,
-    18128: 1,
-    18127: 1,
-    18126: 1,
-    18125: 1,
-    18124: 1,
-    18123: 1,
-    18122: 1,
-    18121: 1,
-    18120: 1,
-    18119: 1,
-    18118: 1,
-    18117: 1,
-    18116: 1,
-    18115: 1,
-    18114: 1,
-    18113: 1,
-    18112: 1,
-    18111: 1,
-    18110: 1,
-    18109: 1,
-    18108: 1,
-    18107: 1,
-    18106: 1,
-    18105: 1,
-    18104: 1,
-    18103: 1,
-    18102: 1,
-    18101: 1,
-    18100: 1,
-    18099: 1,
-    18098: 1,
-    18097: 1,
-    18096: 1,
-    18095: 1,
-    18094: 1,
-    18093: 1,
-    18092: 1,
-    18091: 1,
-    18090: 1,
-    18089: 1,
-    18088: 1,
-    18087: 1,
-    18086: 1,
-    18085: 1,
-    18084: 1,
-    18083: 1,
-    18082: 1,
-    18081: 1,
-    18080: 1,
-    18079: 1,
-    18078: 1,
-    18077: 1,
-    18076: 1,
-    18075: 1,
-    18074: 1,
-    18073: 1,
-    18072: 1,
-    18071: 1,
-    18070: 1,
-    18069: 1,
-    18068: 1,
-    18067: 1,
-    18066: 1,
-    18065: 1,
-    18064: 1,
-    18063: 1,
-    18062: 1,
-    18061: 1,
-    18060: 1,
-    18059: 1,
-    18058: 1,
-    18057: 1,
-    18056: 1,
-    18055: 1,
-    18054: 1,
-    18053: 1,
-    18052: 1,
-    18051: 1,
-    18050: 1,
-    18049: 1,
-    18048: 1,
-    18047: 1,
-    18046: 1,
-    18045: 1,
-    18044: 1,
-    18043: 1,
-    18042: 1,
-    18041: 1,
-    18040: 1,
-    18039: 1,
-    18038: 1,
-    18037: 1,
-    18036: 1,
-    18035: 1,
-    18034: 1,
-    18033: 1,
-    18032: 1,
-    18031: 1,
-    18030: 1,
-    18029: 1,
-    18028: 1,
-    18027: 1,
-    18026: 1,
-    18025: 1,
-    18024: 1,
-    18023: 1,
-    18022: 1,
-    18021: 1,
-    18020: 1,
-    18019: 1,
-    18018: 1,
-    18017: 1,
-    18016: 1,
-    18015: 1,
-    18014: 1,
-    18013: 1,
-    18012: 1,
-    18011: 1,
-    18010: 2,
-    18009: 2,
-    18008: 2,
-    18007: 2,
-    18006: 2,
-    18005: 2,
-    18004: 2,
-    18003: 2,
-    18002: 2,
-    18001: 2,
-    18000: 2,
-    17999: 2,
-    17998: 2,
-    17997: 2,
-    17996: 2,
-    17995: 2,
-    17994: 2,
-    17993: 2,
-    17992: 2,
-    17991: 2,
-    17990: 2,
-    17989: 2,
-    17988: 2,
-    17987: 2,
-    17986: 2,
-    17985: 2,
-    17984: 2,
-    17983: 2,
-    17982: 2,
-    17981: 2,
-    17980: 2,
-    17979: 2,
-    17978: 2,
-    17977: 2,
-    17976: 2,
-    17975: 2,
-    17974: 2,
-    17973: 2,
-    17972: 2,
-    17971: 2,
-    17970: 2,
-    17969: 2,
-    17968: 2,
-    17967: 2,
-    17966: 2,
-    17965: 2,
-    17964: 2,
-    17963: 2,
-    17962: 2,
-    17961: 2,
-    17960: 2,
-    17959: 2,
-    17958: 2,
-    17957: 2,
-    17956: 2,
-    17955: 2,
-    17954: 2,
-    17953: 2,
-    17952: 2,
-    17951: 2,
-    17950: 2,
-    17949: 2,
-    17948: 2,
-    17947: 2,
-    17946: 2,
-    17945: 2,
-    17944: 2,
-    17943: 2,
-    17942: 2,
-    17941: 2,
-    17940: 2,
-    17939: 2,
-    17938: 2,
-    17937: 2,
-    17936: 2,
-    17935: 2,
-    17934: 2,
-    17933: 2,
-    17932: 2,
-    17931: 2,
-    17930: 2,
-    17929: 2,
-    17928: 2,
-    17927: 2,
-    17926: 2,
-    17925: 2,
-    17924: 2,
-    17923: 2,
-    17922: 2,
-    17921: 2,
-    17920: 2,
-    17919: 2,
-    17918: 2,
-    17917: 2,
-    17916: 2,
-    17915: 2,
-    17914: 2,
-    17913: 2,
-    17912: 2,
-    17911: 2,
-    17910: 2,
-    17909: 2,
-    17908: 2,
-    17907: 2,
-    17906: 2,
-    17905: 2,
-    17904: 2,
-    17903: 2,
-    17902: 2,
-    17901: 2,
-    17900: 2,
-    17899: 2,
-    17898: 2,
-    17897: 2,
-    17896: 2,
-    17895: 2,
-    17894: 2,
-    17893: 2,
-    17892: 2,
-    17891: 2,
-    17890: 2,
-    17889: 2,
-    17888: 2,
-    17887: 2,
-    17886: 2,
-    17885: 2,
-    17884: 2,
-    17883: 2,
-    17882: 2,
-    17881: 2,
-    17880: 2,
-    17879: 2,
-    17878: 2,
-    17877: 2,
-    17876: 2,
-    17875: 2,
-    17874: 2,
-    17873: 2,
-    17872: 2,
-    17871: 2,
-    17870: 3,
-    17869: 3,
-    17868: 3,
-    17867: 3,
-    17866: 3,
-    17865: 3,
-    17864: 3,
-    17863: 3,
-    17862: 3,
-    17861: 3,
-    17860: 3,
-    17859: 3,
-    17858: 3,
-    17857: 3,
-    17856: 3,
-    17855: 3,
-    17854: 3,
-    17853: 3,
-    17852: 3,
-    17851: 3,
-    17850: 3,
-    17849: 3,
-    17848: 3,
-    17847: 3,
-    17846: 3,
-    17845: 3,
-    17844: 3,
-    17843: 3,
-    17842: 3,
-    17841: 3,
-    17840: 3,
-    17839: 3,
-    17838: 3,
-    17837: 3,
-    17836: 3,
-    17835: 3,
-    17834: 3,
-    17833: 3,
-    17832: 3,
-    17831: 3,
-    17830: 3,
-    17829: 3,
-    17828: 3,
-    17827: 3,
-    17826: 3,
-    17825: 3,
-    17824: 3,
-    17823: 3,
-    17822: 3,
-    17821: 3,
-    17820: 3,
-    17819: 3,
-    17818: 3,
-    17817: 3,
-    17816: 3,
-    17815: 3,
-    17814: 3,
-    17813: 3,
-    17812: 3,
-    17811: 3,
-    17810: 3,
-    17809: 3,
-    17808: 3,
-    17807: 3,
-    17806: 3,
-    17805: 3,
-    17804: 3,
-    17803: 3,
-    17802: 3,
-    17801: 3,
-    17800: 3,
-    17799: 3,
-    17798: 3,
-    17797: 3,
-    17796: 3,
-    17795: 3,
-    17794: 3,
-    17793: 3,
-    17792: 3,
-    17791: 3,
-    17790: 3,
-    17789: 3,
-    17788: 3,
-    17787: 3,
-    17786: 3,
-    17785: 3,
-    17784: 3,
-    17783: 3,
-    17782: 3,
-    17781: 3,
-    17780: 3,
-    17779: 3,
-    17778: 3,
-    17777: 3,
-    17776: 3,
-    17775: 3,
-    17774: 3,
-    17773: 3,
-    17772: 3,
-    17771: 3,
-    17770: 3,
-    17769: 3,
-    17768: 3,
-    17767: 3,
-    17766: 3,
-    17765: 3,
-    17764: 3,
-    17763: 3,
-    17762: 3,
-    17761: 3,
-    17760: 3,
-    17759: 3,
-    17758: 3,
-    17757: 3,
-    17756: 3,
-    17755: 3,
-    17754: 3,
-    17753: 3,
-    17752: 3,
-    17751: 3,
-    17750: 3,
-    17749: 3,
-    17748: 3,
-    17747: 3,
-    17746: 3,
-    17745: 3,
-    17744: 3,
-    17743: 3,
-    17742: 3,
-    17741: 3,
-    17740: 3,
-    17739: 3,
-    17738: 3,
-    17737: 3,
-    17736: 3,
-    17735: 3,
-    17734: 3,
-    17733: 3,
-    17732: 3,
-    17731: 3,
-    17730: 4,
-    17729: 4,
-    17728: 4,
-    17727: 4,
-    17726: 4,
-    17725: 4,
-    17724: 4,
-    17723: 4,
-    17722: 4,
-    17721: 4,
-    17720: 4,
-    17719: 4,
-    17718: 4,
-    17717: 4,
-    17716: 4,
-    17715: 4,
-    17714: 4,
-    17713: 4,
-    17712: 4,
-    17711: 4,
-    17710: 4,
-    17709: 4,
-    17708: 4,
-    17707: 4,
-    17706: 4,
-    17705: 4,
-    17704: 4,
-    17703: 4,
-    17702: 4,
-    17701: 4,
-    17700: 4,
-    17699: 4,
-    17698: 4,
-    17697: 4,
-    17696: 4,
-    17695: 4,
-    17694: 4,
-    17693: 4,
-    17692: 4,
-    17691: 4,
-    17690: 4,
-    17689: 4,
-    17688: 4,
-    17687: 4,
-    17686: 4,
-    17685: 4,
-    17684: 4,
-    17683: 4,
-    17682: 4,
-    17681: 4,
-    17680: 4,
-    17679: 4,
-    17678: 4,
-    17677: 4,
-    17676: 4,
-    17675: 4,
-    17674: 4,
-    17673: 4,
-    17672: 4,
-    17671: 4,
-    17670: 4,
-    17669: 4,
-    17668: 4,
-    17667: 4,
-    17666: 4,
-    17665: 4,
-    17664: 4,
-    17663: 4,
-    17662: 4,
-    17661: 4,
-    17660: 4,
-    17659: 4,
-    17658: 4,
-    17657: 4,
-    17656: 4,
-    17655: 4,
-    17654: 4,
-    17653: 4,
-    17652: 4,
-    17651: 4,
-    17650: 4,
-    17649: 4,
-    17648: 4,
-    17647: 4,
-    17646: 4,
-    17645: 4,
-    17644: 4,
-    17643: 4,
-    17642: 4,
-    17641: 4,
-    17640: 4,
-    17639: 4,
-    17638: 4,
-    17637: 4,
-    17636: 4,
-    17635: 4,
-    17634: 4,
-    17633: 4,
-    17632: 4,
-    17631: 4,
-    17630: 4,
-    17629: 4,
-    17628: 4,
-    17627: 4,
-    17626: 4,
-    17625: 4,
-    17624: 4,
-    17623: 4,
-    17622: 4,
-    17621: 4,
-    17620: 4,
-    17619: 4,
-    17618: 4,
-    17617: 4,
-    17616: 4,
-    17615: 4,
-    17614: 4,
-    17613: 4,
-    17612: 4,
-    17611: 4,
-    17610: 4,
-    17609: 4,
-    17608: 4,
-    17607: 4,
-    17606: 4,
-    17605: 4,
-    17604: 4,
-    17603: 4,
-    17602: 4,
-    17601: 4,
-    17600: 4,
-    17599: 4,
-    17598: 4,
-    17597: 4,
-    17596: 4,
-    17595: 4,
-    17594: 4,
-    17593: 4,
-    17592: 4,
-    17591: 4,
-    17590: 5,
-    17589: 5,
-    17588: 5,
-    17587: 5,
-    17586: 5,
-    17585: 5,
-    17584: 5,
-    17583: 5,
-    17582: 5,
-    17581: 5,
-    17580: 5,
-    17579: 5,
-    17578: 5,
-    17577: 5,
-    17576: 5,
-    17575: 5,
-    17574: 5,
-    17573: 5,
-    17572: 5,
-    17571: 5,
-    17570: 5,
-    17569: 5,
-    17568: 5,
-    17567: 5,
-    17566: 5,
-    17565: 5,
-    17564: 5,
-    17563: 5,
-    17562: 5,
-    17561: 5,
-    17560: 5,
-    17559: 5,
-    17558: 5,
-    17557: 5,
-    17556: 5,
-    17555: 5,
-    17554: 5,
-    17553: 5,
-    17552: 5,
-    17551: 5,
-    17550: 5,
-    17549: 5,
-    17548: 5,
-    17547: 5,
-    17546: 5,
-    17545: 5,
-    17544: 5,
-    17543: 5,
-    17542: 5,
-    17541: 5,
-    17540: 5,
-    17539: 5,
-    17538: 5,
-    17537: 5,
-    17536: 5,
-    17535: 5,
-    17534: 5,
-    17533: 5,
-    17532: 5,
-    17531: 5,
-    17530: 5,
-    17529: 5,
-    17528: 5,
-    17527: 5,
-    17526: 5,
-    17525: 5,
-    17524: 5,
-    17523: 5,
-    17522: 5,
-    17521: 5,
-    17520: 5,
-    17519: 5,
-    17518: 5,
-    17517: 5,
-    17516: 5,
-    17515: 5,
-    17514: 5,
-    17513: 5,
-    17512: 5,
-    17511: 5,
-    17510: 5,
-    17509: 5,
-    17508: 5,
-    17507: 5,
-    17506: 5,
-    17505: 5,
-    17504: 5,
-    17503: 5,
-    17502: 5,
-    17501: 5,
-    17500: 5,
-    17499: 5,
-    17498: 5,
-    17497: 5,
-    17496: 5,
-    17495: 5,
-    17494: 5,
-    17493: 5,
-    17492: 5,
-    17491: 5,
-    17490: 5,
-    17489: 5,
-    17488: 5,
-    17487: 5,
-    17486: 5,
-    17485: 5,
-    17484: 5,
-    17483: 5,
-    17482: 5,
-    17481: 5,
-    17480: 5,
-    17479: 5,
-    17478: 5,
-    17477: 5,
-    17476: 5,
-    17475: 5,
-    17474: 5,
-    17473: 5,
-    17472: 5,
-    17471: 5,
-    17470: 5,
-    17469: 5,
-    17468: 5,
-    17467: 5,
-    17466: 5,
-    17465: 5,
-    17464: 5,
-    17463: 5,
-    17462: 5,
-    17461: 5,
-    17460: 5,
-    17459: 5,
-    17458: 5,
-    17457: 5,
-    17456: 5,
-    17455: 5,
-    17454: 5,
-    17453: 5,
-    17452: 5,
-    17451: 5,
-    17450: 6,
-    17449: 6,
-    17448: 6,
-    17447: 6,
-    17446: 6,
-    17445: 6,
-    17444: 6,
-    17443: 6,
-    17442: 6,
-    17441: 6,
-    17440: 6,
-    17439: 6,
-    17438: 6,
-    17437: 6,
-    17436: 6,
-    17435: 6,
-    17434: 6,
-    17433: 6,
-    17432: 6,
-    17431: 6,
-    17430: 6,
-    17429: 6,
-    17428: 6,
-    17427: 6,
-    17426: 6,
-    17425: 6,
-    17424: 6,
-    17423: 6,
-    17422: 6,
-    17421: 6,
-    17420: 6,
-    17419: 6,
-    17418: 6,
-    17417: 6,
-    17416: 6,
-    17415: 6,
-    17414: 6,
-    17413: 6,
-    17412: 6,
-    17411: 6,
-    17410: 6,
-    17409: 6,
-    17408: 6,
-    17407: 6,
-    17406: 6,
-    17405: 6,
-    17404: 6,
-    17403: 6,
-    17402: 6,
-    17401: 6,
-    17400: 6,
-    17399: 6,
-    17398: 6,
-    17397: 6,
-    17396: 6,
-    17395: 6,
-    17394: 6,
-    17393: 6,
-    17392: 6,
-    17391: 6,
-    17390: 6,
-    17389: 6,
-    17388: 6,
-    17387: 6,
-    17386: 6,
-    17385: 6,
-    17384: 6,
-    17383: 6,
-    17382: 6,
-    17381: 6,
-    17380: 6,
-    17379: 6,
-    17378: 6,
-    17377: 6,
-    17376: 6,
-    17375: 6,
-    17374: 6,
-    17373: 6,
-    17372: 6,
-    17371: 6,
-    17370: 6,
-    17369: 6,
-    17368: 6,
-    17367: 6,
-    17366: 6,
-    17365: 6,
-    17364: 6,
-    17363: 6,
-    17362: 6,
-    17361: 6,
-    17360: 6,
-    17359: 6,
-    17358: 6,
-    17357: 6,
-    17356: 6,
-    17355: 6,
-    17354: 6,
-    17353: 6,
-    17352: 6,
-    17351: 6,
-    17350: 6,
-    17349: 6,
-    17348: 6,
-    17347: 6,
-    17346: 6,
-    17345: 6,
-    17344: 6,
-    17343: 6,
-    17342: 6,
-    17341: 6,
-    17340: 6,
-    17339: 6,
-    17338: 6,
-    17337: 6,
-    17336: 6,
-    17335: 6,
-    17334: 6,
-    17333: 6,
-    17332: 6,
-    17331: 6,
-    17330: 6,
-    17329: 6,
-    17328: 6,
-    17327: 6,
-    17326: 6,
-    17325: 6,
-    17324: 6,
-    17323: 6,
-    17322: 6,
-    17321: 6,
-    17320: 6,
-    17319: 6,
-    17318: 6,
-    17317: 6,
-    17316: 6,
-    17315: 6,
-    17314: 6,
-    17313: 6,
-    17312: 6,
-    17311: 6,
-    17310: 7,
-    17309: 7,
-    17308: 7,
-    17307: 7,
-    17306: 7,
-    17305: 7,
-    17304: 7,
-    17303: 7,
-    17302: 7,
-    17301: 7,
-    17300: 7,
-    17299: 7,
-    17298: 7,
-    17297: 7,
-    17296: 7,
-    17295: 7,
-    17294: 7,
-    17293: 7,
-    17292: 7,
-    17291: 7,
-    17290: 7,
-    17289: 7,
-    17288: 7,
-    17287: 7,
-    17286: 7,
-    17285: 7,
-    17284: 7,
-    17283: 7,
-    17282: 7,
-    17281: 7,
-    17280: 7,
-    17279: 7,
-    17278: 7,
-    17277: 7,
-    17276: 7,
-    17275: 7,
-    17274: 7,
-    17273: 7,
-    17272: 7,
-    17271: 7,
-    17270: 7,
-    17269: 7,
-    17268: 7,
-    17267: 7,
-    17266: 7,
-    17265: 7,
-    17264: 7,
-    17263: 7,
-    17262: 7,
-    17261: 7,
-    17260: 7,
-    17259: 7,
-    17258: 7,
-    17257: 7,
-    17256: 7,
-    17255: 7,
-    17254: 7,
-    17253: 7,
-    17252: 7,
-    17251: 7,
-    17250: 7,
-    17249: 7,
-    17248: 7,
-    17247: 7,
-    17246: 7,
-    17245: 7,
-    17244: 7,
-    17243: 7,
-    17242: 7,
-    17241: 7,
-    17240: 7,
-    17239: 7,
-    17238: 7,
-    17237: 7,
-    17236: 7,
-    17235: 7,
-    17234: 7,
-    17233: 7,
-    17232: 7,
-    17231: 7,
-    17230: 7,
-    17229: 7,
-    17228: 7,
-    17227: 7,
-    17226: 7,
-    17225: 7,
-    17224: 7,
-    17223: 7,
-    17222: 7,
-    17221: 7,
-    17220: 7,
-    17219: 7,
-    17218: 7,
-    17217: 7,
-    17216: 7,
-    17215: 7,
-    17214: 7,
-    17213: 7,
-    17212: 7,
-    17211: 7,
-    17210: 7,
-    17209: 7,
-    17208: 7,
-    17207: 7,
-    17206: 7,
-    17205: 7,
-    17204: 7,
-    17203: 7,
-    17202: 7,
-    17201: 7,
-    17200: 7,
-    17199: 7,
-    17198: 7,
-    17197: 7,
-    17196: 7,
-    17195: 7,
-    17194: 7,
-    17193: 7,
-    17192: 7,
-    17191: 7,
-    17190: 7,
-    17189: 7,
-    17188: 7,
-    17187: 7,
-    17186: 7,
-    17185: 7,
-    17184: 7,
-    17183: 7,
-    17182: 7,
-    17181: 7,
-    17180: 7,
-    17179: 7,
-    17178: 7,
-    17177: 7,
-    17176: 7,
-    17175: 7,
-    17174: 7,
-    17173: 7,
-    17172: 7,
-    17171: 7,
-    17170: 8,
-    17169: 8,
-    17168: 8,
-    17167: 8,
-    17166: 8,
-    17165: 8,
-    17164: 8,
-    17163: 8,
-    17162: 8,
-    17161: 8,
-    17160: 8,
-    17159: 8,
-    17158: 8,
-    17157: 8,
-    17156: 8,
-    17155: 8,
-    17154: 8,
-    17153: 8,
-    17152: 8,
-    17151: 8,
-    17150: 8,
-    17149: 8,
-    17148: 8,
-    17147: 8,
-    17146: 8,
-    17145: 8,
-    17144: 8,
-    17143: 8,
-    17142: 8,
-    17141: 8,
-    17140: 8,
-    17139: 8,
-    17138: 8,
-    17137: 8,
-    17136: 8,
-    17135: 8,
-    17134: 8,
-    17133: 8,
-    17132: 8,
-    17131: 8,
-    17130: 8,
-    17129: 8,
-    17128: 8,
-    17127: 8,
-    17126: 8,
-    17125: 8,
-    17124: 8,
-    17123: 8,
-    17122: 8,
-    17121: 8,
-    17120: 8,
-    17119: 8,
-    17118: 8,
-    17117: 8,
-    17116: 8,
-    17115: 8,
-    17114: 8,
-    17113: 8,
-    17112: 8,
-    17111: 8,
-    17110: 8,
-    17109: 8,
-    17108: 8,
-    17107: 8,
-    17106: 8,
-    17105: 8,
-    17104: 8,
-    17103: 8,
-    17102: 8,
-    17101: 8,
-    17100: 8,
-    17099: 8,
-    17098: 8,
-    17097: 8,
-    17096: 8,
-    17095: 8,
-    17094: 8,
-    17093: 8,
-    17092: 8,
-    17091: 8,
-    17090: 8,
-    17089: 8,
-    17088: 8,
-    17087: 8,
-    17086: 8,
-    17085: 8,
-    17084: 8,
-    17083: 8,
-    17082: 8,
-    17081: 8,
-    17080: 8,
-    17079: 8,
-    17078: 8,
-    17077: 8,
-    17076: 8,
-    17075: 8,
-    17074: 8,
-    17073: 8,
-    17072: 8,
-    17071: 8,
-    17070: 8,
-    17069: 8,
-    17068: 8,
-    17067: 8,
-    17066: 8,
-    17065: 8,
-    17064: 8,
-    17063: 8,
-    17062: 8,
-    17061: 8,
-    17060: 8,
-    17059: 8,
-    17058: 8,
-    17057: 8,
-    17056: 8,
-    17055: 8,
-    17054: 8,
-    17053: 8,
-    17052: 8,
-    17051: 8,
-    17050: 8,
-    17049: 8,
-    17048: 8,
-    17047: 8,
-    17046: 8,
-    17045: 8,
-    17044: 8,
-    17043: 8,
-    17042: 8,
-    17041: 8,
-    17040: 8,
-    17039: 8,
-    17038: 8,
-    17037: 8,
-    17036: 8,
-    17035: 8,
-    17034: 8,
-    17033: 8,
-    17032: 8,
-    17031: 8,
-    17030: 9,
-    17029: 9,
-    17028: 9,
-    17027: 9,
-    17026: 9,
-    17025: 9,
-    17024: 9,
-    17023: 9,
-    17022: 9,
-    17021: 9,
-    17020: 9,
-    17019: 9,
-    17018: 9,
-    17017: 9,
-    17016: 9,
-    17015: 9,
-    17014: 9,
-    17013: 9,
-    17012: 9,
-    17011: 9,
-    17010: 9,
-    17009: 9,
-    17008: 9,
-    17007: 9,
-    17006: 9,
-    17005: 9,
-    17004: 9,
-    17003: 9,
-    17002: 9,
-    17001: 9,
-    17000: 9,
-    16999: 9,
-    16998: 9,
-    16997: 9,
-    16996: 9,
-    16995: 9,
-    16994: 9,
-    16993: 9,
-    16992: 9,
-    16991: 9,
-    16990: 9,
-    16989: 9,
-    16988: 9,
-    16987: 9,
-    16986: 9,
-    16985: 9,
-    16984: 9,
-    16983: 9,
-    16982: 9,
-    16981: 9,
-    16980: 9,
-    16979: 9,
-    16978: 9,
-    16977: 9,
-    16976: 9,
-    16975: 9,
-    16974: 9,
-    16973: 9,
-    16972: 9,
-    16971: 9,
-    16970: 9,
-    16969: 9,
-    16968: 9,
-    16967: 9,
-    16966: 9,
-    16965: 9,
-    16964: 9,
-    16963: 9,
-    16962: 9,
-    16961: 9,
-    16960: 9,
-    16959: 9,
-    16958: 9,
-    16957: 9,
-    16956: 9,
-    16955: 9,
-    16954: 9,
-    16953: 9,
-    16952: 9,
-    16951: 9,
-    16950: 9,
-    16949: 9,
-    16948: 9,
-    16947: 9,
-    16946: 9,
-    16945: 9,
-    16944: 9,
-    16943: 9,
-    16942: 9,
-    16941: 9,
-    16940: 9,
-    16939: 9,
-    16938: 9,
-    16937: 9,
-    16936: 9,
-    16935: 9,
-    16934: 9,
-    16933: 9,
-    16932: 9,
-    16931: 9,
-    16930: 9,
-    16929: 9,
-    16928: 9,
-    16927: 9,
-    16926: 9,
-    16925: 9,
-    16924: 9,
-    16923: 9,
-    16922: 9,
-    16921: 9,
-    16920: 9,
-    16919: 9,
-    16918: 9,
-    16917: 9,
-    16916: 9,
-    16915: 9,
-    16914: 9,
-    16913: 9,
-    16912: 9,
-    16911: 9,
-    16910: 9,
-    16909: 9,
-    16908: 9,
-    16907: 9,
-    16906: 9,
-    16905: 9,
-    16904: 9,
-    16903: 9,
-    16902: 9,
-    16901: 9,
-    16900: 9,
-    16899: 9,
-    16898: 9,
-    16897: 9,
-    16896: 9,
-    16895: 9,
-    16894: 9,
-    16893: 9,
-    16892: 9,
-    16891: 9,
-    16890: 10,
-    16889: 10,
-    16888: 10,
-    16887: 10,
-    16886: 10,
-    16885: 10,
-    16884: 10,
-    16883: 10,
-    16882: 10,
-    16881: 10,
-    16880: 10,
-    16879: 10,
-    16878: 10,
-    16877: 10,
-    16876: 10,
-    16875: 10,
-    16874: 10,
-    16873: 10,
-    16872: 10,
-    16871: 10,
-    16870: 10,
-    16869: 10,
-    16868: 10,
-    16867: 10,
-    16866: 10,
-    16865: 10,
-    16864: 10,
-    16863: 10,
-    16862: 10,
-    16861: 10,
-    16860: 10,
-    16859: 10,
-    16858: 10,
-    16857: 10,
-    16856: 10,
-    16855: 10,
-    16854: 10,
-    16853: 10,
-    16852: 10,
-    16851: 10,
-    16850: 10,
-    16849: 10,
-    16848: 10,
-    16847: 10,
-    16846: 10,
-    16845: 10,
-    16844: 10,
-    16843: 10,
-    16842: 10,
-    16841: 10,
-    16840: 10,
-    16839: 10,
-    16838: 10,
-    16837: 10,
-    16836: 10,
-    16835: 10,
-    16834: 10,
-    16833: 10,
-    16832: 10,
-    16831: 10,
-    16830: 10,
-    16829: 10,
-    16828: 10,
-    16827: 10,
-    16826: 10,
-    16825: 10,
-    16824: 10,
-    16823: 10,
-    16822: 10,
-    16821: 10,
-    16820: 10,
-    16819: 10,
-    16818: 10,
-    16817: 10,
-    16816: 10,
-    16815: 10,
-    16814: 10,
-    16813: 10,
-    16812: 10,
-    16811: 10,
-    16810: 10,
-    16809: 10,
-    16808: 10,
-    16807: 10,
-    16806: 10,
-    16805: 10,
-    16804: 10,
-    16803: 10,
-    16802: 10,
-    16801: 10,
-    16800: 10,
-    16799: 10,
-    16798: 10,
-    16797: 10,
-    16796: 10,
-    16795: 10,
-    16794: 10,
-    16793: 10,
-    16792: 10,
-    16791: 10,
-    16790: 10,
-    16789: 10,
-    16788: 10,
-    16787: 10,
-    16786: 10,
-    16785: 10,
-    16784: 10,
-    16783: 10,
-    16782: 10,
-    16781: 10,
-    16780: 10,
-    16779: 10,
-    16778: 10,
-    16777: 10,
-    16776: 10,
-    16775: 10,
-    16774: 10,
-    16773: 10,
-    16772: 10,
-    16771: 10,
-    16770: 10,
-    16769: 10,
-    16768: 10,
-    16767: 10,
-    16766: 10,
-    16765: 10,
-    16764: 10,
-    16763: 10,
-    16762: 10,
-    16761: 10,
-    16760: 10,
-    16759: 10,
-    16758: 10,
-    16757: 10,
-    16756: 10,
-    16755: 10,
-    16754: 10,
-    16753: 10,
-    16752: 10,
-    16751: 10,
-    16750: 11,
-    16749: 11,
-    16748: 11,
-    16747: 11,
-    16746: 11,
-    16745: 11,
-    16744: 11,
-    16743: 11,
-    16742: 11,
-    16741: 11,
-    16740: 11,
-    16739: 11,
-    16738: 11,
-    16737: 11,
-    16736: 11,
-    16735: 11,
-    16734: 11,
-    16733: 11,
-    16732: 11,
-    16731: 11,
-    16730: 11,
-    16729: 11,
-    16728: 11,
-    16727: 11,
-    16726: 11,
-    16725: 11,
-    16724: 11,
-    16723: 11,
-    16722: 11,
-    16721: 11,
-    16720: 11,
-    16719: 11,
-    16718: 11,
-    16717: 11,
-    16716: 11,
-    16715: 11,
-    16714: 11,
-    16713: 11,
-    16712: 11,
-    16711: 11,
-    16710: 11,
-    16709: 11,
-    16708: 11,
-    16707: 11,
-    16706: 11,
-    16705: 11,
-    16704: 11,
-    16703: 11,
-    16702: 11,
-    16701: 11,
-    16700: 11,
-    16699: 11,
-    16698: 11,
-    16697: 11,
-    16696: 11,
-    16695: 11,
-    16694: 11,
-    16693: 11,
-    16692: 11,
-    16691: 11,
-    16690: 11,
-    16689: 11,
-    16688: 11,
-    16687: 11,
-    16686: 11,
-    16685: 11,
-    16684: 11,
-    16683: 11,
-    16682: 11,
-    16681: 11,
-    16680: 11,
-    16679: 11,
-    16678: 11,
-    16677: 11,
-    16676: 11,
-    16675: 11,
-    16674: 11,
-    16673: 11,
-    16672: 11,
-    16671: 11,
-    16670: 11,
-    16669: 11,
-    16668: 11,
-    16667: 11,
-    16666: 11,
-    16665: 11,
-    16664: 11,
-    16663: 11,
-    16662: 11,
-    16661: 11,
-    16660: 11,
-    16659: 11,
-    16658: 11,
-    16657: 11,
-    16656: 11,
-    16655: 11,
-    16654: 11,
-    16653: 11,
-    16652: 11,
-    16651: 11,
-    16650: 11,
-    16649: 11,
-    16648: 11,
-    16647: 11,
-    16646: 11,
-    16645: 11,
-    16644: 11,
-    16643: 11,
-    16642: 11,
-    16641: 11,
-    16640: 11,
-    16639: 11,
-    16638: 11,
-    16637: 11,
-    16636: 11,
-    16635: 11,
-    16634: 11,
-    16633: 11,
-    16632: 11,
-    16631: 11,
-    16630: 11,
-    16629: 11,
-    16628: 11,
-    16627: 11,
-    16626: 11,
-    16625: 11,
-    16624: 11,
-    16623: 11,
-    16622: 11,
-    16621: 11,
-    16620: 11,
-    16619: 11,
-    16618: 11,
-    16617: 11,
-    16616: 11,
-    16615: 11,
-    16614: 11,
-    16613: 11,
-    16612: 11,
-    16611: 11,
-    16610: 12,
-    16609: 12,
-    16608: 12,
-    16607: 12,
-    16606: 12,
-    16605: 12,
-    16604: 12,
-    16603: 12,
-    16602: 12,
-    16601: 12,
-    16600: 12,
-    16599: 12,
-    16598: 12,
-    16597: 12,
-    16596: 12,
-    16595: 12,
-    16594: 12,
-    16593: 12,
-    16592: 12,
-    16591: 12,
-    16590: 12,
-    16589: 12,
-    16588: 12,
-    16587: 12,
-    16586: 12,
-    16585: 12,
-    16584: 12,
-    16583: 12,
-    16582: 12,
-    16581: 12,
-    16580: 12,
-    16579: 12,
-    16578: 12,
-    16577: 12,
-    16576: 12,
-    16575: 12,
-    16574: 12,
-    16573: 12,
-    16572: 12,
-    16571: 12,
-    16570: 12,
-    16569: 12,
-    16568: 12,
-    16567: 12,
-    16566: 12,
-    16565: 12,
-    16564: 12,
-    16563: 12,
-    16562: 12,
-    16561: 12,
-    16560: 12,
-    16559: 12,
-    16558: 12,
-    16557: 12,
-    16556: 12,
-    16555: 12,
-    16554: 12,
-    16553: 12,
-    16552: 12,
-    16551: 12,
-    16550: 12,
-    16549: 12,
-    16548: 12,
-    16547: 12,
-    16546: 12,
-    16545: 12,
-    16544: 12,
-    16543: 12,
-    16542: 12,
-    16541: 12,
-    16540: 12,
-    16539: 12,
-    16538: 12,
-    16537: 12,
-    16536: 12,
-    16535: 12,
-    16534: 12,
-    16533: 12,
-    16532: 12,
-    16531: 12,
-    16530: 12,
-    16529: 12,
-    16528: 12,
-    16527: 12,
-    16526: 12,
-    16525: 12,
-    16524: 12,
-    16523: 12,
-    16522: 12,
-    16521: 12,
-    16520: 12,
-    16519: 12,
-    16518: 12,
-    16517: 12,
-    16516: 12,
-    16515: 12,
-    16514: 12,
-    16513: 12,
-    16512: 12,
-    16511: 12,
-    16510: 12,
-    16509: 12,
-    16508: 12,
-    16507: 12,
-    16506: 12,
-    16505: 12,
-    16504: 12,
-    16503: 12,
-    16502: 12,
-    16501: 12,
-    16500: 12,
-    16499: 12,
-    16498: 12,
-    16497: 12,
-    16496: 12,
-    16495: 12,
-    16494: 12,
-    16493: 12,
-    16492: 12,
-    16491: 12,
-    16490: 12,
-    16489: 12,
-    16488: 12,
-    16487: 12,
-    16486: 12,
-    16485: 12,
-    16484: 12,
-    16483: 12,
-    16482: 12,
-    16481: 12,
-    16480: 13,
-    16479: 13,
-    16478: 13,
-    16477: 13,
-    16476: 13,
-    16475: 13,
-    16474: 13,
-    16473: 13,
-    16472: 13,
-    16471: 13,
-    16470: 13,
-    16469: 13,
-    16468: 13,
-    16467: 13,
-    16466: 13,
-    16465: 13,
-    16464: 13,
-    16463: 13,
-    16462: 13,
-    16461: 13,
-    16460: 13,
-    16459: 13,
-    16458: 13,
-    16457: 13,
-    16456: 13,
-    16455: 13,
-    16454: 13,
-    16453: 13,
-    16452: 13,
-    16451: 13,
-    16450: 13,
-    16449: 13,
-    16448: 13,
-    16447: 13,
-    16446: 13,
-    16445: 13,
-    16444: 13,
-    16443: 13,
-    16442: 13,
-    16441: 13,
-    16440: 13,
-    16439: 13,
-    16438: 13,
-    16437: 13,
-    16436: 13,
-    16435: 13,
-    16434: 13,
-    16433: 13,
-    16432: 13,
-    16431: 13,
-    16430: 13,
-    16429: 13,
-    16428: 13,
-    16427: 13,
-    16426: 13,
-    16425: 13,
-    16424: 13,
-    16423: 13,
-    16422: 13,
-    16421: 13,
-    16420: 13,
-    16419: 13,
-    16418: 13,
-    16417: 13,
-    16416: 13,
-    16415: 13,
-    16414: 13,
-    16413: 13,
-    16412: 13,
-    16411: 13,
-    16410: 13,
-    16409: 13,
-    16408: 13,
-    16407: 13,
-    16406: 13,
-    16405: 13,
-    16404: 13,
-    16403: 13,
-    16402: 13,
-    16401: 13,
-    16400: 13,
-    16399: 13,
-    16398: 13,
-    16397: 13,
-    16396: 13,
-    16395: 13,
-    16394: 13,
-    16393: 13,
-    16392: 13,
-    16391: 13,
-    16390: 13,
-    16389: 13,
-    16388: 13,
-    16387: 13,
-    16386: 13,
-    16385: 13,
-    16384: 13,
-    16383: 13,
-    16382: 13,
-    16381: 13,
-    16380: 13,
-    16379: 13,
-    16378: 13,
-    16377: 13,
-    16376: 13,
-    16375: 13,
-    16374: 13,
-    16373: 13,
-    16372: 13,
-    16371: 13,
-    16370: 13,
-    16369: 13,
-    16368: 13,
-    16367: 13,
-    16366: 13,
-    16365: 13,
-    16364: 13,
-    16363: 13,
-    16362: 13,
-    16361: 13,
-    16360: 13,
-    16359: 13,
-    16358: 13,
-    16357: 13,
-    16356: 13,
-    16355: 13,
-    16354: 13,
-    16353: 13,
-    16352: 13,
-    16351: 13,
-    16350: 14,
-    16349: 14,
-    16348: 14,
-    16347: 14,
-    16346: 14,
-    16345: 14,
-    16344: 14,
-    16343: 14,
-    16342: 14,
-    16341: 14,
-    16340: 14,
-    16339: 14,
-    16338: 14,
-    16337: 14,
-    16336: 14,
-    16335: 14,
-    16334: 14,
-    16333: 14,
-    16332: 14,
-    16331: 14,
-    16330: 14,
-    16329: 14,
-    16328: 14,
-    16327: 14,
-    16326: 14,
-    16325: 14,
-    16324: 14,
-    16323: 14,
-    16322: 14,
-    16321: 14,
-    16320: 14,
-    16319: 14,
-    16318: 14,
-    16317: 14,
-    16316: 14,
-    16315: 14,
-    16314: 14,
-    16313: 14,
-    16312: 14,
-    16311: 14,
-    16310: 14,
-    16309: 14,
-    16308: 14,
-    16307: 14,
-    16306: 14,
-    16305: 14,
-    16304: 14,
-    16303: 14,
-    16302: 14,
-    16301: 14,
-    16300: 14,
-    16299: 14,
-    16298: 14,
-    16297: 14,
-    16296: 14,
-    16295: 14,
-    16294: 14,
-    16293: 14,
-    16292: 14,
-    16291: 14,
-    16290: 14,
-    16289: 14,
-    16288: 14,
-    16287: 14,
-    16286: 14,
-    16285: 14,
-    16284: 14,
-    16283: 14,
-    16282: 14,
-    16281: 14,
-    16280: 14,
-    16279: 14,
-    16278: 14,
-    16277: 14,
-    16276: 14,
-    16275: 14,
-    16274: 14,
-    16273: 14,
-    16272: 14,
-    16271: 14,
-    16270: 14,
-    16269: 14,
-    16268: 14,
-    16267: 14,
-    16266: 14,
-    16265: 14,
-    16264: 14,
-    16263: 14,
-    16262: 14,
-    16261: 14,
-    16260: 14,
-    16259: 14,
-    16258: 14,
-    16257: 14,
-    16256: 14,
-    16255: 14,
-    16254: 14,
-    16253: 14,
-    16252: 14,
-    16251: 14,
-    16250: 14,
-    16249: 14,
-    16248: 14,
-    16247: 14,
-    16246: 14,
-    16245: 14,
-    16244: 14,
-    16243: 14,
-    16242: 14,
-    16241: 14,
-    16240: 14,
-    16239: 14,
-    16238: 14,
-    16237: 14,
-    16236: 14,
-    16235: 14,
-    16234: 14,
-    16233: 14,
-    16232: 14,
-    16231: 14,
-    16230: 14,
-    16229: 14,
-    16228: 14,
-    16227: 14,
-    16226: 14,
-    16225: 14,
-    16224: 14,
-    16223: 14,
-    16222: 14,
-    16221: 14,
-    16220: 15,
-    16219: 15,
-    16218: 15,
-    16217: 15,
-    16216: 15,
-    16215: 15,
-    16214: 15,
-    16213: 15,
-    16212: 15,
-    16211: 15,
-    16210: 15,
-    16209: 15,
-    16208: 15,
-    16207: 15,
-    16206: 15,
-    16205: 15,
-    16204: 15,
-    16203: 15,
-    16202: 15,
-    16201: 15,
-    16200: 15,
-    16199: 15,
-    16198: 15,
-    16197: 15,
-    16196: 15,
-    16195: 15,
-    16194: 15,
-    16193: 15,
-    16192: 15,
-    16191: 15,
-    16190: 15,
-    16189: 15,
-    16188: 15,
-    16187: 15,
-    16186: 15,
-    16185: 15,
-    16184: 15,
-    16183: 15,
-    16182: 15,
-    16181: 15,
-    16180: 15,
-    16179: 15,
-    16178: 15,
-    16177: 15,
-    16176: 15,
-    16175: 15,
-    16174: 15,
-    16173: 15,
-    16172: 15,
-    16171: 15,
-    16170: 15,
-    16169: 15,
-    16168: 15,
-    16167: 15,
-    16166: 15,
-    16165: 15,
-    16164: 15,
-    16163: 15,
-    16162: 15,
-    16161: 15,
-    16160: 15,
-    16159: 15,
-    16158: 15,
-    16157: 15,
-    16156: 15,
-    16155: 15,
-    16154: 15,
-    16153: 15,
-    16152: 15,
-    16151: 15,
-    16150: 15,
-    16149: 15,
-    16148: 15,
-    16147: 15,
-    16146: 15,
-    16145: 15,
-    16144: 15,
-    16143: 15,
-    16142: 15,
-    16141: 15,
-    16140: 15,
-    16139: 15,
-    16138: 15,
-    16137: 15,
-    16136: 15,
-    16135: 15,
-    16134: 15,
-    16133: 15,
-    16132: 15,
-    16131: 15,
-    16130: 15,
-    16129: 15,
-    16128: 15,
-    16127: 15,
-    16126: 15,
-    16125: 15,
-    16124: 15,
-    16123: 15,
-    16122: 15,
-    16121: 15,
-    16120: 15,
-    16119: 15,
-    16118: 15,
-    16117: 15,
-    16116: 15,
-    16115: 15,
-    16114: 15,
-    16113: 15,
-    16112: 15,
-    16111: 15,
-    16110: 15,
-    16109: 15,
-    16108: 15,
-    16107: 15,
-    16106: 15,
-    16105: 15,
-    16104: 15,
-    16103: 15,
-    16102: 15,
-    16101: 15,
-    16100: 15,
-    16099: 15,
-    16098: 15,
-    16097: 15,
-    16096: 15,
-    16095: 15,
-    16094: 15,
-    16093: 15,
-    16092: 15,
-    16091: 15,
-    16090: 16,
-    16089: 16,
-    16088: 16,
-    16087: 16,
-    16086: 16,
-    16085: 16,
-    16084: 16,
-    16083: 16,
-    16082: 16,
-    16081: 16,
-    16080: 16,
-    16079: 16,
-    16078: 16,
-    16077: 16,
-    16076: 16,
-    16075: 16,
-    16074: 16,
-    16073: 16,
-    16072: 16,
-    16071: 16,
-    16070: 16,
-    16069: 16,
-    16068: 16,
-    16067: 16,
-    16066: 16,
-    16065: 16,
-    16064: 16,
-    16063: 16,
-    16062: 16,
-    16061: 16,
-    16060: 16,
-    16059: 16,
-    16058: 16,
-    16057: 16,
-    16056: 16,
-    16055: 16,
-    16054: 16,
-    16053: 16,
-    16052: 16,
-    16051: 16,
-    16050: 16,
-    16049: 16,
-    16048: 16,
-    16047: 16,
-    16046: 16,
-    16045: 16,
-    16044: 16,
-    16043: 16,
-    16042: 16,
-    16041: 16,
-    16040: 16,
-    16039: 16,
-    16038: 16,
-    16037: 16,
-    16036: 16,
-    16035: 16,
-    16034: 16,
-    16033: 16,
-    16032: 16,
-    16031: 16,
-    16030: 16,
-    16029: 16,
-    16028: 16,
-    16027: 16,
-    16026: 16,
-    16025: 16,
-    16024: 16,
-    16023: 16,
-    16022: 16,
-    16021: 16,
-    16020: 16,
-    16019: 16,
-    16018: 16,
-    16017: 16,
-    16016: 16,
-    16015: 16,
-    16014: 16,
-    16013: 16,
-    16012: 16,
-    16011: 16,
-    16010: 16,
-    16009: 16,
-    16008: 16,
-    16007: 16,
-    16006: 16,
-    16005: 16,
-    16004: 16,
-    16003: 16,
-    16002: 16,
-    16001: 16,
-    16000: 16,
-    15999: 16,
-    15998: 16,
-    15997: 16,
-    15996: 16,
-    15995: 16,
-    15994: 16,
-    15993: 16,
-    15992: 16,
-    15991: 16,
-    15990: 16,
-    15989: 16,
-    15988: 16,
-    15987: 16,
-    15986: 16,
-    15985: 16,
-    15984: 16,
-    15983: 16,
-    15982: 16,
-    15981: 16,
-    15980: 16,
-    15979: 16,
-    15978: 16,
-    15977: 16,
-    15976: 16,
-    15975: 16,
-    15974: 16,
-    15973: 16,
-    15972: 16,
-    15971: 16,
-    15970: 16,
-    15969: 16,
-    15968: 16,
-    15967: 16,
-    15966: 16,
-    15965: 16,
-    15964: 16,
-    15963: 16,
-    15962: 16,
-    15961: 16,
-    15960: 17,
-    15959: 17,
-    15958: 17,
-    15957: 17,
-    15956: 17,
-    15955: 17,
-    15954: 17,
-    15953: 17,
-    15952: 17,
-    15951: 17,
-    15950: 17,
-    15949: 17,
-    15948: 17,
-    15947: 17,
-    15946: 17,
-    15945: 17,
-    15944: 17,
-    15943: 17,
-    15942: 17,
-    15941: 17,
-    15940: 17,
-    15939: 17,
-    15938: 17,
-    15937: 17,
-    15936: 17,
-    15935: 17,
-    15934: 17,
-    15933: 17,
-    15932: 17,
-    15931: 17,
-    15930: 17,
-    15929: 17,
-    15928: 17,
-    15927: 17,
-    15926: 17,
-    15925: 17,
-    15924: 17,
-    15923: 17,
-    15922: 17,
-    15921: 17,
-    15920: 17,
-    15919: 17,
-    15918: 17,
-    15917: 17,
-    15916: 17,
-    15915: 17,
-    15914: 17,
-    15913: 17,
-    15912: 17,
-    15911: 17,
-    15910: 17,
-    15909: 17,
-    15908: 17,
-    15907: 17,
-    15906: 17,
-    15905: 17,
-    15904: 17,
-    15903: 17,
-    15902: 17,
-    15901: 17,
-    15900: 17,
-    15899: 17,
-    15898: 17,
-    15897: 17,
-    15896: 17,
-    15895: 17,
-    15894: 17,
-    15893: 17,
-    15892: 17,
-    15891: 17,
-    15890: 17,
-    15889: 17,
-    15888: 17,
-    15887: 17,
-    15886: 17,
-    15885: 17,
-    15884: 17,
-    15883: 17,
-    15882: 17,
-    15881: 17,
-    15880: 17,
-    15879: 17,
-    15878: 17,
-    15877: 17,
-    15876: 17,
-    15875: 17,
-    15874: 17,
-    15873: 17,
-    15872: 17,
-    15871: 17,
-    15870: 17,
-    15869: 17,
-    15868: 17,
-    15867: 17,
-    15866: 17,
-    15865: 17,
-    15864: 17,
-    15863: 17,
-    15862: 17,
-    15861: 17,
-    15860: 17,
-    15859: 17,
-    15858: 17,
-    15857: 17,
-    15856: 17,
-    15855: 17,
-    15854: 17,
-    15853: 17,
-    15852: 17,
-    15851: 17,
-    15850: 17,
-    15849: 17,
-    15848: 17,
-    15847: 17,
-    15846: 17,
-    15845: 17,
-    15844: 17,
-    15843: 17,
-    15842: 17,
-    15841: 17,
-    15840: 17,
-    15839: 17,
-    15838: 17,
-    15837: 17,
-    15836: 17,
-    15835: 17,
-    15834: 17,
-    15833: 17,
-    15832: 17,
-    15831: 17,
-    15830: 18,
-    15829: 18,
-    15828: 18,
-    15827: 18,
-    15826: 18,
-    15825: 18,
-    15824: 18,
-    15823: 18,
-    15822: 18,
-    15821: 18,
-    15820: 18,
-    15819: 18,
-    15818: 18,
-    15817: 18,
-    15816: 18,
-    15815: 18,
-    15814: 18,
-    15813: 18,
-    15812: 18,
-    15811: 18,
-    15810: 18,
-    15809: 18,
-    15808: 18,
-    15807: 18,
-    15806: 18,
-    15805: 18,
-    15804: 18,
-    15803: 18,
-    15802: 18,
-    15801: 18,
-    15800: 18,
-    15799: 18,
-    15798: 18,
-    15797: 18,
-    15796: 18,
-    15795: 18,
-    15794: 18,
-    15793: 18,
-    15792: 18,
-    15791: 18,
-    15790: 18,
-    15789: 18,
-    15788: 18,
-    15787: 18,
-    15786: 18,
-    15785: 18,
-    15784: 18,
-    15783: 18,
-    15782: 18,
-    15781: 18,
-    15780: 18,
-    15779: 18,
-    15778: 18,
-    15777: 18,
-    15776: 18,
-    15775: 18,
-    15774: 18,
-    15773: 18,
-    15772: 18,
-    15771: 18,
-    15770: 18,
-    15769: 18,
-    15768: 18,
-    15767: 18,
-    15766: 18,
-    15765: 18,
-    15764: 18,
-    15763: 18,
-    15762: 18,
-    15761: 18,
-    15760: 18,
-    15759: 18,
-    15758: 18,
-    15757: 18,
-    15756: 18,
-    15755: 18,
-    15754: 18,
-    15753: 18,
-    15752: 18,
-    15751: 18,
-    15750: 18,
-    15749: 18,
-    15748: 18,
-    15747: 18,
-    15746: 18,
-    15745: 18,
-    15744: 18,
-    15743: 18,
-    15742: 18,
-    15741: 18,
-    15740: 18,
-    15739: 18,
-    15738: 18,
-    15737: 18,
-    15736: 18,
-    15735: 18,
-    15734: 18,
-    15733: 18,
-    15732: 18,
-    15731: 18,
-    15730: 18,
-    15729: 18,
-    15728: 18,
-    15727: 18,
-    15726: 18,
-    15725: 18,
-    15724: 18,
-    15723: 18,
-    15722: 18,
-    15721: 18,
-    15720: 18,
-    15719: 18,
-    15718: 18,
-    15717: 18,
-    15716: 18,
-    15715: 18,
-    15714: 18,
-    15713: 18,
-    15712: 18,
-    15711: 18,
-    15710: 18,
-    15709: 18,
-    15708: 18,
-    15707: 18,
-    15706: 18,
-    15705: 18,
-    15704: 18,
-    15703: 18,
-    15702: 18,
-    15701: 18,
-    15700: 19,
-    15699: 19,
-    15698: 19,
-    15697: 19,
-    15696: 19,
-    15695: 19,
-    15694: 19,
-    15693: 19,
-    15692: 19,
-    15691: 19,
-    15690: 19,
-    15689: 19,
-    15688: 19,
-    15687: 19,
-    15686: 19,
-    15685: 19,
-    15684: 19,
-    15683: 19,
-    15682: 19,
-    15681: 19,
-    15680: 19,
-    15679: 19,
-    15678: 19,
-    15677: 19,
-    15676: 19,
-    15675: 19,
-    15674: 19,
-    15673: 19,
-    15672: 19,
-    15671: 19,
-    15670: 19,
-    15669: 19,
-    15668: 19,
-    15667: 19,
-    15666: 19,
-    15665: 19,
-    15664: 19,
-    15663: 19,
-    15662: 19,
-    15661: 19,
-    15660: 19,
-    15659: 19,
-    15658: 19,
-    15657: 19,
-    15656: 19,
-    15655: 19,
-    15654: 19,
-    15653: 19,
-    15652: 19,
-    15651: 19,
-    15650: 19,
-    15649: 19,
-    15648: 19,
-    15647: 19,
-    15646: 19,
-    15645: 19,
-    15644: 19,
-    15643: 19,
-    15642: 19,
-    15641: 19,
-    15640: 19,
-    15639: 19,
-    15638: 19,
-    15637: 19,
-    15636: 19,
-    15635: 19,
-    15634: 19,
-    15633: 19,
-    15632: 19,
-    15631: 19,
-    15630: 19,
-    15629: 19,
-    15628: 19,
-    15627: 19,
-    15626: 19,
-    15625: 19,
-    15624: 19,
-    15623: 19,
-    15622: 19,
-    15621: 19,
-    15620: 19,
-    15619: 19,
-    15618: 19,
-    15617: 19,
-    15616: 19,
-    15615: 19,
-    15614: 19,
-    15613: 19,
-    15612: 19,
-    15611: 19,
-    15610: 19,
-    15609: 19,
-    15608: 19,
-    15607: 19,
-    15606: 19,
-    15605: 19,
-    15604: 19,
-    15603: 19,
-    15602: 19,
-    15601: 19,
-    15600: 19,
-    15599: 19,
-    15598: 19,
-    15597: 19,
-    15596: 19,
-    15595: 19,
-    15594: 19,
-    15593: 19,
-    15592: 19,
-    15591: 19,
-    15590: 19,
-    15589: 19,
-    15588: 19,
-    15587: 19,
-    15586: 19,
-    15585: 19,
-    15584: 19,
-    15583: 19,
-    15582: 19,
-    15581: 19,
-    15580: 19,
-    15579: 19,
-    15578: 19,
-    15577: 19,
-    15576: 19,
-    15575: 19,
-    15574: 19,
-    15573: 19,
-    15572: 19,
-    15571: 19,
-    15570: 20,
-    15569: 20,
-    15568: 20,
-    15567: 20,
-    15566: 20,
-    15565: 20,
-    15564: 20,
-    15563: 20,
-    15562: 20,
-    15561: 20,
-    15560: 20,
-    15559: 20,
-    15558: 20,
-    15557: 20,
-    15556: 20,
-    15555: 20,
-    15554: 20,
-    15553: 20,
-    15552: 20,
-    15551: 20,
-    15550: 20,
-    15549: 20,
-    15548: 20,
-    15547: 20,
-    15546: 20,
-    15545: 20,
-    15544: 20,
-    15543: 20,
-    15542: 20,
-    15541: 20,
-    15540: 20,
-    15539: 20,
-    15538: 20,
-    15537: 20,
-    15536: 20,
-    15535: 20,
-    15534: 20,
-    15533: 20,
-    15532: 20,
-    15531: 20,
-    15530: 20,
-    15529: 20,
-    15528: 20,
-    15527: 20,
-    15526: 20,
-    15525: 20,
-    15524: 20,
-    15523: 20,
-    15522: 20,
-    15521: 20,
-    15520: 20,
-    15519: 20,
-    15518: 20,
-    15517: 20,
-    15516: 20,
-    15515: 20,
-    15514: 20,
-    15513: 20,
-    15512: 20,
-    15511: 20,
-    15510: 20,
-    15509: 20,
-    15508: 20,
-    15507: 20,
-    15506: 20,
-    15505: 20,
-    15504: 20,
-    15503: 20,
-    15502: 20,
-    15501: 20,
-    15500: 20,
-    15499: 20,
-    15498: 20,
-    15497: 20,
-    15496: 20,
-    15495: 20,
-    15494: 20,
-    15493: 20,
-    15492: 20,
-    15491: 20,
-    15490: 20,
-    15489: 20,
-    15488: 20,
-    15487: 20,
-    15486: 20,
-    15485: 20,
-    15484: 20,
-    15483: 20,
-    15482: 20,
-    15481: 20,
-    15480: 20,
-    15479: 20,
-    15478: 20,
-    15477: 20,
-    15476: 20,
-    15475: 20,
-    15474: 20,
-    15473: 20,
-    15472: 20,
-    15471: 20,
-    15470: 20,
-    15469: 20,
-    15468: 20,
-    15467: 20,
-    15466: 20,
-    15465: 20,
-    15464: 20,
-    15463: 20,
-    15462: 20,
-    15461: 20,
-    15460: 20,
-    15459: 20,
-    15458: 20,
-    15457: 20,
-    15456: 20,
-    15455: 20,
-    15454: 20,
-    15453: 20,
-    15452: 20,
-    15451: 20,
-    15450: 20,
-    15449: 20,
-    15448: 20,
-    15447: 20,
-    15446: 20,
-    15445: 20,
-    15444: 20,
-    15443: 20,
-    15442: 20,
-    15441: 20,
-    15440: 21,
-    15439: 21,
-    15438: 21,
-    15437: 21,
-    15436: 21,
-    15435: 21,
-    15434: 21,
-    15433: 21,
-    15432: 21,
-    15431: 21,
-    15430: 21,
-    15429: 21,
-    15428: 21,
-    15427: 21,
-    15426: 21,
-    15425: 21,
-    15424: 21,
-    15423: 21,
-    15422: 21,
-    15421: 21,
-    15420: 21,
-    15419: 21,
-    15418: 21,
-    15417: 21,
-    15416: 21,
-    15415: 21,
-    15414: 21,
-    15413: 21,
-    15412: 21,
-    15411: 21,
-    15410: 21,
-    15409: 21,
-    15408: 21,
-    15407: 21,
-    15406: 21,
-    15405: 21,
-    15404: 21,
-    15403: 21,
-    15402: 21,
-    15401: 21,
-    15400: 21,
-    15399: 21,
-    15398: 21,
-    15397: 21,
-    15396: 21,
-    15395: 21,
-    15394: 21,
-    15393: 21,
-    15392: 21,
-    15391: 21,
-    15390: 21,
-    15389: 21,
-    15388: 21,
-    15387: 21,
-    15386: 21,
-    15385: 21,
-    15384: 21,
-    15383: 21,
-    15382: 21,
-    15381: 21,
-    15380: 21,
-    15379: 21,
-    15378: 21,
-    15377: 21,
-    15376: 21,
-    15375: 21,
-    15374: 21,
-    15373: 21,
-    15372: 21,
-    15371: 21,
-    15370: 21,
-    15369: 21,
-    15368: 21,
-    15367: 21,
-    15366: 21,
-    15365: 21,
-    15364: 21,
-    15363: 21,
-    15362: 21,
-    15361: 21,
-    15360: 21,
-    15359: 21,
-    15358: 21,
-    15357: 21,
-    15356: 21,
-    15355: 21,
-    15354: 21,
-    15353: 21,
-    15352: 21,
-    15351: 21,
-    15350: 21,
-    15349: 21,
-    15348: 21,
-    15347: 21,
-    15346: 21,
-    15345: 21,
-    15344: 21,
-    15343: 21,
-    15342: 21,
-    15341: 21,
-    15340: 21,
-    15339: 21,
-    15338: 21,
-    15337: 21,
-    15336: 21,
-    15335: 21,
-    15334: 21,
-    15333: 21,
-    15332: 21,
-    15331: 21,
-    15330: 21,
-    15329: 21,
-    15328: 21,
-    15327: 21,
-    15326: 21,
-    15325: 21,
-    15324: 21,
-    15323: 21,
-    15322: 21,
-    15321: 21,
-    15320: 22,
-    15319: 22,
-    15318: 22,
-    15317: 22,
-    15316: 22,
-    15315: 22,
-    15314: 22,
-    15313: 22,
-    15312: 22,
-    15311: 22,
-    15310: 22,
-    15309: 22,
-    15308: 22,
-    15307: 22,
-    15306: 22,
-    15305: 22,
-    15304: 22,
-    15303: 22,
-    15302: 22,
-    15301: 22,
-    15300: 22,
-    15299: 22,
-    15298: 22,
-    15297: 22,
-    15296: 22,
-    15295: 22,
-    15294: 22,
-    15293: 22,
-    15292: 22,
-    15291: 22,
-    15290: 22,
-    15289: 22,
-    15288: 22,
-    15287: 22,
-    15286: 22,
-    15285: 22,
-    15284: 22,
-    15283: 22,
-    15282: 22,
-    15281: 22,
-    15280: 22,
-    15279: 22,
-    15278: 22,
-    15277: 22,
-    15276: 22,
-    15275: 22,
-    15274: 22,
-    15273: 22,
-    15272: 22,
-    15271: 22,
-    15270: 22,
-    15269: 22,
-    15268: 22,
-    15267: 22,
-    15266: 22,
-    15265: 22,
-    15264: 22,
-    15263: 22,
-    15262: 22,
-    15261: 22,
-    15260: 22,
-    15259: 22,
-    15258: 22,
-    15257: 22,
-    15256: 22,
-    15255: 22,
-    15254: 22,
-    15253: 22,
-    15252: 22,
-    15251: 22,
-    15250: 22,
-    15249: 22,
-    15248: 22,
-    15247: 22,
-    15246: 22,
-    15245: 22,
-    15244: 22,
-    15243: 22,
-    15242: 22,
-    15241: 22,
-    15240: 22,
-    15239: 22,
-    15238: 22,
-    15237: 22,
-    15236: 22,
-    15235: 22,
-    15234: 22,
-    15233: 22,
-    15232: 22,
-    15231: 22,
-    15230: 22,
-    15229: 22,
-    15228: 22,
-    15227: 22,
-    15226: 22,
-    15225: 22,
-    15224: 22,
-    15223: 22,
-    15222: 22,
-    15221: 22,
-    15220: 22,
-    15219: 22,
-    15218: 22,
-    15217: 22,
-    15216: 22,
-    15215: 22,
-    15214: 22,
-    15213: 22,
-    15212: 22,
-    15211: 22,
-    15210: 22,
-    15209: 22,
-    15208: 22,
-    15207: 22,
-    15206: 22,
-    15205: 22,
-    15204: 22,
-    15203: 22,
-    15202: 22,
-    15201: 22,
-    15200: 23,
-    15199: 23,
-    15198: 23,
-    15197: 23,
-    15196: 23,
-    15195: 23,
-    15194: 23,
-    15193: 23,
-    15192: 23,
-    15191: 23,
-    15190: 23,
-    15189: 23,
-    15188: 23,
-    15187: 23,
-    15186: 23,
-    15185: 23,
-    15184: 23,
-    15183: 23,
-    15182: 23,
-    15181: 23,
-    15180: 23,
-    15179: 23,
-    15178: 23,
-    15177: 23,
-    15176: 23,
-    15175: 23,
-    15174: 23,
-    15173: 23,
-    15172: 23,
-    15171: 23,
-    15170: 23,
-    15169: 23,
-    15168: 23,
-    15167: 23,
-    15166: 23,
-    15165: 23,
-    15164: 23,
-    15163: 23,
-    15162: 23,
-    15161: 23,
-    15160: 23,
-    15159: 23,
-    15158: 23,
-    15157: 23,
-    15156: 23,
-    15155: 23,
-    15154: 23,
-    15153: 23,
-    15152: 23,
-    15151: 23,
-    15150: 23,
-    15149: 23,
-    15148: 23,
-    15147: 23,
-    15146: 23,
-    15145: 23,
-    15144: 23,
-    15143: 23,
-    15142: 23,
-    15141: 23,
-    15140: 23,
-    15139: 23,
-    15138: 23,
-    15137: 23,
-    15136: 23,
-    15135: 23,
-    15134: 23,
-    15133: 23,
-    15132: 23,
-    15131: 23,
-    15130: 23,
-    15129: 23,
-    15128: 23,
-    15127: 23,
-    15126: 23,
-    15125: 23,
-    15124: 23,
-    15123: 23,
-    15122: 23,
-    15121: 23,
-    15120: 23,
-    15119: 23,
-    15118: 23,
-    15117: 23,
-    15116: 23,
-    15115: 23,
-    15114: 23,
-    15113: 23,
-    15112: 23,
-    15111: 23,
-    15110: 23,
-    15109: 23,
-    15108: 23,
-    15107: 23,
-    15106: 23,
-    15105: 23,
-    15104: 23,
-    15103: 23,
-    15102: 23,
-    15101: 23,
-    15100: 23,
-    15099: 23,
-    15098: 23,
-    15097: 23,
-    15096: 23,
-    15095: 23,
-    15094: 23,
-    15093: 23,
-    15092: 23,
-    15091: 23,
-    15090: 23,
-    15089: 23,
-    15088: 23,
-    15087: 23,
-    15086: 23,
-    15085: 23,
-    15084: 23,
-    15083: 23,
-    15082: 23,
-    15081: 23,
-    15080: 24,
-    15079: 24,
-    15078: 24,
-    15077: 24,
-    15076: 24,
-    15075: 24,
-    15074: 24,
-    15073: 24,
-    15072: 24,
-    15071: 24,
-    15070: 24,
-    15069: 24,
-    15068: 24,
-    15067: 24,
-    15066: 24,
-    15065: 24,
-    15064: 24,
-    15063: 24,
-    15062: 24,
-    15061: 24,
-    15060: 24,
-    15059: 24,
-    15058: 24,
-    15057: 24,
-    15056: 24,
-    15055: 24,
-    15054: 24,
-    15053: 24,
-    15052: 24,
-    15051: 24,
-    15050: 24,
-    15049: 24,
-    15048: 24,
-    15047: 24,
-    15046: 24,
-    15045: 24,
-    15044: 24,
-    15043: 24,
-    15042: 24,
-    15041: 24,
-    15040: 24,
-    15039: 24,
-    15038: 24,
-    15037: 24,
-    15036: 24,
-    15035: 24,
-    15034: 24,
-    15033: 24,
-    15032: 24,
-    15031: 24,
-    15030: 24,
-    15029: 24,
-    15028: 24,
-    15027: 24,
-    15026: 24,
-    15025: 24,
-    15024: 24,
-    15023: 24,
-    15022: 24,
-    15021: 24,
-    15020: 24,
-    15019: 24,
-    15018: 24,
-    15017: 24,
-    15016: 24,
-    15015: 24,
-    15014: 24,
-    15013: 24,
-    15012: 24,
-    15011: 24,
-    15010: 24,
-    15009: 24,
-    15008: 24,
-    15007: 24,
-    15006: 24,
-    15005: 24,
-    15004: 24,
-    15003: 24,
-    15002: 24,
-    15001: 24,
-    15000: 24,
-    14999: 24,
-    14998: 24,
-    14997: 24,
-    14996: 24,
-    14995: 24,
-    14994: 24,
-    14993: 24,
-    14992: 24,
-    14991: 24,
-    14990: 24,
-    14989: 24,
-    14988: 24,
-    14987: 24,
-    14986: 24,
-    14985: 24,
-    14984: 24,
-    14983: 24,
-    14982: 24,
-    14981: 24,
-    14980: 24,
-    14979: 24,
-    14978: 24,
-    14977: 24,
-    14976: 24,
-    14975: 24,
-    14974: 24,
-    14973: 24,
-    14972: 24,
-    14971: 24,
-    14970: 24,
-    14969: 24,
-    14968: 24,
-    14967: 24,
-    14966: 24,
-    14965: 24,
-    14964: 24,
-    14963: 24,
-    14962: 24,
-    14961: 24,
-    14960: 25,
-    14959: 25,
-    14958: 25,
-    14957: 25,
-    14956: 25,
-    14955: 25,
-    14954: 25,
-    14953: 25,
-    14952: 25,
-    14951: 25,
-    14950: 25,
-    14949: 25,
-    14948: 25,
-    14947: 25,
-    14946: 25,
-    14945: 25,
-    14944: 25,
-    14943: 25,
-    14942: 25,
-    14941: 25,
-    14940: 25,
-    14939: 25,
-    14938: 25,
-    14937: 25,
-    14936: 25,
-    14935: 25,
-    14934: 25,
-    14933: 25,
-    14932: 25,
-    14931: 25,
-    14930: 25,
-    14929: 25,
-    14928: 25,
-    14927: 25,
-    14926: 25,
-    14925: 25,
-    14924: 25,
-    14923: 25,
-    14922: 25,
-    14921: 25,
-    14920: 25,
-    14919: 25,
-    14918: 25,
-    14917: 25,
-    14916: 25,
-    14915: 25,
-    14914: 25,
-    14913: 25,
-    14912: 25,
-    14911: 25,
-    14910: 25,
-    14909: 25,
-    14908: 25,
-    14907: 25,
-    14906: 25,
-    14905: 25,
-    14904: 25,
-    14903: 25,
-    14902: 25,
-    14901: 25,
-    14900: 25,
-    14899: 25,
-    14898: 25,
-    14897: 25,
-    14896: 25,
-    14895: 25,
-    14894: 25,
-    14893: 25,
-    14892: 25,
-    14891: 25,
-    14890: 25,
-    14889: 25,
-    14888: 25,
-    14887: 25,
-    14886: 25,
-    14885: 25,
-    14884: 25,
-    14883: 25,
-    14882: 25,
-    14881: 25,
-    14880: 25,
-    14879: 25,
-    14878: 25,
-    14877: 25,
-    14876: 25,
-    14875: 25,
-    14874: 25,
-    14873: 25,
-    14872: 25,
-    14871: 25,
-    14870: 25,
-    14869: 25,
-    14868: 25,
-    14867: 25,
-    14866: 25,
-    14865: 25,
-    14864: 25,
-    14863: 25,
-    14862: 25,
-    14861: 25,
-    14860: 25,
-    14859: 25,
-    14858: 25,
-    14857: 25,
-    14856: 25,
-    14855: 25,
-    14854: 25,
-    14853: 25,
-    14852: 25,
-    14851: 25,
-    14850: 25,
-    14849: 25,
-    14848: 25,
-    14847: 25,
-    14846: 25,
-    14845: 25,
-    14844: 25,
-    14843: 25,
-    14842: 25,
-    14841: 25,
-    14840: 26,
-    14839: 26,
-    14838: 26,
-    14837: 26,
-    14836: 26,
-    14835: 26,
-    14834: 26,
-    14833: 26,
-    14832: 26,
-    14831: 26,
-    14830: 26,
-    14829: 26,
-    14828: 26,
-    14827: 26,
-    14826: 26,
-    14825: 26,
-    14824: 26,
-    14823: 26,
-    14822: 26,
-    14821: 26,
-    14820: 26,
-    14819: 26,
-    14818: 26,
-    14817: 26,
-    14816: 26,
-    14815: 26,
-    14814: 26,
-    14813: 26,
-    14812: 26,
-    14811: 26,
-    14810: 26,
-    14809: 26,
-    14808: 26,
-    14807: 26,
-    14806: 26,
-    14805: 26,
-    14804: 26,
-    14803: 26,
-    14802: 26,
-    14801: 26,
-    14800: 26,
-    14799: 26,
-    14798: 26,
-    14797: 26,
-    14796: 26,
-    14795: 26,
-    14794: 26,
-    14793: 26,
-    14792: 26,
-    14791: 26,
-    14790: 26,
-    14789: 26,
-    14788: 26,
-    14787: 26,
-    14786: 26,
-    14785: 26,
-    14784: 26,
-    14783: 26,
-    14782: 26,
-    14781: 26,
-    14780: 26,
-    14779: 26,
-    14778: 26,
-    14777: 26,
-    14776: 26,
-    14775: 26,
-    14774: 26,
-    14773: 26,
-    14772: 26,
-    14771: 26,
-    14770: 26,
-    14769: 26,
-    14768: 26,
-    14767: 26,
-    14766: 26,
-    14765: 26,
-    14764: 26,
-    14763: 26,
-    14762: 26,
-    14761: 26,
-    14760: 26,
-    14759: 26,
-    14758: 26,
-    14757: 26,
-    14756: 26,
-    14755: 26,
-    14754: 26,
-    14753: 26,
-    14752: 26,
-    14751: 26,
-    14750: 26,
-    14749: 26,
-    14748: 26,
-    14747: 26,
-    14746: 26,
-    14745: 26,
-    14744: 26,
-    14743: 26,
-    14742: 26,
-    14741: 26,
-    14740: 26,
-    14739: 26,
-    14738: 26,
-    14737: 26,
-    14736: 26,
-    14735: 26,
-    14734: 26,
-    14733: 26,
-    14732: 26,
-    14731: 26,
-    14730: 26,
-    14729: 26,
-    14728: 26,
-    14727: 26,
-    14726: 26,
-    14725: 26,
-    14724: 26,
-    14723: 26,
-    14722: 26,
-    14721: 26,
-    14720: 27,
-    14719: 27,
-    14718: 27,
-    14717: 27,
-    14716: 27,
-    14715: 27,
-    14714: 27,
-    14713: 27,
-    14712: 27,
-    14711: 27,
-    14710: 27,
-    14709: 27,
-    14708: 27,
-    14707: 27,
-    14706: 27,
-    14705: 27,
-    14704: 27,
-    14703: 27,
-    14702: 27,
-    14701: 27,
-    14700: 27,
-    14699: 27,
-    14698: 27,
-    14697: 27,
-    14696: 27,
-    14695: 27,
-    14694: 27,
-    14693: 27,
-    14692: 27,
-    14691: 27,
-    14690: 27,
-    14689: 27,
-    14688: 27,
-    14687: 27,
-    14686: 27,
-    14685: 27,
-    14684: 27,
-    14683: 27,
-    14682: 27,
-    14681: 27,
-    14680: 27,
-    14679: 27,
-    14678: 27,
-    14677: 27,
-    14676: 27,
-    14675: 27,
-    14674: 27,
-    14673: 27,
-    14672: 27,
-    14671: 27,
-    14670: 27,
-    14669: 27,
-    14668: 27,
-    14667: 27,
-    14666: 27,
-    14665: 27,
-    14664: 27,
-    14663: 27,
-    14662: 27,
-    14661: 27,
-    14660: 27,
-    14659: 27,
-    14658: 27,
-    14657: 27,
-    14656: 27,
-    14655: 27,
-    14654: 27,
-    14653: 27,
-    14652: 27,
-    14651: 27,
-    14650: 27,
-    14649: 27,
-    14648: 27,
-    14647: 27,
-    14646: 27,
-    14645: 27,
-    14644: 27,
-    14643: 27,
-    14642: 27,
-    14641: 27,
-    14640: 27,
-    14639: 27,
-    14638: 27,
-    14637: 27,
-    14636: 27,
-    14635: 27,
-    14634: 27,
-    14633: 27,
-    14632: 27,
-    14631: 27,
-    14630: 27,
-    14629: 27,
-    14628: 27,
-    14627: 27,
-    14626: 27,
-    14625: 27,
-    14624: 27,
-    14623: 27,
-    14622: 27,
-    14621: 27,
-    14620: 27,
-    14619: 27,
-    14618: 27,
-    14617: 27,
-    14616: 27,
-    14615: 27,
-    14614: 27,
-    14613: 27,
-    14612: 27,
-    14611: 27,
-    14610: 27,
-    14609: 27,
-    14608: 27,
-    14607: 27,
-    14606: 27,
-    14605: 27,
-    14604: 27,
-    14603: 27,
-    14602: 27,
-    14601: 27,
-    14600: 28,
-    14599: 28,
-    14598: 28,
-    14597: 28,
-    14596: 28,
-    14595: 28,
-    14594: 28,
-    14593: 28,
-    14592: 28,
-    14591: 28,
-    14590: 28,
-    14589: 28,
-    14588: 28,
-    14587: 28,
-    14586: 28,
-    14585: 28,
-    14584: 28,
-    14583: 28,
-    14582: 28,
-    14581: 28,
-    14580: 28,
-    14579: 28,
-    14578: 28,
-    14577: 28,
-    14576: 28,
-    14575: 28,
-    14574: 28,
-    14573: 28,
-    14572: 28,
-    14571: 28,
-    14570: 28,
-    14569: 28,
-    14568: 28,
-    14567: 28,
-    14566: 28,
-    14565: 28,
-    14564: 28,
-    14563: 28,
-    14562: 28,
-    14561: 28,
-    14560: 28,
-    14559: 28,
-    14558: 28,
-    14557: 28,
-    14556: 28,
-    14555: 28,
-    14554: 28,
-    14553: 28,
-    14552: 28,
-    14551: 28,
-    14550: 28,
-    14549: 28,
-    14548: 28,
-    14547: 28,
-    14546: 28,
-    14545: 28,
-    14544: 28,
-    14543: 28,
-    14542: 28,
-    14541: 28,
-    14540: 28,
-    14539: 28,
-    14538: 28,
-    14537: 28,
-    14536: 28,
-    14535: 28,
-    14534: 28,
-    14533: 28,
-    14532: 28,
-    14531: 28,
-    14530: 28,
-    14529: 28,
-    14528: 28,
-    14527: 28,
-    14526: 28,
-    14525: 28,
-    14524: 28,
-    14523: 28,
-    14522: 28,
-    14521: 28,
-    14520: 28,
-    14519: 28,
-    14518: 28,
-    14517: 28,
-    14516: 28,
-    14515: 28,
-    14514: 28,
-    14513: 28,
-    14512: 28,
-    14511: 28,
-    14510: 28,
-    14509: 28,
-    14508: 28,
-    14507: 28,
-    14506: 28,
-    14505: 28,
-    14504: 28,
-    14503: 28,
-    14502: 28,
-    14501: 28,
-    14500: 28,
-    14499: 28,
-    14498: 28,
-    14497: 28,
-    14496: 28,
-    14495: 28,
-    14494: 28,
-    14493: 28,
-    14492: 28,
-    14491: 28,
-    14490: 28,
-    14489: 28,
-    14488: 28,
-    14487: 28,
-    14486: 28,
-    14485: 28,
-    14484: 28,
-    14483: 28,
-    14482: 28,
-    14481: 28,
-    14480: 29,
-    14479: 29,
-    14478: 29,
-    14477: 29,
-    14476: 29,
-    14475: 29,
-    14474: 29,
-    14473: 29,
-    14472: 29,
-    14471: 29,
-    14470: 29,
-    14469: 29,
-    14468: 29,
-    14467: 29,
-    14466: 29,
-    14465: 29,
-    14464: 29,
-    14463: 29,
-    14462: 29,
-    14461: 29,
-    14460: 29,
-    14459: 29,
-    14458: 29,
-    14457: 29,
-    14456: 29,
-    14455: 29,
-    14454: 29,
-    14453: 29,
-    14452: 29,
-    14451: 29,
-    14450: 29,
-    14449: 29,
-    14448: 29,
-    14447: 29,
-    14446: 29,
-    14445: 29,
-    14444: 29,
-    14443: 29,
-    14442: 29,
-    14441: 29,
-    14440: 29,
-    14439: 29,
-    14438: 29,
-    14437: 29,
-    14436: 29,
-    14435: 29,
-    14434: 29,
-    14433: 29,
-    14432: 29,
-    14431: 29,
-    14430: 29,
-    14429: 29,
-    14428: 29,
-    14427: 29,
-    14426: 29,
-    14425: 29,
-    14424: 29,
-    14423: 29,
-    14422: 29,
-    14421: 29,
-    14420: 29,
-    14419: 29,
-    14418: 29,
-    14417: 29,
-    14416: 29,
-    14415: 29,
-    14414: 29,
-    14413: 29,
-    14412: 29,
-    14411: 29,
-    14410: 29,
-    14409: 29,
-    14408: 29,
-    14407: 29,
-    14406: 29,
-    14405: 29,
-    14404: 29,
-    14403: 29,
-    14402: 29,
-    14401: 29,
-    14400: 29,
-    14399: 29,
-    14398: 29,
-    14397: 29,
-    14396: 29,
-    14395: 29,
-    14394: 29,
-    14393: 29,
-    14392: 29,
-    14391: 29,
-    14390: 29,
-    14389: 29,
-    14388: 29,
-    14387: 29,
-    14386: 29,
-    14385: 29,
-    14384: 29,
-    14383: 29,
-    14382: 29,
-    14381: 29,
-    14380: 29,
-    14379: 29,
-    14378: 29,
-    14377: 29,
-    14376: 29,
-    14375: 29,
-    14374: 29,
-    14373: 29,
-    14372: 29,
-    14371: 29,
-    14370: 29,
-    14369: 29,
-    14368: 29,
-    14367: 29,
-    14366: 29,
-    14365: 29,
-    14364: 29,
-    14363: 29,
-    14362: 29,
-    14361: 29,
-    14360: 30,
-    14359: 30,
-    14358: 30,
-    14357: 30,
-    14356: 30,
-    14355: 30,
-    14354: 30,
-    14353: 30,
-    14352: 30,
-    14351: 30,
-    14350: 30,
-    14349: 30,
-    14348: 30,
-    14347: 30,
-    14346: 30,
-    14345: 30,
-    14344: 30,
-    14343: 30,
-    14342: 30,
-    14341: 30,
-    14340: 30,
-    14339: 30,
-    14338: 30,
-    14337: 30,
-    14336: 30,
-    14335: 30,
-    14334: 30,
-    14333: 30,
-    14332: 30,
-    14331: 30,
-    14330: 30,
-    14329: 30,
-    14328: 30,
-    14327: 30,
-    14326: 30,
-    14325: 30,
-    14324: 30,
-    14323: 30,
-    14322: 30,
-    14321: 30,
-    14320: 30,
-    14319: 30,
-    14318: 30,
-    14317: 30,
-    14316: 30,
-    14315: 30,
-    14314: 30,
-    14313: 30,
-    14312: 30,
-    14311: 30,
-    14310: 30,
-    14309: 30,
-    14308: 30,
-    14307: 30,
-    14306: 30,
-    14305: 30,
-    14304: 30,
-    14303: 30,
-    14302: 30,
-    14301: 30,
-    14300: 30,
-    14299: 30,
-    14298: 30,
-    14297: 30,
-    14296: 30,
-    14295: 30,
-    14294: 30,
-    14293: 30,
-    14292: 30,
-    14291: 30,
-    14290: 30,
-    14289: 30,
-    14288: 30,
-    14287: 30,
-    14286: 30,
-    14285: 30,
-    14284: 30,
-    14283: 30,
-    14282: 30,
-    14281: 30,
-    14280: 30,
-    14279: 30,
-    14278: 30,
-    14277: 30,
-    14276: 30,
-    14275: 30,
-    14274: 30,
-    14273: 30,
-    14272: 30,
-    14271: 30,
-    14270: 30,
-    14269: 30,
-    14268: 30,
-    14267: 30,
-    14266: 30,
-    14265: 30,
-    14264: 30,
-    14263: 30,
-    14262: 30,
-    14261: 30,
-    14260: 30,
-    14259: 30,
-    14258: 30,
-    14257: 30,
-    14256: 30,
-    14255: 30,
-    14254: 30,
-    14253: 30,
-    14252: 30,
-    14251: 30,
-    14250: 31,
-    14249: 31,
-    14248: 31,
-    14247: 31,
-    14246: 31,
-    14245: 31,
-    14244: 31,
-    14243: 31,
-    14242: 31,
-    14241: 31,
-    14240: 31,
-    14239: 31,
-    14238: 31,
-    14237: 31,
-    14236: 31,
-    14235: 31,
-    14234: 31,
-    14233: 31,
-    14232: 31,
-    14231: 31,
-    14230: 31,
-    14229: 31,
-    14228: 31,
-    14227: 31,
-    14226: 31,
-    14225: 31,
-    14224: 31,
-    14223: 31,
-    14222: 31,
-    14221: 31,
-    14220: 31,
-    14219: 31,
-    14218: 31,
-    14217: 31,
-    14216: 31,
-    14215: 31,
-    14214: 31,
-    14213: 31,
-    14212: 31,
-    14211: 31,
-    14210: 31,
-    14209: 31,
-    14208: 31,
-    14207: 31,
-    14206: 31,
-    14205: 31,
-    14204: 31,
-    14203: 31,
-    14202: 31,
-    14201: 31,
-    14200: 31,
-    14199: 31,
-    14198: 31,
-    14197: 31,
-    14196: 31,
-    14195: 31,
-    14194: 31,
-    14193: 31,
-    14192: 31,
-    14191: 31,
-    14190: 31,
-    14189: 31,
-    14188: 31,
-    14187: 31,
-    14186: 31,
-    14185: 31,
-    14184: 31,
-    14183: 31,
-    14182: 31,
-    14181: 31,
-    14180: 31,
-    14179: 31,
-    14178: 31,
-    14177: 31,
-    14176: 31,
-    14175: 31,
-    14174: 31,
-    14173: 31,
-    14172: 31,
-    14171: 31,
-    14170: 31,
-    14169: 31,
-    14168: 31,
-    14167: 31,
-    14166: 31,
-    14165: 31,
-    14164: 31,
-    14163: 31,
-    14162: 31,
-    14161: 31,
-    14160: 31,
-    14159: 31,
-    14158: 31,
-    14157: 31,
-    14156: 31,
-    14155: 31,
-    14154: 31,
-    14153: 31,
-    14152: 31,
-    14151: 31,
-    14150: 31,
-    14149: 31,
-    14148: 31,
-    14147: 31,
-    14146: 31,
-    14145: 31,
-    14144: 31,
-    14143: 31,
-    14142: 31,
-    14141: 31,
-    14140: 32,
-    14139: 32,
-    14138: 32,
-    14137: 32,
-    14136: 32,
-    14135: 32,
-    14134: 32,
-    14133: 32,
-    14132: 32,
-    14131: 32,
-    14130: 32,
-    14129: 32,
-    14128: 32,
-    14127: 32,
-    14126: 32,
-    14125: 32,
-    14124: 32,
-    14123: 32,
-    14122: 32,
-    14121: 32,
-    14120: 32,
-    14119: 32,
-    14118: 32,
-    14117: 32,
-    14116: 32,
-    14115: 32,
-    14114: 32,
-    14113: 32,
-    14112: 32,
-    14111: 32,
-    14110: 32,
-    14109: 32,
-    14108: 32,
-    14107: 32,
-    14106: 32,
-    14105: 32,
-    14104: 32,
-    14103: 32,
-    14102: 32,
-    14101: 32,
-    14100: 32,
-    14099: 32,
-    14098: 32,
-    14097: 32,
-    14096: 32,
-    14095: 32,
-    14094: 32,
-    14093: 32,
-    14092: 32,
-    14091: 32,
-    14090: 32,
-    14089: 32,
-    14088: 32,
-    14087: 32,
-    14086: 32,
-    14085: 32,
-    14084: 32,
-    14083: 32,
-    14082: 32,
-    14081: 32,
-    14080: 32,
-    14079: 32,
-    14078: 32,
-    14077: 32,
-    14076: 32,
-    14075: 32,
-    14074: 32,
-    14073: 32,
-    14072: 32,
-    14071: 32,
-    14070: 32,
-    14069: 32,
-    14068: 32,
-    14067: 32,
-    14066: 32,
-    14065: 32,
-    14064: 32,
-    14063: 32,
-    14062: 32,
-    14061: 32,
-    14060: 32,
-    14059: 32,
-    14058: 32,
-    14057: 32,
-    14056: 32,
-    14055: 32,
-    14054: 32,
-    14053: 32,
-    14052: 32,
-    14051: 32,
-    14050: 32,
-    14049: 32,
-    14048: 32,
-    14047: 32,
-    14046: 32,
-    14045: 32,
-    14044: 32,
-    14043: 32,
-    14042: 32,
-    14041: 32,
-    14040: 32,
-    14039: 32,
-    14038: 32,
-    14037: 32,
-    14036: 32,
-    14035: 32,
-    14034: 32,
-    14033: 32,
-    14032: 32,
-    14031: 32,
-    14030: 33,
-    14029: 33,
-    14028: 33,
-    14027: 33,
-    14026: 33,
-    14025: 33,
-    14024: 33,
-    14023: 33,
-    14022: 33,
-    14021: 33,
-    14020: 33,
-    14019: 33,
-    14018: 33,
-    14017: 33,
-    14016: 33,
-    14015: 33,
-    14014: 33,
-    14013: 33,
-    14012: 33,
-    14011: 33,
-    14010: 33,
-    14009: 33,
-    14008: 33,
-    14007: 33,
-    14006: 33,
-    14005: 33,
-    14004: 33,
-    14003: 33,
-    14002: 33,
-    14001: 33,
-    14000: 33,
-    13999: 33,
-    13998: 33,
-    13997: 33,
-    13996: 33,
-    13995: 33,
-    13994: 33,
-    13993: 33,
-    13992: 33,
-    13991: 33,
-    13990: 33,
-    13989: 33,
-    13988: 33,
-    13987: 33,
-    13986: 33,
-    13985: 33,
-    13984: 33,
-    13983: 33,
-    13982: 33,
-    13981: 33,
-    13980: 33,
-    13979: 33,
-    13978: 33,
-    13977: 33,
-    13976: 33,
-    13975: 33,
-    13974: 33,
-    13973: 33,
-    13972: 33,
-    13971: 33,
-    13970: 33,
-    13969: 33,
-    13968: 33,
-    13967: 33,
-    13966: 33,
-    13965: 33,
-    13964: 33,
-    13963: 33,
-    13962: 33,
-    13961: 33,
-    13960: 33,
-    13959: 33,
-    13958: 33,
-    13957: 33,
-    13956: 33,
-    13955: 33,
-    13954: 33,
-    13953: 33,
-    13952: 33,
-    13951: 33,
-    13950: 33,
-    13949: 33,
-    13948: 33,
-    13947: 33,
-    13946: 33,
-    13945: 33,
-    13944: 33,
-    13943: 33,
-    13942: 33,
-    13941: 33,
-    13940: 33,
-    13939: 33,
-    13938: 33,
-    13937: 33,
-    13936: 33,
-    13935: 33,
-    13934: 33,
-    13933: 33,
-    13932: 33,
-    13931: 33,
-    13930: 33,
-    13929: 33,
-    13928: 33,
-    13927: 33,
-    13926: 33,
-    13925: 33,
-    13924: 33,
-    13923: 33,
-    13922: 33,
-    13921: 33,
-    13920: 33,
-    13919: 33,
-    13918: 33,
-    13917: 33,
-    13916: 33,
-    13915: 33,
-    13914: 33,
-    13913: 33,
-    13912: 33,
-    13911: 33,
-    13910: 33,
-    13909: 33,
-    13908: 33,
-    13907: 33,
-    13906: 33,
-    13905: 33,
-    13904: 33,
-    13903: 33,
-    13902: 33,
-    13901: 33,
-    13900: 33,
-    13899: 33,
-    13898: 33,
-    13897: 33,
-    13896: 33,
-    13895: 33,
-    13894: 33,
-    13893: 33,
-    13892: 33,
-    13891: 33,
-    13890: 33,
-    13889: 33,
-    13888: 33,
-    13887: 33,
-    13886: 33,
-    13885: 33,
-    13884: 33,
-    13883: 33,
-    13882: 33,
-    13881: 33,
-    13880: 33,
-    13879: 33,
-    13878: 33,
-    13877: 33,
-    13876: 33,
-    13875: 33,
-    13874: 33,
-    13873: 33,
-    13872: 33,
-    13871: 33,
-    13870: 33,
-    13869: 33,
-    13868: 33,
-    13867: 33,
-    13866: 33,
-    13865: 33,
-    13864: 33,
-    13863: 33,
-    13862: 33,
-    13861: 33,
-    13860: 33,
-    13859: 33,
-    13858: 33,
-    13857: 33,
-    13856: 33,
-    13855: 33,
-    13854: 33,
-    13853: 33,
-    13852: 33,
-    13851: 33,
-    13850: 33,
-    13849: 33,
-    13848: 33,
-    13847: 33,
-    13846: 33,
-    13845: 33,
-    13844: 33,
-    13843: 33,
-    13842: 33,
-    13841: 33,
-    13840: 33,
-    13839: 33,
-    13838: 33,
-    13837: 33,
-    13836: 33,
-    13835: 33,
-    13834: 33,
-    13833: 33,
-    13832: 33,
-    13831: 33,
-    13830: 33,
-    13829: 33,
-    13828: 33,
-    13827: 33,
-    13826: 33,
-    13825: 33,
-    13824: 33,
-    13823: 33,
-    13822: 33,
-    13821: 33,
-    13820: 34,
-    13819: 34,
-    13818: 34,
-    13817: 34,
-    13816: 34,
-    13815: 34,
-    13814: 34,
-    13813: 34,
-    13812: 34,
-    13811: 34,
-    13810: 35,
-    13809: 35,
-    13808: 35,
-    13807: 35,
-    13806: 35,
-    13805: 35,
-    13804: 35,
-    13803: 35,
-    13802: 35,
-    13801: 35,
-    13800: 35,
-    13799: 35,
-    13798: 35,
-    13797: 35,
-    13796: 35,
-    13795: 35,
-    13794: 35,
-    13793: 35,
-    13792: 35,
-    13791: 35,
-    13790: 35,
-    13789: 35,
-    13788: 35,
-    13787: 35,
-    13786: 35,
-    13785: 35,
-    13784: 35,
-    13783: 35,
-    13782: 35,
-    13781: 35,
-    13780: 35,
-    13779: 35,
-    13778: 35,
-    13777: 35,
-    13776: 35,
-    13775: 35,
-    13774: 35,
-    13773: 35,
-    13772: 35,
-    13771: 35,
-    13770: 35,
-    13769: 35,
-    13768: 35,
-    13767: 35,
-    13766: 35,
-    13765: 35,
-    13764: 35,
-    13763: 35,
-    13762: 35,
-    13761: 35,
-    13760: 35,
-    13759: 35,
-    13758: 35,
-    13757: 35,
-    13756: 35,
-    13755: 35,
-    13754: 35,
-    13753: 35,
-    13752: 35,
-    13751: 35,
-    13750: 35,
-    13749: 35,
-    13748: 35,
-    13747: 35,
-    13746: 35,
-    13745: 35,
-    13744: 35,
-    13743: 35,
-    13742: 35,
-    13741: 35,
-    13740: 35,
-    13739: 35,
-    13738: 35,
-    13737: 35,
-    13736: 35,
-    13735: 35,
-    13734: 35,
-    13733: 35,
-    13732: 35,
-    13731: 35,
-    13730: 35,
-    13729: 35,
-    13728: 35,
-    13727: 35,
-    13726: 35,
-    13725: 35,
-    13724: 35,
-    13723: 35,
-    13722: 35,
-    13721: 35,
-    13720: 35,
-    13719: 35,
-    13718: 35,
-    13717: 35,
-    13716: 35,
-    13715: 35,
-    13714: 35,
-    13713: 35,
-    13712: 35,
-    13711: 35,
-    13710: 35,
-    13709: 35,
-    13708: 35,
-    13707: 35,
-    13706: 35,
-    13705: 35,
-    13704: 35,
-    13703: 35,
-    13702: 35,
-    13701: 35,
-    13700: 36,
-    13699: 36,
-    13698: 36,
-    13697: 36,
-    13696: 36,
-    13695: 36,
-    13694: 36,
-    13693: 36,
-    13692: 36,
-    13691: 36,
-    13690: 36,
-    13689: 36,
-    13688: 36,
-    13687: 36,
-    13686: 36,
-    13685: 36,
-    13684: 36,
-    13683: 36,
-    13682: 36,
-    13681: 36,
-    13680: 36,
-    13679: 36,
-    13678: 36,
-    13677: 36,
-    13676: 36,
-    13675: 36,
-    13674: 36,
-    13673: 36,
-    13672: 36,
-    13671: 36,
-    13670: 36,
-    13669: 36,
-    13668: 36,
-    13667: 36,
-    13666: 36,
-    13665: 36,
-    13664: 36,
-    13663: 36,
-    13662: 36,
-    13661: 36,
-    13660: 36,
-    13659: 36,
-    13658: 36,
-    13657: 36,
-    13656: 36,
-    13655: 36,
-    13654: 36,
-    13653: 36,
-    13652: 36,
-    13651: 36,
-    13650: 36,
-    13649: 36,
-    13648: 36,
-    13647: 36,
-    13646: 36,
-    13645: 36,
-    13644: 36,
-    13643: 36,
-    13642: 36,
-    13641: 36,
-    13640: 36,
-    13639: 36,
-    13638: 36,
-    13637: 36,
-    13636: 36,
-    13635: 36,
-    13634: 36,
-    13633: 36,
-    13632: 36,
-    13631: 36,
-    13630: 36,
-    13629: 36,
-    13628: 36,
-    13627: 36,
-    13626: 36,
-    13625: 36,
-    13624: 36,
-    13623: 36,
-    13622: 36,
-    13621: 36,
-    13620: 36,
-    13619: 36,
-    13618: 36,
-    13617: 36,
-    13616: 36,
-    13615: 36,
-    13614: 36,
-    13613: 36,
-    13612: 36,
-    13611: 36,
-    13610: 36,
-    13609: 36,
-    13608: 36,
-    13607: 36,
-    13606: 36,
-    13605: 36,
-    13604: 36,
-    13603: 36,
-    13602: 36,
-    13601: 36,
-    13600: 37,
-    13599: 37,
-    13598: 37,
-    13597: 37,
-    13596: 37,
-    13595: 37,
-    13594: 37,
-    13593: 37,
-    13592: 37,
-    13591: 37,
-    13590: 37,
-    13589: 37,
-    13588: 37,
-    13587: 37,
-    13586: 37,
-    13585: 37,
-    13584: 37,
-    13583: 37,
-    13582: 37,
-    13581: 37,
-    13580: 37,
-    13579: 37,
-    13578: 37,
-    13577: 37,
-    13576: 37,
-    13575: 37,
-    13574: 37,
-    13573: 37,
-    13572: 37,
-    13571: 37,
-    13570: 37,
-    13569: 37,
-    13568: 37,
-    13567: 37,
-    13566: 37,
-    13565: 37,
-    13564: 37,
-    13563: 37,
-    13562: 37,
-    13561: 37,
-    13560: 37,
-    13559: 37,
-    13558: 37,
-    13557: 37,
-    13556: 37,
-    13555: 37,
-    13554: 37,
-    13553: 37,
-    13552: 37,
-    13551: 37,
-    13550: 37,
-    13549: 37,
-    13548: 37,
-    13547: 37,
-    13546: 37,
-    13545: 37,
-    13544: 37,
-    13543: 37,
-    13542: 37,
-    13541: 37,
-    13540: 37,
-    13539: 37,
-    13538: 37,
-    13537: 37,
-    13536: 37,
-    13535: 37,
-    13534: 37,
-    13533: 37,
-    13532: 37,
-    13531: 37,
-    13530: 37,
-    13529: 37,
-    13528: 37,
-    13527: 37,
-    13526: 37,
-    13525: 37,
-    13524: 37,
-    13523: 37,
-    13522: 37,
-    13521: 37,
-    13520: 37,
-    13519: 37,
-    13518: 37,
-    13517: 37,
-    13516: 37,
-    13515: 37,
-    13514: 37,
-    13513: 37,
-    13512: 37,
-    13511: 37,
-    13510: 37,
-    13509: 37,
-    13508: 37,
-    13507: 37,
-    13506: 37,
-    13505: 37,
-    13504: 37,
-    13503: 37,
-    13502: 37,
-    13501: 37,
-    13500: 38,
-    13499: 38,
-    13498: 38,
-    13497: 38,
-    13496: 38,
-    13495: 38,
-    13494: 38,
-    13493: 38,
-    13492: 38,
-    13491: 38,
-    13490: 38,
-    13489: 38,
-    13488: 38,
-    13487: 38,
-    13486: 38,
-    13485: 38,
-    13484: 38,
-    13483: 38,
-    13482: 38,
-    13481: 38,
-    13480: 38,
-    13479: 38,
-    13478: 38,
-    13477: 38,
-    13476: 38,
-    13475: 38,
-    13474: 38,
-    13473: 38,
-    13472: 38,
-    13471: 38,
-    13470: 38,
-    13469: 38,
-    13468: 38,
-    13467: 38,
-    13466: 38,
-    13465: 38,
-    13464: 38,
-    13463: 38,
-    13462: 38,
-    13461: 38,
-    13460: 38,
-    13459: 38,
-    13458: 38,
-    13457: 38,
-    13456: 38,
-    13455: 38,
-    13454: 38,
-    13453: 38,
-    13452: 38,
-    13451: 38,
-    13450: 38,
-    13449: 38,
-    13448: 38,
-    13447: 38,
-    13446: 38,
-    13445: 38,
-    13444: 38,
-    13443: 38,
-    13442: 38,
-    13441: 38,
-    13440: 38,
-    13439: 38,
-    13438: 38,
-    13437: 38,
-    13436: 38,
-    13435: 38,
-    13434: 38,
-    13433: 38,
-    13432: 38,
-    13431: 38,
-    13430: 38,
-    13429: 38,
-    13428: 38,
-    13427: 38,
-    13426: 38,
-    13425: 38,
-    13424: 38,
-    13423: 38,
-    13422: 38,
-    13421: 38,
-    13420: 38,
-    13419: 38,
-    13418: 38,
-    13417: 38,
-    13416: 38,
-    13415: 38,
-    13414: 38,
-    13413: 38,
-    13412: 38,
-    13411: 38,
-    13410: 38,
-    13409: 38,
-    13408: 38,
-    13407: 38,
-    13406: 38,
-    13405: 38,
-    13404: 38,
-    13403: 38,
-    13402: 38,
-    13401: 38,
-    13400: 39,
-    13399: 39,
-    13398: 39,
-    13397: 39,
-    13396: 39,
-    13395: 39,
-    13394: 39,
-    13393: 39,
-    13392: 39,
-    13391: 39,
-    13390: 39,
-    13389: 39,
-    13388: 39,
-    13387: 39,
-    13386: 39,
-    13385: 39,
-    13384: 39,
-    13383: 39,
-    13382: 39,
-    13381: 39,
-    13380: 39,
-    13379: 39,
-    13378: 39,
-    13377: 39,
-    13376: 39,
-    13375: 39,
-    13374: 39,
-    13373: 39,
-    13372: 39,
-    13371: 39,
-    13370: 39,
-    13369: 39,
-    13368: 39,
-    13367: 39,
-    13366: 39,
-    13365: 39,
-    13364: 39,
-    13363: 39,
-    13362: 39,
-    13361: 39,
-    13360: 39,
-    13359: 39,
-    13358: 39,
-    13357: 39,
-    13356: 39,
-    13355: 39,
-    13354: 39,
-    13353: 39,
-    13352: 39,
-    13351: 39,
-    13350: 39,
-    13349: 39,
-    13348: 39,
-    13347: 39,
-    13346: 39,
-    13345: 39,
-    13344: 39,
-    13343: 39,
-    13342: 39,
-    13341: 39,
-    13340: 39,
-    13339: 39,
-    13338: 39,
-    13337: 39,
-    13336: 39,
-    13335: 39,
-    13334: 39,
-    13333: 39,
-    13332: 39,
-    13331: 39,
-    13330: 39,
-    13329: 39,
-    13328: 39,
-    13327: 39,
-    13326: 39,
-    13325: 39,
-    13324: 39,
-    13323: 39,
-    13322: 39,
-    13321: 39,
-    13320: 39,
-    13319: 39,
-    13318: 39,
-    13317: 39,
-    13316: 39,
-    13315: 39,
-    13314: 39,
-    13313: 39,
-    13312: 39,
-    13311: 39,
-    13310: 40,
-    13309: 40,
-    13308: 40,
-    13307: 40,
-    13306: 40,
-    13305: 40,
-    13304: 40,
-    13303: 40,
-    13302: 40,
-    13301: 40,
-    13300: 40,
-    13299: 40,
-    13298: 40,
-    13297: 40,
-    13296: 40,
-    13295: 40,
-    13294: 40,
-    13293: 40,
-    13292: 40,
-    13291: 40,
-    13290: 40,
-    13289: 40,
-    13288: 40,
-    13287: 40,
-    13286: 40,
-    13285: 40,
-    13284: 40,
-    13283: 40,
-    13282: 40,
-    13281: 40,
-    13280: 40,
-    13279: 40,
-    13278: 40,
-    13277: 40,
-    13276: 40,
-    13275: 40,
-    13274: 40,
-    13273: 40,
-    13272: 40,
-    13271: 40,
-    13270: 40,
-    13269: 40,
-    13268: 40,
-    13267: 40,
-    13266: 40,
-    13265: 40,
-    13264: 40,
-    13263: 40,
-    13262: 40,
-    13261: 40,
-    13260: 40,
-    13259: 40,
-    13258: 40,
-    13257: 40,
-    13256: 40,
-    13255: 40,
-    13254: 40,
-    13253: 40,
-    13252: 40,
-    13251: 40,
-    13250: 40,
-    13249: 40,
-    13248: 40,
-    13247: 40,
-    13246: 40,
-    13245: 40,
-    13244: 40,
-    13243: 40,
-    13242: 40,
-    13241: 40,
-    13240: 40,
-    13239: 40,
-    13238: 40,
-    13237: 40,
-    13236: 40,
-    13235: 40,
-    13234: 40,
-    13233: 40,
-    13232: 40,
-    13231: 40,
-    13230: 40,
-    13229: 40,
-    13228: 40,
-    13227: 40,
-    13226: 40,
-    13225: 40,
-    13224: 40,
-    13223: 40,
-    13222: 40,
-    13221: 40,
-    13220: 41,
-    13219: 41,
-    13218: 41,
-    13217: 41,
-    13216: 41,
-    13215: 41,
-    13214: 41,
-    13213: 41,
-    13212: 41,
-    13211: 41,
-    13210: 41,
-    13209: 41,
-    13208: 41,
-    13207: 41,
-    13206: 41,
-    13205: 41,
-    13204: 41,
-    13203: 41,
-    13202: 41,
-    13201: 41,
-    13200: 41,
-    13199: 41,
-    13198: 41,
-    13197: 41,
-    13196: 41,
-    13195: 41,
-    13194: 41,
-    13193: 41,
-    13192: 41,
-    13191: 41,
-    13190: 41,
-    13189: 41,
-    13188: 41,
-    13187: 41,
-    13186: 41,
-    13185: 41,
-    13184: 41,
-    13183: 41,
-    13182: 41,
-    13181: 41,
-    13180: 41,
-    13179: 41,
-    13178: 41,
-    13177: 41,
-    13176: 41,
-    13175: 41,
-    13174: 41,
-    13173: 41,
-    13172: 41,
-    13171: 41,
-    13170: 41,
-    13169: 41,
-    13168: 41,
-    13167: 41,
-    13166: 41,
-    13165: 41,
-    13164: 41,
-    13163: 41,
-    13162: 41,
-    13161: 41,
-    13160: 41,
-    13159: 41,
-    13158: 41,
-    13157: 41,
-    13156: 41,
-    13155: 41,
-    13154: 41,
-    13153: 41,
-    13152: 41,
-    13151: 41,
-    13150: 41,
-    13149: 41,
-    13148: 41,
-    13147: 41,
-    13146: 41,
-    13145: 41,
-    13144: 41,
-    13143: 41,
-    13142: 41,
-    13141: 41,
-    13140: 41,
-    13139: 41,
-    13138: 41,
-    13137: 41,
-    13136: 41,
-    13135: 41,
-    13134: 41,
-    13133: 41,
-    13132: 41,
-    13131: 41,
-    13130: 42,
-    13129: 42,
-    13128: 42,
-    13127: 42,
-    13126: 42,
-    13125: 42,
-    13124: 42,
-    13123: 42,
-    13122: 42,
-    13121: 42,
-    13120: 42,
-    13119: 42,
-    13118: 42,
-    13117: 42,
-    13116: 42,
-    13115: 42,
-    13114: 42,
-    13113: 42,
-    13112: 42,
-    13111: 42,
-    13110: 42,
-    13109: 42,
-    13108: 42,
-    13107: 42,
-    13106: 42,
-    13105: 42,
-    13104: 42,
-    13103: 42,
-    13102: 42,
-    13101: 42,
-    13100: 42,
-    13099: 42,
-    13098: 42,
-    13097: 42,
-    13096: 42,
-    13095: 42,
-    13094: 42,
-    13093: 42,
-    13092: 42,
-    13091: 42,
-    13090: 42,
-    13089: 42,
-    13088: 42,
-    13087: 42,
-    13086: 42,
-    13085: 42,
-    13084: 42,
-    13083: 42,
-    13082: 42,
-    13081: 42,
-    13080: 42,
-    13079: 42,
-    13078: 42,
-    13077: 42,
-    13076: 42,
-    13075: 42,
-    13074: 42,
-    13073: 42,
-    13072: 42,
-    13071: 42,
-    13070: 42,
-    13069: 42,
-    13068: 42,
-    13067: 42,
-    13066: 42,
-    13065: 42,
-    13064: 42,
-    13063: 42,
-    13062: 42,
-    13061: 42,
-    13060: 42,
-    13059: 42,
-    13058: 42,
-    13057: 42,
-    13056: 42,
-    13055: 42,
-    13054: 42,
-    13053: 42,
-    13052: 42,
-    13051: 42,
-    13050: 42,
-    13049: 42,
-    13048: 42,
-    13047: 42,
-    13046: 42,
-    13045: 42,
-    13044: 42,
-    13043: 42,
-    13042: 42,
-    13041: 42,
-    13040: 43,
-    13039: 43,
-    13038: 43,
-    13037: 43,
-    13036: 43,
-    13035: 43,
-    13034: 43,
-    13033: 43,
-    13032: 43,
-    13031: 43,
-    13030: 43,
-    13029: 43,
-    13028: 43,
-    13027: 43,
-    13026: 43,
-    13025: 43,
-    13024: 43,
-    13023: 43,
-    13022: 43,
-    13021: 43,
-    13020: 43,
-    13019: 43,
-    13018: 43,
-    13017: 43,
-    13016: 43,
-    13015: 43,
-    13014: 43,
-    13013: 43,
-    13012: 43,
-    13011: 43,
-    13010: 43,
-    13009: 43,
-    13008: 43,
-    13007: 43,
-    13006: 43,
-    13005: 43,
-    13004: 43,
-    13003: 43,
-    13002: 43,
-    13001: 43,
-    13000: 43,
-    12999: 43,
-    12998: 43,
-    12997: 43,
-    12996: 43,
-    12995: 43,
-    12994: 43,
-    12993: 43,
-    12992: 43,
-    12991: 43,
-    12990: 43,
-    12989: 43,
-    12988: 43,
-    12987: 43,
-    12986: 43,
-    12985: 43,
-    12984: 43,
-    12983: 43,
-    12982: 43,
-    12981: 43,
-    12980: 43,
-    12979: 43,
-    12978: 43,
-    12977: 43,
-    12976: 43,
-    12975: 43,
-    12974: 43,
-    12973: 43,
-    12972: 43,
-    12971: 43,
-    12970: 43,
-    12969: 43,
-    12968: 43,
-    12967: 43,
-    12966: 43,
-    12965: 43,
-    12964: 43,
-    12963: 43,
-    12962: 43,
-    12961: 43,
-    12960: 43,
-    12959: 43,
-    12958: 43,
-    12957: 43,
-    12956: 43,
-    12955: 43,
-    12954: 43,
-    12953: 43,
-    12952: 43,
-    12951: 43,
-    12950: 44,
-    12949: 44,
-    12948: 44,
-    12947: 44,
-    12946: 44,
-    12945: 44,
-    12944: 44,
-    12943: 44,
-    12942: 44,
-    12941: 44,
-    12940: 44,
-    12939: 44,
-    12938: 44,
-    12937: 44,
-    12936: 44,
-    12935: 44,
-    12934: 44,
-    12933: 44,
-    12932: 44,
-    12931: 44,
-    12930: 44,
-    12929: 44,
-    12928: 44,
-    12927: 44,
-    12926: 44,
-    12925: 44,
-    12924: 44,
-    12923: 44,
-    12922: 44,
-    12921: 44,
-    12920: 44,
-    12919: 44,
-    12918: 44,
-    12917: 44,
-    12916: 44,
-    12915: 44,
-    12914: 44,
-    12913: 44,
-    12912: 44,
-    12911: 44,
-    12910: 44,
-    12909: 44,
-    12908: 44,
-    12907: 44,
-    12906: 44,
-    12905: 44,
-    12904: 44,
-    12903: 44,
-    12902: 44,
-    12901: 44,
-    12900: 44,
-    12899: 44,
-    12898: 44,
-    12897: 44,
-    12896: 44,
-    12895: 44,
-    12894: 44,
-    12893: 44,
-    12892: 44,
-    12891: 44,
-    12890: 44,
-    12889: 44,
-    12888: 44,
-    12887: 44,
-    12886: 44,
-    12885: 44,
-    12884: 44,
-    12883: 44,
-    12882: 44,
-    12881: 44,
-    12880: 44,
-    12879: 44,
-    12878: 44,
-    12877: 44,
-    12876: 44,
-    12875: 44,
-    12874: 44,
-    12873: 44,
-    12872: 44,
-    12871: 44,
-    12870: 44,
-    12869: 44,
-    12868: 44,
-    12867: 44,
-    12866: 44,
-    12865: 44,
-    12864: 44,
-    12863: 44,
-    12862: 44,
-    12861: 44,
-    12860: 45,
-    12859: 45,
-    12858: 45,
-    12857: 45,
-    12856: 45,
-    12855: 45,
-    12854: 45,
-    12853: 45,
-    12852: 45,
-    12851: 45,
-    12850: 45,
-    12849: 45,
-    12848: 45,
-    12847: 45,
-    12846: 45,
-    12845: 45,
-    12844: 45,
-    12843: 45,
-    12842: 45,
-    12841: 45,
-    12840: 45,
-    12839: 45,
-    12838: 45,
-    12837: 45,
-    12836: 45,
-    12835: 45,
-    12834: 45,
-    12833: 45,
-    12832: 45,
-    12831: 45,
-    12830: 45,
-    12829: 45,
-    12828: 45,
-    12827: 45,
-    12826: 45,
-    12825: 45,
-    12824: 45,
-    12823: 45,
-    12822: 45,
-    12821: 45,
-    12820: 45,
-    12819: 45,
-    12818: 45,
-    12817: 45,
-    12816: 45,
-    12815: 45,
-    12814: 45,
-    12813: 45,
-    12812: 45,
-    12811: 45,
-    12810: 45,
-    12809: 45,
-    12808: 45,
-    12807: 45,
-    12806: 45,
-    12805: 45,
-    12804: 45,
-    12803: 45,
-    12802: 45,
-    12801: 45,
-    12800: 45,
-    12799: 45,
-    12798: 45,
-    12797: 45,
-    12796: 45,
-    12795: 45,
-    12794: 45,
-    12793: 45,
-    12792: 45,
-    12791: 45,
-    12790: 45,
-    12789: 45,
-    12788: 45,
-    12787: 45,
-    12786: 45,
-    12785: 45,
-    12784: 45,
-    12783: 45,
-    12782: 45,
-    12781: 45,
-    12780: 45,
-    12779: 45,
-    12778: 45,
-    12777: 45,
-    12776: 45,
-    12775: 45,
-    12774: 45,
-    12773: 45,
-    12772: 45,
-    12771: 45,
-    12770: 46,
-    12769: 46,
-    12768: 46,
-    12767: 46,
-    12766: 46,
-    12765: 46,
-    12764: 46,
-    12763: 46,
-    12762: 46,
-    12761: 46,
-    12760: 46,
-    12759: 46,
-    12758: 46,
-    12757: 46,
-    12756: 46,
-    12755: 46,
-    12754: 46,
-    12753: 46,
-    12752: 46,
-    12751: 46,
-    12750: 46,
-    12749: 46,
-    12748: 46,
-    12747: 46,
-    12746: 46,
-    12745: 46,
-    12744: 46,
-    12743: 46,
-    12742: 46,
-    12741: 46,
-    12740: 46,
-    12739: 46,
-    12738: 46,
-    12737: 46,
-    12736: 46,
-    12735: 46,
-    12734: 46,
-    12733: 46,
-    12732: 46,
-    12731: 46,
-    12730: 46,
-    12729: 46,
-    12728: 46,
-    12727: 46,
-    12726: 46,
-    12725: 46,
-    12724: 46,
-    12723: 46,
-    12722: 46,
-    12721: 46,
-    12720: 46,
-    12719: 46,
-    12718: 46,
-    12717: 46,
-    12716: 46,
-    12715: 46,
-    12714: 46,
-    12713: 46,
-    12712: 46,
-    12711: 46,
-    12710: 46,
-    12709: 46,
-    12708: 46,
-    12707: 46,
-    12706: 46,
-    12705: 46,
-    12704: 46,
-    12703: 46,
-    12702: 46,
-    12701: 46,
-    12700: 46,
-    12699: 46,
-    12698: 46,
-    12697: 46,
-    12696: 46,
-    12695: 46,
-    12694: 46,
-    12693: 46,
-    12692: 46,
-    12691: 46,
-    12690: 46,
-    12689: 46,
-    12688: 46,
-    12687: 46,
-    12686: 46,
-    12685: 46,
-    12684: 46,
-    12683: 46,
-    12682: 46,
-    12681: 46,
-    12680: 47,
-    12679: 47,
-    12678: 47,
-    12677: 47,
-    12676: 47,
-    12675: 47,
-    12674: 47,
-    12673: 47,
-    12672: 47,
-    12671: 47,
-    12670: 47,
-    12669: 47,
-    12668: 47,
-    12667: 47,
-    12666: 47,
-    12665: 47,
-    12664: 47,
-    12663: 47,
-    12662: 47,
-    12661: 47,
-    12660: 47,
-    12659: 47,
-    12658: 47,
-    12657: 47,
-    12656: 47,
-    12655: 47,
-    12654: 47,
-    12653: 47,
-    12652: 47,
-    12651: 47,
-    12650: 47,
-    12649: 47,
-    12648: 47,
-    12647: 47,
-    12646: 47,
-    12645: 47,
-    12644: 47,
-    12643: 47,
-    12642: 47,
-    12641: 47,
-    12640: 47,
-    12639: 47,
-    12638: 47,
-    12637: 47,
-    12636: 47,
-    12635: 47,
-    12634: 47,
-    12633: 47,
-    12632: 47,
-    12631: 47,
-    12630: 47,
-    12629: 47,
-    12628: 47,
-    12627: 47,
-    12626: 47,
-    12625: 47,
-    12624: 47,
-    12623: 47,
-    12622: 47,
-    12621: 47,
-    12620: 47,
-    12619: 47,
-    12618: 47,
-    12617: 47,
-    12616: 47,
-    12615: 47,
-    12614: 47,
-    12613: 47,
-    12612: 47,
-    12611: 47,
-    12610: 47,
-    12609: 47,
-    12608: 47,
-    12607: 47,
-    12606: 47,
-    12605: 47,
-    12604: 47,
-    12603: 47,
-    12602: 47,
-    12601: 47,
-    12600: 47,
-    12599: 47,
-    12598: 47,
-    12597: 47,
-    12596: 47,
-    12595: 47,
-    12594: 47,
-    12593: 47,
-    12592: 47,
-    12591: 47,
-    12590: 48,
-    12589: 48,
-    12588: 48,
-    12587: 48,
-    12586: 48,
-    12585: 48,
-    12584: 48,
-    12583: 48,
-    12582: 48,
-    12581: 48,
-    12580: 48,
-    12579: 48,
-    12578: 48,
-    12577: 48,
-    12576: 48,
-    12575: 48,
-    12574: 48,
-    12573: 48,
-    12572: 48,
-    12571: 48,
-    12570: 48,
-    12569: 48,
-    12568: 48,
-    12567: 48,
-    12566: 48,
-    12565: 48,
-    12564: 48,
-    12563: 48,
-    12562: 48,
-    12561: 48,
-    12560: 48,
-    12559: 48,
-    12558: 48,
-    12557: 48,
-    12556: 48,
-    12555: 48,
-    12554: 48,
-    12553: 48,
-    12552: 48,
-    12551: 48,
-    12550: 48,
-    12549: 48,
-    12548: 48,
-    12547: 48,
-    12546: 48,
-    12545: 48,
-    12544: 48,
-    12543: 48,
-    12542: 48,
-    12541: 48,
-    12540: 48,
-    12539: 48,
-    12538: 48,
-    12537: 48,
-    12536: 48,
-    12535: 48,
-    12534: 48,
-    12533: 48,
-    12532: 48,
-    12531: 48,
-    12530: 48,
-    12529: 48,
-    12528: 48,
-    12527: 48,
-    12526: 48,
-    12525: 48,
-    12524: 48,
-    12523: 48,
-    12522: 48,
-    12521: 48,
-    12520: 48,
-    12519: 48,
-    12518: 48,
-    12517: 48,
-    12516: 48,
-    12515: 48,
-    12514: 48,
-    12513: 48,
-    12512: 48,
-    12511: 48,
-    12510: 48,
-    12509: 48,
-    12508: 48,
-    12507: 48,
-    12506: 48,
-    12505: 48,
-    12504: 48,
-    12503: 48,
-    12502: 48,
-    12501: 48,
-    12500: 49,
-    12499: 49,
-    12498: 49,
-    12497: 49,
-    12496: 49,
-    12495: 49,
-    12494: 49,
-    12493: 49,
-    12492: 49,
-    12491: 49,
-    12490: 49,
-    12489: 49,
-    12488: 49,
-    12487: 49,
-    12486: 49,
-    12485: 49,
-    12484: 49,
-    12483: 49,
-    12482: 49,
-    12481: 49,
-    12480: 49,
-    12479: 49,
-    12478: 49,
-    12477: 49,
-    12476: 49,
-    12475: 49,
-    12474: 49,
-    12473: 49,
-    12472: 49,
-    12471: 49,
-    12470: 49,
-    12469: 49,
-    12468: 49,
-    12467: 49,
-    12466: 49,
-    12465: 49,
-    12464: 49,
-    12463: 49,
-    12462: 49,
-    12461: 49,
-    12460: 49,
-    12459: 49,
-    12458: 49,
-    12457: 49,
-    12456: 49,
-    12455: 49,
-    12454: 49,
-    12453: 49,
-    12452: 49,
-    12451: 49,
-    12450: 49,
-    12449: 49,
-    12448: 49,
-    12447: 49,
-    12446: 49,
-    12445: 49,
-    12444: 49,
-    12443: 49,
-    12442: 49,
-    12441: 49,
-    12440: 49,
-    12439: 49,
-    12438: 49,
-    12437: 49,
-    12436: 49,
-    12435: 49,
-    12434: 49,
-    12433: 49,
-    12432: 49,
-    12431: 49,
-    12430: 49,
-    12429: 49,
-    12428: 49,
-    12427: 49,
-    12426: 49,
-    12425: 49,
-    12424: 49,
-    12423: 49,
-    12422: 49,
-    12421: 49,
-    12420: 50,
-    12419: 50,
-    12418: 50,
-    12417: 50,
-    12416: 50,
-    12415: 50,
-    12414: 50,
-    12413: 50,
-    12412: 50,
-    12411: 50,
-    12410: 50,
-    12409: 50,
-    12408: 50,
-    12407: 50,
-    12406: 50,
-    12405: 50,
-    12404: 50,
-    12403: 50,
-    12402: 50,
-    12401: 50,
-    12400: 50,
-    12399: 50,
-    12398: 50,
-    12397: 50,
-    12396: 50,
-    12395: 50,
-    12394: 50,
-    12393: 50,
-    12392: 50,
-    12391: 50,
-    12390: 50,
-    12389: 50,
-    12388: 50,
-    12387: 50,
-    12386: 50,
-    12385: 50,
-    12384: 50,
-    12383: 50,
-    12382: 50,
-    12381: 50,
-    12380: 50,
-    12379: 50,
-    12378: 50,
-    12377: 50,
-    12376: 50,
-    12375: 50,
-    12374: 50,
-    12373: 50,
-    12372: 50,
-    12371: 50,
-    12370: 50,
-    12369: 50,
-    12368: 50,
-    12367: 50,
-    12366: 50,
-    12365: 50,
-    12364: 50,
-    12363: 50,
-    12362: 50,
-    12361: 50,
-    12360: 50,
-    12359: 50,
-    12358: 50,
-    12357: 50,
-    12356: 50,
-    12355: 50,
-    12354: 50,
-    12353: 50,
-    12352: 50,
-    12351: 50,
-    12350: 50,
-    12349: 50,
-    12348: 50,
-    12347: 50,
-    12346: 50,
-    12345: 50,
-    12344: 50,
-    12343: 50,
-    12342: 50,
-    12341: 50,
-    12340: 51,
-    12339: 51,
-    12338: 51,
-    12337: 51,
-    12336: 51,
-    12335: 51,
-    12334: 51,
-    12333: 51,
-    12332: 51,
-    12331: 51,
-    12330: 51,
-    12329: 51,
-    12328: 51,
-    12327: 51,
-    12326: 51,
-    12325: 51,
-    12324: 51,
-    12323: 51,
-    12322: 51,
-    12321: 51,
-    12320: 51,
-    12319: 51,
-    12318: 51,
-    12317: 51,
-    12316: 51,
-    12315: 51,
-    12314: 51,
-    12313: 51,
-    12312: 51,
-    12311: 51,
-    12310: 51,
-    12309: 51,
-    12308: 51,
-    12307: 51,
-    12306: 51,
-    12305: 51,
-    12304: 51,
-    12303: 51,
-    12302: 51,
-    12301: 51,
-    12300: 51,
-    12299: 51,
-    12298: 51,
-    12297: 51,
-    12296: 51,
-    12295: 51,
-    12294: 51,
-    12293: 51,
-    12292: 51,
-    12291: 51,
-    12290: 51,
-    12289: 51,
-    12288: 51,
-    12287: 51,
-    12286: 51,
-    12285: 51,
-    12284: 51,
-    12283: 51,
-    12282: 51,
-    12281: 51,
-    12280: 51,
-    12279: 51,
-    12278: 51,
-    12277: 51,
-    12276: 51,
-    12275: 51,
-    12274: 51,
-    12273: 51,
-    12272: 51,
-    12271: 51,
-    12270: 51,
-    12269: 51,
-    12268: 51,
-    12267: 51,
-    12266: 51,
-    12265: 51,
-    12264: 51,
-    12263: 51,
-    12262: 51,
-    12261: 51,
-    12260: 52,
-    12259: 52,
-    12258: 52,
-    12257: 52,
-    12256: 52,
-    12255: 52,
-    12254: 52,
-    12253: 52,
-    12252: 52,
-    12251: 52,
-    12250: 52,
-    12249: 52,
-    12248: 52,
-    12247: 52,
-    12246: 52,
-    12245: 52,
-    12244: 52,
-    12243: 52,
-    12242: 52,
-    12241: 52,
-    12240: 52,
-    12239: 52,
-    12238: 52,
-    12237: 52,
-    12236: 52,
-    12235: 52,
-    12234: 52,
-    12233: 52,
-    12232: 52,
-    12231: 52,
-    12230: 52,
-    12229: 52,
-    12228: 52,
-    12227: 52,
-    12226: 52,
-    12225: 52,
-    12224: 52,
-    12223: 52,
-    12222: 52,
-    12221: 52,
-    12220: 52,
-    12219: 52,
-    12218: 52,
-    12217: 52,
-    12216: 52,
-    12215: 52,
-    12214: 52,
-    12213: 52,
-    12212: 52,
-    12211: 52,
-    12210: 52,
-    12209: 52,
-    12208: 52,
-    12207: 52,
-    12206: 52,
-    12205: 52,
-    12204: 52,
-    12203: 52,
-    12202: 52,
-    12201: 52,
-    12200: 52,
-    12199: 52,
-    12198: 52,
-    12197: 52,
-    12196: 52,
-    12195: 52,
-    12194: 52,
-    12193: 52,
-    12192: 52,
-    12191: 52,
-    12190: 52,
-    12189: 52,
-    12188: 52,
-    12187: 52,
-    12186: 52,
-    12185: 52,
-    12184: 52,
-    12183: 52,
-    12182: 52,
-    12181: 52,
-    12180: 53,
-    12179: 53,
-    12178: 53,
-    12177: 53,
-    12176: 53,
-    12175: 53,
-    12174: 53,
-    12173: 53,
-    12172: 53,
-    12171: 53,
-    12170: 53,
-    12169: 53,
-    12168: 53,
-    12167: 53,
-    12166: 53,
-    12165: 53,
-    12164: 53,
-    12163: 53,
-    12162: 53,
-    12161: 53,
-    12160: 53,
-    12159: 53,
-    12158: 53,
-    12157: 53,
-    12156: 53,
-    12155: 53,
-    12154: 53,
-    12153: 53,
-    12152: 53,
-    12151: 53,
-    12150: 53,
-    12149: 53,
-    12148: 53,
-    12147: 53,
-    12146: 53,
-    12145: 53,
-    12144: 53,
-    12143: 53,
-    12142: 53,
-    12141: 53,
-    12140: 53,
-    12139: 53,
-    12138: 53,
-    12137: 53,
-    12136: 53,
-    12135: 53,
-    12134: 53,
-    12133: 53,
-    12132: 53,
-    12131: 53,
-    12130: 53,
-    12129: 53,
-    12128: 53,
-    12127: 53,
-    12126: 53,
-    12125: 53,
-    12124: 53,
-    12123: 53,
-    12122: 53,
-    12121: 53,
-    12120: 53,
-    12119: 53,
-    12118: 53,
-    12117: 53,
-    12116: 53,
-    12115: 53,
-    12114: 53,
-    12113: 53,
-    12112: 53,
-    12111: 53,
-    12110: 53,
-    12109: 53,
-    12108: 53,
-    12107: 53,
-    12106: 53,
-    12105: 53,
-    12104: 53,
-    12103: 53,
-    12102: 53,
-    12101: 53,
-    12100: 54,
-    12099: 54,
-    12098: 54,
-    12097: 54,
-    12096: 54,
-    12095: 54,
-    12094: 54,
-    12093: 54,
-    12092: 54,
-    12091: 54,
-    12090: 54,
-    12089: 54,
-    12088: 54,
-    12087: 54,
-    12086: 54,
-    12085: 54,
-    12084: 54,
-    12083: 54,
-    12082: 54,
-    12081: 54,
-    12080: 54,
-    12079: 54,
-    12078: 54,
-    12077: 54,
-    12076: 54,
-    12075: 54,
-    12074: 54,
-    12073: 54,
-    12072: 54,
-    12071: 54,
-    12070: 54,
-    12069: 54,
-    12068: 54,
-    12067: 54,
-    12066: 54,
-    12065: 54,
-    12064: 54,
-    12063: 54,
-    12062: 54,
-    12061: 54,
-    12060: 54,
-    12059: 54,
-    12058: 54,
-    12057: 54,
-    12056: 54,
-    12055: 54,
-    12054: 54,
-    12053: 54,
-    12052: 54,
-    12051: 54,
-    12050: 54,
-    12049: 54,
-    12048: 54,
-    12047: 54,
-    12046: 54,
-    12045: 54,
-    12044: 54,
-    12043: 54,
-    12042: 54,
-    12041: 54,
-    12040: 54,
-    12039: 54,
-    12038: 54,
-    12037: 54,
-    12036: 54,
-    12035: 54,
-    12034: 54,
-    12033: 54,
-    12032: 54,
-    12031: 54,
-    12030: 54,
-    12029: 54,
-    12028: 54,
-    12027: 54,
-    12026: 54,
-    12025: 54,
-    12024: 54,
-    12023: 54,
-    12022: 54,
-    12021: 54,
-    12020: 55,
-    12019: 55,
-    12018: 55,
-    12017: 55,
-    12016: 55,
-    12015: 55,
-    12014: 55,
-    12013: 55,
-    12012: 55,
-    12011: 55,
-    12010: 55,
-    12009: 55,
-    12008: 55,
-    12007: 55,
-    12006: 55,
-    12005: 55,
-    12004: 55,
-    12003: 55,
-    12002: 55,
-    12001: 55,
-    12000: 55,
-    11999: 55,
-    11998: 55,
-    11997: 55,
-    11996: 55,
-    11995: 55,
-    11994: 55,
-    11993: 55,
-    11992: 55,
-    11991: 55,
-    11990: 55,
-    11989: 55,
-    11988: 55,
-    11987: 55,
-    11986: 55,
-    11985: 55,
-    11984: 55,
-    11983: 55,
-    11982: 55,
-    11981: 55,
-    11980: 55,
-    11979: 55,
-    11978: 55,
-    11977: 55,
-    11976: 55,
-    11975: 55,
-    11974: 55,
-    11973: 55,
-    11972: 55,
-    11971: 55,
-    11970: 55,
-    11969: 55,
-    11968: 55,
-    11967: 55,
-    11966: 55,
-    11965: 55,
-    11964: 55,
-    11963: 55,
-    11962: 55,
-    11961: 55,
-    11960: 55,
-    11959: 55,
-    11958: 55,
-    11957: 55,
-    11956: 55,
-    11955: 55,
-    11954: 55,
-    11953: 55,
-    11952: 55,
-    11951: 55,
-    11950: 56,
-    11949: 56,
-    11948: 56,
-    11947: 56,
-    11946: 56,
-    11945: 56,
-    11944: 56,
-    11943: 56,
-    11942: 56,
-    11941: 56,
-    11940: 56,
-    11939: 56,
-    11938: 56,
-    11937: 56,
-    11936: 56,
-    11935: 56,
-    11934: 56,
-    11933: 56,
-    11932: 56,
-    11931: 56,
-    11930: 56,
-    11929: 56,
-    11928: 56,
-    11927: 56,
-    11926: 56,
-    11925: 56,
-    11924: 56,
-    11923: 56,
-    11922: 56,
-    11921: 56,
-    11920: 56,
-    11919: 56,
-    11918: 56,
-    11917: 56,
-    11916: 56,
-    11915: 56,
-    11914: 56,
-    11913: 56,
-    11912: 56,
-    11911: 56,
-    11910: 56,
-    11909: 56,
-    11908: 56,
-    11907: 56,
-    11906: 56,
-    11905: 56,
-    11904: 56,
-    11903: 56,
-    11902: 56,
-    11901: 56,
-    11900: 56,
-    11899: 56,
-    11898: 56,
-    11897: 56,
-    11896: 56,
-    11895: 56,
-    11894: 56,
-    11893: 56,
-    11892: 56,
-    11891: 56,
-    11890: 56,
-    11889: 56,
-    11888: 56,
-    11887: 56,
-    11886: 56,
-    11885: 56,
-    11884: 56,
-    11883: 56,
-    11882: 56,
-    11881: 56,
-    11880: 57,
-    11879: 57,
-    11878: 57,
-    11877: 57,
-    11876: 57,
-    11875: 57,
-    11874: 57,
-    11873: 57,
-    11872: 57,
-    11871: 57,
-    11870: 57,
-    11869: 57,
-    11868: 57,
-    11867: 57,
-    11866: 57,
-    11865: 57,
-    11864: 57,
-    11863: 57,
-    11862: 57,
-    11861: 57,
-    11860: 57,
-    11859: 57,
-    11858: 57,
-    11857: 57,
-    11856: 57,
-    11855: 57,
-    11854: 57,
-    11853: 57,
-    11852: 57,
-    11851: 57,
-    11850: 57,
-    11849: 57,
-    11848: 57,
-    11847: 57,
-    11846: 57,
-    11845: 57,
-    11844: 57,
-    11843: 57,
-    11842: 57,
-    11841: 57,
-    11840: 57,
-    11839: 57,
-    11838: 57,
-    11837: 57,
-    11836: 57,
-    11835: 57,
-    11834: 57,
-    11833: 57,
-    11832: 57,
-    11831: 57,
-    11830: 57,
-    11829: 57,
-    11828: 57,
-    11827: 57,
-    11826: 57,
-    11825: 57,
-    11824: 57,
-    11823: 57,
-    11822: 57,
-    11821: 57,
-    11820: 57,
-    11819: 57,
-    11818: 57,
-    11817: 57,
-    11816: 57,
-    11815: 57,
-    11814: 57,
-    11813: 57,
-    11812: 57,
-    11811: 57,
-    11810: 58,
-    11809: 58,
-    11808: 58,
-    11807: 58,
-    11806: 58,
-    11805: 58,
-    11804: 58,
-    11803: 58,
-    11802: 58,
-    11801: 58,
-    11800: 58,
-    11799: 58,
-    11798: 58,
-    11797: 58,
-    11796: 58,
-    11795: 58,
-    11794: 58,
-    11793: 58,
-    11792: 58,
-    11791: 58,
-    11790: 58,
-    11789: 58,
-    11788: 58,
-    11787: 58,
-    11786: 58,
-    11785: 58,
-    11784: 58,
-    11783: 58,
-    11782: 58,
-    11781: 58,
-    11780: 58,
-    11779: 58,
-    11778: 58,
-    11777: 58,
-    11776: 58,
-    11775: 58,
-    11774: 58,
-    11773: 58,
-    11772: 58,
-    11771: 58,
-    11770: 58,
-    11769: 58,
-    11768: 58,
-    11767: 58,
-    11766: 58,
-    11765: 58,
-    11764: 58,
-    11763: 58,
-    11762: 58,
-    11761: 58,
-    11760: 58,
-    11759: 58,
-    11758: 58,
-    11757: 58,
-    11756: 58,
-    11755: 58,
-    11754: 58,
-    11753: 58,
-    11752: 58,
-    11751: 58,
-    11750: 58,
-    11749: 58,
-    11748: 58,
-    11747: 58,
-    11746: 58,
-    11745: 58,
-    11744: 58,
-    11743: 58,
-    11742: 58,
-    11741: 58,
-    11740: 59,
-    11739: 59,
-    11738: 59,
-    11737: 59,
-    11736: 59,
-    11735: 59,
-    11734: 59,
-    11733: 59,
-    11732: 59,
-    11731: 59,
-    11730: 59,
-    11729: 59,
-    11728: 59,
-    11727: 59,
-    11726: 59,
-    11725: 59,
-    11724: 59,
-    11723: 59,
-    11722: 59,
-    11721: 59,
-    11720: 59,
-    11719: 59,
-    11718: 59,
-    11717: 59,
-    11716: 59,
-    11715: 59,
-    11714: 59,
-    11713: 59,
-    11712: 59,
-    11711: 59,
-    11710: 59,
-    11709: 59,
-    11708: 59,
-    11707: 59,
-    11706: 59,
-    11705: 59,
-    11704: 59,
-    11703: 59,
-    11702: 59,
-    11701: 59,
-    11700: 59,
-    11699: 59,
-    11698: 59,
-    11697: 59,
-    11696: 59,
-    11695: 59,
-    11694: 59,
-    11693: 59,
-    11692: 59,
-    11691: 59,
-    11690: 59,
-    11689: 59,
-    11688: 59,
-    11687: 59,
-    11686: 59,
-    11685: 59,
-    11684: 59,
-    11683: 59,
-    11682: 59,
-    11681: 59,
-    11680: 59,
-    11679: 59,
-    11678: 59,
-    11677: 59,
-    11676: 59,
-    11675: 59,
-    11674: 59,
-    11673: 59,
-    11672: 59,
-    11671: 59,
-    11670: 60,
-    11669: 60,
-    11668: 60,
-    11667: 60,
-    11666: 60,
-    11665: 60,
-    11664: 60,
-    11663: 60,
-    11662: 60,
-    11661: 60,
-    11660: 60,
-    11659: 60,
-    11658: 60,
-    11657: 60,
-    11656: 60,
-    11655: 60,
-    11654: 60,
-    11653: 60,
-    11652: 60,
-    11651: 60,
-    11650: 60,
-    11649: 60,
-    11648: 60,
-    11647: 60,
-    11646: 60,
-    11645: 60,
-    11644: 60,
-    11643: 60,
-    11642: 60,
-    11641: 60,
-    11640: 60,
-    11639: 60,
-    11638: 60,
-    11637: 60,
-    11636: 60,
-    11635: 60,
-    11634: 60,
-    11633: 60,
-    11632: 60,
-    11631: 60,
-    11630: 60,
-    11629: 60,
-    11628: 60,
-    11627: 60,
-    11626: 60,
-    11625: 60,
-    11624: 60,
-    11623: 60,
-    11622: 60,
-    11621: 60,
-    11620: 60,
-    11619: 60,
-    11618: 60,
-    11617: 60,
-    11616: 60,
-    11615: 60,
-    11614: 60,
-    11613: 60,
-    11612: 60,
-    11611: 60,
-    11610: 60,
-    11609: 60,
-    11608: 60,
-    11607: 60,
-    11606: 60,
-    11605: 60,
-    11604: 60,
-    11603: 60,
-    11602: 60,
-    11601: 60,
-    11600: 61,
-    11599: 61,
-    11598: 61,
-    11597: 61,
-    11596: 61,
-    11595: 61,
-    11594: 61,
-    11593: 61,
-    11592: 61,
-    11591: 61,
-    11590: 61,
-    11589: 61,
-    11588: 61,
-    11587: 61,
-    11586: 61,
-    11585: 61,
-    11584: 61,
-    11583: 61,
-    11582: 61,
-    11581: 61,
-    11580: 61,
-    11579: 61,
-    11578: 61,
-    11577: 61,
-    11576: 61,
-    11575: 61,
-    11574: 61,
-    11573: 61,
-    11572: 61,
-    11571: 61,
-    11570: 61,
-    11569: 61,
-    11568: 61,
-    11567: 61,
-    11566: 61,
-    11565: 61,
-    11564: 61,
-    11563: 61,
-    11562: 61,
-    11561: 61,
-    11560: 61,
-    11559: 61,
-    11558: 61,
-    11557: 61,
-    11556: 61,
-    11555: 61,
-    11554: 61,
-    11553: 61,
-    11552: 61,
-    11551: 61,
-    11550: 61,
-    11549: 61,
-    11548: 61,
-    11547: 61,
-    11546: 61,
-    11545: 61,
-    11544: 61,
-    11543: 61,
-    11542: 61,
-    11541: 61,
-    11540: 62,
-    11539: 62,
-    11538: 62,
-    11537: 62,
-    11536: 62,
-    11535: 62,
-    11534: 62,
-    11533: 62,
-    11532: 62,
-    11531: 62,
-    11530: 62,
-    11529: 62,
-    11528: 62,
-    11527: 62,
-    11526: 62,
-    11525: 62,
-    11524: 62,
-    11523: 62,
-    11522: 62,
-    11521: 62,
-    11520: 62,
-    11519: 62,
-    11518: 62,
-    11517: 62,
-    11516: 62,
-    11515: 62,
-    11514: 62,
-    11513: 62,
-    11512: 62,
-    11511: 62,
-    11510: 62,
-    11509: 62,
-    11508: 62,
-    11507: 62,
-    11506: 62,
-    11505: 62,
-    11504: 62,
-    11503: 62,
-    11502: 62,
-    11501: 62,
-    11500: 62,
-    11499: 62,
-    11498: 62,
-    11497: 62,
-    11496: 62,
-    11495: 62,
-    11494: 62,
-    11493: 62,
-    11492: 62,
-    11491: 62,
-    11490: 62,
-    11489: 62,
-    11488: 62,
-    11487: 62,
-    11486: 62,
-    11485: 62,
-    11484: 62,
-    11483: 62,
-    11482: 62,
-    11481: 62,
-    11480: 63,
-    11479: 63,
-    11478: 63,
-    11477: 63,
-    11476: 63,
-    11475: 63,
-    11474: 63,
-    11473: 63,
-    11472: 63,
-    11471: 63,
-    11470: 63,
-    11469: 63,
-    11468: 63,
-    11467: 63,
-    11466: 63,
-    11465: 63,
-    11464: 63,
-    11463: 63,
-    11462: 63,
-    11461: 63,
-    11460: 63,
-    11459: 63,
-    11458: 63,
-    11457: 63,
-    11456: 63,
-    11455: 63,
-    11454: 63,
-    11453: 63,
-    11452: 63,
-    11451: 63,
-    11450: 63,
-    11449: 63,
-    11448: 63,
-    11447: 63,
-    11446: 63,
-    11445: 63,
-    11444: 63,
-    11443: 63,
-    11442: 63,
-    11441: 63,
-    11440: 63,
-    11439: 63,
-    11438: 63,
-    11437: 63,
-    11436: 63,
-    11435: 63,
-    11434: 63,
-    11433: 63,
-    11432: 63,
-    11431: 63,
-    11430: 63,
-    11429: 63,
-    11428: 63,
-    11427: 63,
-    11426: 63,
-    11425: 63,
-    11424: 63,
-    11423: 63,
-    11422: 63,
-    11421: 63,
-    11420: 64,
-    11419: 64,
-    11418: 64,
-    11417: 64,
-    11416: 64,
-    11415: 64,
-    11414: 64,
-    11413: 64,
-    11412: 64,
-    11411: 64,
-    11410: 64,
-    11409: 64,
-    11408: 64,
-    11407: 64,
-    11406: 64,
-    11405: 64,
-    11404: 64,
-    11403: 64,
-    11402: 64,
-    11401: 64,
-    11400: 64,
-    11399: 64,
-    11398: 64,
-    11397: 64,
-    11396: 64,
-    11395: 64,
-    11394: 64,
-    11393: 64,
-    11392: 64,
-    11391: 64,
-    11390: 64,
-    11389: 64,
-    11388: 64,
-    11387: 64,
-    11386: 64,
-    11385: 64,
-    11384: 64,
-    11383: 64,
-    11382: 64,
-    11381: 64,
-    11380: 64,
-    11379: 64,
-    11378: 64,
-    11377: 64,
-    11376: 64,
-    11375: 64,
-    11374: 64,
-    11373: 64,
-    11372: 64,
-    11371: 64,
-    11370: 64,
-    11369: 64,
-    11368: 64,
-    11367: 64,
-    11366: 64,
-    11365: 64,
-    11364: 64,
-    11363: 64,
-    11362: 64,
-    11361: 64,
-    11360: 65,
-    11359: 65,
-    11358: 65,
-    11357: 65,
-    11356: 65,
-    11355: 65,
-    11354: 65,
-    11353: 65,
-    11352: 65,
-    11351: 65,
-    11350: 65,
-    11349: 65,
-    11348: 65,
-    11347: 65,
-    11346: 65,
-    11345: 65,
-    11344: 65,
-    11343: 65,
-    11342: 65,
-    11341: 65,
-    11340: 65,
-    11339: 65,
-    11338: 65,
-    11337: 65,
-    11336: 65,
-    11335: 65,
-    11334: 65,
-    11333: 65,
-    11332: 65,
-    11331: 65,
-    11330: 65,
-    11329: 65,
-    11328: 65,
-    11327: 65,
-    11326: 65,
-    11325: 65,
-    11324: 65,
-    11323: 65,
-    11322: 65,
-    11321: 65,
-    11320: 65,
-    11319: 65,
-    11318: 65,
-    11317: 65,
-    11316: 65,
-    11315: 65,
-    11314: 65,
-    11313: 65,
-    11312: 65,
-    11311: 65,
-    11310: 65,
-    11309: 65,
-    11308: 65,
-    11307: 65,
-    11306: 65,
-    11305: 65,
-    11304: 65,
-    11303: 65,
-    11302: 65,
-    11301: 65,
-    11300: 66,
-    11299: 66,
-    11298: 66,
-    11297: 66,
-    11296: 66,
-    11295: 66,
-    11294: 66,
-    11293: 66,
-    11292: 66,
-    11291: 66,
-    11290: 66,
-    11289: 66,
-    11288: 66,
-    11287: 66,
-    11286: 66,
-    11285: 66,
-    11284: 66,
-    11283: 66,
-    11282: 66,
-    11281: 66,
-    11280: 66,
-    11279: 66,
-    11278: 66,
-    11277: 66,
-    11276: 66,
-    11275: 66,
-    11274: 66,
-    11273: 66,
-    11272: 66,
-    11271: 66,
-    11270: 66,
-    11269: 66,
-    11268: 66,
-    11267: 66,
-    11266: 66,
-    11265: 66,
-    11264: 66,
-    11263: 66,
-    11262: 66,
-    11261: 66,
-    11260: 66,
-    11259: 66,
-    11258: 66,
-    11257: 66,
-    11256: 66,
-    11255: 66,
-    11254: 66,
-    11253: 66,
-    11252: 66,
-    11251: 66,
-    11250: 66,
-    11249: 66,
-    11248: 66,
-    11247: 66,
-    11246: 66,
-    11245: 66,
-    11244: 66,
-    11243: 66,
-    11242: 66,
-    11241: 66,
-    11240: 67,
-    11239: 67,
-    11238: 67,
-    11237: 67,
-    11236: 67,
-    11235: 67,
-    11234: 67,
-    11233: 67,
-    11232: 67,
-    11231: 67,
-    11230: 67,
-    11229: 67,
-    11228: 67,
-    11227: 67,
-    11226: 67,
-    11225: 67,
-    11224: 67,
-    11223: 67,
-    11222: 67,
-    11221: 67,
-    11220: 67,
-    11219: 67,
-    11218: 67,
-    11217: 67,
-    11216: 67,
-    11215: 67,
-    11214: 67,
-    11213: 67,
-    11212: 67,
-    11211: 67,
-    11210: 67,
-    11209: 67,
-    11208: 67,
-    11207: 67,
-    11206: 67,
-    11205: 67,
-    11204: 67,
-    11203: 67,
-    11202: 67,
-    11201: 67,
-    11200: 67,
-    11199: 67,
-    11198: 67,
-    11197: 67,
-    11196: 67,
-    11195: 67,
-    11194: 67,
-    11193: 67,
-    11192: 67,
-    11191: 67,
-    11190: 67,
-    11189: 67,
-    11188: 67,
-    11187: 67,
-    11186: 67,
-    11185: 67,
-    11184: 67,
-    11183: 67,
-    11182: 67,
-    11181: 67,
-    11180: 68,
-    11179: 68,
-    11178: 68,
-    11177: 68,
-    11176: 68,
-    11175: 68,
-    11174: 68,
-    11173: 68,
-    11172: 68,
-    11171: 68,
-    11170: 68,
-    11169: 68,
-    11168: 68,
-    11167: 68,
-    11166: 68,
-    11165: 68,
-    11164: 68,
-    11163: 68,
-    11162: 68,
-    11161: 68,
-    11160: 68,
-    11159: 68,
-    11158: 68,
-    11157: 68,
-    11156: 68,
-    11155: 68,
-    11154: 68,
-    11153: 68,
-    11152: 68,
-    11151: 68,
-    11150: 68,
-    11149: 68,
-    11148: 68,
-    11147: 68,
-    11146: 68,
-    11145: 68,
-    11144: 68,
-    11143: 68,
-    11142: 68,
-    11141: 68,
-    11140: 68,
-    11139: 68,
-    11138: 68,
-    11137: 68,
-    11136: 68,
-    11135: 68,
-    11134: 68,
-    11133: 68,
-    11132: 68,
-    11131: 68,
-    11130: 68,
-    11129: 68,
-    11128: 68,
-    11127: 68,
-    11126: 68,
-    11125: 68,
-    11124: 68,
-    11123: 68,
-    11122: 68,
-    11121: 68,
-    11120: 69,
-    11119: 69,
-    11118: 69,
-    11117: 69,
-    11116: 69,
-    11115: 69,
-    11114: 69,
-    11113: 69,
-    11112: 69,
-    11111: 69,
-    11110: 69,
-    11109: 69,
-    11108: 69,
-    11107: 69,
-    11106: 69,
-    11105: 69,
-    11104: 69,
-    11103: 69,
-    11102: 69,
-    11101: 69,
-    11100: 69,
-    11099: 69,
-    11098: 69,
-    11097: 69,
-    11096: 69,
-    11095: 69,
-    11094: 69,
-    11093: 69,
-    11092: 69,
-    11091: 69,
-    11090: 69,
-    11089: 69,
-    11088: 69,
-    11087: 69,
-    11086: 69,
-    11085: 69,
-    11084: 69,
-    11083: 69,
-    11082: 69,
-    11081: 69,
-    11080: 69,
-    11079: 69,
-    11078: 69,
-    11077: 69,
-    11076: 69,
-    11075: 69,
-    11074: 69,
-    11073: 69,
-    11072: 69,
-    11071: 69,
-    11070: 69,
-    11069: 69,
-    11068: 69,
-    11067: 69,
-    11066: 69,
-    11065: 69,
-    11064: 69,
-    11063: 69,
-    11062: 69,
-    11061: 69,
-    11060: 70,
-    11059: 70,
-    11058: 70,
-    11057: 70,
-    11056: 70,
-    11055: 70,
-    11054: 70,
-    11053: 70,
-    11052: 70,
-    11051: 70,
-    11050: 70,
-    11049: 70,
-    11048: 70,
-    11047: 70,
-    11046: 70,
-    11045: 70,
-    11044: 70,
-    11043: 70,
-    11042: 70,
-    11041: 70,
-    11040: 70,
-    11039: 70,
-    11038: 70,
-    11037: 70,
-    11036: 70,
-    11035: 70,
-    11034: 70,
-    11033: 70,
-    11032: 70,
-    11031: 70,
-    11030: 70,
-    11029: 70,
-    11028: 70,
-    11027: 70,
-    11026: 70,
-    11025: 70,
-    11024: 70,
-    11023: 70,
-    11022: 70,
-    11021: 70,
-    11020: 70,
-    11019: 70,
-    11018: 70,
-    11017: 70,
-    11016: 70,
-    11015: 70,
-    11014: 70,
-    11013: 70,
-    11012: 70,
-    11011: 70,
-    11010: 70,
-    11009: 70,
-    11008: 70,
-    11007: 70,
-    11006: 70,
-    11005: 70,
-    11004: 70,
-    11003: 70,
-    11002: 70,
-    11001: 70,
-    11000: 71,
-    10999: 71,
-    10998: 71,
-    10997: 71,
-    10996: 71,
-    10995: 71,
-    10994: 71,
-    10993: 71,
-    10992: 71,
-    10991: 71,
-    10990: 71,
-    10989: 71,
-    10988: 71,
-    10987: 71,
-    10986: 71,
-    10985: 71,
-    10984: 71,
-    10983: 71,
-    10982: 71,
-    10981: 71,
-    10980: 71,
-    10979: 71,
-    10978: 71,
-    10977: 71,
-    10976: 71,
-    10975: 71,
-    10974: 71,
-    10973: 71,
-    10972: 71,
-    10971: 71,
-    10970: 71,
-    10969: 71,
-    10968: 71,
-    10967: 71,
-    10966: 71,
-    10965: 71,
-    10964: 71,
-    10963: 71,
-    10962: 71,
-    10961: 71,
-    10960: 71,
-    10959: 71,
-    10958: 71,
-    10957: 71,
-    10956: 71,
-    10955: 71,
-    10954: 71,
-    10953: 71,
-    10952: 71,
-    10951: 71,
-    10950: 71,
-    10949: 71,
-    10948: 71,
-    10947: 71,
-    10946: 71,
-    10945: 71,
-    10944: 71,
-    10943: 71,
-    10942: 71,
-    10941: 71,
-    10940: 72,
-    10939: 72,
-    10938: 72,
-    10937: 72,
-    10936: 72,
-    10935: 72,
-    10934: 72,
-    10933: 72,
-    10932: 72,
-    10931: 72,
-    10930: 72,
-    10929: 72,
-    10928: 72,
-    10927: 72,
-    10926: 72,
-    10925: 72,
-    10924: 72,
-    10923: 72,
-    10922: 72,
-    10921: 72,
-    10920: 72,
-    10919: 72,
-    10918: 72,
-    10917: 72,
-    10916: 72,
-    10915: 72,
-    10914: 72,
-    10913: 72,
-    10912: 72,
-    10911: 72,
-    10910: 72,
-    10909: 72,
-    10908: 72,
-    10907: 72,
-    10906: 72,
-    10905: 72,
-    10904: 72,
-    10903: 72,
-    10902: 72,
-    10901: 72,
-    10900: 72,
-    10899: 72,
-    10898: 72,
-    10897: 72,
-    10896: 72,
-    10895: 72,
-    10894: 72,
-    10893: 72,
-    10892: 72,
-    10891: 72,
-    10890: 72,
-    10889: 72,
-    10888: 72,
-    10887: 72,
-    10886: 72,
-    10885: 72,
-    10884: 72,
-    10883: 72,
-    10882: 72,
-    10881: 72,
-    10880: 73,
-    10879: 73,
-    10878: 73,
-    10877: 73,
-    10876: 73,
-    10875: 73,
-    10874: 73,
-    10873: 73,
-    10872: 73,
-    10871: 73,
-    10870: 73,
-    10869: 73,
-    10868: 73,
-    10867: 73,
-    10866: 73,
-    10865: 73,
-    10864: 73,
-    10863: 73,
-    10862: 73,
-    10861: 73,
-    10860: 73,
-    10859: 73,
-    10858: 73,
-    10857: 73,
-    10856: 73,
-    10855: 73,
-    10854: 73,
-    10853: 73,
-    10852: 73,
-    10851: 73,
-    10850: 73,
-    10849: 73,
-    10848: 73,
-    10847: 73,
-    10846: 73,
-    10845: 73,
-    10844: 73,
-    10843: 73,
-    10842: 73,
-    10841: 73,
-    10840: 73,
-    10839: 73,
-    10838: 73,
-    10837: 73,
-    10836: 73,
-    10835: 73,
-    10834: 73,
-    10833: 73,
-    10832: 73,
-    10831: 73,
-    10830: 73,
-    10829: 73,
-    10828: 73,
-    10827: 73,
-    10826: 73,
-    10825: 73,
-    10824: 73,
-    10823: 73,
-    10822: 73,
-    10821: 73,
-    10820: 74,
-    10819: 74,
-    10818: 74,
-    10817: 74,
-    10816: 74,
-    10815: 74,
-    10814: 74,
-    10813: 74,
-    10812: 74,
-    10811: 74,
-    10810: 74,
-    10809: 74,
-    10808: 74,
-    10807: 74,
-    10806: 74,
-    10805: 74,
-    10804: 74,
-    10803: 74,
-    10802: 74,
-    10801: 74,
-    10800: 74,
-    10799: 74,
-    10798: 74,
-    10797: 74,
-    10796: 74,
-    10795: 74,
-    10794: 74,
-    10793: 74,
-    10792: 74,
-    10791: 74,
-    10790: 74,
-    10789: 74,
-    10788: 74,
-    10787: 74,
-    10786: 74,
-    10785: 74,
-    10784: 74,
-    10783: 74,
-    10782: 74,
-    10781: 74,
-    10780: 74,
-    10779: 74,
-    10778: 74,
-    10777: 74,
-    10776: 74,
-    10775: 74,
-    10774: 74,
-    10773: 74,
-    10772: 74,
-    10771: 74,
-    10770: 75,
-    10769: 75,
-    10768: 75,
-    10767: 75,
-    10766: 75,
-    10765: 75,
-    10764: 75,
-    10763: 75,
-    10762: 75,
-    10761: 75,
-    10760: 75,
-    10759: 75,
-    10758: 75,
-    10757: 75,
-    10756: 75,
-    10755: 75,
-    10754: 75,
-    10753: 75,
-    10752: 75,
-    10751: 75,
-    10750: 75,
-    10749: 75,
-    10748: 75,
-    10747: 75,
-    10746: 75,
-    10745: 75,
-    10744: 75,
-    10743: 75,
-    10742: 75,
-    10741: 75,
-    10740: 75,
-    10739: 75,
-    10738: 75,
-    10737: 75,
-    10736: 75,
-    10735: 75,
-    10734: 75,
-    10733: 75,
-    10732: 75,
-    10731: 75,
-    10730: 76,
-    10729: 76,
-    10728: 76,
-    10727: 76,
-    10726: 76,
-    10725: 76,
-    10724: 76,
-    10723: 76,
-    10722: 76,
-    10721: 76,
-    10720: 76,
-    10719: 76,
-    10718: 76,
-    10717: 76,
-    10716: 76,
-    10715: 76,
-    10714: 76,
-    10713: 76,
-    10712: 76,
-    10711: 76,
-    10710: 76,
-    10709: 76,
-    10708: 76,
-    10707: 76,
-    10706: 76,
-    10705: 76,
-    10704: 76,
-    10703: 76,
-    10702: 76,
-    10701: 76,
-    10700: 76,
-    10699: 76,
-    10698: 76,
-    10697: 76,
-    10696: 76,
-    10695: 76,
-    10694: 76,
-    10693: 76,
-    10692: 76,
-    10691: 76,
-    10690: 77,
-    10689: 77,
-    10688: 77,
-    10687: 77,
-    10686: 77,
-    10685: 77,
-    10684: 77,
-    10683: 77,
-    10682: 77,
-    10681: 77,
-    10680: 77,
-    10679: 77,
-    10678: 77,
-    10677: 77,
-    10676: 77,
-    10675: 77,
-    10674: 77,
-    10673: 77,
-    10672: 77,
-    10671: 77,
-    10670: 77,
-    10669: 77,
-    10668: 77,
-    10667: 77,
-    10666: 77,
-    10665: 77,
-    10664: 77,
-    10663: 77,
-    10662: 77,
-    10661: 77,
-    10660: 77,
-    10659: 77,
-    10658: 77,
-    10657: 77,
-    10656: 77,
-    10655: 77,
-    10654: 77,
-    10653: 77,
-    10652: 77,
-    10651: 77,
-    10650: 77,
-    10649: 77,
-    10648: 77,
-    10647: 77,
-    10646: 77,
-    10645: 77,
-    10644: 77,
-    10643: 77,
-    10642: 77,
-    10641: 77,
-    10640: 78,
-    10639: 78,
-    10638: 78,
-    10637: 78,
-    10636: 78,
-    10635: 78,
-    10634: 78,
-    10633: 78,
-    10632: 78,
-    10631: 78,
-    10630: 78,
-    10629: 78,
-    10628: 78,
-    10627: 78,
-    10626: 78,
-    10625: 78,
-    10624: 78,
-    10623: 78,
-    10622: 78,
-    10621: 78,
-    10620: 78,
-    10619: 78,
-    10618: 78,
-    10617: 78,
-    10616: 78,
-    10615: 78,
-    10614: 78,
-    10613: 78,
-    10612: 78,
-    10611: 78,
-    10610: 78,
-    10609: 78,
-    10608: 78,
-    10607: 78,
-    10606: 78,
-    10605: 78,
-    10604: 78,
-    10603: 78,
-    10602: 78,
-    10601: 78,
-    10600: 79,
-    10599: 79,
-    10598: 79,
-    10597: 79,
-    10596: 79,
-    10595: 79,
-    10594: 79,
-    10593: 79,
-    10592: 79,
-    10591: 79,
-    10590: 79,
-    10589: 79,
-    10588: 79,
-    10587: 79,
-    10586: 79,
-    10585: 79,
-    10584: 79,
-    10583: 79,
-    10582: 79,
-    10581: 79,
-    10580: 79,
-    10579: 79,
-    10578: 79,
-    10577: 79,
-    10576: 79,
-    10575: 79,
-    10574: 79,
-    10573: 79,
-    10572: 79,
-    10571: 79,
-    10570: 79,
-    10569: 79,
-    10568: 79,
-    10567: 79,
-    10566: 79,
-    10565: 79,
-    10564: 79,
-    10563: 79,
-    10562: 79,
-    10561: 79,
-    10560: 79,
-    10559: 79,
-    10558: 79,
-    10557: 79,
-    10556: 79,
-    10555: 79,
-    10554: 79,
-    10553: 79,
-    10552: 79,
-    10551: 79,
-    10550: 80,
-    10549: 80,
-    10548: 80,
-    10547: 80,
-    10546: 80,
-    10545: 80,
-    10544: 80,
-    10543: 80,
-    10542: 80,
-    10541: 80,
-    10540: 80,
-    10539: 80,
-    10538: 80,
-    10537: 80,
-    10536: 80,
-    10535: 80,
-    10534: 80,
-    10533: 80,
-    10532: 80,
-    10531: 80,
-    10530: 80,
-    10529: 80,
-    10528: 80,
-    10527: 80,
-    10526: 80,
-    10525: 80,
-    10524: 80,
-    10523: 80,
-    10522: 80,
-    10521: 80,
-    10520: 80,
-    10519: 80,
-    10518: 80,
-    10517: 80,
-    10516: 80,
-    10515: 80,
-    10514: 80,
-    10513: 80,
-    10512: 80,
-    10511: 80,
-    10510: 81,
-    10509: 81,
-    10508: 81,
-    10507: 81,
-    10506: 81,
-    10505: 81,
-    10504: 81,
-    10503: 81,
-    10502: 81,
-    10501: 81,
-    10500: 81,
-    10499: 81,
-    10498: 81,
-    10497: 81,
-    10496: 81,
-    10495: 81,
-    10494: 81,
-    10493: 81,
-    10492: 81,
-    10491: 81,
-    10490: 81,
-    10489: 81,
-    10488: 81,
-    10487: 81,
-    10486: 81,
-    10485: 81,
-    10484: 81,
-    10483: 81,
-    10482: 81,
-    10481: 81,
-    10480: 81,
-    10479: 81,
-    10478: 81,
-    10477: 81,
-    10476: 81,
-    10475: 81,
-    10474: 81,
-    10473: 81,
-    10472: 81,
-    10471: 81,
-    10470: 82,
-    10469: 82,
-    10468: 82,
-    10467: 82,
-    10466: 82,
-    10465: 82,
-    10464: 82,
-    10463: 82,
-    10462: 82,
-    10461: 82,
-    10460: 82,
-    10459: 82,
-    10458: 82,
-    10457: 82,
-    10456: 82,
-    10455: 82,
-    10454: 82,
-    10453: 82,
-    10452: 82,
-    10451: 82,
-    10450: 82,
-    10449: 82,
-    10448: 82,
-    10447: 82,
-    10446: 82,
-    10445: 82,
-    10444: 82,
-    10443: 82,
-    10442: 82,
-    10441: 82,
-    10440: 82,
-    10439: 82,
-    10438: 82,
-    10437: 82,
-    10436: 82,
-    10435: 82,
-    10434: 82,
-    10433: 82,
-    10432: 82,
-    10431: 82,
-    10430: 83,
-    10429: 83,
-    10428: 83,
-    10427: 83,
-    10426: 83,
-    10425: 83,
-    10424: 83,
-    10423: 83,
-    10422: 83,
-    10421: 83,
-    10420: 83,
-    10419: 83,
-    10418: 83,
-    10417: 83,
-    10416: 83,
-    10415: 83,
-    10414: 83,
-    10413: 83,
-    10412: 83,
-    10411: 83,
-    10410: 83,
-    10409: 83,
-    10408: 83,
-    10407: 83,
-    10406: 83,
-    10405: 83,
-    10404: 83,
-    10403: 83,
-    10402: 83,
-    10401: 83,
-    10400: 83,
-    10399: 83,
-    10398: 83,
-    10397: 83,
-    10396: 83,
-    10395: 83,
-    10394: 83,
-    10393: 83,
-    10392: 83,
-    10391: 83,
-    10390: 84,
-    10389: 84,
-    10388: 84,
-    10387: 84,
-    10386: 84,
-    10385: 84,
-    10384: 84,
-    10383: 84,
-    10382: 84,
-    10381: 84,
-    10380: 84,
-    10379: 84,
-    10378: 84,
-    10377: 84,
-    10376: 84,
-    10375: 84,
-    10374: 84,
-    10373: 84,
-    10372: 84,
-    10371: 84,
-    10370: 84,
-    10369: 84,
-    10368: 84,
-    10367: 84,
-    10366: 84,
-    10365: 84,
-    10364: 84,
-    10363: 84,
-    10362: 84,
-    10361: 84,
-    10360: 84,
-    10359: 84,
-    10358: 84,
-    10357: 84,
-    10356: 84,
-    10355: 84,
-    10354: 84,
-    10353: 84,
-    10352: 84,
-    10351: 84,
-    10350: 85,
-    10349: 85,
-    10348: 85,
-    10347: 85,
-    10346: 85,
-    10345: 85,
-    10344: 85,
-    10343: 85,
-    10342: 85,
-    10341: 85,
-    10340: 85,
-    10339: 85,
-    10338: 85,
-    10337: 85,
-    10336: 85,
-    10335: 85,
-    10334: 85,
-    10333: 85,
-    10332: 85,
-    10331: 85,
-    10330: 85,
-    10329: 85,
-    10328: 85,
-    10327: 85,
-    10326: 85,
-    10325: 85,
-    10324: 85,
-    10323: 85,
-    10322: 85,
-    10321: 85,
-    10320: 86,
-    10319: 86,
-    10318: 86,
-    10317: 86,
-    10316: 86,
-    10315: 86,
-    10314: 86,
-    10313: 86,
-    10312: 86,
-    10311: 86,
-    10310: 86,
-    10309: 86,
-    10308: 86,
-    10307: 86,
-    10306: 86,
-    10305: 86,
-    10304: 86,
-    10303: 86,
-    10302: 86,
-    10301: 86,
-    10300: 86,
-    10299: 86,
-    10298: 86,
-    10297: 86,
-    10296: 86,
-    10295: 86,
-    10294: 86,
-    10293: 86,
-    10292: 86,
-    10291: 86,
-    10290: 86,
-    10289: 86,
-    10288: 86,
-    10287: 86,
-    10286: 86,
-    10285: 86,
-    10284: 86,
-    10283: 86,
-    10282: 86,
-    10281: 86,
-    10280: 87,
-    10279: 87,
-    10278: 87,
-    10277: 87,
-    10276: 87,
-    10275: 87,
-    10274: 87,
-    10273: 87,
-    10272: 87,
-    10271: 87,
-    10270: 87,
-    10269: 87,
-    10268: 87,
-    10267: 87,
-    10266: 87,
-    10265: 87,
-    10264: 87,
-    10263: 87,
-    10262: 87,
-    10261: 87,
-    10260: 87,
-    10259: 87,
-    10258: 87,
-    10257: 87,
-    10256: 87,
-    10255: 87,
-    10254: 87,
-    10253: 87,
-    10252: 87,
-    10251: 87,
-    10250: 88,
-    10249: 88,
-    10248: 88,
-    10247: 88,
-    10246: 88,
-    10245: 88,
-    10244: 88,
-    10243: 88,
-    10242: 88,
-    10241: 88,
-    10240: 88,
-    10239: 88,
-    10238: 88,
-    10237: 88,
-    10236: 88,
-    10235: 88,
-    10234: 88,
-    10233: 88,
-    10232: 88,
-    10231: 88,
-    10230: 88,
-    10229: 88,
-    10228: 88,
-    10227: 88,
-    10226: 88,
-    10225: 88,
-    10224: 88,
-    10223: 88,
-    10222: 88,
-    10221: 88,
-    10220: 89,
-    10219: 89,
-    10218: 89,
-    10217: 89,
-    10216: 89,
-    10215: 89,
-    10214: 89,
-    10213: 89,
-    10212: 89,
-    10211: 89,
-    10210: 89,
-    10209: 89,
-    10208: 89,
-    10207: 89,
-    10206: 89,
-    10205: 89,
-    10204: 89,
-    10203: 89,
-    10202: 89,
-    10201: 89,
-    10200: 89,
-    10199: 89,
-    10198: 89,
-    10197: 89,
-    10196: 89,
-    10195: 89,
-    10194: 89,
-    10193: 89,
-    10192: 89,
-    10191: 89,
-    10190: 90,
-    10189: 90,
-    10188: 90,
-    10187: 90,
-    10186: 90,
-    10185: 90,
-    10184: 90,
-    10183: 90,
-    10182: 90,
-    10181: 90,
-    10180: 90,
-    10179: 90,
-    10178: 90,
-    10177: 90,
-    10176: 90,
-    10175: 90,
-    10174: 90,
-    10173: 90,
-    10172: 90,
-    10171: 90,
-    10170: 90,
-    10169: 90,
-    10168: 90,
-    10167: 90,
-    10166: 90,
-    10165: 90,
-    10164: 90,
-    10163: 90,
-    10162: 90,
-    10161: 90,
-    10160: 91,
-    10159: 91,
-    10158: 91,
-    10157: 91,
-    10156: 91,
-    10155: 91,
-    10154: 91,
-    10153: 91,
-    10152: 91,
-    10151: 91,
-    10150: 91,
-    10149: 91,
-    10148: 91,
-    10147: 91,
-    10146: 91,
-    10145: 91,
-    10144: 91,
-    10143: 91,
-    10142: 91,
-    10141: 91,
-    10140: 91,
-    10139: 91,
-    10138: 91,
-    10137: 91,
-    10136: 91,
-    10135: 91,
-    10134: 91,
-    10133: 91,
-    10132: 91,
-    10131: 91,
-    10130: 92,
-    10129: 92,
-    10128: 92,
-    10127: 92,
-    10126: 92,
-    10125: 92,
-    10124: 92,
-    10123: 92,
-    10122: 92,
-    10121: 92,
-    10120: 92,
-    10119: 92,
-    10118: 92,
-    10117: 92,
-    10116: 92,
-    10115: 92,
-    10114: 92,
-    10113: 92,
-    10112: 92,
-    10111: 92,
-    10110: 92,
-    10109: 92,
-    10108: 92,
-    10107: 92,
-    10106: 92,
-    10105: 92,
-    10104: 92,
-    10103: 92,
-    10102: 92,
-    10101: 92,
-    10100: 93,
-    10099: 93,
-    10098: 93,
-    10097: 93,
-    10096: 93,
-    10095: 93,
-    10094: 93,
-    10093: 93,
-    10092: 93,
-    10091: 93,
-    10090: 93,
-    10089: 93,
-    10088: 93,
-    10087: 93,
-    10086: 93,
-    10085: 93,
-    10084: 93,
-    10083: 93,
-    10082: 93,
-    10081: 93,
-    10080: 93,
-    10079: 93,
-    10078: 93,
-    10077: 93,
-    10076: 93,
-    10075: 93,
-    10074: 93,
-    10073: 93,
-    10072: 93,
-    10071: 93,
-    10070: 94,
-    10069: 94,
-    10068: 94,
-    10067: 94,
-    10066: 94,
-    10065: 94,
-    10064: 94,
-    10063: 94,
-    10062: 94,
-    10061: 94,
-    10060: 94,
-    10059: 94,
-    10058: 94,
-    10057: 94,
-    10056: 94,
-    10055: 94,
-    10054: 94,
-    10053: 94,
-    10052: 94,
-    10051: 94,
-    10050: 94,
-    10049: 94,
-    10048: 94,
-    10047: 94,
-    10046: 94,
-    10045: 94,
-    10044: 94,
-    10043: 94,
-    10042: 94,
-    10041: 94,
-    10040: 95,
-    10039: 95,
-    10038: 95,
-    10037: 95,
-    10036: 95,
-    10035: 95,
-    10034: 95,
-    10033: 95,
-    10032: 95,
-    10031: 95,
-    10030: 95,
-    10029: 95,
-    10028: 95,
-    10027: 95,
-    10026: 95,
-    10025: 95,
-    10024: 95,
-    10023: 95,
-    10022: 95,
-    10021: 95,
-    10020: 95,
-    10019: 95,
-    10018: 95,
-    10017: 95,
-    10016: 95,
-    10015: 95,
-    10014: 95,
-    10013: 95,
-    10012: 95,
-    10011: 95,
-    10010: 96,
-    10009: 96,
-    10008: 96,
-    10007: 96,
-    10006: 96,
-    10005: 96,
-    10004: 96,
-    10003: 96,
-    10002: 96,
-    10001: 96,
-    10000: 96,
-    9999: 96,
-    9998: 96,
-    9997: 96,
-    9996: 96,
-    9995: 96,
-    9994: 96,
-    9993: 96,
-    9992: 96,
-    9991: 96,
-    9990: 96,
-    9989: 96,
-    9988: 96,
-    9987: 96,
-    9986: 96,
-    9985: 96,
-    9984: 96,
-    9983: 96,
-    9982: 96,
-    9981: 96,
-    9980: 97,
-    9979: 97,
-    9978: 97,
-    9977: 97,
-    9976: 97,
-    9975: 97,
-    9974: 97,
-    9973: 97,
-    9972: 97,
-    9971: 97,
-    9970: 97,
-    9969: 97,
-    9968: 97,
-    9967: 97,
-    9966: 97,
-    9965: 97,
-    9964: 97,
-    9963: 97,
-    9962: 97,
-    9961: 97,
-    9960: 97,
-    9959: 97,
-    9958: 97,
-    9957: 97,
-    9956: 97,
-    9955: 97,
-    9954: 97,
-    9953: 97,
-    9952: 97,
-    9951: 97,
-    9950: 97,
-    9949: 97,
-    9948: 97,
-    9947: 97,
-    9946: 97,
-    9945: 97,
-    9944: 97,
-    9943: 97,
-    9942: 97,
-    9941: 97,
-    9940: 97,
-    9939: 97,
-    9938: 97,
-    9937: 97,
-    9936: 97,
-    9935: 97,
-    9934: 97,
-    9933: 97,
-    9932: 97,
-    9931: 97,
-    9930: 97,
-    9929: 97,
-    9928: 97,
-    9927: 97,
-    9926: 97,
-    9925: 97,
-    9924: 97,
-    9923: 97,
-    9922: 97,
-    9921: 97,
-    9920: 99,
-    9919: 99,
-    9918: 99,
-    9917: 99,
-    9916: 99,
-    9915: 99,
-    9914: 99,
-    9913: 99,
-    9912: 99,
-    9911: 99,
-    9910: 99,
-    9909: 99,
-    9908: 99,
-    9907: 99,
-    9906: 99,
-    9905: 99,
-    9904: 99,
-    9903: 99,
-    9902: 99,
-    9901: 99,
-    9900: 99,
-    9899: 99,
-    9898: 99,
-    9897: 99,
-    9896: 99,
-    9895: 99,
-    9894: 99,
-    9893: 99,
-    9892: 99,
-    9891: 99,
-    9890: 100,
-    9889: 100,
-    9888: 100,
-    9887: 100,
-    9886: 100,
-    9885: 100,
-    9884: 100,
-    9883: 100,
-    9882: 100,
-    9881: 100,
-    9880: 100,
-    9879: 100,
-    9878: 100,
-    9877: 100,
-    9876: 100,
-    9875: 100,
-    9874: 100,
-    9873: 100,
-    9872: 100,
-    9871: 100,
-    9870: 100,
-    9869: 100,
-    9868: 100,
-    9867: 100,
-    9866: 100,
-    9865: 100,
-    9864: 100,
-    9863: 100,
-    9862: 100,
-    9861: 100,
-    9860: 101,
-    9859: 101,
-    9858: 101,
-    9857: 101,
-    9856: 101,
-    9855: 101,
-    9854: 101,
-    9853: 101,
-    9852: 101,
-    9851: 101,
-    9850: 98,
-    9849: 98,
-    9848: 98,
-    9847: 98,
-    9846: 98,
-    9845: 98,
-    9844: 98,
-    9843: 98,
-    9842: 98,
-    9841: 98,
-    9840: 98,
-    9839: 98,
-    9838: 98,
-    9837: 98,
-    9836: 98,
-    9835: 98,
-    9834: 98,
-    9833: 98,
-    9832: 98,
-    9831: 98,
-    9830: 102,
-    9829: 102,
-    9828: 102,
-    9827: 102,
-    9826: 102,
-    9825: 102,
-    9824: 102,
-    9823: 102,
-    9822: 102,
-    9821: 102,
-    9820: 102,
-    9819: 102,
-    9818: 102,
-    9817: 102,
-    9816: 102,
-    9815: 102,
-    9814: 102,
-    9813: 102,
-    9812: 102,
-    9811: 102,
-    9810: 102,
-    9809: 102,
-    9808: 102,
-    9807: 102,
-    9806: 102,
-    9805: 102,
-    9804: 102,
-    9803: 102,
-    9802: 102,
-    9801: 102,
-    9800: 103,
-    9799: 103,
-    9798: 103,
-    9797: 103,
-    9796: 103,
-    9795: 103,
-    9794: 103,
-    9793: 103,
-    9792: 103,
-    9791: 103,
-    9790: 103,
-    9789: 103,
-    9788: 103,
-    9787: 103,
-    9786: 103,
-    9785: 103,
-    9784: 103,
-    9783: 103,
-    9782: 103,
-    9781: 103,
-    9780: 104,
-    9779: 104,
-    9778: 104,
-    9777: 104,
-    9776: 104,
-    9775: 104,
-    9774: 104,
-    9773: 104,
-    9772: 104,
-    9771: 104,
-    9770: 104,
-    9769: 104,
-    9768: 104,
-    9767: 104,
-    9766: 104,
-    9765: 104,
-    9764: 104,
-    9763: 104,
-    9762: 104,
-    9761: 104,
-    9760: 104,
-    9759: 104,
-    9758: 104,
-    9757: 104,
-    9756: 104,
-    9755: 104,
-    9754: 104,
-    9753: 104,
-    9752: 104,
-    9751: 104,
-    9750: 105,
-    9749: 105,
-    9748: 105,
-    9747: 105,
-    9746: 105,
-    9745: 105,
-    9744: 105,
-    9743: 105,
-    9742: 105,
-    9741: 105,
-    9740: 105,
-    9739: 105,
-    9738: 105,
-    9737: 105,
-    9736: 105,
-    9735: 105,
-    9734: 105,
-    9733: 105,
-    9732: 105,
-    9731: 105,
-    9730: 105,
-    9729: 105,
-    9728: 105,
-    9727: 105,
-    9726: 105,
-    9725: 105,
-    9724: 105,
-    9723: 105,
-    9722: 105,
-    9721: 105,
-    9720: 106,
-    9719: 106,
-    9718: 106,
-    9717: 106,
-    9716: 106,
-    9715: 106,
-    9714: 106,
-    9713: 106,
-    9712: 106,
-    9711: 106,
-    9710: 106,
-    9709: 106,
-    9708: 106,
-    9707: 106,
-    9706: 106,
-    9705: 106,
-    9704: 106,
-    9703: 106,
-    9702: 106,
-    9701: 106,
-    9700: 107,
-    9699: 107,
-    9698: 107,
-    9697: 107,
-    9696: 107,
-    9695: 107,
-    9694: 107,
-    9693: 107,
-    9692: 107,
-    9691: 107,
-    9690: 107,
-    9689: 107,
-    9688: 107,
-    9687: 107,
-    9686: 107,
-    9685: 107,
-    9684: 107,
-    9683: 107,
-    9682: 107,
-    9681: 107,
-    9680: 107,
-    9679: 107,
-    9678: 107,
-    9677: 107,
-    9676: 107,
-    9675: 107,
-    9674: 107,
-    9673: 107,
-    9672: 107,
-    9671: 107,
-    9670: 108,
-    9669: 108,
-    9668: 108,
-    9667: 108,
-    9666: 108,
-    9665: 108,
-    9664: 108,
-    9663: 108,
-    9662: 108,
-    9661: 108,
-    9660: 108,
-    9659: 108,
-    9658: 108,
-    9657: 108,
-    9656: 108,
-    9655: 108,
-    9654: 108,
-    9653: 108,
-    9652: 108,
-    9651: 108,
-    9650: 109,
-    9649: 109,
-    9648: 109,
-    9647: 109,
-    9646: 109,
-    9645: 109,
-    9644: 109,
-    9643: 109,
-    9642: 109,
-    9641: 109,
-    9640: 109,
-    9639: 109,
-    9638: 109,
-    9637: 109,
-    9636: 109,
-    9635: 109,
-    9634: 109,
-    9633: 109,
-    9632: 109,
-    9631: 109,
-    9630: 109,
-    9629: 109,
-    9628: 109,
-    9627: 109,
-    9626: 109,
-    9625: 109,
-    9624: 109,
-    9623: 109,
-    9622: 109,
-    9621: 109,
-    9620: 110,
-    9619: 110,
-    9618: 110,
-    9617: 110,
-    9616: 110,
-    9615: 110,
-    9614: 110,
-    9613: 110,
-    9612: 110,
-    9611: 110,
-    9610: 110,
-    9609: 110,
-    9608: 110,
-    9607: 110,
-    9606: 110,
-    9605: 110,
-    9604: 110,
-    9603: 110,
-    9602: 110,
-    9601: 110,
-    9600: 110,
-    9599: 110,
-    9598: 110,
-    9597: 110,
-    9596: 110,
-    9595: 110,
-    9594: 110,
-    9593: 110,
-    9592: 110,
-    9591: 110,
-    9590: 111,
-    9589: 111,
-    9588: 111,
-    9587: 111,
-    9586: 111,
-    9585: 111,
-    9584: 111,
-    9583: 111,
-    9582: 111,
-    9581: 111,
-    9580: 111,
-    9579: 111,
-    9578: 111,
-    9577: 111,
-    9576: 111,
-    9575: 111,
-    9574: 111,
-    9573: 111,
-    9572: 111,
-    9571: 111,
-    9570: 112,
-    9569: 112,
-    9568: 112,
-    9567: 112,
-    9566: 112,
-    9565: 112,
-    9564: 112,
-    9563: 112,
-    9562: 112,
-    9561: 112,
-    9560: 112,
-    9559: 112,
-    9558: 112,
-    9557: 112,
-    9556: 112,
-    9555: 112,
-    9554: 112,
-    9553: 112,
-    9552: 112,
-    9551: 112,
-    9550: 112,
-    9549: 112,
-    9548: 112,
-    9547: 112,
-    9546: 112,
-    9545: 112,
-    9544: 112,
-    9543: 112,
-    9542: 112,
-    9541: 112,
-    9540: 113,
-    9539: 113,
-    9538: 113,
-    9537: 113,
-    9536: 113,
-    9535: 113,
-    9534: 113,
-    9533: 113,
-    9532: 113,
-    9531: 113,
-    9530: 113,
-    9529: 113,
-    9528: 113,
-    9527: 113,
-    9526: 113,
-    9525: 113,
-    9524: 113,
-    9523: 113,
-    9522: 113,
-    9521: 113,
-    9520: 113,
-    9519: 113,
-    9518: 113,
-    9517: 113,
-    9516: 113,
-    9515: 113,
-    9514: 113,
-    9513: 113,
-    9512: 113,
-    9511: 113,
-    9510: 114,
-    9509: 114,
-    9508: 114,
-    9507: 114,
-    9506: 114,
-    9505: 114,
-    9504: 114,
-    9503: 114,
-    9502: 114,
-    9501: 114,
-    9500: 114,
-    9499: 114,
-    9498: 114,
-    9497: 114,
-    9496: 114,
-    9495: 114,
-    9494: 114,
-    9493: 114,
-    9492: 114,
-    9491: 114,
-    9490: 114,
-    9489: 114,
-    9488: 114,
-    9487: 114,
-    9486: 114,
-    9485: 114,
-    9484: 114,
-    9483: 114,
-    9482: 114,
-    9481: 114,
-    9480: 115,
-    9479: 115,
-    9478: 115,
-    9477: 115,
-    9476: 115,
-    9475: 115,
-    9474: 115,
-    9473: 115,
-    9472: 115,
-    9471: 115,
-    9470: 115,
-    9469: 115,
-    9468: 115,
-    9467: 115,
-    9466: 115,
-    9465: 115,
-    9464: 115,
-    9463: 115,
-    9462: 115,
-    9461: 115,
-    9460: 115,
-    9459: 115,
-    9458: 115,
-    9457: 115,
-    9456: 115,
-    9455: 115,
-    9454: 115,
-    9453: 115,
-    9452: 115,
-    9451: 115,
-    9450: 116,
-    9449: 116,
-    9448: 116,
-    9447: 116,
-    9446: 116,
-    9445: 116,
-    9444: 116,
-    9443: 116,
-    9442: 116,
-    9441: 116,
-    9440: 116,
-    9439: 116,
-    9438: 116,
-    9437: 116,
-    9436: 116,
-    9435: 116,
-    9434: 116,
-    9433: 116,
-    9432: 116,
-    9431: 116,
-    9430: 117,
-    9429: 117,
-    9428: 117,
-    9427: 117,
-    9426: 117,
-    9425: 117,
-    9424: 117,
-    9423: 117,
-    9422: 117,
-    9421: 117,
-    9420: 117,
-    9419: 117,
-    9418: 117,
-    9417: 117,
-    9416: 117,
-    9415: 117,
-    9414: 117,
-    9413: 117,
-    9412: 117,
-    9411: 117,
-    9410: 118,
-    9409: 118,
-    9408: 118,
-    9407: 118,
-    9406: 118,
-    9405: 118,
-    9404: 118,
-    9403: 118,
-    9402: 118,
-    9401: 118,
-    9400: 118,
-    9399: 118,
-    9398: 118,
-    9397: 118,
-    9396: 118,
-    9395: 118,
-    9394: 118,
-    9393: 118,
-    9392: 118,
-    9391: 118,
-    9390: 118,
-    9389: 118,
-    9388: 118,
-    9387: 118,
-    9386: 118,
-    9385: 118,
-    9384: 118,
-    9383: 118,
-    9382: 118,
-    9381: 118,
-    9380: 119,
-    9379: 119,
-    9378: 119,
-    9377: 119,
-    9376: 119,
-    9375: 119,
-    9374: 119,
-    9373: 119,
-    9372: 119,
-    9371: 119,
-    9370: 119,
-    9369: 119,
-    9368: 119,
-    9367: 119,
-    9366: 119,
-    9365: 119,
-    9364: 119,
-    9363: 119,
-    9362: 119,
-    9361: 119,
-    9360: 120,
-    9359: 120,
-    9358: 120,
-    9357: 120,
-    9356: 120,
-    9355: 120,
-    9354: 120,
-    9353: 120,
-    9352: 120,
-    9351: 120,
-    9350: 120,
-    9349: 120,
-    9348: 120,
-    9347: 120,
-    9346: 120,
-    9345: 120,
-    9344: 120,
-    9343: 120,
-    9342: 120,
-    9341: 120,
-    9340: 121,
-    9339: 121,
-    9338: 121,
-    9337: 121,
-    9336: 121,
-    9335: 121,
-    9334: 121,
-    9333: 121,
-    9332: 121,
-    9331: 121,
-    9330: 121,
-    9329: 121,
-    9328: 121,
-    9327: 121,
-    9326: 121,
-    9325: 121,
-    9324: 121,
-    9323: 121,
-    9322: 121,
-    9321: 121,
-    9320: 122,
-    9319: 122,
-    9318: 122,
-    9317: 122,
-    9316: 122,
-    9315: 122,
-    9314: 122,
-    9313: 122,
-    9312: 122,
-    9311: 122,
-    9310: 122,
-    9309: 122,
-    9308: 122,
-    9307: 122,
-    9306: 122,
-    9305: 122,
-    9304: 122,
-    9303: 122,
-    9302: 122,
-    9301: 122,
-    9300: 123,
-    9299: 123,
-    9298: 123,
-    9297: 123,
-    9296: 123,
-    9295: 123,
-    9294: 123,
-    9293: 123,
-    9292: 123,
-    9291: 123,
-    9290: 123,
-    9289: 123,
-    9288: 123,
-    9287: 123,
-    9286: 123,
-    9285: 123,
-    9284: 123,
-    9283: 123,
-    9282: 123,
-    9281: 123,
-    9280: 124,
-    9279: 124,
-    9278: 124,
-    9277: 124,
-    9276: 124,
-    9275: 124,
-    9274: 124,
-    9273: 124,
-    9272: 124,
-    9271: 124,
-    9270: 124,
-    9269: 124,
-    9268: 124,
-    9267: 124,
-    9266: 124,
-    9265: 124,
-    9264: 124,
-    9263: 124,
-    9262: 124,
-    9261: 124,
-    9260: 125,
-    9259: 125,
-    9258: 125,
-    9257: 125,
-    9256: 125,
-    9255: 125,
-    9254: 125,
-    9253: 125,
-    9252: 125,
-    9251: 125,
-    9250: 125,
-    9249: 125,
-    9248: 125,
-    9247: 125,
-    9246: 125,
-    9245: 125,
-    9244: 125,
-    9243: 125,
-    9242: 125,
-    9241: 125,
-    9240: 126,
-    9239: 126,
-    9238: 126,
-    9237: 126,
-    9236: 126,
-    9235: 126,
-    9234: 126,
-    9233: 126,
-    9232: 126,
-    9231: 126,
-    9230: 126,
-    9229: 126,
-    9228: 126,
-    9227: 126,
-    9226: 126,
-    9225: 126,
-    9224: 126,
-    9223: 126,
-    9222: 126,
-    9221: 126,
-    9220: 127,
-    9219: 127,
-    9218: 127,
-    9217: 127,
-    9216: 127,
-    9215: 127,
-    9214: 127,
-    9213: 127,
-    9212: 127,
-    9211: 127,
-    9210: 127,
-    9209: 127,
-    9208: 127,
-    9207: 127,
-    9206: 127,
-    9205: 127,
-    9204: 127,
-    9203: 127,
-    9202: 127,
-    9201: 127,
-    9200: 128,
-    9199: 128,
-    9198: 128,
-    9197: 128,
-    9196: 128,
-    9195: 128,
-    9194: 128,
-    9193: 128,
-    9192: 128,
-    9191: 128,
-    9190: 129,
-    9189: 129,
-    9188: 129,
-    9187: 129,
-    9186: 129,
-    9185: 129,
-    9184: 129,
-    9183: 129,
-    9182: 129,
-    9181: 129,
-    9180: 129,
-    9179: 129,
-    9178: 129,
-    9177: 129,
-    9176: 129,
-    9175: 129,
-    9174: 129,
-    9173: 129,
-    9172: 129,
-    9171: 129,
-    9170: 130,
-    9169: 130,
-    9168: 130,
-    9167: 130,
-    9166: 130,
-    9165: 130,
-    9164: 130,
-    9163: 130,
-    9162: 130,
-    9161: 130,
-    9160: 130,
-    9159: 130,
-    9158: 130,
-    9157: 130,
-    9156: 130,
-    9155: 130,
-    9154: 130,
-    9153: 130,
-    9152: 130,
-    9151: 130,
-    9150: 131,
-    9149: 131,
-    9148: 131,
-    9147: 131,
-    9146: 131,
-    9145: 131,
-    9144: 131,
-    9143: 131,
-    9142: 131,
-    9141: 131,
-    9140: 131,
-    9139: 131,
-    9138: 131,
-    9137: 131,
-    9136: 131,
-    9135: 131,
-    9134: 131,
-    9133: 131,
-    9132: 131,
-    9131: 131,
-    9130: 132,
-    9129: 132,
-    9128: 132,
-    9127: 132,
-    9126: 132,
-    9125: 132,
-    9124: 132,
-    9123: 132,
-    9122: 132,
-    9121: 132,
-    9120: 133,
-    9119: 133,
-    9118: 133,
-    9117: 133,
-    9116: 133,
-    9115: 133,
-    9114: 133,
-    9113: 133,
-    9112: 133,
-    9111: 133,
-    9110: 133,
-    9109: 133,
-    9108: 133,
-    9107: 133,
-    9106: 133,
-    9105: 133,
-    9104: 133,
-    9103: 133,
-    9102: 133,
-    9101: 133,
-    9100: 134,
-    9099: 134,
-    9098: 134,
-    9097: 134,
-    9096: 134,
-    9095: 134,
-    9094: 134,
-    9093: 134,
-    9092: 134,
-    9091: 134,
-    9090: 134,
-    9089: 134,
-    9088: 134,
-    9087: 134,
-    9086: 134,
-    9085: 134,
-    9084: 134,
-    9083: 134,
-    9082: 134,
-    9081: 134,
-    9080: 135,
-    9079: 135,
-    9078: 135,
-    9077: 135,
-    9076: 135,
-    9075: 135,
-    9074: 135,
-    9073: 135,
-    9072: 135,
-    9071: 135,
-    9070: 136,
-    9069: 136,
-    9068: 136,
-    9067: 136,
-    9066: 136,
-    9065: 136,
-    9064: 136,
-    9063: 136,
-    9062: 136,
-    9061: 136,
-    9060: 136,
-    9059: 136,
-    9058: 136,
-    9057: 136,
-    9056: 136,
-    9055: 136,
-    9054: 136,
-    9053: 136,
-    9052: 136,
-    9051: 136,
-    9050: 137,
-    9049: 137,
-    9048: 137,
-    9047: 137,
-    9046: 137,
-    9045: 137,
-    9044: 137,
-    9043: 137,
-    9042: 137,
-    9041: 137,
-    9040: 137,
-    9039: 137,
-    9038: 137,
-    9037: 137,
-    9036: 137,
-    9035: 137,
-    9034: 137,
-    9033: 137,
-    9032: 137,
-    9031: 137,
-    9030: 138,
-    9029: 138,
-    9028: 138,
-    9027: 138,
-    9026: 138,
-    9025: 138,
-    9024: 138,
-    9023: 138,
-    9022: 138,
-    9021: 138,
-    9020: 139,
-    9019: 139,
-    9018: 139,
-    9017: 139,
-    9016: 139,
-    9015: 139,
-    9014: 139,
-    9013: 139,
-    9012: 139,
-    9011: 139,
-    9010: 139,
-    9009: 139,
-    9008: 139,
-    9007: 139,
-    9006: 139,
-    9005: 139,
-    9004: 139,
-    9003: 139,
-    9002: 139,
-    9001: 139,
-    9000: 140,
-    8999: 140,
-    8998: 140,
-    8997: 140,
-    8996: 140,
-    8995: 140,
-    8994: 140,
-    8993: 140,
-    8992: 140,
-    8991: 140,
-    8990: 140,
-    8989: 140,
-    8988: 140,
-    8987: 140,
-    8986: 140,
-    8985: 140,
-    8984: 140,
-    8983: 140,
-    8982: 140,
-    8981: 140,
-    8980: 141,
-    8979: 141,
-    8978: 141,
-    8977: 141,
-    8976: 141,
-    8975: 141,
-    8974: 141,
-    8973: 141,
-    8972: 141,
-    8971: 141,
-    8970: 142,
-    8969: 142,
-    8968: 142,
-    8967: 142,
-    8966: 142,
-    8965: 142,
-    8964: 142,
-    8963: 142,
-    8962: 142,
-    8961: 142,
-    8960: 142,
-    8959: 142,
-    8958: 142,
-    8957: 142,
-    8956: 142,
-    8955: 142,
-    8954: 142,
-    8953: 142,
-    8952: 142,
-    8951: 142,
-    8950: 143,
-    8949: 143,
-    8948: 143,
-    8947: 143,
-    8946: 143,
-    8945: 143,
-    8944: 143,
-    8943: 143,
-    8942: 143,
-    8941: 143,
-    8940: 144,
-    8939: 144,
-    8938: 144,
-    8937: 144,
-    8936: 144,
-    8935: 144,
-    8934: 144,
-    8933: 144,
-    8932: 144,
-    8931: 144,
-    8930: 144,
-    8929: 144,
-    8928: 144,
-    8927: 144,
-    8926: 144,
-    8925: 144,
-    8924: 144,
-    8923: 144,
-    8922: 144,
-    8921: 144,
-    8920: 145,
-    8919: 145,
-    8918: 145,
-    8917: 145,
-    8916: 145,
-    8915: 145,
-    8914: 145,
-    8913: 145,
-    8912: 145,
-    8911: 145,
-    8910: 146,
-    8909: 146,
-    8908: 146,
-    8907: 146,
-    8906: 146,
-    8905: 146,
-    8904: 146,
-    8903: 146,
-    8902: 146,
-    8901: 146,
-    8900: 146,
-    8899: 146,
-    8898: 146,
-    8897: 146,
-    8896: 146,
-    8895: 146,
-    8894: 146,
-    8893: 146,
-    8892: 146,
-    8891: 146,
-    8890: 147,
-    8889: 147,
-    8888: 147,
-    8887: 147,
-    8886: 147,
-    8885: 147,
-    8884: 147,
-    8883: 147,
-    8882: 147,
-    8881: 147,
-    8880: 148,
-    8879: 148,
-    8878: 148,
-    8877: 148,
-    8876: 148,
-    8875: 148,
-    8874: 148,
-    8873: 148,
-    8872: 148,
-    8871: 148,
-    8870: 148,
-    8869: 148,
-    8868: 148,
-    8867: 148,
-    8866: 148,
-    8865: 148,
-    8864: 148,
-    8863: 148,
-    8862: 148,
-    8861: 148,
-    8860: 149,
-    8859: 149,
-    8858: 149,
-    8857: 149,
-    8856: 149,
-    8855: 149,
-    8854: 149,
-    8853: 149,
-    8852: 149,
-    8851: 149,
-    8850: 150
-  },
-  'U16F60H': {
-    'min': 1370,
-    'max': 840,
-    1370: 1,
-    1369: 1,
-    1368: 1,
-    1367: 1,
-    1366: 1,
-    1365: 1,
-    1364: 1,
-    1363: 1,
-    1362: 1,
-    1361: 1,
-    1360: 2,
-    1359: 2,
-    1358: 2,
-    1357: 2,
-    1356: 2,
-    1355: 2,
-    1354: 2,
-    1353: 2,
-    1352: 2,
-    1351: 2,
-    1350: 3,
-    1349: 3,
-    1348: 3,
-    1347: 3,
-    1346: 3,
-    1345: 3,
-    1344: 3,
-    1343: 3,
-    1342: 3,
-    1341: 3,
-    1340: 4,
-    1339: 4,
-    1338: 4,
-    1337: 4,
-    1336: 4,
-    1335: 4,
-    1334: 4,
-    1333: 4,
-    1332: 4,
-    1331: 4,
-    1330: 5,
-    1329: 5,
-    1328: 5,
-    1327: 5,
-    1326: 5,
-    1325: 5,
-    1324: 5,
-    1323: 5,
-    1322: 5,
-    1321: 5,
-    1320: 7,
-    1319: 7,
-    1318: 7,
-    1317: 7,
-    1316: 7,
-    1315: 7,
-    1314: 7,
-    1313: 7,
-    1312: 7,
-    1311: 7,
-    1310: 8,
-    1309: 8,
-    1308: 8,
-    1307: 8,
-    1306: 8,
-    1305: 8,
-    1304: 8,
-    1303: 8,
-    1302: 8,
-    1301: 8,
-    1300: 9,
-    1299: 9,
-    1298: 9,
-    1297: 9,
-    1296: 9,
-    1295: 9,
-    1294: 9,
-    1293: 9,
-    1292: 9,
-    1291: 9,
-    1290: 10,
-    1289: 10,
-    1288: 10,
-    1287: 10,
-    1286: 10,
-    1285: 10,
-    1284: 10,
-    1283: 10,
-    1282: 10,
-    1281: 10,
-    1280: 12,
-    1279: 12,
-    1278: 12,
-    1277: 12,
-    1276: 12,
-    1275: 12,
-    1274: 12,
-    1273: 12,
-    1272: 12,
-    1271: 12,
-    1270: 13,
-    1269: 13,
-    1268: 13,
-    1267: 13,
-    1266: 13,
-    1265: 13,
-    1264: 13,
-    1263: 13,
-    1262: 13,
-    1261: 13,
-    1260: 14,
-    1259: 14,
-    1258: 14,
-    1257: 14,
-    1256: 14,
-    1255: 14,
-    1254: 14,
-    1253: 14,
-    1252: 14,
-    1251: 14,
-    1250: 16,
-    1249: 16,
-    1248: 16,
-    1247: 16,
-    1246: 16,
-    1245: 16,
-    1244: 16,
-    1243: 16,
-    1242: 16,
-    1241: 16,
-    1240: 17,
-    1239: 17,
-    1238: 17,
-    1237: 17,
-    1236: 17,
-    1235: 17,
-    1234: 17,
-    1233: 17,
-    1232: 17,
-    1231: 17,
-    1230: 18,
-    1229: 18,
-    1228: 18,
-    1227: 18,
-    1226: 18,
-    1225: 18,
-    1224: 18,
-    1223: 18,
-    1222: 18,
-    1221: 18,
-    1220: 20,
-    1219: 20,
-    1218: 20,
-    1217: 20,
-    1216: 20,
-    1215: 20,
-    1214: 20,
-    1213: 20,
-    1212: 20,
-    1211: 20,
-    1210: 21,
-    1209: 21,
-    1208: 21,
-    1207: 21,
-    1206: 21,
-    1205: 21,
-    1204: 21,
-    1203: 21,
-    1202: 21,
-    1201: 21,
-    1200: 23,
-    1199: 23,
-    1198: 23,
-    1197: 23,
-    1196: 23,
-    1195: 23,
-    1194: 23,
-    1193: 23,
-    1192: 23,
-    1191: 23,
-    1190: 24,
-    1189: 24,
-    1188: 24,
-    1187: 24,
-    1186: 24,
-    1185: 24,
-    1184: 24,
-    1183: 24,
-    1182: 24,
-    1181: 24,
-    1180: 26,
-    1179: 26,
-    1178: 26,
-    1177: 26,
-    1176: 26,
-    1175: 26,
-    1174: 26,
-    1173: 26,
-    1172: 26,
-    1171: 26,
-    1170: 27,
-    1169: 27,
-    1168: 27,
-    1167: 27,
-    1166: 27,
-    1165: 27,
-    1164: 27,
-    1163: 27,
-    1162: 27,
-    1161: 27,
-    1160: 29,
-    1159: 29,
-    1158: 29,
-    1157: 29,
-    1156: 29,
-    1155: 29,
-    1154: 29,
-    1153: 29,
-    1152: 29,
-    1151: 29,
-    1150: 30,
-    1149: 30,
-    1148: 30,
-    1147: 30,
-    1146: 30,
-    1145: 30,
-    1144: 30,
-    1143: 30,
-    1142: 30,
-    1141: 30,
-    1140: 32,
-    1139: 32,
-    1138: 32,
-    1137: 32,
-    1136: 32,
-    1135: 32,
-    1134: 32,
-    1133: 32,
-    1132: 32,
-    1131: 32,
-    1130: 33,
-    1129: 33,
-    1128: 33,
-    1127: 33,
-    1126: 33,
-    1125: 33,
-    1124: 33,
-    1123: 33,
-    1122: 33,
-    1121: 33,
-    1120: 35,
-    1119: 35,
-    1118: 35,
-    1117: 35,
-    1116: 35,
-    1115: 35,
-    1114: 35,
-    1113: 35,
-    1112: 35,
-    1111: 35,
-    1110: 36,
-    1109: 36,
-    1108: 36,
-    1107: 36,
-    1106: 36,
-    1105: 36,
-    1104: 36,
-    1103: 36,
-    1102: 36,
-    1101: 36,
-    1100: 38,
-    1099: 38,
-    1098: 38,
-    1097: 38,
-    1096: 38,
-    1095: 38,
-    1094: 38,
-    1093: 38,
-    1092: 38,
-    1091: 38,
-    1090: 40,
-    1089: 40,
-    1088: 40,
-    1087: 40,
-    1086: 40,
-    1085: 40,
-    1084: 40,
-    1083: 40,
-    1082: 40,
-    1081: 40,
-    1080: 42,
-    1079: 42,
-    1078: 42,
-    1077: 42,
-    1076: 42,
-    1075: 42,
-    1074: 42,
-    1073: 42,
-    1072: 42,
-    1071: 42,
-    1070: 44,
-    1069: 44,
-    1068: 44,
-    1067: 44,
-    1066: 44,
-    1065: 44,
-    1064: 44,
-    1063: 44,
-    1062: 44,
-    1061: 44,
-    1060: 46,
-    1059: 46,
-    1058: 46,
-    1057: 46,
-    1056: 46,
-    1055: 46,
-    1054: 46,
-    1053: 46,
-    1052: 46,
-    1051: 46,
-    1050: 48,
-    1049: 48,
-    1048: 48,
-    1047: 48,
-    1046: 48,
-    1045: 48,
-    1044: 48,
-    1043: 48,
-    1042: 48,
-    1041: 48,
-    1040: 50,
-    1039: 50,
-    1038: 50,
-    1037: 50,
-    1036: 50,
-    1035: 50,
-    1034: 50,
-    1033: 50,
-    1032: 50,
-    1031: 50,
-    1030: 52,
-    1029: 52,
-    1028: 52,
-    1027: 52,
-    1026: 52,
-    1025: 52,
-    1024: 52,
-    1023: 52,
-    1022: 52,
-    1021: 52,
-    1020: 54,
-    1019: 54,
-    1018: 54,
-    1017: 54,
-    1016: 54,
-    1015: 54,
-    1014: 54,
-    1013: 54,
-    1012: 54,
-    1011: 54,
-    1010: 56,
-    1009: 56,
-    1008: 56,
-    1007: 56,
-    1006: 56,
-    1005: 56,
-    1004: 56,
-    1003: 56,
-    1002: 56,
-    1001: 56,
-    1000: 58,
-    999: 58,
-    998: 58,
-    997: 58,
-    996: 58,
-    995: 58,
-    994: 58,
-    993: 58,
-    992: 58,
-    991: 58,
-    990: 61,
-    989: 61,
-    988: 61,
-    987: 61,
-    986: 61,
-    985: 61,
-    984: 61,
-    983: 61,
-    982: 61,
-    981: 61,
-    980: 64,
-    979: 64,
-    978: 64,
-    977: 64,
-    976: 64,
-    975: 64,
-    974: 64,
-    973: 64,
-    972: 64,
-    971: 64,
-    970: 67,
-    969: 67,
-    968: 67,
-    967: 67,
-    966: 67,
-    965: 67,
-    964: 67,
-    963: 67,
-    962: 67,
-    961: 67,
-    960: 70,
-    959: 70,
-    958: 70,
-    957: 70,
-    956: 70,
-    955: 70,
-    954: 70,
-    953: 70,
-    952: 70,
-    951: 70,
-    950: 74,
-    949: 74,
-    948: 74,
-    947: 74,
-    946: 74,
-    945: 74,
-    944: 74,
-    943: 74,
-    942: 74,
-    941: 74,
-    940: 78,
-    939: 78,
-    938: 78,
-    937: 78,
-    936: 78,
-    935: 78,
-    934: 78,
-    933: 78,
-    932: 78,
-    931: 78,
-    930: 82,
-    929: 82,
-    928: 82,
-    927: 82,
-    926: 82,
-    925: 82,
-    924: 82,
-    923: 82,
-    922: 82,
-    921: 82,
-    920: 87,
-    919: 87,
-    918: 87,
-    917: 87,
-    916: 87,
-    915: 87,
-    914: 87,
-    913: 87,
-    912: 87,
-    911: 87,
-    910: 93,
-    909: 93,
-    908: 93,
-    907: 93,
-    906: 93,
-    905: 93,
-    904: 93,
-    903: 93,
-    902: 93,
-    901: 93,
-    900: 99,
-    899: 99,
-    898: 99,
-    897: 99,
-    896: 99,
-    895: 99,
-    894: 99,
-    893: 99,
-    892: 99,
-    891: 99,
-    890: 105,
-    889: 105,
-    888: 105,
-    887: 105,
-    886: 105,
-    885: 105,
-    884: 105,
-    883: 105,
-    882: 105,
-    881: 105,
-    880: 112,
-    879: 112,
-    878: 112,
-    877: 112,
-    876: 112,
-    875: 112,
-    874: 112,
-    873: 112,
-    872: 112,
-    871: 112,
-    870: 119,
-    869: 119,
-    868: 119,
-    867: 119,
-    866: 119,
-    865: 119,
-    864: 119,
-    863: 119,
-    862: 119,
-    861: 119,
-    860: 128,
-    859: 128,
-    858: 128,
-    857: 128,
-    856: 128,
-    855: 128,
-    854: 128,
-    853: 128,
-    852: 128,
-    851: 128,
-    850: 138,
-    849: 138,
-    848: 138,
-    847: 138,
-    846: 138,
-    845: 138,
-    844: 138,
-    843: 138,
-    842: 138,
-    841: 138,
-    840: 150
-  },
-  'U16F100H': {
-    'min': 1890,
-    'max': 1360,
-    1890: 1,
-    1889: 1,
-    1888: 1,
-    1887: 1,
-    1886: 1,
-    1885: 1,
-    1884: 1,
-    1883: 1,
-    1882: 1,
-    1881: 1,
-    1880: 2,
-    1879: 2,
-    1878: 2,
-    1877: 2,
-    1876: 2,
-    1875: 2,
-    1874: 2,
-    1873: 2,
-    1872: 2,
-    1871: 2,
-    1870: 3,
-    1869: 3,
-    1868: 3,
-    1867: 3,
-    1866: 3,
-    1865: 3,
-    1864: 3,
-    1863: 3,
-    1862: 3,
-    1861: 3,
-    1860: 4,
-    1859: 4,
-    1858: 4,
-    1857: 4,
-    1856: 4,
-    1855: 4,
-    1854: 4,
-    1853: 4,
-    1852: 4,
-    1851: 4,
-    1850: 5,
-    1849: 5,
-    1848: 5,
-    1847: 5,
-    1846: 5,
-    1845: 5,
-    1844: 5,
-    1843: 5,
-    1842: 5,
-    1841: 5,
-    1840: 7,
-    1839: 7,
-    1838: 7,
-    1837: 7,
-    1836: 7,
-    1835: 7,
-    1834: 7,
-    1833: 7,
-    1832: 7,
-    1831: 7,
-    1830: 8,
-    1829: 8,
-    1828: 8,
-    1827: 8,
-    1826: 8,
-    1825: 8,
-    1824: 8,
-    1823: 8,
-    1822: 8,
-    1821: 8,
-    1820: 9,
-    1819: 9,
-    1818: 9,
-    1817: 9,
-    1816: 9,
-    1815: 9,
-    1814: 9,
-    1813: 9,
-    1812: 9,
-    1811: 9,
-    1810: 10,
-    1809: 10,
-    1808: 10,
-    1807: 10,
-    1806: 10,
-    1805: 10,
-    1804: 10,
-    1803: 10,
-    1802: 10,
-    1801: 10,
-    1800: 12,
-    1799: 12,
-    1798: 12,
-    1797: 12,
-    1796: 12,
-    1795: 12,
-    1794: 12,
-    1793: 12,
-    1792: 12,
-    1791: 12,
-    1790: 13,
-    1789: 13,
-    1788: 13,
-    1787: 13,
-    1786: 13,
-    1785: 13,
-    1784: 13,
-    1783: 13,
-    1782: 13,
-    1781: 13,
-    1780: 14,
-    1779: 14,
-    1778: 14,
-    1777: 14,
-    1776: 14,
-    1775: 14,
-    1774: 14,
-    1773: 14,
-    1772: 14,
-    1771: 14,
-    1770: 16,
-    1769: 16,
-    1768: 16,
-    1767: 16,
-    1766: 16,
-    1765: 16,
-    1764: 16,
-    1763: 16,
-    1762: 16,
-    1761: 16,
-    1760: 17,
-    1759: 17,
-    1758: 17,
-    1757: 17,
-    1756: 17,
-    1755: 17,
-    1754: 17,
-    1753: 17,
-    1752: 17,
-    1751: 17,
-    1750: 18,
-    1749: 18,
-    1748: 18,
-    1747: 18,
-    1746: 18,
-    1745: 18,
-    1744: 18,
-    1743: 18,
-    1742: 18,
-    1741: 18,
-    1740: 20,
-    1739: 20,
-    1738: 20,
-    1737: 20,
-    1736: 20,
-    1735: 20,
-    1734: 20,
-    1733: 20,
-    1732: 20,
-    1731: 20,
-    1730: 21,
-    1729: 21,
-    1728: 21,
-    1727: 21,
-    1726: 21,
-    1725: 21,
-    1724: 21,
-    1723: 21,
-    1722: 21,
-    1721: 21,
-    1720: 23,
-    1719: 23,
-    1718: 23,
-    1717: 23,
-    1716: 23,
-    1715: 23,
-    1714: 23,
-    1713: 23,
-    1712: 23,
-    1711: 23,
-    1710: 24,
-    1709: 24,
-    1708: 24,
-    1707: 24,
-    1706: 24,
-    1705: 24,
-    1704: 24,
-    1703: 24,
-    1702: 24,
-    1701: 24,
-    1700: 26,
-    1699: 26,
-    1698: 26,
-    1697: 26,
-    1696: 26,
-    1695: 26,
-    1694: 26,
-    1693: 26,
-    1692: 26,
-    1691: 26,
-    1690: 27,
-    1689: 27,
-    1688: 27,
-    1687: 27,
-    1686: 27,
-    1685: 27,
-    1684: 27,
-    1683: 27,
-    1682: 27,
-    1681: 27,
-    1680: 29,
-    1679: 29,
-    1678: 29,
-    1677: 29,
-    1676: 29,
-    1675: 29,
-    1674: 29,
-    1673: 29,
-    1672: 29,
-    1671: 29,
-    1670: 30,
-    1669: 30,
-    1668: 30,
-    1667: 30,
-    1666: 30,
-    1665: 30,
-    1664: 30,
-    1663: 30,
-    1662: 30,
-    1661: 30,
-    1660: 32,
-    1659: 32,
-    1658: 32,
-    1657: 32,
-    1656: 32,
-    1655: 32,
-    1654: 32,
-    1653: 32,
-    1652: 32,
-    1651: 32,
-    1650: 33,
-    1649: 33,
-    1648: 33,
-    1647: 33,
-    1646: 33,
-    1645: 33,
-    1644: 33,
-    1643: 33,
-    1642: 33,
-    1641: 33,
-    1640: 35,
-    1639: 35,
-    1638: 35,
-    1637: 35,
-    1636: 35,
-    1635: 35,
-    1634: 35,
-    1633: 35,
-    1632: 35,
-    1631: 35,
-    1630: 36,
-    1629: 36,
-    1628: 36,
-    1627: 36,
-    1626: 36,
-    1625: 36,
-    1624: 36,
-    1623: 36,
-    1622: 36,
-    1621: 36,
-    1620: 38,
-    1619: 38,
-    1618: 38,
-    1617: 38,
-    1616: 38,
-    1615: 38,
-    1614: 38,
-    1613: 38,
-    1612: 38,
-    1611: 38,
-    1610: 40,
-    1609: 40,
-    1608: 40,
-    1607: 40,
-    1606: 40,
-    1605: 40,
-    1604: 40,
-    1603: 40,
-    1602: 40,
-    1601: 40,
-    1600: 42,
-    1599: 42,
-    1598: 42,
-    1597: 42,
-    1596: 42,
-    1595: 42,
-    1594: 42,
-    1593: 42,
-    1592: 42,
-    1591: 42,
-    1590: 44,
-    1589: 44,
-    1588: 44,
-    1587: 44,
-    1586: 44,
-    1585: 44,
-    1584: 44,
-    1583: 44,
-    1582: 44,
-    1581: 44,
-    1580: 46,
-    1579: 46,
-    1578: 46,
-    1577: 46,
-    1576: 46,
-    1575: 46,
-    1574: 46,
-    1573: 46,
-    1572: 46,
-    1571: 46,
-    1570: 48,
-    1569: 48,
-    1568: 48,
-    1567: 48,
-    1566: 48,
-    1565: 48,
-    1564: 48,
-    1563: 48,
-    1562: 48,
-    1561: 48,
-    1560: 50,
-    1559: 50,
-    1558: 50,
-    1557: 50,
-    1556: 50,
-    1555: 50,
-    1554: 50,
-    1553: 50,
-    1552: 50,
-    1551: 50,
-    1550: 52,
-    1549: 52,
-    1548: 52,
-    1547: 52,
-    1546: 52,
-    1545: 52,
-    1544: 52,
-    1543: 52,
-    1542: 52,
-    1541: 52,
-    1540: 54,
-    1539: 54,
-    1538: 54,
-    1537: 54,
-    1536: 54,
-    1535: 54,
-    1534: 54,
-    1533: 54,
-    1532: 54,
-    1531: 54,
-    1530: 56,
-    1529: 56,
-    1528: 56,
-    1527: 56,
-    1526: 56,
-    1525: 56,
-    1524: 56,
-    1523: 56,
-    1522: 56,
-    1521: 56,
-    1520: 58,
-    1519: 58,
-    1518: 58,
-    1517: 58,
-    1516: 58,
-    1515: 58,
-    1514: 58,
-    1513: 58,
-    1512: 58,
-    1511: 58,
-    1510: 61,
-    1509: 61,
-    1508: 61,
-    1507: 61,
-    1506: 61,
-    1505: 61,
-    1504: 61,
-    1503: 61,
-    1502: 61,
-    1501: 61,
-    1500: 64,
-    1499: 64,
-    1498: 64,
-    1497: 64,
-    1496: 64,
-    1495: 64,
-    1494: 64,
-    1493: 64,
-    1492: 64,
-    1491: 64,
-    1490: 67,
-    1489: 67,
-    1488: 67,
-    1487: 67,
-    1486: 67,
-    1485: 67,
-    1484: 67,
-    1483: 67,
-    1482: 67,
-    1481: 67,
-    1480: 70,
-    1479: 70,
-    1478: 70,
-    1477: 70,
-    1476: 70,
-    1475: 70,
-    1474: 70,
-    1473: 70,
-    1472: 70,
-    1471: 70,
-    1470: 74,
-    1469: 74,
-    1468: 74,
-    1467: 74,
-    1466: 74,
-    1465: 74,
-    1464: 74,
-    1463: 74,
-    1462: 74,
-    1461: 74,
-    1460: 78,
-    1459: 78,
-    1458: 78,
-    1457: 78,
-    1456: 78,
-    1455: 78,
-    1454: 78,
-    1453: 78,
-    1452: 78,
-    1451: 78,
-    1450: 82,
-    1449: 82,
-    1448: 82,
-    1447: 82,
-    1446: 82,
-    1445: 82,
-    1444: 82,
-    1443: 82,
-    1442: 82,
-    1441: 82,
-    1440: 87,
-    1439: 87,
-    1438: 87,
-    1437: 87,
-    1436: 87,
-    1435: 87,
-    1434: 87,
-    1433: 87,
-    1432: 87,
-    1431: 87,
-    1430: 93,
-    1429: 93,
-    1428: 93,
-    1427: 93,
-    1426: 93,
-    1425: 93,
-    1424: 93,
-    1423: 93,
-    1422: 93,
-    1421: 93,
-    1420: 99,
-    1419: 99,
-    1418: 99,
-    1417: 99,
-    1416: 99,
-    1415: 99,
-    1414: 99,
-    1413: 99,
-    1412: 99,
-    1411: 99,
-    1410: 105,
-    1409: 105,
-    1408: 105,
-    1407: 105,
-    1406: 105,
-    1405: 105,
-    1404: 105,
-    1403: 105,
-    1402: 105,
-    1401: 105,
-    1400: 112,
-    1399: 112,
-    1398: 112,
-    1397: 112,
-    1396: 112,
-    1395: 112,
-    1394: 112,
-    1393: 112,
-    1392: 112,
-    1391: 112,
-    1390: 119,
-    1389: 119,
-    1388: 119,
-    1387: 119,
-    1386: 119,
-    1385: 119,
-    1384: 119,
-    1383: 119,
-    1382: 119,
-    1381: 119,
-    1380: 128,
-    1379: 128,
-    1378: 128,
-    1377: 128,
-    1376: 128,
-    1375: 128,
-    1374: 128,
-    1373: 128,
-    1372: 128,
-    1371: 128,
-    1370: 138,
-    1369: 138,
-    1368: 138,
-    1367: 138,
-    1366: 138,
-    1365: 138,
-    1364: 138,
-    1363: 138,
-    1362: 138,
-    1361: 138,
-    1360: 150
-  },
-  'U16FHJ': {
-    'min': 84,
-    'max': 183,
-    84: 1,
-    85: 2,
-    86: 3,
-    87: 4,
-    88: 5,
-    89: 6,
-    90: 7,
-    91: 8,
-    92: 9,
-    93: 10,
-    94: 11,
-    95: 12,
-    96: 13,
-    97: 14,
-    98: 15,
-    99: 16,
-    100: 17,
-    101: 18,
-    102: 19,
-    103: 20,
-    104: 21,
-    105: 22,
-    106: 23,
-    107: 24,
-    108: 25,
-    109: 26,
-    110: 27,
-    111: 28,
-    112: 29,
-    113: 30,
-    114: 32,
-    115: 33,
-    116: 34,
-    117: 35,
-    118: 36,
-    119: 37,
-    120: 38,
-    121: 39,
-    122: 40,
-    123: 41,
-    124: 43,
-    125: 44,
-    126: 45,
-    127: 46,
-    128: 47,
-    129: 48,
-    130: 49,
-    131: 51,
-    132: 52,
-    133: 53,
-    134: 54,
-    135: 55,
-    136: 56,
-    137: 58,
-    138: 59,
-    139: 60,
-    140: 62,
-    141: 63,
-    142: 64,
-    143: 66,
-    144: 67,
-    145: 69,
-    146: 70,
-    147: 72,
-    148: 74,
-    149: 76,
-    150: 78,
-    151: 80,
-    152: 82,
-    153: 84,
-    154: 86,
-    155: 88,
-    156: 90,
-    157: 92,
-    158: 94,
-    159: 96,
-    160: 98,
-    161: 100,
-    162: 102,
-    163: 104,
-    164: 106,
-    165: 108,
-    166: 110,
-    167: 112,
-    168: 114,
-    169: 116,
-    170: 118,
-    171: 120,
-    172: 122,
-    173: 125,
-    174: 127,
-    175: 130,
-    176: 132,
-    177: 135,
-    178: 137,
-    179: 140,
-    180: 142,
-    181: 145,
-    182: 147,
-    183: 150
-  },
-  'U16FLJ': {
-    'min': 252,
-    'max': 643,
-    252: 1,
-    253: 1,
-    254: 1,
-    255: 1,
-    256: 2,
-    257: 2,
-    258: 2,
-    259: 2,
-    260: 3,
-    261: 3,
-    262: 3,
-    263: 3,
-    264: 4,
-    265: 4,
-    266: 4,
-    267: 4,
-    268: 5,
-    269: 5,
-    270: 5,
-    271: 5,
-    272: 6,
-    273: 6,
-    274: 6,
-    275: 6,
-    276: 7,
-    277: 7,
-    278: 7,
-    279: 7,
-    280: 8,
-    281: 8,
-    282: 8,
-    283: 8,
-    284: 9,
-    285: 9,
-    286: 9,
-    287: 9,
-    288: 10,
-    289: 10,
-    290: 10,
-    291: 10,
-    292: 11,
-    293: 11,
-    294: 11,
-    295: 11,
-    296: 12,
-    297: 12,
-    298: 12,
-    299: 12,
-    300: 13,
-    301: 13,
-    302: 13,
-    303: 13,
-    304: 14,
-    305: 14,
-    306: 14,
-    307: 14,
-    308: 15,
-    309: 15,
-    310: 15,
-    311: 15,
-    312: 16,
-    313: 16,
-    314: 16,
-    315: 16,
-    316: 17,
-    317: 17,
-    318: 17,
-    319: 17,
-    320: 18,
-    321: 18,
-    322: 18,
-    323: 18,
-    324: 19,
-    325: 19,
-    326: 19,
-    327: 19,
-    328: 20,
-    329: 20,
-    330: 20,
-    331: 20,
-    332: 21,
-    333: 21,
-    334: 21,
-    335: 21,
-    336: 22,
-    337: 22,
-    338: 22,
-    339: 22,
-    340: 23,
-    341: 23,
-    342: 23,
-    343: 23,
-    344: 24,
-    345: 24,
-    346: 24,
-    347: 24,
-    348: 25,
-    349: 25,
-    350: 25,
-    351: 26,
-    352: 26,
-    353: 26,
-    354: 26,
-    355: 27,
-    356: 27,
-    357: 27,
-    358: 27,
-    359: 28,
-    360: 28,
-    361: 28,
-    362: 28,
-    363: 29,
-    364: 29,
-    365: 29,
-    366: 30,
-    367: 30,
-    368: 30,
-    369: 30,
-    370: 31,
-    371: 31,
-    372: 31,
-    373: 31,
-    374: 32,
-    375: 32,
-    376: 32,
-    377: 32,
-    378: 33,
-    379: 33,
-    380: 33,
-    381: 34,
-    382: 34,
-    383: 34,
-    384: 34,
-    385: 35,
-    386: 35,
-    387: 35,
-    388: 35,
-    389: 36,
-    390: 36,
-    391: 36,
-    392: 36,
-    393: 37,
-    394: 37,
-    395: 37,
-    396: 38,
-    397: 38,
-    398: 38,
-    399: 38,
-    400: 39,
-    401: 39,
-    402: 39,
-    403: 40,
-    404: 40,
-    405: 40,
-    406: 40,
-    407: 41,
-    408: 41,
-    409: 41,
-    410: 41,
-    411: 42,
-    412: 42,
-    413: 42,
-    414: 43,
-    415: 43,
-    416: 43,
-    417: 43,
-    418: 44,
-    419: 44,
-    420: 44,
-    421: 44,
-    422: 45,
-    423: 45,
-    424: 45,
-    425: 46,
-    426: 46,
-    427: 46,
-    428: 46,
-    429: 47,
-    430: 47,
-    431: 47,
-    432: 48,
-    433: 48,
-    434: 48,
-    435: 48,
-    436: 49,
-    437: 49,
-    438: 49,
-    439: 50,
-    440: 50,
-    441: 50,
-    442: 50,
-    443: 51,
-    444: 51,
-    445: 51,
-    446: 52,
-    447: 52,
-    448: 52,
-    449: 52,
-    450: 53,
-    451: 53,
-    452: 53,
-    453: 54,
-    454: 54,
-    455: 54,
-    456: 55,
-    457: 55,
-    458: 55,
-    459: 55,
-    460: 56,
-    461: 56,
-    462: 56,
-    463: 57,
-    464: 57,
-    465: 57,
-    466: 58,
-    467: 58,
-    468: 59,
-    469: 59,
-    470: 59,
-    471: 59,
-    472: 60,
-    473: 60,
-    474: 60,
-    475: 61,
-    476: 61,
-    477: 61,
-    478: 62,
-    479: 62,
-    480: 62,
-    481: 63,
-    482: 63,
-    483: 63,
-    484: 64,
-    485: 64,
-    486: 64,
-    487: 65,
-    488: 65,
-    489: 65,
-    490: 66,
-    491: 66,
-    492: 66,
-    493: 67,
-    494: 67,
-    495: 68,
-    496: 68,
-    497: 68,
-    498: 69,
-    499: 69,
-    500: 70,
-    501: 70,
-    502: 70,
-    503: 71,
-    504: 71,
-    505: 71,
-    506: 72,
-    507: 72,
-    508: 73,
-    509: 73,
-    510: 74,
-    511: 74,
-    512: 75,
-    513: 75,
-    514: 75,
-    515: 76,
-    516: 76,
-    517: 77,
-    518: 77,
-    519: 78,
-    520: 78,
-    521: 79,
-    522: 79,
-    523: 80,
-    524: 80,
-    525: 81,
-    526: 81,
-    527: 82,
-    528: 82,
-    529: 83,
-    530: 83,
-    531: 84,
-    532: 84,
-    533: 85,
-    534: 85,
-    535: 86,
-    536: 86,
-    537: 87,
-    538: 87,
-    539: 88,
-    540: 88,
-    541: 89,
-    542: 89,
-    543: 90,
-    544: 90,
-    545: 91,
-    546: 91,
-    547: 92,
-    548: 92,
-    549: 93,
-    550: 93,
-    551: 94,
-    552: 94,
-    553: 95,
-    554: 95,
-    555: 96,
-    556: 96,
-    557: 97,
-    558: 97,
-    559: 98,
-    560: 98,
-    561: 99,
-    562: 99,
-    563: 100,
-    564: 100,
-    565: 101,
-    566: 101,
-    567: 102,
-    568: 103,
-    569: 103,
-    570: 103,
-    571: 104,
-    572: 105,
-    573: 105,
-    574: 106,
-    575: 107,
-    576: 107,
-    577: 108,
-    578: 108,
-    579: 109,
-    580: 110,
-    581: 110,
-    582: 111,
-    583: 112,
-    584: 112,
-    585: 113,
-    586: 113,
-    587: 114,
-    588: 115,
-    589: 115,
-    590: 116,
-    591: 116,
-    592: 117,
-    593: 118,
-    594: 118,
-    595: 119,
-    596: 119,
-    597: 120,
-    598: 121,
-    599: 121,
-    600: 122,
-    601: 122,
-    602: 123,
-    603: 124,
-    604: 124,
-    605: 125,
-    606: 126,
-    607: 126,
-    608: 127,
-    609: 128,
-    610: 128,
-    611: 129,
-    612: 130,
-    613: 130,
-    614: 131,
-    615: 132,
-    616: 132,
-    617: 133,
-    618: 134,
-    619: 134,
-    620: 135,
-    621: 136,
-    622: 136,
-    623: 137,
-    624: 138,
-    625: 138,
-    626: 139,
-    627: 139,
-    628: 140,
-    629: 141,
-    630: 141,
-    631: 142,
-    632: 143,
-    633: 143,
-    634: 144,
-    635: 145,
-    636: 145,
-    637: 146,
-    638: 147,
-    639: 147,
-    640: 148,
-    641: 149,
-    642: 149,
-    643: 150
-  },
-  'U16FSP': {
-    'min': 530,
-    'max': 1300,
-    530: 1,
-    531: 1,
-    532: 1,
-    533: 1,
-    534: 1,
-    535: 1,
-    536: 1,
-    537: 1,
-    538: 1,
-    539: 1,
-    540: 2,
-    541: 2,
-    542: 2,
-    543: 2,
-    544: 2,
-    545: 2,
-    546: 2,
-    547: 2,
-    548: 2,
-    549: 2,
-    550: 3,
-    551: 3,
-    552: 3,
-    553: 3,
-    554: 3,
-    555: 3,
-    556: 3,
-    557: 3,
-    558: 3,
-    559: 3,
-    560: 4,
-    561: 4,
-    562: 4,
-    563: 4,
-    564: 4,
-    565: 4,
-    566: 4,
-    567: 4,
-    568: 4,
-    569: 4,
-    570: 5,
-    571: 5,
-    572: 5,
-    573: 5,
-    574: 5,
-    575: 5,
-    576: 5,
-    577: 5,
-    578: 5,
-    579: 5,
-    580: 6,
-    581: 6,
-    582: 6,
-    583: 6,
-    584: 6,
-    585: 6,
-    586: 6,
-    587: 6,
-    588: 6,
-    589: 6,
-    590: 7,
-    591: 7,
-    592: 7,
-    593: 7,
-    594: 7,
-    595: 7,
-    596: 7,
-    597: 7,
-    598: 7,
-    599: 7,
-    600: 8,
-    601: 8,
-    602: 8,
-    603: 8,
-    604: 8,
-    605: 8,
-    606: 8,
-    607: 8,
-    608: 8,
-    609: 8,
-    610: 9,
-    611: 9,
-    612: 9,
-    613: 9,
-    614: 9,
-    615: 9,
-    616: 9,
-    617: 9,
-    618: 9,
-    619: 9,
-    620: 10,
-    621: 10,
-    622: 10,
-    623: 10,
-    624: 10,
-    625: 10,
-    626: 10,
-    627: 10,
-    628: 10,
-    629: 10,
-    630: 11,
-    631: 11,
-    632: 11,
-    633: 11,
-    634: 11,
-    635: 11,
-    636: 11,
-    637: 11,
-    638: 11,
-    639: 11,
-    640: 12,
-    641: 12,
-    642: 12,
-    643: 12,
-    644: 12,
-    645: 12,
-    646: 12,
-    647: 12,
-    648: 12,
-    649: 12,
-    650: 13,
-    651: 13,
-    652: 13,
-    653: 13,
-    654: 13,
-    655: 13,
-    656: 13,
-    657: 13,
-    658: 13,
-    659: 13,
-    660: 14,
-    661: 14,
-    662: 14,
-    663: 14,
-    664: 14,
-    665: 14,
-    666: 14,
-    667: 14,
-    668: 14,
-    669: 14,
-    670: 15,
-    671: 15,
-    672: 15,
-    673: 15,
-    674: 15,
-    675: 15,
-    676: 15,
-    677: 15,
-    678: 15,
-    679: 15,
-    680: 16,
-    681: 16,
-    682: 16,
-    683: 16,
-    684: 16,
-    685: 16,
-    686: 16,
-    687: 16,
-    688: 16,
-    689: 16,
-    690: 17,
-    691: 17,
-    692: 17,
-    693: 17,
-    694: 17,
-    695: 17,
-    696: 17,
-    697: 17,
-    698: 17,
-    699: 17,
-    700: 18,
-    701: 18,
-    702: 18,
-    703: 18,
-    704: 18,
-    705: 18,
-    706: 18,
-    707: 18,
-    708: 18,
-    709: 18,
-    710: 19,
-    711: 19,
-    712: 19,
-    713: 19,
-    714: 19,
-    715: 19,
-    716: 19,
-    717: 19,
-    718: 19,
-    719: 19,
-    720: 20,
-    721: 20,
-    722: 20,
-    723: 20,
-    724: 20,
-    725: 20,
-    726: 20,
-    727: 20,
-    728: 20,
-    729: 20,
-    730: 21,
-    731: 21,
-    732: 21,
-    733: 21,
-    734: 21,
-    735: 21,
-    736: 21,
-    737: 21,
-    738: 21,
-    739: 21,
-    740: 22,
-    741: 22,
-    742: 22,
-    743: 22,
-    744: 22,
-    745: 22,
-    746: 22,
-    747: 22,
-    748: 22,
-    749: 22,
-    750: 23,
-    751: 23,
-    752: 23,
-    753: 23,
-    754: 23,
-    755: 23,
-    756: 23,
-    757: 23,
-    758: 23,
-    759: 23,
-    760: 24,
-    761: 24,
-    762: 24,
-    763: 24,
-    764: 24,
-    765: 24,
-    766: 24,
-    767: 24,
-    768: 24,
-    769: 24,
-    770: 25,
-    771: 25,
-    772: 25,
-    773: 25,
-    774: 25,
-    775: 25,
-    776: 25,
-    777: 25,
-    778: 26,
-    779: 26,
-    780: 26,
-    781: 26,
-    782: 26,
-    783: 26,
-    784: 26,
-    785: 26,
-    786: 27,
-    787: 27,
-    788: 27,
-    789: 27,
-    790: 27,
-    791: 27,
-    792: 27,
-    793: 27,
-    794: 28,
-    795: 28,
-    796: 28,
-    797: 28,
-    798: 28,
-    799: 28,
-    800: 28,
-    801: 28,
-    802: 29,
-    803: 29,
-    804: 29,
-    805: 29,
-    806: 29,
-    807: 29,
-    808: 29,
-    809: 29,
-    810: 30,
-    811: 30,
-    812: 30,
-    813: 30,
-    814: 30,
-    815: 30,
-    816: 30,
-    817: 30,
-    818: 31,
-    819: 31,
-    820: 31,
-    821: 31,
-    822: 31,
-    823: 31,
-    824: 31,
-    825: 31,
-    826: 32,
-    827: 32,
-    828: 32,
-    829: 32,
-    830: 32,
-    831: 32,
-    832: 32,
-    833: 32,
-    834: 33,
-    835: 33,
-    836: 33,
-    837: 33,
-    838: 33,
-    839: 33,
-    840: 33,
-    841: 33,
-    842: 34,
-    843: 34,
-    844: 34,
-    845: 34,
-    846: 34,
-    847: 34,
-    848: 34,
-    849: 34,
-    850: 35,
-    851: 35,
-    852: 35,
-    853: 35,
-    854: 35,
-    855: 35,
-    856: 35,
-    857: 35,
-    858: 36,
-    859: 36,
-    860: 36,
-    861: 36,
-    862: 36,
-    863: 36,
-    864: 36,
-    865: 36,
-    866: 37,
-    867: 37,
-    868: 37,
-    869: 37,
-    870: 37,
-    871: 37,
-    872: 37,
-    873: 37,
-    874: 38,
-    875: 38,
-    876: 38,
-    877: 38,
-    878: 38,
-    879: 38,
-    880: 38,
-    881: 38,
-    882: 39,
-    883: 39,
-    884: 39,
-    885: 39,
-    886: 39,
-    887: 39,
-    888: 39,
-    889: 39,
-    890: 40,
-    891: 40,
-    892: 40,
-    893: 40,
-    894: 40,
-    895: 40,
-    896: 40,
-    897: 40,
-    898: 41,
-    899: 41,
-    900: 41,
-    901: 41,
-    902: 41,
-    903: 41,
-    904: 41,
-    905: 41,
-    906: 42,
-    907: 42,
-    908: 42,
-    909: 42,
-    910: 42,
-    911: 42,
-    912: 42,
-    913: 42,
-    914: 43,
-    915: 43,
-    916: 43,
-    917: 43,
-    918: 43,
-    919: 43,
-    920: 43,
-    921: 43,
-    922: 44,
-    923: 44,
-    924: 44,
-    925: 44,
-    926: 44,
-    927: 44,
-    928: 44,
-    929: 44,
-    930: 45,
-    931: 45,
-    932: 45,
-    933: 45,
-    934: 45,
-    935: 45,
-    936: 45,
-    937: 45,
-    938: 46,
-    939: 46,
-    940: 46,
-    941: 46,
-    942: 46,
-    943: 46,
-    944: 46,
-    945: 46,
-    946: 47,
-    947: 47,
-    948: 47,
-    949: 47,
-    950: 47,
-    951: 47,
-    952: 47,
-    953: 47,
-    954: 48,
-    955: 48,
-    956: 48,
-    957: 48,
-    958: 48,
-    959: 48,
-    960: 48,
-    961: 48,
-    962: 49,
-    963: 49,
-    964: 49,
-    965: 49,
-    966: 49,
-    967: 49,
-    968: 49,
-    969: 49,
-    970: 50,
-    971: 50,
-    972: 50,
-    973: 50,
-    974: 50,
-    975: 50,
-    976: 50,
-    977: 50,
-    978: 51,
-    979: 51,
-    980: 51,
-    981: 51,
-    982: 51,
-    983: 51,
-    984: 51,
-    985: 51,
-    986: 52,
-    987: 52,
-    988: 52,
-    989: 52,
-    990: 52,
-    991: 52,
-    992: 52,
-    993: 52,
-    994: 53,
-    995: 53,
-    996: 53,
-    997: 53,
-    998: 53,
-    999: 53,
-    1000: 53,
-    1001: 53,
-    1002: 54,
-    1003: 54,
-    1004: 54,
-    1005: 54,
-    1006: 54,
-    1007: 54,
-    1008: 54,
-    1009: 54,
-    1010: 55,
-    1011: 55,
-    1012: 55,
-    1013: 55,
-    1014: 55,
-    1015: 55,
-    1016: 55,
-    1017: 55,
-    1018: 56,
-    1019: 56,
-    1020: 56,
-    1021: 56,
-    1022: 56,
-    1023: 56,
-    1024: 56,
-    1025: 56,
-    1026: 57,
-    1027: 57,
-    1028: 57,
-    1029: 57,
-    1030: 57,
-    1031: 57,
-    1032: 57,
-    1033: 57,
-    1034: 58,
-    1035: 58,
-    1036: 58,
-    1037: 58,
-    1038: 58,
-    1039: 58,
-    1040: 58,
-    1041: 58,
-    1042: 59,
-    1043: 59,
-    1044: 59,
-    1045: 59,
-    1046: 59,
-    1047: 59,
-    1048: 59,
-    1049: 59,
-    1050: 60,
-    1051: 60,
-    1052: 60,
-    1053: 60,
-    1054: 60,
-    1055: 61,
-    1056: 61,
-    1057: 61,
-    1058: 61,
-    1059: 61,
-    1060: 62,
-    1061: 62,
-    1062: 62,
-    1063: 62,
-    1064: 62,
-    1065: 63,
-    1066: 63,
-    1067: 63,
-    1068: 63,
-    1069: 63,
-    1070: 64,
-    1071: 64,
-    1072: 64,
-    1073: 64,
-    1074: 64,
-    1075: 65,
-    1076: 65,
-    1077: 65,
-    1078: 65,
-    1079: 65,
-    1080: 66,
-    1081: 66,
-    1082: 66,
-    1083: 66,
-    1084: 66,
-    1085: 67,
-    1086: 67,
-    1087: 67,
-    1088: 67,
-    1089: 67,
-    1090: 68,
-    1091: 68,
-    1092: 68,
-    1093: 68,
-    1094: 68,
-    1095: 69,
-    1096: 69,
-    1097: 69,
-    1098: 69,
-    1099: 69,
-    1100: 70,
-    1101: 70,
-    1102: 70,
-    1103: 70,
-    1104: 70,
-    1105: 71,
-    1106: 71,
-    1107: 71,
-    1108: 71,
-    1109: 71,
-    1110: 72,
-    1111: 72,
-    1112: 72,
-    1113: 72,
-    1114: 72,
-    1115: 73,
-    1116: 73,
-    1117: 73,
-    1118: 73,
-    1119: 73,
-    1120: 74,
-    1121: 74,
-    1122: 74,
-    1123: 74,
-    1124: 74,
-    1125: 75,
-    1126: 75,
-    1127: 75,
-    1128: 75,
-    1129: 75,
-    1130: 76,
-    1131: 76,
-    1132: 76,
-    1133: 76,
-    1134: 76,
-    1135: 77,
-    1136: 77,
-    1137: 77,
-    1138: 77,
-    1139: 77,
-    1140: 78,
-    1141: 78,
-    1142: 78,
-    1143: 78,
-    1144: 78,
-    1145: 79,
-    1146: 79,
-    1147: 79,
-    1148: 79,
-    1149: 79,
-    1150: 80,
-    1151: 80,
-    1152: 80,
-    1153: 80,
-    1154: 80,
-    1155: 81,
-    1156: 81,
-    1157: 81,
-    1158: 81,
-    1159: 81,
-    1160: 82,
-    1161: 82,
-    1162: 82,
-    1163: 82,
-    1164: 82,
-    1165: 83,
-    1166: 83,
-    1167: 83,
-    1168: 83,
-    1169: 83,
-    1170: 84,
-    1171: 84,
-    1172: 84,
-    1173: 84,
-    1174: 84,
-    1175: 85,
-    1176: 85,
-    1177: 85,
-    1178: 85,
-    1179: 85,
-    1180: 86,
-    1181: 86,
-    1182: 86,
-    1183: 86,
-    1184: 86,
-    1185: 87,
-    1186: 87,
-    1187: 87,
-    1188: 87,
-    1189: 87,
-    1190: 88,
-    1191: 88,
-    1192: 88,
-    1193: 88,
-    1194: 88,
-    1195: 89,
-    1196: 89,
-    1197: 89,
-    1198: 89,
-    1199: 89,
-    1200: 90,
-    1201: 90,
-    1202: 91,
-    1203: 91,
-    1204: 92,
-    1205: 92,
-    1206: 93,
-    1207: 93,
-    1208: 94,
-    1209: 94,
-    1210: 95,
-    1211: 95,
-    1212: 96,
-    1213: 96,
-    1214: 97,
-    1215: 97,
-    1216: 98,
-    1217: 98,
-    1218: 99,
-    1219: 99,
-    1220: 100,
-    1221: 100,
-    1222: 101,
-    1223: 101,
-    1224: 102,
-    1225: 102,
-    1226: 103,
-    1227: 103,
-    1228: 104,
-    1229: 104,
-    1230: 105,
-    1231: 105,
-    1232: 106,
-    1233: 106,
-    1234: 107,
-    1235: 107,
-    1236: 108,
-    1237: 108,
-    1238: 109,
-    1239: 109,
-    1240: 110,
-    1241: 110,
-    1242: 111,
-    1243: 111,
-    1244: 112,
-    1245: 112,
-    1246: 113,
-    1247: 113,
-    1248: 114,
-    1249: 114,
-    1250: 115,
-    1251: 115,
-    1252: 116,
-    1253: 116,
-    1254: 117,
-    1255: 117,
-    1256: 118,
-    1257: 118,
-    1258: 119,
-    1259: 119,
-    1260: 120,
-    1261: 120,
-    1262: 121,
-    1263: 121,
-    1264: 122,
-    1265: 122,
-    1266: 123,
-    1267: 123,
-    1268: 124,
-    1269: 124,
-    1270: 125,
-    1271: 125,
-    1272: 126,
-    1273: 126,
-    1274: 127,
-    1275: 127,
-    1276: 128,
-    1277: 128,
-    1278: 129,
-    1279: 129,
-    1280: 130,
-    1281: 131,
-    1282: 132,
-    1283: 133,
-    1284: 134,
-    1285: 135,
-    1286: 136,
-    1287: 137,
-    1288: 138,
-    1289: 139,
-    1290: 140,
-    1291: 141,
-    1292: 142,
-    1293: 143,
-    1294: 144,
-    1295: 145,
-    1296: 146,
-    1297: 147,
-    1298: 148,
-    1299: 149,
-    1300: 150
-  }
-}
+    def scorer(performance):
+      int(100 * performance)
+      return 0
+  return scorer
+
+def score(ag, gender, event_code, performance):
+  return _scorer(ag, gender, event_code)(performance)
+
+def score_many(ag, gender, event_code, performances):
+  """Score a whole heat or pool of performances in one event
+
+  The arguments are checked once; returns a list of points.
+  """
+  return list(map(_scorer(ag, gender, event_code), performances))
+
+def __getattr__(name):
+  if name == 'scores':
+    # the tables as they used to be, performance -> points plus min and max
+    scores = {}
+    for key, t in get_tables().items():
+      d = scores[key] = dict(min=t.min, max=t.max)
+      d.update((t.first + i, p) for i, p in enumerate(t.points))
+    return scores
+  raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -24,9 +24,13 @@ ESAA_2015_HJ = [
 ]
 """
 from __future__ import print_function, annotations
+import json
+import os
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
 from .exceptions import RuleViolation
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Callable
+from collections import namedtuple
 _012 = 0,1,2    #range of attempts
 
 #The countback rule used to separate competitors with equal best heights in High Jump and Pole Vault is possibly the most misunderstood rule in the whole of the sport. Here's how it operates:
@@ -36,21 +40,38 @@ _012 = 0,1,2    #range of attempts
 #So you cannot harm your cause by trying for a height which you think it unlikely that you will clear. But accurate jumping at the lower heights is vital!
 #http://s250914043.websitehome.co.uk/offcourse/HighJumpRules.html
 
+# Each height's attempts are packed into one byte: the number of attempts in
+# the low two bits, then two bits for each of up to three trials.
+_TRIAL_LETTERS = 'ox-r'
+_TRIAL_BITS = dict((c, i) for i, c in enumerate(_TRIAL_LETTERS))
+_HEIGHT_TEXT = tuple(''.join(_TRIAL_LETTERS[(b >> (2 + 2 * i)) & 3] for i in range(b & 3))
+                     for b in range(256))
+_HEIGHT_BYTE = dict((t, b) for b, t in reversed(list(enumerate(_HEIGHT_TEXT))))
+_HEIGHT_FAILURES = tuple(t.count('x') for t in _HEIGHT_TEXT)
+
 class Jumper(object):
     """Used by HighJumpCompetition internally"""
+    __slots__ = ('order', '_place', '_attempts', 'highest_cleared', '_highest_cleared_index',
+                 'eliminated', 'dismissed', 'round_lim', 'consecutive_failures', 'failures',
+                 'cleared_failures', 'first_name', 'last_name', 'bib', 'team', 'gender',
+                 'category', 'rank_group', '_old_pos')
+
     def __init__(self, **kwargs):
         "Allow keyword initialisation"
         self.order = 1  # if we get only one, I guess they jump first
         self._place = 1 # if we only get one, I guess they are winning
 
-        # list of strings containing '', 'o', 'xo', 'xxo', 'xxx', 'x', 'xx'
-        self.attempts_by_height = []
+        # one byte per height, see attempts_by_height
+        self._attempts = bytearray()
         self.highest_cleared = Decimal("0.00")
-        self.highest_cleared_index = -1
+        self._highest_cleared_index = -1
         self.eliminated = False     # still in the competition?
         self.dismissed = False      # still in the round?
         self.round_lim = 3
         self.consecutive_failures = 0
+        self.failures = 0           # 'x' count over all heights so far
+        # failures at, and up to and including, the highest cleared height
+        self.cleared_failures = (0, 0)
 
         for (arg, default) in [
             ('first_name', 'unknown'),
@@ -64,6 +85,36 @@ class Jumper(object):
             value = kwargs.get(arg, default)
             setattr(self, arg, value)
 
+    @property
+    def attempts_by_height(self) -> List[str]:
+        "list of strings containing '', 'o', 'xo', 'xxo', 'xxx', 'x', 'xx'"
+        return [_HEIGHT_TEXT[b] for b in self._attempts]
+
+    @attempts_by_height.setter
+    def attempts_by_height(self, attempts: List[str]) -> None:
+        try:
+            self._attempts = bytearray(_HEIGHT_BYTE[t] for t in attempts)
+        except KeyError as e:
+            raise ValueError('Invalid attempts %r' % e.args[0])
+        self._count_failures()
+
+    @property
+    def highest_cleared_index(self) -> int:
+        "index in attempts_by_height of the highest height cleared, or -1"
+        return self._highest_cleared_index
+
+    @highest_cleared_index.setter
+    def highest_cleared_index(self, index: int) -> None:
+        self._highest_cleared_index = index
+        self._count_failures()
+
+    def _count_failures(self) -> None:
+        "Work out failures and cleared_failures from the attempts afresh"
+        fails = [_HEIGHT_FAILURES[b] for b in self._attempts]
+        self.failures = sum(fails)
+        x = self._highest_cleared_index
+        self.cleared_failures = (fails[x], sum(fails[:x + 1])) if 0 <= x < len(fails) else (0, 0)
+
     def _set_jump_array(self, height_count: int, label : str = 'jump') -> None:
         """Ensure they have one string for each height in the competition
 
@@ -73,26 +124,30 @@ class Jumper(object):
         if self.eliminated or self.dismissed:
             what = 'retiring' if self.has_retired else 'being eliminated' if self.eliminated else 'passing'
             raise RuleViolation("Cannot %s after %s" % (label,what))
-        atts = self.attempts_by_height
-        # they may have skipped some, pas with empty strings
-        while len(atts) < height_count:
-            atts.append('')
-        if len(self.attempts_by_height[-1]) > self.round_lim-1:
+        atts = self._attempts
+        # they may have skipped some, pad with empty heights
+        if len(atts) < height_count:
+            atts.extend(bytes(height_count - len(atts)))
+        n = atts[-1] & 3
+        if n > self.round_lim-1 or n == 3:
             raise RuleViolation("Can attempt a maximum of %d times" % self.round_lim)
 
+    def _add_trial(self, letter: str) -> None:
+        "Add o, x, - or r to the attempts at the current height"
+        atts = self._attempts
+        b = atts[-1]
+        atts[-1] = b + 1 + (_TRIAL_BITS[letter] << (2 + 2 * (b & 3)))
+
     @property
     def has_retired(self):
-        return self.attempts_by_height and self.attempts_by_height[-1].endswith('r')
+        atts = self._attempts
+        return bool(atts) and _HEIGHT_TEXT[atts[-1]].endswith('r')
 
     @property
     def ranking_key(self) -> Tuple[int, Decimal, int, int]:
         """Return a sort key to determine who is winning"""
         x = self.highest_cleared_index
-        if x<0:
-            failures_before_and_at_height = failures_at_height = 0
-        else:
-            failures_at_height = self.attempts_by_height[x].count('x')
-            failures_before_and_at_height = failures_at_height + sum(_.count('x') for _ in self.attempts_by_height[:x])
+        failures_at_height, failures_before_and_at_height = self.cleared_failures
         return (
             (3 if x<0 else 2) if self.eliminated else (1 if x<0 else 0),
             - self.highest_cleared,
@@ -102,20 +157,27 @@ class Jumper(object):
 
     @property
     def place(self):
+        return self._shown_place(self._place)
+
+    def _shown_place(self, place: int):
+        "what place shows when _place is place"
         if self.order in ('DQ','DNS'):
             return self.order
         elif self.highest_cleared_index<0:
             return ''
-        return self._place
+        return place
 
     def cleared(self, height_count: int, height: Decimal) -> None:
         """Add a clearance at the current bar position"""
         self._set_jump_array(height_count)
 
         # Holds their pattern of 'o' and 'x'
-        self.attempts_by_height[-1] += 'o'
+        self._add_trial('o')
         self.highest_cleared = height
-        self.highest_cleared_index = len(self.attempts_by_height)-1
+        self._highest_cleared_index = len(self._attempts)-1
+        # no more attempts can be made at this height, so the countback
+        # figures are fixed until the next clearance
+        self.cleared_failures = (_HEIGHT_FAILURES[self._attempts[-1]], self.failures)
         self.consecutive_failures = 0
         self.dismissed = True
 
@@ -124,7 +186,8 @@ class Jumper(object):
         self._set_jump_array(height_count)
 
         # Holds their pattern of 'o' and 'x'
-        self.attempts_by_height[-1] += 'x'
+        self._add_trial('x')
+        self.failures += 1
         self.consecutive_failures += 1
         if self.consecutive_failures>=self.round_lim:
             self.eliminated = self.dismissed = True
@@ -136,7 +199,7 @@ class Jumper(object):
         self._set_jump_array(height_count,'pass')
 
         # Holds their pattern of 'o' and 'x'
-        self.attempts_by_height[-1] += '-'
+        self._add_trial('-')
         self.dismissed = True
 
     def retired(self, height_count: int, height: Decimal) -> None:
@@ -144,10 +207,36 @@ class Jumper(object):
         self._set_jump_array(height_count,'retire')
 
         # Holds their pattern of 'o' and 'x'
-        self.attempts_by_height[-1] += 'r'
+        self._add_trial('r')
         self.eliminated = True
         self.dismissed = True
 
+    def _snapshot(self) -> Dict:
+        "Everything about the jumper, for HighJumpCompetition.snapshot"
+        d = dict((name.lstrip('_'), getattr(self, name)) for name in self.__slots__
+                 if name != '_old_pos' and hasattr(self, name))
+        d['attempts'] = self._attempts.hex()
+        d['highest_cleared'] = str(self.highest_cleared)
+        d['cleared_failures'] = list(self.cleared_failures)
+        return d
+
+    @classmethod
+    def _from_snapshot(cls, d: Dict) -> Jumper:
+        j = cls.__new__(cls)
+        for name in cls.__slots__:
+            if name.lstrip('_') in d:
+                setattr(j, name, d[name.lstrip('_')])
+        j._attempts = bytearray.fromhex(d['attempts'])
+        j.highest_cleared = Decimal(d['highest_cleared'])
+        # the counters always follow the attempts, whatever the snapshot says
+        j._count_failures()
+        return j
+
+# kind is 'height', 'trial', 'place', 'eliminated' or 'state'; bib is None for
+# 'height' and 'state'.  For 'trial' old and new are the jumper's attempts at
+# the bar height before and after, e.g. 'x' and 'xo'.
+LeaderboardEvent = namedtuple('LeaderboardEvent', 'kind bib old new')
+
 class TrialObj(dict):
     def __init__(self, *args, **kwargs):
         super(TrialObj, self).__init__(*args, **kwargs)
@@ -164,12 +253,16 @@ class HighJumpCompetition(object):
         self.jumpers = []
         self.jumpers_by_bib = {}
         self.ranked_jumpers = []
+        self._rank_stale = False    # ranked_jumpers needs a full sort
         self.bar_height = Decimal("0.00")
         self.heights = []   # sequence of heights so far
         self.in_jump_off = False
         self.actions = []  # log for replay purposes.
+        self.journal = None     # an ActionJournal to write the actions to as well
         self.verbose = 0  # helpful print statements
         self.state = 'scheduled'
+        self._subscribers = []  # called with each LeaderboardEvent
+        self._changes = None    # what ranking changed, while anyone is subscribed
 
     def add_jumper(self, **kwargs) -> None:
         """Add one more person to the competition
@@ -187,11 +280,13 @@ class HighJumpCompetition(object):
         self.jumpers_by_bib[j.bib] = j
         self.jumpers.append(j)
         self.ranked_jumpers.append(j)
+        self._rank_stale = True
 
         # record what happened
-        self.actions.append(('add_jumper', kwargs))
+        self._log('add_jumper', kwargs)
 
     def set_bar_height(self, new_height: Decimal) -> None:
+        old_height, old_state = self.bar_height, self.state
         if self.state=='scheduled':
             self.state = 'started'
         elif self.state not in ('started','jumpoff','won'):
@@ -204,7 +299,12 @@ class HighJumpCompetition(object):
                 j.dismissed = False
         self.heights.append(new_height)
         self.bar_height = new_height
-        self.actions.append(('set_bar_height', new_height))
+        self._log('set_bar_height', new_height)
+        if self._subscribers:
+            events = [LeaderboardEvent('height', None, old_height, new_height)]
+            if self.state != old_state:
+                events.append(LeaderboardEvent('state', None, old_state, self.state))
+            self._emit(events)
 
     def check_started(self, bib: str, label: str = 'jumping') -> Jumper:
         jumper = self.jumpers_by_bib[bib]
@@ -221,34 +321,92 @@ class HighJumpCompetition(object):
             raise RuleViolation('Jumper with bib, %s, has order %s and %s is not allowed!' % (jumper.bib,jumper.order,label))
         return jumper
 
+    def _log(self, action: str, value) -> None:
+        self.actions.append((action, value))
+        if self.journal is not None:
+            self.journal.record(action, value)
+
     def cleared(self, bib: str) -> None:
         "Record a successful jump"
-        jumper = self.check_started(bib)
-        jumper.cleared(len(self.heights), self.bar_height)
-        self.actions.append(('cleared', bib))
-        self._rank()
+        self._trial(bib, 'cleared')
 
     def failed(self, bib: str) -> None:
         "Record a failed jump, raises RuleViolation if out of order"
-        jumper = self.check_started(bib)
-        jumper.failed(len(self.heights), self.bar_height)
-        self.actions.append(('failed', bib))
-        self._rank()
+        self._trial(bib, 'failed')
 
     def passed(self, bib: str) -> None:
         "Record a pass,  raises RuleViolation if out of order"
-        jumper = self.check_started(bib)
-        jumper.passed(len(self.heights), self.bar_height)
-        self.actions.append(('passed', bib))
-        self._rank()
+        self._trial(bib, 'passed')
 
     def retired(self, bib: str) -> None:
         "Record a failed jump. Throws RuleViolation if out of order"
-        jumper = self.check_started(bib,'retiring')
-        jumper = self.jumpers_by_bib[bib]
-        jumper.retired(len(self.heights), self.bar_height)
-        self.actions.append(('retired', bib))
-        self._rank()
+        self._trial(bib, 'retired', 'retiring')
+
+    def _trial(self, bib: str, action: str, label: str = 'jumping') -> None:
+        "Make the jumper's trial, log it and rank them"
+        jumper = self.check_started(bib, label)
+        height_count = len(self.heights)
+        if not self._subscribers:
+            getattr(jumper, action)(height_count, self.bar_height)
+            self._log(action, bib)
+            self._rank(jumper=jumper)
+            return
+
+        def attempts():
+            atts = jumper._attempts
+            return _HEIGHT_TEXT[atts[height_count-1]] if len(atts) >= height_count > 0 else ''
+        old_attempts, old_place, old_eliminated, old_state = attempts(), jumper.place, jumper.eliminated, self.state
+        self._changes = []
+        try:
+            getattr(jumper, action)(height_count, self.bar_height)
+            self._log(action, bib)
+            self._rank(jumper=jumper)
+            changes = self._changes
+        finally:
+            self._changes = None
+
+        events = [LeaderboardEvent('trial', bib, old_attempts, attempts())]
+        if jumper.eliminated != old_eliminated:
+            events.append(LeaderboardEvent('eliminated', bib, old_eliminated, jumper.eliminated))
+        events.extend(LeaderboardEvent('eliminated', j.bib, True, False)
+                      for kind, j, old in changes if kind == 'eliminated' and j is not jumper)
+        if jumper.place != old_place:
+            events.append(LeaderboardEvent('place', bib, old_place, jumper.place))
+        for kind, j, old in changes:
+            if kind == 'place' and j is not jumper:
+                old, new = j._shown_place(old), j.place
+                if new != old:
+                    events.append(LeaderboardEvent('place', j.bib, old, new))
+        if self.state != old_state:
+            events.append(LeaderboardEvent('state', None, old_state, self.state))
+        self._emit(events)
+
+    def subscribe(self, callback: Callable[[LeaderboardEvent], None]) -> Callable:
+        """Call callback(event) with each LeaderboardEvent from now on
+
+        After each bar height and each trial, the events say what changed:
+        the height, the trial, who was eliminated (or brought back for a
+        jump-off), whose place changed, and the state.  A scoreboard which
+        starts from ranked_jumpers can be kept up to date from them.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable) -> None:
+        self._subscribers.remove(callback)
+
+    def events(self) -> LeaderboardEvents:
+        """Return an async iterator over the LeaderboardEvents from now on
+
+            async for event in competition.events():
+                ...
+        """
+        return LeaderboardEvents(self)
+
+    def _emit(self, events: List[LeaderboardEvent]) -> None:
+        for event in events:
+            for callback in list(self._subscribers):
+                callback(event)
 
     action_letter = dict(cleared='o', failed='x', passed='-', retired='r')
 
@@ -285,29 +443,113 @@ class HighJumpCompetition(object):
         for i,j in enumerate(rankj): j._old_pos = i
         rankj.sort(key=lambda j: (j.ranking_key, j._old_pos))
 
+        changes = self._changes
         pk = None
         pj = None
         for i, j in enumerate(rankj):
             del j._old_pos
             k = j.ranking_key
             if i == 0:
-                j._place = 1
+                place = 1
             else:
                 if k == pk:
-                    j._place = pj._place
+                    place = pj._place
                 else:
-                    j._place = i + 1
+                    place = i + 1
+            if changes is not None and place != j._place:
+                changes.append(('place', j, j._place))
+            j._place = place
             pk = k
             pj = j
         return rankj
 
-    def _rank(self, verbose: bool = False) -> None:
+    def _rerankj(self, jumper: Jumper) -> List[Jumper]:
+        """Move jumper to its place after its ranking_key has changed
+
+        Gives exactly what _rankj would, provided ranked_jumpers was in order
+        before: the others stay where they are, and jumper goes among any with
+        an equal key where it was before.  Only the places which can have
+        changed are worked out again.
+        """
+        rankj = self.ranked_jumpers
+        old = rankj.index(jumper)
+        del rankj[old]
+        k = jumper.ranking_key
+        lo, hi = 0, len(rankj)
+        while lo < hi:  # first with a key >= k
+            mid = (lo + hi) // 2
+            if rankj[mid].ranking_key < k:
+                lo = mid + 1
+            else:
+                hi = mid
+        new = lo
+        if new < old:
+            hi = len(rankj)
+            while lo < hi:  # first with a key > k
+                mid = (lo + hi) // 2
+                if k < rankj[mid].ranking_key:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            new = min(old, lo)
+        rankj.insert(new, jumper)
+
+        # beyond the moved part the positions are the same, so once a place
+        # comes out unchanged so do all the rest
+        i = min(old, new)
+        last = max(old, new)
+        pk = rankj[i - 1].ranking_key if i else None
+        for i in range(i, len(rankj)):
+            j = rankj[i]
+            k = j.ranking_key
+            place = rankj[i - 1]._place if k == pk else i + 1
+            if place == j._place:
+                if i > last:
+                    break
+            elif self._changes is not None:
+                self._changes.append(('place', j, j._place))
+            j._place = place
+            pk = k
+        return rankj
+
+    def _ranked_in_order(self) -> bool:
+        "Are ranked_jumpers and their places as _rankj would leave them?"
+        pk = None
+        for i, j in enumerate(self.ranked_jumpers):
+            k = j.ranking_key
+            if pk is not None and k < pk:
+                return False
+            if j._place != (self.ranked_jumpers[i - 1]._place if k == pk else i + 1):
+                return False
+            pk = k
+        return True
+
+    def _reorder(self, jumper: Jumper = None) -> List[Jumper]:
+        """Bring ranked_jumpers and the places up to date
+
+        If only jumper has jumped since the last time, just they are moved.
+        """
+        if jumper is None or self._rank_stale:
+            rankj = self._rankj()
+            self._rank_stale = False
+        else:
+            rankj = self._rerankj(jumper)
+        return rankj
+
+    def _rank(self, verbose: bool = False, jumper: Jumper = None) -> None:
         "Determine who is winning"
-        rankj = self._rankj()
+        rankj = self._reorder(jumper)
         if not rankj: return
 
         if 1 and verbose: print('ranked jumpers in order %s:' % repr([(j._place,j.bib,j.ranking_key) for j in rankj]))
 
+        self._update_state(rankj)
+
+    def _update_state(self, rankj: List[Jumper]) -> None:
+        """Start a jump-off, or end the competition, if it is time to
+
+        Nothing happens while two or more jumpers remain.
+        """
         remj = self.remaining
         if len(remj)==0:
             #they all failed or retired at this height
@@ -319,21 +561,27 @@ class HighJumpCompetition(object):
                         j.rank_group = 1
                     else:
                         nc += 1
+                        if self._changes is not None:
+                            self._changes.append(('eliminated', j, True))
                         j.eliminated = False
                         j.round_lim = 1
                         j.consecutive_failures = 0
                         j.rank_group = 2
                 self.state = 'jumpoff' if nc else 'drawn'
+                self._rank_stale = True
             elif self.state=='jumpoff' and not rankj[0].has_retired:
                     j = rankj[0]
+                    if self._changes is not None:
+                        self._changes.append(('eliminated', j, True))
                     j.eliminated = False
                     j.round_lim = 1
                     j.consecutive_failures = 0
+                    self._rank_stale = True
             else:
                 self.state = 'finished'
         elif (len(remj)==1 and (1+len(self.eliminated))==len(self.jumpers)
-                and len(remj[0].attempts_by_height)==len(self.heights)
-                and 'o' in remj[0].attempts_by_height[-1]):
+                and len(remj[0]._attempts)==len(self.heights)
+                and 'o' in _HEIGHT_TEXT[remj[0]._attempts[-1]]):
             self.state = 'won' if self.state in ('started','won') else 'finished'
 
     def bib_trial(self, bib: str, trial: str) -> None:
@@ -350,7 +598,8 @@ class HighJumpCompetition(object):
             raise RuleViolation("Unknown jump trial code '%s'" % trial)
 
     @classmethod
-    def from_matrix(cls, matrix: List[List[str]], to_nth_height: int = None, verbose: bool = False) -> HighJumpCompetition:
+    def from_matrix(cls, matrix: List[List[str]], to_nth_height: int = None, verbose: bool = False,
+                    fast: bool = False) -> HighJumpCompetition:
         """ Convert from a pasteable tabular representation like this...
 
         RIO_MENS_HJ = [  # pasted from Wikipedia
@@ -368,6 +617,9 @@ class HighJumpCompetition(object):
         replays the bar heights up to the Nth bar if given.
         pass None for an empty competition.
 
+        With fast=True the trials are not recorded in actions (which is left
+        empty) and nothing is printed, but the jumpers, their places and the
+        state come out the same, and the same RuleViolations are raised.
         """
         self = cls()
         # heights are in the top row - change to h1, h2 etc
@@ -400,6 +652,10 @@ class HighJumpCompetition(object):
         else:  # we want some of them, or an empty competition
             heights_to_replay = heights[0:to_nth_height]
 
+        if fast:
+            self._replay_fast(dikts, heights_to_replay)
+            return self
+
         for i, height in enumerate(heights_to_replay):
             height_key = "h%d" % (i + 1)
             self.set_bar_height(height)
@@ -422,6 +678,68 @@ class HighJumpCompetition(object):
 
         return self
 
+    def _replay_fast(self, dikts: List[Dict[str, str]], heights: List[Decimal]) -> None:
+        """Replay the heights for from_matrix(fast=True)
+
+        Does what bib_trial would for each trial, but without the action log.
+        Jumpers are moved in ranked_jumpers just as _rerankj would, using a
+        list of their keys, and the places are only worked out when at most
+        one jumper remains (the only time _update_state can change anything)
+        and at the end.
+        """
+        trials = dict(o=Jumper.cleared, x=Jumper.failed, r=Jumper.retired)
+        jumpers = [(d, self.jumpers_by_bib[d['bib']]) for d in dikts if d['order'] not in ('DNS','DQ')]
+        rankj = self.ranked_jumpers
+        keys = None         # ranking_key of each of rankj
+        placed = True       # are the places up to date?
+        remaining = len(self.remaining)
+        for i, height in enumerate(heights):
+            self.set_bar_height(height)
+            height_count = len(self.heights)
+            height_key = "h%d" % (i + 1)
+            rows = [(j, d.get(height_key, '')) for d, j in jumpers]
+            for a in _012:
+                for j, attempts in rows:
+                    if len(attempts) > a:
+                        result = attempts[a]
+                        if result == '-':
+                            continue
+                        trial = trials.get(result)
+                        if trial is None:
+                            raise RuleViolation("Unknown jump trial code '%s'" % result)
+                        self.check_started(j.bib, 'retiring' if result == 'r' else 'jumping')
+                        eliminated = j.eliminated
+                        trial(j, height_count, self.bar_height)
+
+                        if keys is None or self._rank_stale:
+                            self._rankj()
+                            self._rank_stale = False
+                            keys = [_.ranking_key for _ in rankj]
+                            placed = True
+                        else:
+                            k = j.ranking_key
+                            old = rankj.index(j)
+                            if keys[old] != k:
+                                del rankj[old], keys[old]
+                                new = bisect_left(keys, k)
+                                if new < old:
+                                    new = min(old, bisect_right(keys, k, new))
+                                rankj.insert(new, j)
+                                keys.insert(new, k)
+                                placed = False
+
+                        if j.eliminated and not eliminated:
+                            remaining -= 1
+                        if remaining <= 1:
+                            if not placed:
+                                self._rankj()   # already in order, so this just places them
+                                placed = True
+                            self._update_state(rankj)
+                            remaining = len(self.remaining)
+        if not placed:
+            self._rankj()
+        self.actions = []
+
     def _looks_like_height(self, txt:str) -> bool:
         try:
             h = float(txt)
@@ -462,13 +780,82 @@ class HighJumpCompetition(object):
     def from_actions(self, actions: List[Tuple] = None) -> HighJumpCompetition:
         if actions is None: actions = self.actions
         hj = self.__class__()
+        hj._replay(actions)
+        return hj
+
+    def _replay(self, actions: List[Tuple]) -> None:
         for a, v in actions:
-            m = getattr(hj,a)
+            m = getattr(self,a)
             if isinstance(v,dict):
                 m(**v)
             else:
                 m(v)
-        return hj
+
+    def snapshot(self) -> Dict:
+        """Return the whole state of the competition as a dict which json can save
+
+        from_snapshot makes the competition again.  The actions are not
+        included; an ActionJournal keeps those.
+        """
+        index = dict((id(j), i) for i, j in enumerate(self.jumpers))
+        return dict(
+            version=1,
+            state=self.state,
+            bar_height=str(self.bar_height),
+            heights=[str(h) for h in self.heights],
+            in_jump_off=self.in_jump_off,
+            rank_stale=self._rank_stale,
+            jumpers=[j._snapshot() for j in self.jumpers],
+            ranked=[index[id(j)] for j in self.ranked_jumpers],
+            )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict, actions: List[Tuple] = ()) -> HighJumpCompetition:
+        """Make a competition again from its snapshot, then replay any actions since"""
+        if snapshot.get('version') != 1:
+            raise ValueError('Cannot restore a version %r snapshot' % snapshot.get('version'))
+        self = cls()
+        self.state = snapshot['state']
+        self.bar_height = Decimal(snapshot['bar_height'])
+        self.heights = [Decimal(h) for h in snapshot['heights']]
+        self.in_jump_off = snapshot['in_jump_off']
+        self._rank_stale = snapshot['rank_stale']
+        self.jumpers = [Jumper._from_snapshot(d) for d in snapshot['jumpers']]
+        self.jumpers_by_bib = dict((j.bib, j) for j in self.jumpers)
+        self.ranked_jumpers = [self.jumpers[i] for i in snapshot['ranked']]
+        if not self._ranked_in_order():
+            # edited by hand; moving single jumpers needs the rest in order
+            self._rankj()
+        self._replay(actions)
+        return self
+
+    @classmethod
+    def from_journal(cls, path: str, resume: bool = True) -> HighJumpCompetition:
+        """Restore a competition from the file written by an ActionJournal
+
+        The last snapshot in the journal is loaded and only the actions after
+        it are replayed, so this takes about as long however far through the
+        competition was.  The earlier actions are put back in actions without
+        being replayed.  With resume the competition goes on writing to the
+        journal.
+        """
+        snapshot = None
+        actions = []
+        for a, v in ActionJournal.read(path):
+            if a == 'snapshot':
+                snapshot, n = v, len(actions)
+            else:
+                actions.append((a, v))
+        if snapshot is None:
+            self = cls()
+            self._replay(actions)
+        else:
+            self = cls.from_snapshot(snapshot)
+            self.actions = actions[:n]
+            self._replay(actions[n:])
+        if resume:
+            self.journal = ActionJournal(path)
+        return self
 
     def to_matrix(self, keys: List[str] = []) -> List[List[str]]:
         if 'bib' not in keys: keys.insert(0, 'bib')
@@ -485,3 +872,134 @@ class HighJumpCompetition(object):
     @property
     def is_running(self) -> bool:
         return self.state in ['started','jumpoff']
+
+
+class LeaderboardEvents(object):
+    """Async iterator over a competition's LeaderboardEvents
+
+    Made by HighJumpCompetition.events().  It ends after the competition is
+    finished or drawn, or when close() is called.  The competition must be
+    driven from the same event loop.
+    """
+    def __init__(self, competition: HighJumpCompetition):
+        import asyncio
+        self.competition = competition
+        self._queue = asyncio.Queue()
+        competition.subscribe(self._put)
+
+    def _put(self, event: LeaderboardEvent) -> None:
+        self._queue.put_nowait(event)
+        if event.kind == 'state' and event.new in ('finished', 'drawn'):
+            self.close()
+
+    def close(self) -> None:
+        "Stop listening; the iteration ends after the events already made"
+        if self._put in self.competition._subscribers:
+            self.competition.unsubscribe(self._put)
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> LeaderboardEvents:
+        return self
+
+    async def __anext__(self) -> LeaderboardEvent:
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+
+class ActionJournal(object):
+    """Append-only record of a competition's actions, in a JSON lines file
+
+    Set a competition's journal to one of these (before anything happens) and
+    each action is written and flushed as it is made.  Call snapshot from
+    time to time, so that HighJumpCompetition.from_journal need only replay
+    the actions since the last one.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(path):
+            self._trim(path)
+        self._f = open(path, 'a', encoding='utf8')
+
+    @staticmethod
+    def _trim(path: str) -> None:
+        "Cut off a last line left unfinished by a crash, so we carry on after a whole one"
+        with open(path, 'rb+') as f:
+            end = pos = f.seek(0, 2)
+            while pos > 0:
+                n = min(pos, 4096)
+                f.seek(pos - n)
+                i = f.read(n).rfind(b'\n')
+                if i >= 0:
+                    pos += i + 1 - n
+                    break
+                pos -= n
+            if pos != end:
+                f.truncate(pos)
+
+    def record(self, action: str, value) -> None:
+        self._write([action, value])
+
+    def snapshot(self, competition: HighJumpCompetition) -> None:
+        self._write(['snapshot', competition.snapshot()])
+
+    def _write(self, record: list) -> None:
+        self._f.write(json.dumps(record, default=str) + '\n')
+        self._f.flush()
+
+    def close(self) -> None:
+        self._f.close()
+
+    @staticmethod
+    def read(path: str) -> List[Tuple]:
+        "Return the (action, value) pairs in a journal, with snapshots as ('snapshot', dict)"
+        records = []
+        with open(path, 'r', encoding='utf8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break   # cut short by a crash while it was written
+                if not line.strip():
+                    continue
+                a, v = json.loads(line)
+                if a == 'set_bar_height':
+                    v = Decimal(v)
+                records.append((a, v))
+        return records
+
+
+def _replay_file(path: str) -> Tuple[HighJumpCompetition, Exception]:
+    "Replay one archived competition for replay_archive"
+    try:
+        with open(path, 'r', encoding='utf8') as f:
+            matrix = json.load(f)
+        return HighJumpCompetition.from_matrix(matrix, fast=True), None
+    except (OSError, ValueError, KeyError, IndexError, TypeError, RuleViolation) as e:
+        return None, e
+
+def replay_archive(directory: str, processes: int = None, on_error=None) -> Dict[str, HighJumpCompetition]:
+    """Replay every competition archived in directory, using a pool of processes
+
+    Each .json file there holds a matrix as taken by from_matrix, and is
+    replayed with fast=True.  Returns the competitions keyed by file name.
+    A file which cannot be read or replayed is left out, and on_error(path,
+    exception) called for it if given; otherwise the exception is raised.
+    processes defaults to the number of CPUs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    names = sorted(fn for fn in os.listdir(directory) if fn.endswith('.json'))
+    competitions = {}
+    if not names:
+        return competitions
+    paths = [os.path.join(directory, fn) for fn in names]
+    # a few chunks per process keeps them busy without a round trip per file
+    chunksize = max(1, len(paths) // (4 * (processes or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(processes) as pool:
+        for name, path, (c, e) in zip(names, paths, pool.map(_replay_file, paths, chunksize=chunksize)):
+            if e is None:
+                competitions[name] = c
+            elif on_error is None:
+                raise e
+            else:
+                on_error(path, e)
+    return competitions
@@ -0,0 +1,164 @@
+"""Run many high jump and pole vault competitions at once under asyncio
+
+A championship may have a dozen pits going at the same time, with officials
+entering trials for all of them.  A HighJumpCompetition is not safe to change
+from two places at once, so the manager gives each competition a queue and a
+task of its own: everything done to a competition goes through its queue and
+happens in order, while different competitions carry on independently and
+nothing waits on a global lock.
+
+    async with CompetitionManager() as manager:
+        manager.add('HJ-W', HighJumpCompetition.from_matrix(start_list))
+        await manager.submit('HJ-W', 'set_bar_height', Decimal('1.70'))
+        await manager.submit('HJ-W', 'cleared', '123')   # raises any RuleViolation
+        snapshot = await manager.snapshot('HJ-W')
+"""
+import asyncio
+from typing import Any, Callable, Hashable, Iterator
+
+from .highjump import HighJumpCompetition
+
+__all__ = ('CompetitionManager',)
+
+
+class CompetitionManager(object):
+    """Owns competitions keyed by id and applies what is submitted to each in turn
+
+    Use it from within the event loop.  submit and run return at once with a
+    future, so input is never held up; awaiting the future gives the result
+    or raises what the competition raised.  Await every future, or nothing
+    but a log message at garbage collection reports a failed action.
+    """
+    def __init__(self):
+        self._queues = {}   # id -> asyncio.Queue of (function, future) or None to stop
+        self._tasks = {}    # id -> the task working through the queue
+        self._competitions = {}
+        self._stopped = {}  # id -> what stopped its task, e.g. a CancelledError
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._competitions)
+
+    def __contains__(self, cid: Hashable) -> bool:
+        return cid in self._competitions
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._competitions))
+
+    def add(self, cid: Hashable, competition: HighJumpCompetition = None) -> HighJumpCompetition:
+        """Start managing competition (a new one by default) as cid, and return it
+
+        From now on it should only be changed through the manager.
+        """
+        if self._closed:
+            raise RuntimeError('The manager has been closed')
+        if cid in self._competitions:
+            raise KeyError('There is already a competition %r' % (cid,))
+        if competition is None:
+            competition = HighJumpCompetition()
+        # outside a running loop this raises before anything is registered
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        task = loop.create_task(self._work(cid, competition, queue))
+        self._competitions[cid] = competition
+        self._queues[cid] = queue
+        self._tasks[cid] = task
+        return competition
+
+    def run(self, cid: Hashable, function: Callable[[HighJumpCompetition], Any]) -> asyncio.Future:
+        """Queue function(competition) after everything already submitted for cid
+
+        Returns a future of its result.
+        """
+        self._check(cid)
+        future = asyncio.get_running_loop().create_future()
+        self._queues[cid].put_nowait((function, future))
+        return future
+
+    def submit(self, cid: Hashable, action: str, value: Any = None) -> asyncio.Future:
+        """Queue an action, as in HighJumpCompetition.actions, for competition cid
+
+        e.g. submit(cid, 'cleared', bib) or submit(cid, 'add_jumper', dict(bib='12')).
+        The future's result is None, or it raises the RuleViolation if the
+        action was against the rules.
+        """
+        return self.run(cid, lambda c: c._replay([(action, value)]))
+
+    def snapshot(self, cid: Hashable) -> asyncio.Future:
+        """Future of the competition's snapshot once what is already queued is done"""
+        return self.run(cid, HighJumpCompetition.snapshot)
+
+    async def remove(self, cid: Hashable) -> HighJumpCompetition:
+        "Finish what is queued for cid, then stop managing it and return it"
+        if cid not in self._stopped:
+            self._check(cid)
+        self._queues.pop(cid).put_nowait(None)
+        task = self._tasks.pop(cid)
+        if self._stopped.pop(cid, None) is None:
+            await task
+        return self._competitions.pop(cid)
+
+    async def close(self) -> None:
+        "Finish everything queued and stop managing all the competitions"
+        self._closed = True
+        for queue in self._queues.values():
+            queue.put_nowait(None)
+        tasks = [t for cid, t in self._tasks.items() if cid not in self._stopped]
+        self._queues.clear()
+        self._tasks.clear()
+        self._competitions.clear()
+        self._stopped.clear()
+        await asyncio.gather(*tasks)
+
+    def _check(self, cid: Hashable) -> None:
+        "Raise unless things can be queued for cid"
+        if self._closed:
+            raise RuntimeError('The manager has been closed')
+        if cid not in self._queues:
+            raise KeyError('No competition %r' % (cid,))
+        if cid in self._stopped:
+            raise RuntimeError('Competition %r has stopped' % (cid,)) from self._stopped[cid]
+
+    async def __aenter__(self) -> 'CompetitionManager':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _work(self, cid: Hashable, competition: HighJumpCompetition,
+                    queue: asyncio.Queue) -> None:
+        future = None
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                function, future = item
+                if not future.cancelled():
+                    self._apply(function, competition, future)
+                # a busy competition must not keep the others waiting
+                await asyncio.sleep(0)
+        except BaseException as e:
+            # KeyboardInterrupt, SystemExit or a CancelledError end the task;
+            # fail everything queued rather than leave it waiting for ever
+            self._stopped[cid] = e
+            pending = [future]
+            while not queue.empty():
+                pending.append((queue.get_nowait() or (None, None))[1])
+            for future in pending:
+                if future is not None and not future.done():
+                    error = RuntimeError('Competition %r has stopped' % (cid,))
+                    error.__cause__ = e
+                    future.set_exception(error)
+            raise
+
+    @staticmethod
+    def _apply(function: Callable, competition: HighJumpCompetition, future: asyncio.Future) -> None:
+        # not done in _work, so that the tracebacks of exceptions handed on do
+        # not hold the worker's frame (clearing them would kill the worker)
+        try:
+            result = function(competition)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
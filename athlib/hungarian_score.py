@@ -4,7 +4,11 @@ IAAF has published a book of scoring factors, containing about 183,000
 individual data points.  It is alleged that the formula herein gives the 
 exact same answers.  We'll find out shortly ;-)
 
-score = floor(b * (performance + a)**2  + c), 1)
+score = max(0, floor(a * (performance + b)**2 + c))
+
+except that a race no faster than -b seconds, the time that gets no points,
+scores 0 rather than what the quadratic gives on its far side (e.g. for a 20
+second 100m); so does a performance of 0 or less.
 
 See https://github.com/GlaivePro/IaafPoints
 
@@ -13,26 +17,52 @@ from math import floor
 from athlib.utils import check_event_code
 
 def score(gender, inout, event_code, performance):
-    "Return IAAF (Hungarian) points, or raise AssertionError"
-    assert inout in ('IND', 'OUT'), "Must specify indoor (IN) or outdoor (OUT)"
-    assert gender in 'MFX', "Gender must be M , F or X. X will be looked up in Male points tables!"
-    ec = check_event_code(event_code)
-    assert ec is not None, "Unrecognised event code %s" % event_code
+    "Return IAAF (Hungarian) points, at least 0, or raise AssertionError"
+    (a,b,c) = _factors(gender, inout, event_code)
+    return _points(a, b, c, performance)
 
 
-    key = (gender, inout, event_code)
-    tbl = get_lookup_table()
-    (a,b,c) = tbl[key]
+def score_many(genders, inouts, event_codes, performances):
+    """Return IAAF (Hungarian) points for many performances, e.g. a ranking list
+
+    The arguments are parallel sequences as for score.  Each distinct gender,
+    indoor/outdoor and event is checked once; the points are the same as score
+    gives.
+    """
+    if not (len(genders) == len(inouts) == len(event_codes) == len(performances)):
+        raise ValueError("score_many needs sequences of equal length")
+    factors = {}
+    points = []
+    for key, performance in zip(zip(genders, inouts, event_codes), performances):
+        abc = factors.get(key)
+        if abc is None:
+            abc = factors[key] = _factors(*key)
+        points.append(_points(abc[0], abc[1], abc[2], performance))
+    return points
 
-    # b = performance in m or sec that gets no points.  (Slower would be an input error!)
-    #     Points grow quadratically above it
+
+def _points(a, b, c, performance):
+    "The points for performance with the factors (a, b, c), clamped at 0"
     # a = multiplier to get all events onto a similar scale
-    # c = points shift applied at the end
+    # b = minus the time in sec that gets no points in a race, otherwise a
+    #     shift in m; points grow quadratically away from it
+    # c = points shift applied at the end, making short field marks negative
+    if performance <= 0 or (b < 0 and performance + b >= 0):
+        # no mark, or a race no faster than the time that gets no points
+        return 0
+    return max(0, floor(a * (performance + b)**2 + c))
 
-    # to do:  if performance is worse than a, should get zero points.  e.g. 20 second 100m
 
+def _factors(gender, inout, event_code):
+    "Check the arguments and return the factors (a, b, c) for this event"
+    assert inout in ('IND', 'OUT'), "Must specify indoor (IN) or outdoor (OUT)"
+    assert gender in 'MFX', "Gender must be M , F or X. X will be looked up in Male points tables!"
+    ec = check_event_code(event_code)
+    assert ec is not None, "Unrecognised event code %s" % event_code
 
-    return floor(a * (performance + b)**2 + c) 
+    key = (gender, inout, event_code)
+    tbl = get_lookup_table()
+    return tbl[key]
 
 
 _table = None
@@ -0,0 +1,174 @@
+"""Rank results by IAAF (Hungarian) points, keeping the best N in each event
+
+The results are read, checked and scored one at a time, and only the best N
+for each gender, indoor/outdoor and event are held (in a heap), so a whole
+season's results can be ranked in a fixed amount of memory.
+
+Input is CSV with a header row, or JSON lines, with at least the columns
+gender, event and performance; inout (IND or OUT) is optional.  Other
+columns, such as the athlete's name, are carried through.
+
+    python -m athlib.rank [-n 10] [--indoor] results.csv [more.jsonl ...]
+"""
+import csv
+import heapq
+import io
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from itertools import count
+
+from .hungarian_score import score, get_lookup_table
+from .utils import normalize_gender, normalize_event_code, \
+    check_performance_for_discipline, parse_hms
+
+__all__ = ('ranked', 'read_results', 'score_results', 'top_n', 'rank',
+           'main')
+
+ranked = namedtuple('ranked', 'points gender inout event_code performance row')
+
+# the points tables call hurdles races e.g. 110M rather than 110H
+_PAT_HURDLES = re.compile(r'^(\d+)H$')
+
+
+def read_results(source, format=None):
+    """Yield each result in a CSV or JSON lines file as a dict
+
+    source is a path, '-' for stdin, or an open text file; format is 'csv'
+    or 'jsonl', and by default is guessed from the file name (csv unless it
+    ends in .jsonl, .ndjson or .json).
+    """
+    if format is None:
+        name = (source if isinstance(source, str)
+                else getattr(source, 'name', ''))
+        ext = os.path.splitext(name)[1].lower()
+        format = 'jsonl' if ext in ('.jsonl', '.ndjson', '.json') else 'csv'
+    if format not in ('csv', 'jsonl'):
+        raise ValueError('cannot read results in format %r' % format)
+
+    if source == '-':
+        f, close = sys.stdin, False
+    elif isinstance(source, str):
+        f, close = io.open(source, 'r', encoding='utf8', newline=''), True
+    else:
+        f, close = source, False
+    try:
+        if format == 'csv':
+            for row in csv.DictReader(f):
+                yield row
+        else:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    finally:
+        if close:
+            f.close()
+
+
+def _hungarian_event(event_code):
+    m = _PAT_HURDLES.match(event_code)
+    return m.group(1) + 'M' if m else event_code.upper()
+
+
+def score_results(rows, inout='OUT', on_error=None):
+    """Check and score each result, yielding a ranked tuple for each good one
+
+    Bad results (unknown gender or event, a performance which does not make
+    sense for the event, an event with no points table, or a mark too poor
+    to score any points) are dropped; on_error(row, exception) is called for
+    each if it is given.
+    """
+    tables = get_lookup_table()
+    for row in rows:
+        try:
+            gender = normalize_gender(row['gender'])
+            event_code = normalize_event_code(row['event'])
+            row_inout = (row.get('inout') or inout).upper()
+            key_event = _hungarian_event(event_code)
+            if (gender, row_inout, key_event) not in tables:
+                raise ValueError('no points table for %s %s %s'
+                                 % (gender, row_inout, event_code))
+            performance = check_performance_for_discipline(
+                event_code, str(row['performance']), gender)
+            points = score(gender, row_inout, key_event,
+                           parse_hms(performance))
+            if points <= 0:
+                raise ValueError('%s %s scores no points'
+                                 % (event_code, performance))
+        except (KeyError, ValueError, AssertionError) as e:
+            if on_error is not None:
+                on_error(row, e)
+            continue
+        yield ranked(points, gender, row_inout, event_code, performance, row)
+
+
+def top_n(results, n=10):
+    """Return the best n results for each gender, indoor/outdoor and event
+
+    results are ranked tuples, e.g. from score_results.  Returns a dict
+    keyed by (gender, inout, event_code) of lists, best first; on equal
+    points the earlier result is kept and listed first.
+    """
+    heaps = {}
+    seq = count()
+    for r in results:
+        heap = heaps.setdefault((r.gender, r.inout, r.event_code), [])
+        # the heap holds the n best with the worst at the top; later results
+        # sort below earlier ones with the same points
+        item = (r.points, -next(seq), r)
+        if len(heap) < n:
+            heapq.heappush(heap, item)
+        else:
+            heapq.heappushpop(heap, item)
+    return dict((k, [item[2] for item in sorted(heap, reverse=True)])
+                for k, heap in heaps.items())
+
+
+def rank(sources, n=10, inout='OUT', format=None, on_error=None):
+    """Read, score and rank the results in sources (see read_results)"""
+    def rows():
+        for source in sources:
+            for row in read_results(source, format):
+                yield row
+    return top_n(score_results(rows(), inout, on_error), n)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog='python -m athlib.rank',
+        description='Rank results by IAAF points, best N per event')
+    parser.add_argument('files', nargs='+',
+                        help="CSV or JSON lines files, '-' for stdin")
+    parser.add_argument('-n', type=int, default=10,
+                        help='how many to keep per event (default 10)')
+    parser.add_argument('--indoor', action='store_true',
+                        help='score as indoor unless a row says otherwise')
+    parser.add_argument('--format', choices=('csv', 'jsonl'),
+                        help='input format if not by file extension')
+    parser.add_argument('--name', default='name',
+                        help='column with the athlete name (default name)')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='report rejected rows on stderr')
+    args = parser.parse_args(argv)
+
+    def on_error(row, e):
+        if args.verbose:
+            sys.stderr.write('skipped %r: %s\n' % (row, e))
+
+    tops = rank(args.files, args.n, 'IND' if args.indoor else 'OUT',
+                args.format, on_error)
+    for key in sorted(tops):
+        print(' '.join(key))
+        for i, r in enumerate(tops[key], 1):
+            print('%3d %5d %10s  %s' % (i, r.points, r.performance,
+                                        r.row.get(args.name, '')))
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
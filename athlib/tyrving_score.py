@@ -1,8 +1,7 @@
 __all__ = 'tyrving_score'
 
 import typing
-from athlib import parse_hms, normalize_gender, normalize_event_code, is_hand_timing
-from athlib.codes import PAT_RUN
+from athlib import parse_hms, normalize_gender, normalize_event_code, is_hand_timing, classify_event_code
 from typing import Union, Dict, Tuple
 
 class TyrvingCalculator:
@@ -82,7 +81,8 @@ class TyrvingCalculator:
 
 def tyrving_score(gender: str, age: int, event_code: str, perf: Union[int, float, str]) -> int:
     timing_kind='automatic'
-    if PAT_RUN.match(event_code):
+    info = classify_event_code(event_code)
+    if info and info.kind in ('hurdles', 'track', 'road', 'relay'):
         if is_hand_timing(perf):
             timing_kind = 'manual'
 
@@ -1,11 +1,9 @@
 """General athlib utility functions"""
-import sys, os, json
-from collections import OrderedDict
-import jsonschema
-import jsonschema.validators
-from jsonschema.validators import RefResolver as OriginalResolver
-from jsonschema.exceptions import SchemaError, ValidationError
-from typing import Any, Union, Dict, Optional, Type, Tuple, Match, List, TypeVar
+import sys, os, json, re, math
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from typing import Any, Union, Dict, Optional, Type, Tuple, Match, List, TypeVar, Iterable, Callable
+from array import array
 import builtins
 
 _rootdir = os.path.dirname(os.path.abspath(__file__))
@@ -13,15 +11,19 @@ _rootdir = os.path.normpath(os.path.join(_rootdir, '..'))
 
 from .codes import PAT_THROWS, PAT_JUMPS, PAT_RELAYS, PAT_HURDLES, PAT_TRACK, \
     PAT_LEADING_DIGITS, PAT_LEADING_FLOAT, PAT_PERF, PAT_LONG_SECONDS, PAT_EVENT_CODE, \
-    FIELD_EVENTS, MULTI_EVENTS, CUSTOM_EVENTS, FIELD_SORT_ORDER, PAT_RACES_FOR_DISTANCE
+    FIELD_EVENTS, MULTI_EVENTS, CUSTOM_EVENTS, FIELD_SORT_ORDER, PAT_RACES_FOR_DISTANCE, \
+    PAT_ROAD, PAT_MULTI, PAT_HIGHSCORING_EVENT, PAT_LOWSCORING_EVENT
 
 __all__ = """normalize_gender
             str2num
             parse_hms
+            parse_hms_many
             get_distance
             round_up_str_num
             format_seconds_as_time
+            format_seconds_as_times
             check_performance_for_discipline
+            check_performances
             discipline_sort_key
             text_discipline_sort_key
             sort_by_discipline
@@ -33,6 +35,10 @@ __all__ = """normalize_gender
             nativeStr
             check_event_code
             normalize_event_code
+            classify_event_code
+            EventInfo
+            event_code_cache_info
+            event_code_cache_clear
             is_hand_timing
             get_duration_event_time""".split()
 
@@ -85,26 +91,46 @@ def parse_hms(t: Union[int, float, str]) -> Union[int, float]:
         return t
 
     # Try : and ; separators
-    for sep in ':;':
-        if sep not in t:
-            continue
+    sep = ':' if ':' in t else ';' if ';' in t else None
+    if sep is None:
+        return _parse_seconds(t, t)
 
-        sec = 0
+    sec = 0
+    for s in t.split(sep):
+        sec *= 60
+        sec += _parse_seconds(s, t)
+    return sec
 
-        for s in t.split(sep):
-            sec *= 60
+def _parse_seconds(s: str, t: str) -> Union[int, float]:
+    """str2num(s) for a part of the time t
 
-            try:
-                sec += str2num(s)
-            except ValueError:
-                raise ValueError('cannot parse seconds from %s' % repr(t))
-
-        return sec
+    Plain digits with or without a point are converted directly; anything
+    else (spaces, signs, exponents) goes through str2num.
+    """
+    if s.isdecimal():
+        return int(s)
+    a, point, b = s.partition('.')
+    if point and (a.isdecimal() or not a) and (b.isdecimal() or not b) and (a or b):
+        return float(s)
     try:
-        return str2num(t)
+        return str2num(s)
     except ValueError:
         raise ValueError('cannot parse seconds from %s' % repr(t))
 
+def parse_hms_many(times: Iterable[Union[int, float, str]]) -> array:
+    """
+    Parse many times as parse_hms does, returning an array of float seconds.
+
+    >>> from .utils import parse_hms_many
+    >>> parse_hms_many(['10', '1:10', '1:1:10.1', 9.58])
+    array('d', [10.0, 70.0, 3670.1, 9.58])
+    """
+    return array('d', map(parse_hms, times))
+
+# event codes are few, so the functions parsing them remember their answers
+_CODE_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
 def get_distance(discipline: str) -> Optional[int]:
     """
     Return approx distance in metres, for sanity checking
@@ -220,24 +246,49 @@ def format_seconds_as_time(seconds: float, prec: int = 0) -> str:
     :param prec=0: precision for seconds
     :returns formatted string:
     """
-    if isinstance(prec,int) and 0<=prec<=3:
-        secs = int(seconds)
-        frac = seconds - secs
-        mins, secs = divmod(secs, 60)
-        hours, mins = divmod(mins, 60)
+    _check_time_prec(prec)
+    return _format_seconds(seconds, prec)
+
+def format_seconds_as_times(seq: Iterable[float], prec: int = 0) -> List[str]:
+    """format_seconds_as_time for each of many seconds, e.g. a results list
+
+    >>> from .utils import format_seconds_as_times
+    >>> format_seconds_as_times([9.58, 59.999, 3599.1], prec=2)
+    ['9.58', '1:00.00', '59:59.10']
+    """
+    _check_time_prec(prec)
+    return [_format_seconds(seconds, prec) for seconds in seq]
+
+def _check_time_prec(prec: int) -> None:
+    if not (isinstance(prec,int) and 0<=prec<=3):
+        raise ValueError("Precision must be 0, 1, 2 or 3 digits")
+
+def _format_seconds(seconds: float, prec: int) -> str:
+    secs = int(seconds)
+    frac = seconds - secs
+    mins, secs = divmod(secs, 60)
+    hours, mins = divmod(mins, 60)
+
+    # round the fraction up as round_up_str_num(repr(frac), prec) does, but
+    # in integers
+    e5 = _frac_e5(frac)
+    if e5 is not None:
+        q, rem = divmod(e5, _POW10[5-prec])
+        q += rem > 0
+        rup = q == _POW10[prec]
+        frac = '.%0*d' % (prec, 0 if rup else q) if prec else ''
+    else:
         frac = round_up_str_num(repr(frac),prec)
-        rup = frac[0]
+        rup = frac[0]!='0'
         frac = frac[1:]
-        if rup!='0':
-            secs += 1
-            if secs==60:
-                secs = 0
-                mins += 1
-                if mins==60:
-                    mins = 0
-                    hours += 1
-    else:
-        raise ValueError("Precision must be 0, 1, 2 or 3 digits")
+    if rup:
+        secs += 1
+        if secs==60:
+            secs = 0
+            mins += 1
+            if mins==60:
+                mins = 0
+                hours += 1
     if hours:
         t = "%d:%02d:%02d" % (hours, mins, secs)
     elif mins:
@@ -246,6 +297,22 @@ def format_seconds_as_time(seconds: float, prec: int = 0) -> str:
         t = "%d" % secs
     return t + frac
 
+_POW10 = (1, 10, 100, 1000, 10000, 100000)
+
+def _frac_e5(frac: float) -> Optional[int]:
+    """The first five decimals of repr(frac) as an int, without making the
+    string; None unless repr(frac) is 0.ddd (not negative or tiny)
+
+    n/100000 is the float nearest n 1e-5ths, and repr(frac) is on the same
+    side of it as frac, or exactly it if that is frac.
+    """
+    if type(frac) is int:
+        return 0 if frac == 0 else None
+    if type(frac) is not float or not (1e-4 <= frac < 1 or frac == 0 and math.copysign(1, frac) > 0):
+        return None
+    n = round(frac * 100000)
+    return n if frac >= n / 100000 else n - 1
+
 FIELD_EVENT_RECORDS_BY_GENDER : Dict [str, Dict[str, float]]= dict(
                         m = dict(
                                 HJ = 2.45,
@@ -291,180 +358,245 @@ def check_performance_for_discipline(
     Fix up and return what they typed in,  or raise errorKlass(default ValueError)
     """
     # print("checkperf %s %s" % (discipline, repr(textvalue)))
-    textvalue = textvalue.strip()
-
-    if discipline.lower() == "xc" and textvalue == "":
-        return textvalue
+    value, error = _performance_checker(discipline, gender, ulpc, prec)(textvalue)
+    if error is not None:
+        raise errorKlass(error)
+    return value
 
-    # fix up "," for the Frenchies
-    if "," in textvalue and "." not in textvalue:
-        textvalue = textvalue.replace(",", ".")
-
-    if ";" in textvalue:
-        textvalue = textvalue.replace(";", ':')
+def check_performances(
+    rows: Iterable[Tuple[str, ...]],
+    gender: str = 'all',
+    ulpc: float = 120/100.0,
+    prec: int = None
+) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+    """
+    Check many typed in performances, e.g. from an uploaded spreadsheet
 
+    rows are (discipline, textvalue) or (discipline, textvalue, gender).
+    Returns two lists in the order of the rows: the fixed up values (None
+    where there is an error) and the errors (None where the value is good),
+    as check_performance_for_discipline would return or raise them.  Values
+    which are not strings are converted with str; None counts as empty.
 
-    if PAT_RACES_FOR_DISTANCE.match(discipline):
+    >>> from .utils import check_performances
+    >>> check_performances([('100', '10.1'), ('LJ', '7,5'), ('HJ', '9.99')])
+    (['10.10', '7.50', None], [None, None, 'HJ(all) performance 9.99 seems too large as record is 2.45'])
+    """
+    checkers = {}
+    values = []
+    errors = []
+    for row in rows:
+        discipline, textvalue = row[0], row[1]
+        key = discipline, (row[2] if len(row) > 2 else gender)
+        check = checkers.get(key)
+        if check is None:
+            check = checkers[key] = _performance_checker(key[0], key[1], ulpc, prec)
+        if not isinstance(textvalue, str):
+            textvalue = '' if textvalue is None else str(textvalue)
         try:
-            distance = float(textvalue)
-            return str(distance)
-        except ValueError:
-            raise errorKlass("%s not valid.  Input a distance in metres"  % textvalue)
+            value, error = check(textvalue)
+        except ValueError as e:
+            # a few malformed times get past the checks and fail to convert
+            value, error = None, str(e)
+        values.append(value)
+        errors.append(error)
+    return values, errors
+
+def _performance_checker(
+    discipline: str,
+    gender: str = 'all',
+    ulpc: float = 120/100.0,
+    prec: int = None
+) -> Callable[[str], Tuple[Optional[str], Optional[str]]]:
+    """
+    Return a function which checks one typed in performance in this
+    discipline, returning the fixed up value and None, or None and the error
+    """
+    if PAT_RACES_FOR_DISTANCE.match(discipline):
+        kind = 'number'
+        number_error = "%s not valid.  Input a distance in metres"
+    elif discipline.upper() in CUSTOM_EVENTS:
+        kind = 'number'
+        number_error = "%s not valid.  Input a valid number e.g. '2.34'. This will be assumed to be seconds or metres"
+    elif discipline in FIELD_EVENTS:
+        kind = 'field'
+        record = field_event_record(discipline,gender)
+    elif discipline.upper() in MULTI_EVENTS:
+        kind = 'multi'
+    else:
+        kind = 'run'
+    xc = discipline.lower() == "xc"
 
-    if discipline.upper() in CUSTOM_EVENTS:
-        try:
-            distance = float(textvalue)
-            return str(distance)
-        except ValueError:
-            raise errorKlass("%s not valid.  Input a valid number e.g. '2.34'. This will be assumed to be seconds or metres"  % textvalue)
+    def check(textvalue: str) -> Tuple[Optional[str], Optional[str]]:
+        textvalue = textvalue.strip()
 
+        if xc and textvalue == "":
+            return textvalue, None
 
-    # this rejects long numbers. (e.g. metres in 24 hours) so must follow the above clause
-    if not PAT_PERF.match(textvalue):
-        raise errorKlass(
-            "Illegal numeric pattern.  Use digits, ':' and '.' only")
+        # fix up "," for the Frenchies
+        if "," in textvalue and "." not in textvalue:
+            textvalue = textvalue.replace(",", ".")
 
+        if ";" in textvalue:
+            textvalue = textvalue.replace(";", ':')
 
+        if kind == 'number':
+            try:
+                distance = float(textvalue)
+                return str(distance), None
+            except ValueError:
+                return None, number_error % textvalue
 
-    
+        # this rejects long numbers. (e.g. metres in 24 hours) so must follow the above clause
+        if not PAT_PERF.match(textvalue):
+            return None, "Illegal numeric pattern.  Use digits, ':' and '.' only"
 
+        if kind == 'field':
+            try:
+                distance = float(textvalue)
+            except ValueError:
+                return None, (
+                    "'%s' is not valid for length/height. Use "
+                    "metres/centimetres e.g. '2.34'" % textvalue
+                )
+            else:
+                if record and distance>record*ulpc:
+                    return None, '%s(%s) performance %s seems too large as record is %.2f' % (
+                        discipline, gender, textvalue, record)
+                return "%0.2f" % distance, None
+
+        elif kind == 'multi':
+            try:
+                points = int(textvalue)
+            except ValueError:
+                return None, (
+                    "'%s' is not a valid points value for multi-events"
+                    % textvalue)
+            if points > 9999:
+                return None, "Multi-events scores should be below 10000"
+            return str(points), None
 
-    if discipline in FIELD_EVENTS:
-        try:
-            distance = float(textvalue)
-        except ValueError:
-            raise errorKlass(
-                "'%s' is not valid for length/height. Use "
-                "metres/centimetres e.g. '2.34'" % textvalue
-            )
         else:
-            record = field_event_record(discipline,gender)
-            if record and distance>record*ulpc:
-                raise errorKlass('%s(%s) performance %s seems too large as record is %.2f' % (
-                    discipline, gender, textvalue, record))
-            return "%0.2f" % distance
+            return _check_run_performance(discipline, textvalue, prec)
+
+    return check
+
+def _check_run_performance(discipline: str, textvalue: str, prec: int = None) -> Tuple[Optional[str], Optional[str]]:
+    # It's a running distance.  format check.  Try to extract metres
+
+    distance = get_distance(discipline)
+
+    if textvalue.startswith("0:"):
+        textvalue = textvalue[2:]
+    if textvalue.startswith("00:"):
+        textvalue = textvalue[3:]
+
+    if distance and (distance <= 200) and (":" in textvalue) \
+            and ("." not in textvalue):
+        # print("fixing colon to stop ")
+        textvalue = textvalue.replace(":", ".")
+
+    if distance and (distance >= 800) and ("." in textvalue) and (":" not in textvalue):
+        # print "fixing stop to colon "
+        textvalue = textvalue.replace(".", ":")
+
+    if discipline in ["800", "1500", "3000"]:
+        if "." not in textvalue:
+            chunks = textvalue.split(":")
+            if len(chunks) == 3:
+                textvalue = chunks[0] + ':' + chunks[1] + "." + chunks[2]
+                # we got hours/mins/secs, should have been min/sec +
+                # fraction
+
+    # Brain surgery for the idiots who think 2.33 is a valid 800m time
+    # if expect_minutes and (':' not in textvalue) and ('.' in textvalue):
+    #     textvalue = textvalue.replace('.', ':')
+    # caught false positives
+    chunks = textvalue.split(":")
+
+    # The regex ensures we have 1, 2 or 3 chunks
+    if len(chunks) == 1:
+        hours = 0
+        minutes = 0
+        seconds = float(chunks[0])
+    elif len(chunks) == 2:
+        hours = 0
+        minutes = int(chunks[0])
+        seconds = float(chunks[1])
+    elif len(chunks) == 3:
+        hh, mm, ss = chunks
+        hours = int(hh)
+        minutes = int(mm)
+        seconds = float(ss)
+
+    if (minutes == 0) and (seconds >= 100):
+        return None, (
+            "Please use mm:ss or h:mm:ss for times above 99 seconds")
+
+    if distance == 400 and minutes > 45:
+        "63:40 instead of 63.40"
+        seconds = minutes + 0.01 * seconds
+        hours = 0
+        minutes = 0
+
+    duration = 3600 * hours + 60 * minutes + seconds
+    # print("duration: %0.2f seconds" % duration)
+
+    # do sanity checks.  Over 11 metres per second is pretty fishy for a
+    # sprint
+    if distance and duration:
+
+        velocity = distance * 1.0 / duration
+        # print('distance = %0.2d, duration = %d sec,
+        #        velocity = %0.2f m/s' % (distance, duration, velocity))
+        if distance <= 400:
+            if velocity > 11.0:
+                return None, (
+                    "%s too fast for %s, check the format" %
+                    (textvalue, discipline))
+        elif distance > 400:
+            if velocity > 10.0:
+                return None, (
+                    "%s too fast for %s, check the format" %
+                    (textvalue, discipline))
 
-    elif discipline.upper() in MULTI_EVENTS:
-        try:
-            points = int(textvalue)
-        except ValueError:
-            raise errorKlass(
-                "'%s' is not a valid points value for multi-events"
-                % textvalue)
-        if points > 9999:
-            raise errorKlass("Multi-events scores should be below 10000")
-        return str(points)
+        if velocity < 0.5:
+            return None, (
+                "%s too slow for %s, check the format" %
+                (textvalue, discipline))
 
     else:
-        # It's a running distance.  format check.  Try to extract metres
-
-        distance = get_distance(discipline)
-
-        if textvalue.startswith("0:"):
-            textvalue = textvalue[2:]
-        if textvalue.startswith("00:"):
-            textvalue = textvalue[3:]
-
-        if distance and (distance <= 200) and (":" in textvalue) \
-                and ("." not in textvalue):
-            # print("fixing colon to stop ")
-            textvalue = textvalue.replace(":", ".")
-
-        if distance and (distance >= 800) and ("." in textvalue) and (":" not in textvalue):
-            # print "fixing stop to colon "
-            textvalue = textvalue.replace(".", ":")
-
-        if discipline in ["800", "1500", "3000"]:
-            if "." not in textvalue:
-                chunks = textvalue.split(":")
-                if len(chunks) == 3:
-                    textvalue = chunks[0] + ':' + chunks[1] + "." + chunks[2]
-                    # we got hours/mins/secs, should have been min/sec +
-                    # fraction
-
-        # Brain surgery for the idiots who think 2.33 is a valid 800m time
-        # if expect_minutes and (':' not in textvalue) and ('.' in textvalue):
-        #     textvalue = textvalue.replace('.', ':')
-        # caught false positives
-        chunks = textvalue.split(":")
-
-        # The regex ensures we have 1, 2 or 3 chunks
-        if len(chunks) == 1:
-            hours = 0
-            minutes = 0
-            seconds = float(chunks[0])
-        elif len(chunks) == 2:
-            hours = 0
-            minutes = int(chunks[0])
-            seconds = float(chunks[1])
-        elif len(chunks) == 3:
-            hh, mm, ss = chunks
-            hours = int(hh)
-            minutes = int(mm)
-            seconds = float(ss)
-
-        if (minutes == 0) and (seconds >= 100):
-            raise errorKlass(
-                "Please use mm:ss or h:mm:ss for times above 99 seconds")
-
-        if distance == 400 and minutes > 45:
-            "63:40 instead of 63.40"
-            seconds = minutes + 0.01 * seconds
-            hours = 0
-            minutes = 0
-
-        duration = 3600 * hours + 60 * minutes + seconds
-        # print("duration: %0.2f seconds" % duration)
-
-        # do sanity checks.  Over 11 metres per second is pretty fishy for a
-        # sprint
-        if distance and duration:
-
-            velocity = distance * 1.0 / duration
-            # print('distance = %0.2d, duration = %d sec,
-            #        velocity = %0.2f m/s' % (distance, duration, velocity))
-            if distance <= 400:
-                if velocity > 11.0:
-                    raise errorKlass(
-                        "%s too fast for %s, check the format" %
-                        (textvalue, discipline))
-            elif distance > 400:
-                if velocity > 10.0:
-                    raise errorKlass(
-                        "%s too fast for %s, check the format" %
-                        (textvalue, discipline))
-
-            if velocity < 0.5:
-                raise errorKlass(
-                    "%s too slow for %s, check the format" %
-                    (textvalue, discipline))
-
+        if discipline.upper() == 'XC':
+            if not minutes:
+                return None, (
+                    "Please use mm:ss for minutes and seconds, not mm.ss")
+
+    if prec is None:
+        #use Andy's method
+        # Format consistently for output
+        if hours:
+            t = '%d:%02d:%05.2f' % (hours, minutes, seconds)
+        elif minutes:
+            t = '%d:%05.2f' % (minutes, seconds)
         else:
-            if discipline.upper() == 'XC':
-                if not minutes:
-                    raise errorKlass(
-                        "Please use mm:ss for minutes and seconds, not mm.ss")
-
-        if prec is None:
-            #use Andy's method
-            # Format consistently for output
-            if hours:
-                t = '%d:%02d:%05.2f' % (hours, minutes, seconds)
-            elif minutes:
-                t = '%d:%05.2f' % (minutes, seconds)
-            else:
-                t = '%0.2f' % seconds
+            t = '%0.2f' % seconds
+
+        # Strip trailing zeroes except for short ones
+        if len(t) > 5:
+            while t.endswith('0') and len(t) > 4:
+                t = t[0:-1]
+            if t.endswith('.'):
+                t = t[0:-1]
+        return t, None
+
+    return format_seconds_as_time(duration,prec), None
 
-            # Strip trailing zeroes except for short ones
-            if len(t) > 5:
-                while t.endswith('0') and len(t) > 4:
-                    t = t[0:-1]
-                if t.endswith('.'):
-                    t = t[0:-1]
-            return t
+_RUN_SORT_ORDER = dict(track=1, hurdles=2, relay=5)
 
-        return format_seconds_as_time(duration,prec)
+# position of each code in FIELD_SORT_ORDER
+_FIELD_SORT_INDEX = dict((c, i) for i, c in reversed(list(enumerate(FIELD_SORT_ORDER))))
 
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
 def discipline_sort_key(discipline: Optional[str]) -> Tuple[int, int, str]:
     """
     Return a tuple which will sort into programme order
@@ -476,43 +608,21 @@ def discipline_sort_key(discipline: Optional[str]) -> Tuple[int, int, str]:
         # Goes at the end
         return 6, 0, "?"
 
-    m = PAT_THROWS.search(discipline)
-    if m:
-        du = discipline.upper()
-        order = FIELD_SORT_ORDER.index(du[:3]) if du[:3] in FIELD_SORT_ORDER \
-                else FIELD_SORT_ORDER.index(du[:2])
-        return 4, order, discipline
+    info = classify_event_code(discipline)
+    kind = info.kind if info else None
 
-    m = PAT_HURDLES.search(discipline)
-    if m:
-        distance = int(m.group(1))
-        return 2, distance, discipline
-
-    m = PAT_JUMPS.search(discipline)
-    if m:
+    if kind in ('throw', 'jump'):
         du = discipline.upper()
-        order = FIELD_SORT_ORDER.index(du[:3]) if du[:3] in FIELD_SORT_ORDER \
-                else FIELD_SORT_ORDER.index(du[:2])
-        return 3, order, discipline
+        order = _FIELD_SORT_INDEX.get(du[:3])
+        if order is None:
+            order = _FIELD_SORT_INDEX.get(du[:2])
+            if order is None:
+                order = FIELD_SORT_ORDER.index(du[:2])  # raises as it always has
+        return (4 if kind == 'throw' else 3), order, discipline
 
-    m = PAT_RELAYS.search(discipline)
-    if m:
-        distance = int(m.group(2))
-        return 5, distance, discipline
-
-    # track last, so '100' doesn't match before '100H'
-    m = PAT_TRACK.search(discipline)
-    if m:
-        group1 = m.group(1)
-        # usually distance but might be MILE, 2MILE
-        if group1 == "MILE":
-            distance = 1609
-        elif group1.endswith("MILE"):
-            miles = int(group1[0]) # 2 miles, 6 miles historic on track
-            distance = 1609 * miles
-        else:
-            distance = int(m.group(1))
-        return 1, distance, discipline
+    # hurdles, then track, then relays; track distance might be MILE, 2MILE
+    if kind in _RUN_SORT_ORDER:
+        return _RUN_SORT_ORDER[kind], info.distance or 0, discipline
 
     # anything else sorts to end
     return 6, 0, discipline
@@ -523,22 +633,33 @@ def text_discipline_sort_key(discipline: str) -> str:
 
 T = TypeVar('T')
 
-def sort_by_discipline(stuff: List[T], attr: str = "discipline") -> List[T]:
-    "Sort dicts or objects into the normal athletics order"
+def sort_by_discipline(stuff: Iterable[T], attr: str = "discipline",
+                       key: Optional[Callable[[T], Optional[str]]] = None,
+                       inplace: bool = False) -> List[T]:
+    """Sort dicts or objects into the normal athletics order
 
-    sorter = []
-    for thing in stuff:
-        if isinstance(thing, dict):
-            disc = thing.get(attr, None)
-        else:
+    The discipline is the attr item of a dict or attribute of an object, or
+    key(thing) if key is given.  The sort is stable.  With inplace=True stuff,
+    which must then be a list, is sorted in place and returned rather than
+    copied.
+    """
+    if key is None:
+        def key(thing):
+            if isinstance(thing, dict):
+                return thing.get(attr, None)
             # assume object
-            disc = getattr(thing, attr, None)
-        priority = discipline_sort_key(disc)
-        sorter.append((priority, thing))
+            return getattr(thing, attr, None)
+    get = key
+
+    def sort_key(thing):
+        return discipline_sort_key(get(thing))
 
-    sorter.sort(key=lambda x: x[0])
-    return [thing for (priority, thing) in sorter]
+    if inplace:
+        stuff.sort(key=sort_key)
+        return stuff
+    return sorted(stuff, key=sort_key)
 
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
 def check_event_code(c: str) -> Optional[Match[str]]:
     return PAT_EVENT_CODE.match(c)
 
@@ -581,6 +702,7 @@ _gnorms = dict(
     btnum=_norm_kg, stnum=_norm_kg, gdtnum=_norm_kg,otnum=_norm_g,
     )
 
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
 def normalize_event_code(c : str) -> str:
     c = c.strip()   #remove excess whitespace
     m =  PAT_EVENT_CODE.match(c)
@@ -603,6 +725,104 @@ def normalize_event_code(c : str) -> str:
     return c.replace(' ','')
 
 
+def _named(name: str, pats: Tuple, *groups: str) -> str:
+    """The bodies of the anchored patterns pats as the group name, with the
+    first unnamed groups named as in groups"""
+    groups = list(groups)
+    body = '|'.join(p.pattern[4:-2] for p in pats)
+    body = re.sub(r'\((?!\?)', lambda m: '(?P<%s>' % groups.pop(0) if groups else '(', body)
+    return '(?P<%s>%s)' % (name, body)
+
+# All the event code patterns in one, tried in this order; the outer group
+# which matched is the kind of event.
+_PAT_EVENT_KIND = re.compile('^(?:%s)$' % '|'.join((
+    _named('throw', (PAT_THROWS,)),
+    _named('hurdles', (PAT_HURDLES,), 'hdistance', 'h_sfx', 'h_hi', 'h_hh'),
+    _named('jump', (PAT_JUMPS,)),
+    _named('relay', (PAT_RELAYS,), 'legs', 'leg'),
+    _named('track', (PAT_TRACK,)),
+    _named('road', (PAT_ROAD,)),
+    _named('multi', (PAT_MULTI,)),
+    _named('duration', (PAT_RACES_FOR_DISTANCE,)),
+    _named('custom', (PAT_HIGHSCORING_EVENT, PAT_LOWSCORING_EVENT)),
+    )))
+_THROW_WEIGHTS = ('dtnum', 'jtnum', 'htnum', 'spnum', 'wtnum', 'swtnum', 'btnum', 'stnum', 'gdtnum', 'otnum')
+
+EventInfo = namedtuple('EventInfo', 'code kind distance legs hurdle_height weight')
+EventInfo.__doc__ = """What an event code means, from classify_event_code
+
+code            the normalized event code
+kind            throw, hurdles, jump, relay, track, road, multi, duration or custom
+distance        the distance in the code (per leg for relays; miles as metres)
+legs            the number of legs of a relay
+hurdle_height   in cm, if given
+weight          the normalized implement weight, if given
+"""
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def classify_event_code(c: str) -> Optional[EventInfo]:
+    """
+    Return an EventInfo for the event code, or None if it is not one.
+
+    >>> from .utils import classify_event_code
+    >>> classify_event_code('110H')
+    EventInfo(code='110H', kind='hurdles', distance=110, legs=None, hurdle_height=None, weight=None)
+    >>> classify_event_code('4x400').kind, classify_event_code('4x400').legs
+    ('relay', 4)
+    >>> classify_event_code('jt800').weight, classify_event_code('80H76.2cm').hurdle_height
+    ('800', 76.2)
+    >>> classify_event_code('xyz') is None
+    True
+    """
+    m = _PAT_EVENT_KIND.match(c)
+    if not m:
+        return None
+    kind = m.lastgroup
+    g = m.groupdict()
+    distance = legs = hurdle_height = weight = None
+    if kind == 'hurdles':
+        distance = int(g['hdistance'])
+    elif kind == 'relay':
+        legs = int(g['legs'])
+        if g['leg'].isdigit():
+            distance = int(g['leg'])
+    elif kind == 'track':
+        meters = g['meters']
+        if meters is None:
+            pass
+        elif meters.endswith('MILE'):
+            distance = 1609 * int(meters[:-4] or 1)
+        else:
+            distance = int(meters)
+    elif kind == 'road':
+        distance = get_distance(c)
+    elif kind == 'throw':
+        for k in _THROW_WEIGHTS:
+            v = (g[k] or '').strip()
+            if v:
+                weight = _gnorms[k](v) if k in _gnorms else v
+                break
+    if kind in ('hurdles', 'track'):
+        # hurdle heights are in cm, or 33 or 36 (inches)
+        hh, hi = (g['h_hh'], g['h_hi']) if kind == 'hurdles' else (g['hhh'], g['hhi'])
+        if hh:
+            hurdle_height = float(hh[:-2])
+        elif hi:
+            hurdle_height = round(2.54 * int(hi), 1)
+    return EventInfo(normalize_event_code(c), kind, distance, legs, hurdle_height, weight)
+
+_code_caches = (normalize_event_code, check_event_code, get_distance, classify_event_code,
+                discipline_sort_key)
+
+def event_code_cache_info() -> Dict[str, Any]:
+    "The hits, misses and size of each event code cache, by function name"
+    return dict((f.__name__, f.cache_info()) for f in _code_caches)
+
+def event_code_cache_clear() -> None:
+    "Empty the event code caches"
+    for f in _code_caches:
+        f.cache_clear()
+
 lexec = getattr(builtins, 'exec')
 def isStr(o):
     '''return true if argument is a string type'''
@@ -632,17 +852,37 @@ def localpath(relpath: str, pstart: int = 0) -> str:
                     break
     return relpath
 
-class LocalFileResolver(OriginalResolver):
+_jsonschema = None
+def _get_jsonschema():
+    """Import jsonschema when it is first needed
 
-    def resolve_from_url(self, url: str) -> str:
-        if url.startswith("file:///"):
-            relpath = localpath(url[8:].rstrip('#'),1).replace(os.sep,'/')
-            url = ("file:///%s/%s" if sys.platform ==
-                   'win32' else 'file://%s/%s') % (_rootdir, relpath)
-        return super(LocalFileResolver, self).resolve_from_url(url)
-
-# Monkeypatch jsonschema to resolve local, relative urls.
-jsonschema.validators.RefResolver = LocalFileResolver
+    Only schema validation needs it, so plain import athlib does not pay for it.
+    """
+    global _jsonschema, LocalFileResolver
+    if _jsonschema is None:
+        import jsonschema
+        import jsonschema.validators
+        OriginalResolver = jsonschema.validators.RefResolver
+
+        class LocalFileResolver(OriginalResolver):
+
+            def resolve_from_url(self, url: str) -> str:
+                if url.startswith("file:///"):
+                    relpath = localpath(url[8:].rstrip('#'),1).replace(os.sep,'/')
+                    url = ("file:///%s/%s" if sys.platform ==
+                           'win32' else 'file://%s/%s') % (_rootdir, relpath)
+                return super(LocalFileResolver, self).resolve_from_url(url)
+
+        # Monkeypatch jsonschema to resolve local, relative urls.
+        jsonschema.validators.RefResolver = LocalFileResolver
+        _jsonschema = jsonschema
+    return _jsonschema
+
+def __getattr__(name: str) -> Any:
+    if name == 'LocalFileResolver':
+        _get_jsonschema()
+        return globals()[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 R = TypeVar('R')
 def _add_to_cache(c: Dict[R, T], t: R, v: T, maxlen: int = 20) -> T:
@@ -654,9 +894,13 @@ def _add_to_cache(c: Dict[R, T], t: R, v: T, maxlen: int = 20) -> T:
 
 _schema_valid_cache = dict()
 def schema_valid(schema_file : str,  # should be relative path
-                 validator=jsonschema.Draft3Validator,
+                 validator=None,
                  expect_failure: bool = False) -> bool:
-    """Test that schema is itself valid, using a jsonschema validator"""
+    """Test that schema is itself valid, using a jsonschema validator
+    (default jsonschema.Draft3Validator)"""
+    jsonschema = _get_jsonschema()
+    if validator is None:
+        validator = jsonschema.Draft3Validator
 
     t = (schema_file,validator)
     if t in _schema_valid_cache:
@@ -667,7 +911,7 @@ def schema_valid(schema_file : str,  # should be relative path
         try:
             validator.check_schema(schema)
             return _add_to_cache(_schema_valid_cache, t, True)
-        except SchemaError as e:
+        except jsonschema.exceptions.SchemaError as e:
             if not expect_failure:
                 print(e)
                 return _add_to_cache(_schema_valid_cache, t, False)
@@ -679,6 +923,7 @@ def schema_valid(schema_file : str,  # should be relative path
 _valid_against_schema_cache = dict()
 def valid_against_schema(json_file: str, schema_file: str, expect_failure: bool = False) -> bool:
     """Test that JSON file valid against a schema"""
+    jsonschema = _get_jsonschema()
     t = (json_file,schema_file)
     if t in _valid_against_schema_cache:
         return _valid_against_schema_cache[t]
@@ -691,7 +936,7 @@ def valid_against_schema(json_file: str, schema_file: str, expect_failure: bool
             try:
                 jsonschema.validate(json_data, schema)
                 return _add_to_cache(_valid_against_schema_cache,t,True)
-            except ValidationError as e:
+            except jsonschema.exceptions.ValidationError as e:
                 if not expect_failure:
                     print(e)
                     return _add_to_cache(_valid_against_schema_cache,t,False)
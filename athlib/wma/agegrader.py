@@ -1,54 +1,248 @@
 import json
 import re
 import os
+import struct
+import sys
+import threading
 
+from array import array
+from bisect import bisect_left
 from collections import namedtuple
+from functools import lru_cache
 
-from ..utils import str2num, normalize_gender, parse_hms, get_distance
-from ..codes import PAT_THROWS, PAT_JUMPS, PAT_TRACK, PAT_ROAD
+from ..utils import str2num, normalize_gender, parse_hms, get_distance, classify_event_code
+from .bindata import load_compiled, json_signature, is_current, write_atomic
 
 __all__ = ('AgeGrader',)
 
 road_info = namedtuple('road_info', 'code distance standard factors')
 
+# per gender lookup structures compiled from a loaded table
+#   rows: event code -> row number
+#   runs_start: row number of the first run ("50"); runs follow field and walks
+#   distances: running maximum of the km distances from runs_start onwards
+table_index = namedtuple('table_index', 'table rows runs_start distances')
+
+# results of the row and age searches; fx/ax and fx1/ax1 are the rows/ages
+# either side and pfac/page the fraction of the way from one to the other
+row_lookup = namedtuple('row_lookup', 'fx fx1 pfac')
+age_lookup = namedtuple('age_lookup', 'ax ax1 page')
+
+# header of a saved factor matrix: magic, byte order of the doubles ('<' or
+# '>'), the json's size, mtime (ns) and crc32, and the rows per gender
+_MATRIX_MAGIC = b'ATHWMAF1'
+_MATRIX_HEADER = struct.Struct('<8sc7xQqIII')
+
+# classify_event_code kinds to the kinds of event in the WMA tables
+_AGE_GRADE_KINDS = dict(throw='throw', jump='jump', hurdles='track', track='track', road='road')
+
 
 class AgeGrader(object):
     """
     We implement an object to cache the data used for lookups.
 
-    end users will appear to be calling a function.
+    end users will appear to be calling a function.  Once the data is
+    loaded nothing is written to the instance, so one grader can be
+    shared between threads.
     """
     min_age = 35
     max_age = 100
     data_file_name = "wma-data-2023.json"
     text_columns = 0,
-    event_column = 0
     _data = None
+    _index = None
+    _matrix = None
+    _load_lock = threading.Lock()
+    dense = False
+
+    cached_methods = 'calculate_factor', 'world_best'
 
-    def __init__(self, year="2023"):
+    def __init__(self, year="2023", cache_size=None, dense=False):
         # if year not in ["2015", "2023"]:
         #     raise ValueError("No age grade data for %s" % year) 
         self.data_file_name = "wma-data-%s.json" % year
+        self.dense = dense
+        self.set_cache_size(cache_size)
+
+    def set_cache_size(self, cache_size):
+        """Memoize factors and world bests in LRU caches of this size
+
+        Caching is off by default; pass None or 0 to turn it off again.
+        Any existing cache is discarded.
+        """
+        for name in self.cached_methods:
+            self.__dict__.pop(name, None)
+        if cache_size:
+            for name in self.cached_methods:
+                setattr(self, name, lru_cache(maxsize=cache_size)(getattr(self, name)))
+
+    def cache_info(self):
+        """Return a dict of hit/miss statistics for each cached method
+
+        The dict is empty if caching is off.
+        """
+        return dict((name, self.__dict__[name].cache_info())
+                    for name in self.cached_methods if name in self.__dict__)
+
+    def cache_clear(self):
+        "Empty the caches, if any"
+        for name in self.cached_methods:
+            if name in self.__dict__:
+                self.__dict__[name].cache_clear()
 
     def get_data(self):
         """Defer this until the first call, so we can bubble a function up to
         the top of the package
+
+        A compiled copy of the json (see athlib.wma.bindata) is memory
+        mapped instead of parsing the json, if there is an up to date one.
         """
         if not self._data:
-            codedir = os.path.dirname(__file__)
-            self.data_path = os.path.join(codedir, self.data_file_name)
-
-            with open(self.data_path, 'r') as f:
-                self._data = json.load(f)
+            with self._load_lock:
+                if not self._data:
+                    codedir = os.path.dirname(__file__)
+                    self.data_path = os.path.join(codedir, self.data_file_name)
+
+                    data = load_compiled(self.data_path)
+                    if data is None:
+                        with open(self.data_path, 'r') as f:
+                            data = json.load(f)
+                    self._index = dict((g, self._compile_table(data[g])) for g in 'mf')
+                    self._data = data
 
         return self._data
 
     @property
-    def _all_event_codes(self):
+    def factor_matrix_path(self):
+        "Where the dense factor matrix is saved, next to the json data"
+        codedir = os.path.dirname(__file__)
+        return os.path.join(codedir, os.path.splitext(self.data_file_name)[0] + '-factors.bin')
+
+    def get_factor_matrix(self):
+        """Return the dense factor matrix, loading or building it on first use
+
+        This is a dict of gender to array('d') holding the factor for every
+        table row (in table order) and every whole age from the first to the
+        last tabulated age.  Factors which cannot be calculated are NaN.
+        """
+        if self._matrix is None:
+            data = self.get_data()
+            with self._load_lock:
+                if self._matrix is None:
+                    self._matrix = (self._load_factor_matrix(data)
+                                    or self._build_factor_matrix(data))
+        return self._matrix
+
+    def _matrix_sizes(self, data):
+        ages = data['ages']
+        n = ages[-1] - ages[0] + 1
+        return n, dict((g, len(data[g]) * n) for g in 'mf')
+
+    def _build_factor_matrix(self, data):
+        ages = data['ages']
+        matrix = {}
+        for g in 'mf':
+            table = data[g]
+            m = array('d')
+            for fx in range(len(table)):
+                for age in range(ages[0], ages[-1] + 1):
+                    try:
+                        m.append(self._row_factor(table, fx, self.find_age(age, ages)))
+                    except TypeError:
+                        # missing factors in the table
+                        m.append(float('nan'))
+            matrix[g] = m
+        return matrix
+
+    def _load_factor_matrix(self, data):
+        "Return the saved matrix if it is there, made from the json as it is now and the right size"
+        path = self.factor_matrix_path
+        n, sizes = self._matrix_sizes(data)
+        m = array('d')
+        try:
+            with open(path, 'rb') as f:
+                magic, order, size, mtime, crc, nm, nf = _MATRIX_HEADER.unpack(
+                        f.read(_MATRIX_HEADER.size))
+                if (magic != _MATRIX_MAGIC or order not in (b'<', b'>')
+                        or (nm * n, nf * n) != (sizes['m'], sizes['f'])
+                        or not is_current(self.data_path, (size, mtime, crc))):
+                    return None
+                m.fromfile(f, sizes['m'] + sizes['f'])
+                if f.read(1):
+                    return None
+        except (OSError, EOFError, struct.error):
+            return None
+        if order != (b'<' if sys.byteorder == 'little' else b'>'):
+            m.byteswap()
+        return dict(m=m[:sizes['m']], f=m[sizes['m']:])
+
+    def save_factor_matrix(self, path=None):
+        """Write the dense factor matrix next to the json data (or to path)
+
+        The file records the byte order and the json it was made from, and
+        is ignored once that json changes.
+        """
+        matrix = self.get_factor_matrix()
         data = self.get_data()
+        if path is None:
+            path = self.factor_matrix_path
+        n = self._matrix_sizes(data)[0]
+        header = _MATRIX_HEADER.pack(_MATRIX_MAGIC, b'<' if sys.byteorder == 'little' else b'>',
+                                     *json_signature(self.data_path),
+                                     len(matrix['m']) // n, len(matrix['f']) // n)
+        write_atomic(path, header + matrix['m'].tobytes() + matrix['f'].tobytes())
+        return path
+
+    def _dense_factor(self, gender, age, event):
+        "The precomputed factor or None if it is not in the matrix"
+        matrix = self._matrix or self.get_factor_matrix()
+        ages = self._data['ages']
+        try:
+            a = int(age)
+        except (TypeError, ValueError):
+            return None
+        j = a - ages[0]
+        if a != age or j < 0 or a > ages[-1]:
+            return None
+        fx = self._index[gender].rows.get(event)
+        if fx is None:
+            return None
+        fac = matrix[gender][fx * (ages[-1] - ages[0] + 1) + j]
+        return None if fac != fac else fac
+
+    @staticmethod
+    def _compile_table(table):
+        """Build the event code and distance lookups for one table
 
-        return list(set([t[self.event_column] for T in (
-            data['m'], data['f']) for t in T]))
+        The distances from the first run onwards are not quite in order
+        (track, then road) so we keep their running maximum; bisecting that
+        finds the same row as scanning for the first distance not less than
+        the one we want.
+        """
+        rows = {}
+        for i, row in enumerate(table):
+            rows.setdefault(row[0], i)
+        runs_start = rows.get("50")
+        distances = []
+        if runs_start is not None:
+            d = None
+            for row in table[runs_start:]:
+                d = row[1] if d is None or row[1] > d else d
+                distances.append(d)
+        return table_index(table, rows, runs_start, distances)
+
+    def _table_index(self, table):
+        self.get_data()
+        for index in self._index.values():
+            if index.table is table:
+                return index
+        return self._compile_table(table)
+
+    @property
+    def _all_event_codes(self):
+        self.get_data()
+
+        return list(set([ec for index in self._index.values() for ec in index.rows]))
 
     @staticmethod
     def _check_table_column(table, x, func):
@@ -61,10 +255,8 @@ class AgeGrader(object):
         >>> AgeGrader()._check_patterns()
         """
         for ec in self._all_event_codes:
-            for p in (PAT_THROWS, PAT_JUMPS, PAT_TRACK, PAT_ROAD):
-                if p.match(ec):
-                    break
-            else:
+            info = classify_event_code(ec)
+            if not (info and info.kind in _AGE_GRADE_KINDS):
                 print('could not match %s' % ec)
 
         nuc = []
@@ -85,14 +277,11 @@ class AgeGrader(object):
 
     @staticmethod
     def event_code_to_kind(code):
-        for n, p in (('throw', PAT_THROWS),
-                     ('jump', PAT_JUMPS),
-                     ('track', PAT_TRACK),
-                     ('road', PAT_ROAD)):
-            if p.match(code):
-                return n
-
-        raise ValueError('could not find event kind for code %r' % code)
+        info = classify_event_code(code)
+        kind = _AGE_GRADE_KINDS.get(info.kind) if info else None
+        if kind is None:
+            raise ValueError('could not find event kind for code %r' % code)
+        return kind
 
     @staticmethod
     def normalize_gender(gender):
@@ -115,6 +304,11 @@ class AgeGrader(object):
 
         gender = self.normalize_gender(gender)
 
+        if self.dense:
+            fac = self._dense_factor(gender, age, event)
+            if fac is not None:
+                return fac
+
         # Which table we're using
         data = self.get_data()
         table = data[gender]
@@ -122,22 +316,22 @@ class AgeGrader(object):
         nt = len(table)
 
 
-        self.find_age(age, ages)
+        al = self.find_age(age, ages)
 
         try:
-            self.find_row_by_event(event,
-                                   table,
-                                   label='wma.%s' % (gender))
+            fx = self.find_row_by_event(event,
+                                        table,
+                                        label='wma.%s' % (gender))
         except ValueError:
             # parse event code and get distance
             distance = get_distance(event)
             # print("finding row by distance %s" % distance)
-            self.find_row_by_distance(distance,
-                                      table,
-                                      label='wma.%s' % (gender))
+            rl = self.find_row_by_distance(distance,
+                                           table,
+                                           label='wma.%s' % (gender))
             # we have rows above and below.
-            event_shorter = table[self._fx][0]
-            event_longer = table[self._fx1][0]
+            event_shorter = table[rl.fx][0]
+            event_longer = table[rl.fx1][0]
             # print(f"Longer = {event_longer}")
             # print(f"Shorter = {event_shorter}")
             factor_shorter = self.calculate_factor(gender, age, event_shorter)
@@ -163,18 +357,21 @@ class AgeGrader(object):
         # for a known event, is all this interpolation of ages and distances needed?
         # AR 2024
 
-        fx = self._fx
-        fx1 = self._fx1
-        pfac = self._pfac
-        ax = self._ax
-        ax1 = self._ax1
-        page = self._page
-        FX = table[fx][3:]
-        FX1 = table[fx1][3:]
-        fac = FX[ax]
-        faca = FX[ax1]
-        fac1 = FX1[ax]
-        fac1a = FX1[ax1]
+        return self._row_factor(table, fx, al)
+
+    @staticmethod
+    def _row_factor(table, fx, al):
+        "Interpolate the factor between ages in row fx of table"
+        ax, ax1, page = al
+        fx1 = fx
+        pfac = 0
+        # factors start in the fourth column
+        FX = table[fx]
+        FX1 = table[fx1]
+        fac = FX[3 + ax]
+        faca = FX[3 + ax1]
+        fac1 = FX1[3 + ax]
+        fac1a = FX1[3 + ax1]
         fac = (
                 (1 - pfac) * ((page * faca) + ((1 - page) * fac)) +
                 (pfac * ((page * fac1a) + ((1 - page) * fac1)))
@@ -183,32 +380,27 @@ class AgeGrader(object):
         return fac
 
     def find_row_by_event(self, event, table, label=''):
-        for i, row in enumerate(table):
-            if row[0] == event:
-                self._fx = self._fx1 = i
-                self._pfac = 0
-                return i
+        "Return the row number of this event or raise ValueError"
+        i = self._table_index(table).rows.get(event)
+        if i is not None:
+            return i
 
         raise ValueError('cannot locate event %s in %s' % (repr(event), label))
 
     def find_row_by_distance(self, dist, table, label=''):
+        "Return a row_lookup for the runs either side of dist metres"
         # second item in each row is the distance in metres
 
 
         d = 0.001 * dist
-        i = 0
         x = 1
         nt = len(table)
 
         # skip past field and walks, we know runs are at the end
-        while table[i][0] != "50":
-            i += 1
-
-        try:
-            while i < nt and table[i][x] < d:
-                i += 1
-        except TypeError:
-            raise
+        index = self._table_index(table)
+        if index.runs_start is None:
+            raise ValueError('cannot locate running distances in %s' % label)
+        i = index.runs_start + bisect_left(index.distances, d)
 
         if i == 0:
             pfac = fx = fx1 = 0
@@ -220,11 +412,10 @@ class AgeGrader(object):
         else:
             fx = fx1 = nt - 1
             pfac = 0
-        self._fx = fx
-        self._fx1 = fx1
-        self._pfac = pfac
+        return row_lookup(fx, fx1, pfac)
 
     def find_age(self, age, ages, interpolate=True):
+        "Return an age_lookup for the tabulated ages either side of age"
         if not age:
             age = 29
         na = len(ages)
@@ -241,12 +432,10 @@ class AgeGrader(object):
             page = (float(age - ages[ax]) /
                     (ages[ax1] - ages[ax])) if interpolate else 0
         else:
-            ax = ax1 = nt - 1
+            ax = ax1 = na - 1
             page = 0
 
-        self._ax = ax
-        self._ax1 = ax1
-        self._page = page
+        return age_lookup(ax, ax1, page)
 
     def world_best(self, gender, event):
         "The relevant world-record performance on the date stats were compiled"
@@ -259,17 +448,17 @@ class AgeGrader(object):
             return world_best
         except ValueError:
             distance = get_distance(event)
-            self.find_row_by_distance(distance,
-                                      table,
-                                      label='wma.%s' % (gender))
+            rl = self.find_row_by_distance(distance,
+                                           table,
+                                           label='wma.%s' % (gender))
             # find the speeds of the previous and later bests in m/sec
-            shorter_row = table[self._fx]
-            longer_row = table[self._fx1]
+            shorter_row = table[rl.fx]
+            longer_row = table[rl.fx1]
             v_shorter_best = shorter_row[1] * 1000 / shorter_row[2]
             v_longer_best = longer_row[1] * 1000 / longer_row[2]
 
             # average in proportions
-            v_averaged = v_longer_best + ((1 - self._pfac) * (v_shorter_best - v_longer_best))
+            v_averaged = v_longer_best + ((1 - rl.pfac) * (v_shorter_best - v_longer_best))
 
             # print("speed between ", v_longer_best, "and", v_shorter_best)
             world_best = distance / v_averaged
@@ -298,20 +487,7 @@ class AgeGrader(object):
         # This works for jumps/throws too, as they are floats
         float_performance = parse_hms(performance)
 
-        event = event.upper()
-        if event[-1] == 'H' and event not in ('LH', 'SH', '60H'):
-            if int(event[:-1]) <= 110:
-                event = 'SH'
-            elif int(event[:-1]) >= 200:
-                event = 'LH'
-            else:
-                raise ValueError(f'Event {event} looks like hurdles, but is not a standard distance so not supported')
-        elif event in ['2000SC', '3000SC']:
-            # Generalise to steeplechase for championship steeple distances
-            event = 'SC'
-        elif len(event) > 2 and event[:2] in ['DT', 'HT', 'JT', 'SP', 'WT']:
-            # Chop off weights from throw event codes
-            event = event[:2]
+        event = self._age_grade_event(event)
         world_best = self.world_best(gender, event)
         age_factor = self.calculate_factor(gender, age, event)
         age_group_best = world_best * 1.0 / age_factor
@@ -333,13 +509,73 @@ class AgeGrader(object):
 
         return age_grade
 
+    def calculate_age_grades(self, genders, ages, events, performances):
+        """Return a list of age grades for many results at once.
+
+        The arguments are parallel sequences (lists, tuples or numpy arrays),
+        one item per result, as found in a parkrun or road race file.  Rows
+        are grouped by (gender, event) so the world best and event kind are
+        worked out once per group, and each distinct age once per group.
+        The grades are identical to calling calculate_age_grade on each row.
+
+        >>> from .agegrader import AgeGrader
+        >>> ag=AgeGrader()
+        >>> ["%0.4f" % g for g in ag.calculate_age_grades(['m', 'f'], [50, 50], ['5K', '5K'], ['16:23', '18:00'])]
+        ['0.8917', '0.9159']
+        """
+        n = len(genders)
+        if not (len(ages) == len(events) == len(performances) == n):
+            raise ValueError('calculate_age_grades needs sequences of equal length')
+
+        groups = {}
+        for i, key in enumerate(zip(genders, events)):
+            groups.setdefault(key, []).append(i)
+
+        grades = [None] * n
+        for (gender, event), rows in groups.items():
+            event = self._age_grade_event(event)
+            world_best = self.world_best(gender, event)
+            timed = self.event_code_to_kind(event) in ['road', 'track']
+            factors = {}
+            for i in rows:
+                age = ages[i]
+                age_factor = factors.get(age)
+                if age_factor is None:
+                    age_factor = factors[age] = self.calculate_factor(gender, age, event)
+                age_group_best = world_best * 1.0 / age_factor
+                float_performance = parse_hms(performances[i])
+                if timed:
+                    grades[i] = age_group_best / float_performance
+                else:
+                    grades[i] = float_performance / age_group_best
+        return grades
+
+    @staticmethod
+    def _age_grade_event(event):
+        "Map an event code onto the row used for age grading it"
+        event = event.upper()
+        if event[-1] == 'H' and event not in ('LH', 'SH', '60H'):
+            if int(event[:-1]) <= 110:
+                event = 'SH'
+            elif int(event[:-1]) >= 200:
+                event = 'LH'
+            else:
+                raise ValueError(f'Event {event} looks like hurdles, but is not a standard distance so not supported')
+        elif event in ['2000SC', '3000SC']:
+            # Generalise to steeplechase for championship steeple distances
+            event = 'SC'
+        elif len(event) > 2 and event[:2] in ['DT', 'HT', 'JT', 'SP', 'WT']:
+            # Chop off weights from throw event codes
+            event = event[:2]
+        return event
+
 
 class AthlonsAgeGrader(AgeGrader):
     text_columns = 0, 2
-    event_column = 2
     
-    def __init__(self, data_file_name="wma-athlons-data.json"):
+    def __init__(self, data_file_name="wma-athlons-data.json", cache_size=None):
         self.data_file_name = data_file_name
+        self.set_cache_size(cache_size)
 
     def calculate_factor(self, gender, age, event):
         """Work out 'slowdown factor' for a geezer of this
@@ -375,9 +611,9 @@ class AthlonsAgeGrader(AgeGrader):
         ages = data['ages']
 
         # We must match an event exactly
-        self.find_row_by_event(event,
-                               table,
-                               label='wma-athlons.%s' % (gender))
-        self.find_age(int(age // 5) * 5, ages, interpolate=False)
-        fac = table[self._fx][self._ax1]
+        fx = self.find_row_by_event(event,
+                                    table,
+                                    label='wma-athlons.%s' % (gender))
+        al = self.find_age(int(age // 5) * 5, ages, interpolate=False)
+        fac = table[fx][al.ax1]
         return fac
@@ -0,0 +1,230 @@
+"""Compile the WMA json tables into a compact binary file.
+
+Parsing the json costs a noticeable amount on every process start.  The
+compiled file is memory mapped and turned back into the same lists of rows
+the json gives, using array rather than a parser, in about half the time.
+The rows are ordinary lists, so lookups afterwards cost exactly what they
+do after reading the json.  AgeGrader.get_data uses
+the compiled file when it is present, readable and made from the json as it
+is now, otherwise it reads the json.  The json's size and modification time
+are recorded to tell that cheaply; its crc32 is only checked if the time
+differs, e.g. after copying the files.
+
+Run this to (re)build the compiled files next to the json ones:
+
+    python -m athlib.wma.bindata
+
+Each distinct number is stored once, in a palette, and each cell of the
+tables is a uint16 index into it, so the file is well under the size of the
+json.  The layout is little-endian throughout:
+
+    header      magic, json size, json mtime (ns), json crc32,
+                number of ages, number of tables, number of floats,
+                number of ints
+    ages        int32 per age
+    palette     double per float, then int32 per int; None follows them
+    per table   gender, rows, columns, length of codes
+                event codes joined by newlines (utf8)
+                uint16 palette index per cell, row by row, after the code
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+
+__all__ = ('compile_data', 'compile_all', 'load_data', 'load_compiled', 'compiled_path',
+           'json_signature', 'is_current', 'write_atomic')
+
+MAGIC = b'ATHWMA3\0'
+HEADER = struct.Struct('<8sQqIIIII')
+TABLE = struct.Struct('<4sIII')
+GENDERS = 'm', 'f'
+# wma-athlons-data.json is too small for compiling to gain anything
+DATA_FILES = 'wma-data-2015.json', 'wma-data-2023.json'
+INT32 = -2**31, 2**31
+
+
+def _little(typecode, values):
+    "values as little-endian bytes of array typecode"
+    a = array(typecode, values)
+    if sys.byteorder != 'little':
+        a.byteswap()
+    return a.tobytes()
+
+
+def compiled_path(json_path):
+    "The compiled file which goes with this json file"
+    return os.path.splitext(json_path)[0] + '.bin'
+
+
+def json_signature(json_path, raw=None):
+    """Return (size, mtime in ns, crc32) of a json file, to record in files made from it
+
+    raw is the file's content if it has already been read.
+    """
+    if raw is None:
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+    return len(raw), os.stat(json_path).st_mtime_ns, zlib.crc32(raw)
+
+
+def is_current(json_path, signature):
+    """Is signature (as from json_signature) that of json_path as it is now?
+
+    Only the size and time are looked at unless the time differs.  If the
+    json is not there at all whatever was made from it is trusted.
+    """
+    size, mtime, crc = signature
+    try:
+        st = os.stat(json_path)
+        if st.st_size != size:
+            return False
+        if st.st_mtime_ns == mtime:
+            return True
+        with open(json_path, 'rb') as f:
+            return zlib.crc32(f.read()) == crc
+    except OSError:
+        return True
+
+
+def write_atomic(path, data):
+    """Write data to path by way of a temporary file in the same directory
+
+    Readers, including any which have the old file mapped, never see a
+    partly written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                               prefix=os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def compile_data(json_path, bin_path=None):
+    "Write the compiled form of one WMA json file and return its path"
+    import json
+    with open(json_path, 'rb') as f:
+        raw = f.read()
+    data = json.loads(raw.decode('utf8'))
+    if bin_path is None:
+        bin_path = compiled_path(json_path)
+
+    # 1 and 1.0 are both in the tables and must stay apart
+    cells = [(isinstance(v, int), v) for g in GENDERS for row in data[g]
+             for v in row[1:] if v is not None]
+    floats = sorted(set(v for is_int, v in cells if not is_int))
+    ints = sorted(set(v for is_int, v in cells if is_int))
+    if not all(INT32[0] <= v < INT32[1] for v in ints):
+        raise ValueError('%s: the ints do not fit in int32' % json_path)
+    palette = dict(((False, v), i) for i, v in enumerate(floats))
+    palette.update(((True, v), len(floats) + i) for i, v in enumerate(ints))
+    null = len(palette)
+    if null >= 2**16:
+        raise ValueError('%s: too many different numbers' % json_path)
+
+    ages = data['ages']
+    out = [HEADER.pack(MAGIC, *json_signature(json_path, raw), len(ages), len(GENDERS),
+                       len(floats), len(ints)),
+           _little('i', ages), _little('d', floats), _little('i', ints)]
+    for g in GENDERS:
+        table = data[g]
+        ncols = len(table[0]) - 1
+        codes = '\n'.join(row[0] for row in table).encode('utf8')
+        index = []
+        for row in table:
+            if len(row) - 1 != ncols:
+                raise ValueError('%s: rows of table %r differ in length' % (json_path, g))
+            index.extend(null if v is None else palette[isinstance(v, int), v] for v in row[1:])
+        out += [TABLE.pack(g.encode('ascii'), len(table), ncols, len(codes)), codes,
+                _little('H', index)]
+
+    write_atomic(bin_path, b''.join(out))
+    return bin_path
+
+
+def compile_all(codedir=None):
+    "Compile all the WMA data files shipped with athlib"
+    if codedir is None:
+        codedir = os.path.dirname(__file__)
+    return [compile_data(os.path.join(codedir, fn)) for fn in DATA_FILES]
+
+
+def load_data(bin_path, json_path=None):
+    """Read a compiled file and return it in the same shape as the json
+
+    None is returned if the file cannot be read, is not a whole compiled file
+    or, when json_path is given, was not made from that json as it is now.
+    """
+    try:
+        with open(bin_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            header = HEADER.unpack_from(buf, 0)
+            if header[0] != MAGIC:
+                return None
+            if json_path is not None and not is_current(json_path, header[1:4]):
+                return None
+            return _read_tables(buf, header)
+    except (OSError, ValueError, IndexError, struct.error):
+        return None
+
+
+def _read_tables(buf, header):
+    magic, size, mtime, crc, nages, ntables, nfloats, nints = header
+    pos = HEADER.size
+
+    def take(typecode, n):
+        "The next n items of array typecode in buf, as a list"
+        nonlocal pos
+        a = array(typecode)
+        end = pos + n * a.itemsize
+        if end > len(buf):
+            raise ValueError('compiled WMA data is truncated')
+        a.frombytes(buf[pos:end])
+        if sys.byteorder != 'little':
+            a.byteswap()
+        pos = end
+        return a.tolist()
+
+    data = dict(ages=take('i', nages))
+    palette = take('d', nfloats) + take('i', nints) + [None]
+    for _ in range(ntables):
+        g, nrows, ncols, ncodes = TABLE.unpack_from(buf, pos)
+        pos += TABLE.size
+        if pos + ncodes > len(buf):
+            raise ValueError('compiled WMA data is truncated')
+        codes = buf[pos:pos + ncodes].decode('utf8').split('\n')
+        pos += ncodes
+        if len(codes) != nrows:
+            raise ValueError('compiled WMA data is corrupt')
+        # an index beyond the palette raises IndexError
+        cells = [palette[i] for i in take('H', nrows * ncols)]
+        data[g.rstrip(b'\0').decode('ascii')] = [
+                [code] + cells[r * ncols:(r + 1) * ncols] for r, code in enumerate(codes)]
+    if pos != len(buf):
+        raise ValueError('compiled WMA data is corrupt')
+    return data
+
+
+def load_compiled(json_path):
+    """Return the compiled data for json_path, or None if there is no usable one
+
+    The compiled file is only used if it was made from the json as it is now;
+    if the json is not there at all the compiled file is trusted.
+    """
+    bin_path = compiled_path(json_path)
+    if not os.path.isfile(bin_path):
+        return None
+    return load_data(bin_path, json_path)
+
+
+if __name__ == '__main__':
+    for path in compile_all():
+        print("Wrote", path)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""Time how long it takes to import athlib in a fresh interpreter.
+
+Compares a bare "import athlib", which should only load the package
+itself, with importing every public name, which is roughly what every
+import cost before the submodules were loaded lazily.  Each case runs in its own
+process so nothing is already cached in sys.modules.
+
+    python scripts/import_benchmark.py [repeats]
+"""
+import os
+import subprocess
+import sys
+
+CASES = [
+    ('import athlib', 'import athlib'),
+    ('first use of parse_hms', 'import athlib; athlib.parse_hms'),
+    ('every public name', 'from athlib import *'),
+    ]
+
+TIMER = '''
+import time
+t0 = time.perf_counter()
+%s
+t1 = time.perf_counter()
+import sys
+print(t1 - t0, len([m for m in sys.modules if m.split('.')[0] in ('athlib', 'jsonschema')]))
+'''
+
+def run(stmt, repeats):
+    here = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times = []
+    for i in range(repeats):
+        out = subprocess.check_output([sys.executable, '-c', TIMER % stmt], cwd=here)
+        t, nmods = out.split()
+        times.append(float(t))
+    return min(times), int(nmods)
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, stmt in CASES:
+        t, nmods = run(stmt, repeats)
+        print('%-28s %8.2f ms  %3d athlib/jsonschema modules' % (label, 1000 * t, nmods))
+
+if __name__ == '__main__':
+    main()
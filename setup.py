@@ -59,8 +59,9 @@ def find_json(top,drop=1,force=False):
             if '__pycache__' in fn:
                 continue
             print("scanning", fn)
-            with open(fn,'r') as j:
-                json = j.read()
+            if not force:
+                with open(fn,'r') as j:
+                    json = j.read()
             if force or schema_marker_re.search(json):
                 if drop:
                     fn = os.sep.join(fn.split(os.sep)[drop:])
@@ -85,7 +86,8 @@ try:
         name="athlib",
         version=get_version(),
         packages=find_packages(),
-        package_data={'athlib':(list(find_json(os.path.join('athlib','json-schemas')))
+        package_data={'athlib':(['bulgarian-scores.json']
+                                +list(find_json(os.path.join('athlib','json-schemas')))
                                 +list(find_json(os.path.join('athlib','wma'),force=True)))},
         #test_suite="setup.my_test_suite",
 
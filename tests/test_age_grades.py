@@ -124,6 +124,206 @@ class AgeGrade2023FactorTests(TestCase):
         self.assertTrue((best > 84955) and (best < 84966))
 
 
+class AgeGradeBatchTests(TestCase):
+    def test_batch_matches_scalar(self):
+        ag = AgeGrader(year=2023)
+        rows = [
+            ("m", 50, "5K", "16:23"),
+            ("f", 50, "5K", "18:00"),
+            ("m", 58, "5.31M", "41:37"),
+            ("f", 60, "5.3M", "40:00"),
+            ("m", 50, "5K", "17:01"),
+            ("m", 63, "SP", 7.33),
+            ("f", 53, "100H", "16.10"),
+            ("m", 40, "2400", "6:00"),
+            ("f", 47.5, "10K", "40:10"),
+            ]
+        genders, ages, events, perfs = zip(*rows)
+        grades = ag.calculate_age_grades(genders, ages, events, perfs)
+        self.assertEqual(grades, [ag.calculate_age_grade(*row) for row in rows])
+
+    def test_batch_lengths(self):
+        ag = AgeGrader(year=2023)
+        self.assertEqual(ag.calculate_age_grades([], [], [], []), [])
+        self.assertRaises(ValueError, ag.calculate_age_grades, ["m"], [50], ["5K"], [])
+
+    def test_shared_between_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        ag = AgeGrader(year=2023)
+        calls = [(g, age, ev) for g in "mf" for age in range(30, 95, 3)
+                    for ev in ("100", "2400", "5K", "11K", "5.31M", "HJ")]
+        expected = [ag.calculate_factor(*c) for c in calls]
+        with ThreadPoolExecutor(8) as ex:
+            for _ in range(5):
+                got = list(ex.map(lambda c: ag.calculate_factor(*c), calls))
+                self.assertEqual(got, expected)
+
+    def test_lookups_are_returned(self):
+        ag = AgeGrader(year=2023)
+        data = ag.get_data()
+        self.assertEqual(ag.find_age(47.5, data["ages"]), (42, 43, 0.5))
+        rl = ag.find_row_by_distance(2400, data["m"])
+        self.assertEqual(data["m"][rl.fx][0], "2000")
+        self.assertEqual(data["m"][rl.fx1][0], "3000")
+        self.assertAlmostEqual(rl.pfac, 0.4)
+
+
+class AgeGradeCacheTests(TestCase):
+    def test_cache_off_by_default(self):
+        ag = AgeGrader(year=2023)
+        self.assertEqual(ag.cache_info(), {})
+
+    def test_cached_results_match(self):
+        plain = AgeGrader(year=2023)
+        cached = AgeGrader(year=2023, cache_size=64)
+        for _ in range(3):
+            for ev in ("100", "5K", "11K", "5.31M"):
+                self.assertEqual(cached.calculate_factor("m", 50, ev),
+                                 plain.calculate_factor("m", 50, ev))
+                self.assertEqual(cached.world_best("m", ev), plain.world_best("m", ev))
+        info = cached.cache_info()
+        # 4 events plus the two neighbouring rows for each of 11K and 5.31M
+        self.assertEqual(info["calculate_factor"].misses, 8)
+        self.assertEqual(info["calculate_factor"].hits, 8)
+        self.assertEqual(info["world_best"].misses, 4)
+        self.assertEqual(info["world_best"].hits, 8)
+
+        cached.cache_clear()
+        self.assertEqual(cached.cache_info()["world_best"].currsize, 0)
+        cached.set_cache_size(None)
+        self.assertEqual(cached.cache_info(), {})
+
+    def test_cache_is_bounded(self):
+        from athlib.wma.agegrader import AthlonsAgeGrader
+        aag = AthlonsAgeGrader(cache_size=4)
+        for age in range(35, 80, 5):
+            aag.calculate_factor("M", age, "100")
+        info = aag.cache_info()["calculate_factor"]
+        self.assertEqual(info.maxsize, 4)
+        self.assertEqual(info.currsize, 4)
+
+
+class AgeGradeDenseTests(TestCase):
+    def test_dense_matches(self):
+        plain = AgeGrader(year=2023)
+        dense = AgeGrader(year=2023, dense=True)
+
+        def factor(ag, *args):
+            try:
+                return ag.calculate_factor(*args)
+            except TypeError:
+                # young ages have no factors for some events
+                return TypeError
+
+        for g in "mf":
+            for ev in ("100", "60H", "HJ", "5K", "MAR", "11K"):
+                for age in (5, 18, 30, 35, 47, 47.5, 58, 90, 110):
+                    self.assertEqual(factor(dense, g, age, ev), factor(plain, g, age, ev))
+
+    def test_save_and_load(self):
+        import os, tempfile
+        from array import array
+        from athlib.wma import agegrader
+
+        class TmpAgeGrader(AgeGrader):
+            factor_matrix_path = os.path.join(tempfile.mkdtemp(), "factors.bin")
+
+        ag = TmpAgeGrader(year=2023, dense=True)
+        path = ag.save_factor_matrix()
+        try:
+            loaded = TmpAgeGrader(year=2023, dense=True)
+            matrix = loaded._load_factor_matrix(loaded.get_data())
+            for g in "mf":
+                self.assertEqual(matrix[g].tobytes(), ag.get_factor_matrix()[g].tobytes())
+            self.assertEqual(loaded.calculate_factor("f", 58, "200"), 0.8454)
+
+            with open(path, "rb") as f:
+                raw = f.read()
+            size = agegrader._MATRIX_HEADER.size
+            magic, order, jsize, mtime, crc, nm, nf = agegrader._MATRIX_HEADER.unpack(raw[:size])
+
+            # the other byte order is swapped on loading
+            swapped = array("d", raw[size:])
+            swapped.byteswap()
+            other = b">" if order == b"<" else b"<"
+            with open(path, "wb") as f:
+                f.write(agegrader._MATRIX_HEADER.pack(magic, other, jsize, mtime, crc, nm, nf))
+                f.write(swapped.tobytes())
+            matrix = loaded._load_factor_matrix(loaded.get_data())
+            for g in "mf":
+                self.assertEqual(matrix[g].tobytes(), ag.get_factor_matrix()[g].tobytes())
+
+            # made from other json, without a header or cut short
+            for bad in (agegrader._MATRIX_HEADER.pack(magic, order, jsize + 1, mtime, crc, nm, nf) + raw[size:],
+                        raw[size:], raw[:-8], raw[:size - 1], b""):
+                with open(path, "wb") as f:
+                    f.write(bad)
+                self.assertEqual(loaded._load_factor_matrix(loaded.get_data()), None)
+        finally:
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+
+class CompiledDataTests(TestCase):
+    def test_compiled_matches_json(self):
+        import os, json, shutil, tempfile
+        from athlib.wma import bindata
+        tmp = tempfile.mkdtemp()
+        try:
+            src = os.path.dirname(bindata.__file__)
+            for fn in bindata.DATA_FILES:
+                shutil.copy(os.path.join(src, fn), tmp)
+            bindata.compile_all(tmp)
+
+            def typed(rows):
+                return [[(type(v), v) for v in row] for row in rows]
+
+            for fn in bindata.DATA_FILES:
+                json_path = os.path.join(tmp, fn)
+                with open(json_path) as f:
+                    expected = json.load(f)
+                self.assertLess(os.path.getsize(bindata.compiled_path(json_path)),
+                                os.path.getsize(json_path))
+                data = bindata.load_compiled(json_path)
+                self.assertEqual(data["ages"], expected["ages"])
+                for g in "mf":
+                    # plain lists holding the same ints, floats and Nones, so
+                    # lookups cost just what they do after reading the json
+                    self.assertEqual(set(type(row) for row in data[g]), {list})
+                    self.assertEqual(typed(data[g]), typed(expected[g]))
+
+                # only the json's content matters, not its time
+                os.utime(json_path, (0, 0))
+                self.assertEqual(bindata.load_compiled(json_path)["ages"], expected["ages"])
+
+                # a changed json makes the compiled file stale
+                with open(json_path, "a") as f:
+                    f.write(" ")
+                self.assertEqual(bindata.load_compiled(json_path), None)
+            self.assertEqual(sorted(os.listdir(tmp)),
+                             sorted(bindata.DATA_FILES + tuple(bindata.compiled_path(fn) for fn in bindata.DATA_FILES)))
+        finally:
+            shutil.rmtree(tmp)
+
+    def test_damaged_compiled_file(self):
+        import os, shutil, tempfile
+        from athlib.wma import bindata
+        tmp = tempfile.mkdtemp()
+        try:
+            fn = bindata.DATA_FILES[1]
+            json_path = os.path.join(tmp, fn)
+            shutil.copy(os.path.join(os.path.dirname(bindata.__file__), fn), json_path)
+            bin_path = bindata.compile_data(json_path)
+            with open(bin_path, "rb") as f:
+                good = f.read()
+            for bad in (b"", good[:20], good[:len(good) // 2], good[:-1], good + b"\0" * 8,
+                        b"x" * len(good), good[:-2] + b"\xff\xff"):
+                with open(bin_path, "wb") as f:
+                    f.write(bad)
+                self.assertEqual(bindata.load_compiled(json_path), None)
+        finally:
+            shutil.rmtree(tmp)
+
 
 if __name__ == '__main__':
     main()
@@ -1,8 +1,9 @@
 """Unit tests for iaaf_score.py."""
+import os
 from decimal import Decimal
 
 from unittest import TestCase, main
-from athlib.athlon_score import performance, scoring_key, score, unit_name
+from athlib.athlon_score import performance, performance_range, scoring_key, score, score_many, unit_name, _scoring_table, _fast_floor, _performance
 from athlib.implements import get_implement_weight, get_specific_event_code
 
 
@@ -37,6 +38,23 @@ class IaafScoreTests(TestCase):
         self.assertEqual(performance("M", "HJ", 831), Decimal('2.03'))
 
 
+    def test_performance_range(self):
+        perfs = performance_range("M", "110H", 970, 975)
+        self.assertEqual(len(perfs), 6)
+        self.assertEqual(perfs[3:5], [Decimal('14.01'), Decimal('14')])
+        self.assertEqual(str(perfs[4]), '14.00')
+        self.assertEqual(performance_range("M", "PV", -2, 0), [Decimal('1.00')] * 3)
+        self.assertEqual(performance_range("F", "HJ", 1000, 1000), [Decimal('1.82')])
+        self.assertEqual(performance_range("M", "NA", 0, 10), None)
+        self.assertEqual(performance_range("M", "SP", 10, 9), [])
+
+        # beyond the tables is worked out directly
+        for event_code in ("100", "LJ", "JT"):
+            self.assertEqual(performance_range("F", event_code, 1490, 1510),
+                             [performance("F", event_code, s) for s in range(1490, 1511)])
+            row, = [r for r in _scoring_table if r["gender"] == "F" and r["event_code"] == event_code]
+            self.assertEqual(performance("F", event_code, 1505), _performance(event_code, 1505, row))
+
     def test_scoring_key(self):
         """
         Test the function to calculate the scoring key from the gender and
@@ -148,6 +166,74 @@ class IaafScoreTests(TestCase):
         self.assertEqual(score("F", "150", Decimal('30.00')), 28)
         self.assertEqual(score("F", "150", Decimal('31.55')), 1)
 
+    def test_score_many(self):
+        "Batch scoring matches score for each row"
+        rows = [
+            ("M", "60H", Decimal('10.58'), None),
+            ("M", "60H", Decimal('11.25'), 50),
+            ("M", "LJ", Decimal('4.77'), 50),
+            ("M", "LJ", Decimal('4.77'), None),
+            ("F", "60H", Decimal('12.18'), 40),
+            ("F", "SP", Decimal('5.61'), 70),
+            ("M", "80H", Decimal('14.5'), 60),
+            ("M", "800", Decimal('120'), None),
+            ("M", "PV", Decimal('0.5'), None),
+            ("F", "NA", Decimal('12'), None),
+            ]
+        genders, event_codes, values, ages = zip(*rows)
+        expected = [score(*row) for row in rows]
+        self.assertEqual(score_many(genders, event_codes, values, ages), expected)
+        self.assertEqual(expected[0], 437)
+        self.assertEqual(expected[-2:], [0, None])
+        self.assertEqual(score_many(genders, event_codes, values),
+                         [score(*row[:3]) for row in rows])
+        self.assertEqual(score_many(["M"], ["800"], [120], esaa=True), [769])
+        self.assertEqual(score_many([], [], []), [])
+        self.assertRaises(ValueError, score_many, ["M"], ["800", "60"], [120])
+
+
+class FastPathTests(TestCase):
+    """The float path must agree exactly with the Decimal one.
+
+    Every key in the scoring table is checked over the range of scores, and
+    at the marks either side of each score boundary, where rounding matters.
+    Set ATHLIB_EXHAUSTIVE=1 to check every score from 0 to 1500 (slow).
+    """
+    step = 1 if os.environ.get('ATHLIB_EXHAUSTIVE') else 50
+
+    def test_fast_floor(self):
+        self.assertEqual(_fast_floor(2.5), 2)
+        self.assertEqual(_fast_floor(-2.5), -3)
+        self.assertIsNone(_fast_floor(3.0))
+        self.assertIsNone(_fast_floor(2.9999999999))
+        self.assertIsNone(_fast_floor(1000.0000001))
+
+    def test_examples(self):
+        self.assertEqual(score("M", "60H", Decimal('10.58'), fast=True), 437)
+        self.assertEqual(score("F", "SP", Decimal('5.61'), 70, fast=True), 485)
+        self.assertEqual(score("M", "800", 120, esaa=True, fast=True), 769)
+        self.assertEqual(score("M", "NA", 120, fast=True), None)
+        self.assertEqual(score_many(["M", "F"], ["LJ", "HJ"], [Decimal('4.77'), Decimal('1.29')],
+                                    [50, 53], fast=True), [556, 644])
+        self.assertEqual(performance("M", "HJ", 831, fast=True), Decimal('2.03'))
+        self.assertEqual(performance("M", "PV", 0, fast=True), 1.0)
+        self.assertEqual(performance("M", "NA", 500, fast=True), None)
+
+    def test_every_event(self):
+        for row in _scoring_table:
+            gender, event_code = row["gender"], row["event_code"]
+            marks = set()
+            for points in range(0, 1501, self.step):
+                perf = _performance(event_code, points, row)
+                perf_fast = _performance(event_code, points, row, fast=True)
+                self.assertEqual(str(perf_fast), str(perf), (gender, event_code, points))
+                marks.update((perf - Decimal('0.01'), perf, perf + Decimal('0.01')))
+            marks = sorted(m for m in marks if m > 0)
+            for esaa in (False, True):
+                expected = [score(gender, event_code, m, esaa=esaa) for m in marks]
+                self.assertEqual([score(gender, event_code, m, esaa=esaa, fast=True) for m in marks],
+                                 expected, (gender, event_code))
+
 
 
 
@@ -1,7 +1,7 @@
 
 
 from unittest import TestCase, main
-from athlib.bulgarian_score import score
+from athlib.bulgarian_score import score, score_many, get_tables
 
 class BulgarianUnder16Test(TestCase):
 
@@ -22,6 +22,26 @@ class BulgarianUnder16Test(TestCase):
                 points
                 )
 
+    def test_table_ends(self):
+        self.assertEqual(score('U16', 'M', '60', 12.00), 1)
+        self.assertEqual(score('U16', 'M', '60', 6.80), 150)
+        self.assertEqual(score('U16', 'F', 'LJ', 2.51), 0)
+        self.assertEqual(score('U16', 'F', 'LJ', 2.52), 1)
+        self.assertEqual(score('U16', 'F', 'LJ', 6.44), 150)
+        self.assertEqual(score('U16', 'M', '800', '2:00.00'), score('U16', 'M', '800', 120))
+        self.assertRaises(KeyError, score, 'U16', 'M', 'JT', 40.0)
+
+    def test_score_many(self):
+        heat = [7.10, 7.55, 8.02, '8.40', 9.46, 11.99, 12.50, 6.50]
+        self.assertEqual(score_many('U16', 'M', '60', heat),
+                         [score('U16', 'M', '60', p) for p in heat])
+        self.assertEqual(score_many('U16', 'M', 'SP', []), [])
+
+    def test_tables(self):
+        t = get_tables()['U16M60']
+        self.assertEqual((t.min, t.max, t.first), (1200, 680, 680))
+        self.assertEqual(len(t.points), 521)
+
 
 if __name__ == '__main__':
     main()
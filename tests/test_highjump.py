@@ -419,6 +419,262 @@ JA103141  xxx'''.split('\n')]
         check('r', 'r', 1, 1);
         check('x', 'x', 1, 1);
 
+    def test_incremental_ranking(self):
+        "moving just the jumper who jumped ranks exactly as a full sort"
+        class FullRank(HighJumpCompetition):
+            def _rank(self, verbose=False, jumper=None):
+                HighJumpCompetition._rank(self, verbose)
+
+        def standing(c):
+            return c.state, [(j.bib, j._place, j.ranking_key) for j in c.ranked_jumpers]
+
+        for matrix in (ESAA_2015_HJ, _1066, RIO_MENS_HJ, self.matrix_a):
+            actions = HighJumpCompetition.from_matrix(matrix).actions
+            for i in range(1, len(actions) + 1):
+                inc = HighJumpCompetition().from_actions(actions[:i])
+                self.assertEqual(standing(inc), standing(FullRank().from_actions(actions[:i])))
+            for j in inc.jumpers:
+                x = j.highest_cleared_index
+                atts = j.attempts_by_height[:x + 1] if x >= 0 else []
+                self.assertEqual(j.ranking_key[2:],
+                                 (atts[-1].count('x') if atts else 0, ''.join(atts).count('x')))
+
+    def test_incremental_ranking_after_edits(self):
+        "jumpers changed other than by jumping still rank as a full sort would"
+        from athlib.highjump import _HEIGHT_BYTE
+        def standing(c):
+            return [(j.bib, j._place, j.ranking_key) for j in c.ranked_jumpers]
+
+        # attempts set directly on the jumper who is then moved
+        for bib, atts, x in (('2871', ['o', 'o', 'xo'], 2), ('2197', ['xo', 'xxo'], 1),
+                             ('2052', ['o', 'o', 'o', 'o', 'o', 'o', 'xo'], 6)):
+            inc = HighJumpCompetition.from_matrix(RIO_MENS_HJ)
+            full = HighJumpCompetition.from_matrix(RIO_MENS_HJ)
+            for c in inc, full:
+                j = c.jumpers_by_bib[bib]
+                j.attempts_by_height = atts
+                j.highest_cleared_index = x
+                j.highest_cleared = c.heights[x]
+            inc._rerankj(inc.jumpers_by_bib[bib])
+            full._rankj()
+            self.assertEqual(standing(inc), standing(full))
+
+        # an edited snapshot, then more jumping
+        c = HighJumpCompetition.from_matrix(RIO_MENS_HJ, to_nth_height=4)
+        snapshot = c.snapshot()
+        for d in snapshot['jumpers']:
+            if d['bib'] == '2052':
+                # 'o' for 'xo' at the highest height cleared, which ties them with 2297
+                atts = bytearray.fromhex(d['attempts'])
+                atts[d['highest_cleared_index']] = _HEIGHT_BYTE['o']
+                d['attempts'] = atts.hex()
+        actions = HighJumpCompetition.from_matrix(RIO_MENS_HJ).actions[len(c.actions):]
+        inc = HighJumpCompetition.from_snapshot(snapshot)
+        self.assertEqual(inc.jumpers_by_bib['2052'].place, inc.jumpers_by_bib['2297'].place)
+        full = HighJumpCompetition.from_snapshot(snapshot)
+        full._rankj()
+        self.assertEqual(standing(inc), standing(full))
+        for action in actions:
+            inc._replay([action])
+            full._replay([action])
+            full._rankj()
+            self.assertEqual(standing(inc), standing(full))
+
+    def test_packed_attempts(self):
+        from athlib.highjump import Jumper
+        c = HighJumpCompetition.from_matrix(RIO_MENS_HJ)
+        j = c.jumpers_by_bib['3026']
+        self.assertEqual(j.attempts_by_height, ['', 'o', '', 'o', '', 'xx', 'x'])
+        c = HighJumpCompetition.from_matrix(self.matrix_a)
+        self.assertEqual(c.jumpers_by_bib['A'].attempts_by_height, ['o', 'xxx', 'o', 'x', 'r'])
+        self.assertTrue(c.jumpers_by_bib['A'].has_retired)
+
+        j = Jumper(bib='1')
+        self.assertFalse(j.has_retired)
+        self.assertFalse(hasattr(j, '__dict__'))
+        j.attempts_by_height = ['xo', '', 'xx-', 'xxr']
+        self.assertEqual(j.attempts_by_height, ['xo', '', 'xx-', 'xxr'])
+        self.assertTrue(j.has_retired)
+        self.assertRaises(ValueError, setattr, j, 'attempts_by_height', ['xxxx'])
+        self.assertRaises(ValueError, setattr, j, 'attempts_by_height', ['?'])
+
+        j = Jumper(bib='2')
+        j.passed(2, Decimal('1.50'))
+        self.assertEqual(j.attempts_by_height, ['', '-'])
+        j.dismissed = False
+        for i in range(3):
+            j.failed(3, Decimal('1.55'))
+        self.assertEqual(j.attempts_by_height, ['', '-', 'xxx'])
+        self.assertTrue(j.eliminated)
+
+    def test_set_attempts_ranking_key(self):
+        from athlib.highjump import Jumper
+        # the countback figures follow attempts set directly, in either order
+        j = Jumper(bib='1')
+        j.attempts_by_height = ['xo', 'xxo']
+        j.highest_cleared_index = 1
+        self.assertEqual(j.ranking_key, (0, Decimal('-0.00'), 2, 3))
+        self.assertEqual(j.failures, 3)
+        j = Jumper(bib='2')
+        j.highest_cleared_index = 1
+        j.attempts_by_height = ['xo', 'xxo', 'x']
+        self.assertEqual(j.ranking_key, (0, Decimal('-0.00'), 2, 3))
+        self.assertEqual(j.failures, 4)
+        j.highest_cleared_index = 0
+        self.assertEqual(j.ranking_key, (0, Decimal('-0.00'), 1, 1))
+
+        # and match those of a jumper who jumped the same
+        c = HighJumpCompetition.from_matrix(RIO_MENS_HJ)
+        for j in c.jumpers:
+            k = Jumper(bib=j.bib)
+            k.highest_cleared = j.highest_cleared
+            k.highest_cleared_index = j.highest_cleared_index
+            k.attempts_by_height = j.attempts_by_height
+            k.eliminated = j.eliminated
+            self.assertEqual(k.ranking_key, j.ranking_key)
+
+    def test_fast_from_matrix(self):
+        def standing(c):
+            return c.state, [(j.bib, j.place, j.ranking_key, j.attempts_by_height) for j in c.ranked_jumpers]
+        for matrix in (ESAA_2015_HJ, _1066, RIO_MENS_HJ, self.matrix_a):
+            for n in (None, 0, 1, 5, 10):
+                c = HighJumpCompetition.from_matrix(matrix, to_nth_height=n)
+                fc = HighJumpCompetition.from_matrix(matrix, to_nth_height=n, fast=True)
+                self.assertEqual(standing(fc), standing(c))
+                self.assertEqual(fc.actions, [])
+                self.assertEqual(fc.to_matrix(['bib']), c.to_matrix(['bib']))
+        bad = [row[:] for row in RIO_MENS_HJ]
+        bad[3][10] = 'oo'
+        self.assertRaises(RuleViolation, HighJumpCompetition.from_matrix, bad, fast=True)
+        bad[3][10] = '?'
+        self.assertRaises(RuleViolation, HighJumpCompetition.from_matrix, bad, fast=True)
+
+    def test_replay_archive(self):
+        import json, os, tempfile
+        from athlib.highjump import replay_archive
+        with tempfile.TemporaryDirectory() as d:
+            for name, matrix in (('esaa.json', ESAA_2015_HJ), ('rio.json', RIO_MENS_HJ),
+                                 ('a.json', self.matrix_a)):
+                with open(os.path.join(d, name), 'w') as f:
+                    json.dump(matrix, f)
+            with open(os.path.join(d, 'bad.json'), 'w') as f:
+                json.dump([["bib", "2.00"], ["1", "oo"]], f)
+            with open(os.path.join(d, 'notes.txt'), 'w') as f:
+                f.write('not a competition')
+            errors = []
+            comps = replay_archive(d, processes=2, on_error=lambda path, e: errors.append((path, e)))
+            self.assertEqual(sorted(comps), ['a.json', 'esaa.json', 'rio.json'])
+            self.assertEqual(comps['esaa.json'].state, 'jumpoff')
+            self.assertEqual(comps['a.json'].state, 'drawn')
+            self.assertEqual(comps['rio.json'].jumpers_by_bib['2197'].place, 1)
+            self.assertEqual([os.path.basename(p) for p, e in errors], ['bad.json'])
+            self.assertIsInstance(errors[0][1], RuleViolation)
+            self.assertRaises(RuleViolation, replay_archive, d, 1)
+
+    def test_snapshot(self):
+        import json
+        def standing(c):
+            return (c.state, c.heights, c.bar_height,
+                    [(j.bib, j.place, j.ranking_key, j.attempts_by_height, j.round_lim) for j in c.ranked_jumpers])
+        for matrix in (ESAA_2015_HJ, _1066, RIO_MENS_HJ, self.matrix_a):
+            c = HighJumpCompetition.from_matrix(matrix)
+            for n in (0, 1, len(c.actions) // 2, len(c.actions) - 1, len(c.actions)):
+                snapshot = json.loads(json.dumps(c.from_actions(c.actions[:n]).snapshot()))
+                r = HighJumpCompetition.from_snapshot(snapshot, c.actions[n:])
+                self.assertEqual(standing(r), standing(c))
+                self.assertEqual(r.actions, c.actions[n:])
+        r = HighJumpCompetition.from_snapshot(HighJumpCompetition.from_matrix(ESAA_2015_HJ).snapshot())
+        self.assertEqual(r.state, 'jumpoff')
+        r.set_bar_height(Decimal('2.10'))
+        r.cleared('53')
+        r.failed('81')
+        self.assertEqual(r.state, 'finished')
+        self.assertEqual(r.jumpers_by_bib['53'].place, 1)
+        self.assertRaises(ValueError, HighJumpCompetition.from_snapshot, dict(version=2))
+
+    def test_journal(self):
+        import os, tempfile
+        from athlib.highjump import ActionJournal
+        actions = HighJumpCompetition.from_matrix(RIO_MENS_HJ).actions
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'rio.jsonl')
+            c = HighJumpCompetition()
+            c.journal = ActionJournal(path)
+            for i, (a, v) in enumerate(actions[:60]):
+                c._replay([(a, v)])
+                if i % 25 == 24:
+                    c.journal.snapshot(c)
+            c.journal.close()
+            with open(path, 'a') as f:
+                f.write('["cleared", "22')   # torn by a crash
+
+            r = HighJumpCompetition.from_journal(path)
+            self.assertEqual(r.actions, actions[:60])
+            r._replay(actions[60:])
+            r.journal.close()
+            full = HighJumpCompetition().from_actions(actions)
+            self.assertEqual([(j.bib, j.place) for j in r.ranked_jumpers],
+                             [(j.bib, j.place) for j in full.ranked_jumpers])
+            self.assertEqual(r.state, full.state)
+
+            # the torn line was cut off before the journal carried on
+            self.assertEqual(HighJumpCompetition.from_journal(path, resume=False).actions, actions)
+
+    def test_events(self):
+        from athlib.highjump import LeaderboardEvent
+        actions = HighJumpCompetition.from_matrix(ESAA_2015_HJ).actions
+        c = HighJumpCompetition()
+        events = []
+        record = c.subscribe(events.append)
+        c._replay(actions[:5])
+        self.assertEqual(events, [
+            LeaderboardEvent('height', None, Decimal('0.00'), Decimal('1.81')),
+            LeaderboardEvent('state', None, 'scheduled', 'started'),
+            ])
+        board = dict((j.bib, j.place) for j in c.jumpers)
+        for a, v in actions[5:]:
+            n = len(events)
+            c._replay([(a, v)])
+            for e in events[n:]:
+                if e.kind == 'place':
+                    self.assertEqual(board[e.bib], e.old)
+                    board[e.bib] = e.new
+            self.assertEqual(board, dict((j.bib, j.place) for j in c.jumpers))
+        self.assertEqual([e.new for e in events if e.kind == 'state'], ['started', 'jumpoff'])
+        self.assertIn(LeaderboardEvent('trial', '77', 'xx', 'xxx'), events)
+        self.assertIn(LeaderboardEvent('eliminated', '77', False, True), events)
+        # the two left are brought back for the jump-off
+        self.assertIn(LeaderboardEvent('eliminated', '53', True, False), events)
+
+        c.unsubscribe(record)
+        del events[:]
+        c.set_bar_height(Decimal('2.10'))
+        self.assertEqual(events, [])
+
+    def test_event_stream(self):
+        import asyncio
+        actions = HighJumpCompetition.from_matrix(_1066).actions
+
+        async def watch():
+            c = HighJumpCompetition()
+            stream = c.events()
+            c._replay(actions)
+            return [e async for e in stream]
+        events = asyncio.run(watch())
+        self.assertEqual([e.new for e in events if e.kind == 'state'], ['started', 'jumpoff', 'finished'])
+        self.assertEqual(events[-1].kind, 'state')
+        self.assertIn(('place', '81', 2, 1), events)
+
+        async def closed():
+            c = HighJumpCompetition.from_matrix(RIO_MENS_HJ)
+            stream = c.events()
+            c.failed('2197')
+            stream.close()
+            c.set_bar_height(Decimal('2.45'))
+            return [e async for e in stream]
+        events = asyncio.run(closed())
+        self.assertEqual(events, [('trial', '2197', 'x', 'xx')])
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,147 @@
+"""Unit tests for highjump_manager.py."""
+import asyncio
+from decimal import Decimal
+from unittest import TestCase, main
+
+from athlib.exceptions import RuleViolation
+from athlib.highjump import HighJumpCompetition
+from athlib.highjump_manager import CompetitionManager
+
+from test_highjump import ESAA_2015_HJ, RIO_MENS_HJ
+
+
+def standing(snapshot):
+    return (snapshot['state'], snapshot['ranked'],
+            [(j['bib'], j['place'], j['attempts'])
+             for j in snapshot['jumpers']])
+
+
+class CompetitionManagerTests(TestCase):
+
+    def test_concurrent_competitions(self):
+        matrices = dict(esaa=ESAA_2015_HJ, rio=RIO_MENS_HJ)
+        expected = dict((cid, HighJumpCompetition.from_matrix(m))
+                        for cid, m in matrices.items())
+
+        async def championship():
+            async with CompetitionManager() as manager:
+                for cid in matrices:
+                    manager.add(cid)
+                self.assertEqual(sorted(manager), ['esaa', 'rio'])
+                # the officials' input for both pits arrives interleaved
+                pending = [[(cid, a, v) for a, v in c.actions]
+                           for cid, c in expected.items()]
+                futures = []
+                halfway = {}
+                while any(pending):
+                    for actions in pending:
+                        if actions:
+                            cid, a, v = actions.pop(0)
+                            futures.append(manager.submit(cid, a, v))
+                            if len(expected[cid].actions) - len(actions) == 40:
+                                halfway[cid] = manager.snapshot(cid)
+                await asyncio.gather(*futures)
+                snapshots = dict([(cid, await manager.snapshot(cid))
+                                  for cid in matrices])
+                halfway = dict([(cid, await f) for cid, f in halfway.items()])
+                rio = await manager.remove('rio')
+                self.assertNotIn('rio', manager)
+            return snapshots, halfway, rio
+
+        snapshots, halfway, rio = asyncio.run(championship())
+        for cid, c in expected.items():
+            self.assertEqual(standing(snapshots[cid]), standing(c.snapshot()))
+            self.assertEqual(
+                standing(halfway[cid]),
+                standing(c.from_actions(c.actions[:40]).snapshot()))
+        self.assertEqual(rio.jumpers_by_bib['2197'].place, 1)
+
+    def test_errors(self):
+        async def pit():
+            manager = CompetitionManager()
+            manager.add('pv')
+            self.assertRaises(KeyError, manager.add, 'pv')
+            self.assertRaises(KeyError, manager.submit, 'lj', 'cleared', '1')
+            manager.submit('pv', 'add_jumper', dict(bib='1'))
+            manager.submit('pv', 'add_jumper', dict(bib='2'))
+            self.assertIsInstance(manager.add('hj'), HighJumpCompetition)
+            with self.assertRaises(RuleViolation):
+                await manager.submit('pv', 'cleared', '1')    # bar not set yet
+            manager.submit('pv', 'set_bar_height', Decimal('4.00'))
+            await manager.submit('pv', 'cleared', '1')
+            with self.assertRaises(RuleViolation):
+                await manager.submit('pv', 'cleared', '1')    # already cleared
+            places = await manager.run(
+                'pv', lambda c: [j.place for j in c.ranked_jumpers])
+            self.assertEqual(places, [1, ''])
+            await manager.close()
+            # a closed manager has no competitions and takes nothing more
+            self.assertRaises(RuntimeError, manager.add, 'tj')
+            self.assertRaises(RuntimeError, manager.submit,
+                              'pv', 'cleared', '1')
+            self.assertRaises(RuntimeError, manager.snapshot, 'hj')
+            with self.assertRaises(RuntimeError):
+                await manager.remove('pv')
+            self.assertEqual(len(manager), 0)
+            self.assertNotIn('pv', manager)
+            self.assertEqual(list(manager), [])
+        asyncio.run(pit())
+
+        # outside the event loop nothing is left half added
+        manager = CompetitionManager()
+        self.assertRaises(RuntimeError, manager.add, 'hj')
+        self.assertNotIn('hj', manager)
+        self.assertEqual(len(manager), 0)
+        self.assertEqual(list(manager), [])
+
+    def test_stopped_worker(self):
+        "what is queued fails, rather than waiting for ever, if a task stops"
+        def stop(c):
+            raise asyncio.CancelledError()
+
+        async def pits():
+            manager = CompetitionManager()
+            manager.add('pv')
+            manager.add('hj')
+            first = manager.submit('pv', 'add_jumper', dict(bib='1'))
+            stopped = manager.run('pv', stop)
+            queued = [manager.snapshot('pv'),
+                      manager.submit('pv', 'add_jumper', dict(bib='2'))]
+            other = manager.submit('hj', 'add_jumper', dict(bib='3'))
+            self.assertIsNone(await first)
+            for f in [stopped] + queued:
+                with self.assertRaises(RuntimeError) as cm:
+                    await asyncio.wait_for(f, 1)
+                self.assertIsInstance(cm.exception.__cause__,
+                                      asyncio.CancelledError)
+            self.assertRaises(RuntimeError, manager.submit,
+                              'pv', 'cleared', '1')
+            self.assertIn('pv', manager)
+            # the other pit carries on
+            self.assertIsNone(await other)
+            self.assertEqual(len((await manager.snapshot('hj'))['jumpers']), 1)
+            pv = await manager.remove('pv')
+            self.assertEqual(list(pv.jumpers_by_bib), ['1'])
+            await manager.close()
+        asyncio.run(pits())
+
+    def test_fairness(self):
+        "a competition with a long queue does not hold the others up"
+        async def run():
+            manager = CompetitionManager()
+            order = []
+            manager.add('busy')
+            manager.add('quiet')
+            for i in range(50):
+                manager.run('busy', lambda c, i=i: order.append(('busy', i)))
+            done = manager.run('quiet', lambda c: order.append(('quiet', 0)))
+            await done
+            await manager.close()
+            return order
+        order = asyncio.run(run())
+        self.assertLess(order.index(('quiet', 0)), 5)
+        self.assertEqual(len(order), 51)
+
+
+if __name__ == '__main__':
+    main()
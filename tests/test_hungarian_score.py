@@ -1,7 +1,7 @@
 
 
 from unittest import TestCase, main
-from athlib.hungarian_score import get_lookup_table, score
+from athlib.hungarian_score import get_lookup_table, score, score_many
 
 class HunTest(TestCase):
 
@@ -30,6 +30,42 @@ class HunTest(TestCase):
                 points
                 )
 
+    def test_zero_clamp(self):
+        "Marks not good enough for any points get 0, not the far side of the curve"
+        # 17 seconds gets no points in a men's 100m
+        self.assertEqual(score('M', 'OUT', '100', 16.99), 0)
+        self.assertEqual(score('M', 'OUT', '100', 16.9), 0)
+        self.assertEqual(score('M', 'OUT', '100', 16.5), 6)
+        self.assertEqual(score('M', 'OUT', '100', 17), 0)
+        self.assertEqual(score('M', 'OUT', '100', 60), 0)
+        # a men's long jump gets points from just over 2.50m
+        self.assertEqual(score('M', 'OUT', 'LJ', 2.5), 0)
+        self.assertEqual(score('M', 'OUT', 'LJ', 2.6), 19)
+        self.assertEqual(score('M', 'OUT', 'LJ', 0.5), 0)
+        # no mark at all
+        self.assertEqual(score('M', 'OUT', '100', 0), 0)
+        self.assertEqual(score('M', 'OUT', 'LJ', -1), 0)
+        self.assertEqual(score_many(['M'] * 3, ['OUT'] * 3, ['100', '100', 'LJ'],
+                                    [60, 16.5, 0.5]), [0, 6, 0])
+
+    def test_score_many(self):
+        rows = [
+                ('M', 'OUT', '100', 9.46),
+                ('M', 'OUT', 'MILE', 240),
+                ('F', 'OUT', 'LJ', 7.50),
+                ('M', 'IND', 'SP', 20.00),
+                ('M', 'OUT', '100', 10.5),
+                ('M', 'OUT', '100', 25.0),  # slower than no points, as score
+                ('F', 'OUT', 'LJ', 1.0),  # short of no points, as score
+            ]
+        expected = [score(*row) for row in rows]
+        self.assertEqual(expected, [1400, 1074, 1329, 1121, 1040, 0, 0])
+        self.assertEqual(score_many(*zip(*rows)), expected)
+        self.assertEqual(score_many([], [], [], []), [])
+        self.assertRaises(ValueError, score_many, ['M'], ['OUT'], ['100'], [])
+        self.assertRaises(AssertionError, score_many, ['M', 'M'], ['OUT', 'IN'], ['100', '100'], [10, 10])
+        self.assertRaises(AssertionError, score_many, ['M'], ['OUT'], ['XYZ'], [10])
+
 
 if __name__ == '__main__':
     main()
@@ -95,5 +95,23 @@ class ImportTest(AthlibTestCase):
                 failures.append('athlib.%s has signature\n  %r\nnot the expected\n  %r' % (faker,bad[1],bad[0]))
         self.assertTrue(not failures,'athlib member signature failures\n %s' % '\n '.join(failures))
 
+    def test_import_is_lazy(self):
+        import subprocess
+        code = ("import sys, athlib; "
+                "print(' '.join(m for m in sys.modules "
+                "if m.startswith(('athlib.', 'jsonschema'))))")
+        top = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.check_output([sys.executable, '-c', code], cwd=top)
+        self.assertEqual(out.split(), [])
+
+    def test_lazy_names(self):
+        import athlib
+        import athlib.hungarian_score
+        from athlib.hungarian_score import score
+        self.assertTrue(athlib.hungarian_score is score)
+        self.assertTrue(athlib.ag is athlib.ag2023)
+        self.assertTrue(set(athlib.__all__) <= set(dir(athlib)))
+        self.assertRaises(AttributeError, getattr, athlib, 'no_such_thing')
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,148 @@
+"""Unit tests for rank.py."""
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase, main
+
+from athlib.hungarian_score import score
+from athlib.rank import ranked, read_results, score_results, top_n, rank, \
+    main as rank_main
+
+CSV = """name,gender,event,performance
+Usain,M,100,9.58
+Yohan,M,100,9.69
+Carl,M,100,9.86
+Tyson,m,100,9.69
+Slowcoach,M,100,abc
+Nobody,Q,100,10.0
+Colin,M,110H,12.91
+Jonathan,M,TJ,18.29
+Ingrid,F,MAR,2:23:00
+"""
+
+JSONL = [
+    dict(name="Usain", gender="M", event="200", performance="19.19"),
+    dict(name="Hicham", gender="M", event="1500", performance="3:26.00"),
+    dict(name="Genzebe", gender="F", event="1500", performance="3:55.17",
+         inout="IND"),
+    dict(name="Bad", gender="F", event="ZZZ", performance="1"),
+    ]
+
+
+class RankTests(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.csv = os.path.join(self.dir, 'results.csv')
+        with open(self.csv, 'w') as f:
+            f.write(CSV)
+        self.jsonl = os.path.join(self.dir, 'results.jsonl')
+        with open(self.jsonl, 'w') as f:
+            f.write('\n'.join(json.dumps(row) for row in JSONL) + '\n\n')
+
+    def tearDown(self):
+        for fn in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, fn))
+        os.rmdir(self.dir)
+
+    def test_read_results(self):
+        rows = list(read_results(self.csv))
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(rows[0], dict(name="Usain", gender="M", event="100",
+                                       performance="9.58"))
+        self.assertEqual(list(read_results(self.jsonl)), JSONL)
+        self.assertEqual(list(read_results(io.StringIO(CSV), 'csv')), rows)
+        self.assertRaises(ValueError, list, read_results(self.csv, 'xml'))
+
+    def test_score_results(self):
+        errors = []
+        results = list(score_results(
+            read_results(self.csv),
+            on_error=lambda row, e: errors.append(row['name'])))
+        self.assertEqual(errors, ['Slowcoach', 'Nobody'])
+        self.assertEqual([r.row['name'] for r in results],
+                         ['Usain', 'Yohan', 'Carl', 'Tyson', 'Colin',
+                          'Jonathan', 'Ingrid'])
+        usain = results[0]
+        self.assertEqual(usain[:5], (score('M', 'OUT', '100', 9.58),
+                                     'M', 'OUT', '100', '9.58'))
+        self.assertEqual(results[3].gender, 'M')
+        # hurdles are 110M in the points tables
+        self.assertEqual(results[4].points, score('M', 'OUT', '110M', 12.91))
+        self.assertEqual(results[6].points, score('F', 'OUT', 'MAR', 8580))
+
+        results = list(score_results(JSONL, inout='IND'))
+        self.assertEqual([(r.row['name'], r.inout) for r in results],
+                         [('Usain', 'IND'), ('Hicham', 'IND'),
+                          ('Genzebe', 'IND')])
+
+    def test_pointless_marks(self):
+        "Marks too poor to score are dropped, so cannot outrank real ones"
+        rows = [dict(name="Usain", gender="M", event="100",
+                     performance="9.58"),
+                dict(name="Walker", gender="M", event="100", performance="60"),
+                dict(name="Sprawl", gender="M", event="100",
+                     performance="17.00"),
+                dict(name="Jonathan", gender="M", event="LJ",
+                     performance="7.50"),
+                dict(name="Hop", gender="M", event="LJ", performance="0.50"),
+                ]
+        errors = []
+        results = list(score_results(
+            rows, on_error=lambda row, e: errors.append(row['name'])))
+        self.assertEqual(errors, ['Walker', 'Sprawl', 'Hop'])
+        self.assertEqual([r.row['name'] for r in results],
+                         ['Usain', 'Jonathan'])
+        tops = top_n(score_results(rows), 3)
+        self.assertEqual([r.row['name'] for r in tops['M', 'OUT', '100']],
+                         ['Usain'])
+        self.assertEqual([r.row['name'] for r in tops['M', 'OUT', 'LJ']],
+                         ['Jonathan'])
+
+    def test_top_n(self):
+        results = [ranked(p, 'M', 'OUT', '100', str(p), dict(name=name))
+                   for p, name in [(1000, 'a'), (1200, 'b'), (1100, 'c'),
+                                   (1200, 'd'), (900, 'e'), (1200, 'f')]]
+        tops = top_n(iter(results), 3)
+        self.assertEqual([r.row['name'] for r in tops['M', 'OUT', '100']],
+                         ['b', 'd', 'f'])
+        tops = top_n(results, 5)
+        self.assertEqual([r.row['name'] for r in tops['M', 'OUT', '100']],
+                         ['b', 'd', 'f', 'c', 'a'])
+        self.assertEqual(top_n([], 3), {})
+
+    def test_rank(self):
+        tops = rank([self.csv, self.jsonl], n=2)
+        self.assertEqual(sorted(tops), [
+            ('F', 'IND', '1500'), ('F', 'OUT', 'MAR'), ('M', 'OUT', '100'),
+            ('M', 'OUT', '110H'), ('M', 'OUT', '1500'), ('M', 'OUT', '200'),
+            ('M', 'OUT', 'TJ')])
+        self.assertEqual([r.row['name'] for r in tops['M', 'OUT', '100']],
+                         ['Usain', 'Yohan'])
+
+    def test_large_stream(self):
+        "Only n per event are kept, however many results go in"
+        def rows():
+            for i in range(20000):
+                yield dict(gender='F', event='100', performance='%.2f'
+                           % (11 + (i * 7919 % 1000) / 1000.0))
+        tops = top_n(score_results(rows()), 5)
+        best = tops['F', 'OUT', '100']
+        self.assertEqual([r.performance for r in best], ['11.00'] * 5)
+
+    def test_main(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(rank_main(['-n', '1', self.csv]), 0)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[:3], [
+            'F OUT MAR',
+            '  1 %5d    2:23:00  Ingrid' % score('F', 'OUT', 'MAR', 8580),
+            ''])
+        self.assertIn('M OUT 100', lines)
+
+
+if __name__ == '__main__':
+    main()
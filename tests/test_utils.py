@@ -160,6 +160,23 @@ class UtilsTests(TestCase):
         self.assertRaises(ValueError, parse_hms, "slow")
         self.assertRaises(ValueError, parse_hms, "3:32.x")
 
+        # ints stay ints; the unusual go the long way round
+        self.assertIsInstance(parse_hms("1:01:10"), int)
+        self.assertEqual(parse_hms("1;10.5"), 70.5)
+        self.assertEqual(parse_hms(" 1e1"), 10.0)
+        self.assertEqual(parse_hms(".5"), 0.5)
+        with self.assertRaises(ValueError) as cm:
+            parse_hms("1:.")
+        self.assertEqual(str(cm.exception), "cannot parse seconds from '1:.'")
+
+    def test_parse_hms_many(self):
+        from array import array
+        from athlib.utils import parse_hms_many
+        times = parse_hms_many(["10", "1:10", "1:01:10.1", 9.58, "2:03:59"])
+        self.assertEqual(times, array('d', [10, 70, 3670.1, 9.58, 7439]))
+        self.assertEqual(parse_hms_many(iter([])), array('d'))
+        self.assertRaises(ValueError, parse_hms_many, ["10", "slow"])
+
     def test_format_seconds_as_time(self):
         from athlib.utils import format_seconds_as_time
         self.assertEqual(format_seconds_as_time(27.0), "27")
@@ -201,6 +218,22 @@ class UtilsTests(TestCase):
         self.assertEqual(format_seconds_as_time(3599.1), "1:00:00")
         self.assertEqual(format_seconds_as_time(3599.91, 1), "1:00:00.0")
 
+        # hundredths stored just below themselves are not rounded up
+        self.assertEqual(format_seconds_as_time(12.34, 2), "12.34")
+        self.assertEqual(format_seconds_as_time(0.29, 2), "0.29")
+        self.assertEqual(format_seconds_as_time(59.99999, 3), "1:00.000")
+        self.assertEqual(format_seconds_as_time(59.9990001, 3), "59.999")
+
+    def test_format_seconds_as_times(self):
+        from athlib.utils import format_seconds_as_time, format_seconds_as_times
+        seconds = [0, 9.58, 12.34, 59.9999, 3599.91, 7439.5, 36000.001]
+        for prec in range(4):
+            self.assertEqual(format_seconds_as_times(seconds, prec),
+                             [format_seconds_as_time(s, prec) for s in seconds])
+        self.assertEqual(format_seconds_as_times(iter([63, 7380]), 1), ["1:03.0", "2:03:00.0"])
+        self.assertEqual(format_seconds_as_times([]), [])
+        self.assertRaises(ValueError, format_seconds_as_times, [27.3], 4)
+
     def test_checkperf(self):
         from athlib.utils import check_performance_for_discipline as checkperf
         self.assertEqual(checkperf("XC", ""), "")
@@ -264,6 +297,39 @@ class UtilsTests(TestCase):
         self.assertRaises(ValueError, checkperf, "3KW", "2:34")
         self.assertRaises(ValueError, checkperf, "T26", "26:01")
 
+    def test_check_performances(self):
+        from athlib.utils import check_performances, check_performance_for_discipline as checkperf
+        rows = [
+            ('100', '10.1'),
+            ('100', '1:10'),
+            ('800', '2.05'),
+            ('LJ', '7,5'),
+            ('HJ', '2.5', 'f'),
+            ('HJ', '3.5', 'm'),
+            ('DEC', '12000'),
+            ('100', 'fast'),
+            ('XC', ''),
+            ('1500', '1.2.3'),
+            ]
+        values, errors = check_performances(rows)
+        self.assertEqual(values, ['10.10', None, '2:05', '7.50', '2.50', None, None, None, '', None])
+        self.assertEqual(errors[1], '1.10 too fast for 100, check the format')
+        self.assertEqual(errors[5], 'HJ(m) performance 3.5 seems too large as record is 2.45')
+        self.assertEqual(errors[6], 'Multi-events scores should be below 10000')
+        self.assertEqual(errors[7], "Illegal numeric pattern.  Use digits, ':' and '.' only")
+        for row, value, error in zip(rows, values, errors):
+            if error is None:
+                self.assertEqual(checkperf(*row), value)
+            else:
+                with self.assertRaises(ValueError) as cm:
+                    checkperf(*row)
+                self.assertEqual(str(cm.exception), error)
+
+        # values need not be strings, and None is taken as blank
+        self.assertEqual(check_performances([('1500', 3.5), ('100', None)]),
+                         (['3:05', None], [None, "Illegal numeric pattern.  Use digits, ':' and '.' only"]))
+        self.assertEqual(check_performances([]), ([], []))
+
     def test_discipline_sort_key(self):
         '''should see if event ordering will work'''
         from athlib.utils import discipline_sort_key
@@ -310,6 +376,23 @@ class UtilsTests(TestCase):
         sevents = [e['a'] for e in sort_by_discipline(events,'e')]
         self.assertEqual(sevents,[1100,1800,1609,2200,30,31,32,47,5400,60])
 
+
+    def test_sort_by_discipline_key(self):
+        from athlib.utils import sort_by_discipline
+        rows = [('JT', 'a'), ('100', 'b'), ('', 'c'), ('HJ', 'd'), ('100', 'e'), ('4x100', 'f')]
+        expected = [('100', 'b'), ('100', 'e'), ('HJ', 'd'), ('JT', 'a'), ('4x100', 'f'), ('', 'c')]
+        ordered = sort_by_discipline(rows, key=lambda r: r[0])
+        self.assertEqual(ordered, expected)
+        self.assertIsNot(ordered, rows)
+        self.assertEqual(rows[0], ('JT', 'a'))
+        self.assertIs(sort_by_discipline(rows, key=lambda r: r[0], inplace=True), rows)
+        self.assertEqual(rows, expected)
+        stuff = [dict(discipline='LJ'), dict(discipline='PV')]
+        self.assertIs(sort_by_discipline(stuff, inplace=True), stuff)
+        self.assertEqual(stuff, [dict(discipline='PV'), dict(discipline='LJ')])
+        # any iterable can be sorted into a new list
+        self.assertEqual(sort_by_discipline(iter(['HJ', '200']), key=str), ['200', 'HJ'])
+
     def test_event_codes_match_correctly(self):
         from athlib.codes import PAT_THROWS, PAT_JUMPS, PAT_TRACK, PAT_ROAD, \
                 PAT_RACES_FOR_DISTANCE, PAT_RELAYS, PAT_HURDLES, PAT_MULTI, PAT_HIGHSCORING_EVENT, PAT_EVENT_CODE
@@ -612,6 +695,54 @@ class UtilsTests(TestCase):
                 bad.append('%7r %6r %6r' % (v, x, r))
         self.assertEqual(len(bad),1,"\nnot all is_hand_timing results were correct\n%s" % '\n'.join(bad))
 
+    def test_classify_event_code(self):
+        from athlib import classify_event_code, EventInfo
+        for code, expected in [
+                ('100', ('100', 'track', 100, None, None, None)),
+                ('2MILE', ('2MILE', 'track', 3218, None, None, None)),
+                ('110H', ('110H', 'hurdles', 110, None, None, None)),
+                ('3000SC', ('3000SC', 'hurdles', 3000, None, None, None)),
+                ('80H 76.2cm', ('80H76.2cm', 'hurdles', 80, None, 76.2, None)),
+                ('400H36', ('400H36', 'hurdles', 400, None, 91.4, None)),
+                ('4x400', ('4x400', 'relay', 400, 4, None, None)),
+                ('4xrelay', ('4xRELAY', 'relay', None, 4, None, None)),
+                ('10K', ('10K', 'road', 10000, None, None, None)),
+                ('MAR', ('MAR', 'road', 42195, None, None, None)),
+                ('pv', ('PV', 'jump', None, None, None, None)),
+                ('SP7.26kg', ('SP7.26K', 'throw', None, None, None, '7.26K')),
+                ('JT800', ('JT800', 'throw', None, None, None, '800')),
+                ('DEC', ('DEC', 'multi', None, None, None, None)),
+                ('24HR', ('24HR', 'duration', None, None, None, None)),
+                ('BAL', ('BAL', 'custom', None, None, None, None)),
+                ]:
+            info = classify_event_code(code)
+            self.assertIsInstance(info, EventInfo)
+            self.assertEqual(tuple(info), expected, code)
+        self.assertIsNone(classify_event_code('XYZ'))
+        self.assertIsNone(classify_event_code(''))
+        self.assertIs(classify_event_code('110H'), classify_event_code('110H'))
+
+    def test_event_code_caches(self):
+        from athlib.utils import normalize_event_code, check_event_code, get_distance, \
+                event_code_cache_info, event_code_cache_clear
+        event_code_cache_clear()
+        info = event_code_cache_info()
+        self.assertEqual(sorted(info), ['check_event_code', 'classify_event_code',
+                                        'discipline_sort_key', 'get_distance',
+                                        'normalize_event_code'])
+        self.assertEqual(info['normalize_event_code'].currsize, 0)
+        for i in range(3):
+            self.assertEqual(normalize_event_code('sp7.26kg'), 'SP7.26K')
+            self.assertEqual(get_distance('4x400'), 1600)
+            self.assertTrue(check_event_code('110H'))
+        self.assertRaises(ValueError, normalize_event_code, 'XYZ')
+        info = event_code_cache_info()
+        self.assertEqual(info['normalize_event_code'][:2], (2, 2))
+        self.assertEqual(info['check_event_code'][:2], (2, 1))
+        self.assertEqual(info['get_distance'].hits, 2)
+        event_code_cache_clear()
+        self.assertEqual(event_code_cache_info()['get_distance'].currsize, 0)
+
 
 
 if __name__ == '__main__':